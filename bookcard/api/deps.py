@@ -36,11 +36,20 @@ from bookcard.repositories.user_repository import (
     TokenBlacklistRepository,
     UserRepository,
 )
+from bookcard.services.comic.archive import (
+    ComicArchiveService,
+    ComicPageCache,
+    ComicThumbnailCache,
+    create_comic_archive_service,
+)
 from bookcard.services.config_service import BasicConfigService
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
 from bookcard.services.kobo.auth_service import KoboAuthService
 from bookcard.services.oidc_auth_service import OIDCAuthError, OIDCAuthService
+from bookcard.services.oidc_key_manager import get_oidc_key_manager
 from bookcard.services.opds.auth_service import OpdsAuthService
 from bookcard.services.permission_service import PermissionService
+from bookcard.services.principal_cache import get_principal_cache
 from bookcard.services.security import (
     DataEncryptor,
     JWTManager,
@@ -65,6 +74,52 @@ def get_data_encryptor(request: Request) -> DataEncryptor:
     return DataEncryptor(request.app.state.config.encryption_key)
 
 
+def get_cover_thumbnail_cache(request: Request) -> CoverThumbnailCache:
+    """Get the cover thumbnail cache for the configured data directory.
+
+    Parameters
+    ----------
+    request : Request
+        FastAPI request object.
+
+    Returns
+    -------
+    CoverThumbnailCache
+        Thumbnail cache rooted in ``{data_directory}/cache/covers``.
+    """
+    return CoverThumbnailCache.from_data_directory(
+        request.app.state.config.data_directory
+    )
+
+
+def get_comic_archive_service(request: Request) -> ComicArchiveService:
+    """Get the shared comic archive service.
+
+    Created on first use and kept on ``app.state`` so that the archive
+    metadata LRU and the page and thumbnail caches survive across requests.
+
+    Parameters
+    ----------
+    request : Request
+        FastAPI request object.
+
+    Returns
+    -------
+    ComicArchiveService
+        Archive service caching pages and thumbnails under
+        ``{data_directory}/cache``.
+    """
+    service = getattr(request.app.state, "comic_archive_service", None)
+    if service is None:
+        data_directory = request.app.state.config.data_directory
+        service = create_comic_archive_service(
+            page_cache=ComicPageCache.from_data_directory(data_directory),
+            thumbnail_cache=ComicThumbnailCache.from_data_directory(data_directory),
+        )
+        request.app.state.comic_archive_service = service
+    return service
+
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
 
@@ -145,14 +200,20 @@ def _get_user_from_local_jwt(request: Request, session: Session, token: str) ->
         If the user does not exist.
     """
     jwt_mgr = JWTManager(request.app.state.config)
-    blacklist_repo = TokenBlacklistRepository(session)
-    claims = jwt_mgr.decode_token(
-        token,
-        is_blacklisted=lambda jti: blacklist_repo.is_blacklisted(jti),
-    )
-    user_id = int(claims.get("sub", 0))
-    repo = UserRepository(session)
-    user = repo.get(user_id)
+    principal_cache = get_principal_cache()
+    if principal_cache is not None:
+        claims = jwt_mgr.decode_token(
+            token,
+            is_blacklisted=lambda jti: principal_cache.is_blacklisted(session, jti),
+        )
+        user = principal_cache.get_user(session, int(claims.get("sub", 0)))
+    else:
+        blacklist_repo = TokenBlacklistRepository(session)
+        claims = jwt_mgr.decode_token(
+            token,
+            is_blacklisted=lambda jti: blacklist_repo.is_blacklisted(jti),
+        )
+        user = UserRepository(session).get(int(claims.get("sub", 0)))
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="user_not_found"
@@ -182,7 +243,9 @@ def _get_user_from_oidc_token(request: Request, session: Session, token: str) ->
     HTTPException
         If the token is invalid or user cannot be resolved.
     """
-    service = OIDCAuthService(request.app.state.config)
+    service = OIDCAuthService(
+        request.app.state.config, key_manager=get_oidc_key_manager()
+    )
     try:
         claims = service.validate_access_token(token=token)
     except OIDCAuthError as err:
@@ -35,6 +35,7 @@ from bookcard.api.schemas import (
     AdminUserUpdate,
     BasicConfigRead,
     BasicConfigUpdate,
+    CalibreEngineStats,
     EReaderDeviceCreate,
     EReaderDeviceRead,
     EReaderDeviceUpdate,
@@ -69,6 +70,7 @@ from bookcard.models.tasks import Task
 from bookcard.repositories.config_repository import (
     LibraryRepository,
 )
+from bookcard.repositories.engine_registry import get_calibre_engine_registry
 from bookcard.repositories.ereader_repository import EReaderRepository
 from bookcard.repositories.role_repository import (
     PermissionRepository,
@@ -1912,6 +1914,33 @@ def get_library_stats(
         ) from exc
 
 
+@router.get(
+    "/calibre-engines/stats",
+    response_model=CalibreEngineStats,
+    dependencies=[Depends(get_admin_user)],
+)
+def get_calibre_engine_stats() -> CalibreEngineStats:
+    """Get reuse counters of the shared Calibre database engines.
+
+    Returns
+    -------
+    CalibreEngineStats
+        Engine and connection pool hit/miss counters.
+    """
+    registry = get_calibre_engine_registry()
+    stats = registry.stats()
+    return CalibreEngineStats(
+        libraries=len(registry),
+        engine_hits=stats.engine_hits,
+        engine_misses=stats.engine_misses,
+        evictions=stats.evictions,
+        checkouts=stats.checkouts,
+        connections_opened=stats.connections_opened,
+        pool_hits=stats.pool_hits,
+        pool_misses=stats.pool_misses,
+    )
+
+
 @router.post(
     "/openlibrary/download-dumps",
     response_model=DownloadFilesResponse,
@@ -60,6 +60,8 @@ from bookcard.services.email_config_update import (
 )
 from bookcard.services.file_storage_service import FileStorageService
 from bookcard.services.oidc_auth_service import OIDCAuthError, OIDCAuthService
+from bookcard.services.oidc_key_manager import get_oidc_key_manager
+from bookcard.services.principal_cache import get_principal_cache
 from bookcard.services.security import (
     DataEncryptor,
     JWTManager,
@@ -236,7 +238,7 @@ def _load_user_with_permissions(session: Session, *, user_id: int) -> User:
 
 
 def _oidc_service(request: Request) -> OIDCAuthService:
-    return OIDCAuthService(request.app.state.config)
+    return OIDCAuthService(request.app.state.config, key_manager=get_oidc_key_manager())
 
 
 def _user_linking_service(session: Session) -> UserLinkingService:
@@ -540,6 +542,9 @@ def logout(
     blacklist_repo = TokenBlacklistRepository(session)
     blacklist_repo.add_to_blacklist(jti, expires_at)
     session.flush()
+    principal_cache = get_principal_cache()
+    if principal_cache is not None:
+        principal_cache.add_blacklisted(jti, expires_at)
     logger.info("User logged out: jti=%s", jti)
 
 
@@ -22,7 +22,7 @@ Business logic is delegated to services following SOLID principles.
 import logging
 import math
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -43,6 +43,7 @@ from sqlmodel import Session
 from bookcard.api.deps import (
     _resolve_active_library,
     get_active_library_id,
+    get_cover_thumbnail_cache,
     get_current_user,
     get_db_session,
     get_optional_user,
@@ -94,14 +95,19 @@ from bookcard.services.book_read_model_service import BookReadModelService
 from bookcard.services.book_response_builder import BookResponseBuilder
 from bookcard.services.book_service import BookService
 from bookcard.services.config_service import FileHandlingConfigService
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
 from bookcard.services.email_config_service import EmailConfigService
 from bookcard.services.format_metadata_service import FormatMetadataService
+from bookcard.services.http_caching import conditional_file_response
 from bookcard.services.metadata_enforcement_trigger_service import (
     MetadataEnforcementTriggerService,
 )
 from bookcard.services.metadata_export_service import MetadataExportService
 from bookcard.services.metadata_import_service import MetadataImportService
-from bookcard.services.multi_library_book_service import MultiLibraryBookService
+from bookcard.services.multi_library_book_service import (
+    MultiLibraryBookPage,
+    MultiLibraryBookService,
+)
 from bookcard.services.multi_library_response_builder import (
     MultiLibraryResponseBuilder,
 )
@@ -296,6 +302,7 @@ def _get_response_builder(
 
 def _get_cover_service(
     book_service: Annotated[BookService, Depends(_get_active_library_service)],
+    thumbnail_cache: Annotated[CoverThumbnailCache, Depends(get_cover_thumbnail_cache)],
 ) -> BookCoverService:
     """Get book cover service instance.
 
@@ -303,13 +310,15 @@ def _get_cover_service(
     ----------
     book_service : BookService
         Book service instance.
+    thumbnail_cache : CoverThumbnailCache
+        Cover thumbnail cache invalidated when covers change.
 
     Returns
     -------
     BookCoverService
         Cover service instance.
     """
-    return BookCoverService(book_service)
+    return BookCoverService(book_service, thumbnail_cache)
 
 
 def _get_book_merge_service(
@@ -438,9 +447,10 @@ def _get_library_aware_file_service(
 
 def _get_library_aware_cover_service(
     book_service: Annotated[BookService, Depends(_get_library_aware_book_service)],
+    thumbnail_cache: Annotated[CoverThumbnailCache, Depends(get_cover_thumbnail_cache)],
 ) -> BookCoverService:
     """Build :class:`BookCoverService` from the library-aware book service."""
-    return BookCoverService(book_service)
+    return BookCoverService(book_service, thumbnail_cache)
 
 
 def _get_library_aware_response_builder(
@@ -678,6 +688,35 @@ def _build_multi_library_context(
     return services, libraries
 
 
+def _list_multi_library_page(
+    list_page: Callable[[], MultiLibraryBookPage],
+) -> MultiLibraryBookPage:
+    """Run an all-libraries listing, rejecting stale or malformed cursors.
+
+    Parameters
+    ----------
+    list_page : Callable[[], MultiLibraryBookPage]
+        Bound listing call.
+
+    Returns
+    -------
+    MultiLibraryBookPage
+        Listed page.
+
+    Raises
+    ------
+    HTTPException
+        If the pagination cursor is invalid (400).
+    """
+    try:
+        return list_page()
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+
 def _resolve_effective_book_service(
     session: Session,
     current_user: User | None,
@@ -743,6 +782,10 @@ def list_books(
             description="Optional library ID to list books from a specific library",
         ),
     ] = None,
+    cursor: Annotated[
+        str | None,
+        Query(description="Continuation cursor from a previous all-libraries page"),
+    ] = None,
 ) -> BookListResponse:
     """List books with pagination and optional search.
 
@@ -785,6 +828,9 @@ def list_books(
         Optional day (1-31) to filter books by publication date day.
     requested_library_id : int | None
         Optional explicit library ID to fetch books from.
+    cursor : str | None
+        ``next_cursor`` of a previous all-libraries page; continues after
+        it instead of using ``page``.
 
     Returns
     -------
@@ -797,8 +843,12 @@ def list_books(
         If no active library is configured (404), permission denied (403),
         or requested library not accessible (403).
     """
-    if current_user is not None:
-        permission_helper.check_read_permission(current_user)
+    # Users with conditional read grants only list the books they may read
+    visibility = (
+        permission_helper.get_read_visibility(current_user)
+        if current_user is not None
+        else None
+    )
 
     if page < 1:
         page = 1
@@ -808,6 +858,7 @@ def list_books(
         page_size = 100
 
     effective_library_id: int | None = library_id
+    next_cursor: str | None = None
 
     if requested_library_id is not None and requested_library_id != library_id:
         # Explicit single-library override
@@ -824,6 +875,7 @@ def list_books(
             full=full,
             pubdate_month=pubdate_month,
             pubdate_day=pubdate_day,
+            visibility=visibility,
         )
         book_reads = eff_builder.build_book_read_list(books, full=full)
     elif (
@@ -835,18 +887,24 @@ def list_books(
         services, libraries = ctx
         multi_svc = MultiLibraryBookService(libraries)
         multi_builder = MultiLibraryResponseBuilder(services)
-        books, total = multi_svc.list_books(
-            page=page,
-            page_size=page_size,
-            search_query=search,
-            author_id=author_id,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            full=full,
-            pubdate_month=pubdate_month,
-            pubdate_day=pubdate_day,
+        multi_page = _list_multi_library_page(
+            lambda: multi_svc.list_books(
+                page=page,
+                page_size=page_size,
+                search_query=search,
+                author_id=author_id,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                full=full,
+                pubdate_month=pubdate_month,
+                pubdate_day=pubdate_day,
+                visibility=visibility,
+                cursor=cursor,
+            )
         )
-        book_reads = multi_builder.build_book_read_list(books, full=full)
+        total = multi_page.total
+        next_cursor = multi_page.next_cursor
+        book_reads = multi_builder.build_book_read_list(multi_page.books, full=full)
         effective_library_id = None
     else:
         # Default: single active library
@@ -860,6 +918,7 @@ def list_books(
             full=full,
             pubdate_month=pubdate_month,
             pubdate_day=pubdate_day,
+            visibility=visibility,
         )
         book_reads = response_builder.build_book_read_list(books, full=full)
 
@@ -878,6 +937,7 @@ def list_books(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -1126,24 +1186,38 @@ def delete_book(
 
 @router.get("/{book_id}/cover", response_model=None)
 def get_book_cover(
+    request: Request,
     current_user: OptionalUserDep,
     book_id: int,
     book_service: LibAwareBookServiceDep,
     permission_helper: PermissionHelperDep,
-) -> FileResponse | Response:
+    thumbnail_cache: Annotated[CoverThumbnailCache, Depends(get_cover_thumbnail_cache)],
+    w: Annotated[int | None, Query(ge=1, le=4096)] = None,
+    h: Annotated[int | None, Query(ge=1, le=4096)] = None,
+) -> Response:
     """Get book cover thumbnail image.
 
+    When ``w``/``h`` are given, a resized variant from the thumbnail cache is
+    served (WebP if the client accepts it). Responses carry a strong ETag and
+    honour ``If-None-Match``/``If-Modified-Since``.
+
     Parameters
     ----------
-    session : SessionDep
-        Database session dependency.
+    request : Request
+        Incoming request (used for conditional and ``Accept`` headers).
     book_id : int
         Calibre book ID.
+    thumbnail_cache : CoverThumbnailCache
+        Cover thumbnail cache.
+    w : int | None
+        Requested width in pixels (None for the original cover).
+    h : int | None
+        Requested height in pixels (None for the original cover).
 
     Returns
     -------
-    FileResponse | Response
-        Cover image file or 404 response.
+    Response
+        Cover image file, 304 Not Modified, or 404 response.
 
     Raises
     ------
@@ -1169,10 +1243,22 @@ def get_book_cover(
         )
         return Response(status_code=status.HTTP_404_NOT_FOUND)
 
-    return FileResponse(
-        path=str(cover_path),
-        media_type="image/jpeg",
-        filename=f"cover_{book_id_for_filename}.jpg",
+    image_format = (
+        "webp" if "image/webp" in request.headers.get("accept", "") else "jpeg"
+    )
+    thumbnail = thumbnail_cache.get(
+        cover_path, width=w, height=h, image_format=image_format
+    )
+    extension = "webp" if thumbnail.media_type == "image/webp" else "jpg"
+
+    return conditional_file_response(
+        request,
+        thumbnail.path,
+        media_type=thumbnail.media_type,
+        etag=thumbnail.etag,
+        last_modified=thumbnail.last_modified,
+        filename=f"cover_{book_id_for_filename}.{extension}",
+        extra_headers={"Vary": "Accept"},
     )
 
 
@@ -2383,6 +2469,10 @@ def filter_books(
             description="Optional library ID to filter books from a specific library",
         ),
     ] = None,
+    cursor: Annotated[
+        str | None,
+        Query(description="Continuation cursor from a previous all-libraries page"),
+    ] = None,
 ) -> BookListResponse:
     """Filter books with multiple criteria using OR conditions.
 
@@ -2412,6 +2502,9 @@ def filter_books(
         If True, return full book details with all metadata (default: False).
     requested_library_id : int | None
         Optional explicit library ID to filter books from.
+    cursor : str | None
+        ``next_cursor`` of a previous all-libraries page; continues after
+        it instead of using ``page``.
 
     Returns
     -------
@@ -2423,8 +2516,12 @@ def filter_books(
     HTTPException
         If no active library is configured (404) or permission denied (403).
     """
-    if current_user is not None:
-        permission_helper.check_read_permission(current_user)
+    # Users with conditional read grants only list the books they may read
+    visibility = (
+        permission_helper.get_read_visibility(current_user)
+        if current_user is not None
+        else None
+    )
 
     if page < 1:
         page = 1
@@ -2446,9 +2543,11 @@ def filter_books(
         "sort_by": sort_by,
         "sort_order": sort_order,
         "full": full,
+        "visibility": visibility,
     }
 
     effective_library_id: int | None = library_id
+    next_cursor: str | None = None
 
     if requested_library_id is not None and requested_library_id != library_id:
         eff_svc, eff_builder, effective_library_id = _resolve_requested_library(
@@ -2468,12 +2567,17 @@ def filter_books(
         services, libraries = ctx
         multi_svc = MultiLibraryBookService(libraries)
         multi_builder = MultiLibraryResponseBuilder(services)
-        books, total = multi_svc.list_books_with_filters(
-            page=page,
-            page_size=page_size,
-            **filter_kwargs,
+        multi_page = _list_multi_library_page(
+            lambda: multi_svc.list_books_with_filters(
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+                **filter_kwargs,
+            )
         )
-        book_reads = multi_builder.build_book_read_list(books, full=full)
+        total = multi_page.total
+        next_cursor = multi_page.next_cursor
+        book_reads = multi_builder.build_book_read_list(multi_page.books, full=full)
         effective_library_id = None
     else:
         books, total = book_service.list_books_with_filters(
@@ -2498,6 +2602,7 @@ def filter_books(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
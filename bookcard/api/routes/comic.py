@@ -23,25 +23,32 @@ import io
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 from PIL import Image
 from sqlmodel import Session
 
-from bookcard.api.deps import _resolve_active_library, get_current_user, get_db_session
+from bookcard.api.deps import (
+    _resolve_active_library,
+    get_comic_archive_service,
+    get_current_user,
+    get_db_session,
+)
 from bookcard.models.auth import User
 from bookcard.repositories.config_repository import LibraryRepository
 from bookcard.services.book_permission_helper import BookPermissionHelper
 from bookcard.services.book_service import BookService
 from bookcard.services.comic.archive import (
     ComicArchiveError,
-    create_comic_archive_service,
+    ComicArchiveService,
 )
+from bookcard.services.http_caching import conditional_file_response
 
 router = APIRouter(prefix="/comic", tags=["comic"])
 
 SessionDep = Annotated[Session, Depends(get_db_session)]
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
+ArchiveServiceDep = Annotated[ComicArchiveService, Depends(get_comic_archive_service)]
 
 
 def _get_book_service(
@@ -267,11 +274,59 @@ def _get_comic_file_path(
     return _find_comic_file(book_path, format_data, book_id, file_format)
 
 
+def _get_readable_comic_file(
+    session: Session,
+    current_user: User,
+    book_id: int,
+    file_format: str,
+    library_id: int | None,
+) -> Path:
+    """Resolve a comic file after checking the user may read the book.
+
+    Parameters
+    ----------
+    session : Session
+        Database session.
+    current_user : User
+        Current authenticated user.
+    book_id : int
+        Book ID.
+    file_format : str
+        Comic format (CBZ, CBR, CB7, CBC).
+    library_id : int | None
+        Optional library ID override.
+
+    Returns
+    -------
+    Path
+        Path to the comic file.
+
+    Raises
+    ------
+    HTTPException
+        If book not found, format not found, or permission denied.
+    """
+    book_service = _get_book_service(session, current_user, library_id)
+    book_with_rels = book_service.get_book_full(book_id)
+
+    if book_with_rels is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="book_not_found",
+        )
+
+    permission_helper = BookPermissionHelper(session)
+    permission_helper.check_read_permission(current_user, book_with_rels)
+
+    return _get_comic_file_path(book_service, book_id, file_format)
+
+
 @router.get("/{book_id}/pages")
 def list_comic_pages(
     book_id: int,
     session: SessionDep,
     current_user: CurrentUserDep,
+    archive_service: ArchiveServiceDep,
     file_format: str = Query(..., description="Comic format (CBZ, CBR, CB7, CBC)"),
     include_dimensions: bool = Query(
         False,
@@ -291,6 +346,8 @@ def list_comic_pages(
         Database session.
     current_user : User
         Current authenticated user.
+    archive_service : ComicArchiveService
+        Shared comic archive service.
     library_id : int | None
         Optional library ID override.
 
@@ -321,7 +378,6 @@ def list_comic_pages(
     file_path = _get_comic_file_path(book_service, book_id, file_format)
 
     # List pages
-    archive_service = create_comic_archive_service()
     try:
         pages = archive_service.list_pages(
             file_path, include_dimensions=include_dimensions
@@ -347,10 +403,12 @@ def list_comic_pages(
 
 @router.get("/{book_id}/pages/{page_number}")
 def get_comic_page(
+    request: Request,
     book_id: int,
     page_number: int,
     session: SessionDep,
     current_user: CurrentUserDep,
+    archive_service: ArchiveServiceDep,
     file_format: str = Query(..., description="Comic format (CBZ, CBR, CB7, CBC)"),
     thumbnail: bool = Query(
         False,
@@ -364,8 +422,14 @@ def get_comic_page(
 ) -> Response:
     """Get a specific page image from a comic book archive.
 
+    Thumbnails up to the largest cached width are served from the page
+    thumbnail cache with a strong ETag and honour ``If-None-Match``; larger
+    ones are rendered on the fly.
+
     Parameters
     ----------
+    request : Request
+        Incoming request (used for conditional headers).
     book_id : int
         Book ID.
     page_number : int
@@ -380,38 +444,40 @@ def get_comic_page(
         Database session.
     current_user : User
         Current authenticated user.
+    archive_service : ComicArchiveService
+        Shared comic archive service.
     library_id : int | None
         Optional library ID override.
 
     Returns
     -------
     Response
-        Image response with appropriate content type.
+        Image response with appropriate content type, or 304 Not Modified.
 
     Raises
     ------
     HTTPException
         If book not found, format not found, page not found, or permission denied.
     """
-    book_service = _get_book_service(session, current_user, library_id)
-    book_with_rels = book_service.get_book_full(book_id)
-
-    if book_with_rels is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="book_not_found",
-        )
-
-    # Check permission
-    permission_helper = BookPermissionHelper(session)
-    permission_helper.check_read_permission(current_user, book_with_rels)
-
-    # Get file path
-    file_path = _get_comic_file_path(book_service, book_id, file_format)
+    file_path = _get_readable_comic_file(
+        session, current_user, book_id, file_format, library_id
+    )
 
-    # Extract page
-    archive_service = create_comic_archive_service()
     try:
+        if thumbnail or max_width:
+            cached = archive_service.get_page_thumbnail(
+                file_path, page_number, max_width=max_width
+            )
+            if cached is not None:
+                return conditional_file_response(
+                    request,
+                    cached.path,
+                    media_type=cached.media_type,
+                    etag=cached.etag,
+                    last_modified=cached.last_modified,
+                )
+
+        # Extract page
         page = archive_service.get_page(file_path, page_number)
     except ComicArchiveError as e:
         raise HTTPException(
@@ -458,10 +524,12 @@ def get_comic_page(
 
 @router.get("/{book_id}/pages/{page_number}/thumbnail")
 def get_comic_page_thumbnail(
+    request: Request,
     book_id: int,
     page_number: int,
     session: SessionDep,
     current_user: CurrentUserDep,
+    archive_service: ArchiveServiceDep,
     file_format: str = Query(..., description="Comic format (CBZ, CBR, CB7, CBC)"),
     max_width: int = Query(240, description="Maximum width for thumbnail (pixels)"),
     library_id: int | None = Query(None, description="Library this book belongs to"),
@@ -472,6 +540,8 @@ def get_comic_page_thumbnail(
 
     Parameters
     ----------
+    request : Request
+        Incoming request (used for conditional headers).
     book_id : int
         Book ID.
     page_number : int
@@ -484,6 +554,8 @@ def get_comic_page_thumbnail(
         Database session.
     current_user : User
         Current authenticated user.
+    archive_service : ComicArchiveService
+        Shared comic archive service.
     library_id : int | None
         Optional library ID override.
 
@@ -493,6 +565,7 @@ def get_comic_page_thumbnail(
         Thumbnail image response.
     """
     return get_comic_page(
+        request=request,
         book_id=book_id,
         page_number=page_number,
         file_format=file_format,
@@ -500,5 +573,87 @@ def get_comic_page_thumbnail(
         max_width=max_width,
         session=session,
         current_user=current_user,
+        archive_service=archive_service,
         library_id=library_id,
     )
+
+
+@router.get("/{book_id}/thumbnails/sprite")
+def get_comic_thumbnail_sprite(
+    request: Request,
+    book_id: int,
+    session: SessionDep,
+    current_user: CurrentUserDep,
+    archive_service: ArchiveServiceDep,
+    file_format: str = Query(..., description="Comic format (CBZ, CBR, CB7, CBC)"),
+    max_width: int = Query(
+        120, ge=1, le=960, description="Maximum width of each thumbnail (pixels)"
+    ),
+    columns: int = Query(10, ge=1, le=50, description="Thumbnails per row"),
+    library_id: int | None = Query(None, description="Library this book belongs to"),
+) -> Response:
+    """Get every page thumbnail of a comic as a single sprite sheet.
+
+    Page ``n`` occupies the cell at column ``(n - 1) % columns`` and row
+    ``(n - 1) // columns``. The layout is returned in ``X-Sprite-*`` headers.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request (used for conditional headers).
+    book_id : int
+        Book ID.
+    session : Session
+        Database session.
+    current_user : User
+        Current authenticated user.
+    archive_service : ComicArchiveService
+        Shared comic archive service.
+    file_format : str
+        Comic format (CBZ, CBR, CB7, CBC).
+    max_width : int
+        Maximum width of each thumbnail.
+    columns : int
+        Thumbnails per row.
+    library_id : int | None
+        Optional library ID override.
+
+    Returns
+    -------
+    Response
+        JPEG sprite sheet, or 304 Not Modified.
+
+    Raises
+    ------
+    HTTPException
+        If book not found, format not found, the sheet cannot be rendered,
+        or permission denied.
+    """
+    file_path = _get_readable_comic_file(
+        session, current_user, book_id, file_format, library_id
+    )
+
+    try:
+        sprite = archive_service.get_sprite_sheet(
+            file_path, max_width=max_width, columns=columns
+        )
+    except ComicArchiveError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    return conditional_file_response(
+        request,
+        sprite.path,
+        media_type=sprite.media_type,
+        etag=sprite.etag,
+        last_modified=sprite.last_modified,
+        extra_headers={
+            "X-Sprite-Pages": str(sprite.page_count),
+            "X-Sprite-Columns": str(sprite.columns),
+            "X-Sprite-Rows": str(sprite.rows),
+            "X-Sprite-Cell-Width": str(sprite.cell_width),
+            "X-Sprite-Cell-Height": str(sprite.cell_height),
+        },
+    )
@@ -35,6 +35,7 @@ from sqlmodel import Session, select
 
 from bookcard.api.deps import (
     _resolve_active_library,
+    get_cover_thumbnail_cache,
     get_db_session,
     get_kobo_auth_token,
     get_kobo_user,
@@ -57,6 +58,7 @@ from bookcard.repositories.kobo_repository import (
 )
 from bookcard.repositories.reading_repository import ReadStatusRepository
 from bookcard.services.book_service import BookService
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
 from bookcard.services.kobo.book_lookup_service import KoboBookLookupService
 from bookcard.services.kobo.cover_service import KoboCoverService
 from bookcard.services.kobo.device_auth_service import KoboDeviceAuthService
@@ -494,6 +496,7 @@ def _get_kobo_library_service(
 def _get_kobo_cover_service(
     session: SessionDep,
     book_service: Annotated[BookService, Depends(_get_book_service)],
+    thumbnail_cache: Annotated[CoverThumbnailCache, Depends(get_cover_thumbnail_cache)],
 ) -> KoboCoverService:
     """Get Kobo cover service.
 
@@ -503,6 +506,8 @@ def _get_kobo_cover_service(
         Database session.
     book_service : BookService
         Book service.
+    thumbnail_cache : CoverThumbnailCache
+        Cover thumbnail cache.
 
     Returns
     -------
@@ -515,6 +520,7 @@ def _get_kobo_cover_service(
         book_service=book_service,
         book_lookup_service=book_lookup_service,
         proxy_service=proxy_service,
+        thumbnail_cache=thumbnail_cache,
     )
 
 
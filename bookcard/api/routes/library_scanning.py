@@ -38,6 +38,12 @@ class ScanRequest(BaseModel):
     data_source_config: dict[str, Any] | None = None
 
 
+class FileHashBackfillRequest(BaseModel):
+    """Request model for rebuilding a library's file hash index."""
+
+    library_id: int
+
+
 class ScanResponse(BaseModel):
     """Response model for scan initiation."""
 
@@ -148,6 +154,60 @@ def scan_library(
         ) from e
 
 
+@router.post(
+    "/file-hashes/backfill",
+    response_model=ScanResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(get_admin_user)],
+)
+def backfill_file_hashes(
+    request: FileHashBackfillRequest,
+    http_request: Request,
+    current_user: Annotated[User, Depends(get_admin_user)],
+) -> ScanResponse:
+    """Build or refresh the file hash index of a library.
+
+    Creates and enqueues a BOOK_FILE_HASH_BACKFILL task. Only files that are
+    not indexed yet or changed on disk are hashed.
+
+    Parameters
+    ----------
+    request : FileHashBackfillRequest
+        Request with the library_id.
+    http_request : Request
+        FastAPI request object for accessing app state.
+    current_user : User
+        Current authenticated admin user.
+
+    Returns
+    -------
+    ScanResponse
+        Task ID and message.
+
+    Raises
+    ------
+    HTTPException
+        If the task runner is not available.
+    """
+    task_runner = getattr(http_request.app.state, "task_runner", None)
+    if task_runner is None:
+        _raise_service_unavailable("Task runner not available")
+
+    task_id = task_runner.enqueue(  # type: ignore[union-attr]
+        task_type=TaskType.BOOK_FILE_HASH_BACKFILL,
+        payload={},
+        user_id=current_user.id,
+        metadata={
+            "library_id": request.library_id,
+            "task_type": TaskType.BOOK_FILE_HASH_BACKFILL.value,
+        },
+    )
+    return ScanResponse(
+        task_id=task_id,
+        message=f"File hash backfill for library {request.library_id} queued",
+    )
+
+
 @router.get(
     "/state/{library_id}",
     response_model=ScanStateResponse | None,
@@ -31,13 +31,25 @@ from fastapi.responses import FileResponse
 from fastapi.responses import Response as FastAPIResponse
 from sqlmodel import Session, col, func, select
 
-from bookcard.api.deps import _resolve_active_library, get_db_session, get_opds_user
-from bookcard.api.schemas.opds import OpdsFeedRequest
+from bookcard.api.deps import (
+    _resolve_active_library,
+    get_cover_thumbnail_cache,
+    get_db_session,
+    get_opds_user,
+)
+from bookcard.api.schemas.opds import OpdsFeedRequest, OpdsFeedResponse
 from bookcard.models.auth import User
 from bookcard.models.core import Book, BookAuthorLink, BookSeriesLink, BookTagLink
 from bookcard.repositories.config_repository import LibraryRepository
 from bookcard.services.book_permission_helper import BookPermissionHelper
 from bookcard.services.book_service import BookService
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache  # noqa: TC001
+from bookcard.services.http_caching import (
+    build_validator_headers,
+    conditional_file_response,
+    is_not_modified,
+)
+from bookcard.services.opds.feed_cache import get_opds_feed_cache
 from bookcard.services.opds.feed_service import OpdsFeedService
 from bookcard.services.permission_service import PermissionService
 
@@ -50,6 +62,16 @@ logger = logging.getLogger(__name__)
 SessionDep = Annotated[Session, Depends(get_db_session)]
 OpdsUserDep = Annotated[User | None, Depends(get_opds_user)]
 
+# Feeds change with the library, so clients must revalidate before reuse
+_OPDS_FEED_CACHE_CONTROL = "private, no-cache"
+
+# Longest edge (pixels) served by the sized OPDS cover routes
+_OPDS_COVER_SIZES: dict[str, int] = {
+    "cover_90_90": 90,
+    "cover_240_240": 240,
+    "thumb_240_240": 240,
+}
+
 
 def _check_opds_read_permission(
     user: User | None,
@@ -84,6 +106,45 @@ def _check_opds_read_permission(
         )
 
 
+def _feed_response(request: Request, feed_response: OpdsFeedResponse) -> Response:
+    """Build the HTTP response for a generated feed.
+
+    Cached feeds carry validators; for those the response includes
+    ``ETag``/``Last-Modified`` headers and conditional requests for an
+    unchanged feed are answered with ``304 Not Modified``.
+
+    Parameters
+    ----------
+    request : Request
+        FastAPI request object.
+    feed_response : OpdsFeedResponse
+        Generated feed.
+
+    Returns
+    -------
+    Response
+        Feed response, or an empty 304 response.
+    """
+    if feed_response.etag is None:
+        return Response(
+            content=feed_response.xml_content,
+            media_type=feed_response.content_type,
+        )
+
+    headers = build_validator_headers(
+        feed_response.etag,
+        feed_response.last_modified,
+        cache_control=_OPDS_FEED_CACHE_CONTROL,
+    )
+    if is_not_modified(request, feed_response.etag, feed_response.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=feed_response.xml_content,
+        media_type=feed_response.content_type,
+        headers=headers,
+    )
+
+
 def _get_opds_feed_service(
     session: Session,
     opds_user: User | None,
@@ -126,7 +187,7 @@ def _get_opds_feed_service(
         lib_repo = LibraryRepository(session)
         lib = lib_repo.get(library_id)
         if lib is not None:
-            return OpdsFeedService(session, lib)
+            return OpdsFeedService(session, lib, feed_cache=get_opds_feed_cache())
 
     user_id = opds_user.id if opds_user else None
     library = _resolve_active_library(session, user_id)
@@ -137,7 +198,7 @@ def _get_opds_feed_service(
             detail="no_active_library",
         )
 
-    return OpdsFeedService(session, library)
+    return OpdsFeedService(session, library, feed_cache=get_opds_feed_cache())
 
 
 def _opds_feed_service_dep(
@@ -233,10 +294,7 @@ def feed_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_catalog_feed(request, opds_user)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/books", response_class=FastAPIResponse)
@@ -279,10 +337,7 @@ def feed_books(
     feed_request = OpdsFeedRequest(offset=offset, page_size=page_size)
     feed_response = feed_service.generate_books_feed(request, opds_user, feed_request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/new", response_class=FastAPIResponse)
@@ -325,10 +380,7 @@ def feed_new(
     feed_request = OpdsFeedRequest(offset=offset, page_size=page_size)
     feed_response = feed_service.generate_new_feed(request, opds_user, feed_request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/discover", response_class=FastAPIResponse)
@@ -370,10 +422,7 @@ def feed_discover(
         request, opds_user, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/search", response_class=FastAPIResponse)
@@ -441,10 +490,7 @@ def feed_search(
         request, opds_user, search_query, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/osd", response_class=FastAPIResponse)
@@ -475,10 +521,7 @@ def feed_osd(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_opensearch_description(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/search/{query:path}", response_class=FastAPIResponse)
@@ -531,10 +574,7 @@ def feed_search_path(
         request, opds_user, normalized_query, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/books/letter/{letter}", response_class=FastAPIResponse)
@@ -577,10 +617,7 @@ def feed_books_letter(
         request, opds_user, letter, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/rated", response_class=FastAPIResponse)
@@ -618,10 +655,7 @@ def feed_rated(
     feed_request = OpdsFeedRequest(offset=offset, page_size=page_size)
     feed_response = feed_service.generate_rated_feed(request, opds_user, feed_request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 def _get_opds_media_type(format_name: str) -> str:
@@ -769,28 +803,37 @@ def opds_download(
     "/thumb_240_240/{book_id}", methods=["GET", "HEAD"], response_class=FastAPIResponse
 )
 def opds_cover(
+    request: Request,
     session: SessionDep,
     opds_user: OpdsUserDep,
     book_id: int,
+    thumbnail_cache: Annotated[CoverThumbnailCache, Depends(get_cover_thumbnail_cache)],
     library_id: int | None = Query(None, description="Library this book belongs to"),
 ) -> Response:
     """Get book cover image via OPDS.
 
+    The sized routes (``cover_90_90``, ``cover_240_240``, ``thumb_240_240``)
+    serve resized variants from the thumbnail cache.
+
     Parameters
     ----------
+    request : Request
+        Incoming request (route path selects the size; conditional headers).
     session : SessionDep
         Database session.
     opds_user : User | None
         Authenticated user (required for book access).
     book_id : int
         Book ID.
+    thumbnail_cache : CoverThumbnailCache
+        Cover thumbnail cache.
     library_id : int | None
         Optional library ID override.
 
     Returns
     -------
     Response
-        Cover image file or 404 response.
+        Cover image file, 304 Not Modified, or 404 response.
     """
     _check_opds_read_permission(opds_user, session)
 
@@ -842,10 +885,16 @@ def opds_cover(
         return Response(status_code=status.HTTP_404_NOT_FOUND)
 
     book_id_for_filename = book_with_rels.book.id or book_id
-
-    return FileResponse(
-        path=str(cover_path),
-        media_type="image/jpeg",
+    route_name = request.url.path.rstrip("/").split("/")[-2]
+    size = _OPDS_COVER_SIZES.get(route_name)
+    thumbnail = thumbnail_cache.get(cover_path, width=size, height=size)
+
+    return conditional_file_response(
+        request,
+        thumbnail.path,
+        media_type=thumbnail.media_type,
+        etag=thumbnail.etag,
+        last_modified=thumbnail.last_modified,
         filename=f"cover_{book_id_for_filename}.jpg",
     )
 
@@ -938,10 +987,7 @@ def feed_author_index(
     feed_request = OpdsFeedRequest(offset=offset, page_size=page_size)
     feed_response = feed_service.generate_author_index_feed(request, feed_request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/author/letter/{letter}", response_class=FastAPIResponse)
@@ -984,10 +1030,7 @@ def feed_author_letter(
         request, letter, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/author/{author_id}", response_class=FastAPIResponse)
@@ -1030,10 +1073,7 @@ def feed_author(
         request, opds_user, author_id, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Publisher routes
@@ -1069,10 +1109,7 @@ def feed_publisher_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_publisher_index_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/publisher/{publisher_id}", response_class=FastAPIResponse)
@@ -1115,10 +1152,7 @@ def feed_publisher(
         request, opds_user, publisher_id, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Category/Tag routes
@@ -1154,10 +1188,7 @@ def feed_category_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_category_index_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/category/letter/{letter}", response_class=FastAPIResponse)
@@ -1195,10 +1226,7 @@ def feed_category_letter(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_category_letter_feed(request, letter)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/category/{category_id}", response_class=FastAPIResponse)
@@ -1241,10 +1269,7 @@ def feed_category(
         request, opds_user, category_id, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Series routes
@@ -1280,10 +1305,7 @@ def feed_series_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_series_index_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/series/letter/{letter}", response_class=FastAPIResponse)
@@ -1321,10 +1343,7 @@ def feed_series_letter(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_series_letter_feed(request, letter)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/series/{series_id}", response_class=FastAPIResponse)
@@ -1367,10 +1386,7 @@ def feed_series(
         request, opds_user, series_id, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Ratings routes
@@ -1406,10 +1422,7 @@ def feed_rating_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_rating_index_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/ratings/{rating_id}", response_class=FastAPIResponse)
@@ -1452,10 +1465,7 @@ def feed_ratings(
         request, opds_user, rating_id, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Format routes
@@ -1491,10 +1501,7 @@ def feed_format_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_format_index_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/formats/{format_name}", response_class=FastAPIResponse)
@@ -1537,10 +1544,7 @@ def feed_format(
         request, opds_user, format_name, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Language routes
@@ -1576,10 +1580,7 @@ def feed_language_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_language_index_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/language/{language_id}", response_class=FastAPIResponse)
@@ -1622,10 +1623,7 @@ def feed_language(
         request, opds_user, language_id, feed_request
     )
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Shelf routes
@@ -1661,10 +1659,7 @@ def feed_shelf_index(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_shelf_index_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/shelf/{shelf_id}", response_class=FastAPIResponse)
@@ -1702,10 +1697,7 @@ def feed_shelf(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_books_by_shelf_feed(request, shelf_id)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Other routes
@@ -1744,10 +1736,7 @@ def feed_hot(
     feed_request = OpdsFeedRequest(offset=offset, page_size=page_size)
     feed_response = feed_service.generate_hot_feed(request, opds_user, feed_request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/readbooks", response_class=FastAPIResponse)
@@ -1778,10 +1767,7 @@ def feed_read_books(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_read_books_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 @router.get("/unreadbooks", response_class=FastAPIResponse)
@@ -1812,10 +1798,7 @@ def feed_unread_books(
     _check_opds_read_permission(opds_user, session)
     feed_response = feed_service.generate_unread_books_feed(request)
 
-    return Response(
-        content=feed_response.xml_content,
-        media_type=feed_response.content_type,
-    )
+    return _feed_response(request, feed_response)
 
 
 # Calibre Companion endpoint
@@ -45,6 +45,7 @@ from bookcard.repositories.reading_repository import (
     ReadStatusRepository,
 )
 from bookcard.services.permission_service import PermissionService
+from bookcard.services.reading_progress_buffer import get_reading_progress_buffer
 from bookcard.services.reading_service import ReadingService
 
 READING_RESOURCE_NAME = "books"
@@ -84,6 +85,7 @@ def _reading_service(session: SessionDep) -> ReadingService:
         session_repo,
         status_repo,
         annotation_repo,
+        progress_buffer=get_reading_progress_buffer(),
     )
 
 
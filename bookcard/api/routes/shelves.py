@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import tempfile
+from collections.abc import Iterator, Mapping
 from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
@@ -64,11 +65,13 @@ from bookcard.repositories.shelf_repository import (
 )
 from bookcard.services.config_service import LibraryService
 from bookcard.services.magic_shelf.evaluator import BookRuleEvaluator
+from bookcard.services.magic_shelf.materializer import MagicShelfMaterializer
 from bookcard.services.magic_shelf.service import MagicShelfService
 from bookcard.services.permission_service import PermissionService
 from bookcard.services.shelf_service import ShelfService
 
 if TYPE_CHECKING:
+    from bookcard.models.config import Library
     from bookcard.models.shelves import Shelf
     from bookcard.repositories.interfaces import IBookRepository
 
@@ -148,6 +151,35 @@ def _get_active_library_id(
 ActiveLibraryIdDep = Annotated[int, Depends(_get_active_library_id)]
 
 
+class _LibraryBookRepositories(Mapping[int, "IBookRepository"]):
+    """Book repositories of visible libraries, created on first access.
+
+    Magic Shelves are counted and listed from their materialized
+    membership, so most requests never touch most libraries' Calibre DBs.
+    """
+
+    def __init__(self, libraries: dict[int, Library]) -> None:
+        self._libraries = libraries
+        self._repos: dict[int, IBookRepository] = {}
+
+    def __getitem__(self, library_id: int) -> IBookRepository:
+        repo = self._repos.get(library_id)
+        if repo is None:
+            library = self._libraries[library_id]
+            repo = CalibreBookRepository(
+                calibre_db_path=library.calibre_db_path,
+                calibre_db_file=library.calibre_db_file,
+            )
+            self._repos[library_id] = repo
+        return repo
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._libraries)
+
+    def __len__(self) -> int:
+        return len(self._libraries)
+
+
 def _magic_shelf_service(
     session: SessionDep,
     visible_library_ids: VisibleLibraryIdsDep,
@@ -169,15 +201,13 @@ def _magic_shelf_service(
     library_repo = LibraryRepository(session)
     library_service = LibraryService(session, library_repo)
 
-    book_repos: dict[int, IBookRepository] = {}
+    libraries: dict[int, Library] = {}
     for lib_id in visible_library_ids:
         library = library_service.get_library(lib_id)
         if library and library.calibre_db_path:
-            book_repos[lib_id] = CalibreBookRepository(
-                calibre_db_path=library.calibre_db_path
-            )
+            libraries[lib_id] = library
 
-    if not book_repos:
+    if not libraries:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="No visible libraries have a configured Calibre path",
@@ -186,7 +216,12 @@ def _magic_shelf_service(
     shelf_repo = ShelfRepository(session)
     evaluator = BookRuleEvaluator()
 
-    return MagicShelfService(shelf_repo, book_repos, evaluator)
+    return MagicShelfService(
+        shelf_repo,
+        _LibraryBookRepositories(libraries),
+        evaluator,
+        materializer=MagicShelfMaterializer(session, evaluator),
+    )
 
 
 MagicShelfServiceDep = Annotated[MagicShelfService, Depends(_magic_shelf_service)]
@@ -17,11 +17,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import math
 from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from bookcard.api.deps import get_current_user, get_db_session
@@ -40,15 +43,24 @@ from bookcard.services.library_scanning.workers.progress import JobProgressTrack
 from bookcard.services.messaging.redis_broker import RedisBroker
 from bookcard.services.permission_service import PermissionService
 from bookcard.services.task_service import TaskService
+from bookcard.services.tasks.events import get_task_event_bus
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from bookcard.services.tasks.base import TaskRunner
+    from bookcard.services.tasks.events import TaskEventSubscription
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 SessionDep = Annotated[Session, Depends(get_db_session)]
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
 
+# Seconds between polls of a task event subscription
+_EVENT_POLL_INTERVAL = 0.25
+# Seconds of silence after which a task event stream sends a keep-alive
+_EVENT_KEEPALIVE_INTERVAL = 15.0
+
 
 def _get_task_runner(request: Request) -> TaskRunner | None:
     """Get task runner from app state.
@@ -222,6 +234,95 @@ def count_tasks(
     return TaskCountResponse(count=count)
 
 
+async def _task_event_stream(
+    request: Request,
+    subscription: TaskEventSubscription,
+) -> AsyncIterator[str]:
+    """Format task events of a subscription as Server-Sent Events.
+
+    The subscription is polled without blocking so that idle streams do
+    not hold threadpool workers.
+
+    Parameters
+    ----------
+    request : Request
+        Streaming request, checked for client disconnects.
+    subscription : TaskEventSubscription
+        Subscription to stream; closed when the stream ends.
+
+    Yields
+    ------
+    str
+        SSE-formatted events and keep-alive comments.
+    """
+    try:
+        yield "retry: 2000\n\n"
+        idle = 0.0
+        while not await request.is_disconnected():
+            event = subscription.get(timeout=0)
+            if event is None:
+                await asyncio.sleep(_EVENT_POLL_INTERVAL)
+                idle += _EVENT_POLL_INTERVAL
+                if idle >= _EVENT_KEEPALIVE_INTERVAL:
+                    idle = 0.0
+                    yield ": keep-alive\n\n"
+                continue
+            idle = 0.0
+            yield f"event: {event.event_type}\ndata: {json.dumps(event.to_dict())}\n\n"
+    finally:
+        subscription.close()
+
+
+@router.get("/events")
+def stream_task_events(
+    request: Request,
+    session: SessionDep,
+    current_user: CurrentUserDep,
+) -> StreamingResponse:
+    """Stream progress and status events of tasks via Server-Sent Events (SSE).
+
+    Regular users receive events of their own tasks; admins receive events
+    of all tasks.  Events carry ``progress`` ticks and ``status``
+    transitions, so clients need not poll the task endpoints.
+
+    Parameters
+    ----------
+    request : Request
+        FastAPI request object.
+    session : SessionDep
+        Database session dependency.
+    current_user : CurrentUserDep
+        Current authenticated user.
+
+    Returns
+    -------
+    StreamingResponse
+        SSE stream of JSON-encoded task events.
+
+    Raises
+    ------
+    HTTPException
+        If permission denied (403).
+    """
+    permission_service = PermissionService(session)
+    permission_service.check_permission(current_user, "tasks", "read")
+
+    user_id = current_user.id if not current_user.is_admin else None
+    # The stream outlives the request's session scope: release its connection
+    session.close()
+
+    subscription = get_task_event_bus().subscribe(user_id)
+    headers = {
+        "Cache-Control": "no-cache, no-transform",
+        "X-Accel-Buffering": "no",
+    }
+    return StreamingResponse(
+        _task_event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers=headers,
+    )
+
+
 @router.post("/bulk-cancel", response_model=BulkCancelResponse)
 def bulk_cancel_tasks(
     session: SessionDep,
@@ -122,6 +122,7 @@ from bookcard.api.schemas.kcc import (
     KCCProfileUpdate,
 )
 from bookcard.api.schemas.libraries import (
+    CalibreEngineStats,
     LibraryCreate,
     LibraryRead,
     LibraryStats,
@@ -199,6 +200,7 @@ __all__ = [
     "BookStripDrmResponse",
     "BookUpdate",
     "BookUploadResponse",
+    "CalibreEngineStats",
     "ConversionRequest",
     "CoverFromUrlRequest",
     "CoverFromUrlResponse",
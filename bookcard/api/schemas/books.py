@@ -253,6 +253,9 @@ class BookListResponse(BaseModel):
         Number of items per page.
     total_pages : int
         Total number of pages.
+    next_cursor : str | None
+        Cursor of the next page for all-libraries listings, None on the
+        last page or for single-library listings.
     """
 
     items: list[BookRead]
@@ -260,6 +263,7 @@ class BookListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
 
 
 class SearchSuggestionItem(BaseModel):
@@ -132,3 +132,18 @@ class LibraryStats(BaseModel):
     total_tags: int = Field(description="Total number of unique tags")
     total_ratings: int = Field(description="Total number of books with ratings")
     total_content_size: int = Field(description="Total file size in bytes")
+
+
+class CalibreEngineStats(BaseModel):
+    """Reuse counters of the shared Calibre database engines."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    libraries: int = Field(description="Libraries with open engines")
+    engine_hits: int = Field(description="Lookups served by an existing engine")
+    engine_misses: int = Field(description="Lookups that created a new engine")
+    evictions: int = Field(description="Library engines disposed")
+    checkouts: int = Field(description="Connections checked out of the pools")
+    connections_opened: int = Field(description="New connections opened")
+    pool_hits: int = Field(description="Checkouts served by an open connection")
+    pool_misses: int = Field(description="Checkouts that opened a connection")
@@ -46,6 +46,11 @@ class OpdsFeedResponse(BaseModel):
         Generated OPDS XML content.
     content_type : str
         HTTP content type (default: 'application/atom+xml;profile=opds-catalog').
+    etag : str | None
+        Quoted entity tag, set when the feed is cacheable.
+    last_modified : float | None
+        Library modification time (POSIX timestamp), set when the feed is
+        cacheable.
     """
 
     xml_content: str = Field(description="Generated OPDS XML content")
@@ -53,6 +58,10 @@ class OpdsFeedResponse(BaseModel):
         default="application/atom+xml;profile=opds-catalog",
         description="HTTP content type",
     )
+    etag: str | None = Field(default=None, description="Entity tag")
+    last_modified: float | None = Field(
+        default=None, description="Library modification time"
+    )
 
 
 class OpdsLink(BaseModel):
@@ -27,6 +27,7 @@ from bookcard.api.services.container import (
     INFRASTRUCTURE_EXCEPTIONS,
     ServiceContainer,
 )
+from bookcard.repositories.engine_registry import get_calibre_engine_registry
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,9 @@ def initialize_services(app: FastAPI, container: ServiceContainer) -> None:
     container : ServiceContainer
         Service container for creating services.
     """
+    # Task progress and status events, streamed to clients
+    app.state.task_event_bus = container.create_task_event_bus()
+
     # Initialize task runner
     app.state.task_runner = container.create_task_runner()
 
@@ -100,6 +104,24 @@ def initialize_services(app: FastAPI, container: ServiceContainer) -> None:
     # Initialize ingest watcher (depends on task runner, so initialize after)
     app.state.ingest_watcher = container.create_ingest_watcher(app.state.task_runner)
 
+    # Shared, cached HTTP clients for metadata providers
+    app.state.provider_http_pool = container.create_provider_http_pool()
+
+    # Full-text search indexes of Calibre libraries
+    app.state.book_search_indexes = container.create_book_search_indexes()
+
+    # Targeted cache invalidation on changes made by desktop Calibre etc.
+    app.state.library_change_monitor = container.create_library_change_monitor()
+
+    # Shared OIDC discovery, signing keys and validated-token cache
+    app.state.oidc_key_manager = container.create_oidc_key_manager()
+
+    # Users, permission grants and token blacklist of local JWT requests
+    app.state.principal_cache = container.create_principal_cache()
+
+    # Write-behind buffer for reading progress updates
+    app.state.reading_progress_buffer = container.create_reading_progress_buffer()
+
 
 def _get_background_services(app: FastAPI) -> list[tuple[str, object]]:
     """Get list of background services that need to be started/stopped.
@@ -125,6 +147,21 @@ def _get_background_services(app: FastAPI) -> list[tuple[str, object]]:
     if hasattr(app.state, "ingest_watcher") and app.state.ingest_watcher:
         services.append(("ingest watcher", app.state.ingest_watcher))
 
+    if (
+        hasattr(app.state, "library_change_monitor")
+        and app.state.library_change_monitor
+    ):
+        services.append(("library change monitor", app.state.library_change_monitor))
+
+    if hasattr(app.state, "oidc_key_manager") and app.state.oidc_key_manager:
+        services.append(("OIDC key manager", app.state.oidc_key_manager))
+
+    if (
+        hasattr(app.state, "reading_progress_buffer")
+        and app.state.reading_progress_buffer
+    ):
+        services.append(("reading progress buffer", app.state.reading_progress_buffer))
+
     return services
 
 
@@ -191,3 +228,78 @@ def stop_background_services(app: FastAPI) -> None:
                 shutdown()
             except (RuntimeError, OSError) as e:
                 logger.warning("Error shutting down task runner: %s", e)
+
+    _close_provider_http_pool(app)
+    _close_book_search_indexes(app)
+    _stop_task_event_bus(app)
+    _dispose_calibre_engines()
+
+
+def _close_provider_http_pool(app: FastAPI) -> None:
+    """Close the metadata provider HTTP pool and its response cache.
+
+    Parameters
+    ----------
+    app : FastAPI
+        FastAPI application instance.
+    """
+    pool = getattr(app.state, "provider_http_pool", None)
+    if pool is None:
+        return
+    try:
+        pool.close()
+    except (RuntimeError, OSError) as e:
+        logger.warning("Error closing metadata provider HTTP pool: %s", e)
+
+
+def _close_book_search_indexes(app: FastAPI) -> None:
+    """Close the full-text search indexes of all libraries.
+
+    Parameters
+    ----------
+    app : FastAPI
+        FastAPI application instance.
+    """
+    registry = getattr(app.state, "book_search_indexes", None)
+    if registry is None:
+        return
+    try:
+        registry.close()
+    except (RuntimeError, OSError) as e:
+        logger.warning("Error closing book search indexes: %s", e)
+
+
+def _stop_task_event_bus(app: FastAPI) -> None:
+    """Stop delivering task events.
+
+    Parameters
+    ----------
+    app : FastAPI
+        FastAPI application instance.
+    """
+    bus = getattr(app.state, "task_event_bus", None)
+    if bus is None:
+        return
+    try:
+        bus.stop()
+    except (RuntimeError, OSError) as e:
+        logger.warning("Error stopping task event bus: %s", e)
+
+
+def _dispose_calibre_engines() -> None:
+    """Log the Calibre engine reuse counters and close the pooled engines."""
+    registry = get_calibre_engine_registry()
+    stats = registry.stats()
+    logger.info(
+        "Calibre engines: %d hits, %d misses, %d evictions; "
+        "connections: %d pool hits, %d pool misses",
+        stats.engine_hits,
+        stats.engine_misses,
+        stats.evictions,
+        stats.pool_hits,
+        stats.pool_misses,
+    )
+    try:
+        registry.dispose_all()
+    except (RuntimeError, OSError) as e:
+        logger.warning("Error disposing Calibre engines: %s", e)
@@ -20,15 +20,39 @@ following the Inversion of Control principle to reduce coupling.
 """
 
 import logging
+import sqlite3
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from bookcard.config import AppConfig
 from bookcard.database import get_session
+from bookcard.metadata.http import ProviderHttpPool, configure_provider_http_pool
+from bookcard.repositories.calibre.change_detector import (
+    LibraryChangeMonitor,
+    configure_library_change_monitor,
+)
+from bookcard.repositories.calibre.read_model import notify_book_read_model
+from bookcard.repositories.calibre.search_index import (
+    BookSearchIndexRegistry,
+    configure_book_search_indexes,
+    notify_book_search_index,
+)
+from bookcard.repositories.config_repository import LibraryRepository
 from bookcard.services.ingest.ingest_config_service import IngestConfigService
 from bookcard.services.ingest.ingest_watcher_service import IngestWatcherService
 from bookcard.services.library_scanning.workers.manager import ScanWorkerManager
 from bookcard.services.messaging.redis_broker import RedisBroker
+from bookcard.services.oidc_key_manager import (
+    OIDCKeyManager,
+    configure_oidc_key_manager,
+)
+from bookcard.services.principal_cache import PrincipalCache, configure_principal_cache
+from bookcard.services.reading_progress_buffer import (
+    ReadingProgressBuffer,
+    configure_reading_progress_buffer,
+)
 from bookcard.services.scheduler.service import APSchedulerService
+from bookcard.services.tasks.events import TaskEventBus, configure_task_event_bus
 from bookcard.services.tasks.runner_factory import create_task_runner
 
 if TYPE_CHECKING:
@@ -93,6 +117,31 @@ class ServiceContainer:
             )
             return None
 
+    def create_task_event_bus(self) -> TaskEventBus:
+        """Create and start the global task event bus.
+
+        Events are relayed through Redis when it is enabled, so that
+        out-of-process task workers reach the task event stream.
+
+        Returns
+        -------
+        TaskEventBus
+            Installed bus; an in-process bus if Redis is disabled or the
+            Redis bus cannot be created.
+        """
+        redis_url = self.config.redis_url if self.config.redis_enabled else None
+        try:
+            bus = configure_task_event_bus(redis_url)
+            bus.start()
+        except INFRASTRUCTURE_EXCEPTIONS as exc:
+            logger.warning(
+                "Failed to initialize Redis task event bus: %s. Task events will only reach this process.",
+                exc,
+            )
+            return configure_task_event_bus(None)
+        else:
+            return bus
+
     def create_redis_broker(self) -> RedisBroker | None:
         """Create Redis broker instance.
 
@@ -217,3 +266,104 @@ class ServiceContainer:
             return None
         else:
             return watcher
+
+    def create_provider_http_pool(self) -> ProviderHttpPool | None:
+        """Create the shared HTTP pool of metadata providers.
+
+        Installs the global pool with a response cache persisted under
+        ``{data_directory}/cache`` so provider responses survive restarts.
+
+        Returns
+        -------
+        ProviderHttpPool | None
+            Installed pool, or None if the cache cannot be opened (providers
+            then fall back to a pool with an in-memory cache).
+        """
+        cache_path = Path(self.config.data_directory) / "cache" / "metadata_http.sqlite"
+        try:
+            pool = configure_provider_http_pool(cache_path)
+        except (*INFRASTRUCTURE_EXCEPTIONS, sqlite3.Error) as exc:
+            logger.warning(
+                "Failed to open metadata provider HTTP cache: %s. Responses will not be cached across restarts.",
+                exc,
+            )
+            return None
+        else:
+            return pool
+
+    def create_book_search_indexes(self) -> BookSearchIndexRegistry:
+        """Enable full-text library search.
+
+        Index files live under ``{data_directory}/cache/search`` and are
+        created and built on first search of each library.
+
+        Returns
+        -------
+        BookSearchIndexRegistry
+            Installed registry of per-library search indexes.
+        """
+        return configure_book_search_indexes(
+            Path(self.config.data_directory) / "cache" / "search"
+        )
+
+    def create_library_change_monitor(self) -> LibraryChangeMonitor:
+        """Install the monitor of changes made to libraries by other programs.
+
+        Detected changes invalidate the affected books in the enrichment
+        read models and search indexes.
+
+        Returns
+        -------
+        LibraryChangeMonitor
+            Installed monitor (started with the background services).
+        """
+
+        def _list_libraries() -> list[Path]:
+            with get_session(self.engine) as session:
+                return [
+                    Path(library.calibre_db_path)
+                    / (library.calibre_db_file or "metadata.db")
+                    for library in LibraryRepository(session).list_all()
+                ]
+
+        monitor = configure_library_change_monitor(_list_libraries)
+        monitor.subscribe(notify_book_read_model)
+        monitor.subscribe(notify_book_search_index)
+        return monitor
+
+    def create_oidc_key_manager(self) -> OIDCKeyManager | None:
+        """Install the shared cache of OIDC signing keys and validated tokens.
+
+        Returns
+        -------
+        OIDCKeyManager | None
+            Installed manager (started with the background services), or
+            None if OIDC is disabled.
+        """
+        return configure_oidc_key_manager(self.config)
+
+    def create_principal_cache(self) -> PrincipalCache | None:
+        """Install the cache of authenticated users, grants and blacklist.
+
+        Returns
+        -------
+        PrincipalCache | None
+            Installed cache.
+        """
+        return configure_principal_cache()
+
+    def create_reading_progress_buffer(self) -> ReadingProgressBuffer | None:
+        """Install the write-behind buffer for reading progress.
+
+        Returns
+        -------
+        ReadingProgressBuffer | None
+            Installed buffer (started with the background services), or None
+            if ``reading_progress_flush_seconds`` disables buffering.
+        """
+        buffer = configure_reading_progress_buffer(
+            self.engine, self.config.reading_progress_flush_seconds
+        )
+        if buffer is None:
+            logger.info("Reading progress buffering disabled.")
+        return buffer
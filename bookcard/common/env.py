@@ -0,0 +1,41 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Environment variable helpers."""
+
+import os
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag from environment variables.
+
+    Parameters
+    ----------
+    name : str
+        Environment variable name.
+    default : bool
+        Default value if variable is not set.
+
+    Returns
+    -------
+    bool
+        True if the variable is set to 1, true, yes or on (any case).
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in _TRUE_VALUES
@@ -15,12 +15,25 @@
 
 """Filesystem utilities."""
 
+import errno
+import logging
+import os
 import re
+import shutil
+import tempfile
 from collections.abc import Generator
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
+from enum import StrEnum
 from pathlib import Path
 from typing import IO
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
 # Characters that are invalid in filenames on various filesystems
 INVALID_CHARS = re.compile(r'[\\:*?"<>|]')
 
@@ -73,3 +86,181 @@ def atomic_file_stream(dest_path: Path) -> Generator[IO[bytes], None, None]:
         if temp_path.exists():
             temp_path.unlink()
         raise
+
+
+class TransferMode(StrEnum):
+    """How `transfer_file` places a file at its destination.
+
+    Each mode falls back to the next cheaper safe option when the
+    filesystem does not support it.
+
+    Attributes
+    ----------
+    HARDLINK : str
+        Link the destination to the source's data (same filesystem only),
+        falling back to REFLINK. Both names share the data, so in-place
+        edits of one are visible through the other.
+    REFLINK : str
+        Clone the source's data copy-on-write (e.g., Btrfs, XFS), falling
+        back to COPY.
+    MOVE : str
+        Rename the source, or copy and delete it across filesystems.
+    COPY : str
+        Copy the data and metadata.
+    """
+
+    HARDLINK = "hardlink"
+    REFLINK = "reflink"
+    MOVE = "move"
+    COPY = "copy"
+
+
+# FICLONE ioctl request of Linux (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+# Errors meaning a transfer method is unsupported for the given files
+_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EACCES,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EMLINK,
+    errno.EBADF,
+    errno.ETXTBSY,
+})
+
+
+def same_filesystem(first: Path, second: Path) -> bool:
+    """Check whether two paths live on the same filesystem.
+
+    Parameters
+    ----------
+    first : Path
+        Existing path.
+    second : Path
+        Path whose nearest existing ancestor is compared.
+
+    Returns
+    -------
+    bool
+        True if both are on the same device.
+    """
+    existing = second
+    while not existing.exists() and existing != existing.parent:
+        existing = existing.parent
+    try:
+        return first.stat().st_dev == existing.stat().st_dev
+    except OSError:
+        return False
+
+
+def transfer_file(
+    source: Path, dest: Path, mode: TransferMode = TransferMode.COPY
+) -> TransferMode:
+    """Place a file at a destination, as cheaply as the mode allows.
+
+    An existing destination is replaced rather than written through, so a
+    file hardlinked elsewhere keeps its content.
+
+    Parameters
+    ----------
+    source : Path
+        Source file.
+    dest : Path
+        Destination file path; its parent directory must exist.
+    mode : TransferMode
+        Preferred mode (default COPY).
+
+    Returns
+    -------
+    TransferMode
+        Mode actually used.
+    """
+    if not dest.exists():
+        return _transfer_to_new_file(source, dest, mode)
+    # mkstemp reserves a name unique across threads and processes; free it
+    # so that the link or clone below can create it exclusively
+    fd, temp_name = tempfile.mkstemp(
+        dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    temp_dest = Path(temp_name)
+    try:
+        temp_dest.unlink()
+        used = _transfer_to_new_file(source, temp_dest, mode)
+        temp_dest.replace(dest)
+    except BaseException:
+        with suppress(OSError):
+            temp_dest.unlink()
+        raise
+    return used
+
+
+def _transfer_to_new_file(source: Path, dest: Path, mode: TransferMode) -> TransferMode:
+    """Transfer a file to a path that does not exist yet."""
+    if mode == TransferMode.MOVE:
+        shutil.move(source, dest)
+        return TransferMode.MOVE
+    if mode == TransferMode.HARDLINK and same_filesystem(source, dest.parent):
+        try:
+            os.link(source, dest)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            logger.debug("Cannot hardlink %s: %s", source, e)
+        else:
+            return TransferMode.HARDLINK
+    if mode in (TransferMode.HARDLINK, TransferMode.REFLINK):
+        cloned = _clone_file(source, dest)
+        if cloned is not None:
+            return cloned
+    shutil.copy2(source, dest)
+    return TransferMode.COPY
+
+
+def _clone_file(source: Path, dest: Path) -> TransferMode | None:
+    """Clone a file with FICLONE or copy_file_range, keeping its metadata.
+
+    Returns REFLINK if FICLONE shared the data, COPY if copy_file_range
+    wrote it (which may or may not share extents), or None, leaving no
+    destination file, if neither is supported.
+    """
+    if fcntl is None or not hasattr(os, "copy_file_range"):
+        return None
+    with source.open("rb") as src:
+        # A destination that already exists is not ours to remove
+        dst = dest.open("xb")
+        try:
+            with dst:
+                used = _clone_fd(src.fileno(), dst.fileno())
+            shutil.copystat(source, dest)
+        except OSError as e:
+            with suppress(OSError):
+                dest.unlink()
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            logger.debug("Cannot clone %s: %s", source, e)
+            return None
+    return used
+
+
+def _clone_fd(src_fd: int, dst_fd: int) -> TransferMode:
+    """Clone an open file's data into an empty one."""
+    try:
+        # Only reached through `_clone_file`, which checks fcntl is available
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)  # ty: ignore[unresolved-attribute]
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED_ERRNOS and e.errno != errno.ENOTTY:
+            raise
+    else:
+        return TransferMode.REFLINK
+    remaining = os.fstat(src_fd).st_size
+    while remaining > 0:
+        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+        if copied == 0:
+            break
+        remaining -= copied
+    return TransferMode.COPY
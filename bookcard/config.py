@@ -66,6 +66,11 @@ class AppConfig:
         When enabled, the API runs in **read-only demo mode** for non-admin users.
         Non-safe HTTP methods (POST/PUT/PATCH/DELETE) are blocked by middleware to
         prevent changes to server state and filesystem-backed operations.
+    reading_progress_flush_seconds : float
+        Seconds reading progress updates may stay buffered in memory before
+        they are written to the database. Trades durability for fewer write
+        transactions; ``0`` writes every update immediately. Can be
+        overridden with ``BOOKCARD_READING_PROGRESS_FLUSH_SECONDS``.
     """
 
     jwt_secret: str
@@ -85,6 +90,7 @@ class AppConfig:
     oidc_client_secret: str = ""
     oidc_scopes: str = "openid profile email"
     demo_mode: bool = False
+    reading_progress_flush_seconds: float = 5.0
 
     @staticmethod
     def _normalize_env_value(value: str | None) -> str | None:
@@ -291,4 +297,9 @@ class AppConfig:
             oidc_client_secret=oidc_client_secret,
             oidc_scopes=oidc_scopes,
             demo_mode=demo_mode,
+            reading_progress_flush_seconds=float(
+                AppConfig._normalize_env_value_with_default(
+                    os.getenv("BOOKCARD_READING_PROGRESS_FLUSH_SECONDS"), "5"
+                )
+            ),
         )
@@ -0,0 +1,63 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Add EPUB file fingerprints.
+
+Revision ID: b92e4c7a1f36
+Revises: f5c81d2e9a43
+Create Date: 2026-02-26 14:08:52.118430
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b92e4c7a1f36"
+down_revision: str | Sequence[str] | None = "f5c81d2e9a43"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "epub_file_fingerprints",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("file_path", sqlmodel.AutoString(length=2000), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("mtime_ns", sa.BigInteger(), nullable=False),
+        sa.Column("fixer_hash", sqlmodel.AutoString(length=64), nullable=False),
+        sa.Column("checked_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_epub_file_fingerprints_file_path"),
+        "epub_file_fingerprints",
+        ["file_path"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_epub_file_fingerprints_file_path"),
+        table_name="epub_file_fingerprints",
+    )
+    op.drop_table("epub_file_fingerprints")
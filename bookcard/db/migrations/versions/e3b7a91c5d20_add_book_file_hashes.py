@@ -0,0 +1,134 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Add book file hash index.
+
+Revision ID: e3b7a91c5d20
+Revises: d9a2c3f4b517
+Create Date: 2026-02-20 10:12:44.118203
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b7a91c5d20"
+down_revision: str | Sequence[str] | None = "d9a2c3f4b517"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TASK_TYPES = (
+    "BOOK_UPLOAD",
+    "MULTI_BOOK_UPLOAD",
+    "BOOK_CONVERT",
+    "BOOK_STRIP_DRM",
+    "EMAIL_SEND",
+    "METADATA_BACKUP",
+    "THUMBNAIL_GENERATE",
+    "LIBRARY_SCAN",
+    "AUTHOR_METADATA_FETCH",
+    "OPENLIBRARY_DUMP_DOWNLOAD",
+    "OPENLIBRARY_DUMP_INGEST",
+    "EPUB_FIX_SINGLE",
+    "EPUB_FIX_BATCH",
+    "EPUB_FIX_DAILY_SCAN",
+    "INGEST_DISCOVERY",
+    "INGEST_BOOK",
+    "PVR_DOWNLOAD_MONITOR",
+    "PROWLARR_SYNC",
+    "INDEXER_HEALTH_CHECK",
+)
+
+_TASK_TYPE_TABLES = ("task_statistics", "tasks", "scheduled_job_definitions")
+
+
+def _alter_task_type(task_type_enum: sa.Enum) -> None:
+    """Change the task_type column type on every table that has one."""
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        for table in _TASK_TYPE_TABLES:
+            op.alter_column(
+                table,
+                "task_type",
+                existing_type=sa.VARCHAR(length=50),
+                type_=task_type_enum,
+                existing_nullable=False,
+            )
+        return
+
+    # SQLite: Use batch operations to recreate table with new column type
+    for table in _TASK_TYPE_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                "task_type",
+                existing_type=sa.VARCHAR(length=50),
+                type_=task_type_enum,
+                existing_nullable=False,
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _alter_task_type(
+        sa.Enum(
+            *_TASK_TYPES,
+            "BOOK_FILE_HASH_BACKFILL",
+            name="tasktype",
+            native_enum=False,
+        )
+    )
+
+    op.create_table(
+        "book_file_hashes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("library_id", sa.Integer(), nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("format", sqlmodel.AutoString(length=20), nullable=False),
+        sa.Column("file_size", sa.BigInteger(), nullable=False),
+        sa.Column("file_mtime", sa.Float(), nullable=False),
+        sa.Column("partial_hash", sqlmodel.AutoString(length=64), nullable=False),
+        sa.Column("sha256", sqlmodel.AutoString(length=64), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["library_id"], ["libraries.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "library_id", "book_id", "format", name="uq_book_file_hash_format"
+        ),
+    )
+    op.create_index(
+        "idx_book_file_hashes_size",
+        "book_file_hashes",
+        ["library_id", "format", "file_size"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_book_file_hashes_sha256",
+        "book_file_hashes",
+        ["library_id", "sha256"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_book_file_hashes_sha256", table_name="book_file_hashes")
+    op.drop_index("idx_book_file_hashes_size", table_name="book_file_hashes")
+    op.drop_table("book_file_hashes")
+
+    _alter_task_type(sa.Enum(*_TASK_TYPES, name="tasktype", native_enum=False))
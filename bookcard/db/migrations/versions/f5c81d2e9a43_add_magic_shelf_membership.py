@@ -0,0 +1,166 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Add materialized magic shelf membership.
+
+Revision ID: f5c81d2e9a43
+Revises: e3b7a91c5d20
+Create Date: 2026-02-24 09:31:07.402519
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.sql import column, table
+
+# revision identifiers, used by Alembic.
+revision: str = "f5c81d2e9a43"
+down_revision: str | Sequence[str] | None = "e3b7a91c5d20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TASK_TYPES = (
+    "BOOK_UPLOAD",
+    "MULTI_BOOK_UPLOAD",
+    "BOOK_CONVERT",
+    "BOOK_STRIP_DRM",
+    "EMAIL_SEND",
+    "METADATA_BACKUP",
+    "THUMBNAIL_GENERATE",
+    "LIBRARY_SCAN",
+    "AUTHOR_METADATA_FETCH",
+    "OPENLIBRARY_DUMP_DOWNLOAD",
+    "OPENLIBRARY_DUMP_INGEST",
+    "EPUB_FIX_SINGLE",
+    "EPUB_FIX_BATCH",
+    "EPUB_FIX_DAILY_SCAN",
+    "INGEST_DISCOVERY",
+    "INGEST_BOOK",
+    "PVR_DOWNLOAD_MONITOR",
+    "PROWLARR_SYNC",
+    "INDEXER_HEALTH_CHECK",
+    "BOOK_FILE_HASH_BACKFILL",
+)
+
+_TASK_TYPE_TABLES = ("task_statistics", "tasks", "scheduled_job_definitions")
+
+_JOB_NAME = "magic_shelf_refresh"
+
+
+def _alter_task_type(task_type_enum: sa.Enum) -> None:
+    """Change the task_type column type on every table that has one."""
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        for table_name in _TASK_TYPE_TABLES:
+            op.alter_column(
+                table_name,
+                "task_type",
+                existing_type=sa.VARCHAR(length=50),
+                type_=task_type_enum,
+                existing_nullable=False,
+            )
+        return
+
+    # SQLite: Use batch operations to recreate table with new column type
+    for table_name in _TASK_TYPE_TABLES:
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.alter_column(
+                "task_type",
+                existing_type=sa.VARCHAR(length=50),
+                type_=task_type_enum,
+                existing_nullable=False,
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _alter_task_type(
+        sa.Enum(
+            *_TASK_TYPES,
+            "MAGIC_SHELF_REFRESH",
+            name="tasktype",
+            native_enum=False,
+        )
+    )
+
+    op.create_table(
+        "magic_shelf_books",
+        sa.Column("shelf_id", sa.Integer(), nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["shelf_id"], ["shelves.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("shelf_id", "book_id"),
+    )
+    op.create_table(
+        "magic_shelf_states",
+        sa.Column("shelf_id", sa.Integer(), nullable=False),
+        sa.Column("rule_hash", sqlmodel.AutoString(length=64), nullable=False),
+        sa.Column("watermark_modified", sqlmodel.AutoString(length=64), nullable=True),
+        sa.Column("watermark_book_id", sa.Integer(), nullable=True),
+        sa.Column("book_count", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["shelf_id"], ["shelves.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("shelf_id"),
+    )
+
+    connection = op.get_bind()
+    result = connection.execute(
+        text("SELECT 1 FROM scheduled_job_definitions WHERE job_name = :job_name"),
+        {"job_name": _JOB_NAME},
+    )
+    if result.first() is None:
+        jobs_table = table(
+            "scheduled_job_definitions",
+            column("job_name", sa.String),
+            column("task_type", sa.String),
+            column("cron_expression", sa.String),
+            column("enabled", sa.Boolean),
+            column("description", sa.String),
+            column("arguments", sa.JSON),
+            column("created_at", sa.DateTime),
+            column("updated_at", sa.DateTime),
+        )
+        op.execute(
+            jobs_table.insert().values(
+                job_name=_JOB_NAME,
+                task_type="MAGIC_SHELF_REFRESH",
+                cron_expression="*/15 * * * *",
+                enabled=True,
+                description="Refresh materialized Magic Shelf membership",
+                arguments={},
+                created_at=sa.func.now(),
+                updated_at=sa.func.now(),
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        text(
+            "DELETE FROM scheduled_job_definitions WHERE job_name = :job_name"
+        ).bindparams(job_name=_JOB_NAME)
+    )
+    op.execute(text("DELETE FROM tasks WHERE task_type = 'MAGIC_SHELF_REFRESH'"))
+    op.execute(
+        text("DELETE FROM task_statistics WHERE task_type = 'MAGIC_SHELF_REFRESH'")
+    )
+    op.drop_table("magic_shelf_states")
+    op.drop_table("magic_shelf_books")
+
+    _alter_task_type(sa.Enum(*_TASK_TYPES, name="tasktype", native_enum=False))
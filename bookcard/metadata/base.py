@@ -18,10 +18,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
+
+from bookcard.metadata.http import get_provider_http_pool
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+
+    import httpx
 
     from bookcard.models.metadata import MetadataRecord, MetadataSourceInfo
 
@@ -38,12 +42,22 @@ class MetadataProvider(ABC):
     - `search()`: Search for books by query string
     - Optionally override `is_enabled()` for conditional activation
 
+    Providers making HTTP requests should use `get_http_client()` rather
+    than creating their own ``httpx`` clients.
+
     Attributes
     ----------
     enabled : bool
         Whether this provider is currently enabled.
+    RATE_LIMIT_PER_SECOND : float
+        Average network requests per second allowed by `get_http_client()`.
+    CACHE_TTL_SECONDS : float
+        Seconds successful responses are cached by `get_http_client()`.
     """
 
+    RATE_LIMIT_PER_SECOND: ClassVar[float] = 5.0
+    CACHE_TTL_SECONDS: ClassVar[float] = 6 * 60 * 60
+
     def __init__(self, enabled: bool = True) -> None:
         """Initialize the metadata provider.
 
@@ -94,6 +108,32 @@ class MetadataProvider(ABC):
             If the search fails due to network, parsing, or other errors.
         """
 
+    def get_http_client(self, headers: Mapping[str, str] | None = None) -> httpx.Client:
+        """Get this provider's shared, pooled HTTP client.
+
+        The client reuses connections across searches, is rate limited to
+        `RATE_LIMIT_PER_SECOND` and serves repeated ``GET`` requests from the
+        shared response cache. It is owned by the pool and must not be
+        closed.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str] | None
+            Default request headers, applied when the client is first
+            created.
+
+        Returns
+        -------
+        httpx.Client
+            Shared client following redirects.
+        """
+        return get_provider_http_pool().client(
+            self.get_source_info().id,
+            headers=headers,
+            rate_per_second=self.RATE_LIMIT_PER_SECOND,
+            cache_ttl=self.CACHE_TTL_SECONDS,
+        )
+
     def is_enabled(self) -> bool:
         """Check if this provider is enabled.
 
@@ -0,0 +1,40 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Shared HTTP layer for metadata providers (pooling, rate limits, caching)."""
+
+from bookcard.metadata.http.pool import (
+    ProviderHttpPool,
+    configure_provider_http_pool,
+    get_provider_http_pool,
+)
+from bookcard.metadata.http.rate_limiter import RateLimiter
+from bookcard.metadata.http.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+)
+from bookcard.metadata.http.transport import ProviderTransport
+
+__all__ = [
+    "CachedResponse",
+    "ProviderHttpPool",
+    "ProviderTransport",
+    "RateLimiter",
+    "ResponseCache",
+    "cache_key",
+    "configure_provider_http_pool",
+    "get_provider_http_pool",
+]
@@ -0,0 +1,193 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Shared, pooled HTTP clients for metadata providers.
+
+Providers used to open a new ``httpx.Client`` per search, paying TCP and TLS
+setup on every request and sharing nothing between the concurrent searches
+of `MetadataService` or between ingest tasks. `ProviderHttpPool` keeps one
+long-lived client per provider. All clients share a single connection pool,
+which keeps connections to each host alive and negotiates HTTP/2 when the
+optional ``h2`` package is installed. Each provider has its own rate limiter
+and all of them share a persistent response cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+from bookcard.metadata.http.rate_limiter import RateLimiter
+from bookcard.metadata.http.response_cache import ResponseCache
+from bookcard.metadata.http.transport import ProviderTransport
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_PER_SECOND = 5.0
+DEFAULT_CACHE_TTL = 6 * 60 * 60
+DEFAULT_TIMEOUT = 30.0
+
+_POOL_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=16, keepalive_expiry=60.0
+)
+
+
+class ProviderHttpPool:
+    """Per-provider HTTP clients over one shared connection pool.
+
+    Parameters
+    ----------
+    cache : ResponseCache | None
+        Response cache shared by all providers. If None, an in-memory cache
+        is used.
+    transport : httpx.BaseTransport | None
+        Network transport shared by all clients. If None, a pooled
+        ``httpx.HTTPTransport`` is created (HTTP/2 when available).
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self._cache = cache if cache is not None else ResponseCache(":memory:")
+        self._transport = transport or httpx.HTTPTransport(
+            http2=HTTP2_AVAILABLE, limits=_POOL_LIMITS
+        )
+        self._clients: dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Response cache shared by all providers."""
+        return self._cache
+
+    def client(
+        self,
+        provider_id: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> httpx.Client:
+        """Get the shared client of a provider, creating it on first use.
+
+        The client is thread-safe and owned by the pool: callers must not
+        close it or use it as a context manager. Options only apply when
+        the client is created; pass a per-request ``timeout`` to override
+        the default.
+
+        Parameters
+        ----------
+        provider_id : str
+            Provider source ID.
+        headers : Mapping[str, str] | None
+            Default request headers (e.g. ``User-Agent``).
+        rate_per_second : float
+            Average network requests per second allowed for the provider.
+        cache_ttl : float
+            Seconds successful responses are cached; 0 disables caching.
+        timeout : float
+            Default request timeout in seconds.
+
+        Returns
+        -------
+        httpx.Client
+            Long-lived client of the provider.
+        """
+        with self._lock:
+            client = self._clients.get(provider_id)
+            if client is None:
+                client = httpx.Client(
+                    headers=dict(headers or {}),
+                    timeout=timeout,
+                    follow_redirects=True,
+                    transport=ProviderTransport(
+                        self._transport,
+                        rate_limiter=RateLimiter(rate_per_second),
+                        cache=self._cache,
+                        cache_ttl=cache_ttl,
+                    ),
+                )
+                self._clients[provider_id] = client
+        return client
+
+    def close(self) -> None:
+        """Close every client, the shared connection pool and the cache."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+            self._transport.close()
+            self._cache.close()
+
+
+_pool: ProviderHttpPool | None = None
+_pool_lock = threading.Lock()
+
+
+def configure_provider_http_pool(cache_path: Path | str) -> ProviderHttpPool:
+    """Install the global pool with a persistent response cache.
+
+    Replaces (and closes) any previously configured pool.
+
+    Parameters
+    ----------
+    cache_path : Path | str
+        SQLite file holding cached provider responses.
+
+    Returns
+    -------
+    ProviderHttpPool
+        Newly installed pool.
+    """
+    global _pool
+    pool = ProviderHttpPool(cache=ResponseCache(Path(cache_path)))
+    with _pool_lock:
+        previous, _pool = _pool, pool
+    if previous is not None:
+        previous.close()
+    return pool
+
+
+def get_provider_http_pool() -> ProviderHttpPool:
+    """Get the global provider HTTP pool.
+
+    Returns
+    -------
+    ProviderHttpPool
+        Pool configured by `configure_provider_http_pool`, or a pool with
+        an in-memory cache if none was configured.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProviderHttpPool()
+        return _pool
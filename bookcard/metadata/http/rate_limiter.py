@@ -0,0 +1,86 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Token-bucket rate limiting for metadata provider requests."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Allows bursts of up to ``burst`` requests and ``rate_per_second``
+    requests per second on average. Callers block in `acquire` until a
+    token is available.
+
+    Parameters
+    ----------
+    rate_per_second : float
+        Average number of requests allowed per second.
+    burst : int | None
+        Bucket capacity. Defaults to ``ceil(rate_per_second)``.
+    clock : Callable[[], float]
+        Monotonic clock, injectable for tests.
+    sleep : Callable[[float], None]
+        Sleep function, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_second <= 0:
+            msg = "rate_per_second must be positive"
+            raise ValueError(msg)
+        self._rate = rate_per_second
+        self._capacity = float(burst or max(1, math.ceil(rate_per_second)))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting for it if necessary.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            # Reserve the token now so concurrent callers queue behind us
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
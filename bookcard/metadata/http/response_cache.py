@@ -0,0 +1,254 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Persistent cache of metadata provider HTTP responses.
+
+Ingest, metadata enforcement and interactive searches repeatedly look up
+the same ISBNs and titles. Successful ``GET`` responses are stored in a small
+SQLite database keyed by the normalized request, expire after a TTL, and are
+evicted least recently used first once the cache exceeds its size limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Request headers that change what a server returns for the same URL
+_VARY_HEADERS: tuple[str, ...] = ("accept", "accept-language")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A stored response.
+
+    Attributes
+    ----------
+    status_code : int
+        HTTP status code.
+    headers : list[tuple[str, str]]
+        Response headers (without transfer encodings).
+    content : bytes
+        Decoded response body.
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+
+def cache_key(request: httpx.Request) -> str:
+    """Build the cache key of a request.
+
+    The URL is normalized (lower-case scheme and host, sorted query
+    parameters) and combined with the headers that select a representation.
+
+    Parameters
+    ----------
+    request : httpx.Request
+        Outgoing request.
+
+    Returns
+    -------
+    str
+        Hex digest identifying the request.
+    """
+    url = request.url
+    query = urlencode(
+        sorted(parse_qsl(url.query.decode("ascii"), keep_blank_values=True))
+    )
+    parts = [
+        request.method.upper(),
+        url.scheme.lower(),
+        url.host.lower(),
+        str(url.port or ""),
+        url.path,
+        query,
+    ]
+    parts.extend(request.headers.get(name, "") for name in _VARY_HEADERS)
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed, TTL and size-bounded response cache.
+
+    Parameters
+    ----------
+    path : Path | str
+        Database file, or ``":memory:"`` for a process-local cache.
+    max_bytes : int
+        Upper bound on the total size of stored bodies.
+    """
+
+    def __init__(self, path: Path | str, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get a fresh response.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from `cache_key`.
+
+        Returns
+        -------
+        CachedResponse | None
+            Stored response, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT status_code, headers, content, expires_at "
+                    "FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                status_code, headers, content, expires_at = row
+                if expires_at <= now:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Provider response cache read failed: %s", e)
+                return None
+        return CachedResponse(
+            status_code=status_code,
+            headers=[(name, value) for name, value in json.loads(headers)],
+            content=content,
+        )
+
+    def put(self, key: str, response: CachedResponse, ttl: float) -> None:
+        """Store a response and evict old entries if over the size limit.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from `cache_key`.
+        response : CachedResponse
+            Response to store.
+        ttl : float
+            Seconds until the entry expires.
+        """
+        size = len(response.content)
+        if ttl <= 0 or size > self._max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, status_code, headers, content, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        response.status_code,
+                        json.dumps(response.headers),
+                        response.content,
+                        size,
+                        now + ttl,
+                        now,
+                    ),
+                )
+                self._evict(now)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Provider response cache write failed: %s", e)
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def total_bytes(self) -> int:
+        """Get the total size of stored bodies.
+
+        Returns
+        -------
+        int
+            Size in bytes.
+        """
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return int(total)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired, then least recently used entries (lock held)."""
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        excess = total - self._max_bytes
+        if excess <= 0:
+            return
+        victims: list[str] = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            victims.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany(
+            "DELETE FROM responses WHERE key = ?", [(key,) for key in victims]
+        )
@@ -0,0 +1,141 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""httpx transport adding response caching and rate limiting."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import httpx
+
+from bookcard.metadata.http.response_cache import CachedResponse, cache_key
+
+if TYPE_CHECKING:
+    from bookcard.metadata.http.rate_limiter import RateLimiter
+    from bookcard.metadata.http.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Headers describing the wire encoding of the body; cached bodies are stored
+# decoded, so these must not be replayed.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class ProviderTransport(httpx.BaseTransport):
+    """Transport serving cached responses and rate limiting the rest.
+
+    Wraps a shared connection-pooling transport. Only ``GET`` requests
+    answered with ``200 OK`` are cached, unless the server sends
+    ``Cache-Control: no-store``. Cache hits are not rate limited.
+
+    Parameters
+    ----------
+    inner : httpx.BaseTransport
+        Transport performing the network requests; not closed by this one.
+    rate_limiter : RateLimiter | None
+        Limiter applied to network requests.
+    cache : ResponseCache | None
+        Response cache. If None, nothing is cached.
+    cache_ttl : float
+        Seconds cached responses stay fresh.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.BaseTransport,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        cache_ttl: float = 0.0,
+    ) -> None:
+        self._inner = inner
+        self._rate_limiter = rate_limiter
+        self._cache = cache if cache_ttl > 0 else None
+        self._cache_ttl = cache_ttl
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from the cache or the network.
+
+        Parameters
+        ----------
+        request : httpx.Request
+            Outgoing request.
+
+        Returns
+        -------
+        httpx.Response
+            Cached or fresh response.
+        """
+        cache = self._cache if request.method == "GET" else None
+        key = cache_key(request) if cache is not None else None
+        if cache is not None and key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return httpx.Response(
+                    cached.status_code,
+                    headers=cached.headers,
+                    content=cached.content,
+                    request=request,
+                    extensions={"from_cache": True},
+                )
+
+        if self._rate_limiter is not None:
+            waited = self._rate_limiter.acquire()
+            if waited > 0:
+                logger.debug("Rate limited %s for %.2fs", request.url.host, waited)
+
+        response = self._inner.handle_request(request)
+        if cache is None or key is None or not _is_cacheable(response):
+            return response
+
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _WIRE_HEADERS
+        ]
+        cache.put(
+            key,
+            CachedResponse(
+                status_code=response.status_code, headers=headers, content=content
+            ),
+            self._cache_ttl,
+        )
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions={
+                name: response.extensions[name]
+                for name in ("http_version", "reason_phrase")
+                if name in response.extensions
+            },
+        )
+
+    def close(self) -> None:
+        """Leave the shared inner transport open."""
+
+
+def _is_cacheable(response: httpx.Response) -> bool:
+    if response.status_code != httpx.codes.OK:
+        return False
+    cache_control = response.headers.get("cache-control", "").lower()
+    return "no-store" not in cache_control
@@ -171,28 +171,28 @@ class AmazonProvider(MetadataProvider):
             }
 
             # Fetch search results page and detail pages using same client
-            with httpx.Client(
-                headers=self.HEADERS, timeout=self.timeout, follow_redirects=True
-            ) as client:
-                response = client.get(self.SEARCH_URL, params=search_params)
-                response.raise_for_status()
+            client = self.get_http_client(self.HEADERS)
+            response = client.get(
+                self.SEARCH_URL, params=search_params, timeout=self.timeout
+            )
+            response.raise_for_status()
 
-                # Parse search results
-                soup = BeautifulSoup(response.text, "html.parser")
-                links_list = self._extract_search_result_links(soup)
+            # Parse search results
+            soup = BeautifulSoup(response.text, "html.parser")
+            links_list = self._extract_search_result_links(soup)
 
-                if not links_list:
-                    return []
+            if not links_list:
+                return []
 
-                # Limit to max_results
-                links_list = links_list[:max_results]
+            # Limit to max_results
+            links_list = links_list[:max_results]
 
-                # Fetch detail pages concurrently
-                records = self._fetch_book_details(links_list, client)
+            # Fetch detail pages concurrently
+            records = self._fetch_book_details(links_list, client)
 
-                # Sort by original order for relevance
-                records.sort(key=lambda x: x[1])
-                result = [record[0] for record in records]
+            # Sort by original order for relevance
+            records.sort(key=lambda x: x[1])
+            result = [record[0] for record in records]
         except httpx.TimeoutException as e:
             msg = f"Amazon search request timed out: {e}"
             raise MetadataProviderTimeoutError(msg) from e
@@ -310,7 +310,7 @@ class AmazonProvider(MetadataProvider):
         """
         try:
             url = f"{self.BASE_URL}{link}"
-            response = client.get(url, headers=self.HEADERS)
+            response = client.get(url, timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, "html.parser")
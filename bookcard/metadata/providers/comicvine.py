@@ -159,27 +159,17 @@ class ComicVineProvider(MetadataProvider):
             }
 
             # Make API request
-            with httpx.Client(
-                headers=self.HEADERS, timeout=self.timeout, follow_redirects=True
-            ) as client:
-                response = client.get(self.SEARCH_ENDPOINT, params=params)
-                response.raise_for_status()
-
-                # Parse response
-                data = response.json()
-                results = data.get("results", [])
-
-                records = []
-                for result in results[:max_results]:
-                    try:
-                        record = self._parse_search_result(result)
-                        if record:
-                            records.append(record)
-                    except (KeyError, ValueError, TypeError, AttributeError) as e:
-                        logger.warning("Failed to parse ComicVine result: %s", e)
-                        continue
-
-                return records
+            client = self.get_http_client(self.HEADERS)
+            response = client.get(
+                self.SEARCH_ENDPOINT, params=params, timeout=self.timeout
+            )
+            response.raise_for_status()
+
+            # Parse response
+            data = response.json()
+            results = data.get("results", [])
+
+            records = self._parse_search_results(results[:max_results])
 
         except httpx.TimeoutException as e:
             msg = f"ComicVine API request timed out: {e}"
@@ -190,6 +180,32 @@ class ComicVineProvider(MetadataProvider):
         except (KeyError, ValueError, TypeError) as e:
             msg = f"Failed to parse ComicVine API response: {e}"
             raise MetadataProviderParseError(msg) from e
+        else:
+            return records
+
+    def _parse_search_results(self, results: list[dict]) -> list[MetadataRecord]:
+        """Parse API results, skipping those that cannot be parsed.
+
+        Parameters
+        ----------
+        results : list[dict]
+            Result objects from the API response.
+
+        Returns
+        -------
+        list[MetadataRecord]
+            Parsed metadata records.
+        """
+        records = []
+        for result in results:
+            try:
+                record = self._parse_search_result(result)
+                if record:
+                    records.append(record)
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                logger.warning("Failed to parse ComicVine result: %s", e)
+                continue
+        return records
 
     def _get_title_tokens(self, title: str, strip_joiners: bool = True) -> list[str]:
         """Extract tokens from title for better search matching.
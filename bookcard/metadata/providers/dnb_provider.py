@@ -265,10 +265,9 @@ class DNBProvider(MetadataProvider):
         logger.debug("DNB Query URL: %s", query_url)
 
         try:
-            response = httpx.get(
+            response = self.get_http_client(self.HEADERS).get(
                 self.SRU_ENDPOINT,
                 params=params,
-                headers=self.HEADERS,
                 timeout=self.timeout,
             )
             response.raise_for_status()
@@ -236,10 +236,8 @@ class DoubanProvider(MetadataProvider):
             book_ids = book_ids[:max_results]
 
             # Fetch detail pages concurrently
-            with httpx.Client(
-                headers=self.HEADERS, timeout=self.timeout, follow_redirects=True
-            ) as client:
-                records = self._fetch_book_details(book_ids, client)
+            client = self.get_http_client(self.HEADERS)
+            records = self._fetch_book_details(book_ids, client)
 
         except httpx.TimeoutException as e:
             msg = f"Douban search request timed out: {e}"
@@ -292,22 +290,22 @@ class DoubanProvider(MetadataProvider):
             List of book IDs.
         """
         try:
-            with httpx.Client(
-                headers=self.HEADERS, timeout=self.timeout, follow_redirects=True
-            ) as client:
-                response = client.get(self.SEARCH_URL, params={"cat": 1001, "q": query})
-                response.raise_for_status()
-
-                html = etree.HTML(response.content.decode("utf8"))
-                result_list = html.xpath(self.COVER_XPATH)
+            client = self.get_http_client(self.HEADERS)
+            response = client.get(
+                self.SEARCH_URL,
+                params={"cat": 1001, "q": query},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
 
-                book_ids = []
-                for item in result_list[:10]:
-                    onclick = item.get("onclick", "")
-                    if match := self.ID_PATTERN.search(onclick):
-                        book_ids.append(match.group("id"))
+            html = etree.HTML(response.content.decode("utf8"))
+            result_list = html.xpath(self.COVER_XPATH)
 
-                return book_ids
+            book_ids = []
+            for item in result_list[:10]:
+                onclick = item.get("onclick", "")
+                if match := self.ID_PATTERN.search(onclick):
+                    book_ids.append(match.group("id"))
 
         except (
             httpx.HTTPStatusError,
@@ -321,6 +319,8 @@ class DoubanProvider(MetadataProvider):
         ) as e:
             logger.warning("Failed to get book IDs from Douban search: %s", e)
             return []
+        else:
+            return book_ids
 
     def _fetch_book_details(
         self, book_ids: list[str], client: httpx.Client
@@ -393,7 +393,7 @@ class DoubanProvider(MetadataProvider):
         logger.debug("Parsing Douban book: %s", url)
 
         try:
-            response = client.get(url, headers=self.HEADERS)
+            response = client.get(url, timeout=self.timeout)
             response.raise_for_status()
 
             decode_content = response.content.decode("utf8")
@@ -174,7 +174,7 @@ class GoogleBooksProvider(MetadataProvider):
         }
 
         # Make API request
-        response = httpx.get(
+        response = self.get_http_client().get(
             self.SEARCH_ENDPOINT,
             params=params,
             timeout=self.timeout,
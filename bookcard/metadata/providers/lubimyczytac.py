@@ -278,24 +278,22 @@ class LubimyCzytacProvider(MetadataProvider):
                 return []
 
             # Fetch search results page
-            with httpx.Client(
-                headers=self.HEADERS, timeout=self.timeout, follow_redirects=True
-            ) as client:
-                response = client.get(search_url)
-                response.raise_for_status()
+            client = self.get_http_client(self.HEADERS)
+            response = client.get(search_url, timeout=self.timeout)
+            response.raise_for_status()
 
-                # Parse search results
-                root = fromstring(response.text)
-                search_results = self._parse_search_results(root)
+            # Parse search results
+            root = fromstring(response.text)
+            search_results = self._parse_search_results(root)
 
-                if not search_results:
-                    return []
+            if not search_results:
+                return []
 
-                # Limit to max_results
-                search_results = search_results[:max_results]
+            # Limit to max_results
+            search_results = search_results[:max_results]
 
-                # Fetch detail pages concurrently
-                records = self._fetch_book_details(search_results, client, locale)
+            # Fetch detail pages concurrently
+            records = self._fetch_book_details(search_results, client, locale)
 
         except httpx.TimeoutException as e:
             msg = f"LubimyCzytac search request timed out: {e}"
@@ -482,7 +480,7 @@ class LubimyCzytacProvider(MetadataProvider):
             Parsed metadata record, or None if parsing fails.
         """
         try:
-            response = client.get(search_result["url"], headers=self.HEADERS)
+            response = client.get(search_result["url"], timeout=self.timeout)
             response.raise_for_status()
 
             root = fromstring(response.text)
@@ -133,7 +133,7 @@ class OpenLibraryProvider(MetadataProvider):
             }
 
             # Make API request
-            response = httpx.get(
+            response = self.get_http_client().get(
                 self.SEARCH_ENDPOINT,
                 params=params,
                 timeout=self.timeout,
@@ -75,10 +75,12 @@ from bookcard.models.core import (
     Tag,
 )
 from bookcard.models.epub_fixer import (
+    EPUBFileFingerprint,
     EPUBFix,
     EPUBFixRun,
     EPUBFixType,
 )
+from bookcard.models.file_hash import BookFileHash
 from bookcard.models.ingest import (
     IngestAudit,
     IngestConfig,
@@ -136,6 +138,8 @@ from bookcard.models.reading import (
 )
 from bookcard.models.shelves import (
     BookShelfLink,
+    MagicShelfBook,
+    MagicShelfState,
     Shelf,
     ShelfArchive,
 )
@@ -171,6 +175,7 @@ __all__ = [
     "Book",
     "BookAuthorLink",
     "BookConversion",
+    "BookFileHash",
     "BookLanguageLink",
     "BookPluginData",
     "BookPublisherLink",
@@ -194,6 +199,7 @@ __all__ = [
     "DownloadItemStatus",
     "DownloadRejectionReason",
     "EBookFormat",
+    "EPUBFileFingerprint",
     "EPUBFix",
     "EPUBFixRun",
     "EPUBFixType",
@@ -228,6 +234,8 @@ __all__ = [
     "LibraryId",
     "LibraryScanState",
     "LogLevel",
+    "MagicShelfBook",
+    "MagicShelfState",
     "MetadataDirtied",
     "MetadataEnforcementOperation",
     "OpenLibraryAuthor",
@@ -18,7 +18,7 @@
 from datetime import UTC, datetime
 from enum import StrEnum
 
-from sqlalchemy import Column, ForeignKey, Index, Integer, Text
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, Text
 from sqlalchemy import Enum as SQLEnum
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -257,3 +257,59 @@ class EPUBFix(SQLModel, table=True):
         Index("idx_epub_fixes_type_applied", "fix_type", "applied_at"),
         Index("idx_epub_fixes_file_path", "file_path"),
     )
+
+
+class EPUBFileFingerprint(SQLModel, table=True):
+    """Fingerprint of an EPUB file the fixer has already checked.
+
+    The daily scan skips files whose size, modification time and fixer
+    hash all match the recorded fingerprint, since running the same
+    fixes over an unchanged file cannot find anything new.
+
+    Attributes
+    ----------
+    id : int | None
+        Primary key identifier.
+    file_path : str
+        Path to the EPUB file (unique).
+    size : int
+        File size in bytes when last checked.
+    mtime_ns : int
+        File modification time in nanoseconds when last checked.
+    fixer_hash : str
+        Hash of the fixer version and settings the file was checked with.
+    checked_at : datetime
+        When the file was last checked.
+    """
+
+    __tablename__ = "epub_file_fingerprints"
+
+    id: int | None = Field(default=None, primary_key=True)
+    file_path: str = Field(max_length=2000, unique=True, index=True)
+    size: int = Field(sa_column=Column(BigInteger, nullable=False))
+    mtime_ns: int = Field(sa_column=Column(BigInteger, nullable=False))
+    fixer_hash: str = Field(max_length=64)
+    checked_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    def matches(self, size: int, mtime_ns: int, fixer_hash: str) -> bool:
+        """Check whether the fingerprint still describes a file.
+
+        Parameters
+        ----------
+        size : int
+            Current file size in bytes.
+        mtime_ns : int
+            Current file modification time in nanoseconds.
+        fixer_hash : str
+            Hash of the current fixer version and settings.
+
+        Returns
+        -------
+        bool
+            True if the file is unchanged since it was last checked.
+        """
+        return (
+            self.size == size
+            and self.mtime_ns == mtime_ns
+            and self.fixer_hash == fixer_hash
+        )
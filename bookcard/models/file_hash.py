@@ -0,0 +1,77 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Book file content-hash index model."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class BookFileHash(SQLModel, table=True):
+    """Content hash of a single book format file.
+
+    Used by full-file-hash duplicate detection so that checking a new file
+    is an indexed lookup instead of re-hashing the whole library. A row is
+    considered current while the file's size and mtime are unchanged.
+
+    Attributes
+    ----------
+    id : int | None
+        Primary key identifier.
+    library_id : int
+        Foreign key to library.
+    book_id : int
+        Calibre book ID (no FK constraint - books are in Calibre DB).
+    format : str
+        Upper-case format name (e.g. 'EPUB').
+    file_size : int
+        File size in bytes when hashed.
+    file_mtime : float
+        File modification time (seconds since epoch) when hashed.
+    partial_hash : str
+        SHA-256 of the first block of the file, used as a cheap prefilter.
+    sha256 : str
+        SHA-256 of the entire file.
+    updated_at : datetime
+        When the hashes were last computed.
+    """
+
+    __tablename__ = "book_file_hashes"
+
+    id: int | None = Field(default=None, primary_key=True)
+    library_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("libraries.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+    )
+    book_id: int
+    format: str = Field(max_length=20)
+    file_size: int = Field(sa_column=Column(BigInteger, nullable=False))
+    file_mtime: float
+    partial_hash: str = Field(max_length=64)
+    sha256: str = Field(max_length=64)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    __table_args__ = (
+        UniqueConstraint(
+            "library_id", "book_id", "format", name="uq_book_file_hash_format"
+        ),
+        Index("idx_book_file_hashes_size", "library_id", "format", "file_size"),
+        Index("idx_book_file_hashes_sha256", "library_id", "sha256"),
+    )
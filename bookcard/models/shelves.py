@@ -235,3 +235,68 @@ class ShelfArchive(SQLModel, table=True):
         default_factory=lambda: datetime.now(UTC),
         index=True,
     )
+
+
+class MagicShelfBook(SQLModel, table=True):
+    """Materialized membership of a Magic Shelf.
+
+    One row per Calibre book currently matching the shelf's rules, so that
+    listing and counting a Magic Shelf is an indexed read instead of a rule
+    evaluation against the Calibre database.
+
+    Attributes
+    ----------
+    shelf_id : int
+        Foreign key to the Magic Shelf.
+    book_id : int
+        Calibre book ID in the shelf's library (no FK constraint - books
+        are in Calibre DB).
+    """
+
+    __tablename__ = "magic_shelf_books"
+
+    shelf_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("shelves.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+    book_id: int = Field(primary_key=True)
+
+
+class MagicShelfState(SQLModel, table=True):
+    """Refresh state of a Magic Shelf's materialized membership.
+
+    Attributes
+    ----------
+    shelf_id : int
+        Foreign key to the Magic Shelf (primary key).
+    rule_hash : str
+        SHA-256 of the rules the membership was built from; a different
+        hash means the membership must be rebuilt.
+    watermark_modified : str | None
+        Calibre ``last_modified`` (as stored text) of the newest book seen
+        by the last refresh, or None if the library was empty.
+    watermark_book_id : int | None
+        Calibre book ID paired with ``watermark_modified``.
+    book_count : int
+        Number of member books.
+    refreshed_at : datetime
+        When the membership was last refreshed.
+    """
+
+    __tablename__ = "magic_shelf_states"
+
+    shelf_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("shelves.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+    rule_hash: str = Field(max_length=64)
+    watermark_modified: str | None = Field(default=None, max_length=64)
+    watermark_book_id: int | None = None
+    book_count: int = 0
+    refreshed_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
@@ -68,6 +68,10 @@ class TaskType(StrEnum):
         Thumbnail generation task.
     LIBRARY_SCAN : str
         Library scan task (scans authors, genres, series, and publishers).
+    BOOK_FILE_HASH_BACKFILL : str
+        Build or refresh the book file content-hash index of a library.
+    MAGIC_SHELF_REFRESH : str
+        Refresh the materialized membership of Magic Shelves.
     """
 
     BOOK_UPLOAD = "book_upload"
@@ -89,6 +93,8 @@ class TaskType(StrEnum):
     PVR_DOWNLOAD_MONITOR = "pvr_download_monitor"
     PROWLARR_SYNC = "prowlarr_sync"
     INDEXER_HEALTH_CHECK = "indexer_health_check"
+    BOOK_FILE_HASH_BACKFILL = "book_file_hash_backfill"
+    MAGIC_SHELF_REFRESH = "magic_shelf_refresh"
 
 
 class Task(SQLModel, table=True):
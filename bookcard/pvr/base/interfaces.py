@@ -52,6 +52,20 @@ class DownloadTracker(Protocol):
         ...
 
 
+@runtime_checkable
+class IncrementalDownloadTracker(Protocol):
+    """Protocol for trackers able to fetch only changes between polls.
+
+    Implementations keep the state of the previous sync and still return
+    every active download, so callers can treat the result like
+    `DownloadTracker.get_items`.
+    """
+
+    def sync_items(self) -> Sequence[DownloadItem]:
+        """Get list of active downloads, fetching changes since the last sync."""
+        ...
+
+
 @runtime_checkable
 class DownloadManager(Protocol):
     """Protocol for clients that can manage downloads."""
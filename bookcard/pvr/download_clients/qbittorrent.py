@@ -402,6 +402,30 @@ class QBittorrentProxy:
             msg = f"Failed to parse qBittorrent torrents response: {e}"
             raise PVRProviderError(msg) from e
 
+    def get_maindata(self, rid: int = 0) -> dict[str, Any]:
+        """Get changes since a previous sync.
+
+        Parameters
+        ----------
+        rid : int
+            Response ID of the previous sync, or 0 for a full update.
+
+        Returns
+        -------
+        dict[str, Any]
+            Sync response with ``rid``, ``full_update``, the changed fields
+            of ``torrents`` keyed by hash and ``torrents_removed``.
+        """
+        response_text = self._request(
+            "GET", "/api/v2/sync/maindata", params={"rid": rid}
+        )
+
+        try:
+            return json.loads(response_text)
+        except Exception as e:
+            msg = f"Failed to parse qBittorrent sync response: {e}"
+            raise PVRProviderError(msg) from e
+
     def remove_torrent(self, hash_str: str, delete_files: bool = False) -> None:
         """Remove torrent.
 
@@ -494,6 +518,9 @@ class QBittorrentClient(TrackingDownloadClient):
         )
         self.settings: QBittorrentSettings = settings
         self._proxy = QBittorrentProxy(self.settings)
+        # Torrents as of the last sync, keyed by hash
+        self._sync_rid = 0
+        self._sync_torrents: dict[str, dict[str, Any]] = {}
         self._status_mapper = StatusMapper(
             {
                 "uploading": DownloadStatus.COMPLETED,
@@ -610,45 +637,101 @@ class QBittorrentClient(TrackingDownloadClient):
         try:
             category = self.settings.category
             torrents = self._proxy.get_torrents(category=category)
+            items = [self._build_download_item(torrent) for torrent in torrents]
+        except Exception as e:
+            msg = f"Failed to get downloads from qBittorrent: {e}"
+            raise PVRProviderError(msg) from e
+        else:
+            return items
+
+    def sync_items(self) -> Sequence[DownloadItem]:
+        """Get list of active downloads using incremental sync.
+
+        Only torrents changed since the previous call are transferred, via
+        ``/api/v2/sync/maindata``; the rest are taken from the previous sync.
+
+        Returns
+        -------
+        Sequence[DownloadItem]
+            Sequence of download items with standardized fields.
+
+        Raises
+        ------
+        PVRProviderError
+            If fetching items fails.
+        """
+        if not self.is_enabled():
+            return []
+
+        try:
+            data = self._proxy.get_maindata(self._sync_rid)
+            if data.get("full_update"):
+                self._sync_torrents = {}
+            for hash_str, changes in (data.get("torrents") or {}).items():
+                self._sync_torrents.setdefault(hash_str, {"hash": hash_str}).update(
+                    changes
+                )
+            for hash_str in data.get("torrents_removed") or []:
+                self._sync_torrents.pop(hash_str, None)
+            self._sync_rid = int(data.get("rid", 0))
 
-            items = []
-            for torrent in torrents:
-                # Map qBittorrent state to our status
-                state = torrent.get("state", "")
-                status = self._status_mapper.map(state)
-
-                # Calculate progress
-                # qBittorrent API returns progress as float 0.0-1.0
-                # But some versions may return 0-100, so normalize
-                progress = float(torrent.get("progress", 0.0))
-                if progress > 1.0:
-                    # Assume it's 0-100 scale, convert to 0-1
-                    progress = progress / 100.0
-                if progress > 1.0:
-                    progress = 1.0
-
-                # Get file path (content path for completed torrents)
-                file_path = torrent.get("content_path") or torrent.get("save_path")
-
-                item: DownloadItem = {
-                    "client_item_id": torrent.get("hash", "").upper(),
-                    "title": torrent.get("name", ""),
-                    "status": status,
-                    "progress": progress,
-                    "size_bytes": torrent.get("size"),
-                    "downloaded_bytes": torrent.get("completed"),
-                    "download_speed_bytes_per_sec": torrent.get("dlspeed"),
-                    "eta_seconds": self._calculate_eta(torrent),
-                    "file_path": file_path,
-                    "comment": torrent.get("comment"),
-                }
-                items.append(item)
+            category = self.settings.category
+            items = [
+                self._build_download_item(torrent)
+                for torrent in self._sync_torrents.values()
+                if not category or torrent.get("category") == category
+            ]
         except Exception as e:
+            # Start over with a full update next time
+            self._sync_rid = 0
             msg = f"Failed to get downloads from qBittorrent: {e}"
             raise PVRProviderError(msg) from e
         else:
             return items
 
+    def _build_download_item(self, torrent: dict[str, Any]) -> DownloadItem:
+        """Build a download item from a qBittorrent torrent.
+
+        Parameters
+        ----------
+        torrent : dict[str, Any]
+            Torrent dictionary.
+
+        Returns
+        -------
+        DownloadItem
+            Download item with standardized fields.
+        """
+        # Map qBittorrent state to our status
+        state = torrent.get("state", "")
+        status = self._status_mapper.map(state)
+
+        # Calculate progress
+        # qBittorrent API returns progress as float 0.0-1.0
+        # But some versions may return 0-100, so normalize
+        progress = float(torrent.get("progress", 0.0))
+        if progress > 1.0:
+            # Assume it's 0-100 scale, convert to 0-1
+            progress = progress / 100.0
+        if progress > 1.0:
+            progress = 1.0
+
+        # Get file path (content path for completed torrents)
+        file_path = torrent.get("content_path") or torrent.get("save_path")
+
+        return {
+            "client_item_id": torrent.get("hash", "").upper(),
+            "title": torrent.get("name", ""),
+            "status": status,
+            "progress": progress,
+            "size_bytes": torrent.get("size"),
+            "downloaded_bytes": torrent.get("completed"),
+            "download_speed_bytes_per_sec": torrent.get("dlspeed"),
+            "eta_seconds": self._calculate_eta(torrent),
+            "file_path": file_path,
+            "comment": torrent.get("comment"),
+        }
+
     def remove_item(self, client_item_id: str, delete_files: bool = False) -> bool:
         """Remove a download from qBittorrent.
 
@@ -55,6 +55,9 @@ from bookcard.pvr.utils.status import DownloadStatus, StatusMapper
 
 logger = logging.getLogger(__name__)
 
+# Recently completed history items reported alongside the queue
+HISTORY_LIMIT = 50
+
 
 class SabnzbdSettings(DownloadClientSettings):
     """Settings for SABnzbd download client.
@@ -383,6 +386,39 @@ class SabnzbdProxy:
         history_data = response.get("history", {})
         return history_data.get("slots", [])
 
+    def get_history_changes(
+        self, last_history_update: int, limit: int = 0
+    ) -> tuple[list[dict[str, Any]] | None, int]:
+        """Get history items if the history changed since a previous fetch.
+
+        Parameters
+        ----------
+        last_history_update : int
+            ``last_history_update`` of the previous fetch, or 0 to always
+            fetch the history.
+        limit : int
+            Limit results (0 = all, default: 0).
+
+        Returns
+        -------
+        tuple[list[dict[str, Any]] | None, int]
+            History items, or None if unchanged, and the
+            ``last_history_update`` to pass to the next call.
+        """
+        params: dict[str, Any] = {"last_history_update": last_history_update}
+        if limit > 0:
+            params["limit"] = limit
+
+        response = self._request("GET", "history", params=params)
+        history_data = response.get("history")
+        # SABnzbd answers with `"history": false` if nothing changed
+        if not isinstance(history_data, dict):
+            return None, last_history_update
+        return (
+            history_data.get("slots", []),
+            int(history_data.get("last_history_update", 0)),
+        )
+
     def remove_from_queue(self, nzo_id: str, delete_files: bool = False) -> None:
         """Remove item from queue.
 
@@ -474,6 +510,9 @@ class SabnzbdClient(BaseDownloadClient):
         )
         self.settings: SabnzbdSettings = settings
         self._proxy: SabnzbdProxy = SabnzbdProxy(self.settings)
+        # History items as of the last sync
+        self._last_history_update = 0
+        self._sync_history: list[dict[str, Any]] = []
         self._status_mapper = StatusMapper(
             {
                 # Queue statuses
@@ -552,85 +591,158 @@ class SabnzbdClient(BaseDownloadClient):
             return []
 
         try:
-            items = []
+            items = [
+                *self._build_queue_items(self._proxy.get_queue()),
+                *self._build_history_items(
+                    self._proxy.get_history(limit=HISTORY_LIMIT)
+                ),
+            ]
+        except Exception as e:
+            msg = f"Failed to get downloads from SABnzbd: {e}"
+            raise PVRProviderError(msg) from e
+        else:
+            return items
+
+    def sync_items(self) -> Sequence[DownloadItem]:
+        """Get list of active downloads, reusing the history when unchanged.
+
+        SABnzbd has no delta for the queue, which is fetched in full; the
+        history is only transferred when it changed since the previous call.
+
+        Returns
+        -------
+        Sequence[DownloadItem]
+            Sequence of download items.
 
-            # Get queue items
+        Raises
+        ------
+        PVRProviderError
+            If fetching items fails.
+        """
+        if not self.is_enabled():
+            return []
+
+        try:
             queue_items = self._proxy.get_queue()
-            for item in queue_items:
-                status = item.get("status", "")
-                nzo_id = item.get("nzo_id", "")
-
-                # Map SABnzbd status to our status
-                item_status = self._map_sabnzbd_status(status, is_queue=True)
-
-                # Calculate progress
-                mb = item.get("mb", 0.0)
-                mbleft = item.get("mbleft", 0.0)
-                total_bytes = int(mb * 1024 * 1024) if mb else None
-                remaining_bytes = int(mbleft * 1024 * 1024) if mbleft else None
-
-                progress = 0.0
-                if total_bytes and total_bytes > 0:
-                    downloaded = total_bytes - (remaining_bytes or 0)
-                    progress = downloaded / total_bytes
-                    if progress > 1.0:
-                        progress = 1.0
-
-                # Get ETA
-                timeleft = item.get("timeleft", "")
-                eta_seconds = None
-                if timeleft and isinstance(timeleft, (int, float)):
-                    eta_seconds = int(timeleft)
-
-                download_item: DownloadItem = {
-                    "client_item_id": str(nzo_id),
-                    "title": item.get("filename", ""),
-                    "status": item_status,
-                    "progress": progress,
-                    "size_bytes": total_bytes,
-                    "downloaded_bytes": total_bytes - remaining_bytes
-                    if total_bytes and remaining_bytes
-                    else None,
-                    "download_speed_bytes_per_sec": None,  # SABnzbd doesn't provide this directly
-                    "eta_seconds": eta_seconds,
-                    "file_path": None,  # Will be available in history
-                }
-                items.append(download_item)
-
-            # Get history items (recently completed)
-            history_items = self._proxy.get_history(limit=50)
-            for item in history_items:
-                status = item.get("status", "")
-                nzo_id = item.get("nzo_id", "")
-
-                # Only include completed/failed items
-                if status not in ("Completed", "Failed"):
-                    continue
-
-                item_status = self._map_sabnzbd_status(status, is_queue=False)
-
-                storage = item.get("storage", "")
-                mb = item.get("mb", 0.0)
-                total_bytes = int(mb * 1024 * 1024) if mb else None
-
-                history_item: DownloadItem = {
-                    "client_item_id": str(nzo_id),
-                    "title": item.get("name", ""),
-                    "status": item_status,
-                    "progress": 1.0 if item_status == DownloadStatus.COMPLETED else 0.0,
-                    "size_bytes": total_bytes,
-                    "downloaded_bytes": total_bytes,
-                    "download_speed_bytes_per_sec": None,
-                    "eta_seconds": None,
-                    "file_path": storage if storage else None,
-                }
-                items.append(history_item)
+            history_items, self._last_history_update = self._proxy.get_history_changes(
+                self._last_history_update, limit=HISTORY_LIMIT
+            )
+            if history_items is not None:
+                self._sync_history = history_items
+            items = [
+                *self._build_queue_items(queue_items),
+                *self._build_history_items(self._sync_history),
+            ]
         except Exception as e:
+            # Fetch the history in full next time
+            self._last_history_update = 0
             msg = f"Failed to get downloads from SABnzbd: {e}"
             raise PVRProviderError(msg) from e
         else:
             return items
 
+    def _build_queue_items(
+        self, queue_items: list[dict[str, Any]]
+    ) -> list[DownloadItem]:
+        """Build download items from SABnzbd queue slots.
+
+        Parameters
+        ----------
+        queue_items : list[dict[str, Any]]
+            Queue slots.
+
+        Returns
+        -------
+        list[DownloadItem]
+            Download items.
+        """
+        items = []
+        for item in queue_items:
+            status = item.get("status", "")
+            nzo_id = item.get("nzo_id", "")
+
+            # Map SABnzbd status to our status
+            item_status = self._map_sabnzbd_status(status, is_queue=True)
+
+            # Calculate progress
+            mb = item.get("mb", 0.0)
+            mbleft = item.get("mbleft", 0.0)
+            total_bytes = int(mb * 1024 * 1024) if mb else None
+            remaining_bytes = int(mbleft * 1024 * 1024) if mbleft else None
+
+            progress = 0.0
+            if total_bytes and total_bytes > 0:
+                downloaded = total_bytes - (remaining_bytes or 0)
+                progress = downloaded / total_bytes
+                if progress > 1.0:
+                    progress = 1.0
+
+            # Get ETA
+            timeleft = item.get("timeleft", "")
+            eta_seconds = None
+            if timeleft and isinstance(timeleft, (int, float)):
+                eta_seconds = int(timeleft)
+
+            download_item: DownloadItem = {
+                "client_item_id": str(nzo_id),
+                "title": item.get("filename", ""),
+                "status": item_status,
+                "progress": progress,
+                "size_bytes": total_bytes,
+                "downloaded_bytes": total_bytes - remaining_bytes
+                if total_bytes and remaining_bytes
+                else None,
+                "download_speed_bytes_per_sec": None,  # SABnzbd doesn't provide this directly
+                "eta_seconds": eta_seconds,
+                "file_path": None,  # Will be available in history
+            }
+            items.append(download_item)
+        return items
+
+    def _build_history_items(
+        self, history_items: list[dict[str, Any]]
+    ) -> list[DownloadItem]:
+        """Build download items from recently completed SABnzbd history slots.
+
+        Parameters
+        ----------
+        history_items : list[dict[str, Any]]
+            History slots.
+
+        Returns
+        -------
+        list[DownloadItem]
+            Download items of completed and failed slots.
+        """
+        items = []
+        for item in history_items:
+            status = item.get("status", "")
+            nzo_id = item.get("nzo_id", "")
+
+            # Only include completed/failed items
+            if status not in ("Completed", "Failed"):
+                continue
+
+            item_status = self._map_sabnzbd_status(status, is_queue=False)
+
+            storage = item.get("storage", "")
+            mb = item.get("mb", 0.0)
+            total_bytes = int(mb * 1024 * 1024) if mb else None
+
+            history_item: DownloadItem = {
+                "client_item_id": str(nzo_id),
+                "title": item.get("name", ""),
+                "status": item_status,
+                "progress": 1.0 if item_status == DownloadStatus.COMPLETED else 0.0,
+                "size_bytes": total_bytes,
+                "downloaded_bytes": total_bytes,
+                "download_speed_bytes_per_sec": None,
+                "eta_seconds": None,
+                "file_path": storage if storage else None,
+            }
+            items.append(history_item)
+        return items
+
     def remove_item(self, client_item_id: str, delete_files: bool = False) -> bool:
         """Remove a download from SABnzbd.
 
@@ -25,6 +25,7 @@ import base64
 import json
 import logging
 import pathlib
+import time
 from collections.abc import Callable, Sequence
 from contextlib import suppress
 from typing import Any
@@ -55,6 +56,22 @@ from bookcard.pvr.utils.status import DownloadStatus, StatusMapper
 
 logger = logging.getLogger(__name__)
 
+# Fields needed to build download items
+TRACKING_FIELDS = [
+    "id",
+    "hashString",
+    "name",
+    "downloadDir",
+    "totalSize",
+    "leftUntilDone",
+    "eta",
+    "status",
+]
+
+# Transmission reports torrents active within this many seconds as
+# "recently-active"; older syncs need a full refresh to see every change
+RECENTLY_ACTIVE_SECONDS = 60.0
+
 
 class TransmissionSettings(DownloadClientSettings):
     """Settings for Transmission download client.
@@ -467,6 +484,27 @@ class TransmissionProxy:
         response = self._request("torrent-get", arguments)
         return response.get("arguments", {}).get("torrents", [])
 
+    def get_recently_active(
+        self, fields: list[str]
+    ) -> tuple[list[dict[str, Any]], list[int]]:
+        """Get torrents changed or removed within the last minute.
+
+        Parameters
+        ----------
+        fields : list[str]
+            Fields to retrieve.
+
+        Returns
+        -------
+        tuple[list[dict[str, Any]], list[int]]
+            Recently active torrents and IDs of recently removed torrents.
+        """
+        response = self._request(
+            "torrent-get", {"fields": fields, "ids": "recently-active"}
+        )
+        arguments = response.get("arguments", {})
+        return arguments.get("torrents", []), arguments.get("removed", [])
+
     def remove_torrent(self, hash_str: str, delete_files: bool = False) -> None:
         """Remove torrent.
 
@@ -535,6 +573,9 @@ class TransmissionClient(TrackingDownloadClient):
         )
         self.settings: TransmissionSettings = settings
         self._proxy = TransmissionProxy(self.settings)
+        # Torrents as of the last sync, keyed by ID
+        self._synced_at: float | None = None
+        self._sync_torrents: dict[int, dict[str, Any]] = {}
         self._status_mapper = StatusMapper(
             {
                 6: DownloadStatus.COMPLETED,  # Seeding
@@ -650,45 +691,104 @@ class TransmissionClient(TrackingDownloadClient):
 
         try:
             torrents = self._proxy.get_torrents()
+            items = [self._build_download_item(torrent) for torrent in torrents]
+        except Exception as e:
+            msg = f"Failed to get downloads from Transmission: {e}"
+            raise PVRProviderError(msg) from e
+        else:
+            return items
+
+    def sync_items(self) -> Sequence[DownloadItem]:
+        """Get list of active downloads using incremental sync.
+
+        Fetches only the fields needed for tracking. Syncs following the
+        previous one within `RECENTLY_ACTIVE_SECONDS` transfer only the
+        recently active torrents.
+
+        Returns
+        -------
+        Sequence[DownloadItem]
+            Sequence of download items with standardized fields.
 
-            items = []
+        Raises
+        ------
+        PVRProviderError
+            If fetching items fails.
+        """
+        if not self.is_enabled():
+            return []
+
+        try:
+            started_at = time.monotonic()
+            if (
+                self._synced_at is not None
+                and started_at - self._synced_at < RECENTLY_ACTIVE_SECONDS
+            ):
+                torrents, removed = self._proxy.get_recently_active(TRACKING_FIELDS)
+                for torrent_id in removed:
+                    self._sync_torrents.pop(torrent_id, None)
+            else:
+                torrents = self._proxy.get_torrents(fields=TRACKING_FIELDS)
+                self._sync_torrents = {}
             for torrent in torrents:
-                # Map Transmission status to our status
-                status_code = torrent.get("status", 0)
-                status = self._status_mapper.map(status_code)
-
-                # Calculate progress
-                total_size = torrent.get("totalSize", 0)
-                left_until_done = torrent.get("leftUntilDone", 0)
-                progress = 1.0 - left_until_done / total_size if total_size > 0 else 0.0
-
-                # Get download directory
-                download_dir = torrent.get("downloadDir", "")
-
-                # Calculate download speed (not directly available, estimate from ETA)
-                download_speed = None
-                eta = torrent.get("eta", -1)
-                if eta > 0 and left_until_done > 0:
-                    download_speed = left_until_done / eta
-
-                item: DownloadItem = {
-                    "client_item_id": torrent.get("hashString", "").upper(),
-                    "title": torrent.get("name", ""),
-                    "status": status,
-                    "progress": progress,
-                    "size_bytes": total_size,
-                    "downloaded_bytes": total_size - left_until_done,
-                    "download_speed_bytes_per_sec": download_speed,
-                    "eta_seconds": eta if eta > 0 else None,
-                    "file_path": download_dir,
-                }
-                items.append(item)
+                self._sync_torrents[torrent["id"]] = torrent
+            self._synced_at = started_at
+
+            items = [
+                self._build_download_item(torrent)
+                for torrent in self._sync_torrents.values()
+            ]
         except Exception as e:
+            # Start over with a full refresh next time
+            self._synced_at = None
             msg = f"Failed to get downloads from Transmission: {e}"
             raise PVRProviderError(msg) from e
         else:
             return items
 
+    def _build_download_item(self, torrent: dict[str, Any]) -> DownloadItem:
+        """Build a download item from a Transmission torrent.
+
+        Parameters
+        ----------
+        torrent : dict[str, Any]
+            Torrent dictionary.
+
+        Returns
+        -------
+        DownloadItem
+            Download item with standardized fields.
+        """
+        # Map Transmission status to our status
+        status_code = torrent.get("status", 0)
+        status = self._status_mapper.map(status_code)
+
+        # Calculate progress
+        total_size = torrent.get("totalSize", 0)
+        left_until_done = torrent.get("leftUntilDone", 0)
+        progress = 1.0 - left_until_done / total_size if total_size > 0 else 0.0
+
+        # Get download directory
+        download_dir = torrent.get("downloadDir", "")
+
+        # Calculate download speed (not directly available, estimate from ETA)
+        download_speed = None
+        eta = torrent.get("eta", -1)
+        if eta > 0 and left_until_done > 0:
+            download_speed = left_until_done / eta
+
+        return {
+            "client_item_id": torrent.get("hashString", "").upper(),
+            "title": torrent.get("name", ""),
+            "status": status,
+            "progress": progress,
+            "size_bytes": total_size,
+            "downloaded_bytes": total_size - left_until_done,
+            "download_speed_bytes_per_sec": download_speed,
+            "eta_seconds": eta if eta > 0 else None,
+            "file_path": download_dir,
+        }
+
     def remove_item(self, client_item_id: str, delete_files: bool = False) -> bool:
         """Remove a download from Transmission.
 
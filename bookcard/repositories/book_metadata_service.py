@@ -22,6 +22,7 @@ from pathlib import Path
 
 from bookcard.repositories.interfaces import IBookMetadataService
 from bookcard.services.book_cover_extractor import BookCoverExtractor
+from bookcard.services.book_file_probe import BookFileProbe, get_book_file_probe
 from bookcard.services.book_metadata import BookMetadata
 from bookcard.services.book_metadata_extractor import BookMetadataExtractor
 
@@ -29,13 +30,17 @@ from bookcard.services.book_metadata_extractor import BookMetadataExtractor
 class BookMetadataService(IBookMetadataService):
     """Service for extracting book metadata and covers.
 
-    Handles metadata extraction from book files following SRP.
+    Handles metadata extraction from book files following SRP. Files are
+    probed once for metadata and cover together; with default extractors
+    the process-wide probe is used, so repeated extractions of an
+    unchanged file are served from its cache.
     """
 
     def __init__(
         self,
         metadata_extractor: BookMetadataExtractor | None = None,
         cover_extractor: BookCoverExtractor | None = None,
+        probe: BookFileProbe | None = None,
     ) -> None:
         """Initialize metadata service.
 
@@ -45,9 +50,17 @@ class BookMetadataService(IBookMetadataService):
             Optional metadata extractor (creates default if None).
         cover_extractor : BookCoverExtractor | None
             Optional cover extractor (creates default if None).
+        probe : BookFileProbe | None
+            Optional probe (default: a probe over the given extractors, or
+            the shared probe if none were given).
         """
-        self._metadata_extractor = metadata_extractor or BookMetadataExtractor()
-        self._cover_extractor = cover_extractor or BookCoverExtractor()
+        if probe is None:
+            probe = (
+                BookFileProbe(metadata_extractor, cover_extractor)
+                if metadata_extractor or cover_extractor
+                else get_book_file_probe()
+            )
+        self._probe = probe
 
     def extract_metadata(
         self,
@@ -68,8 +81,5 @@ class BookMetadataService(IBookMetadataService):
         tuple[BookMetadata, bytes | None]
             Tuple of (BookMetadata, cover_data).
         """
-        metadata = self._metadata_extractor.extract_metadata(
-            file_path, file_format, file_path.name
-        )
-        cover_data = self._cover_extractor.extract_cover(file_path, file_format)
-        return metadata, cover_data
+        result = self._probe.probe(file_path, file_format, file_path.name)
+        return result.metadata, result.cover_data
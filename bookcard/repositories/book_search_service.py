@@ -20,19 +20,33 @@ This module handles book search operations following SRP.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from sqlalchemy import func
 from sqlmodel import Session, select
 
 from bookcard.models.core import Author, Book, Series, Tag
 from bookcard.repositories.interfaces import IBookSearchService
 
+if TYPE_CHECKING:
+    from bookcard.repositories.calibre.search_index import BookSearchIndex
+
 
 class BookSearchService(IBookSearchService):
     """Service for searching books, authors, tags, and series.
 
     Handles search operations following SRP.
+
+    Parameters
+    ----------
+    search_index : BookSearchIndex | None
+        Full-text index answering suggestions with ranked prefix matches.
+        The ``LIKE`` queries are used when it is None or cannot answer.
     """
 
+    def __init__(self, search_index: BookSearchIndex | None = None) -> None:
+        self._search_index = search_index
+
     def search_suggestions(
         self,
         session: Session,
@@ -68,6 +82,19 @@ class BookSearchService(IBookSearchService):
         if not query or not query.strip():
             return {"books": [], "authors": [], "tags": [], "series": []}
 
+        if self._search_index is not None:
+            indexed = self._search_index.suggest(
+                query,
+                {
+                    "books": book_limit,
+                    "authors": author_limit,
+                    "tags": tag_limit,
+                    "series": series_limit,
+                },
+            )
+            if indexed is not None:
+                return indexed
+
         results = {
             "books": [],
             "authors": [],
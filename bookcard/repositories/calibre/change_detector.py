@@ -0,0 +1,457 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Detection of changes made to Calibre libraries by other programs.
+
+Libraries are also edited by desktop Calibre and calibre-server. A
+`LibraryChangeDetector` keeps a read-only connection to ``metadata.db``
+and, whenever ``PRAGMA data_version`` shows that another connection
+committed, works out which books changed since its watermark: books whose
+``last_modified`` moved past it, plus added and deleted books. Commits that
+only rename authors, tags, series, publishers, languages or ratings (which
+Calibre does without bumping ``last_modified``) are reported as a full
+change of the library; commits touching neither are not reported.
+
+`LibraryChangeMonitor` runs a detector per library, triggered by
+``watchfiles`` events on ``metadata.db`` and its write-ahead log and by
+polling as fallback (e.g. on network mounts), and publishes each
+`LibraryChange` to its subscribers: caches drop exactly the books that
+changed instead of everything.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from watchfiles import watch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from watchfiles import Change
+
+logger = logging.getLogger(__name__)
+
+# Seconds between polls of every library (also picks up new libraries)
+DEFAULT_POLL_INTERVAL = 10.0
+
+# Milliseconds file events are collected before libraries are checked
+_WATCH_DEBOUNCE_MS = 200
+
+# Name tables whose renames do not bump ``books.last_modified``
+_NAME_TABLES = {
+    "authors": "name",
+    "tags": "name",
+    "series": "name",
+    "publishers": "name",
+    "languages": "lang_code",
+    "ratings": "rating",
+}
+
+
+@dataclass(frozen=True)
+class LibraryChange:
+    """Change of a Calibre library made outside the application.
+
+    Attributes
+    ----------
+    calibre_db_file : Path
+        Resolved path of the library's ``metadata.db``.
+    book_ids : frozenset[int]
+        IDs of added, updated and deleted books.
+    full : bool
+        Whether data shared by many books changed (e.g. a tag was
+        renamed), so everything derived from the library is stale.
+    """
+
+    calibre_db_file: Path
+    book_ids: frozenset[int] = field(default_factory=frozenset)
+    full: bool = False
+
+
+class LibraryChangeDetector:
+    """Detect which books of one library changed since the last check.
+
+    Thread-safe. The first successful check only records the library's
+    state.
+
+    Parameters
+    ----------
+    calibre_db_file : Path
+        Calibre ``metadata.db`` (opened read-only).
+    publish : Callable[[LibraryChange], None] | None
+        Called with every detected change.
+    """
+
+    def __init__(
+        self,
+        calibre_db_file: Path,
+        publish: Callable[[LibraryChange], None] | None = None,
+    ) -> None:
+        self._calibre_db_file = calibre_db_file.resolve()
+        self._publish = publish
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._data_version: int | None = None
+        self._watermark = ""
+        self._book_ids: set[int] = set()
+        self._names_fingerprint = ""
+
+    @property
+    def calibre_db_file(self) -> Path:
+        """Resolved path of the watched ``metadata.db``."""
+        return self._calibre_db_file
+
+    def check(self) -> LibraryChange | None:
+        """Check the library for changes and publish them.
+
+        Returns
+        -------
+        LibraryChange | None
+            Detected change, or None if nothing changed since the last
+            check (or the database cannot be read).
+        """
+        with self._lock:
+            try:
+                change = self._detect()
+            except sqlite3.Error as e:
+                logger.warning(
+                    "Failed to check %s for changes: %s", self._calibre_db_file, e
+                )
+                self._close()
+                return None
+        if change is not None and self._publish is not None:
+            self._publish(change)
+        return change
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._close()
+
+    def _detect(self) -> LibraryChange | None:
+        conn = self._connect()
+        if conn is None:
+            return None
+        (data_version,) = conn.execute("PRAGMA data_version").fetchone()
+        if self._data_version is None:
+            self._data_version = data_version
+            (watermark,) = conn.execute(
+                "SELECT max(last_modified) FROM books"
+            ).fetchone()
+            self._watermark = str(watermark or "")
+            self._book_ids = {r for (r,) in conn.execute("SELECT id FROM books")}
+            self._names_fingerprint = self._fingerprint_names(conn)
+            return None
+        if data_version == self._data_version:
+            return None
+        self._data_version = data_version
+
+        changed: set[int] = set()
+        for book_id, last_modified in conn.execute(
+            "SELECT id, last_modified FROM books WHERE last_modified > ?",
+            (self._watermark,),
+        ):
+            changed.add(book_id)
+            self._watermark = max(self._watermark, str(last_modified))
+
+        (book_count,) = conn.execute("SELECT count(*) FROM books").fetchone()
+        if book_count != len(self._book_ids) or not changed <= self._book_ids:
+            # Deleted books do not bump any last_modified
+            book_ids = {r for (r,) in conn.execute("SELECT id FROM books")}
+            changed |= self._book_ids ^ book_ids
+            self._book_ids = book_ids
+
+        names_fingerprint = self._fingerprint_names(conn)
+        full = names_fingerprint != self._names_fingerprint
+        self._names_fingerprint = names_fingerprint
+
+        if not (changed or full):
+            return None
+        return LibraryChange(self._calibre_db_file, frozenset(changed), full)
+
+    @staticmethod
+    def _fingerprint_names(conn: sqlite3.Connection) -> str:
+        digest = hashlib.sha256()
+        for table, column in _NAME_TABLES.items():
+            with contextlib.suppress(sqlite3.OperationalError):
+                for row in conn.execute(
+                    f"SELECT id, {column} FROM {table} ORDER BY id"  # noqa: S608
+                ):
+                    digest.update(repr(row).encode("utf-8"))
+            digest.update(table.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None:
+            if not self._calibre_db_file.exists():
+                return None
+            self._conn = sqlite3.connect(
+                f"{self._calibre_db_file.as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        # Re-read the library's state on the next check
+        self._data_version = None
+
+
+class LibraryChangeMonitor:
+    """Watch every library for external changes and publish them.
+
+    Parameters
+    ----------
+    list_libraries : Callable[[], Iterable[Path]]
+        Returns the ``metadata.db`` files of the configured libraries.
+    poll_interval : float
+        Seconds between checks of every library, whether or not file
+        events were received.
+    """
+
+    def __init__(
+        self,
+        list_libraries: Callable[[], Iterable[Path]],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self._list_libraries = list_libraries
+        self._poll_interval = poll_interval
+        self._detectors: dict[Path, LibraryChangeDetector] = {}
+        self._subscribers: list[Callable[[LibraryChange], None]] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(
+        self, callback: Callable[[LibraryChange], None]
+    ) -> Callable[[], None]:
+        """Receive every detected change.
+
+        Callbacks run on the thread that detected the change and must not
+        block.
+
+        Parameters
+        ----------
+        callback : Callable[[LibraryChange], None]
+            Change handler.
+
+        Returns
+        -------
+        Callable[[], None]
+            Function removing the subscription.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._lock, contextlib.suppress(ValueError):
+                self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    def detector(self, calibre_db_file: Path) -> LibraryChangeDetector:
+        """Get the detector of a library, creating it on first use.
+
+        Parameters
+        ----------
+        calibre_db_file : Path
+            Calibre ``metadata.db`` of the library.
+
+        Returns
+        -------
+        LibraryChangeDetector
+            Detector publishing to this monitor's subscribers.
+        """
+        key = Path(calibre_db_file).resolve()
+        with self._lock:
+            detector = self._detectors.get(key)
+            if detector is None:
+                detector = LibraryChangeDetector(key, self._publish)
+                self._detectors[key] = detector
+        return detector
+
+    def check_all(self) -> None:
+        """Check every known library for changes."""
+        with self._lock:
+            detectors = list(self._detectors.values())
+        for detector in detectors:
+            detector.check()
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="LibraryChangeMonitor", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop watching and close all detectors."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        with self._lock:
+            detectors = list(self._detectors.values())
+            self._detectors.clear()
+        for detector in detectors:
+            detector.close()
+
+    def _publish(self, change: LibraryChange) -> None:
+        logger.debug(
+            "External change of %s: %d books%s",
+            change.calibre_db_file,
+            len(change.book_ids),
+            " (full)" if change.full else "",
+        )
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(change)
+            except Exception:
+                logger.exception("Library change subscriber failed")
+
+    def _refresh_libraries(self) -> set[Path]:
+        """Create detectors of new libraries and drop removed ones."""
+        try:
+            files = {Path(f).resolve() for f in self._list_libraries()}
+        except Exception:
+            logger.exception("Failed to list libraries")
+            with self._lock:
+                return set(self._detectors)
+        with self._lock:
+            removed = [d for k, d in self._detectors.items() if k not in files]
+            for detector in removed:
+                del self._detectors[detector.calibre_db_file]
+        for detector in removed:
+            detector.close()
+        for calibre_db_file in files:
+            # Records the state new libraries are compared against
+            self.detector(calibre_db_file).check()
+        return files
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            files = self._refresh_libraries()
+            directories = {f.parent for f in files if f.parent.is_dir()}
+            if not directories:
+                self._stop_event.wait(self._poll_interval)
+                continue
+            try:
+                self._watch(files, directories)
+            except Exception:
+                logger.exception("Library watch failed; polling instead")
+                if not self._stop_event.wait(self._poll_interval):
+                    self.check_all()
+
+    def _watch(self, files: set[Path], directories: set[Path]) -> None:
+        """Check libraries on file events and on every poll interval.
+
+        Returns when the set of libraries changes or on stop.
+        """
+        watched = {str(f) for f in files} | {f"{f}-wal" for f in files}
+
+        def _is_database(_change: Change, path: str) -> bool:
+            return path in watched
+
+        for changes in watch(
+            *directories,
+            watch_filter=_is_database,
+            debounce=_WATCH_DEBOUNCE_MS,
+            stop_event=self._stop_event,
+            rust_timeout=int(self._poll_interval * 1000),
+            yield_on_timeout=True,
+            recursive=False,
+        ):
+            if self._stop_event.is_set():
+                return
+            if changes:
+                touched = {Path(path.removesuffix("-wal")) for _, path in changes}
+                for calibre_db_file in touched:
+                    self.detector(calibre_db_file).check()
+                continue
+            # Poll: catches changes watchers miss, e.g. on network mounts
+            if self._refresh_libraries() != files:
+                return
+
+
+_monitor: LibraryChangeMonitor | None = None
+_monitor_lock = threading.Lock()
+
+
+def configure_library_change_monitor(
+    list_libraries: Callable[[], Iterable[Path]],
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> LibraryChangeMonitor:
+    """Install the global library change monitor.
+
+    Replaces (and shuts down) any previously configured monitor.
+
+    Parameters
+    ----------
+    list_libraries : Callable[[], Iterable[Path]]
+        Returns the ``metadata.db`` files of the configured libraries.
+    poll_interval : float
+        Seconds between checks of every library.
+
+    Returns
+    -------
+    LibraryChangeMonitor
+        Newly installed (not yet started) monitor.
+    """
+    global _monitor
+    monitor = LibraryChangeMonitor(list_libraries, poll_interval)
+    with _monitor_lock:
+        previous, _monitor = _monitor, monitor
+    if previous is not None:
+        previous.shutdown()
+    return monitor
+
+
+def get_library_change_detector(
+    calibre_db_file: Path,
+) -> LibraryChangeDetector | None:
+    """Get the change detector of a library.
+
+    Parameters
+    ----------
+    calibre_db_file : Path
+        Calibre ``metadata.db`` of the library.
+
+    Returns
+    -------
+    LibraryChangeDetector | None
+        Detector of the library, or None if change detection is not
+        configured.
+    """
+    with _monitor_lock:
+        monitor = _monitor
+    if monitor is None:
+        return None
+    return monitor.detector(calibre_db_file)
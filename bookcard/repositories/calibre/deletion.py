@@ -46,7 +46,9 @@ if TYPE_CHECKING:
 
     from bookcard.repositories.interfaces import IFileManager, ISessionManager
 
+    from .read_model import BookReadModel
     from .retry import SQLiteRetryPolicy
+    from .search_index import BookSearchIndex
 
 
 class BookDeletionOperations:
@@ -58,10 +60,14 @@ class BookDeletionOperations:
         session_manager: ISessionManager,
         retry_policy: SQLiteRetryPolicy,
         file_manager: IFileManager,
+        search_index: BookSearchIndex | None = None,
+        read_model: BookReadModel | None = None,
     ) -> None:
         self._session_manager = session_manager
         self._retry = retry_policy
         self._file_manager = file_manager
+        self._search_index = search_index
+        self._read_model = read_model
 
     def delete_book(
         self,
@@ -99,6 +105,10 @@ class BookDeletionOperations:
 
                 self._execute_database_deletion_commands(session, book_id, db_book)
                 self._retry.commit(session)
+                if self._search_index is not None:
+                    self._search_index.mark_changed([book_id])
+                if self._read_model is not None:
+                    self._read_model.invalidate([book_id])
 
                 if delete_files_from_drive:
                     self._execute_filesystem_deletion_commands(
@@ -38,6 +38,8 @@ if TYPE_CHECKING:
     from sqlalchemy.sql.selectable import CTE, Subquery
     from sqlmodel import Session
 
+    from .read_model import BookReadModel
+
 from bookcard.models.core import (
     Book,
     BookAuthorLink,
@@ -74,10 +76,23 @@ class _FullDetails(TypedDict):
 
 
 class BookEnrichmentService:
-    """Build enriched `BookWithFullRelations` results from base book rows."""
+    """Build enriched `BookWithFullRelations` results from base book rows.
+
+    Parameters
+    ----------
+    calibre_db_path : Path | None
+        Library directory, used to check that format files exist.
+    read_model : BookReadModel | None
+        Cache of enriched details; details are always queried if None.
+    """
 
-    def __init__(self, calibre_db_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        calibre_db_path: Path | None = None,
+        read_model: BookReadModel | None = None,
+    ) -> None:
         self._calibre_db_path = calibre_db_path
+        self._read_model = read_model
 
     @staticmethod
     def _json_loads_array(value: str | None) -> list:
@@ -446,6 +461,26 @@ class BookEnrichmentService:
             details[book_id] = parsed
         return details
 
+    def _get_full_details_maps(
+        self,
+        session: Session,
+        books: list[BookWithRelations],
+    ) -> dict[int, _FullDetails]:
+        """Get enrichment details, querying only books not in the read model."""
+        versions = {
+            b.book.id: b.book.last_modified for b in books if b.book.id is not None
+        }
+        if self._read_model is None:
+            return self._fetch_full_details_maps(session, list(versions))
+
+        details, generation = self._read_model.get_many(versions)
+        missing = [book_id for book_id in versions if book_id not in details]
+        if missing:
+            fetched = self._fetch_full_details_maps(session, missing)
+            self._read_model.put_many(versions, fetched, generation)
+            details.update(fetched)
+        return details
+
     def enrich_books_with_full_details(
         self,
         session: Session,
@@ -472,7 +507,7 @@ class BookEnrichmentService:
         if not book_ids:
             return []
 
-        details_map = self._fetch_full_details_maps(session, book_ids)
+        details_map = self._get_full_details_maps(session, books)
         formats_map = self._fetch_formats_map(session, book_ids)
 
         enriched: list[BookWithFullRelations] = []
@@ -524,7 +559,7 @@ class BookEnrichmentService:
         if not book_ids:
             return
 
-        details_map = self._fetch_full_details_maps(session, book_ids)
+        details_map = self._get_full_details_maps(session, books)
         for b in books:
             book_id = b.book.id
             if book_id is None:
@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING, cast
 
 from sqlmodel import Session, select
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.core import Book
 from bookcard.models.media import Data
 
@@ -63,6 +64,7 @@ class BookFormatOperations:
         file_path: Path,
         file_format: str,
         replace: bool = False,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """Add a format to an existing book.
 
@@ -76,6 +78,8 @@ class BookFormatOperations:
             Format extension (e.g. 'epub').
         replace : bool
             Whether to replace existing format if it exists.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY).
         """
         if not file_path.exists():
             msg = f"File not found: {file_path}"
@@ -112,6 +116,7 @@ class BookFormatOperations:
                 db_book.path,
                 title_dir,
                 file_format_upper,
+                transfer_mode,
             )
 
             file_size = file_path.stat().st_size
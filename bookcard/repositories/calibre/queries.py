@@ -17,10 +17,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import TYPE_CHECKING, overload
 
-from sqlalchemy import func
+from sqlalchemy import String, and_, func, literal_column, or_, type_coerce
 from sqlalchemy.orm import aliased
 from sqlmodel import select
 
@@ -35,10 +36,14 @@ from bookcard.models.core import (
 )
 
 if TYPE_CHECKING:
-    from sqlalchemy.sql import Select
+    from collections.abc import Sequence
+
+    from sqlalchemy.sql import ColumnElement, Select
     from sqlmodel import Session
     from sqlmodel.sql.expression import SelectOfScalar
 
+    from bookcard.repositories.visibility import BookVisibility
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +74,31 @@ class BookQueryBuilder:
             return None
         return valid_sort_fields.get(sort_by, Book.timestamp)
 
+    def get_keyset_sort_key(self, sort_by: str) -> ColumnElement:
+        """Get a NULL-free sort key usable for keyset pagination.
+
+        Timestamps are compared as stored text so that cursor values
+        round-trip exactly; text keys are lower-cased.
+
+        Parameters
+        ----------
+        sort_by : str
+            Sort field name (unknown names sort by timestamp).
+
+        Returns
+        -------
+        ColumnElement
+            Sort key expression.
+        """
+        if sort_by == "title":
+            return func.lower(func.coalesce(Book.title, ""))
+        if sort_by == "author_sort":
+            return func.lower(func.coalesce(Book.author_sort, ""))
+        if sort_by == "series_index":
+            return func.coalesce(Book.series_index, 0.0)
+        column = Book.pubdate if sort_by == "pubdate" else Book.timestamp
+        return func.coalesce(type_coerce(column, String), "")
+
     def build_author_books_subquery(
         self,
         session: Session,
@@ -136,20 +166,42 @@ class BookQueryBuilder:
             combined_condition = combined_condition & condition
         return stmt.where(combined_condition)
 
-    def build_list_base_stmt(self, *, search_query: str | None) -> Select:
-        """Build base `list_books` statement with series join and optional search."""
+    def build_list_base_stmt(
+        self,
+        *,
+        search_query: str | None,
+        matched_book_ids: Sequence[int] | None = None,
+    ) -> Select:
+        """Build base `list_books` statement with series join and optional search.
+
+        When ``matched_book_ids`` (from the full-text index) is given it
+        replaces the join-based evaluation of ``search_query``.
+        """
         series_alias = aliased(Series)
         stmt = (
             select(Book, series_alias.name.label("series_name"))  # type: ignore[attr-defined]
             .outerjoin(BookSeriesLink, Book.id == BookSeriesLink.book)
             .outerjoin(series_alias, BookSeriesLink.series == series_alias.id)
         )
+        if matched_book_ids is not None:
+            return stmt.where(self.book_id_in(matched_book_ids))
         return self._apply_search(
             stmt, series_alias=series_alias, search_query=search_query
         )
 
-    def build_count_stmt(self, *, search_query: str | None) -> SelectOfScalar:
-        """Build `count_books` statement with optional search."""
+    def build_count_stmt(
+        self,
+        *,
+        search_query: str | None,
+        matched_book_ids: Sequence[int] | None = None,
+    ) -> SelectOfScalar:
+        """Build `count_books` statement with optional search.
+
+        When ``matched_book_ids`` (from the full-text index) is given it
+        replaces the join-based evaluation of ``search_query``.
+        """
+        if matched_book_ids is not None:
+            return select(func.count(Book.id)).where(self.book_id_in(matched_book_ids))
         if not search_query:
             return select(func.count(Book.id))
 
@@ -186,6 +238,38 @@ class BookQueryBuilder:
             )
         )
 
+    @overload
+    def apply_visibility(
+        self, stmt: Select, visibility: BookVisibility | None
+    ) -> Select: ...
+
+    @overload
+    def apply_visibility(
+        self, stmt: SelectOfScalar, visibility: BookVisibility | None
+    ) -> SelectOfScalar: ...
+
+    def apply_visibility(
+        self,
+        stmt: Select | SelectOfScalar,
+        visibility: BookVisibility | None,
+    ) -> Select | SelectOfScalar:
+        """Restrict a statement over `Book` to the books a user may see."""
+        predicate = visibility.to_predicate() if visibility is not None else None
+        if predicate is None:
+            return stmt
+        return stmt.where(predicate)
+
+    def book_id_in(self, book_ids: Sequence[int]) -> ColumnElement[bool]:
+        """Build a ``Book.id IN (...)`` condition for any number of IDs.
+
+        The IDs are bound as a single JSON array expanded with ``json_each``
+        so large result sets do not hit SQLite's bound parameter limit.
+        """
+        ids = select(literal_column("value")).select_from(
+            func.json_each(json.dumps(list(book_ids)))
+        )
+        return Book.id.in_(ids)  # type: ignore[union-attr]
+
     def apply_ordering_and_pagination(
         self,
         stmt: Select,
@@ -204,6 +288,53 @@ class BookQueryBuilder:
             stmt = stmt.order_by(sort_field.asc())  # type: ignore[attr-defined]
         return stmt.limit(limit).offset(offset)
 
+    def apply_keyset_pagination(
+        self,
+        stmt: Select,
+        *,
+        sort_key: ColumnElement,
+        sort_order: str,
+        after: tuple[object, int] | None,
+        limit: int,
+    ) -> Select:
+        """Select ``(sort_key, Book.id)`` pages ordered by key then ID.
+
+        Parameters
+        ----------
+        stmt : Select
+            Filtered statement over `Book`.
+        sort_key : ColumnElement
+            Key from `get_keyset_sort_key`.
+        sort_order : str
+            ``'asc'`` or ``'desc'``; also applies to the ID tie-breaker.
+        after : tuple[object, int] | None
+            Exclusive cursor ``(sort_value, book_id)``.
+        limit : int
+            Maximum number of keys.
+
+        Returns
+        -------
+        Select
+            Statement returning ``(sort_value, book_id)`` rows.
+        """
+        stmt = stmt.with_only_columns(sort_key, Book.id).distinct()  # type: ignore[arg-type]
+        descending = sort_order == "desc"
+        if after is not None:
+            value, book_id = after
+            if descending:
+                stmt = stmt.where(
+                    or_(sort_key < value, and_(sort_key == value, Book.id < book_id))  # type: ignore[operator]
+                )
+            else:
+                stmt = stmt.where(
+                    or_(sort_key > value, and_(sort_key == value, Book.id > book_id))  # type: ignore[operator]
+                )
+        if descending:
+            stmt = stmt.order_by(sort_key.desc(), Book.id.desc())  # type: ignore[union-attr]
+        else:
+            stmt = stmt.order_by(sort_key.asc(), Book.id.asc())  # type: ignore[union-attr]
+        return stmt.limit(limit)
+
     def _apply_search(
         self, stmt: Select, *, series_alias: object, search_query: str | None
     ) -> Select:
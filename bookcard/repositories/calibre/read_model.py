@@ -0,0 +1,241 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Read model of enriched book details.
+
+Book lists, grids, OPDS feeds and Kobo sync enrich every page of books with
+tags, authors, identifiers, languages, publisher, rating, series and
+description, aggregated by one wide query and parsed from JSON per book.
+`BookReadModel` keeps the parsed details of each book in memory, keyed by
+the book's ``last_modified``, so repeated requests only query books that
+are new or changed.
+
+Repository writes invalidate the books they touch. When ``metadata.db``
+changes on disk (detected by size and modification time of the database
+and its write-ahead log, as for the search index), the library's
+`LibraryChangeDetector` works out which books changed and
+`notify_book_read_model` drops only those. Without change detection, every
+entry of the library is dropped, since external tools may change linked
+names without bumping ``last_modified``.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .change_detector import get_library_change_detector
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import datetime
+
+    from .change_detector import LibraryChange
+    from .enrichment import _FullDetails
+
+# Books whose details are kept in memory, per library
+READ_MODEL_SIZE = 10_000
+
+
+class BookReadModel:
+    """Thread-safe LRU cache of the enriched details of one library's books.
+
+    Caching is bypassed while ``metadata.db`` does not exist.
+
+    Parameters
+    ----------
+    calibre_db_file : Path
+        Calibre ``metadata.db`` of the library.
+    maxsize : int
+        Maximum number of cached books.
+    """
+
+    def __init__(self, calibre_db_file: Path, maxsize: int = READ_MODEL_SIZE) -> None:
+        self._calibre_db_file = calibre_db_file
+        self._maxsize = maxsize
+        self._entries: OrderedDict[int, tuple[datetime | None, _FullDetails]] = (
+            OrderedDict()
+        )
+        self._signature: str | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_many(
+        self, books: Mapping[int, datetime | None]
+    ) -> tuple[dict[int, _FullDetails], int | None]:
+        """Get the cached details of books.
+
+        Parameters
+        ----------
+        books : Mapping[int, datetime | None]
+            ``last_modified`` of each requested book, by book ID.
+
+        Returns
+        -------
+        tuple[dict[int, _FullDetails], int | None]
+            Copies of the cached details by book ID, and the generation to
+            pass to `put_many` (None if caching is bypassed).
+        """
+        signature = self._db_signature()
+        if signature is None:
+            return {}, None
+        if signature != self._signature:
+            self._sync_external_changes(signature)
+
+        with self._lock:
+            hits: dict[int, _FullDetails] = {}
+            for book_id, last_modified in books.items():
+                entry = self._entries.get(book_id)
+                if entry is None or entry[0] != last_modified:
+                    continue
+                self._entries.move_to_end(book_id)
+                hits[book_id] = entry[1]
+            generation = self._generation
+        return copy.deepcopy(hits), generation
+
+    def put_many(
+        self,
+        books: Mapping[int, datetime | None],
+        details: Mapping[int, _FullDetails],
+        generation: int | None,
+    ) -> None:
+        """Cache details fetched after a `get_many` call.
+
+        Nothing is cached if the library changed since that call, so
+        details read before a write never outlive it.
+
+        Parameters
+        ----------
+        books : Mapping[int, datetime | None]
+            ``last_modified`` of each fetched book, by book ID.
+        details : Mapping[int, _FullDetails]
+            Fetched details by book ID (stored as copies).
+        generation : int | None
+            Generation returned by `get_many`.
+        """
+        if generation is None:
+            return
+        details = copy.deepcopy(dict(details))
+        with self._lock:
+            if generation != self._generation:
+                return
+            for book_id, book_details in details.items():
+                self._entries[book_id] = (books.get(book_id), book_details)
+                self._entries.move_to_end(book_id)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, book_ids: Iterable[int]) -> None:
+        """Drop the cached details of books.
+
+        Parameters
+        ----------
+        book_ids : Iterable[int]
+            IDs of added, updated or deleted books.
+        """
+        with self._lock:
+            for book_id in book_ids:
+                self._entries.pop(book_id, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Drop every cached book."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def apply_change(self, change: LibraryChange) -> None:
+        """Drop the books affected by a change of the library.
+
+        Parameters
+        ----------
+        change : LibraryChange
+            Change detected in the library.
+        """
+        if change.full:
+            self.clear()
+        else:
+            self.invalidate(change.book_ids)
+
+    def _sync_external_changes(self, signature: str) -> None:
+        """Drop what changed on disk since the last recorded signature."""
+        detector = get_library_change_detector(self._calibre_db_file)
+        if detector is None:
+            self.clear()
+        else:
+            # Publishes the change to subscribers, `notify_book_read_model`
+            # among them (the first check only records the library's state)
+            detector.check()
+        with self._lock:
+            self._signature = signature
+
+    def _db_signature(self) -> str | None:
+        """Identify the on-disk state of ``metadata.db`` (None if missing)."""
+        parts = []
+        for path in (
+            self._calibre_db_file,
+            self._calibre_db_file.with_name(f"{self._calibre_db_file.name}-wal"),
+        ):
+            try:
+                stat = path.stat()
+            except OSError:
+                if path is self._calibre_db_file:
+                    return None
+                continue
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return "|".join(parts)
+
+
+_read_models: dict[Path, BookReadModel] = {}
+_read_models_lock = threading.Lock()
+
+
+def get_book_read_model(calibre_db_file: Path) -> BookReadModel:
+    """Get the process-wide read model of a library.
+
+    Parameters
+    ----------
+    calibre_db_file : Path
+        Calibre ``metadata.db`` of the library.
+
+    Returns
+    -------
+    BookReadModel
+        Read model shared by every repository of the library.
+    """
+    key = Path(calibre_db_file).resolve()
+    with _read_models_lock:
+        read_model = _read_models.get(key)
+        if read_model is None:
+            read_model = BookReadModel(key)
+            _read_models[key] = read_model
+        return read_model
+
+
+def notify_book_read_model(change: LibraryChange) -> None:
+    """Drop the books affected by an external change from its read model.
+
+    Parameters
+    ----------
+    change : LibraryChange
+        Change detected in the library.
+    """
+    with _read_models_lock:
+        read_model = _read_models.get(change.calibre_db_file)
+    if read_model is not None:
+        read_model.apply_change(change)
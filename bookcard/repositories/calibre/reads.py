@@ -20,7 +20,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, cast
 
-from sqlalchemy import func
+from sqlalchemy import String, and_, func, or_, type_coerce
 from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
@@ -37,9 +37,10 @@ from bookcard.repositories.models import BookWithFullRelations, BookWithRelation
 from bookcard.repositories.suggestions import FilterSuggestionFactory
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Sequence
     from pathlib import Path
 
+    from sqlalchemy.sql import Select
     from sqlmodel.sql.expression import SelectOfScalar
 
     from bookcard.repositories.interfaces import (
@@ -47,11 +48,13 @@ if TYPE_CHECKING:
         ILibraryStatisticsService,
         ISessionManager,
     )
+    from bookcard.repositories.visibility import BookVisibility
 
     from .enrichment import BookEnrichmentService
     from .pathing import BookPathService
     from .queries import BookQueryBuilder
     from .retry import SQLiteRetryPolicy
+    from .search_index import BookSearchIndex
     from .unwrapping import ResultUnwrapper
 
 logger = logging.getLogger(__name__)
@@ -72,6 +75,7 @@ class BookReadOperations:
         statistics_service: ILibraryStatisticsService,
         pathing: BookPathService,
         calibre_db_path: Path,
+        search_index: BookSearchIndex | None = None,
     ) -> None:
         self._session_manager: ISessionManager = session_manager
         self._retry: SQLiteRetryPolicy = retry_policy
@@ -82,6 +86,7 @@ class BookReadOperations:
         self._statistics_service = statistics_service
         self._pathing = pathing
         self._calibre_db_path = calibre_db_path
+        self._search_index = search_index
 
     def count_books(
         self,
@@ -90,6 +95,7 @@ class BookReadOperations:
         author_id: int | None = None,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> int:
         """Count total number of books, optionally filtered by search.
 
@@ -103,15 +109,20 @@ class BookReadOperations:
             Optional publication month filter.
         pubdate_day : int | None
             Optional publication day filter.
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
 
         Returns
         -------
         int
             Number of matching books.
         """
+        matched_book_ids = self._match_search(search_query)
 
         def _op(session: Session) -> int:
-            stmt = self._queries.build_count_stmt(search_query=search_query)
+            stmt = self._queries.build_count_stmt(
+                search_query=search_query, matched_book_ids=matched_book_ids
+            )
 
             if author_id is not None:
                 author_books_subquery = self._queries.build_author_books_subquery(
@@ -125,11 +136,12 @@ class BookReadOperations:
                 pubdate_month=pubdate_month,
                 pubdate_day=pubdate_day,
             )
+            stmt = self._queries.apply_visibility(stmt, visibility)
             result = session.exec(stmt).one()  # type: ignore[arg-type]
             return int(result) if result else 0
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="count_books",
         )
@@ -146,6 +158,7 @@ class BookReadOperations:
         full: bool = False,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> list[BookWithRelations | BookWithFullRelations]:
         """List books with pagination and optional search."""
         sort_field = self._queries.get_sort_field(sort_by)
@@ -153,12 +166,16 @@ class BookReadOperations:
         if normalized_sort_order not in {"asc", "desc"}:
             normalized_sort_order = "desc"
 
+        matched_book_ids = self._match_search(search_query)
+
         def _op(session: Session) -> list[BookWithRelations | BookWithFullRelations]:
             author_books_subquery = self._queries.build_author_books_subquery(
                 session, author_id
             )
 
-            stmt = self._queries.build_list_base_stmt(search_query=search_query)
+            stmt = self._queries.build_list_base_stmt(
+                search_query=search_query, matched_book_ids=matched_book_ids
+            )
             if author_books_subquery is not None:
                 stmt = stmt.where(Book.id.in_(author_books_subquery))  # type: ignore[arg-type]
 
@@ -167,6 +184,7 @@ class BookReadOperations:
                 pubdate_month=pubdate_month,
                 pubdate_day=pubdate_day,
             )
+            stmt = self._queries.apply_visibility(stmt, visibility)
 
             stmt = self._queries.apply_ordering_and_pagination(
                 stmt,
@@ -190,7 +208,7 @@ class BookReadOperations:
             return cast("list[BookWithRelations | BookWithFullRelations]", base_books)
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="list_books",
         )
@@ -212,6 +230,7 @@ class BookReadOperations:
         sort_by: str = "timestamp",
         sort_order: str = "desc",
         full: bool = False,
+        visibility: BookVisibility | None = None,
     ) -> list[BookWithRelations | BookWithFullRelations]:
         """List books with multiple filter criteria using OR conditions."""
         sort_field = self._queries.get_sort_field(sort_by)
@@ -238,6 +257,7 @@ class BookReadOperations:
                 .with_formats(formats)
                 .with_rating_ids(rating_ids)
                 .with_language_ids(language_ids)
+                .with_visibility(visibility)
                 .build()
             )
 
@@ -262,7 +282,7 @@ class BookReadOperations:
             return cast("list[BookWithRelations | BookWithFullRelations]", base_books)
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="list_books_with_filters",
         )
@@ -279,6 +299,7 @@ class BookReadOperations:
         formats: list[str] | None = None,
         rating_ids: list[int] | None = None,
         language_ids: list[int] | None = None,
+        visibility: BookVisibility | None = None,
     ) -> int:
         """Count books matching filter criteria."""
 
@@ -301,17 +322,151 @@ class BookReadOperations:
                 .with_formats(formats)
                 .with_rating_ids(rating_ids)
                 .with_language_ids(language_ids)
+                .with_visibility(visibility)
                 .build()
             )
             result = session.exec(stmt).one()  # type: ignore[arg-type]
             return int(result) if result else 0
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="count_books_with_filters",
         )
 
+    def list_book_sort_keys(
+        self,
+        *,
+        sort_by: str = "timestamp",
+        sort_order: str = "desc",
+        after: tuple[object, int] | None = None,
+        limit: int = 20,
+        search_query: str | None = None,
+        author_id: int | None = None,
+        pubdate_month: int | None = None,
+        pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
+    ) -> list[tuple[object, int]]:
+        """List ``(sort_value, book_id)`` keys of matching books in order.
+
+        Keyset-paginated counterpart of `list_books` that loads no book
+        data, used to merge listings across libraries.
+        """
+        matched_book_ids = self._match_search(search_query)
+
+        def _op(session: Session) -> list[tuple[object, int]]:
+            stmt = self._queries.build_list_base_stmt(
+                search_query=search_query, matched_book_ids=matched_book_ids
+            )
+            author_books_subquery = self._queries.build_author_books_subquery(
+                session, author_id
+            )
+            if author_books_subquery is not None:
+                stmt = stmt.where(Book.id.in_(author_books_subquery))  # type: ignore[arg-type]
+            stmt = self._queries.apply_pubdate_filter(
+                stmt,
+                pubdate_month=pubdate_month,
+                pubdate_day=pubdate_day,
+            )
+            stmt = self._queries.apply_visibility(stmt, visibility)
+            return self._fetch_sort_keys(
+                session,
+                stmt,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                after=after,
+                limit=limit,
+            )
+
+        return self._retry.run_read(
+            self._session_manager.get_read_session,
+            _op,
+            operation_name="list_book_sort_keys",
+        )
+
+    def list_book_sort_keys_with_filters(
+        self,
+        *,
+        sort_by: str = "timestamp",
+        sort_order: str = "desc",
+        after: tuple[object, int] | None = None,
+        limit: int = 20,
+        author_ids: list[int] | None = None,
+        title_ids: list[int] | None = None,
+        genre_ids: list[int] | None = None,
+        publisher_ids: list[int] | None = None,
+        identifier_ids: list[int] | None = None,
+        series_ids: list[int] | None = None,
+        formats: list[str] | None = None,
+        rating_ids: list[int] | None = None,
+        language_ids: list[int] | None = None,
+        visibility: BookVisibility | None = None,
+    ) -> list[tuple[object, int]]:
+        """List ``(sort_value, book_id)`` keys of filtered books in order.
+
+        Keyset-paginated counterpart of `list_books_with_filters`.
+        """
+
+        def _op(session: Session) -> list[tuple[object, int]]:
+            series_alias = aliased(Series)
+            base_stmt = (
+                select(Book.id)
+                .outerjoin(BookSeriesLink, Book.id == BookSeriesLink.book)
+                .outerjoin(series_alias, BookSeriesLink.series == series_alias.id)
+            )
+            stmt = (
+                FilterBuilder(base_stmt)  # type: ignore[arg-type]
+                .with_author_ids(author_ids)
+                .with_title_ids(title_ids)
+                .with_genre_ids(genre_ids)
+                .with_publisher_ids(publisher_ids)
+                .with_identifier_ids(identifier_ids)
+                .with_series_ids(series_ids, series_alias)
+                .with_formats(formats)
+                .with_rating_ids(rating_ids)
+                .with_language_ids(language_ids)
+                .with_visibility(visibility)
+                .build()
+            )
+            return self._fetch_sort_keys(
+                session,
+                stmt,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                after=after,
+                limit=limit,
+            )
+
+        return self._retry.run_read(
+            self._session_manager.get_read_session,
+            _op,
+            operation_name="list_book_sort_keys_with_filters",
+        )
+
+    def _fetch_sort_keys(
+        self,
+        session: Session,
+        stmt: Select,
+        *,
+        sort_by: str,
+        sort_order: str,
+        after: tuple[object, int] | None,
+        limit: int,
+    ) -> list[tuple[object, int]]:
+        normalized_sort_order = sort_order.lower()
+        if normalized_sort_order not in {"asc", "desc"}:
+            normalized_sort_order = "desc"
+        stmt = self._queries.apply_keyset_pagination(
+            stmt,
+            sort_key=self._queries.get_keyset_sort_key(sort_by),
+            sort_order=normalized_sort_order,
+            after=after,
+            limit=limit,
+        )
+        # execute() rather than exec(): a narrowed scalar select must still
+        # yield (value, id) rows
+        return [(row[0], int(row[1])) for row in session.execute(stmt).all()]
+
     def list_books_by_ids_query(
         self,
         book_ids_query: SelectOfScalar[int],
@@ -370,7 +525,7 @@ class BookReadOperations:
             return cast("list[BookWithRelations | BookWithFullRelations]", base_books)
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="list_books_by_ids_query",
         )
@@ -396,11 +551,101 @@ class BookReadOperations:
             return int(result) if result else 0
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="count_books_by_ids_query",
         )
 
+    def list_book_ids_by_query(self, book_ids_query: SelectOfScalar[int]) -> list[int]:
+        """List the book IDs returned by a query.
+
+        Parameters
+        ----------
+        book_ids_query : SelectOfScalar[int]
+            Statement returning `Book.id` values.
+
+        Returns
+        -------
+        list[int]
+            Matching book IDs.
+        """
+
+        def _op(session: Session) -> list[int]:
+            return [int(book_id) for book_id in session.exec(book_ids_query).all()]
+
+        return self._retry.run_read(
+            self._session_manager.get_read_session,
+            _op,
+            operation_name="list_book_ids_by_query",
+        )
+
+    def list_modified_book_keys(
+        self,
+        *,
+        after: tuple[str, int] | None = None,
+        formats: Sequence[str] | None = None,
+        book_ids: Collection[int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """List ``(last_modified, id)`` keys of books in modification order.
+
+        ``last_modified`` is compared and returned as stored text so that
+        keyset cursors round-trip exactly, independent of how the timestamp
+        was formatted by the writer (Calibre or this application).
+        """
+        if book_ids is not None and not book_ids:
+            return []
+
+        def _op(session: Session) -> list[tuple[str, int]]:
+            last_modified = type_coerce(Book.last_modified, String)
+            stmt = select(last_modified, Book.id)
+            if after is not None:
+                after_modified, after_id = after
+                stmt = stmt.where(
+                    or_(
+                        last_modified > after_modified,
+                        and_(last_modified == after_modified, Book.id > after_id),  # type: ignore[operator]
+                    )
+                )
+            if formats:
+                stmt = stmt.where(
+                    select(Data.id)
+                    .where(Data.book == Book.id)
+                    .where(func.upper(Data.format).in_([f.upper() for f in formats]))
+                    .exists()
+                )
+            if book_ids is not None:
+                stmt = stmt.where(Book.id.in_(list(book_ids)))  # type: ignore[union-attr]
+            stmt = stmt.order_by(last_modified, Book.id)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            return [(str(row[0]), int(row[1])) for row in session.exec(stmt).all()]
+
+        return self._retry.run_read(
+            self._session_manager.get_read_session,
+            _op,
+            operation_name="list_modified_book_keys",
+        )
+
+    def get_latest_modified_key(self) -> tuple[str, int] | None:
+        """Get the greatest ``(last_modified, id)`` key, as stored text."""
+
+        def _op(session: Session) -> tuple[str, int] | None:
+            last_modified = type_coerce(Book.last_modified, String)
+            stmt = (
+                select(last_modified, Book.id)
+                .order_by(last_modified.desc(), Book.id.desc())  # type: ignore[union-attr]
+                .limit(1)
+            )
+            row = session.exec(stmt).first()
+            return (str(row[0]), int(row[1])) if row is not None else None
+
+        return self._retry.run_read(
+            self._session_manager.get_read_session,
+            _op,
+            operation_name="get_latest_modified_key",
+        )
+
     def get_book(self, *, book_id: int) -> BookWithRelations | None:
         """Get a book by ID."""
 
@@ -436,7 +681,7 @@ class BookReadOperations:
             return base
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="get_book",
         )
@@ -473,7 +718,7 @@ class BookReadOperations:
             return enriched[0] if enriched else None
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="get_book_full",
         )
@@ -502,7 +747,7 @@ class BookReadOperations:
             )
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="search_suggestions",
         )
@@ -526,7 +771,7 @@ class BookReadOperations:
             return strategy.get_suggestions(session, query, limit)
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="filter_suggestions",
         )
@@ -538,11 +783,26 @@ class BookReadOperations:
             return self._statistics_service.get_statistics(session)
 
         return self._retry.run_read(
-            self._session_manager.get_session,
+            self._session_manager.get_read_session,
             _op,
             operation_name="get_library_stats",
         )
 
+    def _match_search(self, search_query: str | None) -> list[int] | None:
+        """Resolve a free-text search through the full-text index.
+
+        Returns None when there is nothing to search, the query is an exact
+        series filter, or the index cannot answer; callers then evaluate
+        ``search_query`` with the join-based query.
+        """
+        if (
+            not search_query
+            or self._search_index is None
+            or search_query.startswith('series:"=')
+        ):
+            return None
+        return self._search_index.search_book_ids(search_query)
+
     def _build_books_from_results(
         self, session: Session, results: Sequence[object]
     ) -> list[BookWithRelations]:
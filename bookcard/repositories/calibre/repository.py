@@ -25,6 +25,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.repositories.book_metadata_service import BookMetadataService
 from bookcard.repositories.book_relationship_manager import BookRelationshipManager
 from bookcard.repositories.book_search_service import BookSearchService
@@ -46,19 +47,24 @@ from .enrichment import BookEnrichmentService
 from .formats import BookFormatOperations
 from .pathing import BookPathService
 from .queries import BookQueryBuilder
+from .read_model import get_book_read_model
 from .reads import BookReadOperations
 from .retry import SQLiteRetryPolicy
+from .search_index import get_book_search_index
 from .unwrapping import ResultUnwrapper
 from .writes import BookWriteOperations
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Collection, Generator, Sequence
     from datetime import datetime
 
     from sqlmodel import Session
     from sqlmodel.sql.expression import SelectOfScalar
 
     from bookcard.repositories.models import BookWithFullRelations, BookWithRelations
+    from bookcard.repositories.visibility import BookVisibility
+
+    from .search_index import BookSearchIndex
 
 
 class CalibreBookRepository(IBookRepository):
@@ -82,6 +88,9 @@ class CalibreBookRepository(IBookRepository):
         Optional search service (creates default if None).
     statistics_service : ILibraryStatisticsService | None
         Optional statistics service (creates default if None).
+    search_index : BookSearchIndex | None
+        Optional full-text index (uses the library's configured index if
+        None; searches use join-based queries when there is none).
     """
 
     def __init__(
@@ -94,6 +103,7 @@ class CalibreBookRepository(IBookRepository):
         metadata_service: IBookMetadataService | None = None,
         search_service: IBookSearchService | None = None,
         statistics_service: ILibraryStatisticsService | None = None,
+        search_index: BookSearchIndex | None = None,
     ) -> None:
         self._calibre_db_path = Path(calibre_db_path)
         self._calibre_db_file = calibre_db_file
@@ -104,13 +114,21 @@ class CalibreBookRepository(IBookRepository):
         self._file_manager = file_manager or CalibreFileManager()
         self._relationship_manager = relationship_manager or BookRelationshipManager()
         self._metadata_service = metadata_service or BookMetadataService()
-        self._search_service = search_service or BookSearchService()
+        self._search_index = search_index or get_book_search_index(
+            self._calibre_db_path / calibre_db_file
+        )
+        self._search_service = search_service or BookSearchService(
+            search_index=self._search_index
+        )
         self._statistics_service = statistics_service or LibraryStatisticsService()
 
         self._retry = SQLiteRetryPolicy(max_retries=3)
         self._unwrapper = ResultUnwrapper()
         self._queries = BookQueryBuilder()
-        self._enrichment = BookEnrichmentService(calibre_db_path=self._calibre_db_path)
+        self._read_model = get_book_read_model(self._calibre_db_path / calibre_db_file)
+        self._enrichment = BookEnrichmentService(
+            calibre_db_path=self._calibre_db_path, read_model=self._read_model
+        )
         self._pathing = BookPathService()
 
         self._reads = BookReadOperations(
@@ -123,6 +141,7 @@ class CalibreBookRepository(IBookRepository):
             statistics_service=self._statistics_service,
             pathing=self._pathing,
             calibre_db_path=self._calibre_db_path,
+            search_index=self._search_index,
         )
         self._formats = BookFormatOperations(
             session_manager=self._session_manager,
@@ -135,6 +154,8 @@ class CalibreBookRepository(IBookRepository):
             session_manager=self._session_manager,
             retry_policy=self._retry,
             file_manager=self._file_manager,
+            search_index=self._search_index,
+            read_model=self._read_model,
         )
         self._writes = BookWriteOperations(
             session_manager=self._session_manager,
@@ -145,6 +166,8 @@ class CalibreBookRepository(IBookRepository):
             pathing=self._pathing,
             calibre_db_path=self._calibre_db_path,
             get_book_full=self.get_book_full,
+            search_index=self._search_index,
+            read_model=self._read_model,
         )
 
     def dispose(self) -> None:
@@ -181,6 +204,7 @@ class CalibreBookRepository(IBookRepository):
         author_id: int | None = None,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> int:
         """Count total number of books, optionally filtered by search."""
         return self._reads.count_books(
@@ -188,6 +212,7 @@ class CalibreBookRepository(IBookRepository):
             author_id=author_id,
             pubdate_month=pubdate_month,
             pubdate_day=pubdate_day,
+            visibility=visibility,
         )
 
     def list_books(
@@ -201,6 +226,7 @@ class CalibreBookRepository(IBookRepository):
         full: bool = False,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> list[BookWithRelations | BookWithFullRelations]:
         """List books with pagination and optional search."""
         return self._reads.list_books(
@@ -213,6 +239,7 @@ class CalibreBookRepository(IBookRepository):
             full=full,
             pubdate_month=pubdate_month,
             pubdate_day=pubdate_day,
+            visibility=visibility,
         )
 
     def list_books_with_filters(
@@ -231,6 +258,7 @@ class CalibreBookRepository(IBookRepository):
         sort_by: str = "timestamp",
         sort_order: str = "desc",
         full: bool = False,
+        visibility: BookVisibility | None = None,
     ) -> list[BookWithRelations | BookWithFullRelations]:
         """List books with multiple filter criteria using OR conditions."""
         return self._reads.list_books_with_filters(
@@ -248,6 +276,7 @@ class CalibreBookRepository(IBookRepository):
             sort_by=sort_by,
             sort_order=sort_order,
             full=full,
+            visibility=visibility,
         )
 
     def count_books_with_filters(
@@ -261,6 +290,7 @@ class CalibreBookRepository(IBookRepository):
         formats: list[str] | None = None,
         rating_ids: list[int] | None = None,
         language_ids: list[int] | None = None,
+        visibility: BookVisibility | None = None,
     ) -> int:
         """Count books matching filter criteria."""
         return self._reads.count_books_with_filters(
@@ -273,6 +303,7 @@ class CalibreBookRepository(IBookRepository):
             formats=formats,
             rating_ids=rating_ids,
             language_ids=language_ids,
+            visibility=visibility,
         )
 
     def list_books_by_ids_query(
@@ -299,6 +330,89 @@ class CalibreBookRepository(IBookRepository):
         """Count books whose IDs are returned by a query."""
         return self._reads.count_books_by_ids_query(book_ids_query)
 
+    def list_book_sort_keys(
+        self,
+        *,
+        sort_by: str = "timestamp",
+        sort_order: str = "desc",
+        after: tuple[object, int] | None = None,
+        limit: int = 20,
+        search_query: str | None = None,
+        author_id: int | None = None,
+        pubdate_month: int | None = None,
+        pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
+    ) -> list[tuple[object, int]]:
+        """List ``(sort_value, book_id)`` keys of matching books in order."""
+        return self._reads.list_book_sort_keys(
+            sort_by=sort_by,
+            sort_order=sort_order,
+            after=after,
+            limit=limit,
+            search_query=search_query,
+            author_id=author_id,
+            pubdate_month=pubdate_month,
+            pubdate_day=pubdate_day,
+            visibility=visibility,
+        )
+
+    def list_book_sort_keys_with_filters(
+        self,
+        *,
+        sort_by: str = "timestamp",
+        sort_order: str = "desc",
+        after: tuple[object, int] | None = None,
+        limit: int = 20,
+        author_ids: list[int] | None = None,
+        title_ids: list[int] | None = None,
+        genre_ids: list[int] | None = None,
+        publisher_ids: list[int] | None = None,
+        identifier_ids: list[int] | None = None,
+        series_ids: list[int] | None = None,
+        formats: list[str] | None = None,
+        rating_ids: list[int] | None = None,
+        language_ids: list[int] | None = None,
+        visibility: BookVisibility | None = None,
+    ) -> list[tuple[object, int]]:
+        """List ``(sort_value, book_id)`` keys of filtered books in order."""
+        return self._reads.list_book_sort_keys_with_filters(
+            sort_by=sort_by,
+            sort_order=sort_order,
+            after=after,
+            limit=limit,
+            author_ids=author_ids,
+            title_ids=title_ids,
+            genre_ids=genre_ids,
+            publisher_ids=publisher_ids,
+            identifier_ids=identifier_ids,
+            series_ids=series_ids,
+            formats=formats,
+            rating_ids=rating_ids,
+            language_ids=language_ids,
+            visibility=visibility,
+        )
+
+    def list_book_ids_by_query(self, book_ids_query: SelectOfScalar[int]) -> list[int]:
+        """List the book IDs returned by a query."""
+        return self._reads.list_book_ids_by_query(book_ids_query)
+
+    def list_modified_book_keys(
+        self,
+        *,
+        after: tuple[str, int] | None = None,
+        formats: Sequence[str] | None = None,
+        book_ids: Collection[int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """List ``(last_modified, id)`` keys of books in modification order."""
+        return self._reads.list_modified_book_keys(
+            after=after, formats=formats, book_ids=book_ids, limit=limit
+        )
+
+    def get_latest_modified_key(self) -> tuple[str, int] | None:
+        """Get the greatest ``(last_modified, id)`` key of the library."""
+        return self._reads.get_latest_modified_key()
+
     def get_book(self, book_id: int) -> BookWithRelations | None:
         """Get a book by ID."""
         return self._reads.get_book(book_id=book_id)
@@ -360,6 +474,7 @@ class CalibreBookRepository(IBookRepository):
         author_name: str | None = None,
         pubdate: datetime | None = None,
         library_path: Path | None = None,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> int:
         """Add a book directly to the Calibre database."""
         return self._writes.add_book(
@@ -369,6 +484,7 @@ class CalibreBookRepository(IBookRepository):
             author_name=author_name,
             pubdate=pubdate,
             library_path=library_path,
+            transfer_mode=transfer_mode,
         )
 
     def add_format(
@@ -377,6 +493,7 @@ class CalibreBookRepository(IBookRepository):
         file_path: Path,
         file_format: str,
         replace: bool = False,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """Add a format to an existing book."""
         self._formats.add_format(
@@ -384,6 +501,7 @@ class CalibreBookRepository(IBookRepository):
             file_path=file_path,
             file_format=file_format,
             replace=replace,
+            transfer_mode=transfer_mode,
         )
 
     def delete_format(
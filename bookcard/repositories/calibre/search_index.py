@@ -0,0 +1,630 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Full-text search index of a Calibre library.
+
+Library search used to run ``lower(col) LIKE '%q%'`` over an outer join of
+books, authors, tags and series, which no index can serve. `BookSearchIndex`
+keeps an SQLite FTS5 index of every book (title, authors, series, tags,
+publisher, identifiers and comments) plus the author, tag and series names
+in a sidecar database; Calibre's own schema is never modified.
+
+The index is brought up to date incrementally: books whose ``last_modified``
+moved past the indexed watermark are re-indexed when ``metadata.db`` changes
+on disk (checked at most every ``poll_interval`` seconds), and repository
+writes mark the books they touch so edits are searchable immediately. While
+the index is being built or cannot be brought up to date, lookups return
+None and callers fall back to the join-based search.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import html
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from .change_detector import LibraryChange
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 30.0
+
+# Larger external changes (e.g. a bulk edit in Calibre) are re-indexed in the
+# background while searches fall back to the join-based query.
+MAX_INLINE_SYNC = 500
+
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS book_fts USING fts5(
+    title, authors, series, tags, publisher, identifiers, comments,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS name_fts USING fts5(
+    name, kind UNINDEXED, entity_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+CREATE TABLE IF NOT EXISTS index_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# BM25 column weights, in ``book_fts`` column order
+_BM25 = "bm25(book_fts, 10.0, 5.0, 4.0, 3.0, 1.0, 2.0, 0.5)"
+
+_BOOK_DOCUMENTS_SQL = """
+SELECT
+    b.id,
+    b.title,
+    (SELECT group_concat(a.name, ' ') FROM books_authors_link l
+        JOIN authors a ON a.id = l.author WHERE l.book = b.id),
+    (SELECT group_concat(s.name, ' ') FROM books_series_link l
+        JOIN series s ON s.id = l.series WHERE l.book = b.id),
+    (SELECT group_concat(t.name, ' ') FROM books_tags_link l
+        JOIN tags t ON t.id = l.tag WHERE l.book = b.id),
+    (SELECT group_concat(p.name, ' ') FROM books_publishers_link l
+        JOIN publishers p ON p.id = l.publisher WHERE l.book = b.id),
+    (SELECT group_concat(i.val, ' ') FROM identifiers i WHERE i.book = b.id),
+    (SELECT c.text FROM comments c WHERE c.book = b.id)
+FROM books b
+"""
+
+# Suggestion kind -> Calibre table holding the names
+_NAME_TABLES = {"authors": "authors", "tags": "tags", "series": "series"}
+
+_TOKEN_RE = re.compile(r"\w+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def build_match_expression(query: str, column: str | None = None) -> str | None:
+    """Translate a user query into an FTS5 prefix query.
+
+    Every word of the query must match the start of a word in the document,
+    in any order. FTS5 syntax in the input is neutralized by quoting.
+
+    Parameters
+    ----------
+    query : str
+        Raw search query.
+    column : str | None
+        Restrict matching to this column.
+
+    Returns
+    -------
+    str | None
+        MATCH expression, or None if the query contains no words.
+    """
+    tokens = _TOKEN_RE.findall(query.lower())
+    if not tokens:
+        return None
+    terms = " ".join(f'"{token}"*' for token in tokens)
+    return f"{column} : ({terms})" if column else terms
+
+
+@contextlib.contextmanager
+def _open_read_only(db_file: Path) -> Iterator[sqlite3.Connection]:
+    """Open a Calibre database without write access."""
+    conn = sqlite3.connect(f"{db_file.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _plain_text(comment: str | None) -> str:
+    """Strip the HTML markup Calibre stores in comments."""
+    if not comment:
+        return ""
+    return html.unescape(_HTML_TAG_RE.sub(" ", comment))
+
+
+class BookSearchIndex:
+    """FTS5 sidecar index of one Calibre library.
+
+    Thread-safe. Lookups never block on a running build; they return None
+    instead so callers can use the join-based search.
+
+    Parameters
+    ----------
+    index_path : Path | str
+        Sidecar SQLite file, or ``":memory:"``.
+    calibre_db_file : Path
+        Calibre ``metadata.db`` to index (opened read-only).
+    poll_interval : float
+        Minimum seconds between checks of ``metadata.db`` for changes.
+    clock : Callable[[], float]
+        Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        index_path: Path | str,
+        calibre_db_file: Path,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._calibre_db_file = calibre_db_file
+        self._poll_interval = poll_interval
+        self._clock = clock
+        if str(index_path) != ":memory:":
+            Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(index_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: set[int] = set()
+        self._names_dirty = False
+        self._last_poll: float | None = None
+        self._build_thread: threading.Thread | None = None
+
+    @property
+    def is_built(self) -> bool:
+        """Whether a full build has completed."""
+        return self._get_state("watermark") is not None
+
+    def search_book_ids(self, query: str) -> list[int] | None:
+        """Get the IDs of books matching a query, best match first.
+
+        Parameters
+        ----------
+        query : str
+            Raw search query.
+
+        Returns
+        -------
+        list[int] | None
+            Matching book IDs ranked by BM25, or None if the index cannot
+            answer (not built, busy, stale, or no searchable words).
+        """
+        expression = build_match_expression(query)
+        if expression is None or not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if not self._ensure_fresh():
+                return None
+            rows = self._conn.execute(
+                f"SELECT rowid FROM book_fts WHERE book_fts MATCH ? ORDER BY {_BM25}",  # noqa: S608
+                (expression,),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Book search index query failed: %s", e)
+            return None
+        finally:
+            self._lock.release()
+        return [book_id for (book_id,) in rows]
+
+    def suggest(
+        self, query: str, limits: dict[str, int]
+    ) -> dict[str, list[dict[str, str | int]]] | None:
+        """Get ranked prefix matches for search-as-you-type suggestions.
+
+        Parameters
+        ----------
+        query : str
+            Raw search query.
+        limits : dict[str, int]
+            Maximum matches per kind: ``books``, ``authors``, ``tags`` and
+            ``series``.
+
+        Returns
+        -------
+        dict[str, list[dict[str, str | int]]] | None
+            Matches per kind with ``id`` and ``name`` fields, or None if the
+            index cannot answer.
+        """
+        if build_match_expression(query) is None or not self._lock.acquire(
+            blocking=False
+        ):
+            return None
+        try:
+            if not self._ensure_fresh():
+                return None
+            return {
+                kind: self._suggest_kind(kind, query, limit)
+                for kind, limit in limits.items()
+            }
+        except sqlite3.Error as e:
+            logger.warning("Book search index query failed: %s", e)
+            return None
+        finally:
+            self._lock.release()
+
+    def mark_changed(self, book_ids: Iterable[int]) -> None:
+        """Queue books for re-indexing before the next lookup.
+
+        Called by repository writes; books that no longer exist are removed
+        from the index.
+
+        Parameters
+        ----------
+        book_ids : Iterable[int]
+            IDs of added, updated or deleted books.
+        """
+        with self._pending_lock:
+            self._pending.update(book_ids)
+            self._names_dirty = True
+
+    def rebuild(self) -> None:
+        """Index the whole library from scratch.
+
+        Raises
+        ------
+        sqlite3.Error
+            If the Calibre database or the index cannot be accessed.
+        """
+        with self._lock, self._open_calibre() as calibre:
+            signature = self._db_signature()
+            self._conn.execute("DELETE FROM book_fts")
+            cursor = calibre.execute(_BOOK_DOCUMENTS_SQL)
+            while rows := cursor.fetchmany(_BATCH_SIZE):
+                self._insert_documents(rows)
+            for kind in _NAME_TABLES:
+                self._reindex_names(calibre, kind)
+            self._set_state("watermark", self._max_last_modified(calibre))
+            self._set_state("signature", signature)
+            self._conn.commit()
+            self._last_poll = self._clock()
+        logger.info("Built search index for %s", self._calibre_db_file)
+
+    def start_rebuild(self) -> None:
+        """Start a full build in a background thread, unless one is running."""
+        if self._build_thread is not None and self._build_thread.is_alive():
+            return
+        self._build_thread = threading.Thread(
+            target=self._rebuild_in_background,
+            name="book-search-index",
+            daemon=True,
+        )
+        self._build_thread.start()
+
+    def close(self) -> None:
+        """Close the index database."""
+        with self._lock:
+            self._conn.close()
+
+    def _rebuild_in_background(self) -> None:
+        try:
+            self.rebuild()
+        except sqlite3.Error:
+            logger.exception(
+                "Failed to build search index for %s", self._calibre_db_file
+            )
+
+    def _ensure_fresh(self) -> bool:
+        """Apply pending and external changes (lock held).
+
+        Returns
+        -------
+        bool
+            True if the index reflects the library.
+        """
+        if not self.is_built:
+            self.start_rebuild()
+            return False
+
+        now = self._clock()
+        poll_due = (
+            self._last_poll is None or now - self._last_poll >= self._poll_interval
+        )
+        with self._pending_lock:
+            pending, self._pending = self._pending, set()
+            names_dirty, self._names_dirty = self._names_dirty, False
+        if not (poll_due or pending or names_dirty):
+            return True
+
+        try:
+            with self._open_calibre() as calibre:
+                if poll_due:
+                    self._last_poll = now
+                    external = self._poll_external_changes(calibre)
+                    if external is None:
+                        self.start_rebuild()
+                        return False
+                    pending |= external
+                    names_dirty = names_dirty or bool(external)
+                self._reindex_books(calibre, pending)
+                if names_dirty:
+                    for kind in _NAME_TABLES:
+                        self._reindex_names(calibre, kind)
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Failed to update search index: %s", e)
+            self._conn.rollback()
+            self.mark_changed(pending)
+            return False
+        return True
+
+    def _poll_external_changes(self, calibre: sqlite3.Connection) -> set[int] | None:
+        """Find books changed in ``metadata.db`` since the last sync.
+
+        Returns
+        -------
+        set[int] | None
+            IDs to re-index, or None if there are too many to do inline.
+        """
+        signature = self._db_signature()
+        if signature == self._get_state("signature"):
+            return set()
+
+        watermark = self._get_state("watermark") or ""
+        rows = calibre.execute(
+            "SELECT id FROM books WHERE last_modified >= ? LIMIT ?",
+            (watermark, MAX_INLINE_SYNC + 1),
+        ).fetchall()
+        if len(rows) > MAX_INLINE_SYNC:
+            return None
+        changed = {book_id for (book_id,) in rows}
+
+        (indexed_count,) = self._conn.execute(
+            "SELECT count(*) FROM book_fts"
+        ).fetchone()
+        (library_count,) = calibre.execute("SELECT count(*) FROM books").fetchone()
+        if indexed_count != library_count:
+            # Deleted books do not bump any last_modified
+            indexed = {r for (r,) in self._conn.execute("SELECT rowid FROM book_fts")}
+            existing = {r for (r,) in calibre.execute("SELECT id FROM books")}
+            changed |= indexed - existing
+
+        self._set_state("watermark", self._max_last_modified(calibre))
+        self._set_state("signature", signature)
+        return changed
+
+    def _reindex_books(self, calibre: sqlite3.Connection, book_ids: set[int]) -> None:
+        if not book_ids:
+            return
+        ids = sorted(book_ids)
+        for start in range(0, len(ids), _BATCH_SIZE):
+            batch = ids[start : start + _BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            self._conn.execute(
+                f"DELETE FROM book_fts WHERE rowid IN ({placeholders})",  # noqa: S608
+                batch,
+            )
+            rows = calibre.execute(
+                f"{_BOOK_DOCUMENTS_SQL} WHERE b.id IN ({placeholders})",
+                batch,
+            ).fetchall()
+            self._insert_documents(rows)
+
+    def _insert_documents(self, rows: list[tuple]) -> None:
+        self._conn.executemany(
+            "INSERT INTO book_fts (rowid, title, authors, series, tags, publisher, "
+            "identifiers, comments) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(*row[:7], _plain_text(row[7])) for row in rows],
+        )
+
+    def _reindex_names(self, calibre: sqlite3.Connection, kind: str) -> None:
+        """Re-index one kind of names if its table changed."""
+        table = _NAME_TABLES[kind]
+        fingerprint = calibre.execute(
+            f"SELECT count(*), max(id), sum(length(name)) FROM {table}"  # noqa: S608
+        ).fetchone()
+        key = f"names:{kind}"
+        if repr(fingerprint) == self._get_state(key):
+            return
+        self._conn.execute("DELETE FROM name_fts WHERE kind = ?", (kind,))
+        self._conn.executemany(
+            "INSERT INTO name_fts (name, kind, entity_id) VALUES (?, ?, ?)",
+            (
+                (name, kind, entity_id)
+                for entity_id, name in calibre.execute(
+                    f"SELECT id, name FROM {table}"  # noqa: S608
+                )
+            ),
+        )
+        self._set_state(key, repr(fingerprint))
+
+    def _suggest_kind(
+        self, kind: str, query: str, limit: int
+    ) -> list[dict[str, str | int]]:
+        if limit <= 0:
+            return []
+        if kind == "books":
+            rows = self._conn.execute(
+                "SELECT rowid, title FROM book_fts WHERE book_fts MATCH ? "
+                "ORDER BY rank LIMIT ?",
+                (build_match_expression(query, "title"), limit),
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                "SELECT entity_id, name FROM name_fts "
+                "WHERE name_fts MATCH ? AND kind = ? ORDER BY rank LIMIT ?",
+                (build_match_expression(query, "name"), kind, limit),
+            ).fetchall()
+        return [{"id": entity_id, "name": name} for entity_id, name in rows]
+
+    def _open_calibre(self) -> contextlib.AbstractContextManager[sqlite3.Connection]:
+        return _open_read_only(self._calibre_db_file)
+
+    def _db_signature(self) -> str:
+        """Identify the current on-disk state of ``metadata.db``."""
+        parts = []
+        for path in (
+            self._calibre_db_file,
+            self._calibre_db_file.with_name(f"{self._calibre_db_file.name}-wal"),
+        ):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return "|".join(parts)
+
+    @staticmethod
+    def _max_last_modified(calibre: sqlite3.Connection) -> str:
+        (value,) = calibre.execute("SELECT max(last_modified) FROM books").fetchone()
+        return str(value or "")
+
+    def _get_state(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT value FROM index_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO index_state (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+
+class BookSearchIndexRegistry:
+    """Search indexes of all libraries, stored in one directory.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory holding one sidecar index file per library.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._indexes: dict[Path, BookSearchIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, calibre_db_file: Path) -> BookSearchIndex:
+        """Get the index of a library, creating it on first use.
+
+        Parameters
+        ----------
+        calibre_db_file : Path
+            Calibre ``metadata.db`` of the library.
+
+        Returns
+        -------
+        BookSearchIndex
+            Index of the library (possibly not built yet).
+        """
+        key = calibre_db_file.resolve()
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                digest = hashlib.sha256(str(key).encode("utf-8")).hexdigest()[:16]
+                index = BookSearchIndex(self._directory / f"{digest}.sqlite", key)
+                self._indexes[key] = index
+        return index
+
+    def find(self, calibre_db_file: Path) -> BookSearchIndex | None:
+        """Get the index of a library if it has been opened.
+
+        Parameters
+        ----------
+        calibre_db_file : Path
+            Calibre ``metadata.db`` of the library.
+
+        Returns
+        -------
+        BookSearchIndex | None
+            Open index of the library, or None.
+        """
+        with self._lock:
+            return self._indexes.get(calibre_db_file.resolve())
+
+    def close(self) -> None:
+        """Close every index."""
+        with self._lock:
+            for index in self._indexes.values():
+                index.close()
+            self._indexes.clear()
+
+
+_registry: BookSearchIndexRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def configure_book_search_indexes(directory: Path | str) -> BookSearchIndexRegistry:
+    """Enable full-text search with indexes stored in ``directory``.
+
+    Replaces (and closes) any previously configured registry.
+
+    Parameters
+    ----------
+    directory : Path | str
+        Directory holding the sidecar index files.
+
+    Returns
+    -------
+    BookSearchIndexRegistry
+        Newly installed registry.
+    """
+    global _registry
+    registry = BookSearchIndexRegistry(Path(directory))
+    with _registry_lock:
+        previous, _registry = _registry, registry
+    if previous is not None:
+        previous.close()
+    return registry
+
+
+def get_book_search_index(calibre_db_file: Path) -> BookSearchIndex | None:
+    """Get the search index of a library.
+
+    Parameters
+    ----------
+    calibre_db_file : Path
+        Calibre ``metadata.db`` of the library.
+
+    Returns
+    -------
+    BookSearchIndex | None
+        Index of the library, or None if full-text search is not configured
+        (or its index cannot be opened).
+    """
+    with _registry_lock:
+        registry = _registry
+    if registry is None:
+        return None
+    try:
+        return registry.get(calibre_db_file)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Cannot open search index for %s: %s", calibre_db_file, e)
+        return None
+
+
+def notify_book_search_index(change: LibraryChange) -> None:
+    """Bring the search index of a library in line with an external change.
+
+    Changed books are re-indexed before the next search; changes of names
+    shared by many books rebuild the index.
+
+    Parameters
+    ----------
+    change : LibraryChange
+        Change detected in the library.
+    """
+    with _registry_lock:
+        registry = _registry
+    index = registry.find(change.calibre_db_file) if registry is not None else None
+    if index is None:
+        return
+    if change.full:
+        index.start_rebuild()
+    else:
+        index.mark_changed(change.book_ids)
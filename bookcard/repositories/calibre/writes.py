@@ -24,6 +24,7 @@ from uuid import uuid4
 
 from sqlmodel import Session, select
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.core import (
     Author,
     Book,
@@ -47,7 +48,9 @@ if TYPE_CHECKING:
     from bookcard.services.book_metadata import BookMetadata
 
     from .pathing import BookPathService
+    from .read_model import BookReadModel
     from .retry import SQLiteRetryPolicy
+    from .search_index import BookSearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +69,8 @@ class BookWriteOperations:
         pathing: BookPathService,
         calibre_db_path: Path,
         get_book_full: Callable[[int], BookWithFullRelations | None],
+        search_index: BookSearchIndex | None = None,
+        read_model: BookReadModel | None = None,
     ) -> None:
         self._session_manager = session_manager
         self._retry = retry_policy
@@ -75,6 +80,8 @@ class BookWriteOperations:
         self._pathing = pathing
         self._calibre_db_path = calibre_db_path
         self._get_book_full = get_book_full
+        self._search_index = search_index
+        self._read_model = read_model
 
     def add_book(
         self,
@@ -85,6 +92,7 @@ class BookWriteOperations:
         author_name: str | None = None,
         pubdate: datetime | None = None,
         library_path: Path | None = None,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> int:
         """Add a book directly to the Calibre database.
 
@@ -102,6 +110,8 @@ class BookWriteOperations:
             Optional pubdate override.
         library_path : Path | None
             Optional library root path override.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY).
 
         Returns
         -------
@@ -156,9 +166,11 @@ class BookWriteOperations:
                 title_dir=title_dir,
                 file_format=file_format,
                 cover_data=cover_data,
+                transfer_mode=transfer_mode,
             )
 
             self._retry.commit(session)
+            self._mark_changed(book_id)
             return book_id
 
     def update_book(
@@ -247,10 +259,18 @@ class BookWriteOperations:
 
             self._retry.commit(session)
             session.refresh(book)
+        self._mark_changed(book_id)
 
         # Read back in a fresh session (simpler, consistent with existing code)
         return self._get_book_full(book_id)
 
+    def _mark_changed(self, book_id: int) -> None:
+        """Have the search index and read model pick up a written book."""
+        if self._search_index is not None:
+            self._search_index.mark_changed([book_id])
+        if self._read_model is not None:
+            self._read_model.invalidate([book_id])
+
     def _update_book_relationships(
         self,
         *,
@@ -443,9 +463,15 @@ class BookWriteOperations:
         title_dir: str,
         file_format: str,
         cover_data: bytes | None,
+        transfer_mode: TransferMode,
     ) -> None:
         self._file_manager.save_book_file(
-            file_path, library_path, book_path_str, title_dir, file_format
+            file_path,
+            library_path,
+            book_path_str,
+            title_dir,
+            file_format,
+            transfer_mode,
         )
         if cover_data:
             cover_saved = self._file_manager.save_book_cover(
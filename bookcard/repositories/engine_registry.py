@@ -0,0 +1,387 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Process-wide registry of Calibre database engines.
+
+Every `CalibreSessionManager` used to create its own SQLAlchemy engine, so each
+request that built a repository paid for engine creation, pragma setup and
+function registration before running a single query. This module keeps one
+pair of pooled engines (read-write and read-only) per Calibre library and
+shares them across requests, background tasks and libraries.
+
+Engines are keyed by the resolved ``metadata.db`` path. The file identity
+(device and inode) is recorded alongside each entry so that a database that
+was replaced on disk (e.g. restored from backup) gets a fresh engine instead
+of pooled connections pointing at the old file.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlmodel import create_engine
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from sqlalchemy import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 5
+DEFAULT_MAX_LIBRARIES = 16
+DEFAULT_IDLE_TIMEOUT_SECONDS = 600.0
+
+
+def get_calibre_sqlite_functions() -> list[tuple[str, int, Callable[..., object]]]:
+    """Get list of SQLite functions to register for Calibre database.
+
+    Returns
+    -------
+    list[tuple[str, int, Callable[..., object]]]
+        List of tuples containing (function_name, num_args, function_impl).
+        Each tuple defines a SQLite function to register.
+
+    Notes
+    -----
+    To add a new function, simply add a tuple to this list:
+    - function_name: Name of the SQL function (e.g., "my_function")
+    - num_args: Number of arguments the function accepts (-1 for variable)
+    - function_impl: Python callable that implements the function
+    """
+    return [
+        (
+            "title_sort",
+            1,
+            lambda x: x or "",
+        ),
+        (
+            "uuid4",
+            0,
+            lambda: str(uuid4()),
+        ),
+    ]
+
+
+@dataclass(slots=True)
+class EngineRegistryStats:
+    """Counters describing engine and connection reuse.
+
+    Attributes
+    ----------
+    engine_hits : int
+        Number of engine lookups served by an existing engine.
+    engine_misses : int
+        Number of engine lookups that had to create a new engine.
+    evictions : int
+        Number of library entries disposed (idle, LRU or replaced file).
+    checkouts : int
+        Number of connections checked out of the pools.
+    connections_opened : int
+        Number of new DBAPI connections opened by the pools.
+    """
+
+    engine_hits: int = 0
+    engine_misses: int = 0
+    evictions: int = 0
+    checkouts: int = 0
+    connections_opened: int = 0
+
+    @property
+    def pool_hits(self) -> int:
+        """Number of checkouts served by an already-open pooled connection."""
+        return max(0, self.checkouts - self.connections_opened)
+
+    @property
+    def pool_misses(self) -> int:
+        """Number of checkouts that required opening a new connection."""
+        return self.connections_opened
+
+
+@dataclass(slots=True)
+class _LibraryEngines:
+    """Engines and bookkeeping for a single Calibre database file."""
+
+    file_id: tuple[int, int] | None
+    write_engine: Engine
+    read_engine: Engine
+    last_used: float = field(default_factory=time.monotonic)
+
+    def dispose(self) -> None:
+        """Close all pooled connections of both engines."""
+        self.write_engine.dispose(close=True)
+        self.read_engine.dispose(close=True)
+
+
+class CalibreEngineRegistry:
+    """Shares pooled SQLAlchemy engines per Calibre database file.
+
+    Each library gets a read-write engine (WAL, busy timeout, Calibre SQL
+    functions) and a read-only engine (``PRAGMA query_only``) for read paths.
+    Both use a bounded connection pool. Libraries that have not been used for
+    ``idle_timeout`` seconds, or that fall out of the ``max_libraries`` LRU
+    window, are disposed.
+
+    Parameters
+    ----------
+    pool_size : int
+        Number of connections kept open per engine.
+    max_overflow : int
+        Additional connections allowed per engine under burst load.
+    max_libraries : int
+        Maximum number of libraries kept warm at the same time.
+    idle_timeout : float
+        Seconds after which an unused library's engines are disposed.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        max_libraries: int = DEFAULT_MAX_LIBRARIES,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._max_libraries = max_libraries
+        self._idle_timeout = idle_timeout
+        self._entries: OrderedDict[str, _LibraryEngines] = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = EngineRegistryStats()
+
+    def get_engine(self, db_path: Path, *, read_only: bool = False) -> Engine:
+        """Get the shared engine for a Calibre database file.
+
+        Parameters
+        ----------
+        db_path : Path
+            Path to the Calibre ``metadata.db`` file.
+        read_only : bool
+            Whether to return the read-only engine.
+
+        Returns
+        -------
+        Engine
+            Pooled SQLAlchemy engine.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the database file does not exist.
+        """
+        if not db_path.exists():
+            msg = f"Calibre database not found at {db_path}"
+            raise FileNotFoundError(msg)
+        key = str(db_path.resolve())
+        try:
+            st = db_path.stat()
+        except OSError:
+            file_id = None
+        else:
+            file_id = (st.st_dev, st.st_ino)
+
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is not None and entry.file_id != file_id:
+                logger.info("Calibre database replaced on disk, recycling: %s", key)
+                self._evict(key)
+                entry = None
+
+            if entry is None:
+                self._stats.engine_misses += 1
+                entry = _LibraryEngines(
+                    file_id=file_id,
+                    write_engine=self._create_engine(key, read_only=False),
+                    read_engine=self._create_engine(key, read_only=True),
+                )
+                self._entries[key] = entry
+            else:
+                self._stats.engine_hits += 1
+                self._entries.move_to_end(key)
+
+            entry.last_used = now
+            self._evict_stale(now, keep=key)
+            return entry.read_engine if read_only else entry.write_engine
+
+    def dispose(self, db_path: Path) -> None:
+        """Dispose the engines of a single library.
+
+        The next lookup for the same path creates fresh engines.
+
+        Parameters
+        ----------
+        db_path : Path
+            Path to the Calibre ``metadata.db`` file.
+        """
+        key = str(db_path.resolve())
+        with self._lock:
+            self._evict(key)
+
+    def dispose_all(self) -> None:
+        """Dispose the engines of every registered library."""
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key)
+
+    def stats(self) -> EngineRegistryStats:
+        """Return a snapshot of the registry counters.
+
+        Returns
+        -------
+        EngineRegistryStats
+            Copy of the current counters.
+        """
+        with self._lock:
+            return EngineRegistryStats(
+                engine_hits=self._stats.engine_hits,
+                engine_misses=self._stats.engine_misses,
+                evictions=self._stats.evictions,
+                checkouts=self._stats.checkouts,
+                connections_opened=self._stats.connections_opened,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of libraries currently registered."""
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self, key: str) -> None:
+        """Remove and dispose an entry. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        entry.dispose()
+        self._stats.evictions += 1
+        logger.debug("Disposed Calibre engines for %s", key)
+
+    def _evict_stale(self, now: float, *, keep: str) -> None:
+        """Evict idle and over-capacity entries. Caller must hold the lock."""
+        for key, entry in list(self._entries.items()):
+            if key != keep and now - entry.last_used > self._idle_timeout:
+                self._evict(key)
+        while len(self._entries) > self._max_libraries:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._evict(oldest)
+
+    def _create_engine(self, db_path: str, *, read_only: bool) -> Engine:
+        """Create a pooled engine for a Calibre database file.
+
+        Parameters
+        ----------
+        db_path : str
+            Resolved path to the Calibre database file.
+        read_only : bool
+            Whether connections should reject writes.
+
+        Returns
+        -------
+        Engine
+            Configured SQLAlchemy engine.
+        """
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            echo=False,
+            future=True,
+            connect_args={
+                "timeout": 30.0,
+                "check_same_thread": False,
+            },
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            pool_pre_ping=True,
+        )
+
+        def _configure_sqlite_connection(
+            dbapi_conn: sqlite3.Connection, connection_record: object
+        ) -> None:
+            """Configure SQLite connection for Calibre database.
+
+            This applies SQLite pragmas that improve concurrency and registers
+            Calibre-specific SQLite functions required by Calibre triggers.
+
+            Parameters
+            ----------
+            dbapi_conn : sqlite3.Connection
+                SQLite database connection.
+            connection_record : object
+                Connection record (required by event listener signature).
+            """
+            # connection_record is required by event listener signature but unused
+            _ = connection_record
+
+            cursor = dbapi_conn.cursor()
+            try:
+                if read_only:
+                    # Reject writes on connections handed out to read paths
+                    cursor.execute("PRAGMA query_only=ON")
+                else:
+                    # Enable WAL mode (Write-Ahead Logging) for better concurrency
+                    cursor.execute("PRAGMA journal_mode=WAL")
+                # Wait up to 30 seconds if the database is busy/locked
+                cursor.execute("PRAGMA busy_timeout=30000")
+            finally:
+                cursor.close()
+
+            # Register each function (create_function is idempotent)
+            for func_name, num_args, func_impl in get_calibre_sqlite_functions():
+                dbapi_conn.create_function(func_name, num_args, func_impl)  # type: ignore[invalid-argument-type]
+
+            with self._lock:
+                self._stats.connections_opened += 1
+
+        def _count_checkout(*_args: object) -> None:
+            with self._lock:
+                self._stats.checkouts += 1
+
+        event.listen(engine, "connect", _configure_sqlite_connection)
+        event.listen(engine, "checkout", _count_checkout)
+        return engine
+
+
+# Global registry instance
+_registry: CalibreEngineRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_calibre_engine_registry() -> CalibreEngineRegistry:
+    """Get the process-wide Calibre engine registry.
+
+    Returns
+    -------
+    CalibreEngineRegistry
+        Global registry instance.
+    """
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            registry = _registry
+            if registry is None:
+                registry = _registry = CalibreEngineRegistry()
+    return registry
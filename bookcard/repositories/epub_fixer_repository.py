@@ -15,15 +15,27 @@
 
 """Repository layer for EPUB fixer persistence operations.
 
-Provides data access for EPUB fix runs and individual fixes.
+Provides data access for EPUB fix runs, individual fixes and the
+fingerprints of already checked files.
 """
 
-from sqlalchemy import desc, func
-from sqlmodel import Session, select
+from collections.abc import Iterable
+from datetime import UTC, datetime
 
-from bookcard.models.epub_fixer import EPUBFix, EPUBFixRun, EPUBFixType
+from sqlalchemy import desc, func
+from sqlmodel import Session, col, select
+
+from bookcard.models.epub_fixer import (
+    EPUBFileFingerprint,
+    EPUBFix,
+    EPUBFixRun,
+    EPUBFixType,
+)
 from bookcard.repositories.base import Repository
 
+# Maximum number of bound parameters in one IN (...) clause
+_PATH_CHUNK_SIZE = 500
+
 
 class EPUBFixRunRepository(Repository[EPUBFixRun]):
     """Repository for EPUBFixRun entities.
@@ -393,3 +405,77 @@ class EPUBFixRepository(Repository[EPUBFix]):
             stmt = stmt.where(EPUBFix.fix_type == fix_type)
         stmt = stmt.order_by(desc(EPUBFix.applied_at)).limit(limit)  # type: ignore[invalid-argument-type]
         return list(self._session.exec(stmt).all())
+
+
+class EPUBFileFingerprintRepository(Repository[EPUBFileFingerprint]):
+    """Repository for EPUBFileFingerprint entities.
+
+    Provides bulk lookups and upserts of the fingerprints recorded by the
+    daily EPUB fix scan.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize EPUB file fingerprint repository.
+
+        Parameters
+        ----------
+        session : Session
+            Active SQLModel session.
+        """
+        super().__init__(session, EPUBFileFingerprint)
+
+    def get_by_paths(self, file_paths: Iterable[str]) -> dict[str, EPUBFileFingerprint]:
+        """Get the fingerprints of several files.
+
+        Parameters
+        ----------
+        file_paths : Iterable[str]
+            EPUB file paths.
+
+        Returns
+        -------
+        dict[str, EPUBFileFingerprint]
+            Fingerprints keyed by file path; files without a fingerprint
+            are absent.
+        """
+        paths = list(dict.fromkeys(file_paths))
+        fingerprints: dict[str, EPUBFileFingerprint] = {}
+        for start in range(0, len(paths), _PATH_CHUNK_SIZE):
+            stmt = select(EPUBFileFingerprint).where(
+                col(EPUBFileFingerprint.file_path).in_(
+                    paths[start : start + _PATH_CHUNK_SIZE]
+                )
+            )
+            for fingerprint in self._session.exec(stmt).all():
+                fingerprints[fingerprint.file_path] = fingerprint
+        return fingerprints
+
+    def upsert_many(
+        self,
+        entries: Iterable[tuple[str, int, int]],
+        fixer_hash: str,
+    ) -> None:
+        """Record the fingerprints of checked files.
+
+        Existing fingerprints are updated in place; changes are not
+        committed.
+
+        Parameters
+        ----------
+        entries : Iterable[tuple[str, int, int]]
+            ``(file_path, size, mtime_ns)`` of each checked file.
+        fixer_hash : str
+            Hash of the fixer version and settings the files were checked with.
+        """
+        latest = {path: (size, mtime_ns) for path, size, mtime_ns in entries}
+        if not latest:
+            return
+        existing = self.get_by_paths(latest)
+        checked_at = datetime.now(UTC)
+        for path, (size, mtime_ns) in latest.items():
+            fingerprint = existing.get(path) or EPUBFileFingerprint(file_path=path)
+            fingerprint.size = size
+            fingerprint.mtime_ns = mtime_ns
+            fingerprint.fixer_hash = fixer_hash
+            fingerprint.checked_at = checked_at
+            self._session.add(fingerprint)
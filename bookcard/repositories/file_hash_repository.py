@@ -0,0 +1,149 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Repository layer for the book file content-hash index."""
+
+from sqlmodel import Session, select
+
+from bookcard.models.file_hash import BookFileHash
+from bookcard.repositories.base import Repository
+
+
+class BookFileHashRepository(Repository[BookFileHash]):
+    """Repository for BookFileHash entities."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize book file hash repository.
+
+        Parameters
+        ----------
+        session : Session
+            Active SQLModel session.
+        """
+        super().__init__(session, BookFileHash)
+
+    def get_for_format(
+        self, library_id: int, book_id: int, file_format: str
+    ) -> BookFileHash | None:
+        """Get the hash record of one book format.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        book_id : int
+            Calibre book ID.
+        file_format : str
+            Upper-case format name.
+
+        Returns
+        -------
+        BookFileHash | None
+            Hash record if indexed, None otherwise.
+        """
+        stmt = select(BookFileHash).where(
+            BookFileHash.library_id == library_id,
+            BookFileHash.book_id == book_id,
+            BookFileHash.format == file_format,
+        )
+        return self._session.exec(stmt).first()
+
+    def find_by_size(
+        self, library_id: int, file_format: str, file_size: int
+    ) -> list[BookFileHash]:
+        """Get hash records of files with the given format and size.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        file_format : str
+            Upper-case format name.
+        file_size : int
+            File size in bytes.
+
+        Returns
+        -------
+        list[BookFileHash]
+            Matching hash records.
+        """
+        stmt = select(BookFileHash).where(
+            BookFileHash.library_id == library_id,
+            BookFileHash.format == file_format,
+            BookFileHash.file_size == file_size,
+        )
+        return list(self._session.exec(stmt).all())
+
+    def list_book_ids(self, library_id: int, file_format: str) -> set[int]:
+        """Get the IDs of books whose format is indexed.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        file_format : str
+            Upper-case format name.
+
+        Returns
+        -------
+        set[int]
+            Indexed book IDs.
+        """
+        stmt = select(BookFileHash.book_id).where(
+            BookFileHash.library_id == library_id,
+            BookFileHash.format == file_format,
+        )
+        return set(self._session.exec(stmt).all())
+
+    def list_keys(self, library_id: int) -> set[tuple[int, str]]:
+        """Get the ``(book_id, format)`` keys indexed for a library.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+
+        Returns
+        -------
+        set[tuple[int, str]]
+            Indexed keys.
+        """
+        stmt = select(BookFileHash.book_id, BookFileHash.format).where(
+            BookFileHash.library_id == library_id
+        )
+        return {(book_id, fmt) for book_id, fmt in self._session.exec(stmt).all()}
+
+    def delete_for_book(
+        self, library_id: int, book_id: int, file_format: str | None = None
+    ) -> None:
+        """Delete hash records of a book, or of one of its formats.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        book_id : int
+            Calibre book ID.
+        file_format : str | None
+            Upper-case format name. If None, all formats are deleted.
+        """
+        stmt = select(BookFileHash).where(
+            BookFileHash.library_id == library_id,
+            BookFileHash.book_id == book_id,
+        )
+        if file_format is not None:
+            stmt = stmt.where(BookFileHash.format == file_format)
+        for record in self._session.exec(stmt).all():
+            self._session.delete(record)
@@ -26,6 +26,7 @@ from pathlib import Path
 from PIL import Image
 from sqlmodel import Session, select
 
+from bookcard.common.filesystem import TransferMode, transfer_file
 from bookcard.models.media import Data
 from bookcard.repositories.interfaces import IFileManager
 
@@ -46,6 +47,7 @@ class CalibreFileManager(IFileManager):
         book_path_str: str,
         title_dir: str,
         file_format: str,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """Save book file to library directory structure.
 
@@ -61,11 +63,14 @@ class CalibreFileManager(IFileManager):
             Sanitized title directory name.
         file_format : str
             File format extension.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY). Cheaper
+            modes are for callers whose source file is disposable.
         """
         book_dir = library_path / book_path_str
         book_dir.mkdir(parents=True, exist_ok=True)
         library_file_path = book_dir / f"{title_dir}.{file_format.lower()}"
-        shutil.copy2(file_path, library_file_path)
+        transfer_file(file_path, library_file_path, transfer_mode)
 
     def save_book_cover(
         self,
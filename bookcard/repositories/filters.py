@@ -48,6 +48,8 @@ from bookcard.repositories.models import FilterContext
 if TYPE_CHECKING:
     from sqlalchemy.sql import Select
 
+    from bookcard.repositories.visibility import BookVisibility
+
 
 class FilterStrategy:
     """Strategy interface for building filter conditions.
@@ -439,6 +441,26 @@ class FilterBuilder:
         self._context = self._strategies["language"].apply(self._context, language_ids)
         return self
 
+    def with_visibility(self, visibility: BookVisibility | None) -> FilterBuilder:
+        """Restrict results to the books a user may see.
+
+        Unlike the other filters, visibility is always combined with AND.
+
+        Parameters
+        ----------
+        visibility : BookVisibility | None
+            Visibility of the user, or None for no restriction.
+
+        Returns
+        -------
+        FilterBuilder
+            Self for method chaining.
+        """
+        predicate = visibility.to_predicate() if visibility is not None else None
+        if predicate is not None:
+            self._context.and_conditions.append(predicate)
+        return self
+
     def build(self) -> Select:
         """Build final query with all filters applied.
 
@@ -24,7 +24,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from bookcard.common.filesystem import TransferMode
+
 if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
     from contextlib import AbstractContextManager
     from datetime import datetime
     from pathlib import Path
@@ -33,6 +36,7 @@ if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
 
     from bookcard.repositories.models import BookWithFullRelations, BookWithRelations
+    from bookcard.repositories.visibility import BookVisibility
     from bookcard.services.book_metadata import BookMetadata
 
 
@@ -50,6 +54,19 @@ class ISessionManager(ABC):
         """
         ...
 
+    def get_read_session(self) -> AbstractContextManager[Session]:
+        """Get a database session context manager for read-only work.
+
+        Implementations may route read sessions to connections that reject
+        writes. Defaults to `get_session`.
+
+        Returns
+        -------
+        AbstractContextManager[Session]
+            Context manager that yields a SQLModel session.
+        """
+        return self.get_session()
+
     @abstractmethod
     def dispose(self) -> None:
         """Dispose of the database engine and close all connections."""
@@ -67,6 +84,7 @@ class IFileManager(ABC):
         book_path_str: str,
         title_dir: str,
         file_format: str,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """Save book file to library directory structure.
 
@@ -82,6 +100,8 @@ class IFileManager(ABC):
             Sanitized title directory name.
         file_format : str
             File format extension.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY).
         """
         ...
 
@@ -485,6 +505,7 @@ class IBookRepository(ABC):
         full: bool = False,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> list[BookWithRelations | BookWithFullRelations]:
         """List books with pagination and optional search.
 
@@ -508,6 +529,8 @@ class IBookRepository(ABC):
             Optional month (1-12) to filter books by publication date month.
         pubdate_day : int | None
             Optional day (1-31) to filter books by publication date day.
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
 
         Returns
         -------
@@ -523,6 +546,7 @@ class IBookRepository(ABC):
         author_id: int | None = None,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> int:
         """Count total number of books, optionally filtered by search.
 
@@ -536,6 +560,8 @@ class IBookRepository(ABC):
             Optional month (1-12) to filter books by publication date month.
         pubdate_day : int | None
             Optional day (1-31) to filter books by publication date day.
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
 
         Returns
         -------
@@ -561,6 +587,7 @@ class IBookRepository(ABC):
         sort_by: str = "timestamp",
         sort_order: str = "desc",
         full: bool = False,
+        visibility: BookVisibility | None = None,
     ) -> list[BookWithRelations | BookWithFullRelations]:
         """List books with multiple filter criteria.
 
@@ -594,6 +621,8 @@ class IBookRepository(ABC):
             Sort order: 'asc' or 'desc' (default: 'desc').
         full : bool
             If True, return full book details with all metadata (default: False).
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
 
         Returns
         -------
@@ -614,6 +643,7 @@ class IBookRepository(ABC):
         formats: list[str] | None = None,
         rating_ids: list[int] | None = None,
         language_ids: list[int] | None = None,
+        visibility: BookVisibility | None = None,
     ) -> int:
         """Count books matching filter criteria.
 
@@ -637,6 +667,8 @@ class IBookRepository(ABC):
             List of rating IDs to filter by (OR condition).
         language_ids : list[int] | None
             List of language IDs to filter by (OR condition).
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
 
         Returns
         -------
@@ -696,6 +728,142 @@ class IBookRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def list_book_ids_by_query(self, book_ids_query: SelectOfScalar[int]) -> list[int]:
+        """List the book IDs returned by a query.
+
+        Parameters
+        ----------
+        book_ids_query : SelectOfScalar[int]
+            Statement returning `Book.id` values.
+
+        Returns
+        -------
+        list[int]
+            Matching book IDs, in no particular order.
+        """
+        ...
+
+    @abstractmethod
+    def list_modified_book_keys(
+        self,
+        *,
+        after: tuple[str, int] | None = None,
+        formats: Sequence[str] | None = None,
+        book_ids: Collection[int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """List ``(last_modified, id)`` keys of books in modification order.
+
+        Parameters
+        ----------
+        after : tuple[str, int] | None
+            Exclusive keyset cursor ``(last_modified, id)``. Only books sorting
+            after it are returned.
+        formats : Sequence[str] | None
+            If set, only books having at least one of these formats.
+        book_ids : Collection[int] | None
+            If set, only books with these IDs.
+        limit : int | None
+            Maximum number of keys to return.
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            Keys ordered by ``(last_modified, id)``. ``last_modified`` is the
+            value as stored in the database, suitable for a later cursor.
+        """
+        ...
+
+    @abstractmethod
+    def get_latest_modified_key(self) -> tuple[str, int] | None:
+        """Get the greatest ``(last_modified, id)`` key of the library.
+
+        Returns
+        -------
+        tuple[str, int] | None
+            Key of the most recently modified book, as returned by
+            `list_modified_book_keys`, or None if the library is empty.
+        """
+        ...
+
+    @abstractmethod
+    def list_book_sort_keys(
+        self,
+        *,
+        sort_by: str = "timestamp",
+        sort_order: str = "desc",
+        after: tuple[object, int] | None = None,
+        limit: int = 20,
+        search_query: str | None = None,
+        author_id: int | None = None,
+        pubdate_month: int | None = None,
+        pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
+    ) -> list[tuple[object, int]]:
+        """List ``(sort_value, book_id)`` keys of matching books in order.
+
+        Parameters
+        ----------
+        sort_by : str
+            Sort field (``timestamp``, ``pubdate``, ``title``,
+            ``author_sort``, ``series_index``).
+        sort_order : str
+            ``'asc'`` or ``'desc'``; ties are broken by book ID in the same
+            direction.
+        after : tuple[object, int] | None
+            Exclusive keyset cursor ``(sort_value, book_id)``.
+        limit : int
+            Maximum number of keys to return.
+        search_query : str | None
+            Optional search query.
+        author_id : int | None
+            Optional author ID filter.
+        pubdate_month : int | None
+            Optional publication month filter.
+        pubdate_day : int | None
+            Optional publication day filter.
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
+
+        Returns
+        -------
+        list[tuple[object, int]]
+            Keys in listing order; sort values are suitable for a cursor.
+        """
+        ...
+
+    @abstractmethod
+    def list_book_sort_keys_with_filters(
+        self,
+        *,
+        sort_by: str = "timestamp",
+        sort_order: str = "desc",
+        after: tuple[object, int] | None = None,
+        limit: int = 20,
+        author_ids: list[int] | None = None,
+        title_ids: list[int] | None = None,
+        genre_ids: list[int] | None = None,
+        publisher_ids: list[int] | None = None,
+        identifier_ids: list[int] | None = None,
+        series_ids: list[int] | None = None,
+        formats: list[str] | None = None,
+        rating_ids: list[int] | None = None,
+        language_ids: list[int] | None = None,
+        visibility: BookVisibility | None = None,
+    ) -> list[tuple[object, int]]:
+        """List ``(sort_value, book_id)`` keys of filtered books in order.
+
+        Filters combine as in `list_books_with_filters`; ordering and the
+        cursor work as in `list_book_sort_keys`.
+
+        Returns
+        -------
+        list[tuple[object, int]]
+            Keys in listing order.
+        """
+        ...
+
     @abstractmethod
     def update_book(
         self,
@@ -778,6 +946,7 @@ class IBookRepository(ABC):
         author_name: str | None = None,
         pubdate: datetime | None = None,
         library_path: Path | None = None,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> int:
         """Add a book directly to the Calibre database.
 
@@ -796,6 +965,8 @@ class IBookRepository(ABC):
             from file metadata (if available).
         library_path : "Path" | None
             Library root path. If None, uses calibre_db_path.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY).
 
         Returns
         -------
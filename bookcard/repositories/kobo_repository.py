@@ -526,6 +526,31 @@ class KoboArchivedBookRepository(Repository[KoboArchivedBook]):
         )
         return self._session.exec(stmt).first()
 
+    def find_book_ids_by_user_and_library(
+        self, user_id: int, library_id: int
+    ) -> set[int]:
+        """Get set of book IDs with an archive record for a user and library.
+
+        Includes books whose archive flag has since been cleared.
+
+        Parameters
+        ----------
+        user_id : int
+            User ID.
+        library_id : int
+            Library ID.
+
+        Returns
+        -------
+        set[int]
+            Set of book IDs.
+        """
+        stmt = select(KoboArchivedBook.book_id).where(
+            KoboArchivedBook.user_id == user_id,
+            KoboArchivedBook.library_id == library_id,
+        )
+        return set(self._session.exec(stmt).all())
+
     def find_archived_by_user_and_library(
         self,
         user_id: int,
@@ -0,0 +1,192 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Repository layer for materialized Magic Shelf membership.
+
+A shelf can be refreshed by several requests and the scheduled refresh at
+once, each from its own snapshot, so membership rows and refresh state are
+written with ``INSERT ... ON CONFLICT`` instead of plain inserts.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, SQLModel, col, select
+
+from bookcard.models.shelves import MagicShelfBook, MagicShelfState
+from bookcard.repositories.base import Repository
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from datetime import datetime
+
+# Rows per bulk delete or insert, kept below SQLite's bound parameter limit
+_DELETE_CHUNK_SIZE = 500
+_INSERT_CHUNK_SIZE = 400
+
+
+class MagicShelfMembershipRepository(Repository[MagicShelfState]):
+    """Repository for Magic Shelf membership rows and their refresh state."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize Magic Shelf membership repository.
+
+        Parameters
+        ----------
+        session : Session
+            Active SQLModel session.
+        """
+        super().__init__(session, MagicShelfState)
+
+    def list_book_ids(self, shelf_id: int) -> list[int]:
+        """Get the member book IDs of a shelf.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Shelf ID.
+
+        Returns
+        -------
+        list[int]
+            Calibre book IDs, in ascending order.
+        """
+        stmt = (
+            select(MagicShelfBook.book_id)
+            .where(MagicShelfBook.shelf_id == shelf_id)
+            .order_by(col(MagicShelfBook.book_id))
+        )
+        return list(self._session.exec(stmt).all())
+
+    def add_books(self, shelf_id: int, book_ids: Collection[int]) -> None:
+        """Add member books to a shelf.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Shelf ID.
+        book_ids : Collection[int]
+            Calibre book IDs that are not members yet. IDs that another
+            refresh added in the meantime are skipped.
+        """
+        ids = sorted(book_ids)
+        for start in range(0, len(ids), _INSERT_CHUNK_SIZE):
+            stmt = (
+                self
+                ._insert(MagicShelfBook)
+                .values([
+                    {"shelf_id": shelf_id, "book_id": book_id}
+                    for book_id in ids[start : start + _INSERT_CHUNK_SIZE]
+                ])
+                .on_conflict_do_nothing()
+            )
+            self._session.execute(stmt)
+
+    def save_state(
+        self,
+        shelf_id: int,
+        *,
+        rule_hash: str,
+        watermark_modified: str | None,
+        watermark_book_id: int | None,
+        book_count: int,
+        refreshed_at: datetime,
+    ) -> MagicShelfState:
+        """Create or overwrite the refresh state of a shelf.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Shelf ID.
+        rule_hash : str
+            Hash of the rules the membership was built from.
+        watermark_modified : str | None
+            Calibre ``last_modified`` of the newest book seen.
+        watermark_book_id : int | None
+            Calibre book ID paired with ``watermark_modified``.
+        book_count : int
+            Number of member books.
+        refreshed_at : datetime
+            Time of the refresh.
+
+        Returns
+        -------
+        MagicShelfState
+            Refresh state as stored.
+        """
+        values = {
+            "rule_hash": rule_hash,
+            "watermark_modified": watermark_modified,
+            "watermark_book_id": watermark_book_id,
+            "book_count": book_count,
+            "refreshed_at": refreshed_at,
+        }
+        stmt = (
+            self
+            ._insert(MagicShelfState)
+            .values(shelf_id=shelf_id, **values)
+            .on_conflict_do_update(index_elements=["shelf_id"], set_=values)
+        )
+        self._session.execute(stmt)
+        state = self._session.get(MagicShelfState, shelf_id, populate_existing=True)
+        if state is None:  # pragma: no cover - the row was just written
+            msg = f"Magic shelf state {shelf_id} was not saved"
+            raise RuntimeError(msg)
+        return state
+
+    def remove_books(self, shelf_id: int, book_ids: Collection[int]) -> None:
+        """Remove member books from a shelf.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Shelf ID.
+        book_ids : Collection[int]
+            Calibre book IDs to remove.
+        """
+        ids = sorted(book_ids)
+        for start in range(0, len(ids), _DELETE_CHUNK_SIZE):
+            self._session.execute(
+                delete(MagicShelfBook).where(
+                    col(MagicShelfBook.shelf_id) == shelf_id,
+                    col(MagicShelfBook.book_id).in_(
+                        ids[start : start + _DELETE_CHUNK_SIZE]
+                    ),
+                )
+            )
+
+    def delete_for_shelf(self, shelf_id: int) -> None:
+        """Delete the membership and refresh state of a shelf.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Shelf ID.
+        """
+        self._session.execute(
+            delete(MagicShelfBook).where(col(MagicShelfBook.shelf_id) == shelf_id)
+        )
+        self._session.execute(
+            delete(MagicShelfState).where(col(MagicShelfState.shelf_id) == shelf_id)
+        )
+
+    def _insert(self, model: type[SQLModel]) -> sqlite.Insert | postgresql.Insert:
+        """Build an INSERT supporting ON CONFLICT for the session's database."""
+        if self._session.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
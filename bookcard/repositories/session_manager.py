@@ -15,7 +15,9 @@
 
 """Session manager for Calibre database connections.
 
-This module handles database connection management following SRP.
+This module handles database connection management following SRP. Engines are
+shared process-wide through `CalibreEngineRegistry`, so constructing a session
+manager is cheap and sessions reuse warm pooled connections.
 """
 
 from __future__ import annotations
@@ -24,26 +26,30 @@ import logging
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
-from sqlalchemy import event
-from sqlmodel import Session, create_engine
+from sqlmodel import Session
 
+from bookcard.repositories.engine_registry import (
+    get_calibre_engine_registry,
+    get_calibre_sqlite_functions,
+)
 from bookcard.repositories.interfaces import ISessionManager
 
 if TYPE_CHECKING:
-    import sqlite3
     from collections.abc import Callable, Iterator
 
     from sqlalchemy import Engine
 
+    from bookcard.repositories.engine_registry import CalibreEngineRegistry
+
 logger = logging.getLogger(__name__)
 
 
 class CalibreSessionManager(ISessionManager):
     """Manages database connections for Calibre SQLite database.
 
-    Handles engine creation, SQLite function registration, and session management.
+    Handles engine lookup and session management. Engines (and their SQLite
+    function registration and pragmas) live in a shared registry.
     Follows SRP by focusing solely on database connection concerns.
 
     Parameters
@@ -52,17 +58,22 @@ class CalibreSessionManager(ISessionManager):
         Path to Calibre library directory (contains metadata.db).
     calibre_db_file : str
         Calibre database filename (default: 'metadata.db').
+    registry : CalibreEngineRegistry | None
+        Engine registry to use (defaults to the process-wide registry).
     """
 
     def __init__(
         self,
         calibre_db_path: str,
         calibre_db_file: str = "metadata.db",
+        registry: CalibreEngineRegistry | None = None,
     ) -> None:
         self._calibre_db_path = Path(calibre_db_path)
         self._calibre_db_file = calibre_db_file
         self._db_path = self._calibre_db_path / self._calibre_db_file
-        self._engine: Engine | None = None
+        self._registry = (
+            registry if registry is not None else get_calibre_engine_registry()
+        )
 
     @staticmethod
     def _get_calibre_sqlite_functions() -> list[tuple[str, int, Callable[..., object]]]:
@@ -72,30 +83,16 @@ class CalibreSessionManager(ISessionManager):
         -------
         list[tuple[str, int, Callable[..., object]]]
             List of tuples containing (function_name, num_args, function_impl).
-            Each tuple defines a SQLite function to register.
-
-        Notes
-        -----
-        To add a new function, simply add a tuple to this list:
-        - function_name: Name of the SQL function (e.g., "my_function")
-        - num_args: Number of arguments the function accepts (-1 for variable)
-        - function_impl: Python callable that implements the function
         """
-        return [
-            (
-                "title_sort",
-                1,
-                lambda x: x or "",
-            ),
-            (
-                "uuid4",
-                0,
-                lambda: str(uuid4()),
-            ),
-        ]
-
-    def _get_engine(self) -> Engine:
-        """Get or create SQLAlchemy engine for Calibre database.
+        return get_calibre_sqlite_functions()
+
+    def _get_engine(self, *, read_only: bool = False) -> Engine:
+        """Get the shared SQLAlchemy engine for Calibre database.
+
+        Parameters
+        ----------
+        read_only : bool
+            Whether to return the engine whose connections reject writes.
 
         Returns
         -------
@@ -107,73 +104,16 @@ class CalibreSessionManager(ISessionManager):
         FileNotFoundError
             If Calibre database file does not exist.
         """
-        if not self._db_path.exists():
-            msg = f"Calibre database not found at {self._db_path}"
-            raise FileNotFoundError(msg)
-        if self._engine is None:
-            db_url = f"sqlite:///{self._db_path}"
-
-            def _configure_sqlite_connection(
-                dbapi_conn: sqlite3.Connection, connection_record: object
-            ) -> None:
-                """Configure SQLite connection for Calibre database.
-
-                This applies SQLite pragmas that improve concurrency and registers
-                Calibre-specific SQLite functions required by Calibre triggers.
-
-                Parameters
-                ----------
-                dbapi_conn : sqlite3.Connection
-                    SQLite database connection.
-                connection_record : object
-                    Connection record (required by event listener signature).
-                """
-                # connection_record is required by event listener signature but unused
-                _ = connection_record
-
-                cursor = dbapi_conn.cursor()
-                try:
-                    # Enable WAL mode (Write-Ahead Logging) for better concurrency
-                    cursor.execute("PRAGMA journal_mode=WAL")
-                    # Wait up to 30 seconds if the database is busy/locked
-                    cursor.execute("PRAGMA busy_timeout=30000")
-                finally:
-                    cursor.close()
-
-                # Register each function (create_function is idempotent)
-                for (
-                    func_name,
-                    num_args,
-                    func_impl,
-                ) in self._get_calibre_sqlite_functions():
-                    dbapi_conn.create_function(func_name, num_args, func_impl)  # type: ignore[invalid-argument-type]
-
-            self._engine = create_engine(
-                db_url,
-                echo=False,
-                future=True,
-                connect_args={
-                    "timeout": 30.0,
-                    "check_same_thread": False,
-                },
-                pool_pre_ping=True,
-            )
-            event.listen(self._engine, "connect", _configure_sqlite_connection)
-        return self._engine
+        return self._registry.get_engine(self._db_path, read_only=read_only)
 
     def dispose(self) -> None:
-        """Dispose of the database engine and close all connections.
+        """Release resources held by this session manager.
 
-        This is useful for cleanup in tests or when the manager is no longer needed.
-        After calling this method, the engine will be recreated on the next use.
+        Engines are shared by every session manager of the library, so they
+        are left pooled in the registry; use
+        `CalibreEngineRegistry.dispose` to close them when a library is
+        removed.
         """
-        if self._engine is not None:
-            # Force close all connections and dispose the engine
-            self._engine.dispose(close=True)
-            # On Windows, we need to ensure all connections are fully closed
-            # before the file can be deleted. The dispose(close=True) should handle this,
-            # but we set engine to None immediately to prevent reuse.
-            self._engine = None
 
     @contextmanager
     def get_session(self) -> Iterator[Session]:
@@ -190,3 +130,19 @@ class CalibreSessionManager(ISessionManager):
             yield session
         finally:
             session.close()
+
+    @contextmanager
+    def get_read_session(self) -> Iterator[Session]:
+        """Get a SQLModel session backed by read-only connections.
+
+        Yields
+        ------
+        Session
+            SQLModel session that cannot write to the Calibre database.
+        """
+        engine = self._get_engine(read_only=True)
+        session = Session(engine)
+        try:
+            yield session
+        finally:
+            session.close()
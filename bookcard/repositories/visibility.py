@@ -0,0 +1,208 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Book visibility compiled into SQL predicates.
+
+Conditional ``books:read`` grants restrict a user to the books matching at
+least one of the grants' conditions. `BookVisibility` holds those
+conditions and compiles them into a predicate over `Book`, so listings
+filter, count and paginate visible books in the database rather than
+checking every fetched book in Python.
+
+Conditions use the keys understood by
+`PermissionService.evaluate_condition`. Keys without meaning for Calibre
+books (``owner_id``) and unknown keys compile to FALSE, matching the
+evaluator's fail-safe denial.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, exists, false, or_, true
+
+from bookcard.models.core import (
+    Author,
+    Book,
+    BookAuthorLink,
+    BookSeriesLink,
+    BookTagLink,
+    Tag,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from sqlalchemy.sql import ColumnElement
+
+
+@dataclass(frozen=True, slots=True)
+class BookVisibility:
+    """Books a user may see.
+
+    Attributes
+    ----------
+    conditions : tuple[Mapping[str, Any], ...] | None
+        Conditions of which a visible book must match at least one, or None
+        if every book is visible.
+    """
+
+    conditions: tuple[Mapping[str, Any], ...] | None = None
+
+    @property
+    def is_unrestricted(self) -> bool:
+        """Whether every book is visible."""
+        return self.conditions is None
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no book is visible."""
+        return self.conditions == ()
+
+    def to_predicate(self) -> ColumnElement[bool] | None:
+        """Compile the visibility into a predicate over `Book`.
+
+        Returns
+        -------
+        ColumnElement[bool] | None
+            Predicate selecting visible books, or None if every book is
+            visible.
+        """
+        if self.conditions is None:
+            return None
+        if not self.conditions:
+            return false()
+        predicates = [compile_book_condition(c) for c in self.conditions]
+        return predicates[0] if len(predicates) == 1 else or_(*predicates)
+
+
+def compile_book_condition(condition: Mapping[str, Any]) -> ColumnElement[bool]:
+    """Compile a permission condition into a predicate over `Book`.
+
+    Keys are combined with AND, as in `PermissionService.evaluate_condition`.
+
+    Parameters
+    ----------
+    condition : Mapping[str, Any]
+        Permission condition (e.g., ``{"tags": ["Fiction", "Poetry"]}``).
+
+    Returns
+    -------
+    ColumnElement[bool]
+        Predicate selecting the books matching the condition.
+    """
+    predicates = []
+    for key, value in condition.items():
+        compiler = _COMPILERS.get(key)
+        if compiler is None:
+            return false()
+        predicates.append(compiler(value))
+    if not predicates:
+        return true()
+    return predicates[0] if len(predicates) == 1 else and_(*predicates)
+
+
+def _exists_for_book(*criteria: ColumnElement[bool]) -> ColumnElement[bool]:
+    # Correlate only `Book`: listing queries may join the link tables too
+    return exists().where(*criteria).correlate(Book)
+
+
+def _is_scalar(value: object) -> bool:
+    return isinstance(value, (str, int, float))
+
+
+def _scalars(value: object) -> list[object] | None:
+    """Get the values of a list condition, or None if it cannot match."""
+    if not isinstance(value, list):
+        return None
+    return [item for item in value if _is_scalar(item)]
+
+
+def _has_author_named(value: object) -> ColumnElement[bool]:
+    if not _is_scalar(value):
+        return false()
+    return _exists_for_book(
+        BookAuthorLink.book == Book.id,
+        BookAuthorLink.author == Author.id,
+        Author.name == value,
+    )
+
+
+def _has_author_id(value: object) -> ColumnElement[bool]:
+    if not _is_scalar(value):
+        return false()
+    return _exists_for_book(
+        BookAuthorLink.book == Book.id,
+        BookAuthorLink.author == value,
+    )
+
+
+def _has_any_author_id(value: object) -> ColumnElement[bool]:
+    author_ids = _scalars(value)
+    if not author_ids:
+        return false()
+    return _exists_for_book(
+        BookAuthorLink.book == Book.id,
+        BookAuthorLink.author.in_(author_ids),  # type: ignore[attr-defined]
+    )
+
+
+def _has_tag_named(value: object) -> ColumnElement[bool]:
+    if not _is_scalar(value):
+        return false()
+    return _exists_for_book(
+        BookTagLink.book == Book.id,
+        BookTagLink.tag == Tag.id,
+        Tag.name == value,
+    )
+
+
+def _has_any_tag_named(value: object) -> ColumnElement[bool]:
+    tags = _scalars(value)
+    if not tags:
+        return false()
+    return _exists_for_book(
+        BookTagLink.book == Book.id,
+        BookTagLink.tag == Tag.id,
+        Tag.name.in_(tags),  # type: ignore[attr-defined]
+    )
+
+
+def _in_series(value: object) -> ColumnElement[bool]:
+    if value is None:
+        return ~_exists_for_book(BookSeriesLink.book == Book.id)
+    if not _is_scalar(value):
+        return false()
+    return _exists_for_book(
+        BookSeriesLink.book == Book.id,
+        BookSeriesLink.series == value,
+    )
+
+
+def _never(_value: object) -> ColumnElement[bool]:
+    # Calibre books have no owner
+    return false()
+
+
+_COMPILERS: dict[str, Callable[[object], ColumnElement[bool]]] = {
+    "author": _has_author_named,
+    "author_id": _has_author_id,
+    "author_ids": _has_any_author_id,
+    "tag": _has_tag_named,
+    "tags": _has_any_tag_named,
+    "series_id": _in_series,
+    "owner_id": _never,
+}
@@ -32,6 +32,7 @@ from sqlmodel import select
 
 from bookcard.models.core import Book
 from bookcard.services.book_service import BookService
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +44,22 @@ class BookCoverService:
     Uses IOC by accepting BookService as dependency.
     """
 
-    def __init__(self, book_service: BookService) -> None:
+    def __init__(
+        self,
+        book_service: BookService,
+        thumbnail_cache: CoverThumbnailCache | None = None,
+    ) -> None:
         """Initialize cover service.
 
         Parameters
         ----------
         book_service : BookService
             Book service for accessing book data and repository.
+        thumbnail_cache : CoverThumbnailCache | None
+            Optional thumbnail cache to invalidate when a cover is replaced.
         """
         self._book_service = book_service
+        self._thumbnail_cache = thumbnail_cache
 
     def validate_url(self, url: str) -> None:
         """Validate cover URL format.
@@ -198,6 +206,8 @@ class BookCoverService:
         # Save cover as cover.jpg (Calibre standard)
         cover_path = book_path / "cover.jpg"
         cover_path.write_bytes(content)
+        if self._thumbnail_cache is not None:
+            self._thumbnail_cache.invalidate(cover_path)
 
         # Update database to mark book as having a cover
         with self._book_service._book_repo.get_session() as calibre_session:  # noqa: SLF001
@@ -0,0 +1,335 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Single-pass book file probe.
+
+Uploads and ingests need the metadata, cover, page count and content hash
+of the same file, and retries, duplicate checks and metadata enforcement
+ask for them again.  `BookFileProbe` opens a file once to compute all of
+them -- hashing the stream, then parsing EPUB packages and PDF documents
+from the same handle -- and caches results by (path, size, mtime).
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import logging
+import threading
+import zipfile
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO
+
+from pypdf import PdfReader
+from pypdf.errors import PyPdfError
+
+from bookcard.services.book_cover_extractor import BookCoverExtractor
+from bookcard.services.book_metadata_extractor import BookMetadataExtractor
+from bookcard.services.cover_extractors.epub import EpubCoverExtractor
+from bookcard.services.metadata_extractors.epub import EpubMetadataExtractor
+from bookcard.services.metadata_extractors.pdf import PdfMetadataExtractor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from bookcard.services.book_metadata import BookMetadata
+
+logger = logging.getLogger(__name__)
+
+# Probe results kept in memory (each may hold a cover image)
+PROBE_CACHE_SIZE = 32
+
+# Content hashes kept in memory
+HASH_CACHE_SIZE = 1024
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_EPUB_FORMATS = frozenset({"EPUB", "KEPUB"})
+
+# (resolved path, size, mtime_ns)
+_FileKey = tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class BookProbeResult:
+    """Everything learned from probing a book file.
+
+    Attributes
+    ----------
+    metadata : BookMetadata
+        Extracted metadata (filename-based if extraction failed).
+    cover_data : bytes | None
+        Cover image data, or None if the file has no extractable cover.
+    page_count : int | None
+        Number of pages for paginated formats (PDF), otherwise None.
+    sha256 : str
+        SHA-256 hex digest of the file content.
+    size : int
+        File size in bytes.
+    mtime_ns : int
+        File modification time in nanoseconds.
+    """
+
+    metadata: BookMetadata
+    cover_data: bytes | None
+    page_count: int | None
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+class _LRUCache[K, V]:
+    """Small thread-safe LRU mapping."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._items: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+def _file_key(file_path: Path) -> _FileKey:
+    stat = file_path.stat()
+    return str(file_path.resolve()), stat.st_size, stat.st_mtime_ns
+
+
+def _hash_stream(stream: BinaryIO) -> str:
+    sha256 = hashlib.sha256()
+    while chunk := stream.read(HASH_CHUNK_SIZE):
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class BookFileProbe:
+    """Extract metadata, cover, page count and content hash in one pass.
+
+    EPUB/KEPUB and PDF files are parsed once for both metadata and cover;
+    other formats fall back to the metadata and cover extraction
+    strategies.  Results are cached until the file's size or modification
+    time changes.
+
+    Parameters
+    ----------
+    metadata_extractor : BookMetadataExtractor | None
+        Extractor for formats without a single-pass probe and for the
+        filename fallback (creates default if None).
+    cover_extractor : BookCoverExtractor | None
+        Cover extractor for formats without a single-pass probe (creates
+        default if None).
+    cache_size : int
+        Maximum number of cached probe results.
+    """
+
+    def __init__(
+        self,
+        metadata_extractor: BookMetadataExtractor | None = None,
+        cover_extractor: BookCoverExtractor | None = None,
+        cache_size: int = PROBE_CACHE_SIZE,
+    ) -> None:
+        self._metadata_extractor = metadata_extractor or BookMetadataExtractor()
+        self._cover_extractor = cover_extractor or BookCoverExtractor()
+        self._epub_metadata = EpubMetadataExtractor()
+        self._epub_cover = EpubCoverExtractor()
+        self._pdf_metadata = PdfMetadataExtractor()
+        self._results: _LRUCache[tuple[_FileKey, str, str], BookProbeResult] = (
+            _LRUCache(cache_size)
+        )
+        self._hashes: _LRUCache[_FileKey, str] = _LRUCache(HASH_CACHE_SIZE)
+
+    def probe(
+        self,
+        file_path: Path,
+        file_format: str,
+        original_filename: str | None = None,
+    ) -> BookProbeResult:
+        """Probe a book file.
+
+        Parameters
+        ----------
+        file_path : Path
+            Path to the book file.
+        file_format : str
+            File format extension (e.g., 'epub', 'pdf', 'mobi').
+        original_filename : str | None
+            Original filename for the metadata fallback (default:
+            file_path.name).
+
+        Returns
+        -------
+        BookProbeResult
+            Probe result; its metadata is a copy the caller may modify.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        """
+        if original_filename is None:
+            original_filename = file_path.name
+        file_format = file_format.upper().lstrip(".")
+        file_key = _file_key(file_path)
+        cache_key = (file_key, file_format, original_filename)
+
+        result = self._results.get(cache_key)
+        if result is None:
+            result = self._probe_file(
+                file_path, file_key, file_format, original_filename
+            )
+            self._results.put(cache_key, result)
+            self._hashes.put(file_key, result.sha256)
+        return dataclasses.replace(result, metadata=copy.deepcopy(result.metadata))
+
+    def content_hash(self, file_path: Path) -> str:
+        """Get the SHA-256 of a file, reusing the hash of an earlier probe.
+
+        Parameters
+        ----------
+        file_path : Path
+            Path to the file.
+
+        Returns
+        -------
+        str
+            SHA-256 hex digest.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        """
+        file_key = _file_key(file_path)
+        sha256 = self._hashes.get(file_key)
+        if sha256 is None:
+            with file_path.open("rb") as stream:
+                sha256 = _hash_stream(stream)
+            self._hashes.put(file_key, sha256)
+        return sha256
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._results.clear()
+        self._hashes.clear()
+
+    def _probe_file(
+        self,
+        file_path: Path,
+        file_key: _FileKey,
+        file_format: str,
+        original_filename: str,
+    ) -> BookProbeResult:
+        metadata: BookMetadata | None = None
+        cover_data: bytes | None = None
+        cover_probed = False
+        page_count: int | None = None
+
+        with file_path.open("rb") as stream:
+            sha256 = _hash_stream(stream)
+            stream.seek(0)
+            if file_format in _EPUB_FORMATS:
+                metadata, cover_data = self._probe_epub(stream, original_filename)
+                cover_probed = True
+            elif file_format == "PDF":
+                metadata, page_count = self._probe_pdf(stream, original_filename)
+
+        if metadata is None:
+            metadata = self._metadata_extractor.extract_metadata(
+                file_path, file_format, original_filename
+            )
+        if not cover_probed:
+            cover_data = self._cover_extractor.extract_cover(file_path, file_format)
+
+        _, size, mtime_ns = file_key
+        return BookProbeResult(
+            metadata=metadata,
+            cover_data=cover_data,
+            page_count=page_count,
+            sha256=sha256,
+            size=size,
+            mtime_ns=mtime_ns,
+        )
+
+    def _probe_epub(
+        self, stream: BinaryIO, original_filename: str
+    ) -> tuple[BookMetadata | None, bytes | None]:
+        """Read metadata and cover from one parse of the EPUB package."""
+        try:
+            with zipfile.ZipFile(stream) as epub_zip:
+                opf_path, root = self._epub_metadata.read_package(epub_zip)
+                metadata: BookMetadata | None = None
+                with suppress(ValueError, KeyError):
+                    metadata = self._epub_metadata.extract_from_package(
+                        root, original_filename, opf_path
+                    )
+                cover_data = None
+                with suppress(Exception):
+                    cover_data = self._epub_cover.extract_cover_from_package(
+                        epub_zip, opf_path, root
+                    )
+                return metadata, cover_data
+        except (zipfile.BadZipFile, ValueError, KeyError, OSError) as exc:
+            logger.debug("Could not read EPUB package: %s", exc)
+            return None, None
+
+    def _probe_pdf(
+        self, stream: BinaryIO, original_filename: str
+    ) -> tuple[BookMetadata | None, int | None]:
+        """Read metadata and page count from one PDF reader."""
+        try:
+            reader = PdfReader(stream)
+            metadata = self._pdf_metadata.extract_from_reader(reader, original_filename)
+            page_count = len(reader.pages)
+        except (PyPdfError, ValueError, KeyError, OSError) as exc:
+            logger.debug("Could not read PDF: %s", exc)
+            return None, None
+        return metadata, page_count
+
+
+_probe: BookFileProbe | None = None
+_probe_lock = threading.Lock()
+
+
+def get_book_file_probe() -> BookFileProbe:
+    """Get the process-wide book file probe.
+
+    Returns
+    -------
+    BookFileProbe
+        Shared probe, so that every caller benefits from its cache.
+    """
+    global _probe
+    with _probe_lock:
+        if _probe is None:
+            _probe = BookFileProbe()
+        return _probe
@@ -23,6 +23,7 @@ from sqlmodel import Session
 
 from bookcard.models.auth import User
 from bookcard.repositories.models import BookWithFullRelations, BookWithRelations
+from bookcard.repositories.visibility import BookVisibility
 from bookcard.services.permission_service import PermissionService
 
 
@@ -67,19 +68,43 @@ class BookPermissionHelper:
             "authors": book_with_rels.authors,
         }
 
+        # Add author_ids if available (populated by list enrichment)
+        if book_with_rels.author_ids:
+            context["author_ids"] = book_with_rels.author_ids
+
         # Add series_id if available
-        if (
-            isinstance(book_with_rels, BookWithFullRelations)
-            and book_with_rels.series_id
-        ):
+        if book_with_rels.series_id:
             context["series_id"] = book_with_rels.series_id
 
         # Add tags if available
-        if isinstance(book_with_rels, BookWithFullRelations) and book_with_rels.tags:
+        if book_with_rels.tags:
             context["tags"] = book_with_rels.tags
 
         return context
 
+    def get_read_visibility(self, user: User) -> BookVisibility:
+        """Get the books a user may read, for filtering book listings.
+
+        Parameters
+        ----------
+        user : User
+            Current authenticated user.
+
+        Returns
+        -------
+        BookVisibility
+            Visibility to pass to listing queries.
+
+        Raises
+        ------
+        HTTPException
+            If user may not read any book.
+        """
+        visibility = self._permission_service.get_book_visibility(user, "read")
+        if visibility.is_empty:
+            self._permission_service.check_permission(user, "books", "read")
+        return visibility
+
     def check_read_permission(
         self,
         user: User,
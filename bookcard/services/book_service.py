@@ -30,6 +30,7 @@ from sqlalchemy import func, or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import col, select
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.conversion import BookConversion, ConversionMethod
 from bookcard.models.core import Book, Tag
 from bookcard.models.epub_fixer import EPUBFix
@@ -54,16 +55,24 @@ from bookcard.repositories import (
     CalibreBookRepository,
     ereader_repository,
 )
+from bookcard.repositories.file_hash_repository import BookFileHashRepository
 from bookcard.services.config_service import FileHandlingConfigService
 from bookcard.services.conversion import create_conversion_service
 from bookcard.services.conversion_utils import raise_conversion_error
+from bookcard.services.duplicate_detection.file_hash_index import (
+    FileHashIndex,
+    file_hash_detection_enabled,
+)
 from bookcard.services.tracked_book_service import TrackedBookService
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
     from sqlmodel import Session
 
     from bookcard.models.auth import EReaderDevice
     from bookcard.models.config import Library
+    from bookcard.repositories.visibility import BookVisibility
     from bookcard.services.email_service import EmailService
 
 logger = logging.getLogger(__name__)
@@ -111,6 +120,7 @@ class BookService:
         full: bool = False,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> tuple[list[BookWithRelations | BookWithFullRelations], int]:
         """List books with pagination.
 
@@ -134,6 +144,9 @@ class BookService:
             Optional month (1-12) to filter books by publication date month.
         pubdate_day : int | None
             Optional day (1-31) to filter books by publication date day.
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see; tracked books
+            are only merged into unrestricted listings.
 
         Returns
         -------
@@ -151,18 +164,25 @@ class BookService:
             full=full,
             pubdate_month=pubdate_month,
             pubdate_day=pubdate_day,
+            visibility=visibility,
         )
         total = self._book_repo.count_books(
             search_query=search_query,
             author_id=author_id,
             pubdate_month=pubdate_month,
             pubdate_day=pubdate_day,
+            visibility=visibility,
         )
 
         # Merge tracked books if session is available and on first page (or searching)
         # We only show tracked books on page 1 to simulate "pinned" status
         # and avoid complex pagination across two data sources.
-        if self._session and page == 1 and not author_id:
+        if (
+            self._session
+            and page == 1
+            and not author_id
+            and (visibility is None or visibility.is_unrestricted)
+        ):
             try:
                 tracked_service = TrackedBookService(self._session)
                 all_tracked = tracked_service.list_tracked_books()
@@ -264,6 +284,66 @@ class BookService:
 
         return self._book_repo.get_book_full(book_id)
 
+    def list_books_by_ids(
+        self, book_ids: Sequence[int], full: bool = False
+    ) -> list[BookWithRelations | BookWithFullRelations]:
+        """Get several books by ID in a single query.
+
+        Parameters
+        ----------
+        book_ids : Sequence[int]
+            Calibre book IDs.
+        full : bool
+            If True, return full book details with all metadata.
+
+        Returns
+        -------
+        list[BookWithRelations | BookWithFullRelations]
+            Books found, in the order of ``book_ids``. Missing IDs are skipped.
+        """
+        if not book_ids:
+            return []
+        books = self._book_repo.list_books_by_ids_query(
+            select(Book.id).where(col(Book.id).in_(book_ids)),
+            limit=len(book_ids),
+            full=full,
+        )
+        by_id = {b.book.id: b for b in books}
+        return [by_id[book_id] for book_id in book_ids if book_id in by_id]
+
+    def list_modified_book_keys(
+        self,
+        *,
+        after: tuple[str, int] | None = None,
+        formats: Sequence[str] | None = None,
+        book_ids: Collection[int] | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """List ``(last_modified, id)`` keys of books in modification order.
+
+        Lightweight keyset query for incremental consumers (e.g. device sync)
+        that only need to know which books changed, without loading relations.
+
+        Parameters
+        ----------
+        after : tuple[str, int] | None
+            Exclusive ``(last_modified, id)`` cursor from a previous call.
+        formats : Sequence[str] | None
+            If set, only books having at least one of these formats.
+        book_ids : Collection[int] | None
+            If set, only books with these IDs.
+        limit : int | None
+            Maximum number of keys to return.
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            Keys ordered by ``(last_modified, id)``.
+        """
+        return self._book_repo.list_modified_book_keys(
+            after=after, formats=formats, book_ids=book_ids, limit=limit
+        )
+
     def _create_virtual_book(
         self, tracked_book: TrackedBook, full: bool = False
     ) -> BookWithRelations | BookWithFullRelations:
@@ -661,6 +741,7 @@ class BookService:
         sort_by: str = "timestamp",
         sort_order: str = "desc",
         full: bool = False,
+        visibility: BookVisibility | None = None,
     ) -> tuple[list[BookWithRelations | BookWithFullRelations], int]:
         """List books with multiple filter criteria using OR conditions.
 
@@ -694,6 +775,8 @@ class BookService:
             Sort order: 'asc' or 'desc' (default: 'desc').
         full : bool
             If True, return full book details with all metadata (default: False).
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
 
         Returns
         -------
@@ -716,6 +799,7 @@ class BookService:
             sort_by=sort_by,
             sort_order=sort_order,
             full=full,
+            visibility=visibility,
         )
         total = self._book_repo.count_books_with_filters(
             author_ids=author_ids,
@@ -727,6 +811,7 @@ class BookService:
             formats=formats,
             rating_ids=rating_ids,
             language_ids=language_ids,
+            visibility=visibility,
         )
         return books, total
 
@@ -737,6 +822,7 @@ class BookService:
         title: str | None = None,
         author_name: str | None = None,
         pubdate: datetime | None = None,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> int:
         """Add a book directly to the Calibre library.
 
@@ -755,6 +841,9 @@ class BookService:
             Author name. If None, uses 'Unknown'.
         pubdate : datetime | None
             Publication date. If None, uses date from file metadata or current date.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY). Callers
+            whose file is disposable may link it instead.
 
         Returns
         -------
@@ -768,14 +857,17 @@ class BookService:
         """
         # Determine library path
         library_path = self._get_library_path()
-        return self._book_repo.add_book(
+        book_id = self._book_repo.add_book(
             file_path=file_path,
             file_format=file_format,
             title=title,
             author_name=author_name,
             pubdate=pubdate,
             library_path=library_path,
+            transfer_mode=transfer_mode,
         )
+        self._index_format_file(book_id, file_format)
+        return book_id
 
     def add_format(
         self,
@@ -783,6 +875,7 @@ class BookService:
         file_path: Path,
         file_format: str,
         replace: bool = False,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """Add a format to an existing book.
 
@@ -796,6 +889,8 @@ class BookService:
             Format extension (e.g. 'epub').
         replace : bool
             Whether to replace existing format if it exists.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY).
 
         Raises
         ------
@@ -809,7 +904,9 @@ class BookService:
             file_path=file_path,
             file_format=file_format,
             replace=replace,
+            transfer_mode=transfer_mode,
         )
+        self._index_format_file(book_id, file_format)
 
     def add_format_from_content(
         self,
@@ -953,6 +1050,28 @@ class BookService:
             file_format=file_format,
             delete_file_from_drive=delete_file_from_drive,
         )
+        if (
+            self._session is None
+            or self._library.id is None
+            or not file_hash_detection_enabled()
+        ):
+            return
+        # The file is already gone, so a failed index update must not fail
+        # the deletion; the savepoint keeps unrelated session work intact
+        try:
+            with self._session.begin_nested():
+                FileHashIndex(self._session).remove(
+                    library_id=self._library.id,
+                    book_id=book_id,
+                    file_format=file_format,
+                )
+        except SQLAlchemyError:
+            logger.warning(
+                "Failed to remove file hash for book_id=%d, format=%s",
+                book_id,
+                file_format,
+                exc_info=True,
+            )
 
     def delete_book(
         self,
@@ -1611,6 +1730,7 @@ class BookService:
         - Metadata enforcement operations (MetadataEnforcementOperation)
         - Ingest history (IngestHistory)
         - TrackedBook associations (updates TrackedBook, deletes TrackedBookFile)
+        - File hash index records (BookFileHash)
 
         Parameters
         ----------
@@ -1684,6 +1804,10 @@ class BookService:
             # Delete all associations
             for model_class, model_name in models_to_delete:
                 self._delete_associations_by_model(book_id, model_class, model_name)
+            if self._library.id is not None:
+                BookFileHashRepository(self._session).delete_for_book(
+                    self._library.id, book_id
+                )
 
             # Commit all deletions
             self._session.commit()
@@ -1701,6 +1825,51 @@ class BookService:
             )
             raise
 
+    def _index_format_file(self, book_id: int, file_format: str) -> None:
+        """Record a newly stored format file in the file hash index.
+
+        Indexing is best effort: a failure is logged, rolled back to a
+        savepoint and does not fail the operation that stored the file.
+        Files are only hashed while full-file-hash duplicate detection is
+        enabled.
+
+        Parameters
+        ----------
+        book_id : int
+            Calibre book ID.
+        file_format : str
+            Format extension (e.g. 'epub').
+        """
+        if (
+            self._session is None
+            or self._library.id is None
+            or not file_hash_detection_enabled()
+        ):
+            return
+        try:
+            file_path = self.get_format_file_path(book_id, file_format)
+            with self._session.begin_nested():
+                FileHashIndex(self._session).record_file(
+                    library_id=self._library.id,
+                    book_id=book_id,
+                    file_format=file_format,
+                    file_path=file_path,
+                )
+        except (OSError, ValueError):
+            logger.warning(
+                "Failed to index file hash for book_id=%d, format=%s",
+                book_id,
+                file_format,
+                exc_info=True,
+            )
+        except SQLAlchemyError:
+            logger.warning(
+                "Failed to store file hash for book_id=%d, format=%s",
+                book_id,
+                file_format,
+                exc_info=True,
+            )
+
     def _delete_associations_by_model(
         self, book_id: int, model_class: type, model_name: str
     ) -> None:
@@ -28,10 +28,19 @@ from bookcard.services.comic.archive.models import (
     ComicPage,
     ComicPageInfo,
 )
+from bookcard.services.comic.archive.page_cache import (
+    ComicPageCache,
+    PageCacheStats,
+)
 from bookcard.services.comic.archive.service import (
     ComicArchiveService,
     create_comic_archive_service,
 )
+from bookcard.services.comic.archive.thumbnail_cache import (
+    ComicSpriteSheet,
+    ComicThumbnail,
+    ComicThumbnailCache,
+)
 
 __all__ = [
     "ArchiveCorruptedError",
@@ -39,9 +48,14 @@ __all__ = [
     "ComicArchiveError",
     "ComicArchiveService",
     "ComicPage",
+    "ComicPageCache",
     "ComicPageInfo",
+    "ComicSpriteSheet",
+    "ComicThumbnail",
+    "ComicThumbnailCache",
     "ImageProcessingError",
     "InvalidArchiveEntryNameError",
+    "PageCacheStats",
     "PageNotFoundError",
     "UnsupportedFormatError",
     "create_comic_archive_service",
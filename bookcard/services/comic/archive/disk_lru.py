@@ -0,0 +1,164 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Size accounting and LRU eviction for on-disk comic caches.
+
+The page and thumbnail caches store one directory per cached unit (an
+archive, or an archive at a given thumbnail width). `DirectoryLru` tracks
+the bytes held by each directory and removes whole directories, least
+recently used first, once the total exceeds a limit. Directory mtimes carry
+the recency order across restarts.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class DirectoryLru:
+    """Byte-bounded LRU over the subdirectories of a cache root.
+
+    Parameters
+    ----------
+    root : Path
+        Cache root; each subdirectory is one eviction unit.
+    max_bytes : int
+        Upper bound on the total size of counted files.
+    suffixes : tuple[str, ...]
+        Suffixes of the files counted when sizes are loaded from disk.
+    """
+
+    def __init__(
+        self, root: Path, max_bytes: int, *, suffixes: tuple[str, ...]
+    ) -> None:
+        self._root = root
+        self._max_bytes = max_bytes
+        self._suffixes = suffixes
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] | None = None
+        self._total_bytes = 0
+        self._evictions = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently accounted for."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._total_bytes
+
+    @property
+    def evictions(self) -> int:
+        """Directories removed to stay within the size limit."""
+        with self._lock:
+            return self._evictions
+
+    def load(self) -> None:
+        """Scan directories left by previous runs, if not done yet.
+
+        Call before writing into a directory so the new file is not counted
+        both by the scan and by `record`.
+        """
+        with self._lock:
+            self._ensure_loaded()
+
+    def touch(self, key: str) -> None:
+        """Mark a directory as most recently used.
+
+        Parameters
+        ----------
+        key : str
+            Directory name.
+        """
+        now = time.time()
+        try:
+            os.utime(self._root / key, (now, now))
+        except OSError:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            if self._sizes is not None and key in self._sizes:
+                self._sizes.move_to_end(key)
+
+    def record(self, key: str, added: int) -> None:
+        """Account for bytes written into a directory and evict if needed.
+
+        The directory being written is never evicted.
+
+        Parameters
+        ----------
+        key : str
+            Directory name.
+        added : int
+            Change in size in bytes (negative when files shrank).
+        """
+        with self._lock:
+            self._ensure_loaded()
+            sizes = self._sizes
+            if sizes is None:  # pragma: no cover - set by _ensure_loaded
+                return
+            sizes[key] = sizes.get(key, 0) + added
+            sizes.move_to_end(key)
+            self._total_bytes += added
+            self._evict(protect=key)
+
+    def clear(self) -> None:
+        """Remove every directory."""
+        with self._lock:
+            shutil.rmtree(self._root, ignore_errors=True)
+            self._sizes = OrderedDict()
+            self._total_bytes = 0
+
+    def _ensure_loaded(self) -> None:
+        """Load sizes of directories cached by previous runs (lock held)."""
+        if self._sizes is not None:
+            return
+        entries: list[tuple[float, str, int]] = []
+        if self._root.is_dir():
+            for entry_dir in self._root.iterdir():
+                if not entry_dir.is_dir():
+                    continue
+                try:
+                    size = sum(
+                        p.stat().st_size
+                        for p in entry_dir.iterdir()
+                        if p.suffix in self._suffixes
+                    )
+                    entries.append((entry_dir.stat().st_mtime, entry_dir.name, size))
+                except OSError:
+                    continue
+        entries.sort()
+        self._sizes = OrderedDict((name, size) for _, name, size in entries)
+        self._total_bytes = sum(self._sizes.values())
+
+    def _evict(self, *, protect: str) -> None:
+        """Drop least recently used directories until within budget (lock held)."""
+        sizes = self._sizes
+        if sizes is None:  # pragma: no cover - set by _ensure_loaded
+            return
+        while self._total_bytes > self._max_bytes:
+            victim = next((k for k in sizes if k != protect), None)
+            if victim is None:
+                return
+            self._total_bytes -= sizes.pop(victim)
+            shutil.rmtree(self._root / victim, ignore_errors=True)
+            self._evictions += 1
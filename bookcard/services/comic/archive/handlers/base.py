@@ -21,6 +21,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from bookcard.services.comic.archive.image_processor import ImageProcessor
@@ -104,3 +105,30 @@ class ArchiveHandler(ABC):
         dict[str, PageDetails]
             Mapping from entry name to details.
         """
+
+    def extract_pages(
+        self,
+        file_path: Path,
+        *,
+        metadata: ArchiveMetadata,
+        on_page: Callable[[str, bytes], None],
+    ) -> None:
+        """Extract every page in a single pass over the archive.
+
+        Handlers of formats that can be solid override this to decompress
+        the archive once; the default extracts pages one by one.
+
+        Parameters
+        ----------
+        file_path : Path
+            Path to the archive.
+        metadata : ArchiveMetadata
+            Metadata previously returned by `scan_metadata`.
+        on_page : Callable[[str, bytes], None]
+            Called with ``(filename, image_bytes)`` for each page as soon as
+            it is available.
+        """
+        for name in metadata.page_filenames:
+            on_page(
+                name, self.extract_page(file_path, filename=name, metadata=metadata)
+            )
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from io import BytesIO
 from typing import TYPE_CHECKING
 
 from bookcard.services.comic.archive.exceptions import ArchiveReadError
@@ -29,8 +30,11 @@ from bookcard.services.comic.archive.utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from pathlib import Path
 
+    import py7zr
+
     from bookcard.services.comic.archive.image_processor import ImageProcessor
 
 
@@ -50,6 +54,7 @@ class CB7Handler(ArchiveHandler):
         try:
             with py7zr.SevenZipFile(file_path, "r") as z:
                 names = z.getnames()
+                is_solid = bool(z.archiveinfo().solid)
         except OSError as e:
             msg = f"Failed to read CB7 {file_path}: {e}"
             raise ArchiveReadError(msg) from e
@@ -61,6 +66,7 @@ class CB7Handler(ArchiveHandler):
         return ArchiveMetadata(
             page_filenames=tuple(sorted(page_names, key=natural_sort_key)),
             last_modified_ns=last_modified_ns,
+            is_solid=is_solid,
         )
 
     def extract_page(
@@ -79,14 +85,47 @@ class CB7Handler(ArchiveHandler):
             raise ArchiveReadError(msg) from e
 
         validate_archive_entry_name(filename)
+        pages: dict[str, bytes] = {}
+        streamer = _PageStreamer({filename}, pages.__setitem__)
         try:
             with py7zr.SevenZipFile(file_path, "r") as z:
-                file_data = z.read([filename])
-                return file_data[filename].read()
+                z.extract(targets=[filename], factory=streamer)
+            streamer.finish()
+            return pages[filename]
         except (KeyError, OSError) as e:
             msg = f"Failed to extract {filename!r} from CB7 {file_path}: {e}"
             raise ArchiveReadError(msg) from e
 
+    def extract_pages(
+        self,
+        file_path: Path,
+        *,
+        metadata: ArchiveMetadata,
+        on_page: Callable[[str, bytes], None],
+    ) -> None:
+        """Extract every page of a CB7 in one decompression pass.
+
+        Entries are decompressed straight into per-entry buffers and handed
+        to ``on_page`` as soon as the next entry starts, so at most one page
+        is held in memory.
+        """
+        try:
+            import py7zr
+        except ImportError as e:
+            msg = "py7zr library required for CB7 support"
+            raise ArchiveReadError(msg) from e
+
+        for name in metadata.page_filenames:
+            validate_archive_entry_name(name)
+        streamer = _PageStreamer(set(metadata.page_filenames), on_page)
+        try:
+            with py7zr.SevenZipFile(file_path, "r") as z:
+                z.extract(targets=list(metadata.page_filenames), factory=streamer)
+            streamer.finish()
+        except OSError as e:
+            msg = f"Failed to extract pages from CB7 {file_path}: {e}"
+            raise ArchiveReadError(msg) from e
+
     def get_page_details(
         self,
         file_path: Path,
@@ -122,13 +161,15 @@ class CB7Handler(ArchiveHandler):
 
                 for name in metadata.page_filenames:
                     validate_archive_entry_name(name)
+                dimensions = (
+                    _read_dimensions(z, metadata.page_filenames, image_processor)
+                    if include_dimensions
+                    else {}
+                )
+
+                for name in metadata.page_filenames:
                     file_size = int(size_by_name.get(name, 0) or 0)
-                    width: int | None = None
-                    height: int | None = None
-                    if include_dimensions:
-                        file_data = z.read([name])
-                        data = file_data[name].read()
-                        width, height = image_processor.get_dimensions(data)
+                    width, height = dimensions.get(name, (None, None))
                     details[name] = PageDetails(
                         file_size=file_size, width=width, height=height
                     )
@@ -140,3 +181,89 @@ class CB7Handler(ArchiveHandler):
             raise ArchiveReadError(msg) from e
 
         return details
+
+
+def _read_dimensions(
+    archive: py7zr.SevenZipFile,
+    names: Sequence[str],
+    image_processor: ImageProcessor,
+) -> dict[str, tuple[int, int]]:
+    """Decode the dimensions of the given pages in one archive pass."""
+    dimensions: dict[str, tuple[int, int]] = {}
+
+    def on_page(name: str, data: bytes) -> None:
+        dimensions[name] = image_processor.get_dimensions(data)
+
+    streamer = _PageStreamer(set(names), on_page)
+    # _PageStreamer satisfies py7zr's WriterFactory structurally; py7zr is
+    # an optional import here, so it cannot subclass the ABC directly.
+    archive.extract(
+        targets=list(names),
+        factory=streamer,  # ty: ignore[invalid-argument-type]
+    )
+    streamer.finish()
+    missing = [name for name in names if name not in dimensions]
+    if missing:
+        raise KeyError(missing[0])
+    return dimensions
+
+
+class _PageWriter:
+    """In-memory sink for one decompressed CB7 entry (py7zr ``Py7zIO``)."""
+
+    def __init__(self, streamer: _PageStreamer, buffer: BytesIO) -> None:
+        self._streamer = streamer
+        self._buffer = buffer
+
+    def write(self, s: bytes | bytearray) -> int:
+        return self._buffer.write(s)
+
+    def read(self, size: int | None = None) -> bytes:
+        return self._buffer.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._buffer.seek(offset, whence)
+
+    def flush(self) -> None:
+        return None
+
+    def size(self) -> int:
+        return self._buffer.getbuffer().nbytes
+
+    def close(self) -> None:
+        self._streamer.finish(self._buffer)
+
+
+class _PageStreamer:
+    """py7zr writer factory streaming decompressed entries to a callback.
+
+    py7zr decompresses entries in archive order and only calls ``close`` on
+    writers in recent versions, so an entry is also considered complete
+    when the writer for the next entry is created.
+    """
+
+    def __init__(self, wanted: set[str], on_page: Callable[[str, bytes], None]) -> None:
+        self._wanted = wanted
+        self._on_page = on_page
+        self._current: tuple[str, BytesIO] | None = None
+
+    def create(self, filename: str) -> _PageWriter:
+        """Finish the previous entry and return a writer for the next."""
+        self.finish()
+        buffer = BytesIO()
+        if filename in self._wanted:
+            self._current = (filename, buffer)
+        return _PageWriter(self, buffer)
+
+    def finish(self, buffer: BytesIO | None = None) -> None:
+        """Publish the entry being written, if any.
+
+        Parameters
+        ----------
+        buffer : BytesIO | None
+            Only publish if this is the current entry's buffer.
+        """
+        if self._current is not None and buffer in (None, self._current[1]):
+            filename, buffer = self._current
+            self._current = None
+            self._on_page(filename, buffer.getvalue())
@@ -18,6 +18,8 @@
 from __future__ import annotations
 
 import subprocess  # noqa: S404
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import rarfile
@@ -25,7 +27,10 @@ import rarfile
 from bookcard.services.comic.archive.exceptions import ArchiveReadError
 from bookcard.services.comic.archive.handlers.base import ArchiveHandler
 from bookcard.services.comic.archive.models import ArchiveMetadata, PageDetails
-from bookcard.services.comic.archive.rar_extractor import extract_member_with_bsdtar
+from bookcard.services.comic.archive.rar_extractor import (
+    extract_all_with_bsdtar,
+    extract_member_with_bsdtar,
+)
 from bookcard.services.comic.archive.utils import (
     is_image_entry,
     natural_sort_key,
@@ -33,7 +38,7 @@ from bookcard.services.comic.archive.utils import (
 )
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable
 
     from bookcard.services.comic.archive.image_processor import ImageProcessor
 
@@ -48,6 +53,7 @@ class CBRHandler(ArchiveHandler):
         try:
             with rarfile.RarFile(file_path, "r") as rf:
                 names = rf.namelist()
+                is_solid = rf.is_solid()
         except (rarfile.Error, OSError) as e:
             msg = f"Failed to read CBR {file_path}: {e}"
             raise ArchiveReadError(msg) from e
@@ -59,6 +65,7 @@ class CBRHandler(ArchiveHandler):
         return ArchiveMetadata(
             page_filenames=tuple(sorted(page_names, key=natural_sort_key)),
             last_modified_ns=last_modified_ns,
+            is_solid=is_solid,
         )
 
     def extract_page(
@@ -94,6 +101,42 @@ class CBRHandler(ArchiveHandler):
             msg = f"Failed to extract {filename!r} from CBR {file_path}: {e}"
             raise ArchiveReadError(msg) from e
 
+    def extract_pages(
+        self,
+        file_path: Path,
+        *,
+        metadata: ArchiveMetadata,
+        on_page: Callable[[str, bytes], None],
+    ) -> None:
+        """Extract every page of a CBR with a single extractor invocation.
+
+        `rarfile` runs the external tool once per `read`, which for solid
+        archives decompresses everything before each member. Extracting the
+        whole archive into a scratch directory decompresses it once.
+        """
+        for name in metadata.page_filenames:
+            validate_archive_entry_name(name)
+        try:
+            with tempfile.TemporaryDirectory(prefix="bookcard-cbr-") as scratch:
+                dest_dir = Path(scratch)
+                try:
+                    with rarfile.RarFile(file_path, "r") as rf:
+                        rf.extractall(
+                            path=dest_dir, members=list(metadata.page_filenames)
+                        )
+                except rarfile.BadRarFile:
+                    # Same tool-backend fallback as `extract_page`
+                    extract_all_with_bsdtar(file_path, dest_dir=dest_dir)
+                for name in metadata.page_filenames:
+                    on_page(name, (dest_dir / name).read_bytes())
+        except (
+            rarfile.Error,
+            OSError,
+            subprocess.CalledProcessError,
+        ) as e:
+            msg = f"Failed to extract pages from CBR {file_path}: {e}"
+            raise ArchiveReadError(msg) from e
+
     def get_page_details(
         self,
         file_path: Path,
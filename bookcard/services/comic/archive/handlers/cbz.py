@@ -37,6 +37,7 @@ from bookcard.services.comic.archive.utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from bookcard.services.comic.archive.image_processor import ImageProcessor
@@ -104,6 +105,36 @@ class CBZHandler(ArchiveHandler):
             msg = f"Failed to read CBZ {file_path}: {e}"
             raise ArchiveReadError(msg) from e
 
+    def extract_pages(
+        self,
+        file_path: Path,
+        *,
+        metadata: ArchiveMetadata,
+        on_page: Callable[[str, bytes], None],
+    ) -> None:
+        """Extract every page of a CBZ, opening the archive once."""
+        if not isinstance(metadata, ZipArchiveMetadata):
+            msg = "CBZ handler received non-zip metadata"
+            raise ArchiveReadError(msg)
+
+        for name in metadata.page_filenames:
+            validate_archive_entry_name(name)
+        try:
+            with zipfile.ZipFile(
+                file_path, "r", metadata_encoding=metadata.metadata_encoding
+            ) as zf:
+                for name in metadata.page_filenames:
+                    on_page(name, zf.read(name))
+        except zipfile.BadZipFile as e:
+            msg = f"Invalid CBZ archive: {file_path}: {e}"
+            raise ArchiveCorruptedError(msg) from e
+        except KeyError as e:
+            msg = f"Missing CBZ entry {e} in {file_path}"
+            raise ArchiveReadError(msg) from e
+        except OSError as e:
+            msg = f"Failed to read CBZ {file_path}: {e}"
+            raise ArchiveReadError(msg) from e
+
     def get_page_details(
         self,
         file_path: Path,
@@ -17,7 +17,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -80,10 +80,14 @@ class ArchiveMetadata:
         Natural-sorted list of image entry names.
     last_modified_ns : int
         Last modified time (ns) used to validate cache entries.
+    is_solid : bool
+        Whether the archive is solid, i.e. extracting one entry decompresses
+        every entry stored before it.
     """
 
     page_filenames: tuple[str, ...]
     last_modified_ns: int
+    is_solid: bool = field(default=False, kw_only=True)
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,353 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""On-disk cache of extracted comic pages.
+
+Extracting one entry of a solid CB7/CBR decompresses every entry stored
+before it, so reading a comic page by page re-decompresses the archive over
+and over. This cache extracts solid archives once, in a single pass, and
+serves every later page from disk. Pages of non-solid archives (CBZ, CBC and
+non-solid CB7/CBR) are cached as they are read, and the next few pages are
+extracted in the background so sequential reading rarely waits.
+
+Entries are keyed by the archive's resolved path and mtime, so a modified
+archive never serves stale pages. The total size on disk is bounded; whole
+archives are evicted in least-recently-used order.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from bookcard.services.comic.archive.disk_lru import DirectoryLru
+from bookcard.services.comic.archive.exceptions import ComicArchiveError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from bookcard.services.comic.archive.handlers.base import ArchiveHandler
+    from bookcard.services.comic.archive.models import ArchiveMetadata
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+DEFAULT_PREFETCH_PAGES = 3
+
+_TMP_PREFIX = ".tmp-"
+_PAGE_SUFFIX = ".page"
+_COMPLETE_MARKER = ".complete"
+
+
+@dataclass(slots=True)
+class PageCacheStats:
+    """Counters describing page cache effectiveness.
+
+    Attributes
+    ----------
+    hits : int
+        Page requests served from the cache.
+    misses : int
+        Page requests that had to read the archive.
+    archive_extractions : int
+        Single-pass extractions of solid archives.
+    prefetched : int
+        Pages extracted ahead of being requested.
+    evictions : int
+        Archives removed to stay within the size limit.
+    bytes_cached : int
+        Bytes currently stored on disk.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    archive_extractions: int = 0
+    prefetched: int = 0
+    evictions: int = 0
+    bytes_cached: int = 0
+
+
+class ComicPageCache:
+    """Size-bounded on-disk cache of comic page images.
+
+    Parameters
+    ----------
+    cache_dir : Path | str
+        Directory where extracted pages are stored.
+    max_bytes : int
+        Upper bound on the total size of cached pages. The archive being
+        read is never evicted, so a single archive larger than the bound is
+        still cached while in use.
+    prefetch_pages : int
+        Number of following pages extracted in the background after a page
+        of a non-solid archive is read. 0 disables read-ahead.
+    executor : Executor | None
+        Executor running read-ahead. If None, a small thread pool is created
+        on first use.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+        executor: Executor | None = None,
+    ) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._lru = DirectoryLru(self._cache_dir, max_bytes, suffixes=(_PAGE_SUFFIX,))
+        self._prefetch_pages = prefetch_pages
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._archive_locks: dict[str, threading.Lock] = {}
+        self._pending: set[tuple[str, int]] = set()
+        self._stats = PageCacheStats()
+
+    @classmethod
+    def from_data_directory(cls, data_directory: Path | str) -> ComicPageCache:
+        """Create a cache rooted in the application data directory.
+
+        Parameters
+        ----------
+        data_directory : Path | str
+            Application data directory (``AppConfig.data_directory``).
+
+        Returns
+        -------
+        ComicPageCache
+            Cache storing files under ``{data_directory}/cache/comic_pages``.
+        """
+        return cls(Path(data_directory) / "cache" / "comic_pages")
+
+    def get_page(
+        self,
+        file_path: Path,
+        *,
+        page_number: int,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> bytes:
+        """Get a page image, extracting and caching it if needed.
+
+        Parameters
+        ----------
+        file_path : Path
+            Archive path.
+        page_number : int
+            Page number (1-based), already validated against ``metadata``.
+        metadata : ArchiveMetadata
+            Archive metadata from the metadata provider.
+        handler : ArchiveHandler
+            Handler for the archive format.
+
+        Returns
+        -------
+        bytes
+            Raw image bytes.
+        """
+        key = self._archive_key(file_path, metadata)
+        data = self._read(key, page_number)
+        if data is not None:
+            self._record(hits=1)
+            self._schedule_prefetch(key, file_path, page_number, metadata, handler)
+            return data
+
+        self._record(misses=1)
+        if metadata.is_solid:
+            self._extract_archive(key, file_path, metadata, handler)
+            data = self._read(key, page_number)
+            if data is not None:
+                return data
+
+        filename = metadata.page_filenames[page_number - 1]
+        data = handler.extract_page(file_path, filename=filename, metadata=metadata)
+        self._write(key, page_number, data)
+        self._schedule_prefetch(key, file_path, page_number, metadata, handler)
+        return data
+
+    def stats(self) -> PageCacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns
+        -------
+        PageCacheStats
+            Copy of the current counters.
+        """
+        bytes_cached = self._lru.total_bytes
+        with self._lock:
+            return replace(
+                self._stats, evictions=self._lru.evictions, bytes_cached=bytes_cached
+            )
+
+    def clear(self) -> None:
+        """Remove every cached page from disk."""
+        self._lru.clear()
+
+    def _archive_key(self, file_path: Path, metadata: ArchiveMetadata) -> str:
+        identity = f"{file_path.resolve()}\0{metadata.last_modified_ns}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+
+    def _page_path(self, key: str, page_number: int) -> Path:
+        return self._cache_dir / key / f"{page_number:05d}{_PAGE_SUFFIX}"
+
+    def _read(self, key: str, page_number: int) -> bytes | None:
+        path = self._page_path(key, page_number)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self._lru.touch(key)
+        return data
+
+    def _write(self, key: str, page_number: int, data: bytes) -> None:
+        """Store a page atomically and account for its size."""
+        archive_dir = self._cache_dir / key
+        path = self._page_path(key, page_number)
+        # Scan earlier runs before this page lands on disk
+        self._lru.load()
+        try:
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = archive_dir / f"{_TMP_PREFIX}{uuid4().hex}"
+            tmp_path.write_bytes(data)
+            replaced = path.stat().st_size if path.exists() else 0
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Failed to cache comic page %s: %s", path, e)
+            return
+        self._lru.record(key, len(data) - replaced)
+
+    def _extract_archive(
+        self,
+        key: str,
+        file_path: Path,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> None:
+        """Extract all pages of an archive once, serialised per archive."""
+        with self._lock:
+            archive_lock = self._archive_locks.setdefault(key, threading.Lock())
+        try:
+            with archive_lock:
+                if (self._cache_dir / key / _COMPLETE_MARKER).exists():
+                    return
+                self._extract_all_pages(key, file_path, metadata, handler)
+        finally:
+            with self._lock:
+                self._archive_locks.pop(key, None)
+
+    def _extract_all_pages(
+        self,
+        key: str,
+        file_path: Path,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> None:
+        page_numbers = {
+            name: i for i, name in enumerate(metadata.page_filenames, start=1)
+        }
+
+        def on_page(name: str, data: bytes) -> None:
+            page_number = page_numbers.get(name)
+            if page_number is not None:
+                self._write(key, page_number, data)
+
+        start = time.perf_counter()
+        handler.extract_pages(file_path, metadata=metadata, on_page=on_page)
+        try:
+            (self._cache_dir / key / _COMPLETE_MARKER).touch()
+        except OSError as e:
+            logger.warning("Failed to mark %s as extracted: %s", file_path, e)
+        self._record(archive_extractions=1)
+        logger.debug(
+            "Extracted %d pages of %s in %.3fs",
+            len(page_numbers),
+            file_path,
+            time.perf_counter() - start,
+        )
+
+    def _schedule_prefetch(
+        self,
+        key: str,
+        file_path: Path,
+        page_number: int,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> None:
+        """Extract the next pages of a non-solid archive in the background."""
+        if metadata.is_solid or self._prefetch_pages <= 0:
+            return
+        last = min(len(metadata.page_filenames), page_number + self._prefetch_pages)
+        for next_page in range(page_number + 1, last + 1):
+            if self._page_path(key, next_page).exists():
+                continue
+            with self._lock:
+                if (key, next_page) in self._pending:
+                    continue
+                self._pending.add((key, next_page))
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=2, thread_name_prefix="comic-prefetch"
+                    )
+                executor = self._executor
+            executor.submit(
+                self._prefetch, key, file_path, next_page, metadata, handler
+            )
+
+    def _prefetch(
+        self,
+        key: str,
+        file_path: Path,
+        page_number: int,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> None:
+        try:
+            filename = metadata.page_filenames[page_number - 1]
+            data = handler.extract_page(file_path, filename=filename, metadata=metadata)
+            self._write(key, page_number, data)
+            self._record(prefetched=1)
+        except (ComicArchiveError, OSError) as e:
+            logger.debug(
+                "Prefetch of page %d of %s failed: %s", page_number, file_path, e
+            )
+        except Exception:
+            # Nobody reads the prefetch future, so report bugs here
+            logger.exception(
+                "Unexpected error prefetching page %d of %s", page_number, file_path
+            )
+        finally:
+            with self._lock:
+                self._pending.discard((key, page_number))
+
+    def _record(
+        self,
+        *,
+        hits: int = 0,
+        misses: int = 0,
+        archive_extractions: int = 0,
+        prefetched: int = 0,
+    ) -> None:
+        with self._lock:
+            self._stats.hits += hits
+            self._stats.misses += misses
+            self._stats.archive_extractions += archive_extractions
+            self._stats.prefetched += prefetched
@@ -68,3 +68,33 @@ def extract_member_with_bsdtar(file_path: Path, *, filename: str) -> bytes:
         capture_output=True,
     )
     return proc.stdout
+
+
+def extract_all_with_bsdtar(file_path: Path, *, dest_dir: Path) -> None:
+    """Extract every member of a RAR/CBR into a directory using `bsdtar`.
+
+    One invocation decompresses the archive once, which matters for solid
+    archives where extracting members one by one re-decompresses everything
+    stored before each of them.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to the RAR/CBR archive.
+    dest_dir : Path
+        Existing directory to extract into.
+
+    Raises
+    ------
+    FileNotFoundError
+        If `bsdtar` is not installed or not found on PATH.
+    subprocess.CalledProcessError
+        If `bsdtar` fails to extract the archive.
+    OSError
+        If process execution fails for OS reasons.
+    """
+    subprocess.run(  # noqa: S603
+        ["bsdtar", "-x", "-f", str(file_path), "-C", str(dest_dir)],  # noqa: S607
+        check=True,
+        capture_output=True,
+    )
@@ -18,6 +18,8 @@
 This module wires together:
 - format handlers (CBZ/CBR/CB7/CBC)
 - metadata caching (LRU)
+- page caching (on-disk, optional)
+- page thumbnail caching (on-disk, optional)
 - image processing (dimensions)
 """
 
@@ -27,6 +29,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from bookcard.services.comic.archive.exceptions import (
+    ImageProcessingError,
     PageNotFoundError,
     UnsupportedFormatError,
 )
@@ -50,6 +53,12 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from bookcard.services.comic.archive.handlers.base import ArchiveHandler
+    from bookcard.services.comic.archive.page_cache import ComicPageCache
+    from bookcard.services.comic.archive.thumbnail_cache import (
+        ComicSpriteSheet,
+        ComicThumbnail,
+        ComicThumbnailCache,
+    )
 
 DEFAULT_ZIP_METADATA_ENCODINGS: tuple[str, ...] = (
     "utf-8",
@@ -68,6 +77,8 @@ class ComicArchiveService:
     metadata_provider: LruArchiveMetadataProvider
     details_provider: LruPageDetailsProvider
     image_processor: ImageProcessor
+    page_cache: ComicPageCache | None = None
+    thumbnail_cache: ComicThumbnailCache | None = None
 
     def register_handler(self, extension: str, handler: ArchiveHandler) -> None:
         """Register or replace an archive handler.
@@ -149,16 +160,20 @@ class ComicArchiveService:
         UnsupportedFormatError
             If the file extension is not supported.
         """
-        metadata = self.metadata_provider.get(file_path)
-        if page_number < 1 or page_number > len(metadata.page_filenames):
-            msg = f"Page number {page_number} out of range (1-{len(metadata.page_filenames)})"
-            raise PageNotFoundError(msg)
-
+        metadata = self._get_page_metadata(file_path, page_number)
         handler = self._get_handler(file_path)
         filename = metadata.page_filenames[page_number - 1]
-        image_data = handler.extract_page(
-            file_path, filename=filename, metadata=metadata
-        )
+        if self.page_cache is not None:
+            image_data = self.page_cache.get_page(
+                file_path,
+                page_number=page_number,
+                metadata=metadata,
+                handler=handler,
+            )
+        else:
+            image_data = handler.extract_page(
+                file_path, filename=filename, metadata=metadata
+            )
         width, height = self.image_processor.get_dimensions(image_data)
         return ComicPage(
             page_number=page_number,
@@ -168,6 +183,97 @@ class ComicArchiveService:
             height=height,
         )
 
+    def get_page_thumbnail(
+        self, file_path: Path, page_number: int, *, max_width: int | None
+    ) -> ComicThumbnail | None:
+        """Get a cached thumbnail of a page.
+
+        The first request for a comic renders the thumbnails of all of its
+        pages in one pass over the archive.
+
+        Parameters
+        ----------
+        file_path : Path
+            Archive path.
+        page_number : int
+            Page number (1-based).
+        max_width : int | None
+            Maximum thumbnail width in pixels.
+
+        Returns
+        -------
+        ComicThumbnail | None
+            Cached thumbnail, or None if there is no thumbnail cache, the
+            width exceeds the largest thumbnail bucket or the page cannot be
+            decoded. Callers then render the page themselves.
+
+        Raises
+        ------
+        PageNotFoundError
+            If the page number is out of range.
+        UnsupportedFormatError
+            If the file extension is not supported.
+        """
+        metadata = self._get_page_metadata(file_path, page_number)
+        cache = self.thumbnail_cache
+        bucket = cache.bucket_for(max_width) if cache is not None else None
+        if cache is None or bucket is None:
+            return None
+        return cache.get_thumbnail(
+            file_path,
+            page_number=page_number,
+            bucket=bucket,
+            metadata=metadata,
+            handler=self._get_handler(file_path),
+        )
+
+    def get_sprite_sheet(
+        self, file_path: Path, *, max_width: int, columns: int
+    ) -> ComicSpriteSheet:
+        """Get a sprite sheet of all page thumbnails of a comic.
+
+        Parameters
+        ----------
+        file_path : Path
+            Archive path.
+        max_width : int
+            Maximum thumbnail width in pixels; rounded up to a bucket.
+        columns : int
+            Number of thumbnails per row.
+
+        Returns
+        -------
+        ComicSpriteSheet
+            Sprite sheet and its layout.
+
+        Raises
+        ------
+        ImageProcessingError
+            If thumbnails are not cached, the width exceeds the largest
+            bucket or the sheet would be too tall.
+        UnsupportedFormatError
+            If the file extension is not supported.
+        """
+        cache = self.thumbnail_cache
+        bucket = cache.bucket_for(max_width) if cache is not None else None
+        if cache is None or bucket is None:
+            msg = f"Sprite sheets are not available at width {max_width}"
+            raise ImageProcessingError(msg)
+        return cache.get_sprite_sheet(
+            file_path,
+            bucket=bucket,
+            columns=columns,
+            metadata=self.metadata_provider.get(file_path),
+            handler=self._get_handler(file_path),
+        )
+
+    def _get_page_metadata(self, file_path: Path, page_number: int) -> ArchiveMetadata:
+        metadata = self.metadata_provider.get(file_path)
+        if page_number < 1 or page_number > len(metadata.page_filenames):
+            msg = f"Page number {page_number} out of range (1-{len(metadata.page_filenames)})"
+            raise PageNotFoundError(msg)
+        return metadata
+
     def _scan_metadata(
         self, file_path: Path, *, last_modified_ns: int
     ) -> ArchiveMetadata:
@@ -187,6 +293,8 @@ def create_comic_archive_service(
     *,
     zip_metadata_encodings: tuple[str, ...] = DEFAULT_ZIP_METADATA_ENCODINGS,
     cache_size: int = 50,
+    page_cache: ComicPageCache | None = None,
+    thumbnail_cache: ComicThumbnailCache | None = None,
 ) -> ComicArchiveService:
     """Create a production-configured comic archive service.
 
@@ -196,6 +304,11 @@ def create_comic_archive_service(
         Encodings to probe for ZIP filename decoding (CBZ and CBC inner CBZ).
     cache_size : int
         Maximum number of archive metadata entries to keep in LRU.
+    page_cache : ComicPageCache | None
+        On-disk page cache. If None, every page request reads the archive.
+    thumbnail_cache : ComicThumbnailCache | None
+        On-disk page thumbnail cache. If None, thumbnails are not cached and
+        sprite sheets are unavailable.
 
     Returns
     -------
@@ -236,4 +349,6 @@ def create_comic_archive_service(
         metadata_provider=provider,
         details_provider=details_provider,
         image_processor=image_processor,
+        page_cache=page_cache,
+        thumbnail_cache=thumbnail_cache,
     )
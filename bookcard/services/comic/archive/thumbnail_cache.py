@@ -0,0 +1,405 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""On-disk cache of comic page thumbnails.
+
+The page strip of the reader requests a small thumbnail of every page of a
+comic. Rendering each one on demand opens the archive and fully decodes the
+page every time, so this cache renders the thumbnails of all pages of a
+comic in one pass over the archive, at a fixed set of width buckets, and
+serves the resulting JPEG files with strong ETags. A sprite sheet combining
+every thumbnail of a comic can be rendered from the cached files for clients
+that prefer a single request.
+
+Thumbnails are keyed by the archive's resolved path, mtime and width bucket,
+so a modified archive never serves stale thumbnails. The total size on disk
+is bounded; whole (archive, width) sets are evicted least recently used
+first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from PIL import Image
+
+from bookcard.services.comic.archive.disk_lru import DirectoryLru
+from bookcard.services.comic.archive.exceptions import ImageProcessingError
+
+if TYPE_CHECKING:
+    from bookcard.services.comic.archive.handlers.base import ArchiveHandler
+    from bookcard.services.comic.archive.models import ArchiveMetadata
+
+logger = logging.getLogger(__name__)
+
+# Widths (in pixels) that page thumbnails are rendered at. Requested widths
+# are rounded up to the nearest bucket so arbitrary client sizes map onto a
+# handful of cached sets.
+THUMBNAIL_WIDTH_BUCKETS: tuple[int, ...] = (120, 240, 480, 960)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# JPEG cannot encode images taller than this
+_MAX_SPRITE_HEIGHT = 65_500
+
+_TMP_PREFIX = ".tmp-"
+_IMAGE_SUFFIX = ".jpg"
+_COMPLETE_MARKER = ".complete"
+
+
+@dataclass(frozen=True, slots=True)
+class ComicThumbnail:
+    """A cached page thumbnail ready to be served.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the JPEG file.
+    etag : str
+        Strong entity tag (quoted) identifying this exact rendition.
+    last_modified : float
+        Modification time of the archive (POSIX timestamp).
+    media_type : str
+        MIME type of the image.
+    """
+
+    path: Path
+    etag: str
+    last_modified: float
+    media_type: str = "image/jpeg"
+
+
+@dataclass(frozen=True, slots=True)
+class ComicSpriteSheet:
+    """A grid of every page thumbnail of a comic in one JPEG.
+
+    Page ``n`` (1-based) occupies the cell at column ``(n - 1) % columns``
+    and row ``(n - 1) // columns``; thumbnails are anchored at the top-left
+    corner of their cell.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the JPEG file.
+    etag : str
+        Strong entity tag (quoted) identifying this exact rendition.
+    last_modified : float
+        Modification time of the archive (POSIX timestamp).
+    page_count : int
+        Number of pages in the sheet.
+    columns : int
+        Number of cells per row.
+    rows : int
+        Number of rows.
+    cell_width : int
+        Cell width in pixels.
+    cell_height : int
+        Cell height in pixels.
+    media_type : str
+        MIME type of the image.
+    """
+
+    path: Path
+    etag: str
+    last_modified: float
+    page_count: int
+    columns: int
+    rows: int
+    cell_width: int
+    cell_height: int
+    media_type: str = "image/jpeg"
+
+
+class ComicThumbnailCache:
+    """Renders and caches comic page thumbnails on disk.
+
+    Parameters
+    ----------
+    cache_dir : Path | str
+        Directory where thumbnails are stored.
+    max_bytes : int
+        Upper bound on the total size of cached thumbnails.
+    quality : int
+        JPEG encoder quality.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        quality: int = 80,
+    ) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._lru = DirectoryLru(self._cache_dir, max_bytes, suffixes=(_IMAGE_SUFFIX,))
+        self._quality = quality
+        self._lock = threading.Lock()
+        self._set_locks: dict[str, threading.Lock] = {}
+
+    @classmethod
+    def from_data_directory(cls, data_directory: Path | str) -> ComicThumbnailCache:
+        """Create a cache rooted in the application data directory.
+
+        Parameters
+        ----------
+        data_directory : Path | str
+            Application data directory (``AppConfig.data_directory``).
+
+        Returns
+        -------
+        ComicThumbnailCache
+            Cache storing files under ``{data_directory}/cache/comic_thumbnails``.
+        """
+        return cls(Path(data_directory) / "cache" / "comic_thumbnails")
+
+    @staticmethod
+    def bucket_for(max_width: int | None) -> int | None:
+        """Map a requested width to a thumbnail width bucket.
+
+        Parameters
+        ----------
+        max_width : int | None
+            Requested maximum width in pixels.
+
+        Returns
+        -------
+        int | None
+            Smallest bucket covering the requested width, or None when no
+            width was requested or it exceeds the largest bucket.
+        """
+        if not max_width or max_width <= 0:
+            return None
+        for bucket in THUMBNAIL_WIDTH_BUCKETS:
+            if max_width <= bucket:
+                return bucket
+        return None
+
+    def get_thumbnail(
+        self,
+        file_path: Path,
+        *,
+        page_number: int,
+        bucket: int,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> ComicThumbnail | None:
+        """Get a page thumbnail, rendering the whole comic's set if needed.
+
+        Parameters
+        ----------
+        file_path : Path
+            Archive path.
+        page_number : int
+            Page number (1-based), already validated against ``metadata``.
+        bucket : int
+            Thumbnail width bucket (see `bucket_for`).
+        metadata : ArchiveMetadata
+            Archive metadata from the metadata provider.
+        handler : ArchiveHandler
+            Handler for the archive format.
+
+        Returns
+        -------
+        ComicThumbnail | None
+            Cached thumbnail, or None if the page could not be decoded.
+        """
+        key = self._set_key(file_path, metadata, bucket)
+        self._ensure_rendered(key, file_path, bucket, metadata, handler)
+        path = self._cache_dir / key / f"{page_number:05d}{_IMAGE_SUFFIX}"
+        if not path.exists():
+            return None
+        self._lru.touch(key)
+        return ComicThumbnail(
+            path=path,
+            etag=f'"{metadata.last_modified_ns:x}-w{bucket}-p{page_number}"',
+            last_modified=metadata.last_modified_ns / 1e9,
+        )
+
+    def get_sprite_sheet(
+        self,
+        file_path: Path,
+        *,
+        bucket: int,
+        columns: int,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> ComicSpriteSheet:
+        """Get a sprite sheet of every page thumbnail of a comic.
+
+        Parameters
+        ----------
+        file_path : Path
+            Archive path.
+        bucket : int
+            Thumbnail width bucket (see `bucket_for`); bounds the cell width.
+        columns : int
+            Number of cells per row.
+        metadata : ArchiveMetadata
+            Archive metadata from the metadata provider.
+        handler : ArchiveHandler
+            Handler for the archive format.
+
+        Returns
+        -------
+        ComicSpriteSheet
+            Cached sprite sheet and its layout.
+
+        Raises
+        ------
+        ImageProcessingError
+            If the sheet would be too tall to encode; more columns are needed.
+        """
+        key = self._set_key(file_path, metadata, bucket)
+        self._ensure_rendered(key, file_path, bucket, metadata, handler)
+        page_count = len(metadata.page_filenames)
+        rows = max(1, math.ceil(page_count / columns))
+        path = self._cache_dir / key / f"sprite-c{columns}{_IMAGE_SUFFIX}"
+
+        with self._set_lock(key):
+            if not path.exists():
+                self._render_sprite(key, path, page_count, columns, rows)
+        self._lru.touch(key)
+
+        with Image.open(path) as sprite:
+            cell_width = sprite.width // columns
+            cell_height = sprite.height // rows
+        return ComicSpriteSheet(
+            path=path,
+            etag=f'"{metadata.last_modified_ns:x}-w{bucket}-c{columns}"',
+            last_modified=metadata.last_modified_ns / 1e9,
+            page_count=page_count,
+            columns=columns,
+            rows=rows,
+            cell_width=cell_width,
+            cell_height=cell_height,
+        )
+
+    def clear(self) -> None:
+        """Remove every cached thumbnail from disk."""
+        self._lru.clear()
+
+    def _set_key(self, file_path: Path, metadata: ArchiveMetadata, bucket: int) -> str:
+        identity = f"{file_path.resolve()}\0{metadata.last_modified_ns}"
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+        return f"{digest}-w{bucket}"
+
+    def _set_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._set_locks.setdefault(key, threading.Lock())
+
+    def _ensure_rendered(
+        self,
+        key: str,
+        file_path: Path,
+        bucket: int,
+        metadata: ArchiveMetadata,
+        handler: ArchiveHandler,
+    ) -> None:
+        """Render every page's thumbnail once, serialised per set."""
+        set_dir = self._cache_dir / key
+        marker = set_dir / _COMPLETE_MARKER
+        if marker.exists():
+            return
+        with self._set_lock(key):
+            if marker.exists():
+                return
+            # Scan earlier runs before new thumbnails land on disk
+            self._lru.load()
+            set_dir.mkdir(parents=True, exist_ok=True)
+            page_numbers = {
+                name: i for i, name in enumerate(metadata.page_filenames, start=1)
+            }
+
+            def on_page(name: str, data: bytes) -> None:
+                page_number = page_numbers.get(name)
+                if page_number is None:
+                    return
+                try:
+                    thumb = _render_thumbnail(data, bucket)
+                except (OSError, ValueError, Image.DecompressionBombError) as e:
+                    logger.debug(
+                        "Cannot thumbnail page %d of %s: %s", page_number, file_path, e
+                    )
+                    return
+                self._save(key, set_dir / f"{page_number:05d}{_IMAGE_SUFFIX}", thumb)
+
+            handler.extract_pages(file_path, metadata=metadata, on_page=on_page)
+            marker.touch()
+
+    def _render_sprite(
+        self, key: str, path: Path, page_count: int, columns: int, rows: int
+    ) -> None:
+        set_dir = path.parent
+        thumbnails: list[Image.Image | None] = []
+        for page_number in range(1, page_count + 1):
+            thumb_path = set_dir / f"{page_number:05d}{_IMAGE_SUFFIX}"
+            try:
+                with Image.open(thumb_path) as thumb:
+                    thumbnails.append(thumb.convert("RGB"))
+            except OSError:
+                thumbnails.append(None)
+
+        cell_width = max((t.width for t in thumbnails if t is not None), default=1)
+        cell_height = max((t.height for t in thumbnails if t is not None), default=1)
+        if rows * cell_height > _MAX_SPRITE_HEIGHT:
+            msg = (
+                f"Sprite sheet of {page_count} pages in {columns} columns is "
+                "too tall; use more columns"
+            )
+            raise ImageProcessingError(msg)
+
+        sprite = Image.new(
+            "RGB", (columns * cell_width, rows * cell_height), (255, 255, 255)
+        )
+        for index, thumb in enumerate(thumbnails):
+            if thumb is not None:
+                row, column = divmod(index, columns)
+                sprite.paste(thumb, (column * cell_width, row * cell_height))
+        self._save(key, path, sprite)
+
+    def _save(self, key: str, path: Path, image: Image.Image) -> None:
+        """Encode an image and atomically move it into place."""
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=self._quality)
+        tmp_path = path.parent / f"{_TMP_PREFIX}{uuid4().hex}"
+        try:
+            tmp_path.write_bytes(buffer.getvalue())
+            replaced = path.stat().st_size if path.exists() else 0
+            tmp_path.replace(path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Failed to cache comic thumbnail %s: %s", path, e)
+            return
+        self._lru.record(key, buffer.tell() - replaced)
+
+
+def _render_thumbnail(data: bytes, width: int) -> Image.Image:
+    """Decode a page and scale it down to at most ``width`` pixels wide."""
+    with Image.open(io.BytesIO(data)) as img:
+        if img.width > width:
+            height = max(1, round(img.height * width / img.width))
+            # Let the JPEG decoder downscale by a power of two before resizing
+            img.draft("RGB", (width, height))
+            thumb = img.convert("RGB")
+            return thumb.resize((width, height), Image.Resampling.LANCZOS)
+        return img.convert("RGB")
@@ -39,6 +39,7 @@ from bookcard.repositories.calibre_book_repository import (
     CalibreBookRepository,
 )
 from bookcard.repositories.config_repository import LibraryRepository
+from bookcard.repositories.engine_registry import get_calibre_engine_registry
 from bookcard.services.calibre_db_initializer import (
     CalibreDatabaseInitializer,
 )
@@ -670,6 +671,10 @@ class LibraryService:
             raise ValueError(msg)
 
         self._library_repo.delete(library)
+        # Close the pooled connections (and WAL handles) to its database
+        get_calibre_engine_registry().dispose(
+            Path(library.calibre_db_path) / library.calibre_db_file
+        )
 
     def get_library_stats(self, library_id: int) -> dict[str, int | float]:
         """Get statistics for a library.
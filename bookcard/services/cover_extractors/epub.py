@@ -61,29 +61,50 @@ class EpubCoverExtractor(CoverExtractionStrategy):
                 return None
 
             root = self._parse_opf(epub_zip, opf_path)
-            opf_dir = Path(opf_path).parent
+            return self.extract_cover_from_package(epub_zip, opf_path, root)
 
-            # Find cover item using multiple strategies (following foliate-js)
-            cover_href = self._find_cover_href(root, opf_dir)
+    def extract_cover_from_package(
+        self, epub_zip: zipfile.ZipFile, opf_path: str, root: etree._Element
+    ) -> bytes | None:
+        """Extract the cover image of an open EPUB with a parsed OPF.
 
-            if cover_href is None:
-                return None
+        Parameters
+        ----------
+        epub_zip : zipfile.ZipFile
+            Open EPUB archive.
+        opf_path : str
+            OPF path within the archive.
+        root : etree._Element
+            Parsed OPF root.
+
+        Returns
+        -------
+        bytes | None
+            Cover image data as bytes, or None if no cover found.
+        """
+        opf_dir = Path(opf_path).parent
 
-            # Resolve relative path from OPF directory
-            cover_path = self._resolve_cover_path(cover_href, opf_dir)
+        # Find cover item using multiple strategies (following foliate-js)
+        cover_href = self._find_cover_href(root, opf_dir)
 
-            # Extract cover image from EPUB archive
-            try:
-                data = epub_zip.read(cover_path)
-            except (KeyError, zipfile.BadZipFile):
-                return None
-            else:
-                # Check if data looks like HTML/XHTML (starts with tags)
-                # Some EPUBs point to an HTML wrapper page instead of the image
-                if data.strip().startswith((b"<html", b"<?xml", b"<!DOCTYPE")):
-                    return self._extract_image_from_html(data, cover_path, epub_zip)
+        if cover_href is None:
+            return None
+
+        # Resolve relative path from OPF directory
+        cover_path = self._resolve_cover_path(cover_href, opf_dir)
+
+        # Extract cover image from EPUB archive
+        try:
+            data = epub_zip.read(cover_path)
+        except (KeyError, zipfile.BadZipFile):
+            return None
+        else:
+            # Check if data looks like HTML/XHTML (starts with tags)
+            # Some EPUBs point to an HTML wrapper page instead of the image
+            if data.strip().startswith((b"<html", b"<?xml", b"<!DOCTYPE")):
+                return self._extract_image_from_html(data, cover_path, epub_zip)
 
-                return data
+            return data
 
     def _find_opf_file(self, epub_zip: zipfile.ZipFile) -> str | None:
         """Find the OPF file in the EPUB archive."""
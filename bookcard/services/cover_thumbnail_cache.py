@@ -0,0 +1,260 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""On-disk cache of resized cover thumbnails.
+
+Calibre stores one full-size ``cover.jpg`` per book. Library grids, OPDS
+thumbnail links and Kobo devices only need small renditions, so this module
+generates resized JPEG/WebP variants lazily, one per (cover, size bucket,
+format), and keeps them under ``{data_directory}/cache/covers``.
+
+Variants are keyed by the cover's path, size and mtime. Replacing a cover
+therefore never serves a stale variant; `CoverThumbnailCache.invalidate`
+additionally removes the old files from disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Longest-edge sizes (in pixels) that thumbnails are rendered at.
+# Requests are rounded up to the nearest bucket so that arbitrary client sizes
+# map onto a handful of cached files.
+THUMBNAIL_SIZE_BUCKETS: tuple[int, ...] = (120, 300, 600, 1200)
+
+_TMP_PREFIX = ".tmp-"
+
+_FORMATS: dict[str, tuple[str, str]] = {
+    # format -> (Pillow format name, media type)
+    "jpeg": ("JPEG", "image/jpeg"),
+    "webp": ("WEBP", "image/webp"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CoverThumbnail:
+    """A cover rendition ready to be served.
+
+    Attributes
+    ----------
+    path : Path
+        Path to the image file (cached variant or original cover).
+    media_type : str
+        MIME type of the image.
+    etag : str
+        Strong entity tag (quoted) identifying this exact rendition.
+    last_modified : float
+        Modification time of the source cover (POSIX timestamp).
+    """
+
+    path: Path
+    media_type: str
+    etag: str
+    last_modified: float
+
+
+class CoverThumbnailCache:
+    """Generates and caches resized cover images on disk.
+
+    Parameters
+    ----------
+    cache_dir : Path | str
+        Directory where thumbnail variants are stored.
+    quality : int
+        Encoder quality for JPEG/WebP output.
+    """
+
+    def __init__(self, cache_dir: Path | str, quality: int = 85) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._quality = quality
+
+    @classmethod
+    def from_data_directory(cls, data_directory: Path | str) -> CoverThumbnailCache:
+        """Create a cache rooted in the application data directory.
+
+        Parameters
+        ----------
+        data_directory : Path | str
+            Application data directory (``AppConfig.data_directory``).
+
+        Returns
+        -------
+        CoverThumbnailCache
+            Cache storing files under ``{data_directory}/cache/covers``.
+        """
+        return cls(Path(data_directory) / "cache" / "covers")
+
+    @staticmethod
+    def bucket_for(width: int | None, height: int | None = None) -> int | None:
+        """Map a requested size to a thumbnail size bucket.
+
+        Parameters
+        ----------
+        width : int | None
+            Requested width in pixels.
+        height : int | None
+            Requested height in pixels.
+
+        Returns
+        -------
+        int | None
+            Smallest bucket covering the requested size, or None when no size
+            was requested or the request exceeds the largest bucket (in which
+            case the original cover should be served).
+        """
+        requested = max(width or 0, height or 0)
+        if requested <= 0:
+            return None
+        for bucket in THUMBNAIL_SIZE_BUCKETS:
+            if requested <= bucket:
+                return bucket
+        return None
+
+    def get(
+        self,
+        cover_path: Path,
+        *,
+        width: int | None = None,
+        height: int | None = None,
+        image_format: str = "jpeg",
+    ) -> CoverThumbnail:
+        """Get a cover rendition, generating and caching it if necessary.
+
+        Parameters
+        ----------
+        cover_path : Path
+            Path to the full-size cover image.
+        width : int | None
+            Requested width in pixels (None for the original).
+        height : int | None
+            Requested height in pixels (None for the original).
+        image_format : str
+            Output format for resized variants: 'jpeg' or 'webp'.
+
+        Returns
+        -------
+        CoverThumbnail
+            Rendition to serve. Falls back to the original cover if a variant
+            cannot be generated.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the cover image does not exist.
+        ValueError
+            If ``image_format`` is not supported.
+        """
+        if image_format not in _FORMATS:
+            msg = f"Unsupported thumbnail format: {image_format}"
+            raise ValueError(msg)
+
+        stat = cover_path.stat()
+        version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        bucket = self.bucket_for(width, height)
+
+        if bucket is None:
+            return self._original(cover_path, version, stat.st_mtime)
+
+        pil_format, media_type = _FORMATS[image_format]
+        variant_dir = self._variant_dir(cover_path)
+        variant_path = variant_dir / f"{version}_{bucket}.{image_format}"
+        etag = f'"{version}-{bucket}-{image_format}"'
+
+        if not variant_path.exists():
+            try:
+                self._generate(cover_path, variant_path, bucket, pil_format)
+            except (OSError, Image.DecompressionBombError) as exc:
+                logger.warning(
+                    "Failed to generate %dpx thumbnail for %s: %s",
+                    bucket,
+                    cover_path,
+                    exc,
+                )
+                return self._original(cover_path, version, stat.st_mtime)
+            self._remove_stale_variants(variant_dir, version)
+
+        return CoverThumbnail(
+            path=variant_path,
+            media_type=media_type,
+            etag=etag,
+            last_modified=stat.st_mtime,
+        )
+
+    def invalidate(self, cover_path: Path) -> None:
+        """Remove all cached variants of a cover.
+
+        Parameters
+        ----------
+        cover_path : Path
+            Path to the full-size cover image.
+        """
+        variant_dir = self._variant_dir(cover_path)
+        if variant_dir.exists():
+            shutil.rmtree(variant_dir, ignore_errors=True)
+
+    def _variant_dir(self, cover_path: Path) -> Path:
+        """Return the directory holding variants of a cover."""
+        digest = hashlib.sha256(str(cover_path.resolve()).encode()).hexdigest()
+        return self._cache_dir / digest[:2] / digest[2:20]
+
+    @staticmethod
+    def _original(cover_path: Path, version: str, mtime: float) -> CoverThumbnail:
+        """Describe the original cover as a rendition."""
+        return CoverThumbnail(
+            path=cover_path,
+            media_type="image/jpeg",
+            etag=f'"{version}"',
+            last_modified=mtime,
+        )
+
+    def _generate(
+        self, cover_path: Path, variant_path: Path, bucket: int, pil_format: str
+    ) -> None:
+        """Render a variant and atomically move it into place."""
+        variant_path.parent.mkdir(parents=True, exist_ok=True)
+        with Image.open(cover_path) as img:
+            # Let the JPEG decoder downscale by a power of two before resizing
+            img.draft("RGB", (bucket, bucket))
+            thumb = img.convert("RGB")
+            thumb.thumbnail((bucket, bucket), Image.Resampling.LANCZOS)
+
+        fd, tmp_name = tempfile.mkstemp(
+            dir=variant_path.parent, prefix=_TMP_PREFIX, suffix=variant_path.suffix
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                thumb.save(tmp, format=pil_format, quality=self._quality)
+            Path(tmp_name).replace(variant_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _remove_stale_variants(variant_dir: Path, version: str) -> None:
+        """Delete variants rendered from an older version of the cover."""
+        for path in variant_dir.iterdir():
+            name = path.name
+            if not name.startswith((f"{version}_", _TMP_PREFIX)):
+                path.unlink(missing_ok=True)
@@ -0,0 +1,275 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Process-wide pool of download client instances.
+
+The download monitor runs as a fresh task every cycle. `DownloadClientPool`
+keeps one client instance per client definition between cycles, so
+sessions, auth cookies and incremental sync state survive, and guards each
+client with a `CircuitBreaker` so a dead client is not polled every cycle.
+Instances are rebuilt when their definition's connection settings change.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from bookcard.models.pvr import DownloadClientDefinition
+    from bookcard.pvr.base.interfaces import DownloadTracker
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failed polls opening a client's circuit
+CIRCUIT_FAILURE_THRESHOLD = 3
+
+# Seconds an open circuit skips polls, doubled on every failed retry
+CIRCUIT_COOLDOWN_SECONDS = 300.0
+
+# Upper bound of the cooldown
+CIRCUIT_MAX_COOLDOWN_SECONDS = 3600.0
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Closed while polls succeed. After ``failure_threshold`` consecutive
+    failures it opens and rejects polls for a cooldown, then lets one poll
+    through: success closes it, failure reopens it with a doubled cooldown.
+
+    Parameters
+    ----------
+    failure_threshold : int
+        Consecutive failures opening the circuit.
+    cooldown : float
+        Seconds the circuit stays open after opening.
+    max_cooldown : float
+        Upper bound of the doubled cooldown.
+    clock : Callable[[], float]
+        Monotonic clock.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN_SECONDS,
+        max_cooldown: float = CIRCUIT_MAX_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._clock = clock
+        self._failures = 0
+        self._open_until: float | None = None
+        self._current_cooldown = cooldown
+
+    @property
+    def is_open(self) -> bool:
+        """Whether polls are currently rejected."""
+        return self._open_until is not None and self._clock() < self._open_until
+
+    def allow(self) -> bool:
+        """Check whether a poll may be attempted.
+
+        Returns
+        -------
+        bool
+            False while the circuit is open.
+        """
+        return not self.is_open
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful poll."""
+        self._failures = 0
+        self._open_until = None
+        self._current_cooldown = self._cooldown
+
+    def record_failure(self) -> None:
+        """Count a failed poll, opening the circuit if needed."""
+        self._failures += 1
+        if self._open_until is not None:
+            # The retry after a cooldown failed: back off further
+            self._current_cooldown = min(self._current_cooldown * 2, self._max_cooldown)
+        elif self._failures < self._failure_threshold:
+            return
+        self._open_until = self._clock() + self._current_cooldown
+
+
+@dataclass(eq=False)
+class PooledClient:
+    """Client instance kept between monitor cycles.
+
+    Attributes
+    ----------
+    client : DownloadTracker
+        Client instance.
+    fingerprint : Hashable
+        Connection settings the instance was built from.
+    breaker : CircuitBreaker
+        Circuit breaker of the client.
+    busy : bool
+        Whether a poll of the client is still running.
+    """
+
+    client: DownloadTracker
+    fingerprint: Hashable
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    busy: bool = False
+
+
+def client_fingerprint(definition: DownloadClientDefinition) -> Hashable:
+    """Get the connection settings of a client definition.
+
+    Parameters
+    ----------
+    definition : DownloadClientDefinition
+        Client definition.
+
+    Returns
+    -------
+    Hashable
+        Value changing whenever the client must be rebuilt.
+    """
+    return (
+        definition.client_type,
+        definition.host,
+        definition.port,
+        definition.username,
+        definition.password,
+        definition.use_ssl,
+        definition.timeout_seconds,
+        definition.category,
+        definition.download_path,
+        repr(definition.additional_settings),
+    )
+
+
+class DownloadClientPool:
+    """Thread-safe pool of tracking download clients keyed by definition ID.
+
+    Parameters
+    ----------
+    breaker_factory : Callable[[], CircuitBreaker]
+        Creates the circuit breaker of a new pooled client.
+    """
+
+    def __init__(
+        self, breaker_factory: Callable[[], CircuitBreaker] = CircuitBreaker
+    ) -> None:
+        self._breaker_factory = breaker_factory
+        self._lock = threading.Lock()
+        self._clients: dict[int, PooledClient] = {}
+
+    def checkout(
+        self,
+        definition: DownloadClientDefinition,
+        create: Callable[[], DownloadTracker | None],
+    ) -> PooledClient | None:
+        """Reserve a client for one poll.
+
+        Parameters
+        ----------
+        definition : DownloadClientDefinition
+            Client definition; must have an ID.
+        create : Callable[[], DownloadTracker | None]
+            Creates the client if none is pooled for the current settings.
+
+        Returns
+        -------
+        PooledClient | None
+            Reserved client, to pass to `release` once polled, or None if
+            the client cannot track downloads, its circuit is open, or its
+            previous poll is still running.
+        """
+        if definition.id is None:
+            return None
+        fingerprint = client_fingerprint(definition)
+        with self._lock:
+            pooled = self._clients.get(definition.id)
+            if pooled is not None and pooled.fingerprint != fingerprint:
+                pooled = None
+
+        if pooled is None:
+            client = create()
+            if client is None:
+                return None
+            pooled = PooledClient(client, fingerprint, self._breaker_factory())
+
+        with self._lock:
+            current = self._clients.get(definition.id)
+            if current is not None and current.fingerprint == fingerprint:
+                pooled = current
+            else:
+                self._clients[definition.id] = pooled
+            if pooled.busy:
+                logger.debug(
+                    "Previous poll of download client %s still running",
+                    definition.name,
+                )
+                return None
+            if not pooled.breaker.allow():
+                logger.debug("Circuit of download client %s is open", definition.name)
+                return None
+            pooled.busy = True
+            return pooled
+
+    def release(self, pooled: PooledClient) -> None:
+        """Mark a client reserved by `checkout` as idle.
+
+        Parameters
+        ----------
+        pooled : PooledClient
+            Client returned by `checkout`.
+        """
+        with self._lock:
+            pooled.busy = False
+
+    def retain(self, client_ids: set[int]) -> None:
+        """Drop pooled clients whose definitions are gone or disabled.
+
+        Parameters
+        ----------
+        client_ids : set[int]
+            IDs of the definitions to keep.
+        """
+        with self._lock:
+            for client_id in set(self._clients) - client_ids:
+                del self._clients[client_id]
+
+
+_pool: DownloadClientPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_download_client_pool() -> DownloadClientPool:
+    """Get the global download client pool.
+
+    Returns
+    -------
+    DownloadClientPool
+        Pool shared by every download monitor run of the process.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DownloadClientPool()
+        return _pool
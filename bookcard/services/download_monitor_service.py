@@ -20,9 +20,17 @@ This module provides the DownloadMonitorService which is responsible for:
 - Updating the local database with current download progress and status
 - Handling download completion and failure detection
 - reconciling local download items with remote client state
+
+Clients are polled concurrently, each within its own timeout, using
+long-lived instances from the process-wide `DownloadClientPool`; database
+updates are applied sequentially afterwards, as sessions are not
+thread-safe.
 """
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
 
 from sqlmodel import Session
 
@@ -34,10 +42,15 @@ from bookcard.models.pvr import (
     DownloadItemStatus,
     TrackedBookStatus,
 )
-from bookcard.pvr.base.interfaces import DownloadTracker
+from bookcard.pvr.base.interfaces import DownloadTracker, IncrementalDownloadTracker
 from bookcard.pvr.models import DownloadItem as ClientDownloadItem
 from bookcard.services.download.book_updater import TrackedBookStatusUpdater
 from bookcard.services.download.client_health_manager import ClientHealthManager
+from bookcard.services.download.client_pool import (
+    DownloadClientPool,
+    PooledClient,
+    get_download_client_pool,
+)
 from bookcard.services.download.client_repository import (
     DownloadClientRepository,
     SQLModelDownloadClientRepository,
@@ -71,6 +84,13 @@ logger = logging.getLogger(__name__)
 
 PENDING_CLIENT_ITEM_ID = "PENDING"
 
+# Maximum number of clients polled at the same time
+MAX_CONCURRENT_POLLS = 8
+
+# A poll may take this many request timeouts of its client (e.g., login,
+# queue and history requests)
+POLL_TIMEOUT_FACTOR = 3
+
 
 class DownloadMonitorService:
     """Service for monitoring download clients and updating local state.
@@ -91,6 +111,7 @@ class DownloadMonitorService:
         item_updater: DownloadItemUpdater | None = None,
         book_updater: TrackedBookStatusUpdater | None = None,
         clock: Clock | None = None,
+        client_pool: DownloadClientPool | None = None,
     ) -> None:
         """Initialize service.
 
@@ -118,6 +139,9 @@ class DownloadMonitorService:
             Tracked book status updater.
         clock : Clock | None
             Time provider.
+        client_pool : DownloadClientPool | None
+            Pool of client instances kept between checks; defaults to the
+            process-wide pool.
         """
         self._session = session
         self._encryptor = encryptor
@@ -133,6 +157,7 @@ class DownloadMonitorService:
             self._status_mapper, self._clock
         )
         self._book_updater = book_updater or TrackedBookStatusUpdater()
+        self._client_pool = client_pool or get_download_client_pool()
 
         if reconciler:
             self._reconciler = reconciler
@@ -151,30 +176,115 @@ class DownloadMonitorService:
     def check_downloads(self) -> None:
         """Check all enabled download clients for updates.
 
-        Iterates through all enabled download clients, fetches their active items,
-        and updates local database records. Handles connection errors by updating
-        client status.
+        Fetches the active items of all enabled download clients
+        concurrently, then updates local database records client by client.
+        Handles connection errors and timeouts by updating client status;
+        clients failing repeatedly are skipped until their circuit closes.
         """
         clients = self._client_repo.get_enabled_clients()
+        self._client_pool.retain({c.id for c in clients if c.id is not None})
 
+        polls: list[tuple[DownloadClientDefinition, PooledClient]] = []
         for client_def in clients:
             try:
-                self._process_client(client_def)
-            except (ConnectionError, TimeoutError) as e:
-                logger.warning(
-                    "Connection error checking download client %s (id=%d): %s",
-                    client_def.name,
-                    client_def.id,
-                    e,
+                pooled = self._client_pool.checkout(
+                    client_def, partial(self._create_client_instance, client_def)
                 )
-                self._update_client_health(client_def, str(e))
             except Exception as e:
                 logger.exception(
-                    "Unexpected error checking download client %s (id=%d)",
+                    "Unexpected error creating download client %s (id=%d)",
                     client_def.name,
                     client_def.id,
                 )
                 self._update_client_health(client_def, str(e))
+                continue
+            if pooled is not None:
+                polls.append((client_def, pooled))
+
+        if not polls:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(polls), MAX_CONCURRENT_POLLS),
+            thread_name_prefix="download-monitor",
+        )
+        try:
+            started_at = time.monotonic()
+            futures = [
+                (client_def, pooled, self._submit_fetch(executor, pooled))
+                for client_def, pooled in polls
+            ]
+            for client_def, pooled, future in futures:
+                deadline = started_at + POLL_TIMEOUT_FACTOR * max(
+                    client_def.timeout_seconds, 1
+                )
+                self._check_client(client_def, pooled, future, deadline)
+        finally:
+            # Timed out polls keep their thread; the client stays busy until
+            # it returns
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_fetch(
+        self, executor: ThreadPoolExecutor, pooled: PooledClient
+    ) -> Future[list[ClientDownloadItem]]:
+        """Start fetching the items of a client, releasing it when done."""
+        future = executor.submit(self._fetch_items, pooled.client)
+        future.add_done_callback(lambda _future: self._client_pool.release(pooled))
+        return future
+
+    @staticmethod
+    def _fetch_items(client: DownloadTracker) -> list[ClientDownloadItem]:
+        """Fetch the active items of a client, incrementally if supported."""
+        if isinstance(client, IncrementalDownloadTracker):
+            return list(client.sync_items())
+        return list(client.get_items())
+
+    def _check_client(
+        self,
+        client_def: DownloadClientDefinition,
+        pooled: PooledClient,
+        future: Future[list[ClientDownloadItem]],
+        deadline: float,
+    ) -> None:
+        """Wait for the items of a client and apply them to the database."""
+        try:
+            client_items = self._wait_for_items(pooled, future, deadline)
+            self._process_client(client_def, client_items)
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning(
+                "Connection error checking download client %s (id=%d): %s",
+                client_def.name,
+                client_def.id,
+                e,
+            )
+            self._update_client_health(client_def, str(e))
+        except Exception as e:
+            logger.exception(
+                "Unexpected error checking download client %s (id=%d)",
+                client_def.name,
+                client_def.id,
+            )
+            self._update_client_health(client_def, str(e))
+
+    @staticmethod
+    def _wait_for_items(
+        pooled: PooledClient,
+        future: Future[list[ClientDownloadItem]],
+        deadline: float,
+    ) -> list[ClientDownloadItem]:
+        """Wait for fetched items, recording the outcome in the client's circuit."""
+        done, _pending = wait([future], timeout=max(deadline - time.monotonic(), 0))
+        if not done:
+            pooled.breaker.record_failure()
+            msg = "Timed out fetching download client items"
+            raise TimeoutError(msg)
+        try:
+            client_items = future.result()
+        except Exception:
+            pooled.breaker.record_failure()
+            raise
+        pooled.breaker.record_success()
+        return client_items
 
     def _update_client_health(
         self, client_def: DownloadClientDefinition, error_message: str
@@ -187,16 +297,12 @@ class DownloadMonitorService:
         )
         self._session.commit()
 
-    def _process_client(self, client_def: DownloadClientDefinition) -> None:
-        """Process a single download client."""
-        # Create client instance (handling decryption)
-        client = self._create_client_instance(client_def)
-        if not client:
-            return
-
-        # Fetch items
-        client_items = list(client.get_items())
-
+    def _process_client(
+        self,
+        client_def: DownloadClientDefinition,
+        client_items: list[ClientDownloadItem],
+    ) -> None:
+        """Apply the fetched items of a download client."""
         # Update health status
         self._health_manager.update_status(client_def, DownloadClientStatus.HEALTHY)
 
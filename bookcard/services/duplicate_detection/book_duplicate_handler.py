@@ -26,14 +26,21 @@ from typing import TYPE_CHECKING
 
 from bookcard.models.config import DuplicateHandling
 from bookcard.repositories import CalibreBookRepository
+from bookcard.services.duplicate_detection.file_hash_index import (
+    FileHashIndex,
+    file_hash_detection_enabled,
+)
 from bookcard.services.duplicate_detection.strategies import (
     DirectTitleAuthorMatchStrategy,
     DuplicateDetectionStrategy,
     FilenameDuplicateStrategy,
+    FullFileHashDuplicateStrategy,
     TitleAuthorLevenshteinDuplicateStrategy,
 )
 
 if TYPE_CHECKING:
+    from sqlmodel import Session
+
     from bookcard.models.config import Library
 
 logger = logging.getLogger(__name__)
@@ -71,6 +78,8 @@ class BookDuplicateHandler:
     def __init__(
         self,
         strategies: list[DuplicateDetectionStrategy] | None = None,
+        session: "Session | None" = None,
+        use_file_hash: bool | None = None,
     ) -> None:
         """Initialize duplicate handler.
 
@@ -78,7 +87,17 @@ class BookDuplicateHandler:
         ----------
         strategies : list[DuplicateDetectionStrategy] | None
             List of detection strategies to use. If None, uses default strategies.
+        session : Session | None
+            Bookcard database session, needed by full-file-hash detection.
+        use_file_hash : bool | None
+            Whether the default strategies include full-file-hash detection
+            backed by the file hash index. None reads
+            ``BOOKCARD_DUPLICATE_FILE_HASH`` (default: disabled).
         """
+        self._session = session
+        self._use_file_hash = (
+            file_hash_detection_enabled() if use_file_hash is None else use_file_hash
+        )
         self._strategies = strategies or self._get_default_strategies()
 
     def _get_default_strategies(self) -> list[DuplicateDetectionStrategy]:
@@ -89,12 +108,17 @@ class BookDuplicateHandler:
         list[DuplicateDetectionStrategy]
             List of default strategies in priority order.
         """
-        return [
+        strategies: list[DuplicateDetectionStrategy] = [
             DirectTitleAuthorMatchStrategy(),
             TitleAuthorLevenshteinDuplicateStrategy(min_similarity=0.85),
             FilenameDuplicateStrategy(),
-            # FullFileHashDuplicateStrategy(), # - disabled by default (expensive)  # noqa: ERA001
         ]
+        # Without the index, hashing re-reads the whole library on every check
+        if self._use_file_hash and self._session is not None:
+            strategies.append(
+                FullFileHashDuplicateStrategy(index=FileHashIndex(self._session))
+            )
+        return strategies
 
     def check_duplicate(
         self,
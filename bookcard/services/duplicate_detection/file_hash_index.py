@@ -0,0 +1,492 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Persistent content-hash index of library book files.
+
+Stores the size, mtime, a partial hash and the SHA-256 of every book format
+file so full-file-hash duplicate detection only has to hash the incoming
+file. Library files are hashed once and re-hashed only when their size or
+mtime changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlmodel import col, select
+
+from bookcard.common.env import env_flag
+from bookcard.models.core import Book
+from bookcard.models.file_hash import BookFileHash
+from bookcard.models.media import Data
+from bookcard.repositories.file_hash_repository import BookFileHashRepository
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Collection
+    from pathlib import Path
+
+    from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_HASH_SIZE = 64 * 1024
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Whole-file hash detection reads every same-size library file and the
+# incoming file, so it (and hashing of newly added files) is opt-in
+FILE_HASH_DETECTION_ENV = "BOOKCARD_DUPLICATE_FILE_HASH"
+
+
+def file_hash_detection_enabled() -> bool:
+    """Check whether full-file-hash duplicate detection is enabled.
+
+    Returns
+    -------
+    bool
+        True if ``BOOKCARD_DUPLICATE_FILE_HASH`` is set to a true value
+        (default: False).
+    """
+    return env_flag(FILE_HASH_DETECTION_ENV, default=False)
+
+
+def compute_partial_hash(file_path: Path, size: int = PARTIAL_HASH_SIZE) -> str:
+    """Compute SHA-256 of the first ``size`` bytes of a file.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to file.
+    size : int
+        Number of leading bytes to hash.
+
+    Returns
+    -------
+    str
+        Hexadecimal hash string.
+    """
+    with file_path.open("rb") as f:
+        return hashlib.sha256(f.read(size)).hexdigest()
+
+
+def compute_file_hash(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Compute SHA-256 of an entire file.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to file.
+    chunk_size : int
+        Read buffer size in bytes.
+
+    Returns
+    -------
+    str
+        Hexadecimal hash string.
+    """
+    sha256 = hashlib.sha256()
+    with file_path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def locate_format_file(
+    book_dir: Path, name: str | None, book_id: int, file_format: str
+) -> Path | None:
+    """Locate the file of a book format inside its book directory.
+
+    Parameters
+    ----------
+    book_dir : Path
+        Book directory inside the library.
+    name : str | None
+        File name stem from the Data record.
+    book_id : int
+        Calibre book ID.
+    file_format : str
+        Format name.
+
+    Returns
+    -------
+    Path | None
+        Path to the file if found, None otherwise.
+    """
+    extension = file_format.lower()
+    primary = book_dir / f"{name or book_id}.{extension}"
+    if primary.exists():
+        return primary
+    alt = book_dir / f"{book_id}.{extension}"
+    if alt.exists():
+        return alt
+    return None
+
+
+@dataclass
+class FileHashBackfillResult:
+    """Outcome of a backfill run.
+
+    Attributes
+    ----------
+    hashed : int
+        Files hashed because they were new or their size/mtime changed.
+    unchanged : int
+        Files whose index record was still current.
+    missing : int
+        Formats whose file could not be found on disk.
+    removed : int
+        Index records deleted because the format no longer exists.
+    cancelled : bool
+        Whether the run stopped early because of cancellation.
+    """
+
+    hashed: int = 0
+    unchanged: int = 0
+    missing: int = 0
+    removed: int = 0
+    cancelled: bool = False
+
+
+class FileHashIndex:
+    """Maintains and queries the book file content-hash index.
+
+    Parameters
+    ----------
+    session : Session
+        Bookcard database session holding the index table.
+    chunk_size : int
+        Read buffer size used for full-file hashing.
+    """
+
+    def __init__(self, session: Session, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._session = session
+        self._repo = BookFileHashRepository(session)
+        self._chunk_size = chunk_size
+
+    def record_file(
+        self,
+        *,
+        library_id: int,
+        book_id: int,
+        file_format: str,
+        file_path: Path,
+    ) -> None:
+        """Index a book format file and flush.
+
+        The record is committed with the caller's transaction.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        book_id : int
+            Calibre book ID.
+        file_format : str
+            Format name (any case, leading dot allowed).
+        file_path : Path
+            Path to the file inside the library.
+        """
+        self._index_file(library_id, book_id, _normalize_format(file_format), file_path)
+        self._session.flush()
+
+    def remove(
+        self,
+        *,
+        library_id: int,
+        book_id: int,
+        file_format: str | None = None,
+    ) -> None:
+        """Remove a book, or one of its formats, from the index and flush.
+
+        The removal is committed with the caller's transaction.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        book_id : int
+            Calibre book ID.
+        file_format : str | None
+            Format name. If None, all formats of the book are removed.
+        """
+        self._repo.delete_for_book(
+            library_id,
+            book_id,
+            _normalize_format(file_format) if file_format else None,
+        )
+        self._session.flush()
+
+    def find_duplicate(
+        self,
+        *,
+        library_id: int,
+        calibre_session: Session,
+        library_path: Path,
+        file_path: Path,
+        file_format: str,
+        content_hash: Callable[[Path], str] | None = None,
+    ) -> int | None:
+        """Find a library book whose format file has the same content.
+
+        Only index records with the same format and size are considered,
+        those are narrowed by partial hash, and the incoming file is fully
+        hashed only if a candidate survives. Library files of the same size
+        that are not indexed yet are indexed on the way; the new records are
+        flushed, and committed with the caller's transaction.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        calibre_session : Session
+            Calibre database session, used to locate library files.
+        library_path : Path
+            Library root path.
+        file_path : Path
+            Path to the incoming file.
+        file_format : str
+            Format name.
+        content_hash : Callable[[Path], str] | None
+            Computes the SHA-256 of the incoming file, e.g. from a cache
+            (default: hash the file).
+
+        Returns
+        -------
+        int | None
+            Book ID of the duplicate if found, None otherwise.
+
+        Raises
+        ------
+        OSError
+            If the incoming file cannot be read.
+        """
+        file_format = _normalize_format(file_format)
+        file_size = file_path.stat().st_size
+
+        self._index_unindexed(
+            library_id, calibre_session, library_path, file_format, file_size
+        )
+        candidates = self._repo.find_by_size(library_id, file_format, file_size)
+        if not candidates:
+            return None
+
+        partial_hash = compute_partial_hash(file_path)
+        candidates = [c for c in candidates if c.partial_hash == partial_hash]
+        if not candidates:
+            return None
+
+        sha256 = (
+            content_hash(file_path)
+            if content_hash is not None
+            else compute_file_hash(file_path, self._chunk_size)
+        )
+        matches = [c for c in candidates if c.sha256 == sha256]
+        if not matches:
+            return None
+
+        # Guard against records whose file changed since it was hashed
+        paths = self._resolve_paths(
+            calibre_session, library_path, file_format, [m.book_id for m in matches]
+        )
+        for match in matches:
+            current = paths.get(match.book_id)
+            if current is None:
+                continue
+            record = self._index_file(library_id, match.book_id, file_format, current)
+            if record.sha256 == sha256:
+                return match.book_id
+        return None
+
+    def backfill(
+        self,
+        *,
+        library_id: int,
+        calibre_session: Session,
+        library_path: Path,
+        check_cancelled: Callable[[], bool] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+        batch_size: int = 100,
+    ) -> FileHashBackfillResult:
+        """Bring the index of a library in line with its files.
+
+        Hashes formats that are not indexed or whose size/mtime changed and
+        drops records of formats that no longer exist.
+
+        Parameters
+        ----------
+        library_id : int
+            Library ID.
+        calibre_session : Session
+            Calibre database session.
+        library_path : Path
+            Library root path.
+        check_cancelled : Callable[[], bool] | None
+            Polled between files; returning True stops the run.
+        on_progress : Callable[[int, int], None] | None
+            Called as ``(files_processed, total_files)``.
+        batch_size : int
+            Number of files between commits.
+
+        Returns
+        -------
+        FileHashBackfillResult
+            Counters describing the run.
+        """
+        result = FileHashBackfillResult()
+        stmt = select(Data.book, Data.format, Data.name, Book.path).join(
+            Book, col(Book.id) == Data.book
+        )
+        rows = calibre_session.exec(stmt).all()
+        stale_keys = self._repo.list_keys(library_id)
+
+        for processed, (book_id, raw_format, name, book_path) in enumerate(
+            rows, start=1
+        ):
+            if check_cancelled is not None and check_cancelled():
+                result.cancelled = True
+                break
+
+            file_format = _normalize_format(raw_format)
+            stale_keys.discard((book_id, file_format))
+            file_path = locate_format_file(
+                library_path / book_path, name, book_id, file_format
+            )
+            if file_path is None:
+                result.missing += 1
+            else:
+                try:
+                    if self._needs_hash(library_id, book_id, file_format, file_path):
+                        self._index_file(library_id, book_id, file_format, file_path)
+                        result.hashed += 1
+                    else:
+                        result.unchanged += 1
+                except OSError as exc:
+                    logger.warning("Failed to hash '%s': %s", file_path, exc)
+                    result.missing += 1
+
+            if processed % batch_size == 0:
+                self._session.commit()
+            if on_progress is not None:
+                on_progress(processed, len(rows))
+
+        if not result.cancelled:
+            for book_id, file_format in stale_keys:
+                self._repo.delete_for_book(library_id, book_id, file_format)
+            result.removed = len(stale_keys)
+        self._session.commit()
+        return result
+
+    def _needs_hash(
+        self, library_id: int, book_id: int, file_format: str, file_path: Path
+    ) -> bool:
+        record = self._repo.get_for_format(library_id, book_id, file_format)
+        return record is None or not _is_current(record, file_path.stat())
+
+    def _index_file(
+        self, library_id: int, book_id: int, file_format: str, file_path: Path
+    ) -> BookFileHash:
+        """Create or refresh a record, hashing only if size/mtime changed."""
+        stat = file_path.stat()
+        record = self._repo.get_for_format(library_id, book_id, file_format)
+        if record is not None and _is_current(record, stat):
+            return record
+
+        if record is None:
+            record = BookFileHash(
+                library_id=library_id,
+                book_id=book_id,
+                format=file_format,
+                file_size=0,
+                file_mtime=0.0,
+                partial_hash="",
+                sha256="",
+            )
+        record.file_size = stat.st_size
+        record.file_mtime = stat.st_mtime
+        record.partial_hash = compute_partial_hash(file_path)
+        record.sha256 = compute_file_hash(file_path, self._chunk_size)
+        record.updated_at = datetime.now(UTC)
+        self._repo.add(record)
+        self._repo.flush()
+        return record
+
+    def _index_unindexed(
+        self,
+        library_id: int,
+        calibre_session: Session,
+        library_path: Path,
+        file_format: str,
+        file_size: int,
+    ) -> None:
+        """Index same-size library files that have no record yet.
+
+        Calibre records the file size in ``data.uncompressed_size`` so files
+        that could match can be found without touching the disk.
+        """
+        stmt = select(Data.book).where(
+            Data.format == file_format, Data.uncompressed_size == file_size
+        )
+        indexed = self._repo.list_book_ids(library_id, file_format)
+        book_ids = [
+            book_id
+            for book_id in calibre_session.exec(stmt).all()
+            if book_id not in indexed
+        ]
+        if not book_ids:
+            return
+        paths = self._resolve_paths(
+            calibre_session, library_path, file_format, book_ids
+        )
+        for book_id, path in paths.items():
+            try:
+                self._index_file(library_id, book_id, file_format, path)
+            except OSError as exc:
+                logger.warning("Failed to hash '%s': %s", path, exc)
+
+    @staticmethod
+    def _resolve_paths(
+        calibre_session: Session,
+        library_path: Path,
+        file_format: str,
+        book_ids: Collection[int],
+    ) -> dict[int, Path]:
+        """Map book IDs to the on-disk file of the given format."""
+        stmt = (
+            select(Book.id, Book.path, Data.name)
+            .join(Data, col(Data.book) == Book.id)
+            .where(Data.format == file_format, col(Book.id).in_(book_ids))
+        )
+        paths: dict[int, Path] = {}
+        for book_id, book_path, name in calibre_session.exec(stmt).all():
+            if book_id is None:
+                continue
+            path = locate_format_file(
+                library_path / book_path, name, book_id, file_format
+            )
+            if path is not None:
+                paths[book_id] = path
+        return paths
+
+
+def _normalize_format(file_format: str) -> str:
+    return file_format.upper().lstrip(".")
+
+
+def _is_current(record: BookFileHash, stat: os.stat_result) -> bool:
+    return record.file_size == stat.st_size and record.file_mtime == stat.st_mtime
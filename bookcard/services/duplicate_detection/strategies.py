@@ -19,7 +19,6 @@ Uses Strategy pattern for pluggable detection algorithms.
 Follows SRP, IOC, and SOC principles.
 """
 
-import hashlib
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -33,9 +32,16 @@ from bookcard.repositories.filename_utils import (
     calculate_book_path,
     sanitize_filename,
 )
-from bookcard.services.library_scanning.matching.exact import normalize_name
-from bookcard.services.library_scanning.matching.fuzzy import (
-    levenshtein_distance,
+from bookcard.services.book_file_probe import get_book_file_probe
+from bookcard.services.duplicate_detection.file_hash_index import (
+    FileHashIndex,
+    compute_file_hash,
+    locate_format_file,
+)
+from bookcard.services.duplicate_detection.title_author_index import (
+    TitleAuthorIndexRegistry,
+    build_search_key,
+    get_title_author_index_registry,
 )
 
 if TYPE_CHECKING:
@@ -88,24 +94,33 @@ class DuplicateDetectionStrategy(ABC):
 class TitleAuthorLevenshteinDuplicateStrategy(DuplicateDetectionStrategy):
     """Detect duplicates using title and author with Levenshtein distance.
 
-    Compares normalized title+author combination against existing books.
-    Uses Levenshtein distance for fuzzy matching.
+    Compares the normalized title+author combination against existing books.
+    A per-library trigram index narrows the library down to the few keys
+    that can reach the threshold before any distance is computed.
     """
 
-    def __init__(self, min_similarity: float = 0.85) -> None:
+    def __init__(
+        self,
+        min_similarity: float = 0.85,
+        index_registry: TitleAuthorIndexRegistry | None = None,
+    ) -> None:
         """Initialize strategy.
 
         Parameters
         ----------
         min_similarity : float
             Minimum similarity threshold (0.0-1.0, default: 0.85).
+        index_registry : TitleAuthorIndexRegistry | None
+            Registry of per-library title/author indexes. If None, uses the
+            process-wide registry.
         """
         self._min_similarity = min_similarity
+        self._index_registry = index_registry or get_title_author_index_registry()
 
     def find_duplicate(
         self,
         session: Session,
-        library: "Library",  # noqa: ARG002
+        library: "Library",
         file_path: Path,  # noqa: ARG002
         title: str | None,
         author_name: str | None,
@@ -118,7 +133,7 @@ class TitleAuthorLevenshteinDuplicateStrategy(DuplicateDetectionStrategy):
         session : Session
             Database session.
         library : Library
-            Library configuration (required by interface).
+            Library configuration, selects the title/author index.
         file_path : Path
             File path (required by interface).
         title : str | None
@@ -131,77 +146,25 @@ class TitleAuthorLevenshteinDuplicateStrategy(DuplicateDetectionStrategy):
         Returns
         -------
         int | None
-            Book ID of duplicate if found, None otherwise.
+            Book ID of the most similar duplicate if found, None otherwise.
         """
         if not title:
             return None
 
-        # Normalize title and author
-        normalized_title = normalize_name(title)
-        normalized_author = normalize_name(author_name) if author_name else ""
-
-        # Build search key: title + author
-        search_key = f"{normalized_title} {normalized_author}".strip()
+        index = self._index_registry.get(library)
+        match = index.find_best(session, title, author_name, self._min_similarity)
+        if match is None:
+            return None
 
-        # Query books with authors
-        stmt = (
-            select(Book, Author.name.label("author_name"))  # type: ignore[attr-defined]
-            .outerjoin(BookAuthorLink, Book.id == BookAuthorLink.book)
-            .outerjoin(Author, BookAuthorLink.author == Author.id)
-            .where(Book.title != None)  # noqa: E711
+        logger.debug(
+            "Duplicate found via title+author Levenshtein: "
+            "book_id=%d, similarity=%.3f, new='%s', existing='%s'",
+            match.book_id,
+            match.similarity,
+            build_search_key(title, author_name),
+            match.key,
         )
-
-        books_with_authors = session.exec(stmt).all()
-
-        # Check each book for similarity
-        for book, db_author_name in books_with_authors:
-            if not book.title:
-                continue
-
-            db_title = normalize_name(book.title)
-            db_author = normalize_name(db_author_name) if db_author_name else ""
-            db_search_key = f"{db_title} {db_author}".strip()
-
-            # Calculate similarity
-            similarity = self._calculate_similarity(search_key, db_search_key)
-
-            if similarity >= self._min_similarity:
-                logger.debug(
-                    "Duplicate found via title+author Levenshtein: "
-                    "book_id=%d, similarity=%.3f, new='%s', existing='%s'",
-                    book.id,
-                    similarity,
-                    search_key,
-                    db_search_key,
-                )
-                return book.id
-
-        return None
-
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """Calculate Levenshtein-based similarity between two strings.
-
-        Parameters
-        ----------
-        str1 : str
-            First string.
-        str2 : str
-            Second string.
-
-        Returns
-        -------
-        float
-            Similarity score (0.0-1.0).
-        """
-        if not str1 or not str2:
-            return 0.0
-
-        max_len = max(len(str1), len(str2))
-        if max_len == 0:
-            return 1.0
-
-        distance = levenshtein_distance(str1, str2)
-        return 1.0 - (distance / max_len)
+        return match.book_id
 
 
 class FilenameDuplicateStrategy(DuplicateDetectionStrategy):
@@ -349,18 +312,26 @@ class FilenameDuplicateStrategy(DuplicateDetectionStrategy):
 class FullFileHashDuplicateStrategy(DuplicateDetectionStrategy):
     """Detect duplicates by computing full file hash.
 
-    Most accurate but slower strategy. Computes SHA-256 hash of entire file.
+    Most accurate strategy. Computes SHA-256 hash of entire file. With a
+    `FileHashIndex` the check is an indexed lookup; without one every file
+    of the same format in the library is re-hashed.
     """
 
-    def __init__(self, chunk_size: int = 8192) -> None:
+    def __init__(
+        self, chunk_size: int = 8192, index: FileHashIndex | None = None
+    ) -> None:
         """Initialize strategy.
 
         Parameters
         ----------
         chunk_size : int
             Chunk size for reading file (default: 8192 bytes).
+        index : FileHashIndex | None
+            Persistent content-hash index. If None, falls back to hashing
+            every existing file of the same format.
         """
         self._chunk_size = chunk_size
+        self._index = index
 
     def find_duplicate(
         self,
@@ -400,9 +371,14 @@ class FullFileHashDuplicateStrategy(DuplicateDetectionStrategy):
         if not file_path.exists():
             return None
 
+        if self._index is not None and library.id is not None:
+            return self._find_indexed_duplicate(
+                session, library, file_path, file_format
+            )
+
         try:
-            # Compute hash of the new file
-            new_file_hash = self._compute_file_hash(file_path)
+            # Hash of the new file, usually cached by the upload's probe
+            new_file_hash = get_book_file_probe().content_hash(file_path)
             logger.debug(
                 "Computed hash for new file: %s (first 16 chars: %s)",
                 file_path,
@@ -465,6 +441,53 @@ class FullFileHashDuplicateStrategy(DuplicateDetectionStrategy):
 
         return None
 
+    def _find_indexed_duplicate(
+        self,
+        session: Session,
+        library: "Library",
+        file_path: Path,
+        file_format: str,
+    ) -> int | None:
+        """Find duplicate through the persistent content-hash index.
+
+        Parameters
+        ----------
+        session : Session
+            Calibre database session.
+        library : Library
+            Library configuration.
+        file_path : Path
+            Path to the book file.
+        file_format : str
+            File format extension.
+
+        Returns
+        -------
+        int | None
+            Book ID of duplicate if found, None otherwise.
+        """
+        if self._index is None or library.id is None:
+            return None
+        try:
+            book_id = self._index.find_duplicate(
+                library_id=library.id,
+                calibre_session=session,
+                library_path=self._get_library_path(library),
+                file_path=file_path,
+                file_format=file_format,
+                content_hash=get_book_file_probe().content_hash,
+            )
+        except OSError as exc:
+            logger.warning("Failed to compute file hash for '%s': %s", file_path, exc)
+            return None
+        if book_id is not None:
+            logger.debug(
+                "Duplicate found via file hash index: book_id=%d, file='%s'",
+                book_id,
+                file_path,
+            )
+        return book_id
+
     def _get_library_path(self, library: "Library") -> Path:
         """Get library root path.
 
@@ -513,20 +536,9 @@ class FullFileHashDuplicateStrategy(DuplicateDetectionStrategy):
         Path | None
             Path to the book file if found, None otherwise.
         """
-        book_dir = library_path / book.path
-
-        # Primary path: {name}.{format}
-        file_name = data.name or str(book_id)
-        primary = book_dir / f"{file_name}.{data.format.lower()}"
-        if primary.exists():
-            return primary
-
-        # Alternative path: {book_id}.{format}
-        alt = book_dir / f"{book_id}.{data.format.lower()}"
-        if alt.exists():
-            return alt
-
-        return None
+        return locate_format_file(
+            library_path / book.path, data.name, book_id, data.format
+        )
 
     def _compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of file.
@@ -541,11 +553,7 @@ class FullFileHashDuplicateStrategy(DuplicateDetectionStrategy):
         str
             Hexadecimal hash string.
         """
-        sha256 = hashlib.sha256()
-        with file_path.open("rb") as f:
-            while chunk := f.read(self._chunk_size):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return compute_file_hash(file_path, self._chunk_size)
 
 
 class DirectTitleAuthorMatchStrategy(DuplicateDetectionStrategy):
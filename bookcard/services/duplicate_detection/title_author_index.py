@@ -0,0 +1,383 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""In-memory fuzzy index of a library's title+author keys.
+
+`TitleAuthorLevenshteinDuplicateStrategy` used to load every book/author row
+and compute a Levenshtein distance against each one for every ingested file.
+This module keeps a trigram index of the normalized ``"title author"`` keys
+per Calibre library so a check only verifies the handful of keys that can
+reach the similarity threshold.
+
+The index is brought up to date before each lookup. A single aggregate query
+(book count, link count, latest ``last_modified``) detects writes made by
+this application or by Calibre itself; changed books are re-indexed
+incrementally and anything the aggregates cannot explain (deletions,
+backdated imports) triggers a full rebuild. Entries are also rebuilt after
+``max_age`` seconds to pick up edits that do not touch ``last_modified``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String, func, type_coerce
+from sqlmodel import col, select
+
+from bookcard.models.core import Author, Book, BookAuthorLink
+from bookcard.services.fuzzy_matching import TrigramIndex
+from bookcard.services.library_scanning.matching.exact import normalize_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlmodel import Session
+
+    from bookcard.models.config import Library
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 600.0
+DEFAULT_MAX_LIBRARIES = 8
+
+# Index key: (book ID, author ID or 0 for books without authors)
+_EntryKey = tuple[int, int]
+
+
+def build_search_key(title: str, author_name: str | None) -> str:
+    """Build the normalized title+author key used for fuzzy matching.
+
+    Parameters
+    ----------
+    title : str
+        Book title.
+    author_name : str | None
+        Author name.
+
+    Returns
+    -------
+    str
+        Normalized ``"title author"`` key.
+    """
+    normalized_author = normalize_name(author_name) if author_name else ""
+    return f"{normalize_name(title)} {normalized_author}".strip()
+
+
+@dataclass(frozen=True, slots=True)
+class TitleAuthorMatch:
+    """Best fuzzy match of a title+author key.
+
+    Attributes
+    ----------
+    book_id : int
+        Calibre book ID.
+    similarity : float
+        Levenshtein similarity (0.0-1.0) between the keys.
+    key : str
+        Matched normalized key of the existing book.
+    """
+
+    book_id: int
+    similarity: float
+    key: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Fingerprint:
+    """Cheap aggregate describing the indexed rows of a library."""
+
+    book_count: int
+    link_count: int
+    max_modified: str | None
+
+
+class TitleAuthorIndex:
+    """Trigram index of the title+author keys of one Calibre library.
+
+    Thread-safe; lookups and refreshes are serialised per library.
+
+    Parameters
+    ----------
+    max_age : float
+        Seconds after which the index is rebuilt from scratch on next use.
+    """
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE_SECONDS) -> None:
+        self._max_age = max_age
+        self._index: TrigramIndex[_EntryKey] = TrigramIndex()
+        self._book_entries: dict[int, list[_EntryKey]] = {}
+        self._book_links: dict[int, int] = {}
+        self._link_count = 0
+        self._fingerprint: _Fingerprint | None = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def find_best(
+        self,
+        session: Session,
+        title: str,
+        author_name: str | None,
+        min_similarity: float,
+    ) -> TitleAuthorMatch | None:
+        """Find the existing book whose key is most similar to a title+author.
+
+        Parameters
+        ----------
+        session : Session
+            Calibre database session, used to refresh the index.
+        title : str
+            Book title.
+        author_name : str | None
+            Author name.
+        min_similarity : float
+            Minimum similarity (0.0-1.0) of a match.
+
+        Returns
+        -------
+        TitleAuthorMatch | None
+            Best match (lowest book ID on ties), or None.
+        """
+        search_key = build_search_key(title, author_name)
+        if not search_key:
+            return None
+        with self._lock:
+            self._refresh(session)
+            matches = self._index.search(search_key, min_similarity)
+            if not matches:
+                return None
+            (book_id, author_id), similarity = max(
+                matches, key=lambda match: (match[1], -match[0][0])
+            )
+            return TitleAuthorMatch(
+                book_id=book_id,
+                similarity=similarity,
+                key=self._index.text((book_id, author_id)),
+            )
+
+    def refresh(self, session: Session) -> None:
+        """Bring the index up to date with the Calibre database.
+
+        Parameters
+        ----------
+        session : Session
+            Calibre database session.
+        """
+        with self._lock:
+            self._refresh(session)
+
+    def invalidate(self) -> None:
+        """Drop all entries; the next lookup rebuilds the index."""
+        with self._lock:
+            self._clear()
+
+    def __len__(self) -> int:
+        """Get the number of indexed keys."""
+        return len(self._index)
+
+    def _refresh(self, session: Session) -> None:
+        fingerprint = self._read_fingerprint(session)
+        fresh = time.monotonic() - self._built_at < self._max_age
+        previous = self._fingerprint
+        if previous is not None and fresh:
+            if fingerprint == previous:
+                return
+            if fingerprint.book_count >= previous.book_count:
+                self._index_books(session, modified_since=previous.max_modified)
+                if (
+                    len(self._book_entries) == fingerprint.book_count
+                    and self._link_count == fingerprint.link_count
+                ):
+                    self._fingerprint = fingerprint
+                    return
+        self._rebuild(session, fingerprint)
+
+    def _rebuild(self, session: Session, fingerprint: _Fingerprint) -> None:
+        start = time.perf_counter()
+        self._clear()
+        self._index_books(session, modified_since=None)
+        self._fingerprint = fingerprint
+        self._built_at = time.monotonic()
+        logger.debug(
+            "Built title/author index: %d books, %d keys in %.3fs",
+            len(self._book_entries),
+            len(self._index),
+            time.perf_counter() - start,
+        )
+
+    def _clear(self) -> None:
+        self._index.clear()
+        self._book_entries.clear()
+        self._book_links.clear()
+        self._link_count = 0
+        self._fingerprint = None
+
+    def _index_books(self, session: Session, modified_since: str | None) -> None:
+        """(Re-)index books, all of them or those modified at/after a stamp."""
+        stmt = (
+            select(Book.id, Book.title, BookAuthorLink.author, Author.name)
+            .outerjoin(BookAuthorLink, col(Book.id) == BookAuthorLink.book)
+            .outerjoin(Author, col(BookAuthorLink.author) == Author.id)
+            .where(col(Book.title).is_not(None))
+        )
+        if modified_since is not None:
+            stmt = stmt.where(type_coerce(Book.last_modified, String) >= modified_since)
+
+        rows: dict[int, list[tuple[str, int | None, str | None]]] = {}
+        for book_id, title, author_id, author_name in session.exec(stmt).all():
+            if book_id is not None:
+                rows.setdefault(book_id, []).append((title, author_id, author_name))
+        for book_id, book_rows in rows.items():
+            self._index_book(book_id, book_rows)
+
+    def _index_book(
+        self,
+        book_id: int,
+        rows: Iterable[tuple[str, int | None, str | None]],
+    ) -> None:
+        for key in self._book_entries.pop(book_id, []):
+            self._index.remove(key)
+        self._link_count -= self._book_links.pop(book_id, 0)
+
+        entries: list[_EntryKey] = []
+        links = 0
+        for title, author_id, author_name in rows:
+            if author_id is not None:
+                links += 1
+            if not title:
+                continue
+            key: _EntryKey = (book_id, author_id or 0)
+            self._index.add(key, build_search_key(title, author_name))
+            entries.append(key)
+        # Books without a usable title still count towards the fingerprint
+        self._book_entries[book_id] = entries
+        self._book_links[book_id] = links
+        self._link_count += links
+
+    @staticmethod
+    def _read_fingerprint(session: Session) -> _Fingerprint:
+        titled = col(Book.title).is_not(None)
+        link_count = (
+            select(func.count(col(BookAuthorLink.id)))
+            .join(Book, col(Book.id) == BookAuthorLink.book)
+            .where(titled)
+            .scalar_subquery()
+        )
+        book_count, max_modified, link_count = session.exec(
+            select(
+                func.count(col(Book.id)),
+                func.max(type_coerce(Book.last_modified, String)),
+                link_count,
+            ).where(titled)
+        ).one()
+        return _Fingerprint(
+            book_count=int(book_count or 0),
+            link_count=int(link_count or 0),
+            max_modified=str(max_modified) if max_modified is not None else None,
+        )
+
+
+class TitleAuthorIndexRegistry:
+    """Keeps one `TitleAuthorIndex` per Calibre library.
+
+    Parameters
+    ----------
+    max_libraries : int
+        Maximum number of library indexes kept in memory (LRU).
+    max_age : float
+        Full-rebuild interval passed to each index.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_libraries: int = DEFAULT_MAX_LIBRARIES,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        self._max_libraries = max_libraries
+        self._max_age = max_age
+        self._indexes: OrderedDict[str, TitleAuthorIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, library: Library) -> TitleAuthorIndex:
+        """Get the index of a library, creating it if needed.
+
+        Parameters
+        ----------
+        library : Library
+            Library configuration.
+
+        Returns
+        -------
+        TitleAuthorIndex
+            Index for the library's Calibre database.
+        """
+        key = self._library_key(library)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = TitleAuthorIndex(max_age=self._max_age)
+                self._indexes[key] = index
+                while len(self._indexes) > self._max_libraries:
+                    self._indexes.popitem(last=False)
+            else:
+                self._indexes.move_to_end(key)
+            return index
+
+    def invalidate(self, library: Library | None = None) -> None:
+        """Drop the index of a library, or of every library.
+
+        Parameters
+        ----------
+        library : Library | None
+            Library whose index to drop. If None, all indexes are dropped.
+        """
+        with self._lock:
+            if library is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(self._library_key(library), None)
+
+    @staticmethod
+    def _library_key(library: Library) -> str:
+        return str(Path(library.calibre_db_path) / library.calibre_db_file)
+
+
+# Global registry instance
+_registry: TitleAuthorIndexRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_title_author_index_registry() -> TitleAuthorIndexRegistry:
+    """Get the process-wide title/author index registry.
+
+    Returns
+    -------
+    TitleAuthorIndexRegistry
+        Global registry instance.
+    """
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            registry = _registry
+            if registry is None:
+                registry = _registry = TitleAuthorIndexRegistry()
+    return registry
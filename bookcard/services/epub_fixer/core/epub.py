@@ -17,16 +17,125 @@
 
 Provides EPUBContents data class and EPUBReader/EPUBWriter classes
 following Single Responsibility Principle.
+
+Only text entries (XHTML, OPF, NCX, CSS, ...) are decoded when an EPUB is
+read; binary entries are read from the archive on access.  On write,
+entries that were not modified are copied byte-for-byte from the source
+archive without being decompressed and recompressed, and the archive is
+streamed to a temporary file that replaces the output atomically.
 """
 
+import copy
+import os
+import shutil
+import struct
+import tempfile
 import zipfile
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 if TYPE_CHECKING:
     from bookcard.models.epub_fixer import EPUBFixType
 
+# Extensions of entries decoded as text when reading an EPUB
+TEXT_EXTENSIONS = frozenset({"html", "xhtml", "htm", "xml", "svg", "css", "opf", "ncx"})
+
+# Bytes per read when copying raw entry data
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Permissions of newly created EPUB files
+_DEFAULT_FILE_MODE = 0o644
+
+# Data descriptor flag; copied entries carry their sizes in the local header
+_FLAG_DATA_DESCRIPTOR = 0x08
+
+# Indexes of the name and extra field lengths in an unpacked local header
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+
+# Undocumented ``zipfile`` internals the raw entry copy relies on
+_ZIPFILE_MODULE_INTERNALS = ("structFileHeader", "sizeFileHeader", "stringFileHeader")
+_ZIPFILE_WRITER_INTERNALS = ("start_dir", "filelist", "NameToInfo", "_didModify")
+
+
+def is_text_entry(filename: str) -> bool:
+    """Return whether an EPUB entry is decoded as text.
+
+    Parameters
+    ----------
+    filename : str
+        Entry name within the archive.
+
+    Returns
+    -------
+    bool
+        True for the ``mimetype`` entry and markup/stylesheet entries.
+    """
+    ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    return filename == "mimetype" or ext in TEXT_EXTENSIONS
+
+
+class ArchiveBinaryFiles(MutableMapping[str, bytes]):
+    """Binary entries of an EPUB, read from the archive on access.
+
+    Entries that are never assigned stay in the source archive and are
+    not held in memory.  Assigned entries are kept in memory and written
+    out when the EPUB is saved.
+
+    Parameters
+    ----------
+    archive_path : Path
+        Source EPUB archive.
+    names : list[str]
+        Names of the binary entries in archive order.
+    """
+
+    def __init__(self, archive_path: Path, names: list[str]) -> None:
+        self._archive_path = archive_path
+        # None marks an entry whose data still lives in the archive
+        self._entries: dict[str, bytes | None] = dict.fromkeys(names)
+
+    def is_pristine(self, name: str) -> bool:
+        """Return whether an entry is unmodified since it was read.
+
+        Parameters
+        ----------
+        name : str
+            Entry name.
+
+        Returns
+        -------
+        bool
+            True if the entry's data can be copied from the archive.
+        """
+        return name in self._entries and self._entries[name] is None
+
+    def __getitem__(self, name: str) -> bytes:
+        """Get an entry's data, reading it from the archive if needed."""
+        data = self._entries[name]
+        if data is not None:
+            return data
+        with zipfile.ZipFile(self._archive_path, "r") as zip_ref:
+            return zip_ref.read(name)
+
+    def __setitem__(self, name: str, data: bytes) -> None:
+        """Replace or add an entry."""
+        self._entries[name] = data
+
+    def __delitem__(self, name: str) -> None:
+        """Remove an entry."""
+        del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over entry names."""
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._entries)
+
 
 @dataclass
 class EPUBContents:
@@ -36,15 +145,45 @@ class EPUBContents:
     ----------
     files : dict[str, str]
         Text-based files (HTML, XML, CSS, etc.) mapped by filename.
-    binary_files : dict[str, bytes]
-        Binary files (images, fonts, etc.) mapped by filename.
+    binary_files : MutableMapping[str, bytes]
+        Binary files (images, fonts, etc.) mapped by filename.  Read lazily
+        when the contents come from `EPUBReader`.
     entries : list[str]
         List of all file entries in the EPUB archive.
+    source_path : Path | None
+        Archive the contents were read from, if any.
+    original_files : dict[str, str]
+        Text files as read, used to detect modified entries.
     """
 
     files: dict[str, str] = field(default_factory=dict)
-    binary_files: dict[str, bytes] = field(default_factory=dict)
+    binary_files: MutableMapping[str, bytes] = field(default_factory=dict)
     entries: list[str] = field(default_factory=list)
+    source_path: Path | None = None
+    original_files: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def is_pristine(self, filename: str) -> bool:
+        """Return whether an entry can be copied unchanged from the source.
+
+        Parameters
+        ----------
+        filename : str
+            Entry name.
+
+        Returns
+        -------
+        bool
+            True if the entry was read from `source_path` and not modified.
+        """
+        if self.source_path is None or filename not in self.entries:
+            return False
+        if filename in self.files:
+            original = self.original_files.get(filename)
+            return original is not None and self.files[filename] == original
+        binary_files = self.binary_files
+        return isinstance(
+            binary_files, ArchiveBinaryFiles
+        ) and binary_files.is_pristine(filename)
 
 
 @dataclass
@@ -103,36 +242,29 @@ class EPUBReader:
             msg = f"EPUB file not found: {epub_path}"
             raise FileNotFoundError(msg)
 
-        contents = EPUBContents()
-
         with zipfile.ZipFile(epub_path, "r") as zip_ref:
-            contents.entries = zip_ref.namelist()
-
-            for filename in contents.entries:
-                ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
-                if filename == "mimetype" or ext in [
-                    "html",
-                    "xhtml",
-                    "htm",
-                    "xml",
-                    "svg",
-                    "css",
-                    "opf",
-                    "ncx",
-                ]:
+            entries = zip_ref.namelist()
+            files: dict[str, str] = {}
+            binary_names: list[str] = []
+
+            for filename in entries:
+                if is_text_entry(filename):
+                    data = zip_ref.read(filename)
                     try:
-                        contents.files[filename] = zip_ref.read(filename).decode(
-                            "utf-8"
-                        )
+                        files[filename] = data.decode("utf-8")
                     except UnicodeDecodeError:
                         # Fallback to latin-1 if UTF-8 fails
-                        contents.files[filename] = zip_ref.read(filename).decode(
-                            "latin-1"
-                        )
+                        files[filename] = data.decode("latin-1")
                 else:
-                    contents.binary_files[filename] = zip_ref.read(filename)
+                    binary_names.append(filename)
 
-        return contents
+        return EPUBContents(
+            files=files,
+            binary_files=ArchiveBinaryFiles(epub_path, binary_names),
+            entries=entries,
+            source_path=epub_path,
+            original_files=dict(files),
+        )
 
 
 class EPUBWriter:
@@ -144,6 +276,10 @@ class EPUBWriter:
     def write(self, contents: EPUBContents, output_path: str | Path) -> None:
         """Write EPUB file contents to disk.
 
+        Entries left unmodified since `EPUBReader.read` are copied from the
+        source archive as stored, without decompressing them.  The output
+        may be the source archive itself.
+
         Parameters
         ----------
         contents : EPUBContents
@@ -158,20 +294,149 @@ class EPUBWriter:
         """
         output_path = Path(output_path)
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
-            # First write mimetype file (must be uncompressed)
-            if "mimetype" in contents.files:
-                zip_ref.writestr(
-                    "mimetype",
-                    contents.files["mimetype"],
-                    compress_type=zipfile.ZIP_STORED,
-                )
-
-            # Add text files
-            for filename, content in contents.files.items():
-                if filename != "mimetype":
-                    zip_ref.writestr(filename, content)
-
-            # Add binary files
-            for filename, content in contents.binary_files.items():
-                zip_ref.writestr(filename, content)
+        # Stream to a sibling temporary file: the output may be the source
+        # archive that unmodified entries are copied from.
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{output_path.name}.", suffix=".tmp", dir=output_path.parent
+        )
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                self._write_archive(contents, tmp_file)
+            # mkstemp creates owner-only files; keep the output's permissions
+            mode = (
+                output_path.stat().st_mode & 0o777
+                if output_path.exists()
+                else _DEFAULT_FILE_MODE
+            )
+            tmp_path.chmod(mode)
+            tmp_path.replace(output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write_archive(self, contents: EPUBContents, fileobj: BinaryIO) -> None:
+        """Write the EPUB archive to an open binary file."""
+        names = [
+            name
+            for name in contents.entries
+            if name in contents.files or name in contents.binary_files
+        ]
+        known = set(names)
+        names += [name for name in contents.files if name not in known]
+        names += [name for name in contents.binary_files if name not in known]
+
+        source = (
+            zipfile.ZipFile(contents.source_path, "r")
+            if contents.source_path is not None
+            and any(contents.is_pristine(name) for name in names)
+            else None
+        )
+        try:
+            with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+                # First write mimetype file (must be uncompressed)
+                if "mimetype" in contents.files:
+                    zip_ref.writestr(
+                        "mimetype",
+                        contents.files["mimetype"],
+                        compress_type=zipfile.ZIP_STORED,
+                    )
+
+                for filename in names:
+                    if filename == "mimetype" and filename in contents.files:
+                        continue
+                    if source is not None and contents.is_pristine(filename):
+                        _copy_raw_entry(source, zip_ref, source.getinfo(filename))
+                    elif filename in contents.files:
+                        zip_ref.writestr(filename, contents.files[filename])
+                    else:
+                        zip_ref.writestr(filename, contents.binary_files[filename])
+        finally:
+            if source is not None:
+                source.close()
+
+
+def _copy_raw_entry(
+    source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> None:
+    """Copy an entry's compressed data between archives without recompressing.
+
+    ``zipfile`` has no public API for raw copies, so this writes the local
+    header and data itself and registers the entry with the target archive
+    the way ``ZipFile.writestr`` does.  ZIP64-sized entries, and every entry
+    if this Python's ``zipfile`` lacks the internals used, are recompressed
+    through ``zipfile`` instead.
+
+    Parameters
+    ----------
+    source : zipfile.ZipFile
+        Archive opened for reading.
+    target : zipfile.ZipFile
+        Archive opened for writing to a seekable file.
+    info : zipfile.ZipInfo
+        Entry of the source archive.
+    """
+    is_zip64 = max(info.file_size, info.compress_size) >= zipfile.ZIP64_LIMIT
+    if is_zip64 or not _supports_raw_copy(target):
+        _recompress_entry(source, target, info)
+        return
+
+    source_fp = source.fp
+    target_fp = target.fp
+    if source_fp is None or target_fp is None:
+        msg = "Archives must be open to copy entries"
+        raise ValueError(msg)
+
+    # The attributes below are private to zipfile and missing from its type
+    # stubs; _supports_raw_copy checked that they exist on this Python.
+    source_fp.seek(info.header_offset)
+    header = struct.unpack(
+        zipfile.structFileHeader,  # ty: ignore[unresolved-attribute]
+        source_fp.read(zipfile.sizeFileHeader),  # ty: ignore[unresolved-attribute]
+    )
+    if header[0] != zipfile.stringFileHeader:  # ty: ignore[unresolved-attribute]
+        msg = f"Bad local file header for {info.filename}"
+        raise zipfile.BadZipFile(msg)
+    source_fp.seek(header[_FH_FILENAME_LENGTH] + header[_FH_EXTRA_FIELD_LENGTH], 1)
+
+    copied = copy.copy(info)
+    copied.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+    target_fp.seek(target.start_dir)
+    copied.header_offset = target_fp.tell()
+    target_fp.write(copied.FileHeader(False))
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = source_fp.read(min(_COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            msg = f"Truncated data for {info.filename}"
+            raise zipfile.BadZipFile(msg)
+        target_fp.write(chunk)
+        remaining -= len(chunk)
+
+    target.filelist.append(copied)
+    target.NameToInfo[copied.filename] = copied
+    target.start_dir = target_fp.tell()
+    target._didModify = True  # noqa: SLF001  # ty: ignore[unresolved-attribute]
+
+
+def _supports_raw_copy(target: zipfile.ZipFile) -> bool:
+    """Check that ``zipfile`` still has the internals `_copy_raw_entry` uses."""
+    return (
+        all(hasattr(zipfile, name) for name in _ZIPFILE_MODULE_INTERNALS)
+        and all(hasattr(target, name) for name in _ZIPFILE_WRITER_INTERNALS)
+        and hasattr(zipfile.ZipInfo, "FileHeader")
+        and target.fp is not None
+        and target.fp.seekable()
+    )
+
+
+def _recompress_entry(
+    source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> None:
+    """Copy an entry through ``zipfile``, decompressing and recompressing it."""
+    force_zip64 = max(info.file_size, info.compress_size) >= zipfile.ZIP64_LIMIT
+    with (
+        source.open(info) as src,
+        target.open(copy.copy(info), "w", force_zip64=force_zip64) as dst,
+    ):
+        shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
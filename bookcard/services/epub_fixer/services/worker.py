@@ -0,0 +1,218 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Per-file EPUB fix worker.
+
+Runs the read → fix → backup → write cycle of one EPUB file without
+touching the database, so it can run in a worker process.  Jobs and
+outcomes are plain picklable dataclasses; the caller persists outcomes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import signal
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from bookcard.services.epub_fixer.core.epub import EPUBReader, EPUBWriter, FixResult
+from bookcard.services.epub_fixer.core.fixes import (
+    BodyIdLinkFix,
+    EncodingFix,
+    EPUBFix,
+    LanguageFix,
+    StrayImageFix,
+)
+from bookcard.services.epub_fixer.orchestrator import EPUBFixerOrchestrator
+from bookcard.services.epub_fixer.services.backup import BackupService
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Bump whenever a fix changes behaviour, so fingerprinted files are rechecked
+FIXER_VERSION = 1
+
+# Seconds a single file may take before it is abandoned
+FILE_FIX_TIMEOUT = 300
+
+
+def build_fixes(default_language: str) -> list[EPUBFix]:
+    """Build the fixes applied by scheduled scans.
+
+    Parameters
+    ----------
+    default_language : str
+        Language used when an EPUB declares none or an invalid one.
+
+    Returns
+    -------
+    list[EPUBFix]
+        Fix implementations, in application order.
+    """
+    return [
+        BodyIdLinkFix(),
+        LanguageFix(default_language=default_language),
+        StrayImageFix(),
+        EncodingFix(),
+    ]
+
+
+def compute_fixer_hash(default_language: str) -> str:
+    """Hash the fixer version and the settings that affect fix results.
+
+    Parameters
+    ----------
+    default_language : str
+        Default language passed to the language fix.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+    """
+    payload = {
+        "version": FIXER_VERSION,
+        "fixes": [type(fix).__name__ for fix in build_fixes(default_language)],
+        "default_language": default_language,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class EPUBFixJob:
+    """Work order for fixing one EPUB file.
+
+    Attributes
+    ----------
+    file_path : str
+        Path to the EPUB file.
+    default_language : str
+        Default language for the language fix.
+    backup_directory : str | None
+        Directory for backups of fixed files; None disables backups.
+    timeout : int | None
+        Seconds after which the file is abandoned; None waits indefinitely.
+    """
+
+    file_path: str
+    default_language: str
+    backup_directory: str | None = None
+    timeout: int | None = FILE_FIX_TIMEOUT
+
+
+@dataclass
+class EPUBFixOutcome:
+    """Result of an `EPUBFixJob`.
+
+    Attributes
+    ----------
+    file_path : str
+        Path to the EPUB file.
+    fix_results : list[FixResult]
+        Fixes applied (empty if the file needed none).
+    backup_path : str | None
+        Backup of the original file, if one was created.
+    size : int | None
+        File size after processing, for the fingerprint.
+    mtime_ns : int | None
+        File modification time after processing, for the fingerprint.
+    error : str | None
+        Error message if the file could not be processed.
+    """
+
+    file_path: str
+    fix_results: list[FixResult] = field(default_factory=list)
+    backup_path: str | None = None
+    size: int | None = None
+    mtime_ns: int | None = None
+    error: str | None = None
+
+
+class FileFixTimeoutError(TimeoutError):
+    """Raised when fixing a file exceeds its timeout."""
+
+
+@contextmanager
+def _time_limit(seconds: int | None) -> Iterator[None]:
+    """Raise `FileFixTimeoutError` if the block runs longer than ``seconds``.
+
+    Uses ``SIGALRM``, so the limit only applies on platforms that have it
+    and on the main thread (as in pool worker processes).
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _on_alarm(_signum: int, _frame: object) -> None:
+        msg = f"Timed out after {seconds}s"
+        raise FileFixTimeoutError(msg)
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def fix_epub_file(job: EPUBFixJob) -> EPUBFixOutcome:
+    """Fix one EPUB file in place.
+
+    The original is backed up only when fixes were found, right before
+    the fixed file replaces it.
+
+    Parameters
+    ----------
+    job : EPUBFixJob
+        File to fix and fix settings.
+
+    Returns
+    -------
+    EPUBFixOutcome
+        Applied fixes and the file's new fingerprint; never raises.
+    """
+    path = Path(job.file_path)
+    outcome = EPUBFixOutcome(file_path=job.file_path)
+    try:
+        with _time_limit(job.timeout):
+            stat = path.stat()
+            contents = EPUBReader().read(path)
+            fix_results = EPUBFixerOrchestrator(
+                build_fixes(job.default_language)
+            ).process(contents)
+            if fix_results:
+                if job.backup_directory is not None:
+                    outcome.backup_path = BackupService(
+                        job.backup_directory
+                    ).create_backup(path)
+                EPUBWriter().write(contents, path)
+                stat = path.stat()
+            outcome.fix_results = fix_results
+            outcome.size = stat.st_size
+            outcome.mtime_ns = stat.st_mtime_ns
+    except Exception as exc:  # noqa: BLE001
+        outcome.error = str(exc) or type(exc).__name__
+    return outcome
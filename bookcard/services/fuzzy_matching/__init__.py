@@ -0,0 +1,36 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Fuzzy string matching primitives.
+
+Provides a bounded Levenshtein distance with early termination and an
+in-memory trigram index that narrows a large set of strings down to a small
+candidate set before any distance is computed.
+"""
+
+from bookcard.services.fuzzy_matching.distance import (
+    levenshtein_distance,
+    max_edit_distance,
+    similarity_score,
+)
+from bookcard.services.fuzzy_matching.trigram_index import TrigramIndex, trigrams
+
+__all__ = [
+    "TrigramIndex",
+    "levenshtein_distance",
+    "max_edit_distance",
+    "similarity_score",
+    "trigrams",
+]
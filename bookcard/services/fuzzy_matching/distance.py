@@ -0,0 +1,156 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Bounded Levenshtein distance and similarity.
+
+Matching callers only care whether two strings are within a similarity
+threshold, so the distance can be computed in a diagonal band of width
+``2k + 1`` and abandoned as soon as every cell of a row exceeds ``k``.
+"""
+
+from __future__ import annotations
+
+import math
+
+# Absorbs float error in (1 - min_similarity) * length, e.g. 0.3 * 10
+_EPSILON = 1e-9
+
+
+def max_edit_distance(length: int, min_similarity: float) -> int:
+    """Get the largest distance that still meets a similarity threshold.
+
+    Parameters
+    ----------
+    length : int
+        Length of the longer string.
+    min_similarity : float
+        Similarity threshold (0.0-1.0).
+
+    Returns
+    -------
+    int
+        Maximum Levenshtein distance ``d`` with ``1 - d / length >= min_similarity``.
+    """
+    return max(0, math.floor((1.0 - min_similarity) * length + _EPSILON))
+
+
+def levenshtein_distance(s1: str, s2: str, max_distance: int | None = None) -> int:
+    """Calculate Levenshtein distance between two strings.
+
+    Parameters
+    ----------
+    s1 : str
+        First string.
+    s2 : str
+        Second string.
+    max_distance : int | None
+        Upper bound of interest. When given, only a band of the matrix is
+        computed and ``max_distance + 1`` is returned as soon as the distance
+        is known to exceed the bound.
+
+    Returns
+    -------
+    int
+        Levenshtein distance, or ``max_distance + 1`` if it exceeds
+        ``max_distance``.
+    """
+    if s1 == s2:
+        return 0
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    s1, s2 = _strip_common_affixes(s1, s2)
+
+    bound = len(s1) if max_distance is None else max_distance
+    if len(s1) - len(s2) > bound:
+        return bound + 1
+    if not s2:
+        return len(s1)
+    return _banded_distance(s1, s2, bound)
+
+
+def _strip_common_affixes(s1: str, s2: str) -> tuple[str, str]:
+    """Drop the common prefix and suffix, which do not affect the distance."""
+    start = 0
+    while start < len(s2) and s1[start] == s2[start]:
+        start += 1
+    end1, end2 = len(s1), len(s2)
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    return s1[start:end1], s2[start:end2]
+
+
+def _banded_distance(s1: str, s2: str, bound: int) -> int:
+    """Compute the distance within a diagonal band, capped at ``bound + 1``.
+
+    ``s1`` must be at least as long as ``s2``. Cells further than ``bound``
+    from the diagonal are at least ``bound + 1`` and are capped there.
+    """
+    len2 = len(s2)
+    cap = bound + 1
+    previous = [min(j, cap) for j in range(len2 + 1)]
+    for i, c1 in enumerate(s1, start=1):
+        low = max(1, i - bound)
+        high = min(len2, i + bound)
+        current = [cap] * (len2 + 1)
+        current[0] = min(i, cap)
+        row_min = current[0] if low == 1 else cap
+        for j in range(low, high + 1):
+            value = min(
+                previous[j - 1] + (c1 != s2[j - 1]),
+                previous[j] + 1,
+                current[j - 1] + 1,
+                cap,
+            )
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > bound:
+            return cap
+        previous = current
+    return previous[len2]
+
+
+def similarity_score(s1: str, s2: str, min_similarity: float = 0.0) -> float:
+    """Calculate similarity score between two strings (0.0 to 1.0).
+
+    Parameters
+    ----------
+    s1 : str
+        First string.
+    s2 : str
+        Second string.
+    min_similarity : float
+        Threshold below which the exact score is not needed. Scores under
+        it are reported as 0.0, which lets the distance stop early.
+
+    Returns
+    -------
+    float
+        Similarity score (1.0 = identical, 0.0 = completely different or
+        below ``min_similarity``).
+    """
+    if not s1 or not s2:
+        return 0.0
+
+    max_len = max(len(s1), len(s2))
+    if min_similarity <= 0.0:
+        return 1.0 - (levenshtein_distance(s1, s2) / max_len)
+
+    bound = max_edit_distance(max_len, min_similarity)
+    distance = levenshtein_distance(s1, s2, max_distance=bound)
+    if distance > bound:
+        return 0.0
+    score = 1.0 - (distance / max_len)
+    return score if score >= min_similarity else 0.0
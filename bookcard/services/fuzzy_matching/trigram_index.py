@@ -0,0 +1,235 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""In-memory trigram index for fuzzy candidate retrieval.
+
+Every indexed string is split into padded character trigrams. A string
+within Levenshtein distance ``k`` of the query keeps all but at most ``3k``
+of the query's distinct trigrams, since one edit touches at most three of
+them. Only strings sharing enough trigrams are verified with the bounded
+distance, so a lookup costs a few posting-list walks instead of a
+comparison against every indexed string.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Hashable
+
+from bookcard.services.fuzzy_matching.distance import similarity_score
+
+# Guards the threshold derivation against float error
+_EPSILON = 1e-9
+
+# Dead entries tolerated before posting lists are rebuilt
+_MIN_DEAD_TO_COMPACT = 1024
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Get the distinct padded trigrams of a string.
+
+    Parameters
+    ----------
+    text : str
+        Text to split.
+
+    Returns
+    -------
+    frozenset[str]
+        Trigrams, including the ones spanning the padding at both ends.
+    """
+    padded = f"  {text} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex[K: Hashable]:
+    """Trigram posting lists over a set of keyed strings.
+
+    Keys are arbitrary hashable identifiers; one key maps to one string.
+    Posting lists are compact arrays of internal entry numbers. Removing or
+    replacing a key only marks its entry dead; dead entries are dropped
+    once they outnumber the live ones. The index is not thread-safe;
+    callers sharing it must synchronise.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[K, str] | None] = []
+        self._ids: dict[K, int] = {}
+        self._postings: dict[str, array[int]] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        """Get the number of indexed strings."""
+        return len(self._ids)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is indexed."""
+        return key in self._ids
+
+    def add(self, key: K, text: str) -> None:
+        """Index a string, replacing any string stored under the same key.
+
+        Parameters
+        ----------
+        key : K
+            Identifier of the string.
+        text : str
+            String to index, already normalized by the caller.
+        """
+        self.remove(key)
+        entry_id = len(self._entries)
+        self._entries.append((key, text))
+        self._ids[key] = entry_id
+        for gram in trigrams(text):
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = array("I")
+            posting.append(entry_id)
+
+    def remove(self, key: K) -> None:
+        """Remove a key from the index if present.
+
+        Parameters
+        ----------
+        key : K
+            Identifier of the string.
+        """
+        entry_id = self._ids.pop(key, None)
+        if entry_id is None:
+            return
+        self._entries[entry_id] = None
+        self._dead += 1
+        if self._dead > _MIN_DEAD_TO_COMPACT and self._dead > len(self._ids):
+            self._compact()
+
+    def clear(self) -> None:
+        """Remove every key."""
+        self._entries.clear()
+        self._ids.clear()
+        self._postings.clear()
+        self._dead = 0
+
+    def text(self, key: K) -> str:
+        """Get the string indexed under a key.
+
+        Parameters
+        ----------
+        key : K
+            Identifier of the string.
+
+        Returns
+        -------
+        str
+            Indexed string.
+
+        Raises
+        ------
+        KeyError
+            If the key is not indexed.
+        """
+        entry = self._entries[self._ids[key]]
+        if entry is None:  # pragma: no cover - ids only point at live entries
+            raise KeyError(key)
+        return entry[1]
+
+    def candidates(self, query: str, min_similarity: float) -> set[K]:
+        """Get keys whose strings may reach a similarity threshold.
+
+        The candidate set is a superset of the matches for thresholds high
+        enough that a match must share at least one query trigram; below
+        that (short queries with low thresholds) strings sharing no trigram
+        at all are not considered.
+
+        Parameters
+        ----------
+        query : str
+            Normalized query string.
+        min_similarity : float
+            Similarity threshold (0.0-1.0) of the intended search.
+
+        Returns
+        -------
+        set[K]
+            Candidate keys.
+        """
+        if not query or not self._ids:
+            return set()
+        query_grams = trigrams(query)
+        min_shared = self._min_shared(query, len(query_grams), min_similarity)
+
+        # Any entry sharing min_shared grams shares one of the rarest
+        # len - min_shared + 1 grams, so only those postings are walked.
+        empty: array[int] = array("I")
+        by_rarity = sorted(query_grams, key=lambda g: len(self._postings.get(g, empty)))
+        seeds: set[int] = set()
+        for gram in by_rarity[: len(by_rarity) - min_shared + 1]:
+            seeds.update(self._postings.get(gram, empty))
+
+        keys: set[K] = set()
+        for entry_id in seeds:
+            entry = self._entries[entry_id]
+            if entry is None:
+                continue
+            if min_shared > 1 and len(trigrams(entry[1]) & query_grams) < min_shared:
+                continue
+            keys.add(entry[0])
+        return keys
+
+    def search(
+        self, query: str, min_similarity: float, limit: int | None = None
+    ) -> list[tuple[K, float]]:
+        """Find indexed strings similar to a query.
+
+        Parameters
+        ----------
+        query : str
+            Normalized query string.
+        min_similarity : float
+            Minimum Levenshtein similarity (0.0-1.0) of a match.
+        limit : int | None
+            Maximum number of matches to return.
+
+        Returns
+        -------
+        list[tuple[K, float]]
+            ``(key, similarity)`` pairs, best first.
+        """
+        matches: list[tuple[K, float]] = []
+        for key in self.candidates(query, min_similarity):
+            score = similarity_score(query, self.text(key), min_similarity)
+            if score > 0.0 and score >= min_similarity:
+                matches.append((key, score))
+        matches.sort(key=lambda match: -match[1])
+        return matches[:limit] if limit is not None else matches
+
+    @staticmethod
+    def _min_shared(query: str, gram_count: int, min_similarity: float) -> int:
+        """Get the minimum number of query trigrams a match must share."""
+        if min_similarity <= 0.0:
+            return 1
+        # A match is at most len(query) / min_similarity long, which bounds
+        # the edit distance it may have from the query.
+        max_distance = math.floor(
+            (1.0 - min_similarity) * len(query) / min_similarity + _EPSILON
+        )
+        return max(1, gram_count - 3 * max_distance)
+
+    def _compact(self) -> None:
+        """Rebuild the posting lists from the live entries."""
+        live = [entry for entry in self._entries if entry is not None]
+        self.clear()
+        for key, text in live:
+            self.add(key, text)
@@ -0,0 +1,157 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""HTTP conditional request helpers.
+
+Small utilities for serving cacheable resources with ``ETag`` and
+``Last-Modified`` validators and answering ``If-None-Match`` /
+``If-Modified-Since`` with ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+from email.utils import formatdate, parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from fastapi import Response, status
+from fastapi.responses import FileResponse
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from fastapi import Request
+
+# Covers and thumbnails are addressed by content version, so clients may keep
+# them for a day and revalidate cheaply afterwards.
+DEFAULT_CACHE_CONTROL = "private, max-age=86400"
+
+
+def build_validator_headers(
+    etag: str,
+    last_modified: float | None = None,
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+) -> dict[str, str]:
+    """Build caching headers for a resource.
+
+    Parameters
+    ----------
+    etag : str
+        Quoted entity tag.
+    last_modified : float | None
+        Modification time (POSIX timestamp), if known.
+    cache_control : str
+        ``Cache-Control`` header value.
+
+    Returns
+    -------
+    dict[str, str]
+        Response headers.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: float | None = None
+) -> bool:
+    """Check whether the client's cached copy is still valid.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since`` as required
+    by RFC 9110.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request.
+    etag : str
+        Current quoted entity tag of the resource.
+    last_modified : float | None
+        Current modification time of the resource (POSIX timestamp).
+
+    Returns
+    -------
+    bool
+        True if a 304 response should be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= int(since)
+
+    return False
+
+
+def conditional_file_response(
+    request: Request,
+    path: Path,
+    *,
+    media_type: str,
+    etag: str,
+    last_modified: float | None = None,
+    filename: str | None = None,
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+    extra_headers: dict[str, str] | None = None,
+) -> Response:
+    """Serve a file, or ``304 Not Modified`` if the client copy is current.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request.
+    path : Path
+        File to serve.
+    media_type : str
+        MIME type of the file.
+    etag : str
+        Quoted entity tag of the file.
+    last_modified : float | None
+        Modification time (POSIX timestamp), if known.
+    filename : str | None
+        Optional download filename.
+    cache_control : str
+        ``Cache-Control`` header value.
+    extra_headers : dict[str, str] | None
+        Additional headers (e.g. ``Vary``).
+
+    Returns
+    -------
+    Response
+        ``FileResponse`` or an empty 304 response carrying the validators.
+    """
+    headers = build_validator_headers(etag, last_modified, cache_control)
+    if extra_headers:
+        headers.update(extra_headers)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return FileResponse(
+        path=str(path),
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+    )
@@ -25,6 +25,7 @@ from pathlib import Path
 
 from sqlmodel import Session
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.config import Library
 from bookcard.models.ingest import IngestHistory, IngestStatus
 from bookcard.models.metadata import MetadataRecord
@@ -234,6 +235,7 @@ class IngestProcessorService:
         cover_url: str | None = None,
         library_id: int | None = None,
         user_id: int | None = None,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> int:
         """Add a book file to the library.
 
@@ -270,6 +272,8 @@ class IngestProcessorService:
             then first available library when ``None``.
         user_id : int | None
             Optional user identifier for per-user library fallback.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY).
 
         Returns
         -------
@@ -306,6 +310,7 @@ class IngestProcessorService:
                 title=title,
                 author_name=author_name,
                 pubdate=pubdate,
+                transfer_mode=transfer_mode,
             )
         finally:
             self._cleanup_processed_file(file_path, processed_file_path)
@@ -359,6 +364,7 @@ class IngestProcessorService:
         file_format: str,
         library_id: int | None = None,
         user_id: int | None = None,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """Add a format to an existing book.
 
@@ -375,6 +381,8 @@ class IngestProcessorService:
             then first available library when ``None``.
         user_id : int | None
             Optional user identifier for per-user library fallback.
+        transfer_mode : TransferMode
+            How the file is placed in the library (default COPY).
         """
         library = self._get_active_library_or_raise(library_id, user_id=user_id)
         book_service = self._book_service_factory(library)
@@ -387,6 +395,7 @@ class IngestProcessorService:
                 book_id=book_id,
                 file_path=processed_file_path,
                 file_format=file_format,
+                transfer_mode=transfer_mode,
             )
             logger.info("Added format %s to book %d", file_format, book_id)
         except Exception:
@@ -25,8 +25,11 @@ from typing import TYPE_CHECKING
 from fastapi import HTTPException, status
 from fastapi.responses import FileResponse, RedirectResponse
 
+from bookcard.services.http_caching import build_validator_headers
+
 if TYPE_CHECKING:
     from bookcard.services.book_service import BookService
+    from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
     from bookcard.services.kobo.book_lookup_service import KoboBookLookupService
     from bookcard.services.kobo.store_proxy_service import KoboStoreProxyService
 
@@ -46,6 +49,8 @@ class KoboCoverService:
         Book lookup service.
     proxy_service : KoboStoreProxyService
         Store proxy service.
+    thumbnail_cache : CoverThumbnailCache | None
+        Optional cache used to serve covers at the size the device requests.
     """
 
     def __init__(
@@ -53,10 +58,12 @@ class KoboCoverService:
         book_service: BookService,
         book_lookup_service: KoboBookLookupService,
         proxy_service: KoboStoreProxyService,
+        thumbnail_cache: CoverThumbnailCache | None = None,
     ) -> None:
         self._book_service = book_service
         self._book_lookup_service = book_lookup_service
         self._proxy_service = proxy_service
+        self._thumbnail_cache = thumbnail_cache
 
     def get_cover_image(
         self, book_uuid: str, width: str, height: str
@@ -100,11 +107,43 @@ class KoboCoverService:
         if cover_path is None or not cover_path.exists():
             return self._redirect_to_store(book_uuid, width, height)
 
+        if self._thumbnail_cache is None:
+            return FileResponse(
+                path=str(cover_path),
+                media_type="image/jpeg",
+            )
+
+        thumbnail = self._thumbnail_cache.get(
+            cover_path,
+            width=self._parse_dimension(width),
+            height=self._parse_dimension(height),
+        )
         return FileResponse(
-            path=str(cover_path),
-            media_type="image/jpeg",
+            path=str(thumbnail.path),
+            media_type=thumbnail.media_type,
+            headers=build_validator_headers(thumbnail.etag, thumbnail.last_modified),
         )
 
+    @staticmethod
+    def _parse_dimension(value: str) -> int | None:
+        """Parse a width/height path segment sent by the device.
+
+        Parameters
+        ----------
+        value : str
+            Dimension in pixels as sent in the URL.
+
+        Returns
+        -------
+        int | None
+            Positive dimension, or None if it cannot be parsed.
+        """
+        try:
+            dimension = int(value)
+        except ValueError:
+            return None
+        return dimension if dimension > 0 else None
+
     def _redirect_to_store(
         self, book_uuid: str, width: str, height: str
     ) -> RedirectResponse:
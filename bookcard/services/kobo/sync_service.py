@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     from bookcard.services.shelf_service import ShelfService
 
 SYNC_ITEM_LIMIT = 100
+SYNC_BOOK_FORMATS = ("EPUB", "KEPUB")
 
 
 class KoboSyncService:
@@ -117,7 +118,7 @@ class KoboSyncService:
         sync_results: list[dict[str, object]] = []
 
         # Get books to sync
-        books_to_sync = self._get_books_to_sync(
+        books_to_sync, more_books = self._get_books_to_sync(
             user_id, library_id, sync_token, only_shelves
         )
 
@@ -129,7 +130,7 @@ class KoboSyncService:
         new_books_last_created = sync_token.books_last_created
         new_reading_state_last_modified = sync_token.reading_state_last_modified
 
-        for book_with_rels in books_to_sync[:SYNC_ITEM_LIMIT]:
+        for book_with_rels in books_to_sync:
             book = book_with_rels.book
             if book.id is None:
                 continue
@@ -231,10 +232,7 @@ class KoboSyncService:
         sync_token.reading_state_last_modified = new_reading_state_last_modified
 
         # Check if more items to sync
-        continue_sync = (
-            len(books_to_sync) > SYNC_ITEM_LIMIT
-            or len(changed_reading_states) > SYNC_ITEM_LIMIT
-        )
+        continue_sync = more_books or len(changed_reading_states) > SYNC_ITEM_LIMIT
 
         return sync_results, continue_sync
 
@@ -244,8 +242,16 @@ class KoboSyncService:
         library_id: int,
         sync_token: SyncToken,
         only_shelves: bool,
-    ) -> list[BookWithRelations | BookWithFullRelations]:
-        """Get books that need to be synced.
+    ) -> tuple[list[BookWithRelations | BookWithFullRelations], bool]:
+        """Get the next page of books that need to be synced.
+
+        Candidates are selected in the Calibre database by keyset pagination
+        over ``(last_modified, id)`` starting at the token's cursor, so only
+        the books actually emitted are loaded with full details. Books that
+        sit behind the cursor but were never sent (added to a synced shelf
+        later, or re-queued by archiving) are sent first.
+
+        The token's ``books_cursor`` is advanced past the emitted books.
 
         Parameters
         ----------
@@ -254,35 +260,120 @@ class KoboSyncService:
         library_id : int
             Library ID.
         sync_token : SyncToken
-            Sync token with last sync timestamps.
+            Sync token with last sync timestamps and cursor.
         only_shelves : bool
             If True, only return books in Kobo-synced shelves.
 
         Returns
         -------
-        list[BookWithRelations | BookWithFullRelations]
-            List of books to sync.
+        tuple[list[BookWithRelations | BookWithFullRelations], bool]
+            Books to sync (at most `SYNC_ITEM_LIMIT`, in emission order) and
+            whether more books remain.
         """
-        synced_book_ids = self._synced_book_repo.find_book_ids_by_user_and_library(
-            user_id, library_id
-        )
         shelf_book_ids = self._get_shelf_book_ids(user_id, library_id, only_shelves)
-        books, _total = self._book_service.list_books(
-            page=1,
-            page_size=1000,  # Large page size for sync
-            full=True,
-        )
+        cursor = self._get_books_cursor(sync_token)
 
-        filtered_books = self._filter_books_for_sync(
-            books, synced_book_ids, shelf_book_ids, sync_token
-        )
+        pending_keys: list[tuple[str, int]] = []
+        if cursor is not None:
+            pending_ids = self._get_pending_book_ids(
+                user_id, library_id, shelf_book_ids
+            )
+            if pending_ids:
+                pending_keys = [
+                    key
+                    for key in self._book_service.list_modified_book_keys(
+                        formats=SYNC_BOOK_FORMATS,
+                        book_ids=pending_ids,
+                        limit=SYNC_ITEM_LIMIT + 1,
+                    )
+                    if key <= cursor
+                ]
+
+        has_more = len(pending_keys) > SYNC_ITEM_LIMIT
+        pending_keys = pending_keys[:SYNC_ITEM_LIMIT]
+        remaining = SYNC_ITEM_LIMIT - len(pending_keys)
+
+        changed_keys: list[tuple[str, int]] = []
+        if remaining > 0:
+            changed_keys = self._book_service.list_modified_book_keys(
+                after=cursor,
+                formats=SYNC_BOOK_FORMATS,
+                book_ids=shelf_book_ids,
+                limit=remaining + 1,
+            )
+            has_more = has_more or len(changed_keys) > remaining
+            changed_keys = changed_keys[:remaining]
+        else:
+            has_more = True
 
-        filtered_books.sort(
-            key=lambda b: b.book.last_modified or datetime.min.replace(tzinfo=UTC),
-            reverse=False,
-        )
+        if changed_keys:
+            sync_token.books_cursor = changed_keys[-1]
+        elif cursor is not None:
+            sync_token.books_cursor = cursor
+
+        book_ids = [book_id for _, book_id in pending_keys + changed_keys]
+        books = self._book_service.list_books_by_ids(book_ids, full=True)
+        return books, has_more
+
+    @staticmethod
+    def _get_books_cursor(sync_token: SyncToken) -> tuple[str, int] | None:
+        """Get the keyset cursor to resume book sync from.
+
+        Tokens issued before cursors were introduced only carry
+        ``books_last_modified`` (second precision). It is converted to a
+        cursor that sorts before every book modified within that second, so
+        at worst a few boundary books are sent again.
+
+        Parameters
+        ----------
+        sync_token : SyncToken
+            Sync token.
 
-        return filtered_books
+        Returns
+        -------
+        tuple[str, int] | None
+            ``(last_modified, book_id)`` cursor, or None for a full sync.
+        """
+        if sync_token.books_cursor is not None:
+            return sync_token.books_cursor
+        if sync_token.books_last_modified == datetime.min.replace(tzinfo=UTC):
+            return None
+        last_modified = sync_token.books_last_modified.astimezone(UTC)
+        return last_modified.strftime("%Y-%m-%d %H:%M:%S"), 0
+
+    def _get_pending_book_ids(
+        self, user_id: int, library_id: int, shelf_book_ids: set[int] | None
+    ) -> set[int]:
+        """Get IDs of books that may sit behind the cursor without being synced.
+
+        Parameters
+        ----------
+        user_id : int
+            User ID.
+        library_id : int
+            Library ID.
+        shelf_book_ids : set[int] | None
+            Shelf book IDs if filtering by shelves.
+
+        Returns
+        -------
+        set[int]
+            Candidate book IDs not yet recorded as synced.
+        """
+        if shelf_book_ids is not None:
+            candidates = shelf_book_ids
+        else:
+            # Archiving a book removes its synced record so that the device
+            # receives the archived entitlement on the next sync.
+            candidates = self._archived_book_repo.find_book_ids_by_user_and_library(
+                user_id, library_id
+            )
+        if not candidates:
+            return set()
+        synced_book_ids = self._synced_book_repo.find_book_ids_by_user_and_library(
+            user_id, library_id
+        )
+        return candidates - synced_book_ids
 
     def _get_shelf_book_ids(
         self, user_id: int, library_id: int, only_shelves: bool
@@ -318,89 +409,6 @@ class KoboSyncService:
                     shelf_book_ids.add(book_link.book_id)
         return shelf_book_ids
 
-    def _filter_books_for_sync(
-        self,
-        books: list[BookWithRelations | BookWithFullRelations],
-        synced_book_ids: set[int],
-        shelf_book_ids: set[int] | None,
-        sync_token: SyncToken,
-    ) -> list[BookWithRelations | BookWithFullRelations]:
-        """Filter books that need syncing.
-
-        Parameters
-        ----------
-        books : list[BookWithRelations | BookWithFullRelations]
-            All books to filter.
-        synced_book_ids : set[int]
-            Already synced book IDs.
-        shelf_book_ids : set[int] | None
-            Shelf book IDs if filtering by shelves.
-        sync_token : SyncToken
-            Sync token with last sync timestamps.
-
-        Returns
-        -------
-        list[BookWithRelations | BookWithFullRelations]
-            Filtered books to sync.
-        """
-        filtered_books: list[BookWithRelations | BookWithFullRelations] = []
-        for book_with_rels in books:
-            book = book_with_rels.book
-            if book.id is None:
-                continue
-
-            if not self._should_sync_book(
-                book, book_with_rels, synced_book_ids, shelf_book_ids, sync_token
-            ):
-                continue
-
-            filtered_books.append(book_with_rels)
-        return filtered_books
-
-    def _should_sync_book(
-        self,
-        book: object,
-        book_with_rels: BookWithRelations | BookWithFullRelations,
-        synced_book_ids: set[int],
-        shelf_book_ids: set[int] | None,
-        sync_token: SyncToken,
-    ) -> bool:
-        """Check if a book should be synced.
-
-        Parameters
-        ----------
-        book : object
-            Book object.
-        book_with_rels : BookWithRelations | BookWithFullRelations
-            Book with relations.
-        synced_book_ids : set[int]
-            Already synced book IDs.
-        shelf_book_ids : set[int] | None
-            Shelf book IDs if filtering by shelves.
-        sync_token : SyncToken
-            Sync token with last sync timestamps.
-
-        Returns
-        -------
-        bool
-            True if book should be synced.
-        """
-        if not hasattr(book, "id") or book.id is None:
-            return False
-
-        if synced_book_ids and book.id in synced_book_ids:
-            book_last_modified = getattr(
-                book, "last_modified", None
-            ) or datetime.min.replace(tzinfo=UTC)
-            if book_last_modified <= sync_token.books_last_modified:
-                return False
-
-        if shelf_book_ids is not None and book.id not in shelf_book_ids:
-            return False
-
-        formats = getattr(book_with_rels, "formats", []) or []
-        return any(f.get("format", "").upper() in ("KEPUB", "EPUB") for f in formats)
-
     def _get_reading_states_to_sync(
         self,
         user_id: int,
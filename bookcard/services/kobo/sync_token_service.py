@@ -59,6 +59,31 @@ def _parse_timestamp(ts_str: str | None) -> datetime | None:
     return None
 
 
+def _parse_cursor(value: object) -> tuple[str, int] | None:
+    """Parse the book keyset cursor from sync token data.
+
+    Parameters
+    ----------
+    value : object
+        Value of the ``BooksCursor`` key, expected to be a mapping with
+        ``LastModified`` (str) and ``BookId`` (int).
+
+    Returns
+    -------
+    tuple[str, int] | None
+        Cursor as ``(last_modified, book_id)``, or None if missing or invalid.
+    """
+    if not isinstance(value, dict):
+        return None
+    last_modified = value.get("LastModified")
+    book_id = value.get("BookId")
+    if not isinstance(last_modified, str) or not last_modified:
+        return None
+    if not isinstance(book_id, int) or isinstance(book_id, bool):
+        return None
+    return last_modified, book_id
+
+
 @dataclass
 class SyncToken:
     """Kobo sync token for tracking synchronization state.
@@ -80,6 +105,10 @@ class SyncToken:
         Last modification time for tags/shelves.
     archive_last_modified : datetime
         Last modification time for archived books.
+    books_cursor : tuple[str, int] | None
+        Keyset position ``(last_modified, book_id)`` of the last book sent,
+        with ``last_modified`` as stored in the Calibre database. Lets book
+        sync resume exactly where the previous page stopped.
     """
 
     books_last_modified: datetime = field(
@@ -97,6 +126,7 @@ class SyncToken:
     archive_last_modified: datetime = field(
         default_factory=lambda: datetime.min.replace(tzinfo=UTC)
     )
+    books_cursor: tuple[str, int] | None = None
 
     @classmethod
     def from_headers(cls, headers: dict[str, str]) -> SyncToken:
@@ -139,6 +169,7 @@ class SyncToken:
                 ),
                 tags_last_modified=parse_timestamp(data.get("TagsLastModified")),
                 archive_last_modified=parse_timestamp(data.get("ArchiveLastModified")),
+                books_cursor=_parse_cursor(data.get("BooksCursor")),
             )
         except (ValueError, json.JSONDecodeError, binascii.Error):
             # If parsing fails, return default token
@@ -164,7 +195,7 @@ class SyncToken:
             dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
             return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        data = {
+        timestamps = {
             "BooksLastModified": format_timestamp(self.books_last_modified),
             "BooksLastCreated": format_timestamp(self.books_last_created),
             "ReadingStateLastModified": format_timestamp(
@@ -175,7 +206,10 @@ class SyncToken:
         }
 
         # Remove empty values
-        data = {k: v for k, v in data.items() if v}
+        data: dict[str, object] = {k: v for k, v in timestamps.items() if v}
+        if self.books_cursor is not None:
+            last_modified, book_id = self.books_cursor
+            data["BooksCursor"] = {"LastModified": last_modified, "BookId": book_id}
 
         if data:
             json_str = json.dumps(data)
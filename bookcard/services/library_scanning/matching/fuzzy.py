@@ -20,70 +20,17 @@ Confidence: 0.5-0.85.
 """
 
 from bookcard.models.core import Author
+from bookcard.services.fuzzy_matching import levenshtein_distance, similarity_score
 from bookcard.services.library_scanning.data_sources.base import BaseDataSource
 from bookcard.services.library_scanning.matching.base import BaseMatchingStrategy
 from bookcard.services.library_scanning.matching.exact import normalize_name
 from bookcard.services.library_scanning.matching.types import MatchResult
 
-
-def levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein distance between two strings.
-
-    Parameters
-    ----------
-    s1 : str
-        First string.
-    s2 : str
-        Second string.
-
-    Returns
-    -------
-    int
-        Levenshtein distance.
-    """
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-
-    if len(s2) == 0:
-        return len(s1)
-
-    previous_row = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
-
-
-def similarity_score(s1: str, s2: str) -> float:
-    """Calculate similarity score between two strings (0.0 to 1.0).
-
-    Parameters
-    ----------
-    s1 : str
-        First string.
-    s2 : str
-        Second string.
-
-    Returns
-    -------
-    float
-        Similarity score (1.0 = identical, 0.0 = completely different).
-    """
-    if not s1 or not s2:
-        return 0.0
-
-    max_len = max(len(s1), len(s2))
-    if max_len == 0:
-        return 1.0
-
-    distance = levenshtein_distance(s1, s2)
-    return 1.0 - (distance / max_len)
+__all__ = [
+    "FuzzyNameMatchingStrategy",
+    "levenshtein_distance",
+    "similarity_score",
+]
 
 
 class FuzzyNameMatchingStrategy(BaseMatchingStrategy):
@@ -147,7 +94,9 @@ class FuzzyNameMatchingStrategy(BaseMatchingStrategy):
         # Find best fuzzy match
         for result in search_results:
             normalized_result_name = normalize_name(result.name)
-            score = similarity_score(normalized_calibre_name, normalized_result_name)
+            score = similarity_score(
+                normalized_calibre_name, normalized_result_name, self.min_similarity
+            )
 
             if score >= self.min_similarity and score > best_score:
                 # Map similarity score (0.7-1.0) to confidence (0.5-0.85)
@@ -166,7 +115,7 @@ class FuzzyNameMatchingStrategy(BaseMatchingStrategy):
             for alt_name in result.alternate_names:
                 normalized_alt_name = normalize_name(alt_name)
                 alt_score = similarity_score(
-                    normalized_calibre_name, normalized_alt_name
+                    normalized_calibre_name, normalized_alt_name, self.min_similarity
                 )
 
                 if alt_score >= self.min_similarity and alt_score > best_score:
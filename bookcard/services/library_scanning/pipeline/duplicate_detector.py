@@ -27,10 +27,12 @@ from datetime import UTC, datetime
 from typing import ClassVar
 
 from bookcard.models.author_metadata import AuthorMetadata
-from bookcard.services.library_scanning.matching.exact import normalize_name
-from bookcard.services.library_scanning.matching.fuzzy import (
+from bookcard.services.fuzzy_matching import (
     levenshtein_distance,
+    max_edit_distance,
+    similarity_score,
 )
+from bookcard.services.library_scanning.matching.exact import normalize_name
 
 logger = logging.getLogger(__name__)
 
@@ -301,7 +303,9 @@ class DuplicateDetector:
         if max_len == 0:
             return True  # Both empty, consider duplicates
 
-        distance = levenshtein_distance(name1, name2)
+        # Distances beyond the threshold are not needed, so stop early
+        bound = max_edit_distance(max_len, self._min_similarity)
+        distance = levenshtein_distance(name1, name2, max_distance=bound)
         similarity = 1.0 - (distance / max_len)
 
         # Check if similarity meets threshold
@@ -325,19 +329,18 @@ class DuplicateDetector:
                 norm_alt1 = normalize_name(alt1.name)
                 for alt2 in author2.alternate_names:
                     norm_alt2 = normalize_name(alt2.name)
-                    alt_distance = levenshtein_distance(norm_alt1, norm_alt2)
-                    alt_max_len = max(len(norm_alt1), len(norm_alt2))
-                    if alt_max_len > 0:
-                        alt_similarity = 1.0 - (alt_distance / alt_max_len)
-                        if alt_similarity >= self._min_similarity:
-                            logger.debug(
-                                "Duplicate detected via alternate names: '%s' and '%s' - "
-                                "Similarity: %.3f",
-                                alt1.name,
-                                alt2.name,
-                                alt_similarity,
-                            )
-                            return True
+                    alt_similarity = similarity_score(
+                        norm_alt1, norm_alt2, self._min_similarity
+                    )
+                    if alt_similarity > 0.0:
+                        logger.debug(
+                            "Duplicate detected via alternate names: '%s' and '%s' - "
+                            "Similarity: %.3f",
+                            alt1.name,
+                            alt2.name,
+                            alt_similarity,
+                        )
+                        return True
 
         return False
 
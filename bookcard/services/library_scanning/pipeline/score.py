@@ -40,6 +40,10 @@ from bookcard.services.progress import BaseProgressTracker
 if TYPE_CHECKING:
     from sqlmodel import Session
 
+    from bookcard.services.library_scanning.pipeline.score_engine import (
+        BlockedSimilarityEngine,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -748,9 +752,16 @@ class ScoreStage(PipelineStage):
         similarity_calculator: SimilarityCalculator | None = None,
         stale_data_max_age_days: int | None = None,
         target_author_metadata_id: int | None = None,
+        similarity_engine: "BlockedSimilarityEngine | None" = None,
+        max_neighbors: int = 25,
     ) -> None:
         """Initialize score stage.
 
+        By default similarities are computed by `BlockedSimilarityEngine`,
+        which bulk-loads subjects and only compares authors sharing a
+        subject. Injecting a custom ``similarity_calculator`` falls back to
+        comparing every author pair with that calculator.
+
         Parameters
         ----------
         min_similarity : float
@@ -772,6 +783,10 @@ class ScoreStage(PipelineStage):
             None means always analyze (no staleness check).
         target_author_metadata_id : int | None
             If provided, only score links involving this author (single-author mode).
+        similarity_engine : BlockedSimilarityEngine | None
+            Engine for blocked scoring (created from context if None).
+        max_neighbors : int
+            Number of best matches kept per author by the blocked engine.
         """
         self._progress = 0.0
         self._min_similarity = min_similarity
@@ -782,6 +797,9 @@ class ScoreStage(PipelineStage):
         self._similarity_calculator = similarity_calculator
         self._stale_data_max_age_days = stale_data_max_age_days
         self._target_author_metadata_id = target_author_metadata_id
+        self._similarity_engine = similarity_engine
+        self._max_neighbors = max_neighbors
+        self._use_pair_loop = similarity_calculator is not None
         self._progress_tracker: ProgressTracker | None = None
 
     def _create_repositories(self, session: "Session") -> None:
@@ -1117,6 +1135,17 @@ class ScoreStage(PipelineStage):
         tuple[int, int]
             Tuple of (similarities_created, authors_skipped).
         """
+        # Filter out authors with fresh similarities if staleness check is enabled
+        authors_to_process, skipped_count = self._filter_authors_by_staleness(
+            all_authors
+        )
+
+        if not self._use_pair_loop:
+            similarities_created = self._process_with_engine(
+                context, authors_to_process, skipped_count
+            )
+            return similarities_created, skipped_count
+
         if self._similarity_calculator is None:
             self._similarity_calculator = self._create_default_calculator()
 
@@ -1130,11 +1159,6 @@ class ScoreStage(PipelineStage):
             self._min_similarity,
         )
 
-        # Filter out authors with fresh similarities if staleness check is enabled
-        authors_to_process, skipped_count = self._filter_authors_by_staleness(
-            all_authors
-        )
-
         # Recalculate total pairs based on filtered authors
         actual_total_pairs = (
             len(authors_to_process) * (len(authors_to_process) - 1) // 2
@@ -1154,6 +1178,78 @@ class ScoreStage(PipelineStage):
 
         return similarities_created, skipped_count
 
+    def _process_with_engine(
+        self,
+        context: PipelineContext,
+        authors_to_process: list[AuthorMetadata],
+        skipped_count: int,
+    ) -> int:
+        """Score authors with the blocked similarity engine.
+
+        Parameters
+        ----------
+        context : PipelineContext
+            Pipeline context.
+        authors_to_process : list[AuthorMetadata]
+            Authors to compare.
+        skipped_count : int
+            Number of skipped authors.
+
+        Returns
+        -------
+        int
+            Number of similarities created.
+        """
+        # Imported here: the engine reuses helpers defined in this module
+        from bookcard.services.library_scanning.pipeline.score_engine import (
+            BlockedSimilarityEngine,
+        )
+
+        if self._similarity_engine is None:
+            self._similarity_engine = BlockedSimilarityEngine(
+                context.session,
+                min_similarity=self._min_similarity,
+                max_neighbors=self._max_neighbors,
+            )
+
+        total_authors = len(authors_to_process)
+        self._progress_tracker = ProgressTracker(
+            total_authors, log_interval=max(1, min(100, total_authors // 10))
+        )
+
+        def _on_progress(processed: int, total: int, pairs_scored: int) -> None:
+            if self._progress_tracker is None:
+                return
+            progress = self._progress_tracker.update(1)
+            if self._progress_tracker.should_log():
+                logger.info(
+                    "Score progress: %d/%d authors processed (%d candidate pairs scored)",
+                    processed,
+                    total,
+                    pairs_scored,
+                )
+            context.update_progress(
+                progress,
+                {
+                    "current_stage": {
+                        "name": "score",
+                        "status": "in_progress",
+                        "current_index": processed,
+                        "total_items": total,
+                        "pairs_scored": pairs_scored,
+                        "authors_skipped": skipped_count,
+                    },
+                },
+            )
+
+        result = self._similarity_engine.run(
+            authors_to_process,
+            target_author_id=self._target_author_metadata_id,
+            check_cancelled=context.check_cancelled,
+            on_progress=_on_progress,
+        )
+        return result.similarities_created
+
     def _get_authors_to_score(
         self,
         context: PipelineContext,
@@ -1250,7 +1346,7 @@ class ScoreStage(PipelineStage):
             self._create_repositories(context.session)
 
             # Get calculator if not set
-            if self._similarity_calculator is None:
+            if self._use_pair_loop and self._similarity_calculator is None:
                 self._similarity_calculator = self._create_default_calculator()
 
             # Get authors to process
@@ -0,0 +1,379 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Blocked author similarity scoring.
+
+`ScoreStage` originally compared every pair of authors, issuing an existence
+query and two subject queries per pair. This engine loads everything it needs
+in a handful of bulk queries, only compares authors that share at least one
+subject (blocking via an inverted subject index), keeps the best
+``max_neighbors`` matches per author and inserts the results in batches.
+
+Scores are computed with the same formula as the default composite
+calculator in `score` (genre 0.5, work count 0.2, ratings 0.15, birth year
+0.15, averaged over non-zero factors).
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlmodel import col, select
+
+from bookcard.models.author_metadata import (
+    AuthorSimilarity,
+    AuthorWork,
+    WorkSubject,
+)
+from bookcard.services.library_scanning.pipeline.score import (
+    DateParser,
+    SimilarityMetrics,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from sqlmodel import Session
+
+    from bookcard.models.author_metadata import AuthorMetadata
+
+logger = logging.getLogger(__name__)
+
+# Weights of the default composite calculator
+GENRE_WEIGHT = 0.5
+WORK_COUNT_WEIGHT = 0.2
+RATINGS_WEIGHT = 0.15
+TIME_PERIOD_WEIGHT = 0.15
+MAX_YEAR_DIFF = 50
+
+# Keep IN (...) lists well below SQLite's bound parameter limit
+_QUERY_CHUNK_SIZE = 500
+_INSERT_BATCH_SIZE = 500
+
+
+@dataclass(slots=True)
+class ScoringResult:
+    """Outcome of a scoring run.
+
+    Attributes
+    ----------
+    similarities_created : int
+        Number of new similarity records inserted.
+    candidate_pairs : int
+        Number of author pairs that shared a subject and were scored.
+    authors_processed : int
+        Number of authors whose neighbours were computed.
+    cancelled : bool
+        Whether the run stopped early because of cancellation.
+    """
+
+    similarities_created: int = 0
+    candidate_pairs: int = 0
+    authors_processed: int = 0
+    cancelled: bool = False
+
+
+class _AuthorFeatures:
+    """Column-oriented feature arrays for a list of authors.
+
+    Index ``i`` in every array refers to ``author_ids[i]``. Subjects are
+    interned to integers so that set operations run on small ints.
+    """
+
+    __slots__ = (
+        "author_ids",
+        "birth_years",
+        "ratings_counts",
+        "subjects",
+        "work_counts",
+    )
+
+    def __init__(
+        self,
+        authors: Sequence[AuthorMetadata],
+        subjects_by_author: dict[int, set[str]],
+    ) -> None:
+        self.author_ids = array("q")
+        self.work_counts = array("q")
+        self.ratings_counts = array("q")
+        self.birth_years = array("q")
+        self.subjects: list[frozenset[int]] = []
+
+        interned: dict[str, int] = {}
+        for author in authors:
+            if author.id is None:
+                continue
+            self.author_ids.append(author.id)
+            self.work_counts.append(author.work_count or 0)
+            self.ratings_counts.append(author.ratings_count or 0)
+            year = DateParser.extract_year(author.birth_date or "")
+            self.birth_years.append(year if year is not None else -1)
+            self.subjects.append(
+                frozenset(
+                    interned.setdefault(name, len(interned))
+                    for name in subjects_by_author.get(author.id, ())
+                )
+            )
+
+    def __len__(self) -> int:
+        return len(self.author_ids)
+
+
+class BlockedSimilarityEngine:
+    """Computes top-k author similarities using subject blocking.
+
+    Parameters
+    ----------
+    session : Session
+        Database session.
+    min_similarity : float
+        Minimum similarity score to store.
+    max_neighbors : int
+        Number of best-scoring neighbours kept per author. A pair is stored if
+        it ranks in the top ``max_neighbors`` of either author.
+    max_block_size : int
+        Subjects shared by more authors than this are too generic to signal
+        similarity and are not used to generate candidate pairs. They still
+        count towards the genre overlap of pairs found through other subjects.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        min_similarity: float = 0.2,
+        max_neighbors: int = 25,
+        max_block_size: int = 1000,
+    ) -> None:
+        self._session = session
+        self._min_similarity = min_similarity
+        self._max_neighbors = max_neighbors
+        self._max_block_size = max_block_size
+
+    def run(
+        self,
+        authors: Sequence[AuthorMetadata],
+        *,
+        target_author_id: int | None = None,
+        check_cancelled: Callable[[], bool] | None = None,
+        on_progress: Callable[[int, int, int], None] | None = None,
+    ) -> ScoringResult:
+        """Score authors and insert new similarity records.
+
+        Parameters
+        ----------
+        authors : Sequence[AuthorMetadata]
+            Authors to compare with each other.
+        target_author_id : int | None
+            If set, only pairs involving this author are scored.
+        check_cancelled : Callable[[], bool] | None
+            Polled between authors; returning True stops the run.
+        on_progress : Callable[[int, int, int], None] | None
+            Called as ``(authors_processed, total_authors, pairs_scored)``.
+
+        Returns
+        -------
+        ScoringResult
+            Counters describing the run.
+        """
+        result = ScoringResult()
+        author_ids = [a.id for a in authors if a.id is not None]
+        if len(author_ids) < 2:
+            return result
+
+        features = _AuthorFeatures(authors, self._load_subjects(author_ids))
+        existing = self._load_existing_pairs(author_ids)
+        postings = self._build_postings(features)
+
+        full = target_author_id is None or target_author_id not in author_ids
+        if full:
+            sources = list(range(len(features)))
+        else:
+            sources = [list(features.author_ids).index(target_author_id)]
+
+        neighbors: dict[int, list[tuple[float, int]]] = defaultdict(list)
+        for processed, i in enumerate(sources, start=1):
+            if check_cancelled is not None and check_cancelled():
+                result.cancelled = True
+                break
+
+            for j in self._candidates(i, features, postings, full=full):
+                result.candidate_pairs += 1
+                score = self._score(i, j, features)
+                if score < self._min_similarity:
+                    continue
+                self._push(neighbors[i], score, j)
+                if full:
+                    self._push(neighbors[j], score, i)
+
+            result.authors_processed = processed
+            if on_progress is not None:
+                on_progress(processed, len(sources), result.candidate_pairs)
+
+        if result.cancelled:
+            return result
+
+        rows = self._select_pairs(neighbors, features, existing)
+        result.similarities_created = self._insert(rows)
+        return result
+
+    def _load_subjects(self, author_ids: Sequence[int]) -> dict[int, set[str]]:
+        """Load the subjects of every author in a few bulk queries."""
+        subjects: dict[int, set[str]] = defaultdict(set)
+        for chunk in _chunks(author_ids, _QUERY_CHUNK_SIZE):
+            stmt = (
+                select(AuthorWork.author_metadata_id, WorkSubject.subject_name)
+                .join(AuthorWork, col(WorkSubject.author_work_id) == AuthorWork.id)
+                .where(col(AuthorWork.author_metadata_id).in_(chunk))
+                .distinct()
+            )
+            for author_id, subject_name in self._session.exec(stmt).all():
+                subjects[author_id].add(subject_name)
+        return subjects
+
+    def _load_existing_pairs(self, author_ids: Sequence[int]) -> set[tuple[int, int]]:
+        """Load existing similarity pairs touching the given authors."""
+        existing: set[tuple[int, int]] = set()
+        for chunk in _chunks(author_ids, _QUERY_CHUNK_SIZE):
+            for column in (AuthorSimilarity.author1_id, AuthorSimilarity.author2_id):
+                stmt = select(
+                    AuthorSimilarity.author1_id, AuthorSimilarity.author2_id
+                ).where(col(column).in_(chunk))
+                for a, b in self._session.exec(stmt).all():
+                    existing.add((a, b) if a < b else (b, a))
+        return existing
+
+    def _build_postings(self, features: _AuthorFeatures) -> dict[int, list[int]]:
+        """Build the subject -> author index, dropping overly generic subjects."""
+        postings: dict[int, list[int]] = defaultdict(list)
+        for index, subjects in enumerate(features.subjects):
+            for subject in subjects:
+                postings[subject].append(index)
+        return {
+            subject: members
+            for subject, members in postings.items()
+            if len(members) <= self._max_block_size
+        }
+
+    @staticmethod
+    def _candidates(
+        i: int,
+        features: _AuthorFeatures,
+        postings: dict[int, list[int]],
+        *,
+        full: bool,
+    ) -> Iterable[int]:
+        """Yield authors sharing a blocking subject with author ``i``.
+
+        In full mode only ``j > i`` is yielded so each pair is scored once.
+        """
+        seen: set[int] = set()
+        for subject in features.subjects[i]:
+            for j in postings.get(subject, ()):
+                if j == i or (full and j < i) or j in seen:
+                    continue
+                seen.add(j)
+                yield j
+
+    @staticmethod
+    def _score(i: int, j: int, features: _AuthorFeatures) -> float:
+        """Composite similarity of two authors; matches the default calculator."""
+        weighted = 0.0
+        total_weight = 0.0
+
+        subjects_i = features.subjects[i]
+        subjects_j = features.subjects[j]
+        shared = len(subjects_i & subjects_j)
+        if shared:
+            genre = shared / len(subjects_i | subjects_j)
+            boost = 0.05 if shared <= 2 else 0.10 if shared <= 5 else 0.15
+            genre = min(1.0, genre + boost)
+            weighted += genre * GENRE_WEIGHT
+            total_weight += GENRE_WEIGHT
+
+        work = SimilarityMetrics.normalize_ratio(
+            features.work_counts[i], features.work_counts[j]
+        )
+        if work > 0:
+            weighted += work * WORK_COUNT_WEIGHT
+            total_weight += WORK_COUNT_WEIGHT
+
+        ratings = SimilarityMetrics.normalize_ratio(
+            features.ratings_counts[i], features.ratings_counts[j]
+        )
+        if ratings > 0:
+            weighted += ratings * RATINGS_WEIGHT
+            total_weight += RATINGS_WEIGHT
+
+        year_i = features.birth_years[i]
+        year_j = features.birth_years[j]
+        if year_i >= 0 and year_j >= 0:
+            year_diff = abs(year_i - year_j)
+            if year_diff < MAX_YEAR_DIFF:
+                weighted += (1.0 - year_diff / MAX_YEAR_DIFF) * TIME_PERIOD_WEIGHT
+                total_weight += TIME_PERIOD_WEIGHT
+
+        if total_weight == 0:
+            return 0.05
+        return min(1.0, weighted / total_weight)
+
+    def _push(self, heap: list[tuple[float, int]], score: float, other: int) -> None:
+        """Add a neighbour to a bounded min-heap of the best matches."""
+        if len(heap) < self._max_neighbors:
+            heapq.heappush(heap, (score, other))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, other))
+
+    @staticmethod
+    def _select_pairs(
+        neighbors: dict[int, list[tuple[float, int]]],
+        features: _AuthorFeatures,
+        existing: set[tuple[int, int]],
+    ) -> list[tuple[int, int, float]]:
+        """Collect unique, not yet stored pairs from the neighbour heaps."""
+        rows: dict[tuple[int, int], float] = {}
+        for i, heap in neighbors.items():
+            for score, j in heap:
+                a = features.author_ids[i]
+                b = features.author_ids[j]
+                key = (a, b) if a < b else (b, a)
+                if key not in existing:
+                    rows[key] = score
+        return [(a, b, score) for (a, b), score in sorted(rows.items())]
+
+    def _insert(self, rows: list[tuple[int, int, float]]) -> int:
+        """Insert similarity records in batches, committing after each."""
+        for batch in _chunks(rows, _INSERT_BATCH_SIZE):
+            self._session.add_all([
+                AuthorSimilarity(
+                    author1_id=a,
+                    author2_id=b,
+                    similarity_score=score,
+                    similarity_source="composite",
+                )
+                for a, b, score in batch
+            ])
+            self._session.commit()
+        return len(rows)
+
+
+def _chunks[T](items: Sequence[T], size: int) -> Iterable[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -17,6 +17,7 @@
 
 import logging
 import random
+import threading
 import time
 from collections.abc import Callable
 from contextlib import suppress
@@ -26,6 +27,8 @@ from sqlalchemy.exc import OperationalError
 from sqlmodel import Session
 
 from bookcard.database import create_db_engine, get_session
+from bookcard.models.tasks import Task, TaskStatus
+from bookcard.services.tasks.events import TaskEvent, get_task_event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,11 @@ class ScanTaskTracker:
         "completion": 1.0,  # 95-100%
     }
 
+    # Last progress write per task: (stage, monotonic time, owner user ID).
+    # Trackers are created per call, so the state is shared by the class.
+    _progress_writes: ClassVar[dict[int, tuple[str, float, int]]] = {}
+    _progress_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize task tracker."""
         self.engine = create_db_engine()
@@ -83,8 +91,16 @@ class ScanTaskTracker:
             Progress within the stage (0.0 to 1.0).
         metadata : dict[str, Any] | None
             Optional metadata to include.
+
+        Notes
+        -----
+        Every update is published on the task event bus, but within a stage
+        progress is written to the database at most once per flush interval.
         """
         from bookcard.services.task_service import TaskService
+        from bookcard.services.tasks.progress_reporter import (
+            PROGRESS_FLUSH_INTERVAL,
+        )
 
         stage_base = self.STAGE_PROGRESS.get(stage, 0.0)
         stage_range = self._get_stage_range(stage)
@@ -98,9 +114,34 @@ class ScanTaskTracker:
         if metadata:
             task_metadata.update(metadata)
 
+        now = time.monotonic()
+        with self._progress_lock:
+            last_write = self._progress_writes.get(task_id)
+        if (
+            last_write is not None
+            and last_write[0] == stage
+            and stage_progress < 1.0
+            and now - last_write[1] < PROGRESS_FLUSH_INTERVAL
+        ):
+            get_task_event_bus().publish(
+                TaskEvent(
+                    task_id=task_id,
+                    user_id=last_write[2],
+                    event_type="progress",
+                    status=TaskStatus.RUNNING,
+                    progress=overall_progress,
+                    metadata=task_metadata,
+                )
+            )
+            return
+
         def update_progress(session: Session) -> None:
             task_service = TaskService(session)
             task_service.update_task_progress(task_id, overall_progress, task_metadata)
+            task = session.get(Task, task_id)
+            if task is not None:
+                with self._progress_lock:
+                    self._progress_writes[task_id] = (stage, now, task.user_id)
             logger.debug(
                 "Updated task %d progress: %.2f%% (stage: %s, stage_progress: %.2f%%)",
                 task_id,
@@ -138,6 +179,7 @@ class ScanTaskTracker:
             f"complete task {task_id}",
             max_retries=5,
         )
+        self._forget_progress(task_id)
         logger.info("Marked task %d as COMPLETED", task_id)
 
     def fail_task(
@@ -161,8 +203,14 @@ class ScanTaskTracker:
             f"fail task {task_id}",
             max_retries=5,
         )
+        self._forget_progress(task_id)
         logger.error("Marked task %d as FAILED: %s", task_id, error_message)
 
+    def _forget_progress(self, task_id: int) -> None:
+        """Drop the progress write state of a finished task."""
+        with self._progress_lock:
+            self._progress_writes.pop(task_id, None)
+
     def _get_stage_range(self, stage: str) -> float:
         """Get the progress range for a stage.
 
@@ -0,0 +1,283 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Materialized Magic Shelf membership.
+
+The book IDs matching a Magic Shelf's rules are stored in the app database
+together with a hash of the rules and a Calibre ``last_modified``
+watermark.  A refresh re-evaluates the rules only for books modified after
+the watermark and drops members deleted from Calibre; when the rules change
+the membership is rebuilt from a full evaluation.
+
+Concurrent refreshes of a shelf compute the same changes from their own
+snapshots; the repository writes them idempotently so that neither fails.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, cast
+
+from sqlmodel import select
+
+from bookcard.models.core import Book
+from bookcard.repositories.calibre.queries import BookQueryBuilder
+from bookcard.repositories.magic_shelf_repository import (
+    MagicShelfMembershipRepository,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from sqlmodel import Session
+    from sqlmodel.sql.expression import SelectOfScalar
+
+    from bookcard.models.magic_shelf_rules import GroupRule
+    from bookcard.models.shelves import MagicShelfState
+    from bookcard.repositories.interfaces import IBookRepository
+    from bookcard.services.magic_shelf.evaluator import BookRuleEvaluator
+
+logger = logging.getLogger(__name__)
+
+# Age after which a read triggers an incremental refresh
+REFRESH_INTERVAL = timedelta(seconds=60)
+
+
+@dataclass
+class MagicShelfRefreshResult:
+    """Outcome of a membership refresh.
+
+    Attributes
+    ----------
+    rebuilt : bool
+        Whether the rules were evaluated against the whole library.
+    added : int
+        Number of books that joined the shelf.
+    removed : int
+        Number of books that left the shelf.
+    book_count : int
+        Number of member books after the refresh.
+    """
+
+    rebuilt: bool = False
+    added: int = 0
+    removed: int = 0
+    book_count: int = 0
+
+
+def rule_hash(group_rule: GroupRule) -> str:
+    """Hash a rule tree so that any change of rules changes the hash.
+
+    Parameters
+    ----------
+    group_rule : GroupRule
+        Parsed shelf rules.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 of the canonical JSON form of the rules.
+    """
+    payload = json.dumps(
+        group_rule.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MagicShelfMaterializer:
+    """Keep the materialized membership of Magic Shelves up to date.
+
+    Parameters
+    ----------
+    session : Session
+        App database session holding the membership tables.
+    evaluator : BookRuleEvaluator
+        Rule evaluator used to select matching Calibre books.
+    refresh_interval : timedelta
+        Age after which `ensure_current` refreshes a membership.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        evaluator: BookRuleEvaluator,
+        refresh_interval: timedelta = REFRESH_INTERVAL,
+    ) -> None:
+        self._repo = MagicShelfMembershipRepository(session)
+        self._evaluator = evaluator
+        self._refresh_interval = refresh_interval
+        self._queries = BookQueryBuilder()
+
+    def ensure_current(
+        self, shelf_id: int, group_rule: GroupRule, book_repo: IBookRepository
+    ) -> MagicShelfState:
+        """Return a shelf's refresh state, refreshing the membership if due.
+
+        The membership is rebuilt when it does not exist yet or was built
+        from other rules, and refreshed incrementally when it is older than
+        the refresh interval.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Magic Shelf ID.
+        group_rule : GroupRule
+            Current rules of the shelf.
+        book_repo : IBookRepository
+            Repository of the shelf's library.
+
+        Returns
+        -------
+        MagicShelfState
+            Current refresh state.
+        """
+        state = self._repo.get(shelf_id)
+        if (
+            state is None
+            or state.rule_hash != rule_hash(group_rule)
+            or datetime.now(UTC) - _as_utc(state.refreshed_at) >= self._refresh_interval
+        ):
+            self.refresh(shelf_id, group_rule, book_repo)
+            state = cast("MagicShelfState", self._repo.get(shelf_id))
+        return state
+
+    def refresh(
+        self,
+        shelf_id: int,
+        group_rule: GroupRule,
+        book_repo: IBookRepository,
+        *,
+        rebuild: bool = False,
+    ) -> MagicShelfRefreshResult:
+        """Bring a shelf's membership up to date in the session's transaction.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Magic Shelf ID.
+        group_rule : GroupRule
+            Current rules of the shelf.
+        book_repo : IBookRepository
+            Repository of the shelf's library.
+        rebuild : bool
+            Evaluate the rules against the whole library even if the
+            membership could be refreshed incrementally.
+
+        Returns
+        -------
+        MagicShelfRefreshResult
+            Refresh statistics.
+        """
+        current_hash = rule_hash(group_rule)
+        state = self._repo.get(shelf_id)
+        members = set(self._repo.list_book_ids(shelf_id))
+        matching_stmt = self._evaluator.build_matching_book_ids_stmt(group_rule)
+
+        if rebuild or state is None or state.rule_hash != current_hash:
+            # Take the watermark first: books modified during the evaluation
+            # are re-evaluated by the next refresh.
+            watermark = book_repo.get_latest_modified_key()
+            matching = set(book_repo.list_book_ids_by_query(matching_stmt))
+            to_add = matching - members
+            to_remove = members - matching
+            rebuilt = True
+        else:
+            after = (
+                (state.watermark_modified, state.watermark_book_id or 0)
+                if state.watermark_modified is not None
+                else None
+            )
+            changed = book_repo.list_modified_book_keys(after=after)
+            watermark = changed[-1] if changed else after
+            changed_ids = {book_id for _, book_id in changed}
+            matching = (
+                set(
+                    book_repo.list_book_ids_by_query(
+                        matching_stmt.where(
+                            self._queries.book_id_in(sorted(changed_ids))
+                        )
+                    )
+                )
+                if changed_ids
+                else set()
+            )
+            to_add = matching - members
+            # Deleted books do not bump any last_modified
+            existing = set(
+                book_repo.list_book_ids_by_query(self._book_ids_stmt(members))
+            )
+            to_remove = ((changed_ids - matching) | (members - existing)) & members
+            rebuilt = False
+
+        self._repo.remove_books(shelf_id, to_remove)
+        self._repo.add_books(shelf_id, to_add)
+        book_count = len(members) - len(to_remove) + len(to_add)
+
+        watermark_modified, watermark_book_id = (
+            watermark if watermark is not None else (None, None)
+        )
+        self._repo.save_state(
+            shelf_id,
+            rule_hash=current_hash,
+            watermark_modified=watermark_modified,
+            watermark_book_id=watermark_book_id,
+            book_count=book_count,
+            refreshed_at=datetime.now(UTC),
+        )
+
+        if to_add or to_remove:
+            logger.debug(
+                "Refreshed magic shelf %d: %d added, %d removed (rebuilt=%s)",
+                shelf_id,
+                len(to_add),
+                len(to_remove),
+                rebuilt,
+            )
+        return MagicShelfRefreshResult(
+            rebuilt=rebuilt,
+            added=len(to_add),
+            removed=len(to_remove),
+            book_count=book_count,
+        )
+
+    def book_ids_stmt(self, shelf_id: int) -> SelectOfScalar[int]:
+        """Build a Calibre statement selecting a shelf's member books.
+
+        Parameters
+        ----------
+        shelf_id : int
+            Magic Shelf ID.
+
+        Returns
+        -------
+        SelectOfScalar[int]
+            Statement selecting the member `Book.id` values.
+        """
+        return self._book_ids_stmt(self._repo.list_book_ids(shelf_id))
+
+    def _book_ids_stmt(self, book_ids: Collection[int]) -> SelectOfScalar[int]:
+        return cast(
+            "SelectOfScalar[int]",
+            select(Book.id).where(self._queries.book_id_in(list(book_ids))),
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes read back from SQLite as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
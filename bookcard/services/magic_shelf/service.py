@@ -17,7 +17,10 @@
 
 This module orchestrates the retrieval of books for Magic Shelves.
 It adheres to DIP by depending on abstractions (repositories) and SRP
-by delegating rule evaluation to a dedicated component.
+by delegating rule evaluation to a dedicated component.  When a
+:class:`MagicShelfMaterializer` is given, shelves are listed and counted
+from their materialized membership instead of evaluating the rules on
+every request.
 """
 
 from __future__ import annotations
@@ -29,10 +32,18 @@ from bookcard.models.magic_shelf_rules import GroupRule
 from bookcard.models.shelves import Shelf, ShelfTypeEnum
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from sqlmodel.sql.expression import SelectOfScalar
+
     from bookcard.repositories.interfaces import IBookRepository
     from bookcard.repositories.models import BookWithFullRelations, BookWithRelations
     from bookcard.repositories.shelf_repository import ShelfRepository
     from bookcard.services.magic_shelf.evaluator import BookRuleEvaluator
+    from bookcard.services.magic_shelf.materializer import (
+        MagicShelfMaterializer,
+        MagicShelfRefreshResult,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -43,17 +54,31 @@ class MagicShelfService:
     Supports querying books across multiple libraries by holding a mapping
     of ``library_id`` to ``IBookRepository``.  When only a single library is
     configured the behaviour is identical to the original single-repo design.
+
+    Parameters
+    ----------
+    shelf_repo : ShelfRepository
+        Shelf repository.
+    book_repos : Mapping[int, IBookRepository]
+        Book repositories by ``library_id``.
+    evaluator : BookRuleEvaluator
+        Rule evaluator.
+    materializer : MagicShelfMaterializer | None
+        Optional materialized membership store.  Without one, the rules are
+        evaluated against Calibre on every call.
     """
 
     def __init__(
         self,
         shelf_repo: ShelfRepository,
-        book_repos: dict[int, IBookRepository],
+        book_repos: Mapping[int, IBookRepository],
         evaluator: BookRuleEvaluator,
+        materializer: MagicShelfMaterializer | None = None,
     ) -> None:
         self._shelf_repo = shelf_repo
         self._book_repos = book_repos
         self._evaluator = evaluator
+        self._materializer = materializer
 
     # ------------------------------------------------------------------
     # Legacy single-repo constructor for backward compatibility
@@ -123,6 +148,11 @@ class MagicShelfService:
         if not group_rule:
             return 0
 
+        if self._materializer is not None:
+            return self._materializer.ensure_current(
+                shelf_id, group_rule, repo
+            ).book_count
+
         book_ids_query = self._evaluator.build_matching_book_ids_stmt(group_rule)
         return repo.count_books_by_ids_query(book_ids_query)
 
@@ -181,9 +211,16 @@ class MagicShelfService:
         if not group_rule:
             return [], 0
 
-        book_ids_query = self._evaluator.build_matching_book_ids_stmt(group_rule)
+        book_ids_query: SelectOfScalar[int]
+        if self._materializer is not None:
+            total_count = self._materializer.ensure_current(
+                shelf_id, group_rule, repo
+            ).book_count
+            book_ids_query = self._materializer.book_ids_stmt(shelf_id)
+        else:
+            book_ids_query = self._evaluator.build_matching_book_ids_stmt(group_rule)
+            total_count = repo.count_books_by_ids_query(book_ids_query)
 
-        total_count = repo.count_books_by_ids_query(book_ids_query)
         offset = (page - 1) * page_size
         books = repo.list_books_by_ids_query(
             book_ids_query,
@@ -198,6 +235,52 @@ class MagicShelfService:
 
         return books, total_count
 
+    def refresh_shelf(
+        self, shelf_id: int, *, rebuild: bool = False
+    ) -> MagicShelfRefreshResult | None:
+        """Refresh the materialized membership of a Magic Shelf.
+
+        Parameters
+        ----------
+        shelf_id : int
+            ID of the shelf.
+        rebuild : bool
+            Evaluate the rules against the whole library instead of only
+            the books modified since the last refresh.
+
+        Returns
+        -------
+        MagicShelfRefreshResult | None
+            Refresh statistics, or None if the shelf's rules are invalid.
+
+        Raises
+        ------
+        ValueError
+            If no materializer is configured, the shelf is not found, not a
+            magic shelf, or its library is not among the configured
+            repositories.
+        """
+        if self._materializer is None:
+            msg = "Magic Shelf materialization is not configured"
+            raise ValueError(msg)
+
+        shelf = self._shelf_repo.get(shelf_id)
+        if not shelf:
+            msg = f"Shelf {shelf_id} not found"
+            raise ValueError(msg)
+
+        if shelf.shelf_type != ShelfTypeEnum.MAGIC_SHELF:
+            msg = f"Shelf {shelf_id} is not a Magic Shelf"
+            raise ValueError(msg)
+
+        repo = self._get_repo_for_shelf(shelf)
+
+        group_rule = self._parse_rules(shelf.filter_rules, shelf_id)
+        if not group_rule:
+            return None
+
+        return self._materializer.refresh(shelf_id, group_rule, repo, rebuild=rebuild)
+
     def _get_repo_for_shelf(self, shelf: Shelf) -> IBookRepository:
         """Return the book repository for the shelf's library.
 
@@ -82,19 +82,57 @@ class EpubMetadataExtractor(MetadataExtractionStrategy):
         # EPUB is a ZIP file containing OPF metadata
         try:
             with zipfile.ZipFile(file_path, "r") as epub_zip:
-                opf_path = self._find_opf_file(epub_zip)
-                if opf_path is None:
-                    msg = "No OPF file found in EPUB"
-                    raise ValueError(msg)
-
-                root = self._parse_opf(epub_zip, opf_path)
-                return self._extract_metadata_from_opf(
-                    root, original_filename, opf_path
-                )
+                opf_path, root = self.read_package(epub_zip)
+                return self.extract_from_package(root, original_filename, opf_path)
         except zipfile.BadZipFile as e:
             msg = f"File is not a valid EPUB/ZIP file: {e}"
             raise ValueError(msg) from e
 
+    def read_package(self, epub_zip: zipfile.ZipFile) -> tuple[str, EtreeElement]:
+        """Locate and parse the OPF package document of an open EPUB.
+
+        Parameters
+        ----------
+        epub_zip : zipfile.ZipFile
+            Open EPUB archive.
+
+        Returns
+        -------
+        tuple[str, EtreeElement]
+            Tuple of (OPF path within the archive, parsed OPF root).
+
+        Raises
+        ------
+        ValueError
+            If the archive contains no OPF file.
+        """
+        opf_path = self._find_opf_file(epub_zip)
+        if opf_path is None:
+            msg = "No OPF file found in EPUB"
+            raise ValueError(msg)
+        return opf_path, self._parse_opf(epub_zip, opf_path)
+
+    def extract_from_package(
+        self, root: EtreeElement, original_filename: str, opf_path: str
+    ) -> BookMetadata:
+        """Extract metadata from an already parsed OPF package document.
+
+        Parameters
+        ----------
+        root : EtreeElement
+            Parsed OPF root, as returned by `read_package`.
+        original_filename : str
+            Original filename for fallback.
+        opf_path : str
+            OPF path within the archive.
+
+        Returns
+        -------
+        BookMetadata
+            Extracted metadata.
+        """
+        return self._extract_metadata_from_opf(root, original_filename, opf_path)
+
     def _find_opf_file(self, epub_zip: zipfile.ZipFile) -> str | None:
         """Find the OPF file in the EPUB archive."""
         # First try to find container.xml to get the correct OPF path
@@ -51,87 +51,105 @@ class PdfMetadataExtractor(MetadataExtractionStrategy):
         following foliate-js approach.
         """
         with file_path.open("rb") as pdf_file:
-            reader = PdfReader(pdf_file)
-            info = reader.metadata
-
-            if info is None:
-                # Fallback to filename if no metadata
-                return BookMetadata(
-                    title=original_filename,
-                    author="Unknown",
-                )
-
-            # Try to get XMP metadata (Dublin Core)
-            xmp_metadata = None
-            try:
-                if hasattr(reader, "xmp_metadata") and reader.xmp_metadata:
-                    xmp_metadata = reader.xmp_metadata
-            except (AttributeError, KeyError, TypeError):
-                pass
+            return self.extract_from_reader(PdfReader(pdf_file), original_filename)
 
-            # Extract fields (prefer XMP, fallback to Info)
-            # Following foliate-js pattern: metadata?.get('dc:title') ?? info?.Title
-            title = (
-                self._get_xmp_field(xmp_metadata, "dc:title")
-                or info.get("/Title")
-                or original_filename
-            )
-            author = (
-                self._get_xmp_field(xmp_metadata, "dc:creator")
-                or info.get("/Author")
-                or "Unknown"
-            )
-            description = (
-                self._get_xmp_field(xmp_metadata, "dc:description")
-                or info.get("/Subject")
-                or ""
-            )
-            publisher = self._get_xmp_field(xmp_metadata, "dc:publisher") or info.get(
-                "/Producer"
-            )
-            language = self._get_xmp_field(xmp_metadata, "dc:language")
-            subject = self._get_xmp_field(xmp_metadata, "dc:subject")
-            identifier = self._get_xmp_field(xmp_metadata, "dc:identifier")
-            rights = self._get_xmp_field(xmp_metadata, "dc:rights")
-
-            # Extract contributors
-            contributors = self._extract_contributors(xmp_metadata, info)
-
-            # Extract tags (from Keywords in Info or dc:subject in XMP)
-            tags = self._extract_tags(info, subject)
-
-            # Extract dates
-            pubdate = self._extract_pubdate(info)
-            modified = self._extract_modified(info)
-
-            # Extract identifiers
-            identifiers = self._extract_identifiers(identifier)
-
-            # Get primary author from contributors or fallback
-            primary_author = author
-            if contributors:
-                authors = [
-                    c.name for c in contributors if c.role == "author" or c.role is None
-                ]
-                if authors:
-                    primary_author = " & ".join(authors)
-                elif not primary_author or primary_author == "Unknown":
-                    primary_author = contributors[0].name
+    def extract_from_reader(
+        self, reader: PdfReader, original_filename: str
+    ) -> BookMetadata:
+        """Extract metadata from an open PDF reader.
 
+        Parameters
+        ----------
+        reader : PdfReader
+            Reader over the PDF file.
+        original_filename : str
+            Original filename for fallback.
+
+        Returns
+        -------
+        BookMetadata
+            Extracted metadata.
+        """
+        info = reader.metadata
+
+        if info is None:
+            # Fallback to filename if no metadata
             return BookMetadata(
-                title=title,
-                author=primary_author,
-                description=description,
-                tags=tags,
-                publisher=publisher,
-                pubdate=pubdate,
-                modified=modified,
-                languages=[language] if language else [],
-                identifiers=identifiers,
-                contributors=contributors,
-                rights=rights,
+                title=original_filename,
+                author="Unknown",
             )
 
+        # Try to get XMP metadata (Dublin Core)
+        xmp_metadata = None
+        try:
+            if hasattr(reader, "xmp_metadata") and reader.xmp_metadata:
+                xmp_metadata = reader.xmp_metadata
+        except (AttributeError, KeyError, TypeError):
+            pass
+
+        # Extract fields (prefer XMP, fallback to Info)
+        # Following foliate-js pattern: metadata?.get('dc:title') ?? info?.Title
+        title = (
+            self._get_xmp_field(xmp_metadata, "dc:title")
+            or info.get("/Title")
+            or original_filename
+        )
+        author = (
+            self._get_xmp_field(xmp_metadata, "dc:creator")
+            or info.get("/Author")
+            or "Unknown"
+        )
+        description = (
+            self._get_xmp_field(xmp_metadata, "dc:description")
+            or info.get("/Subject")
+            or ""
+        )
+        publisher = self._get_xmp_field(xmp_metadata, "dc:publisher") or info.get(
+            "/Producer"
+        )
+        language = self._get_xmp_field(xmp_metadata, "dc:language")
+        subject = self._get_xmp_field(xmp_metadata, "dc:subject")
+        identifier = self._get_xmp_field(xmp_metadata, "dc:identifier")
+        rights = self._get_xmp_field(xmp_metadata, "dc:rights")
+
+        # Extract contributors
+        contributors = self._extract_contributors(xmp_metadata, info)
+
+        # Extract tags (from Keywords in Info or dc:subject in XMP)
+        tags = self._extract_tags(info, subject)
+
+        # Extract dates
+        pubdate = self._extract_pubdate(info)
+        modified = self._extract_modified(info)
+
+        # Extract identifiers
+        identifiers = self._extract_identifiers(identifier)
+
+        # Get primary author from contributors or fallback
+        primary_author = author
+        if contributors:
+            authors = [
+                c.name for c in contributors if c.role == "author" or c.role is None
+            ]
+            if authors:
+                primary_author = " & ".join(authors)
+            elif not primary_author or primary_author == "Unknown":
+                primary_author = contributors[0].name
+
+        return BookMetadata(
+            title=title,
+            author=primary_author,
+            description=description,
+            tags=tags,
+            publisher=publisher,
+            pubdate=pubdate,
+            modified=modified,
+            languages=[language] if language else [],
+            identifiers=identifiers,
+            contributors=contributors,
+            rights=rights,
+        )
+
     def _get_xmp_field(self, xmp_metadata: object | None, dc_field: str) -> str | None:
         """Get field from XMP metadata (Dublin Core).
 
@@ -18,24 +18,92 @@
 Queries books across multiple Calibre libraries, merges results, and
 provides sorted, paginated responses.  Follows the same cross-library
 aggregation pattern as :class:`MagicShelfService`.
+
+Libraries are queried concurrently.  Each library streams only the
+``(sort_value, book_id)`` keys of its matching books, in order and
+keyset-paginated, into a heap-based k-way merge; book data is loaded and
+enriched for the final page only.  Pages can be requested by number or by
+an opaque continuation cursor that resumes right after the previous page.
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
+import concurrent.futures
+import heapq
+import json
 import logging
 import random
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, TypedDict, cast
+
+from sqlmodel import col, select
 
+from bookcard.models.core import Book
 from bookcard.repositories.calibre.repository import CalibreBookRepository
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+
+    from sqlmodel.sql.expression import SelectOfScalar
 
     from bookcard.models.config import Library
     from bookcard.repositories.models import BookWithFullRelations, BookWithRelations
+    from bookcard.repositories.visibility import BookVisibility
 
 logger = logging.getLogger(__name__)
 
+MAX_WORKERS = 8
+
+# Upper bound on keys fetched per library query; deep pages fetch more
+# batches lazily as the merge consumes them.
+MAX_KEY_BATCH = 5000
+
+# Larger than any book ID, used to place a library's ties around a cursor
+_MAX_BOOK_ID = 2**63 - 1
+
+# Merge order: sort value, then library ID, then book ID
+type MergeKey = tuple[object, int, int]
+type KeyFetcher = Callable[
+    [CalibreBookRepository, tuple[object, int] | None, int],
+    list[tuple[object, int]],
+]
+
+
+class _BookFilters(TypedDict):
+    """Filter arguments shared by the per-library count and key queries."""
+
+    author_ids: list[int] | None
+    title_ids: list[int] | None
+    genre_ids: list[int] | None
+    publisher_ids: list[int] | None
+    identifier_ids: list[int] | None
+    series_ids: list[int] | None
+    formats: list[str] | None
+    rating_ids: list[int] | None
+    language_ids: list[int] | None
+
+
+@dataclass
+class MultiLibraryBookPage:
+    """One page of the all-libraries book listing.
+
+    Attributes
+    ----------
+    books : list[BookWithRelations | BookWithFullRelations]
+        Books of the page, tagged with ``library_id``.
+    total : int
+        Total number of matching books across libraries.
+    next_cursor : str | None
+        Cursor of the following page, or None on the last page.
+    """
+
+    books: list[BookWithRelations | BookWithFullRelations]
+    total: int
+    next_cursor: str | None = None
+
 
 class MultiLibraryBookService:
     """Query and merge books from multiple Calibre libraries.
@@ -44,11 +112,18 @@ class MultiLibraryBookService:
     ----------
     libraries : dict[int, Library]
         Mapping of ``library_id`` to :class:`Library` configuration.
+    repositories : dict[int, CalibreBookRepository] | None
+        Optional repositories per ``library_id`` (created from
+        ``libraries`` if None).
     """
 
-    def __init__(self, libraries: dict[int, Library]) -> None:
+    def __init__(
+        self,
+        libraries: dict[int, Library],
+        repositories: dict[int, CalibreBookRepository] | None = None,
+    ) -> None:
         self._libraries = libraries
-        self._repos: dict[int, CalibreBookRepository] = {
+        self._repos: dict[int, CalibreBookRepository] = repositories or {
             lib_id: CalibreBookRepository(
                 calibre_db_path=lib.calibre_db_path,
                 calibre_db_file=lib.calibre_db_file,
@@ -68,16 +143,18 @@ class MultiLibraryBookService:
         full: bool = False,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
-    ) -> tuple[list[BookWithRelations | BookWithFullRelations], int]:
+        visibility: BookVisibility | None = None,
+        cursor: str | None = None,
+    ) -> MultiLibraryBookPage:
         """List books across all configured libraries.
 
-        Each library is queried independently with the same filters.  Results
+        Each library is queried concurrently with the same filters.  Results
         are tagged with ``library_id``, merged, sorted, and paginated.
 
         Parameters
         ----------
         page : int
-            Page number (1-indexed).
+            Page number (1-indexed); ignored when ``cursor`` is given.
         page_size : int
             Items per page.
         search_query : str | None
@@ -95,52 +172,75 @@ class MultiLibraryBookService:
             Optional publication-date month filter.
         pubdate_day : int | None
             Optional publication-date day filter.
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
+        cursor : str | None
+            ``next_cursor`` of the previous page, to continue after it.
 
         Returns
         -------
-        tuple[list[BookWithRelations | BookWithFullRelations], int]
-            ``(paginated_books, total_count)``
+        MultiLibraryBookPage
+            Page of books with total count and continuation cursor.
+
+        Raises
+        ------
+        ValueError
+            If ``cursor`` is malformed or was issued for another ordering.
         """
-        all_books: list[BookWithRelations | BookWithFullRelations] = []
-        total_count = 0
-        fetch_limit = page * page_size
 
-        for lib_id, repo in self._repos.items():
-            count = repo.count_books(
+        def count(repo: CalibreBookRepository) -> int:
+            return repo.count_books(
                 search_query=search_query,
                 author_id=author_id,
                 pubdate_month=pubdate_month,
                 pubdate_day=pubdate_day,
+                visibility=visibility,
             )
-            total_count += count
-            if count == 0:
-                continue
 
-            books = repo.list_books(
-                limit=min(count, fetch_limit),
-                offset=0,
-                search_query=search_query,
-                author_id=author_id,
+        if sort_by == "random":
+            return self._list_random(
+                page=page,
+                page_size=page_size,
+                count=count,
+                fetch=lambda repo, limit: repo.list_books(
+                    limit=limit,
+                    offset=0,
+                    search_query=search_query,
+                    author_id=author_id,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    full=full,
+                    pubdate_month=pubdate_month,
+                    pubdate_day=pubdate_day,
+                    visibility=visibility,
+                ),
+            )
+
+        def fetch_keys(
+            repo: CalibreBookRepository, after: tuple[object, int] | None, limit: int
+        ) -> list[tuple[object, int]]:
+            return repo.list_book_sort_keys(
                 sort_by=sort_by,
                 sort_order=sort_order,
-                full=full,
+                after=after,
+                limit=limit,
+                search_query=search_query,
+                author_id=author_id,
                 pubdate_month=pubdate_month,
                 pubdate_day=pubdate_day,
-            )
-            for book in books:
-                book.library_id = lib_id
-            all_books.extend(books)
-
-        if sort_by == "random":
-            random.shuffle(all_books)
-        else:
-            all_books.sort(
-                key=_get_sort_key(sort_by),
-                reverse=(sort_order == "desc"),
+                visibility=visibility,
             )
 
-        offset = (page - 1) * page_size
-        return all_books[offset : offset + page_size], total_count
+        return self._list_merged(
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            full=full,
+            cursor=cursor,
+            count=count,
+            fetch_keys=fetch_keys,
+        )
 
     def list_books_with_filters(
         self,
@@ -159,13 +259,15 @@ class MultiLibraryBookService:
         sort_by: str = "timestamp",
         sort_order: str = "desc",
         full: bool = False,
-    ) -> tuple[list[BookWithRelations | BookWithFullRelations], int]:
+        visibility: BookVisibility | None = None,
+        cursor: str | None = None,
+    ) -> MultiLibraryBookPage:
         """List books across libraries using multi-filter criteria.
 
         Parameters
         ----------
         page : int
-            Page number (1-indexed).
+            Page number (1-indexed); ignored when ``cursor`` is given.
         page_size : int
             Items per page.
         author_ids : list[int] | None
@@ -192,86 +294,259 @@ class MultiLibraryBookService:
             ``'asc'`` or ``'desc'``.
         full : bool
             Return full book metadata.
+        visibility : BookVisibility | None
+            Optional restriction to the books a user may see.
+        cursor : str | None
+            ``next_cursor`` of the previous page, to continue after it.
 
         Returns
         -------
-        tuple[list[BookWithRelations | BookWithFullRelations], int]
-            ``(paginated_books, total_count)``
+        MultiLibraryBookPage
+            Page of books with total count and continuation cursor.
+
+        Raises
+        ------
+        ValueError
+            If ``cursor`` is malformed or was issued for another ordering.
         """
-        all_books: list[BookWithRelations | BookWithFullRelations] = []
-        total_count = 0
-        fetch_limit = page * page_size
+        filters: _BookFilters = {
+            "author_ids": author_ids,
+            "title_ids": title_ids,
+            "genre_ids": genre_ids,
+            "publisher_ids": publisher_ids,
+            "identifier_ids": identifier_ids,
+            "series_ids": series_ids,
+            "formats": formats,
+            "rating_ids": rating_ids,
+            "language_ids": language_ids,
+        }
 
-        for lib_id, repo in self._repos.items():
-            count = repo.count_books_with_filters(
-                author_ids=author_ids,
-                title_ids=title_ids,
-                genre_ids=genre_ids,
-                publisher_ids=publisher_ids,
-                identifier_ids=identifier_ids,
-                series_ids=series_ids,
-                formats=formats,
-                rating_ids=rating_ids,
-                language_ids=language_ids,
-            )
-            total_count += count
-            if count == 0:
-                continue
-
-            books = repo.list_books_with_filters(
-                limit=min(count, fetch_limit),
-                offset=0,
-                author_ids=author_ids,
-                title_ids=title_ids,
-                genre_ids=genre_ids,
-                publisher_ids=publisher_ids,
-                identifier_ids=identifier_ids,
-                series_ids=series_ids,
-                formats=formats,
-                rating_ids=rating_ids,
-                language_ids=language_ids,
+        def fetch_keys(
+            repo: CalibreBookRepository, after: tuple[object, int] | None, limit: int
+        ) -> list[tuple[object, int]]:
+            return repo.list_book_sort_keys_with_filters(
                 sort_by=sort_by,
                 sort_order=sort_order,
+                after=after,
+                limit=limit,
+                visibility=visibility,
+                **filters,
+            )
+
+        return self._list_merged(
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            full=full,
+            cursor=cursor,
+            count=lambda repo: repo.count_books_with_filters(
+                visibility=visibility, **filters
+            ),
+            fetch_keys=fetch_keys,
+        )
+
+    def _list_merged(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        sort_by: str,
+        sort_order: str,
+        full: bool,
+        cursor: str | None,
+        count: Callable[[CalibreBookRepository], int],
+        fetch_keys: KeyFetcher,
+    ) -> MultiLibraryBookPage:
+        """Merge per-library key streams and load the selected page."""
+        order = "asc" if sort_order.lower() == "asc" else "desc"
+        position = _decode_cursor(cursor, sort_by, order) if cursor else None
+        skip = 0 if position is not None else (page - 1) * page_size
+        batch_size = min(skip + page_size + 1, MAX_KEY_BATCH)
+
+        with self._executor() as executor:
+            count_futures = [
+                executor.submit(count, repo) for repo in self._repos.values()
+            ]
+            first_batches = {
+                lib_id: executor.submit(
+                    fetch_keys,
+                    repo,
+                    _library_after(position, lib_id, order),
+                    batch_size,
+                )
+                for lib_id, repo in self._repos.items()
+            }
+            streams = [
+                _stream_keys(
+                    lib_id,
+                    future.result(),
+                    lambda after, limit, repo=self._repos[lib_id]: fetch_keys(
+                        repo, after, limit
+                    ),
+                    batch_size,
+                )
+                for lib_id, future in first_batches.items()
+            ]
+            merged = heapq.merge(*streams, reverse=order == "desc")
+            window = list(islice(merged, skip, skip + page_size + 1))
+            total = sum(future.result() for future in count_futures)
+            page_keys = window[:page_size]
+            books = self._load_books(executor, page_keys, full=full)
+
+        next_cursor = (
+            _encode_cursor(page_keys[-1], sort_by, order)
+            if len(window) > page_size
+            else None
+        )
+        return MultiLibraryBookPage(books=books, total=total, next_cursor=next_cursor)
+
+    def _load_books(
+        self,
+        executor: concurrent.futures.Executor,
+        page_keys: list[MergeKey],
+        *,
+        full: bool,
+    ) -> list[BookWithRelations | BookWithFullRelations]:
+        """Load the books of a page, in page order."""
+        ids_by_library: dict[int, list[int]] = {}
+        for _, lib_id, book_id in page_keys:
+            ids_by_library.setdefault(lib_id, []).append(book_id)
+
+        futures = {
+            lib_id: executor.submit(
+                self._repos[lib_id].list_books_by_ids_query,
+                cast(
+                    "SelectOfScalar[int]",
+                    select(Book.id).where(col(Book.id).in_(book_ids)),
+                ),
+                limit=len(book_ids),
                 full=full,
             )
+            for lib_id, book_ids in ids_by_library.items()
+        }
+        loaded: dict[tuple[int, int], BookWithRelations | BookWithFullRelations] = {}
+        for lib_id, future in futures.items():
+            for book in future.result():
+                book.library_id = lib_id
+                if book.book.id is not None:
+                    loaded[lib_id, book.book.id] = book
+
+        # Books deleted between the key and data queries are skipped
+        return [
+            loaded[lib_id, book_id]
+            for _, lib_id, book_id in page_keys
+            if (lib_id, book_id) in loaded
+        ]
+
+    def _list_random(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        count: Callable[[CalibreBookRepository], int],
+        fetch: Callable[
+            [CalibreBookRepository, int],
+            list[BookWithRelations | BookWithFullRelations],
+        ],
+    ) -> MultiLibraryBookPage:
+        """List a random sample; random order has no keyset to resume from."""
+        fetch_limit = page * page_size
+
+        def load(
+            lib_id: int, repo: CalibreBookRepository
+        ) -> tuple[int, list[BookWithRelations | BookWithFullRelations]]:
+            library_count = count(repo)
+            if library_count == 0:
+                return 0, []
+            books = fetch(repo, min(library_count, fetch_limit))
             for book in books:
                 book.library_id = lib_id
-            all_books.extend(books)
+            return library_count, books
 
-        all_books.sort(
-            key=_get_sort_key(sort_by),
-            reverse=(sort_order == "desc"),
+        all_books: list[BookWithRelations | BookWithFullRelations] = []
+        total = 0
+        with self._executor() as executor:
+            for library_count, books in executor.map(
+                lambda item: load(*item), self._repos.items()
+            ):
+                total += library_count
+                all_books.extend(books)
+
+        random.shuffle(all_books)
+        offset = (page - 1) * page_size
+        return MultiLibraryBookPage(
+            books=all_books[offset : offset + page_size], total=total
         )
 
-        offset = (page - 1) * page_size
-        return all_books[offset : offset + page_size], total_count
+    def _executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(len(self._repos), MAX_WORKERS)),
+            thread_name_prefix="multi-library",
+        )
 
 
-def _get_sort_key(
-    sort_by: str,
-) -> Callable:
-    """Return a sort-key function for cross-library result merging.
+def _stream_keys(
+    lib_id: int,
+    first_batch: list[tuple[object, int]],
+    fetch: Callable[[tuple[object, int], int], list[tuple[object, int]]],
+    batch_size: int,
+) -> Iterator[MergeKey]:
+    """Yield a library's merge keys, fetching further batches on demand."""
+    keys = first_batch
+    while True:
+        for value, book_id in keys:
+            yield (value, lib_id, book_id)
+        if len(keys) < batch_size:
+            return
+        keys = fetch(keys[-1], batch_size)
+
+
+def _library_after(
+    position: MergeKey | None, lib_id: int, order: str
+) -> tuple[object, int] | None:
+    """Translate a global cursor into one library's exclusive keyset cursor.
+
+    Ties on the sort value are ordered by library ID, then book ID, so a
+    library's books with the cursor's sort value are either all before the
+    cursor, all after it, or split at the cursor's book ID.
+    """
+    if position is None:
+        return None
+    value, cursor_lib_id, book_id = position
+    if lib_id == cursor_lib_id:
+        return (value, book_id)
+    ties_precede = lib_id < cursor_lib_id if order == "asc" else lib_id > cursor_lib_id
+    if order == "asc":
+        return (value, _MAX_BOOK_ID if ties_precede else -1)
+    return (value, -1 if ties_precede else _MAX_BOOK_ID)
 
-    Parameters
-    ----------
-    sort_by : str
-        Sort field name.
 
-    Returns
-    -------
-    callable
-        Key function suitable for :func:`list.sort`.
-    """
+def _encode_cursor(key: MergeKey, sort_by: str, order: str) -> str:
+    payload = json.dumps([sort_by, order, *key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
 
-    def _key(b: BookWithRelations | BookWithFullRelations) -> str | float:
-        if sort_by == "title":
-            return (b.book.sort or b.book.title or "").lower()
-        if sort_by == "author_sort":
-            return (b.book.author_sort or "").lower()
-        if sort_by == "pubdate":
-            return str(b.book.pubdate or "")
-        if sort_by == "series_index":
-            return b.book.series_index or 0.0
-        return str(b.book.timestamp or "")
-
-    return _key
+def _decode_cursor(cursor: str, sort_by: str, order: str) -> MergeKey:
+    """Decode a cursor issued by `_encode_cursor` for the same ordering.
+
+    Raises
+    ------
+    ValueError
+        If the cursor is malformed or was issued for another ordering.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        cursor_sort_by, cursor_order, value, lib_id, book_id = payload
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        msg = "invalid_cursor"
+        raise ValueError(msg) from e
+    if (
+        (cursor_sort_by, cursor_order) != (sort_by, order)
+        or not isinstance(lib_id, int)
+        or not isinstance(book_id, int)
+    ):
+        msg = "invalid_cursor"
+        raise ValueError(msg)
+    return (value, lib_id, book_id)
@@ -35,7 +35,7 @@ import secrets
 import time
 from dataclasses import dataclass
 from threading import Lock
-from typing import Final
+from typing import TYPE_CHECKING, Final
 from urllib.parse import urlencode
 
 import httpx
@@ -45,6 +45,9 @@ from jwt.types import Options
 
 from bookcard.config import AppConfig  # noqa: TC001
 
+if TYPE_CHECKING:
+    from bookcard.services.oidc_key_manager import OIDCKeyManager
+
 
 class OIDCAuthError(Exception):
     """Raised when OIDC authentication operations fail."""
@@ -85,17 +88,27 @@ class OIDCAuthService:
     config : AppConfig
         Application configuration containing OIDC settings.
     http_client : httpx.Client | None
-        Optional injected HTTP client. If not provided, an internal client is used.
+        Optional injected HTTP client. If not provided, the key manager's
+        client or an internal client is used.
         This supports IOC/testing without coupling call sites to httpx.
+    key_manager : OIDCKeyManager | None
+        Optional process-wide cache of discovery, signing keys and validated
+        tokens. Without it, discovery and JWKS are cached per instance.
     """
 
     _DISCOVERY_PATH: Final[str] = ".well-known/openid-configuration"
     _STATE_AUD: Final[str] = "bookcard:oidc_state"
 
     def __init__(
-        self, config: AppConfig, http_client: httpx.Client | None = None
+        self,
+        config: AppConfig,
+        http_client: httpx.Client | None = None,
+        key_manager: OIDCKeyManager | None = None,
     ) -> None:
         self._cfg = config
+        self._key_manager = key_manager
+        if http_client is None and key_manager is not None:
+            http_client = key_manager.http_client
         self._http = http_client or httpx.Client(timeout=10.0)
 
         self._lock = Lock()
@@ -279,6 +292,9 @@ class OIDCAuthService:
     def validate_access_token(self, *, token: str) -> dict[str, object]:
         """Validate an OIDC JWT access token using JWKS.
 
+        With a key manager, claims of recently validated tokens are reused
+        without verifying the signature again.
+
         Parameters
         ----------
         token : str
@@ -289,28 +305,19 @@ class OIDCAuthService:
         dict[str, object]
             Validated JWT claims.
         """
-        jwks = self._get_jwks()
-        keys_raw = jwks.get("keys") if isinstance(jwks, dict) else None
-        if not isinstance(keys_raw, list) or not keys_raw:
-            msg = "oidc_jwks_invalid"
-            raise OIDCTokenValidationError(msg)
-        keys: list[object] = list(keys_raw)
+        if self._key_manager is not None:
+            cached = self._key_manager.get_claims(token)
+            if cached is not None:
+                return cached
 
         kid = self._extract_kid_from_jwt_header(token)
         if not isinstance(kid, str) or not kid:
             msg = "oidc_token_missing_kid"
             raise OIDCTokenValidationError(msg)
-
-        jwk = self._select_jwk_for_kid(keys, kid)
-        if jwk is None:
-            msg = "oidc_token_unknown_kid"
-            raise OIDCTokenValidationError(msg)
-
-        try:
-            public_key = RSAAlgorithm.from_jwk(json.dumps(jwk))
-        except (ValueError, TypeError) as err:
-            msg = "oidc_jwk_parse_failed"
-            raise OIDCTokenValidationError(msg) from err
+        if self._key_manager is not None:
+            public_key = self._key_manager.get_signing_key(kid)
+        else:
+            public_key = self._get_public_key(kid)
 
         issuer = self._cfg.oidc_issuer
         options = Options(verify_aud=False)
@@ -338,8 +345,30 @@ class OIDCAuthService:
 
         claims_dict: dict[str, object] = {str(k): v for k, v in claims.items()}
         self._enforce_client_audience_or_azp(claims_dict)
+        if self._key_manager is not None:
+            self._key_manager.put_claims(token, claims_dict)
         return claims_dict
 
+    def _get_public_key(self, kid: str) -> object:
+        """Get the public key with a key ID from this instance's JWKS."""
+        jwks = self._get_jwks()
+        keys_raw = jwks.get("keys") if isinstance(jwks, dict) else None
+        if not isinstance(keys_raw, list) or not keys_raw:
+            msg = "oidc_jwks_invalid"
+            raise OIDCTokenValidationError(msg)
+        keys: list[object] = list(keys_raw)
+
+        jwk = self._select_jwk_for_kid(keys, kid)
+        if jwk is None:
+            msg = "oidc_token_unknown_kid"
+            raise OIDCTokenValidationError(msg)
+
+        try:
+            return RSAAlgorithm.from_jwk(json.dumps(jwk))
+        except (ValueError, TypeError) as err:
+            msg = "oidc_jwk_parse_failed"
+            raise OIDCTokenValidationError(msg) from err
+
     @staticmethod
     def _extract_kid_from_jwt_header(token: str) -> str | None:
         """Extract `kid` from JWT header without verifying the signature."""
@@ -413,6 +442,8 @@ class OIDCAuthService:
         )
 
     def _get_discovery(self) -> dict[str, object]:
+        if self._key_manager is not None:
+            return self._key_manager.get_discovery()
         if not self._cfg.oidc_enabled:
             msg = "oidc_disabled"
             raise OIDCConfigurationError(msg)
@@ -0,0 +1,429 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Process-wide cache of OIDC provider metadata, signing keys and tokens.
+
+`OIDCAuthService` is created per request, so its own caches never outlive
+the request. `OIDCKeyManager` keeps, for the whole process, the provider's
+discovery document, its JWKS parsed into public keys by ``kid``, and the
+claims of recently validated tokens:
+
+- Keys are refreshed by a background thread (and lazily once stale). A
+  token signed with an unknown ``kid`` triggers one immediate refresh, to
+  pick up rotated keys, at most once per ``min_rotation_interval`` so
+  forged ``kid`` values cannot make every request call the provider.
+- Validated claims are cached by SHA-256 of the token for a few seconds,
+  never past the token's ``exp``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from jwt.algorithms import RSAAlgorithm
+
+from bookcard.services.oidc_auth_service import (
+    OIDCAuthError,
+    OIDCConfigurationError,
+    OIDCError,
+    OIDCTokenValidationError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from bookcard.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+# Seconds between refreshes of the discovery document and JWKS
+JWKS_REFRESH_INTERVAL = 3600.0
+
+# Minimum seconds between refreshes triggered by unknown key IDs
+JWKS_MIN_ROTATION_INTERVAL = 60.0
+
+# Seconds validated token claims are reused
+CLAIMS_CACHE_TTL = 60.0
+
+# Tokens whose validated claims are kept
+CLAIMS_CACHE_SIZE = 1024
+
+_DISCOVERY_PATH = ".well-known/openid-configuration"
+
+
+class OIDCKeyManager:
+    """Shared, thread-safe OIDC discovery, JWKS and validated-token cache.
+
+    Parameters
+    ----------
+    config : AppConfig
+        Application configuration containing OIDC settings.
+    http_client : httpx.Client | None
+        HTTP client for provider requests (also shared with
+        `OIDCAuthService`); a new client is created if not provided.
+    refresh_interval : float
+        Seconds after which discovery and keys are refreshed.
+    min_rotation_interval : float
+        Minimum seconds between key refreshes triggered by unknown key IDs.
+    claims_ttl : float
+        Seconds validated token claims are reused.
+    claims_cache_size : int
+        Maximum number of cached tokens.
+    clock : Callable[[], float]
+        Wall clock returning seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        http_client: httpx.Client | None = None,
+        *,
+        refresh_interval: float = JWKS_REFRESH_INTERVAL,
+        min_rotation_interval: float = JWKS_MIN_ROTATION_INTERVAL,
+        claims_ttl: float = CLAIMS_CACHE_TTL,
+        claims_cache_size: int = CLAIMS_CACHE_SIZE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cfg = config
+        self._http = http_client or httpx.Client(timeout=10.0)
+        self._refresh_interval = refresh_interval
+        self._min_rotation_interval = min_rotation_interval
+        self._claims_ttl = claims_ttl
+        self._claims_cache_size = claims_cache_size
+        self._clock = clock
+
+        # Guards the cached values; _fetch_lock serializes provider requests
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        # Fetch attempts (failed ones included) pace refreshes during outages
+        self._discovery: dict[str, object] | None = None
+        self._discovery_checked_at = float("-inf")
+        self._keys: dict[str, object] | None = None
+        self._keys_checked_at = float("-inf")
+        self._claims: OrderedDict[str, tuple[float, dict[str, object]]] = OrderedDict()
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """HTTP client used for provider requests."""
+        return self._http
+
+    def get_discovery(self) -> dict[str, object]:
+        """Get the provider's discovery document.
+
+        Returns
+        -------
+        dict[str, object]
+            Cached discovery document, fetched if missing or stale.
+
+        Raises
+        ------
+        OIDCConfigurationError
+            If OIDC is disabled or no issuer is configured.
+        OIDCError
+            If the document cannot be fetched and none is cached.
+        """
+        with self._lock:
+            discovery = self._discovery
+            checked_at = self._discovery_checked_at
+        if discovery is not None and not self._is_due(
+            checked_at, self._refresh_interval
+        ):
+            return discovery
+        with self._fetch_lock:
+            with self._lock:
+                if self._discovery is not None and (
+                    self._discovery_checked_at > checked_at
+                ):
+                    return self._discovery
+            try:
+                return self._fetch_discovery()
+            except OIDCError:
+                if discovery is None:
+                    raise
+                logger.warning("Failed to refresh OIDC discovery; using cached")
+                return discovery
+
+    def get_signing_key(self, kid: str) -> object:
+        """Get the provider's public key with a key ID.
+
+        Parameters
+        ----------
+        kid : str
+            Key ID from the token header.
+
+        Returns
+        -------
+        object
+            Public key for signature verification.
+
+        Raises
+        ------
+        OIDCTokenValidationError
+            If no key has the ID, even after refreshing the keys.
+        OIDCError
+            If the keys cannot be fetched and none are cached.
+        """
+        with self._lock:
+            keys = self._keys
+            checked_at = self._keys_checked_at
+        if keys is None or self._is_due(checked_at, self._refresh_interval):
+            keys = self._refresh_keys(checked_at, stale=keys)
+        elif kid not in keys and self._is_due(checked_at, self._min_rotation_interval):
+            # The provider may have rotated its keys since the last fetch
+            keys = self._refresh_keys(checked_at, stale=keys)
+        key = keys.get(kid)
+        if key is None:
+            msg = "oidc_token_unknown_kid"
+            raise OIDCTokenValidationError(msg)
+        return key
+
+    def refresh(self) -> None:
+        """Fetch the discovery document and keys again.
+
+        Raises
+        ------
+        OIDCAuthError
+            If the provider cannot be reached or returns invalid data.
+        """
+        with self._fetch_lock:
+            self._fetch_discovery()
+            self._fetch_keys()
+
+    def get_claims(self, token: str) -> dict[str, object] | None:
+        """Get the cached claims of a validated token.
+
+        Parameters
+        ----------
+        token : str
+            Bearer token.
+
+        Returns
+        -------
+        dict[str, object] | None
+            Copy of the claims, or None if the token is not cached or its
+            entry expired.
+        """
+        key = self._token_key(token)
+        now = self._clock()
+        with self._lock:
+            entry = self._claims.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if now >= expires_at:
+                del self._claims[key]
+                return None
+            self._claims.move_to_end(key)
+            return dict(claims)
+
+    def put_claims(self, token: str, claims: dict[str, object]) -> None:
+        """Cache the claims of a validated token.
+
+        Parameters
+        ----------
+        token : str
+            Bearer token.
+        claims : dict[str, object]
+            Validated claims; reused until the cache TTL or the token's
+            ``exp``, whichever comes first.
+        """
+        expires_at = self._clock() + self._claims_ttl
+        exp = claims.get("exp")
+        if isinstance(exp, int | float):
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= self._clock():
+            return
+        key = self._token_key(token)
+        with self._lock:
+            self._claims[key] = (expires_at, dict(claims))
+            self._claims.move_to_end(key)
+            while len(self._claims) > self._claims_cache_size:
+                self._claims.popitem(last=False)
+
+    def start(self) -> None:
+        """Start refreshing discovery and keys in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="OIDCKeyManager", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop the refresher and close the HTTP client."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self._http.close()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.refresh()
+            except OIDCAuthError as e:
+                logger.warning("Failed to refresh OIDC signing keys: %s", e)
+            except Exception:
+                logger.exception("Unexpected error refreshing OIDC signing keys")
+            if self._stop_event.wait(self._refresh_interval):
+                return
+
+    def _is_due(self, checked_at: float, interval: float) -> bool:
+        return self._clock() - checked_at >= interval
+
+    def _refresh_keys(
+        self, checked_at: float, *, stale: dict[str, object] | None
+    ) -> dict[str, object]:
+        """Fetch keys unless another thread tried since ``checked_at``."""
+        with self._fetch_lock:
+            with self._lock:
+                if self._keys is not None and self._keys_checked_at > checked_at:
+                    return self._keys
+            try:
+                return self._fetch_keys()
+            except OIDCError:
+                if stale is None:
+                    raise
+                logger.warning("Failed to refresh OIDC signing keys; using cached")
+                return stale
+
+    def _fetch_discovery(self) -> dict[str, object]:
+        if not self._cfg.oidc_enabled:
+            msg = "oidc_disabled"
+            raise OIDCConfigurationError(msg)
+        if not self._cfg.oidc_issuer:
+            msg = "oidc_issuer_missing"
+            raise OIDCConfigurationError(msg)
+        url = f"{self._cfg.oidc_issuer.rstrip('/')}/{_DISCOVERY_PATH}"
+        with self._lock:
+            self._discovery_checked_at = self._clock()
+        discovery = self._get_json(url, error_prefix="oidc_discovery")
+        with self._lock:
+            self._discovery = discovery
+        return discovery
+
+    def _fetch_keys(self) -> dict[str, object]:
+        with self._lock:
+            discovery = self._discovery
+            self._keys_checked_at = self._clock()
+        if discovery is None:
+            discovery = self._fetch_discovery()
+        jwks_uri = discovery.get("jwks_uri")
+        if not isinstance(jwks_uri, str) or not jwks_uri:
+            msg = "OIDC discovery missing jwks_uri"
+            raise OIDCConfigurationError(msg)
+
+        jwks = self._get_json(jwks_uri, error_prefix="oidc_jwks")
+        keys_raw = jwks.get("keys")
+        if not isinstance(keys_raw, list) or not keys_raw:
+            msg = "oidc_jwks_invalid"
+            raise OIDCError(msg)
+        keys: dict[str, object] = {}
+        for jwk in keys_raw:
+            if not isinstance(jwk, dict):
+                continue
+            key_data: dict[str, Any] = jwk
+            kid = key_data.get("kid")
+            if not isinstance(kid, str):
+                continue
+            try:
+                keys[kid] = RSAAlgorithm.from_jwk(json.dumps(key_data))
+            except (ValueError, TypeError):
+                # Keys of other types or uses (e.g. encryption) are not used
+                logger.debug("Skipping unusable OIDC key %s", kid)
+
+        with self._lock:
+            self._keys = keys
+        return keys
+
+    def _get_json(self, url: str, *, error_prefix: str) -> dict[str, object]:
+        try:
+            resp = self._http.get(url)
+        except httpx.TimeoutException as err:
+            msg = f"{error_prefix}_timeout"
+            raise OIDCError(msg) from err
+        except httpx.HTTPError as err:
+            msg = f"{error_prefix}_http_error"
+            raise OIDCError(msg) from err
+        try:
+            payload = resp.json()
+        except json.JSONDecodeError as err:
+            msg = f"{error_prefix}_non_json"
+            raise OIDCError(msg) from err
+        if resp.status_code >= 400:
+            msg = f"{error_prefix}_failed"
+            raise OIDCError(msg)
+        if not isinstance(payload, dict):
+            msg = f"{error_prefix}_invalid"
+            raise OIDCError(msg)
+        return {str(k): v for k, v in payload.items()}
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+_manager: OIDCKeyManager | None = None
+_manager_lock = threading.Lock()
+
+
+def configure_oidc_key_manager(config: AppConfig | None) -> OIDCKeyManager | None:
+    """Install the global OIDC key manager.
+
+    Replaces (and shuts down) any previously configured manager.
+
+    Parameters
+    ----------
+    config : AppConfig | None
+        Application configuration; None, or OIDC being disabled, removes
+        the manager.
+
+    Returns
+    -------
+    OIDCKeyManager | None
+        Newly installed (not yet started) manager, or None if disabled.
+    """
+    global _manager
+    manager = (
+        OIDCKeyManager(config) if config is not None and config.oidc_enabled else None
+    )
+    with _manager_lock:
+        previous, _manager = _manager, manager
+    if previous is not None:
+        previous.shutdown()
+    return manager
+
+
+def get_oidc_key_manager() -> OIDCKeyManager | None:
+    """Get the global OIDC key manager.
+
+    Returns
+    -------
+    OIDCKeyManager | None
+        Manager configured by `configure_oidc_key_manager`, or None.
+    """
+    with _manager_lock:
+        return _manager
@@ -15,7 +15,10 @@
 
 """Book query service for OPDS feeds with permission filtering.
 
-Queries books from Calibre library and filters based on user permissions.
+Queries books from Calibre library restricted to the books a user may read.
+The restriction is compiled into the listing queries, so pages and totals
+only cover readable books; fetched books are still checked against the
+user's permissions as a safety net.
 """
 
 from __future__ import annotations
@@ -34,6 +37,7 @@ if TYPE_CHECKING:
     from bookcard.models.auth import User
     from bookcard.models.config import Library
     from bookcard.repositories.models import BookWithRelations
+    from bookcard.repositories.visibility import BookVisibility
 
 
 class OpdsBookQueryService(IOpdsBookQueryService):
@@ -100,22 +104,22 @@ class OpdsBookQueryService(IOpdsBookQueryService):
         tuple[list[BookWithRelations], int]
             Tuple of (books list, total count).
         """
+        visibility = self._get_visibility(user)
         books, total = self._book_service.list_books(
             page=page,
             page_size=page_size,
             sort_by=sort_by,
             sort_order=sort_order,
             full=False,
+            visibility=visibility,
         )
 
         # Filter by permissions
-        filtered_books = self._filter_by_permissions(books, user)
+        filtered_books = self._filter_by_permissions(books, user, visibility)
 
-        # Keep the underlying total count for correct OPDS pagination.
-        #
-        # Note: filtering happens after pagination, so `total` is not strictly
-        # permission-aware; however OPDS clients (e.g. Readest) rely on paging
-        # links (`next`/`last`) which require an honest total estimate.
+        # The total is counted under the same visibility as the page, so the
+        # paging links (`next`/`last`) OPDS clients (e.g. Readest) rely on
+        # only cover readable books.
         return filtered_books, total
 
     def get_recent_books(
@@ -169,16 +173,18 @@ class OpdsBookQueryService(IOpdsBookQueryService):
         """
         # Get a larger sample to account for filtering
         sample_size = limit * 3
+        visibility = self._get_visibility(user)
         books, _ = self._book_service.list_books(
             page=1,
             page_size=sample_size,
             sort_by="timestamp",
             sort_order="desc",
             full=False,
+            visibility=visibility,
         )
 
         # Filter by permissions
-        filtered_books = self._filter_by_permissions(books, user)
+        filtered_books = self._filter_by_permissions(books, user, visibility)
 
         # Randomize and limit
         random.shuffle(filtered_books)
@@ -209,15 +215,17 @@ class OpdsBookQueryService(IOpdsBookQueryService):
         tuple[list[BookWithRelations], int]
             Tuple of (books list, total count).
         """
+        visibility = self._get_visibility(user)
         books, total = self._book_service.list_books(
             page=page,
             page_size=page_size,
             search_query=query,
             full=False,
+            visibility=visibility,
         )
 
         # Filter by permissions
-        filtered_books = self._filter_by_permissions(books, user)
+        filtered_books = self._filter_by_permissions(books, user, visibility)
 
         return filtered_books, total
 
@@ -270,6 +278,7 @@ class OpdsBookQueryService(IOpdsBookQueryService):
         tuple[list[BookWithRelations], int]
             Tuple of (books list, total count).
         """
+        visibility = self._get_visibility(user)
         books, total = self._book_service.list_books_with_filters(
             page=page,
             page_size=page_size,
@@ -283,10 +292,11 @@ class OpdsBookQueryService(IOpdsBookQueryService):
             sort_by=sort_by,
             sort_order=sort_order,
             full=False,
+            visibility=visibility,
         )
 
         # Filter by permissions
-        filtered_books = self._filter_by_permissions(books, user)
+        filtered_books = self._filter_by_permissions(books, user, visibility)
 
         return filtered_books, total
 
@@ -318,6 +328,7 @@ class OpdsBookQueryService(IOpdsBookQueryService):
         # We need to find rating IDs that correspond to high ratings
         # For now, we'll get all books with ratings and filter client-side
         # A better approach would be to query rating IDs >= 9
+        visibility = self._get_visibility(user)
         books, _total = self._book_service.list_books_with_filters(
             page=page,
             page_size=page_size,
@@ -325,10 +336,11 @@ class OpdsBookQueryService(IOpdsBookQueryService):
             sort_by="timestamp",
             sort_order="desc",
             full=False,
+            visibility=visibility,
         )
 
         # Filter by permissions and rating value
-        filtered_books = self._filter_by_permissions(books, user)
+        filtered_books = self._filter_by_permissions(books, user, visibility)
         # Filter for high ratings (rating >= 9, which is 4.5 stars)
         high_rated = [
             b
@@ -339,19 +351,44 @@ class OpdsBookQueryService(IOpdsBookQueryService):
 
         return high_rated, len(high_rated)
 
+    def _get_visibility(self, user: User | None) -> BookVisibility | None:
+        """Get the books a user may read, to restrict listing queries.
+
+        Parameters
+        ----------
+        user : User | None
+            Authenticated user or None.
+
+        Returns
+        -------
+        BookVisibility | None
+            Visibility of the user, or None without a user.
+        """
+        if user is None:
+            return None
+        return self._permission_service.get_book_visibility(user, "read")
+
     def _filter_by_permissions(
         self,
         books: list,  # list[BookWithRelations | BookWithFullRelations]
         user: User | None,
+        visibility: BookVisibility | None = None,
     ) -> list:  # list[BookWithRelations]
         """Filter books based on user permissions.
 
+        Books listed under a restricted visibility were already filtered by
+        the query; they are checked again in case the compiled predicate and
+        the permission evaluator ever disagree.
+
         Parameters
         ----------
         books : list[BookWithRelations]
             List of books to filter.
         user : User | None
             Authenticated user or None.
+        visibility : BookVisibility | None
+            Visibility the books were listed under; unrestricted visibility
+            skips the per-book checks.
 
         Returns
         -------
@@ -379,6 +416,10 @@ class OpdsBookQueryService(IOpdsBookQueryService):
             ):
                 continue
 
+            if visibility is not None and visibility.is_unrestricted:
+                filtered.append(book)
+                continue
+
             # Build permission context
             context = BookPermissionHelper.build_permission_context(book)
 
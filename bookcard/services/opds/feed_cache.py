@@ -0,0 +1,246 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Cache for rendered OPDS feeds.
+
+E-reader clients poll the same navigation and listing feeds over and over.
+Rendered feeds are cached under the request URL, the permission scope of
+the user and a watermark of the library's state, so any change to
+``metadata.db``, to tracked books or to the library configuration makes
+old entries unreachable instead of requiring explicit invalidation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from sqlmodel import func, select
+
+from bookcard.models.pvr import TrackedBook
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+    from bookcard.api.schemas.opds import OpdsFeedResponse
+    from bookcard.models.auth import User
+    from bookcard.models.config import Library
+    from bookcard.services.permission_service import PermissionService
+
+# Rendered feeds kept in memory across all libraries and users
+FEED_CACHE_SIZE = 512
+
+
+class LibraryWatermark(NamedTuple):
+    """Identity of a library's current state.
+
+    Attributes
+    ----------
+    signature : str
+        Changes whenever anything a feed is rendered from changes.
+    last_modified : float | None
+        Latest modification time of ``metadata.db`` (POSIX timestamp).
+    """
+
+    signature: str
+    last_modified: float | None
+
+
+class OpdsFeedCacheKey(NamedTuple):
+    """Key of a rendered feed.
+
+    Attributes
+    ----------
+    library_id : int | None
+        Library the feed was rendered from.
+    url : str
+        Full request URL (feed type, parameters and link base).
+    scope : str
+        Permission scope of the user (see `permission_scope`).
+    watermark : str
+        Library watermark signature.
+    """
+
+    library_id: int | None
+    url: str
+    scope: str
+    watermark: str
+
+
+def library_watermark(session: Session, library: Library) -> LibraryWatermark:
+    """Compute the watermark of a library.
+
+    Combines the size and modification time of ``metadata.db`` and its
+    write-ahead log, the library configuration timestamp and the state of
+    tracked books, which OPDS listings merge in as virtual entries.
+
+    Parameters
+    ----------
+    session : Session
+        Application database session.
+    library : Library
+        Library configuration.
+
+    Returns
+    -------
+    LibraryWatermark
+        Watermark of the library's current state.
+    """
+    db_file = Path(library.calibre_db_path) / (library.calibre_db_file or "metadata.db")
+    parts = [str(library.updated_at)]
+    last_modified: float | None = None
+    for path in (db_file, db_file.with_name(f"{db_file.name}-wal")):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        last_modified = max(last_modified or 0.0, stat.st_mtime)
+
+    tracked_count, tracked_updated = session.exec(
+        select(func.count(TrackedBook.id), func.max(TrackedBook.updated_at))  # type: ignore[invalid-argument-type]
+    ).one()
+    parts.append(f"{tracked_count}:{tracked_updated}")
+
+    return LibraryWatermark("|".join(parts), last_modified)
+
+
+def permission_scope(user: User | None, permission_service: PermissionService) -> str:
+    """Describe what a user may see, so equally privileged users share feeds.
+
+    Parameters
+    ----------
+    user : User | None
+        Authenticated user.
+    permission_service : PermissionService
+        Service used to load the user's role permissions.
+
+    Returns
+    -------
+    str
+        Scope identifier.
+    """
+    if user is None or user.id is None:
+        return "anonymous"
+    if user.is_admin:
+        return "admin"
+
+    grants = sorted(
+        json.dumps(
+            [grant.resource, grant.action, grant.condition],
+            sort_keys=True,
+            default=str,
+        )
+        for grant in permission_service.get_user_grants(user)
+    )
+    payload = "\n".join(grants)
+    if "user.id" in payload:
+        # Conditions on the current user make the grants user specific
+        payload = f"user:{user.id}\n{payload}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def feed_etag(xml_content: str) -> str:
+    """Build the entity tag of a rendered feed.
+
+    Parameters
+    ----------
+    xml_content : str
+        Rendered feed.
+
+    Returns
+    -------
+    str
+        Quoted entity tag.
+    """
+    return f'"{hashlib.sha256(xml_content.encode("utf-8")).hexdigest()[:32]}"'
+
+
+class OpdsFeedCache:
+    """Thread-safe LRU cache of rendered OPDS feeds.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached feeds.
+    """
+
+    def __init__(self, maxsize: int = FEED_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._feeds: OrderedDict[OpdsFeedCacheKey, OpdsFeedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: OpdsFeedCacheKey) -> OpdsFeedResponse | None:
+        """Get a cached feed.
+
+        Parameters
+        ----------
+        key : OpdsFeedCacheKey
+            Feed key.
+
+        Returns
+        -------
+        OpdsFeedResponse | None
+            Cached feed, or None on a miss.
+        """
+        with self._lock:
+            feed = self._feeds.get(key)
+            if feed is not None:
+                self._feeds.move_to_end(key)
+            return feed
+
+    def put(self, key: OpdsFeedCacheKey, feed: OpdsFeedResponse) -> None:
+        """Cache a rendered feed.
+
+        Parameters
+        ----------
+        key : OpdsFeedCacheKey
+            Feed key.
+        feed : OpdsFeedResponse
+            Rendered feed, with its validators set.
+        """
+        with self._lock:
+            self._feeds[key] = feed
+            self._feeds.move_to_end(key)
+            while len(self._feeds) > self._maxsize:
+                self._feeds.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached feeds."""
+        with self._lock:
+            self._feeds.clear()
+
+
+_feed_cache: OpdsFeedCache | None = None
+_feed_cache_lock = threading.Lock()
+
+
+def get_opds_feed_cache() -> OpdsFeedCache:
+    """Get the process-wide OPDS feed cache.
+
+    Returns
+    -------
+    OpdsFeedCache
+        Shared feed cache.
+    """
+    global _feed_cache
+    with _feed_cache_lock:
+        if _feed_cache is None:
+            _feed_cache = OpdsFeedCache()
+        return _feed_cache
@@ -18,8 +18,11 @@
 Orchestrates feed generation by coordinating book queries and XML building.
 """
 
+import functools
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import Concatenate
 
 from fastapi import Request
 from sqlmodel import Session
@@ -34,13 +37,48 @@ from bookcard.models.auth import User
 from bookcard.models.config import Library
 from bookcard.services.book_service import BookService
 from bookcard.services.opds.book_query_service import OpdsBookQueryService
+from bookcard.services.opds.feed_cache import (
+    OpdsFeedCache,
+    OpdsFeedCacheKey,
+    feed_etag,
+    library_watermark,
+    permission_scope,
+)
 from bookcard.services.opds.interfaces import IOpdsFeedService
 from bookcard.services.opds.url_builder import OpdsUrlBuilder
 from bookcard.services.opds.xml_builder import OpdsXmlBuilder
+from bookcard.services.permission_service import PermissionService
 
 logger = logging.getLogger(__name__)
 
 
+def _cacheable[**P](
+    method: Callable[Concatenate["OpdsFeedService", Request, P], OpdsFeedResponse],
+) -> Callable[Concatenate["OpdsFeedService", Request, P], OpdsFeedResponse]:
+    """Serve a feed from the service's feed cache, if it has one.
+
+    The request URL identifies the feed type and all of its parameters;
+    the user passed to the feed method, if any, selects the permission
+    scope.
+    """
+
+    @functools.wraps(method)
+    def wrapper(
+        self: "OpdsFeedService", request: Request, *args: P.args, **kwargs: P.kwargs
+    ) -> OpdsFeedResponse:
+        if self._feed_cache is None:
+            return method(self, request, *args, **kwargs)
+        user = next(
+            (arg for arg in (*args, *kwargs.values()) if isinstance(arg, User)),
+            None,
+        )
+        return self._get_cached_feed(
+            request, user, lambda: method(self, request, *args, **kwargs)
+        )
+
+    return wrapper
+
+
 class OpdsFeedService(IOpdsFeedService):
     """Service for generating OPDS feeds.
 
@@ -54,6 +92,7 @@ class OpdsFeedService(IOpdsFeedService):
         library: Library,
         xml_builder: OpdsXmlBuilder | None = None,
         book_query_service: OpdsBookQueryService | None = None,
+        feed_cache: OpdsFeedCache | None = None,
     ) -> None:
         """Initialize OPDS feed service.
 
@@ -67,6 +106,9 @@ class OpdsFeedService(IOpdsFeedService):
             Optional XML builder (creates default if None).
         book_query_service : OpdsBookQueryService | None
             Optional book query service (creates default if None).
+        feed_cache : OpdsFeedCache | None
+            Optional cache for rendered feeds; feeds are rendered on every
+            call and carry no validators if None.
         """
         self._session = session
         self._library = library
@@ -75,7 +117,53 @@ class OpdsFeedService(IOpdsFeedService):
             session, library
         )
         self._book_service = BookService(library, session=session)
+        self._feed_cache = feed_cache
+
+    def _get_cached_feed(
+        self,
+        request: Request,
+        user: User | None,
+        render: Callable[[], OpdsFeedResponse],
+    ) -> OpdsFeedResponse:
+        """Get a feed from the cache, rendering and caching it on a miss.
 
+        Parameters
+        ----------
+        request : Request
+            FastAPI request object.
+        user : User | None
+            User the feed is filtered for, if any.
+        render : Callable[[], OpdsFeedResponse]
+            Renders the feed.
+
+        Returns
+        -------
+        OpdsFeedResponse
+            Feed with ``etag`` and ``last_modified`` set.
+        """
+        if self._feed_cache is None:
+            return render()
+
+        watermark = library_watermark(self._session, self._library)
+        key = OpdsFeedCacheKey(
+            library_id=self._library.id,
+            url=str(request.url),
+            scope=permission_scope(user, PermissionService(self._session)),
+            watermark=watermark.signature,
+        )
+        feed = self._feed_cache.get(key)
+        if feed is None:
+            feed = render()
+            feed = feed.model_copy(
+                update={
+                    "etag": feed_etag(feed.xml_content),
+                    "last_modified": watermark.last_modified,
+                }
+            )
+            self._feed_cache.put(key, feed)
+        return feed
+
+    @_cacheable
     def generate_catalog_feed(
         self,
         request: Request,
@@ -148,6 +236,7 @@ class OpdsFeedService(IOpdsFeedService):
 
         return OpdsFeedResponse(xml_content=xml_content)
 
+    @_cacheable
     def generate_books_feed(
         self, request: Request, user: User | None, feed_request: OpdsFeedRequest
     ) -> OpdsFeedResponse:
@@ -180,6 +269,7 @@ class OpdsFeedService(IOpdsFeedService):
             request, books, total, feed_request, "/opds/books", "All Books"
         )
 
+    @_cacheable
     def generate_new_feed(
         self, request: Request, user: User | None, feed_request: OpdsFeedRequest
     ) -> OpdsFeedResponse:
@@ -252,6 +342,7 @@ class OpdsFeedService(IOpdsFeedService):
 
         return OpdsFeedResponse(xml_content=xml_content)
 
+    @_cacheable
     def generate_search_feed(
         self,
         request: Request,
@@ -442,21 +533,13 @@ class OpdsFeedService(IOpdsFeedService):
         base_url = str(request.base_url).rstrip("/")
         entries: list[OpdsEntry] = []
 
-        logger.info("Building OPDS entries for %s books", len(books))
+        logger.debug("Building OPDS entries for %s books", len(books))
 
         for book_with_rels in books:
             book = book_with_rels.book
             if book.id is None:
                 continue
 
-            # Log book title for debugging
-            logger.info(
-                "OPDS Entry: id=%s, title='%s', virtual=%s",
-                book.id,
-                book.title,
-                getattr(book_with_rels, "is_virtual", False),
-            )
-
             # Build entry ID using URN UUID to match Calibre-Web-Automated
             # This prevents browsers/readers from trying to navigate to it as a URL
             if book.uuid:
@@ -480,7 +563,7 @@ class OpdsFeedService(IOpdsFeedService):
                 )
                 links.append(
                     OpdsLink(
-                        href=cover_url,
+                        href=url_builder.build_thumbnail_url(book.id),
                         rel="http://opds-spec.org/image/thumbnail",
                         type="image/jpeg",
                     )
@@ -556,6 +639,7 @@ class OpdsFeedService(IOpdsFeedService):
 
         return entries
 
+    @_cacheable
     def generate_books_by_letter_feed(
         self,
         request: Request,
@@ -634,6 +718,7 @@ class OpdsFeedService(IOpdsFeedService):
 
         return OpdsFeedResponse(xml_content=xml_content)
 
+    @_cacheable
     def generate_rated_feed(
         self,
         request: Request,
@@ -766,6 +851,7 @@ class OpdsFeedService(IOpdsFeedService):
         ]
 
     # Index feed methods (lists of entities for browsing)
+    @_cacheable
     def generate_author_index_feed(
         self,
         request: Request,
@@ -813,6 +899,7 @@ class OpdsFeedService(IOpdsFeedService):
 
         return OpdsFeedResponse(xml_content=xml_content)
 
+    @_cacheable
     def generate_author_letter_feed(
         self,
         request: Request,
@@ -867,6 +954,7 @@ class OpdsFeedService(IOpdsFeedService):
 
         return OpdsFeedResponse(xml_content=xml_content)
 
+    @_cacheable
     def generate_books_by_author_feed(
         self,
         request: Request,
@@ -949,6 +1037,7 @@ class OpdsFeedService(IOpdsFeedService):
         # Similar to author index - implement with Publisher model
         return self._generate_generic_index_feed(request, "publisher", "Publishers")
 
+    @_cacheable
     def generate_books_by_publisher_feed(
         self,
         request: Request,
@@ -1005,6 +1094,7 @@ class OpdsFeedService(IOpdsFeedService):
             request, letter, "category", "Categories"
         )
 
+    @_cacheable
     def generate_books_by_category_feed(
         self,
         request: Request,
@@ -1058,6 +1148,7 @@ class OpdsFeedService(IOpdsFeedService):
         """Generate series by letter feed."""
         return self._generate_generic_letter_feed(request, letter, "series", "Series")
 
+    @_cacheable
     def generate_books_by_series_feed(
         self,
         request: Request,
@@ -1103,6 +1194,7 @@ class OpdsFeedService(IOpdsFeedService):
         """Generate rating index feed."""
         return self._generate_generic_index_feed(request, "ratings", "Ratings")
 
+    @_cacheable
     def generate_books_by_rating_feed(
         self,
         request: Request,
@@ -1148,6 +1240,7 @@ class OpdsFeedService(IOpdsFeedService):
         """Generate format index feed."""
         return self._generate_generic_index_feed(request, "formats", "Formats")
 
+    @_cacheable
     def generate_books_by_format_feed(
         self,
         request: Request,
@@ -1193,6 +1286,7 @@ class OpdsFeedService(IOpdsFeedService):
         """Generate language index feed."""
         return self._generate_generic_index_feed(request, "language", "Languages")
 
+    @_cacheable
     def generate_books_by_language_feed(
         self,
         request: Request,
@@ -108,6 +108,22 @@ class OpdsUrlBuilder:
         base_url = str(self._request.base_url).rstrip("/")
         return f"{base_url}/opds/cover/{book_id}"
 
+    def build_thumbnail_url(self, book_id: int) -> str:
+        """Build book cover thumbnail URL.
+
+        Parameters
+        ----------
+        book_id : int
+            Book ID.
+
+        Returns
+        -------
+        str
+            Absolute URL of a resized cover suitable for catalog listings.
+        """
+        base_url = str(self._request.base_url).rstrip("/")
+        return f"{base_url}/opds/thumb_240_240/{book_id}"
+
     def build_pagination_url(
         self,
         path: str,
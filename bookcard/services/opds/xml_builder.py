@@ -18,6 +18,8 @@
 Builds OPDS 1.2/2.0 compliant XML documents using lxml.etree.
 """
 
+from collections.abc import Iterable, Iterator
+
 from lxml import etree  # type: ignore[attr-defined]
 
 from bookcard.api.schemas.opds import OpdsEntry
@@ -29,6 +31,33 @@ NS_OPDS = "http://opds-spec.org/2010/catalog"
 NS_DC = "http://purl.org/dc/elements/1.1/"
 NS_DCTERMS = "http://purl.org/dc/terms/"
 
+_NSMAP = {
+    None: NS_ATOM,
+    "opds": NS_OPDS,
+    "dc": NS_DC,
+    "dcterms": NS_DCTERMS,
+}
+
+# Elements written incrementally are serialized standalone, so each one
+# declares the namespaces it may use; keep those declarations minimal.
+_ATOM_NSMAP = {None: NS_ATOM}
+_ENTRY_NSMAP = {None: NS_ATOM, "dc": NS_DC, "dcterms": NS_DCTERMS}
+
+
+class _ChunkSink:
+    """Write target collecting ``etree.xmlfile`` output between yields."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self._chunks.append(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
 
 class OpdsXmlBuilder(IOpdsXmlBuilder):
     """Builder for OPDS XML documents.
@@ -42,7 +71,7 @@ class OpdsXmlBuilder(IOpdsXmlBuilder):
         title: str,
         feed_id: str,
         updated: str,
-        entries: list[OpdsEntry],
+        entries: Iterable[OpdsEntry],
         links: list[dict[str, str]] | None = None,
     ) -> str:
         """Build OPDS feed XML.
@@ -55,8 +84,8 @@ class OpdsXmlBuilder(IOpdsXmlBuilder):
             Feed ID (URI).
         updated : str
             Feed update timestamp (ISO 8601).
-        entries : list[OpdsEntry]
-            List of feed entries.
+        entries : Iterable[OpdsEntry]
+            Feed entries.
         links : list[dict[str, str]] | None
             Optional list of feed links (with 'href', 'rel', 'type' keys).
 
@@ -65,55 +94,109 @@ class OpdsXmlBuilder(IOpdsXmlBuilder):
         str
             XML content as string.
         """
-        # Create root feed element with namespaces
-        feed = etree.Element(
-            f"{{{NS_ATOM}}}feed",
-            nsmap={
-                None: NS_ATOM,
-                "opds": NS_OPDS,
-                "dc": NS_DC,
-                "dcterms": NS_DCTERMS,
-            },
+        return b"".join(self.iter_feed(title, feed_id, updated, entries, links)).decode(
+            "utf-8"
         )
 
-        # Add required Atom elements
-        title_elem = etree.SubElement(feed, f"{{{NS_ATOM}}}title")
-        title_elem.text = title
+    def iter_feed(
+        self,
+        title: str,
+        feed_id: str,
+        updated: str,
+        entries: Iterable[OpdsEntry],
+        links: list[dict[str, str]] | None = None,
+    ) -> Iterator[bytes]:
+        """Serialize an OPDS feed incrementally.
 
-        id_elem = etree.SubElement(feed, f"{{{NS_ATOM}}}id")
-        id_elem.text = feed_id
+        Entries are consumed lazily and written one at a time with
+        ``etree.xmlfile``, so only a single entry element is alive at any
+        point and the document never exists as one tree.
 
-        updated_elem = etree.SubElement(feed, f"{{{NS_ATOM}}}updated")
-        updated_elem.text = updated
+        Parameters
+        ----------
+        title : str
+            Feed title.
+        feed_id : str
+            Feed ID (URI).
+        updated : str
+            Feed update timestamp (ISO 8601).
+        entries : Iterable[OpdsEntry]
+            Feed entries.
+        links : list[dict[str, str]] | None
+            Optional list of feed links (with 'href', 'rel', 'type' keys).
+
+        Yields
+        ------
+        bytes
+            UTF-8 encoded XML chunks: the feed header, then one per entry,
+            then the closing tag.
+        """
+        sink = _ChunkSink()
+        with etree.xmlfile(sink, encoding="utf-8", buffered=False) as xml_file:
+            xml_file.write_declaration()
+            with xml_file.element(f"{{{NS_ATOM}}}feed", nsmap=_NSMAP):
+                xml_file.write("\n")
+                for element in self._build_feed_header(title, feed_id, updated, links):
+                    xml_file.write(element, pretty_print=True)
+                yield sink.drain()
+
+                for entry in entries:
+                    xml_file.write(self.build_entry(entry), pretty_print=True)
+                    yield sink.drain()
+        yield sink.drain()
+
+    def _build_feed_header(
+        self,
+        title: str,
+        feed_id: str,
+        updated: str,
+        links: list[dict[str, str]] | None,
+    ) -> list[etree._Element]:
+        """Build the feed-level elements preceding the entries.
+
+        Parameters
+        ----------
+        title : str
+            Feed title.
+        feed_id : str
+            Feed ID (URI).
+        updated : str
+            Feed update timestamp (ISO 8601).
+        links : list[dict[str, str]] | None
+            Optional list of feed links.
+
+        Returns
+        -------
+        list[_Element]
+            Header elements, in document order.
+        """
+        # Required Atom elements
+        header = []
+        for tag, text in (("title", title), ("id", feed_id), ("updated", updated)):
+            elem = etree.Element(f"{{{NS_ATOM}}}{tag}", nsmap=_ATOM_NSMAP)
+            elem.text = text
+            header.append(elem)
 
         # Add author element (required by Atom)
-        author_elem = etree.SubElement(feed, f"{{{NS_ATOM}}}author")
+        author_elem = etree.Element(f"{{{NS_ATOM}}}author", nsmap=_ATOM_NSMAP)
         name_elem = etree.SubElement(author_elem, f"{{{NS_ATOM}}}name")
         name_elem.text = "Calibre Bookcard"
+        header.append(author_elem)
 
-        # Add links
+        # Add links (built on a scratch parent, then detached)
         if links:
+            scratch = etree.Element(f"{{{NS_ATOM}}}feed", nsmap=_ATOM_NSMAP)
             for link_data in links:
                 self._add_link(
-                    feed,
+                    scratch,
                     link_data.get("href", ""),
                     link_data.get("rel", "alternate"),
                     mime_type=link_data.get("type"),
                     title=link_data.get("title"),
                 )
+            header.extend(scratch)
 
-        # Add entries
-        for entry in entries:
-            entry_elem = self.build_entry(entry)
-            feed.append(entry_elem)
-
-        # Generate XML string
-        return etree.tostring(
-            feed,
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        ).decode("utf-8")
+        return header
 
     def build_entry(self, entry: OpdsEntry) -> etree._Element:
         """Build OPDS entry element.
@@ -128,7 +211,7 @@ class OpdsXmlBuilder(IOpdsXmlBuilder):
         _Element
             XML element (lxml.etree._Element).
         """
-        entry_elem = etree.Element(f"{{{NS_ATOM}}}entry")
+        entry_elem = etree.Element(f"{{{NS_ATOM}}}entry", nsmap=_ENTRY_NSMAP)
 
         # Required Atom elements
         self._add_required_atom_elements(entry_elem, entry)
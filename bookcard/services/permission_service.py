@@ -24,6 +24,8 @@ from fastapi import HTTPException, status
 from sqlmodel import Session, select
 
 from bookcard.models.auth import Permission, RolePermission, User, UserRole
+from bookcard.repositories.visibility import BookVisibility
+from bookcard.services.principal_cache import PermissionGrant, get_principal_cache
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -83,25 +85,19 @@ class PermissionService:
         if user.is_admin:
             return True
 
-        # Get all permissions for the user's roles
-        user_permissions = self.get_user_permissions(user)
-
-        # Find matching permission
-        for perm_data in user_permissions:
-            perm = perm_data["permission"]
-            condition = perm_data["condition"]
-
+        # Find matching permission among the grants of the user's roles
+        for grant in self.get_user_grants(user):
             # Check if permission matches resource:action
-            if perm.resource != resource or perm.action != action:
+            if grant.resource != resource or grant.action != action:
                 continue
 
             # If no condition, permission applies globally
-            if condition is None:
+            if grant.condition is None:
                 return True
 
             # Evaluate condition against context
             if context is not None and self.evaluate_condition(
-                condition, context, user
+                grant.condition, context, user
             ):
                 return True
 
@@ -363,6 +359,77 @@ class PermissionService:
         # All conditions matched
         return True
 
+    def get_book_visibility(self, user: User, action: str = "read") -> BookVisibility:
+        """Get the books a user may access, compiled from its grants.
+
+        The conditions of the user's ``books`` grants are combined into a
+        `BookVisibility` whose SQL predicate listing queries apply, so
+        only accessible books are fetched and counted. The predicate
+        mirrors `evaluate_condition` on a context of the book's authors,
+        author IDs, tags and series.
+
+        Parameters
+        ----------
+        user : User
+            User to get the visibility of.
+        action : str
+            Book action (default: 'read').
+
+        Returns
+        -------
+        BookVisibility
+            Unrestricted for admins and users holding an unconditional
+            grant; empty for users without any grant.
+        """
+        if user.id is None:
+            return BookVisibility(conditions=())
+        if user.is_admin:
+            return BookVisibility()
+
+        conditions = []
+        for grant in self.get_user_grants(user):
+            if grant.resource != "books" or grant.action != action:
+                continue
+            if grant.condition is None:
+                return BookVisibility()
+            conditions.append(grant.condition)
+        return BookVisibility(conditions=tuple(conditions))
+
+    def get_user_grants(self, user: User) -> tuple[PermissionGrant, ...]:
+        """Get the compiled permissions of a user.
+
+        Served from the principal cache when it is configured (loaded at
+        most once per session), otherwise loaded from the database.
+
+        Parameters
+        ----------
+        user : User
+            User to get permissions for.
+
+        Returns
+        -------
+        tuple[PermissionGrant, ...]
+            Resource, action and condition of every permission granted by
+            the user's roles.
+        """
+        if user.id is None:
+            return ()
+
+        def _load() -> tuple[PermissionGrant, ...]:
+            return tuple(
+                PermissionGrant(
+                    perm_data["permission"].resource,
+                    perm_data["permission"].action,
+                    perm_data["condition"],
+                )
+                for perm_data in self.get_user_permissions(user)
+            )
+
+        cache = get_principal_cache()
+        if cache is None:
+            return _load()
+        return cache.get_grants(self._session, user.id, _load)
+
     def get_user_permissions(self, user: User) -> list[dict[str, Any]]:
         """Get all permissions with conditions for user.
 
@@ -0,0 +1,398 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""In-process cache of authenticated principals.
+
+Every request authenticated by a local JWT checks the token blacklist and
+loads its user, and every permission check joins the user's roles with
+their permissions. `PrincipalCache` keeps, per process:
+
+- the blacklisted token IDs, synced incrementally from the database at
+  most every few seconds and updated at once on logout in this process;
+- a detached copy of each recently authenticated user, merged back into
+  the request's session without a query;
+- each user's permissions compiled into `PermissionGrant` tuples.
+
+Users and grants are dropped when a commit in this process changes the
+user, its roles, or any role or permission (tracked with session events),
+and expire after a few seconds so changes made by other processes are
+picked up. Within one session, grants are loaded at most once per user.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import select
+
+from bookcard.models.auth import (
+    Permission,
+    Role,
+    RolePermission,
+    TokenBlacklist,
+    User,
+    UserRole,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from sqlmodel import Session
+
+# Seconds cached users and grants are trusted without a database read
+PRINCIPAL_CACHE_TTL = 10.0
+
+# Users whose principal is kept
+PRINCIPAL_CACHE_SIZE = 4096
+
+# Seconds between syncs of the token blacklist from the database
+BLACKLIST_SYNC_SECONDS = 5.0
+
+# Session.info keys of the per-session grants memo and pending invalidations
+_GRANTS_MEMO_KEY = "principal_cache.grants"
+_CHANGES_KEY = "principal_cache.changes"
+
+# Changes of these models affect every user holding the changed roles
+_ROLE_MODELS = (Role, RolePermission, Permission)
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionGrant:
+    """Permission granted to a user by one of its roles.
+
+    Attributes
+    ----------
+    resource : str
+        Resource name (e.g., 'books', 'shelves').
+    action : str
+        Action name (e.g., 'read', 'write', 'delete').
+    condition : dict[str, Any] | None
+        Condition restricting the grant, or None if it applies globally.
+    """
+
+    resource: str
+    action: str
+    condition: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class _Principal:
+    user: User | None
+    grants: tuple[PermissionGrant, ...] | None
+    expires_at: float
+
+
+class PrincipalCache:
+    """Thread-safe cache of users, their grants and the token blacklist.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds cached users and grants are reused.
+    maxsize : int
+        Maximum number of cached users.
+    blacklist_sync_interval : float
+        Seconds between syncs of the token blacklist.
+    clock : Callable[[], float]
+        Monotonic clock.
+    """
+
+    def __init__(
+        self,
+        ttl: float = PRINCIPAL_CACHE_TTL,
+        maxsize: int = PRINCIPAL_CACHE_SIZE,
+        blacklist_sync_interval: float = BLACKLIST_SYNC_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._blacklist_sync_interval = blacklist_sync_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._principals: dict[int, _Principal] = {}
+        # Bumped by every invalidation; loads that raced one are not stored
+        self._generation = 0
+        self._blacklist: dict[str, datetime] = {}
+        self._blacklist_last_id = 0
+        self._blacklist_synced_at = float("-inf")
+
+    def is_blacklisted(self, session: Session, jti: str) -> bool:
+        """Check whether a token ID is blacklisted.
+
+        Parameters
+        ----------
+        session : Session
+            Session used to sync the blacklist when due.
+        jti : str
+            JWT ID to check.
+
+        Returns
+        -------
+        bool
+            True if the token was revoked.
+        """
+        with self._lock:
+            due = self._clock() - self._blacklist_synced_at >= (
+                self._blacklist_sync_interval
+            )
+        if due:
+            self._sync_blacklist(session)
+        with self._lock:
+            return jti in self._blacklist
+
+    def add_blacklisted(self, jti: str, expires_at: datetime) -> None:
+        """Record a token revoked by this process.
+
+        Parameters
+        ----------
+        jti : str
+            JWT ID of the revoked token.
+        expires_at : datetime
+            Expiration of the token.
+        """
+        with self._lock:
+            self._blacklist[jti] = expires_at
+
+    def get_user(self, session: Session, user_id: int) -> User | None:
+        """Get a user, attached to a session.
+
+        Parameters
+        ----------
+        session : Session
+            Session the returned user belongs to.
+        user_id : int
+            User ID.
+
+        Returns
+        -------
+        User | None
+            User, or None if it does not exist.
+        """
+        principal = self._get(user_id) if _is_cacheable(session) else None
+        if principal is not None and principal.user is not None:
+            return session.merge(principal.user, load=False)
+
+        generation = self._current_generation()
+        user = session.get(User, user_id)
+        if user is not None and _is_cacheable(session):
+            detached = User(**user.model_dump())
+            make_transient_to_detached(detached)
+            self._store(user_id, generation, user=detached)
+        return user
+
+    def get_grants(
+        self,
+        session: Session,
+        user_id: int,
+        load: Callable[[], tuple[PermissionGrant, ...]],
+    ) -> tuple[PermissionGrant, ...]:
+        """Get the compiled permissions of a user.
+
+        Parameters
+        ----------
+        session : Session
+            Session of the request, holding the per-session memo.
+        user_id : int
+            User ID.
+        load : Callable[[], tuple[PermissionGrant, ...]]
+            Loads the grants from the database through ``session``.
+
+        Returns
+        -------
+        tuple[PermissionGrant, ...]
+            Grants of all of the user's roles.
+        """
+        memo: dict[int, tuple[PermissionGrant, ...]] = session.info.setdefault(
+            _GRANTS_MEMO_KEY, {}
+        )
+        grants = memo.get(user_id)
+        if grants is not None:
+            return grants
+
+        cacheable = _is_cacheable(session)
+        principal = self._get(user_id) if cacheable else None
+        if principal is not None and principal.grants is not None:
+            grants = principal.grants
+        else:
+            generation = self._current_generation()
+            grants = load()
+            if cacheable:
+                self._store(user_id, generation, grants=grants)
+        memo[user_id] = grants
+        return grants
+
+    def invalidate(self, user_ids: Iterable[int] | None = None) -> None:
+        """Drop cached principals.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int] | None
+            Users to drop, or None to drop every user.
+        """
+        with self._lock:
+            if user_ids is None:
+                self._principals.clear()
+            else:
+                for user_id in user_ids:
+                    self._principals.pop(user_id, None)
+            self._generation += 1
+
+    def _current_generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def _get(self, user_id: int) -> _Principal | None:
+        with self._lock:
+            principal = self._principals.get(user_id)
+            if principal is None:
+                return None
+            if self._clock() >= principal.expires_at:
+                del self._principals[user_id]
+                return None
+            return principal
+
+    def _store(
+        self,
+        user_id: int,
+        generation: int,
+        *,
+        user: User | None = None,
+        grants: tuple[PermissionGrant, ...] | None = None,
+    ) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            previous = self._principals.pop(user_id, None)
+            if previous is not None and self._clock() < previous.expires_at:
+                user = user if user is not None else previous.user
+                grants = grants if grants is not None else previous.grants
+                expires_at = previous.expires_at
+            else:
+                expires_at = self._clock() + self._ttl
+            self._principals[user_id] = _Principal(user, grants, expires_at)
+            while len(self._principals) > self._maxsize:
+                # Dicts keep insertion order: drop the oldest entry
+                del self._principals[next(iter(self._principals))]
+
+    def _sync_blacklist(self, session: Session) -> None:
+        with self._lock:
+            last_id = self._blacklist_last_id
+        rows = session.exec(
+            select(TokenBlacklist.id, TokenBlacklist.jti, TokenBlacklist.expires_at)
+            .where(TokenBlacklist.id > last_id)  # type: ignore[operator]
+            .order_by(TokenBlacklist.id)  # type: ignore[arg-type]
+        ).all()
+        now = datetime.now(UTC)
+        with self._lock:
+            for row_id, jti, expires_at in rows:
+                self._blacklist[jti] = expires_at
+                self._blacklist_last_id = max(self._blacklist_last_id, row_id or 0)
+            # Expired tokens fail validation anyway
+            self._blacklist = {
+                jti: expires_at
+                for jti, expires_at in self._blacklist.items()
+                if _as_utc(expires_at) > now
+            }
+            self._blacklist_synced_at = self._clock()
+
+
+def _is_cacheable(session: Session) -> bool:
+    """Whether a session has no uncommitted changes of principals."""
+    return _CHANGES_KEY not in session.info
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _record_changes(session: SASession, _flush_context: object) -> None:
+    """Remember which principals a flush changed, until commit."""
+    changes: set[int] | None = session.info.get(_CHANGES_KEY, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if changes is None:
+            break
+        if isinstance(instance, _ROLE_MODELS):
+            changes = None
+        elif isinstance(instance, User) and instance.id is not None:
+            changes.add(instance.id)
+        elif isinstance(instance, UserRole):
+            changes.add(instance.user_id)
+    if changes is None or changes:
+        session.info[_CHANGES_KEY] = changes
+        session.info.pop(_GRANTS_MEMO_KEY, None)
+
+
+def _apply_changes(session: SASession) -> None:
+    """Invalidate principals changed by a committed transaction."""
+    if _CHANGES_KEY not in session.info:
+        return
+    changes = session.info.pop(_CHANGES_KEY)
+    cache = get_principal_cache()
+    if cache is not None:
+        cache.invalidate(changes)
+
+
+def _discard_changes(session: SASession) -> None:
+    session.info.pop(_CHANGES_KEY, None)
+
+
+_cache: PrincipalCache | None = None
+_cache_lock = threading.Lock()
+_listeners_installed = False
+
+
+def configure_principal_cache(enabled: bool = True) -> PrincipalCache | None:
+    """Install the global principal cache.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to cache principals; False removes the cache.
+
+    Returns
+    -------
+    PrincipalCache | None
+        Newly installed cache, or None if disabled.
+    """
+    global _cache, _listeners_installed
+    cache = PrincipalCache() if enabled else None
+    with _cache_lock:
+        _cache = cache
+        if cache is not None and not _listeners_installed:
+            event.listen(SASession, "after_flush", _record_changes)
+            event.listen(SASession, "after_commit", _apply_changes)
+            event.listen(SASession, "after_rollback", _discard_changes)
+            _listeners_installed = True
+    return cache
+
+
+def get_principal_cache() -> PrincipalCache | None:
+    """Get the global principal cache.
+
+    Returns
+    -------
+    PrincipalCache | None
+        Cache configured by `configure_principal_cache`, or None.
+    """
+    with _cache_lock:
+        return _cache
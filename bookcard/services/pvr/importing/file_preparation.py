@@ -13,21 +13,77 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-"""File preparation service for PVR import."""
+"""File preparation service for PVR import.
+
+Completed downloads are staged into a temporary directory before ingest.
+Staging is done with a `TransferMode` so that, on the library's
+filesystem, staged files are hardlinks or copy-on-write clones of the
+download rather than full copies. The import mode is configured with the
+``BOOKCARD_PVR_IMPORT_MODE`` environment variable (``hardlink``,
+``reflink``, ``move`` or ``copy``; default ``reflink``).
+"""
 
 import logging
+import os
 import shutil
 from contextlib import suppress
 from pathlib import Path
 
+from bookcard.common.filesystem import TransferMode, transfer_file
+
 logger = logging.getLogger(__name__)
 
+IMPORT_MODE_ENV = "BOOKCARD_PVR_IMPORT_MODE"
+DEFAULT_IMPORT_MODE = TransferMode.REFLINK
+
+
+def import_mode_from_env() -> TransferMode:
+    """Get the import transfer mode configured in the environment.
+
+    Returns
+    -------
+    TransferMode
+        Configured mode, or the default if unset or invalid.
+    """
+    raw = os.getenv(IMPORT_MODE_ENV)
+    if not raw:
+        return DEFAULT_IMPORT_MODE
+    try:
+        return TransferMode(raw.strip().lower())
+    except ValueError:
+        logger.warning(
+            "Invalid %s %r, using %s", IMPORT_MODE_ENV, raw, DEFAULT_IMPORT_MODE
+        )
+        return DEFAULT_IMPORT_MODE
+
 
 class FilePreparationService:
-    """Handles file extraction and preparation."""
+    """Handles file extraction and preparation.
+
+    Parameters
+    ----------
+    transfer_mode : TransferMode | None
+        How downloads are imported, or None to read it from the
+        environment. HARDLINK leaves library files sharing data with the
+        download (e.g., a seeding torrent); MOVE removes the download once
+        imported (see `release_source`).
+    """
+
+    def __init__(self, transfer_mode: TransferMode | None = None) -> None:
+        self.transfer_mode = transfer_mode or import_mode_from_env()
+
+    @property
+    def staging_mode(self) -> TransferMode:
+        """Mode used to stage download files.
+
+        MOVE stages hardlinks so the download survives a failed import.
+        """
+        if self.transfer_mode == TransferMode.MOVE:
+            return TransferMode.HARDLINK
+        return self.transfer_mode
 
     def prepare_files(self, source_path: Path, dest_dir: Path) -> None:
-        """Extract archives or copy files to staging directory.
+        """Extract archives or transfer files to staging directory.
 
         Parameters
         ----------
@@ -41,15 +97,27 @@ class FilePreparationService:
                 logger.info("Extracting archive %s to %s", source_path, dest_dir)
                 shutil.unpack_archive(source_path, dest_dir)
             else:
-                logger.info("Copying file %s to %s", source_path, dest_dir)
-                shutil.copy2(source_path, dest_dir)
+                logger.info(
+                    "Staging file %s to %s (%s)",
+                    source_path,
+                    dest_dir,
+                    self.staging_mode,
+                )
+                transfer_file(
+                    source_path, dest_dir / source_path.name, self.staging_mode
+                )
         elif source_path.is_dir():
-            logger.info("Copying directory %s to %s", source_path, dest_dir)
+            logger.info(
+                "Staging directory %s to %s (%s)",
+                source_path,
+                dest_dir,
+                self.staging_mode,
+            )
             for item in source_path.iterdir():
                 if item.is_dir():
-                    shutil.copytree(item, dest_dir / item.name)
+                    self._transfer_tree(item, dest_dir / item.name)
                 else:
-                    shutil.copy2(item, dest_dir)
+                    transfer_file(item, dest_dir / item.name, self.staging_mode)
                     if self._is_archive(item):
                         # Try to extract archives found inside the dir too
                         with suppress(shutil.ReadError, ValueError):
@@ -57,6 +125,37 @@ class FilePreparationService:
                             extract_dir.mkdir(exist_ok=True)
                             shutil.unpack_archive(item, extract_dir)
 
+    def release_source(self, source_path: Path) -> None:
+        """Remove an imported download in MOVE mode.
+
+        Parameters
+        ----------
+        source_path : Path
+            Download file or directory passed to `prepare_files`.
+        """
+        if self.transfer_mode != TransferMode.MOVE:
+            return
+        logger.info("Removing imported download %s", source_path)
+        try:
+            if source_path.is_dir():
+                shutil.rmtree(source_path)
+            else:
+                source_path.unlink(missing_ok=True)
+        except OSError:
+            logger.warning(
+                "Failed to remove imported download %s", source_path, exc_info=True
+            )
+
+    def _transfer_tree(self, source_dir: Path, dest_dir: Path) -> None:
+        """Transfer a directory tree file by file."""
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        for item in source_dir.iterdir():
+            if item.is_dir():
+                self._transfer_tree(item, dest_dir / item.name)
+            else:
+                transfer_file(item, dest_dir / item.name, self.staging_mode)
+        shutil.copystat(source_dir, dest_dir)
+
     def _is_archive(self, path: Path) -> bool:
         """Check if file is a supported archive format."""
         # extensions supported by shutil.unpack_archive
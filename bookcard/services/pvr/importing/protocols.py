@@ -21,6 +21,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.config import Library
 from bookcard.services.ingest.file_discovery_service import FileGroup
 
@@ -197,6 +198,7 @@ class IngestServiceProtocol(Protocol):
         tags: list[str] | None = None,
         rating: int | None = None,
         cover_url: str | None = None,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> int:
         """
         Add book to library.
@@ -229,6 +231,8 @@ class IngestServiceProtocol(Protocol):
             Rating value (0-10).
         cover_url : str | None, optional
             Cover URL.
+        transfer_mode : TransferMode, optional
+            How the file is placed in the library, by default COPY.
 
         Returns
         -------
@@ -242,6 +246,7 @@ class IngestServiceProtocol(Protocol):
         book_id: int,
         file_path: Path,
         file_format: str,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """
         Add format to book.
@@ -254,6 +259,8 @@ class IngestServiceProtocol(Protocol):
             The path to the file to add.
         file_format : str
             The format of the file.
+        transfer_mode : TransferMode, optional
+            How the file is placed in the library, by default COPY.
         """
         ...
 
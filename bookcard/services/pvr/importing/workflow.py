@@ -18,11 +18,13 @@
 from __future__ import annotations
 
 import logging
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
+from bookcard.common.filesystem import TransferMode, same_filesystem
 from bookcard.models.pvr import (
     DownloadItem,
     TrackedBook,
@@ -70,11 +72,13 @@ class BookIngestCommand:
         ingest_service: IngestServiceProtocol,
         book_service: BookServiceProtocol,
         download_item: DownloadItem,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         """Initialize command."""
         self._ingest = ingest_service
         self._book_service = book_service
         self._download_item = download_item
+        self._transfer_mode = transfer_mode
         self._history_id: int | None = None
         self._book_id: int | None = None
 
@@ -138,6 +142,7 @@ class BookIngestCommand:
             rating=rating,
             cover_url=tracked_book.cover_url,
             pubdate=pubdate,
+            transfer_mode=self._transfer_mode,
         )
         return self
 
@@ -160,6 +165,7 @@ class BookIngestCommand:
                     book_id=self._book_id,
                     file_path=file_path,
                     file_format=file_format,
+                    transfer_mode=self._transfer_mode,
                 )
             except (ValueError, RuntimeError, OSError) as e:
                 logger.warning(
@@ -189,8 +195,13 @@ class BookIngestionOrchestrator(Protocol):
         file_groups: list[FileGroup],
         download_item: DownloadItem,
         tx: ImportTransaction,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> list[int]:
-        """Ingest all file groups."""
+        """Ingest all file groups.
+
+        `transfer_mode` is how the group files are placed in the library;
+        callers that own the files (e.g., a staging copy) may link them.
+        """
         ...
 
 
@@ -217,13 +228,16 @@ class DefaultBookIngestionOrchestrator:
         file_groups: list[FileGroup],
         download_item: DownloadItem,
         tx: ImportTransaction,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> list[int]:
         """Ingest all file groups and return list of book IDs."""
         ingested_book_ids: list[int] = []
 
         for group in file_groups:
             try:
-                result = self._ingest_file_group(group, download_item, tx)
+                result = self._ingest_file_group(
+                    group, download_item, tx, transfer_mode
+                )
                 if result.book_id:
                     ingested_book_ids.append(result.book_id)
             except Exception:
@@ -243,6 +257,7 @@ class DefaultBookIngestionOrchestrator:
         file_group: FileGroup,
         download_item: DownloadItem,
         tx: ImportTransaction,
+        transfer_mode: TransferMode,
     ) -> FileGroupImportResult:
         """Ingest a file group using template method pattern."""
         tracked_book = download_item.tracked_book
@@ -262,6 +277,7 @@ class DefaultBookIngestionOrchestrator:
                     tracked_book.matched_book_id,
                     book_service,
                     tx,
+                    transfer_mode,
                 )
                 if book_id:
                     result.book_id = book_id
@@ -314,6 +330,7 @@ class DefaultBookIngestionOrchestrator:
                     dup_result.duplicate_book_id,
                     book_service,
                     tx,
+                    transfer_mode,
                 )
                 if book_id:
                     result.book_id = book_id
@@ -323,7 +340,9 @@ class DefaultBookIngestionOrchestrator:
 
             # Use Command Pattern
             book_id = (
-                BookIngestCommand(self._ingest_service, book_service, download_item)
+                BookIngestCommand(
+                    self._ingest_service, book_service, download_item, transfer_mode
+                )
                 .create_history(file_group)
                 .add_book(main_file)
                 .add_formats(other_files, tx)
@@ -372,6 +391,7 @@ class DefaultBookIngestionOrchestrator:
         book_id: int,
         book_service: BookServiceProtocol,
         tx: ImportTransaction,
+        transfer_mode: TransferMode,
     ) -> int | None:
         """Update existing book with any new files from the group."""
         # Verify book exists
@@ -405,6 +425,7 @@ class DefaultBookIngestionOrchestrator:
                         book_id=book_id,
                         file_path=file_path,
                         file_format=file_format,
+                        transfer_mode=transfer_mode,
                     )
                     self._record_file_safely(
                         download_item,
@@ -505,7 +526,9 @@ class PVRImportWorkflow:
         tx: ImportTransaction,
     ) -> WorkflowResult:
         """Execute complete import workflow."""
-        with tempfile.TemporaryDirectory(prefix="pvr_import_") as temp_dir:
+        staging_root = self._staging_root()
+        prefix = "pvr_import_" if staging_root is None else ".pvr_import_"
+        with tempfile.TemporaryDirectory(prefix=prefix, dir=staging_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # 1. Prepare files
@@ -531,11 +554,14 @@ class PVRImportWorkflow:
                 msg = "Failed to group files"
                 raise RuntimeError(msg)
 
-            # 3. Ingest groups
+            # 3. Ingest groups, linking the disposable staged files into the
+            # library instead of copying them again
             ingested_book_ids = self._book_ingester.ingest_all(
-                file_groups, download_item, tx
+                file_groups, download_item, tx, TransferMode.HARDLINK
             )
-            if not ingested_book_ids:
+            if ingested_book_ids:
+                self._file_preparer.release_source(download_path)
+            else:
                 logger.warning(
                     "No files ingested for download %s (likely duplicates or skipped)",
                     download_item.id,
@@ -549,6 +575,30 @@ class PVRImportWorkflow:
 
             return WorkflowResult(book_id=best_match_id)
 
+    def _staging_root(self) -> Path | None:
+        """Get the directory to stage downloads in.
+
+        Staged files can only be linked into the library from the library's
+        filesystem, so they are staged in a hidden directory of the library
+        when the system temporary directory is elsewhere.
+
+        Returns
+        -------
+        Path | None
+            Library root, or None for the system temporary directory.
+        """
+        library_root = Path(self._library.library_root or self._library.calibre_db_path)
+        if not library_root.is_dir():
+            library_root = library_root.parent
+        temp_root = Path(tempfile.gettempdir())
+        if (
+            not library_root.is_dir()
+            or same_filesystem(library_root, temp_root)
+            or not os.access(library_root, os.W_OK)
+        ):
+            return None
+        return library_root
+
     def find_best_match(
         self,
         book_ids: list[int],
@@ -0,0 +1,504 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Write-behind buffer for reading progress.
+
+Readers report their position on every page turn.  Instead of writing
+each report in its own transaction, `ReadingService` records updates of
+existing progress rows here: one entry per (user, library, book, format),
+last write wins.  A flusher thread persists all pending entries in a
+single transaction every few seconds, when too many entries are pending,
+and on shutdown.  Progress may therefore lag in the database by up to one
+flush interval, and is lost if the process dies; reads through
+`ReadingService` always see the buffered values.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from bookcard.database import get_session
+from bookcard.models.reading import ReadingProgress
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Seconds between flushes of buffered progress
+FLUSH_INTERVAL_SECONDS = 5.0
+
+# Pending entries that trigger a flush before the interval elapses
+MAX_PENDING_UPDATES = 1000
+
+# Buffer key: user ID, library ID, book ID and format
+ProgressKey = tuple[int, int, int, str]
+
+
+@dataclass(frozen=True)
+class BufferedProgress:
+    """Pending reading progress of an existing progress row.
+
+    Optional fields left as None keep the value of the previous update,
+    matching `ReadingService.update_progress`.
+
+    Attributes
+    ----------
+    progress_id : int
+        ID of the persisted progress row.
+    user_id : int
+        User ID.
+    library_id : int
+        Library ID.
+    book_id : int
+        Book ID.
+    book_format : str
+        Book format (EPUB, PDF, etc.).
+    progress : float
+        Reading progress (0.0 to 1.0).
+    cfi : str | None
+        Canonical Fragment Identifier for EPUB.
+    page_number : int | None
+        Page number for PDF or comic formats.
+    device : str | None
+        Device identifier.
+    spread_mode : bool | None
+        Whether reading in spread mode for comics.
+    reading_direction : str | None
+        Reading direction for comics.
+    updated_at : datetime
+        Time of the latest update.
+    updates : int
+        Number of updates coalesced into this entry.
+    """
+
+    progress_id: int
+    user_id: int
+    library_id: int
+    book_id: int
+    book_format: str
+    progress: float
+    cfi: str | None = None
+    page_number: int | None = None
+    device: str | None = None
+    spread_mode: bool | None = None
+    reading_direction: str | None = None
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updates: int = 1
+
+    @property
+    def key(self) -> ProgressKey:
+        """Buffer key of this entry."""
+        return (self.user_id, self.library_id, self.book_id, self.book_format)
+
+    @classmethod
+    def from_model(cls, progress: ReadingProgress) -> BufferedProgress:
+        """Create an entry holding the persisted state of a progress row.
+
+        Parameters
+        ----------
+        progress : ReadingProgress
+            Persisted progress row (must have an ID).
+
+        Returns
+        -------
+        BufferedProgress
+            Entry without any coalesced update.
+        """
+        return cls(
+            progress_id=progress.id,  # type: ignore[invalid-argument-type]
+            user_id=progress.user_id,
+            library_id=progress.library_id,
+            book_id=progress.book_id,
+            book_format=progress.format,
+            progress=progress.progress,
+            cfi=progress.cfi,
+            page_number=progress.page_number,
+            device=progress.device,
+            spread_mode=progress.spread_mode,
+            reading_direction=progress.reading_direction,
+            updated_at=progress.updated_at,
+            updates=0,
+        )
+
+    def merged(self, newer: BufferedProgress) -> BufferedProgress:
+        """Apply a newer update on top of this entry.
+
+        Parameters
+        ----------
+        newer : BufferedProgress
+            Later update of the same key.
+
+        Returns
+        -------
+        BufferedProgress
+            Entry with the newer values, keeping this entry's row ID and the
+            optional fields the newer update leaves unset.
+        """
+        return replace(
+            newer,
+            progress_id=self.progress_id,
+            cfi=self.cfi if newer.cfi is None else newer.cfi,
+            page_number=(
+                self.page_number if newer.page_number is None else newer.page_number
+            ),
+            device=self.device if newer.device is None else newer.device,
+            spread_mode=(
+                self.spread_mode if newer.spread_mode is None else newer.spread_mode
+            ),
+            reading_direction=(
+                self.reading_direction
+                if newer.reading_direction is None
+                else newer.reading_direction
+            ),
+            updates=self.updates + newer.updates,
+        )
+
+    def to_model(self) -> ReadingProgress:
+        """Build a detached progress row with this entry's values.
+
+        Returns
+        -------
+        ReadingProgress
+            Progress as it will be persisted by the next flush.
+        """
+        return ReadingProgress(
+            id=self.progress_id,
+            user_id=self.user_id,
+            library_id=self.library_id,
+            book_id=self.book_id,
+            format=self.book_format,
+            progress=self.progress,
+            cfi=self.cfi,
+            page_number=self.page_number,
+            device=self.device,
+            spread_mode=self.spread_mode,
+            reading_direction=self.reading_direction,
+            updated_at=self.updated_at,
+        )
+
+
+@dataclass(frozen=True)
+class ProgressBufferStats:
+    """Counters of a `ReadingProgressBuffer`.
+
+    Attributes
+    ----------
+    updates : int
+        Updates recorded since start.
+    pending : int
+        Entries waiting for the next flush.
+    flushes : int
+        Successful flushes that wrote at least one row.
+    failed_flushes : int
+        Flushes that failed (their entries were re-queued).
+    flushed_rows : int
+        Rows written by successful flushes.
+    flushed_updates : int
+        Updates persisted by those rows.
+    """
+
+    updates: int = 0
+    pending: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    flushed_rows: int = 0
+    flushed_updates: int = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Average number of updates persisted per written row."""
+        if not self.flushed_rows:
+            return 0.0
+        return self.flushed_updates / self.flushed_rows
+
+
+class ReadingProgressBuffer:
+    """Coalesce reading progress updates and persist them in batches.
+
+    Parameters
+    ----------
+    engine : Engine
+        Database engine used by the flusher.
+    flush_interval : float
+        Seconds between flushes.
+    max_pending : int
+        Number of pending entries that triggers an early flush.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_pending: int = MAX_PENDING_UPDATES,
+    ) -> None:
+        self._engine = engine
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._pending: dict[ProgressKey, BufferedProgress] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats = ProgressBufferStats()
+
+    @property
+    def stats(self) -> ProgressBufferStats:
+        """Snapshot of the buffer counters."""
+        with self._lock:
+            return replace(self._stats, pending=len(self._pending))
+
+    def record(self, update: BufferedProgress) -> BufferedProgress:
+        """Record an update, replacing any pending update of the same key.
+
+        Parameters
+        ----------
+        update : BufferedProgress
+            Progress update.
+
+        Returns
+        -------
+        BufferedProgress
+            Pending entry after the update.
+        """
+        with self._lock:
+            pending = self._pending.get(update.key)
+            entry = update if pending is None else pending.merged(update)
+            self._pending[update.key] = entry
+            self._stats = replace(
+                self._stats, updates=self._stats.updates + update.updates
+            )
+            if len(self._pending) >= self._max_pending:
+                self._wake.set()
+        return entry
+
+    def get(self, key: ProgressKey) -> BufferedProgress | None:
+        """Get the pending entry of a key.
+
+        Parameters
+        ----------
+        key : ProgressKey
+            (user_id, library_id, book_id, format).
+
+        Returns
+        -------
+        BufferedProgress | None
+            Pending entry, or None if nothing is buffered for the key.
+        """
+        with self._lock:
+            return self._pending.get(key)
+
+    def pop(self, key: ProgressKey) -> BufferedProgress | None:
+        """Remove and return the pending entry of a key.
+
+        Used when an update of the key is written through, so that the
+        flusher does not later overwrite it with older values.
+
+        Parameters
+        ----------
+        key : ProgressKey
+            (user_id, library_id, book_id, format).
+
+        Returns
+        -------
+        BufferedProgress | None
+            Removed entry, or None if nothing was buffered for the key.
+        """
+        with self._lock:
+            return self._pending.pop(key, None)
+
+    def pending_for(self, user_id: int, library_id: int) -> list[BufferedProgress]:
+        """Get the pending entries of a user in a library.
+
+        Parameters
+        ----------
+        user_id : int
+            User ID.
+        library_id : int
+            Library ID.
+
+        Returns
+        -------
+        list[BufferedProgress]
+            Pending entries.
+        """
+        with self._lock:
+            return [
+                entry
+                for entry in self._pending.values()
+                if entry.user_id == user_id and entry.library_id == library_id
+            ]
+
+    def flush(self) -> int:
+        """Persist all pending entries in one transaction.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+
+        Raises
+        ------
+        Exception
+            Any error raised while writing; the entries are re-queued
+            beneath updates recorded in the meantime.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending.values())
+                self._pending.clear()
+            if not batch:
+                return 0
+
+            try:
+                self._write(batch)
+            except Exception:
+                with self._lock:
+                    for entry in batch:
+                        newer = self._pending.get(entry.key)
+                        self._pending[entry.key] = (
+                            entry if newer is None else entry.merged(newer)
+                        )
+                    self._stats = replace(
+                        self._stats, failed_flushes=self._stats.failed_flushes + 1
+                    )
+                raise
+
+            with self._lock:
+                self._stats = replace(
+                    self._stats,
+                    flushes=self._stats.flushes + 1,
+                    flushed_rows=self._stats.flushed_rows + len(batch),
+                    flushed_updates=self._stats.flushed_updates
+                    + sum(entry.updates for entry in batch),
+                )
+            logger.debug("Flushed %d buffered reading progress rows", len(batch))
+            return len(batch)
+
+    def start(self) -> None:
+        """Start the flusher thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="reading-progress-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop the flusher thread and persist everything still pending."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._flush_interval + 30)
+            self._thread = None
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush buffered reading progress on shutdown")
+        stats = self.stats
+        logger.info(
+            "Reading progress buffer stopped: %d updates, %d rows written "
+            "(coalescing ratio %.2f), %d failed flushes, %d unsaved",
+            stats.updates,
+            stats.flushed_rows,
+            stats.coalescing_ratio,
+            stats.failed_flushes,
+            stats.pending,
+        )
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush buffered reading progress")
+
+    def _write(self, batch: list[BufferedProgress]) -> None:
+        # Imported here: the reading service imports this module
+        from bookcard.repositories.reading_repository import (
+            ReadingProgressRepository,
+            ReadingSessionRepository,
+            ReadStatusRepository,
+        )
+        from bookcard.services.reading_service import ReadingService
+
+        with get_session(self._engine) as session:
+            ReadingService(
+                session,
+                ReadingProgressRepository(session),
+                ReadingSessionRepository(session),
+                ReadStatusRepository(session),
+            ).apply_buffered_progress(batch)
+
+
+_buffer: ReadingProgressBuffer | None = None
+_buffer_lock = threading.Lock()
+
+
+def configure_reading_progress_buffer(
+    engine: Engine | None,
+    flush_interval: float = FLUSH_INTERVAL_SECONDS,
+) -> ReadingProgressBuffer | None:
+    """Install the global reading progress buffer.
+
+    Replaces (and shuts down) any previously configured buffer.
+
+    Parameters
+    ----------
+    engine : Engine | None
+        Database engine used by the flusher; None disables buffering.
+    flush_interval : float
+        Seconds between flushes; 0 or less disables buffering, so every
+        update is written through.
+
+    Returns
+    -------
+    ReadingProgressBuffer | None
+        Newly installed (not yet started) buffer, or None if disabled.
+    """
+    global _buffer
+    buffer = (
+        ReadingProgressBuffer(engine, flush_interval)
+        if engine is not None and flush_interval > 0
+        else None
+    )
+    with _buffer_lock:
+        previous, _buffer = _buffer, buffer
+    if previous is not None:
+        previous.shutdown()
+    return buffer
+
+
+def get_reading_progress_buffer() -> ReadingProgressBuffer | None:
+    """Get the global reading progress buffer.
+
+    Returns
+    -------
+    ReadingProgressBuffer | None
+        Buffer configured by `configure_reading_progress_buffer`, or None
+        if progress is written through.
+    """
+    with _buffer_lock:
+        return _buffer
@@ -17,6 +17,8 @@
 
 Business logic for tracking reading progress, managing reading sessions,
 and handling read status with automatic marking at 90% threshold.
+Progress updates of existing rows may be coalesced in a
+`ReadingProgressBuffer` and persisted in batches.
 """
 
 from __future__ import annotations
@@ -30,8 +32,11 @@ from bookcard.models.reading import (
     ReadStatus,
     ReadStatusEnum,
 )
+from bookcard.services.reading_progress_buffer import BufferedProgress
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlmodel import Session
 
     from bookcard.repositories.reading_repository import (
@@ -40,11 +45,17 @@ if TYPE_CHECKING:
         ReadingSessionRepository,
         ReadStatusRepository,
     )
+    from bookcard.services.reading_progress_buffer import ReadingProgressBuffer
 
 # Auto-mark threshold: 90%
 AUTO_MARK_THRESHOLD = 0.90
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive timestamps (as read back from SQLite) as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
 class ReadingService:
     """Service for managing reading progress, sessions, and status.
 
@@ -60,6 +71,8 @@ class ReadingService:
         Repository for read status operations.
     annotation_repo : AnnotationRepository
         Repository for annotation operations.
+    progress_buffer : ReadingProgressBuffer | None
+        Write-behind buffer for progress updates.
     """
 
     def __init__(
@@ -69,6 +82,7 @@ class ReadingService:
         session_repo: ReadingSessionRepository,
         status_repo: ReadStatusRepository,
         annotation_repo: AnnotationRepository | None = None,
+        progress_buffer: ReadingProgressBuffer | None = None,
     ) -> None:
         """Initialize reading service.
 
@@ -84,12 +98,16 @@ class ReadingService:
             Read status repository.
         annotation_repo : AnnotationRepository | None
             Annotation repository (optional).
+        progress_buffer : ReadingProgressBuffer | None
+            Write-behind buffer for progress updates; None writes every
+            update through (optional).
         """
         self._session = session
         self._progress_repo = progress_repo
         self._session_repo = session_repo
         self._status_repo = status_repo
         self._annotation_repo = annotation_repo
+        self._progress_buffer = progress_buffer
 
     def update_progress(
         self,
@@ -107,6 +125,8 @@ class ReadingService:
         """Update reading progress for a book.
 
         Automatically marks book as read when progress reaches 90%.
+        With a progress buffer, updates of existing progress rows below
+        the threshold are buffered and persisted by its next flush.
 
         Parameters
         ----------
@@ -145,53 +165,116 @@ class ReadingService:
             msg = f"Progress must be between 0.0 and 1.0, got {progress}"
             raise ValueError(msg)
 
-        # Get or create reading progress
-        existing = self._progress_repo.get_by_user_book_format(
-            user_id,
-            library_id,
-            book_id,
-            book_format,
+        # The row ID is filled in if the update gets buffered
+        update = BufferedProgress(
+            progress_id=0,
+            user_id=user_id,
+            library_id=library_id,
+            book_id=book_id,
+            book_format=book_format,
+            progress=progress,
+            cfi=cfi,
+            page_number=page_number,
+            device=device,
+            spread_mode=spread_mode,
+            reading_direction=reading_direction,
         )
+        if self._progress_buffer is not None:
+            if progress < AUTO_MARK_THRESHOLD:
+                buffered = self._buffer_progress(update)
+                if buffered is not None:
+                    return buffered
+            # Written through: fold in what is pending so a later flush
+            # cannot overwrite this update with older values
+            pending = self._progress_buffer.pop(update.key)
+            if pending is not None:
+                update = pending.merged(update)
+
+        return self._write_progress(update)
+
+    def apply_buffered_progress(self, entries: Iterable[BufferedProgress]) -> None:
+        """Persist progress updates collected by a progress buffer.
+
+        Entries older than the stored progress are skipped.
+
+        Parameters
+        ----------
+        entries : Iterable[BufferedProgress]
+            Pending buffer entries.
+        """
+        for entry in entries:
+            existing = self._progress_repo.get_by_user_book_format(*entry.key)
+            if existing is not None and _as_utc(existing.updated_at) > _as_utc(
+                entry.updated_at
+            ):
+                continue
+            self._write_progress(entry, existing)
+
+    def _buffer_progress(self, update: BufferedProgress) -> ReadingProgress | None:
+        """Buffer an update of an existing progress row.
+
+        Returns None (nothing buffered) if the row does not exist yet.
+        """
+        buffer = self._progress_buffer
+        if buffer is None:
+            return None
+        if buffer.get(update.key) is None:
+            existing = self._progress_repo.get_by_user_book_format(*update.key)
+            if existing is None or existing.id is None:
+                return None
+            update = BufferedProgress.from_model(existing).merged(update)
+        return buffer.record(update).to_model()
+
+    def _write_progress(
+        self,
+        update: BufferedProgress,
+        existing: ReadingProgress | None = None,
+    ) -> ReadingProgress:
+        """Write a progress update and apply its read status side effects."""
+        if existing is None:
+            existing = self._progress_repo.get_by_user_book_format(*update.key)
 
         if existing is None:
             progress_obj = ReadingProgress(
-                user_id=user_id,
-                library_id=library_id,
-                book_id=book_id,
-                format=book_format,
-                progress=progress,
-                cfi=cfi,
-                page_number=page_number,
-                device=device,
-                spread_mode=spread_mode,
-                reading_direction=reading_direction,
-                updated_at=datetime.now(UTC),
+                user_id=update.user_id,
+                library_id=update.library_id,
+                book_id=update.book_id,
+                format=update.book_format,
+                progress=update.progress,
+                cfi=update.cfi,
+                page_number=update.page_number,
+                device=update.device,
+                spread_mode=update.spread_mode,
+                reading_direction=update.reading_direction,
+                updated_at=update.updated_at,
             )
             self._progress_repo.add(progress_obj)
         else:
-            existing.progress = progress
-            if cfi is not None:
-                existing.cfi = cfi
-            if page_number is not None:
-                existing.page_number = page_number
-            if device is not None:
-                existing.device = device
-            if spread_mode is not None:
-                existing.spread_mode = spread_mode
-            if reading_direction is not None:
-                existing.reading_direction = reading_direction
-            existing.updated_at = datetime.now(UTC)
+            existing.progress = update.progress
+            if update.cfi is not None:
+                existing.cfi = update.cfi
+            if update.page_number is not None:
+                existing.page_number = update.page_number
+            if update.device is not None:
+                existing.device = update.device
+            if update.spread_mode is not None:
+                existing.spread_mode = update.spread_mode
+            if update.reading_direction is not None:
+                existing.reading_direction = update.reading_direction
+            existing.updated_at = update.updated_at
             progress_obj = existing
 
         self._session.flush()
 
         # Update read status if progress >= threshold
-        if progress >= AUTO_MARK_THRESHOLD:
-            self._auto_mark_as_read(user_id, library_id, book_id, progress)
+        if update.progress >= AUTO_MARK_THRESHOLD:
+            self._auto_mark_as_read(
+                update.user_id, update.library_id, update.book_id, update.progress
+            )
 
         # Update first_opened_at if not set and progress > 0
-        if progress > 0:
-            self._ensure_first_opened(user_id, library_id, book_id)
+        if update.progress > 0:
+            self._ensure_first_opened(update.user_id, update.library_id, update.book_id)
 
         return progress_obj
 
@@ -415,6 +498,15 @@ class ReadingService:
         ReadingProgress | None
             Reading progress if found, None otherwise.
         """
+        if self._progress_buffer is not None:
+            pending = self._progress_buffer.get((
+                user_id,
+                library_id,
+                book_id,
+                book_format,
+            ))
+            if pending is not None:
+                return pending.to_model()
         return self._progress_repo.get_by_user_book_format(
             user_id,
             library_id,
@@ -444,7 +536,34 @@ class ReadingService:
         list[ReadingProgress]
             List of recent reading progress records.
         """
-        return self._progress_repo.get_recent_reads(user_id, library_id, limit)
+        reads = self._progress_repo.get_recent_reads(user_id, library_id, limit)
+        if self._progress_buffer is None:
+            return reads
+        pending = self._progress_buffer.pending_for(user_id, library_id)
+        if not pending:
+            return reads
+
+        # Overlay buffered progress, keeping the latest format per book
+        buffered = {entry.key: entry for entry in pending}
+        candidates: list[ReadingProgress] = []
+        for read in reads:
+            entry = buffered.pop(
+                (read.user_id, read.library_id, read.book_id, read.format), None
+            )
+            candidates.append(read if entry is None else entry.to_model())
+        candidates.extend(entry.to_model() for entry in buffered.values())
+        latest: dict[int, ReadingProgress] = {}
+        for read in candidates:
+            if read.progress <= 0.0:
+                continue
+            current = latest.get(read.book_id)
+            if current is None or _as_utc(read.updated_at) > _as_utc(
+                current.updated_at
+            ):
+                latest[read.book_id] = read
+        return sorted(
+            latest.values(), key=lambda read: _as_utc(read.updated_at), reverse=True
+        )[:limit]
 
     def get_reading_history(
         self,
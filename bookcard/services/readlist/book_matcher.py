@@ -20,7 +20,6 @@ exact, fuzzy, and title-based matching strategies.
 """
 
 import logging
-import os
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime
@@ -30,6 +29,7 @@ from sqlalchemy import Integer, func
 from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
+from bookcard.common.env import env_flag
 from bookcard.models.config import Library
 from bookcard.models.core import Author, Book, BookAuthorLink, BookSeriesLink, Series
 from bookcard.repositories.session_manager import CalibreSessionManager
@@ -42,36 +42,15 @@ from bookcard.services.readlist.interfaces import (
 logger = logging.getLogger(__name__)
 
 
-def _env_flag(name: str, default: bool) -> bool:
-    """Read a boolean flag from environment variables.
-
-    Parameters
-    ----------
-    name : str
-        Environment variable name.
-    default : bool
-        Default value if variable is not set or invalid.
-
-    Returns
-    -------
-    bool
-        Parsed boolean value.
-    """
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
-
-
 # Module-level configuration flags for matching behaviour.
 # These can be tuned via environment variables:
 # - BOOKCARD_READLIST_REQUIRE_YEAR_EXACT
 # - BOOKCARD_READLIST_REQUIRE_YEAR_FUZZY
-USE_YEAR_IN_EXACT_MATCH = _env_flag(
+USE_YEAR_IN_EXACT_MATCH = env_flag(
     "BOOKCARD_READLIST_REQUIRE_YEAR_EXACT",
     True,
 )
-USE_YEAR_IN_FUZZY_MATCH = _env_flag(
+USE_YEAR_IN_FUZZY_MATCH = env_flag(
     "BOOKCARD_READLIST_REQUIRE_YEAR_FUZZY",
     True,
 )
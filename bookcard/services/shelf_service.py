@@ -29,6 +29,9 @@ from typing import TYPE_CHECKING, Any
 from bookcard.models.magic_shelf_rules import GroupRule
 from bookcard.models.shelves import BookShelfLink, Shelf, ShelfTypeEnum
 from bookcard.repositories.config_repository import LibraryRepository
+from bookcard.repositories.magic_shelf_repository import (
+    MagicShelfMembershipRepository,
+)
 from bookcard.services.config_service import LibraryService
 from bookcard.services.permission_service import PermissionService
 from bookcard.services.readlist.import_service import (
@@ -300,6 +303,8 @@ class ShelfService:
 
         # Delete all book-shelf links
         self._link_repo.delete_by_shelf(shelf_id)
+        if shelf.shelf_type == ShelfTypeEnum.MAGIC_SHELF:
+            MagicShelfMembershipRepository(self._session).delete_for_shelf(shelf_id)
         # Delete the shelf
         self._shelf_repo.delete(shelf)
         self._session.flush()
@@ -30,6 +30,7 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import Session  # noqa: TC002
 
 from bookcard.models.tasks import Task, TaskStatistics, TaskStatus, TaskType
+from bookcard.services.tasks.events import TaskEvent, TaskEventBus, get_task_event_bus
 from bookcard.services.tasks.metadata_normalizer import TaskMetadataNormalizer
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,9 @@ logger = logging.getLogger(__name__)
 # before exposing to frontend (e.g., encryption keys, passwords, tokens)
 SENSITIVE_METADATA_FIELDS = {"encryption_key"}
 
+# Metadata fields of progress updates; they replace the stored task data
+PROGRESS_METADATA_FIELDS = {"status", "current_file", "processed_records"}
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
@@ -52,17 +56,22 @@ class TaskService:
     ----------
     session : Session
         Database session for task operations.
+    event_bus : TaskEventBus | None
+        Bus receiving progress and status events; defaults to the global bus.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, event_bus: TaskEventBus | None = None) -> None:
         """Initialize task service.
 
         Parameters
         ----------
         session : Session
             Database session.
+        event_bus : TaskEventBus | None
+            Bus receiving task events; defaults to the global bus.
         """
         self._session = session
+        self._event_bus = event_bus
 
     def create_task(
         self,
@@ -96,6 +105,7 @@ class TaskService:
         self._session.add(task)
         self._session.commit()
         self._session.refresh(task)
+        self._publish_status(task)
         return task
 
     def get_task(self, task_id: int, user_id: int | None = None) -> Task | None:
@@ -197,6 +207,8 @@ class TaskService:
         task_id: int,
         progress: float,
         metadata: dict | None = None,
+        *,
+        publish: bool = True,
     ) -> None:
         """Update task progress and optional metadata.
 
@@ -204,6 +216,10 @@ class TaskService:
         to avoid cluttering the display. Non-progress fields from initial metadata
         are preserved but not shown in progress updates.
 
+        High-frequency callers should go through
+        `CoalescedProgressReporter`, which publishes every tick but writes
+        to the database at most once per flush interval.
+
         Parameters
         ----------
         task_id : int
@@ -214,6 +230,9 @@ class TaskService:
             Optional metadata to merge into existing metadata.
             Progress-related fields (status, current_file, processed_records)
             will replace existing values. Other fields are preserved.
+        publish : bool
+            Whether to publish a progress event (callers that already
+            published the tick pass False).
         """
         task = self._session.get(Task, task_id)
         if task is None:
@@ -234,12 +253,11 @@ class TaskService:
 
             # For progress updates, only keep progress-related fields
             # Filter out non-progress fields like task_type, data_directory, etc.
-            progress_fields = {"status", "current_file", "processed_records"}
-            if any(key in progress_fields for key in metadata):
+            if any(key in PROGRESS_METADATA_FIELDS for key in metadata):
                 # This is a progress update - replace task_data with only progress fields
                 # This ensures the display only shows progress-related information
                 filtered_metadata = {
-                    k: v for k, v in metadata.items() if k in progress_fields
+                    k: v for k, v in metadata.items() if k in PROGRESS_METADATA_FIELDS
                 }
                 # Only keep progress fields in task_data for display
                 updated_task_data = filtered_metadata
@@ -250,6 +268,61 @@ class TaskService:
             task.task_data = updated_task_data
         self._session.add(task)
         self._session.commit()
+        if publish:
+            self.publish_progress(task_id, task.user_id, progress, metadata)
+
+    def publish_progress(
+        self,
+        task_id: int,
+        user_id: int,
+        progress: float,
+        metadata: dict | None = None,
+    ) -> None:
+        """Publish a progress event without touching the database.
+
+        Parameters
+        ----------
+        task_id : int
+            Task ID.
+        user_id : int
+            ID of the user owning the task.
+        progress : float
+            Progress value between 0.0 and 1.0.
+        metadata : dict | None
+            Optional progress metadata.
+        """
+        self._publish(
+            TaskEvent(
+                task_id=task_id,
+                user_id=user_id,
+                event_type="progress",
+                status=TaskStatus.RUNNING,
+                progress=progress,
+                metadata=_public_metadata(metadata),
+            )
+        )
+
+    def _publish_status(self, task: Task) -> None:
+        """Publish a status event for a task that changed state."""
+        self._publish(
+            TaskEvent(
+                task_id=task.id or 0,
+                user_id=task.user_id,
+                event_type="status",
+                status=task.status,
+                progress=task.progress,
+                metadata=_public_metadata(task.task_data),
+                error_message=task.error_message,
+            )
+        )
+
+    def _publish(self, event: TaskEvent) -> None:
+        bus = self._event_bus or get_task_event_bus()
+        try:
+            bus.publish(event)
+        except Exception:
+            # Events are best effort; the database remains the source of truth
+            logger.exception("Failed to publish event for task %s", event.task_id)
 
     def start_task(self, task_id: int) -> None:
         """Mark a task as started.
@@ -268,6 +341,7 @@ class TaskService:
         task.started_at = datetime.now(UTC)
         self._session.add(task)
         self._session.commit()
+        self._publish_status(task)
 
     def complete_task(
         self,
@@ -332,6 +406,7 @@ class TaskService:
         self._session.commit()
         # Refresh to ensure all changes are loaded
         self._session.refresh(task)
+        self._publish_status(task)
 
     def fail_task(self, task_id: int, error_message: str) -> None:
         """Mark a task as failed.
@@ -353,6 +428,7 @@ class TaskService:
         task.completed_at = datetime.now(UTC)
         self._session.add(task)
         self._session.commit()
+        self._publish_status(task)
 
     def cancel_task(self, task_id: int, user_id: int | None = None) -> bool:
         """Cancel a task.
@@ -384,6 +460,7 @@ class TaskService:
         task.cancelled_at = datetime.now(UTC)
         self._session.add(task)
         self._session.commit()
+        self._publish_status(task)
         return True
 
     def has_active_task_of_type(self, task_type: TaskType) -> bool:
@@ -644,3 +721,10 @@ class TaskService:
             if stats not in added_list:
                 self._session.add(stats)
         self._session.commit()
+
+
+def _public_metadata(metadata: dict | None) -> dict | None:
+    """Drop sensitive fields from metadata exposed in task events."""
+    if metadata is None:
+        return None
+    return {k: v for k, v in metadata.items() if k not in SENSITIVE_METADATA_FIELDS}
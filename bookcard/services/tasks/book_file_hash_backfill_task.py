@@ -0,0 +1,112 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Book file hash index backfill task implementation."""
+
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bookcard.repositories.calibre_book_repository import CalibreBookRepository
+from bookcard.services.duplicate_detection.file_hash_index import FileHashIndex
+from bookcard.services.tasks.base import BaseTask
+from bookcard.services.tasks.task_library_resolver import resolve_task_library
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+    from bookcard.models.config import Library
+
+logger = logging.getLogger(__name__)
+
+
+class BookFileHashBackfillTask(BaseTask):
+    """Task for building and refreshing a library's file hash index.
+
+    Hashes every format file that is not indexed yet or whose size/mtime
+    changed since it was hashed, and drops records of deleted formats.
+    Re-running it on an unchanged library only stats the files.
+    """
+
+    def run(self, worker_context: dict[str, Any]) -> None:
+        """Execute the backfill task.
+
+        Parameters
+        ----------
+        worker_context : dict[str, Any]
+            Worker context containing session, task_service, update_progress.
+        """
+        session: Session = worker_context["session"]
+        update_progress = worker_context["update_progress"]
+
+        library = resolve_task_library(session, self.metadata, self.user_id)
+        if library.id is None:
+            msg = "Library has no ID"
+            raise ValueError(msg)
+
+        calibre_repo = CalibreBookRepository(
+            calibre_db_path=library.calibre_db_path,
+            calibre_db_file=library.calibre_db_file,
+        )
+
+        def on_progress(processed: int, total: int) -> None:
+            update_progress(processed / total)
+
+        with calibre_repo.get_session() as calibre_session:
+            result = FileHashIndex(session).backfill(
+                library_id=library.id,
+                calibre_session=calibre_session,
+                library_path=self._get_library_path(library),
+                check_cancelled=self.check_cancelled,
+                on_progress=on_progress,
+            )
+
+        self.set_metadata("stats", asdict(result))
+        if result.cancelled:
+            logger.info("Task %s cancelled during file hash backfill", self.task_id)
+            return
+
+        update_progress(1.0, self.metadata)
+        logger.info(
+            "File hash backfill for library %s completed: %d hashed, "
+            "%d unchanged, %d missing, %d removed",
+            library.id,
+            result.hashed,
+            result.unchanged,
+            result.missing,
+            result.removed,
+        )
+
+    @staticmethod
+    def _get_library_path(library: "Library") -> Path:
+        """Get library root path.
+
+        Parameters
+        ----------
+        library : Library
+            Library configuration.
+
+        Returns
+        -------
+        Path
+            Library root path.
+        """
+        if library.library_root:
+            return Path(library.library_root)
+        db_path = Path(library.calibre_db_path)
+        if db_path.is_dir():
+            return db_path
+        return db_path.parent
@@ -19,7 +19,17 @@ Handles scheduled daily scanning and fixing of EPUB files in the library.
 """
 
 import logging
+import multiprocessing
+import os
 from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from sqlmodel import Session, select
@@ -32,28 +42,27 @@ if TYPE_CHECKING:
 from bookcard.models.config import EPUBFixerConfig, Library, ScheduledTasksConfig
 from bookcard.models.epub_fixer import EPUBFixRun
 from bookcard.repositories.calibre_book_repository import CalibreBookRepository
-from bookcard.services.epub_fixer import (
-    BackupService,
-    EPUBFixerOrchestrator,
-    EPUBFixerSettings,
-    EPUBReader,
-    EPUBWriter,
-    FixResultRecorder,
-    LanguageFix,
-    NullBackupService,
-)
-from bookcard.services.epub_fixer.core.fixes import (
-    BodyIdLinkFix,
-    EncodingFix,
-    StrayImageFix,
-)
+from bookcard.repositories.epub_fixer_repository import EPUBFileFingerprintRepository
+from bookcard.services.epub_fixer import EPUBFixerSettings, FixResultRecorder
 from bookcard.services.epub_fixer.services.scanner import EPUBFileInfo, EPUBScanner
+from bookcard.services.epub_fixer.services.worker import (
+    EPUBFixJob,
+    EPUBFixOutcome,
+    compute_fixer_hash,
+    fix_epub_file,
+)
 from bookcard.services.epub_fixer_service import EPUBFixerService
 from bookcard.services.tasks.base import BaseTask
 from bookcard.services.tasks.task_library_resolver import resolve_task_library
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker processes fixing files concurrently
+MAX_FIX_WORKERS = 4
+
+# Number of completed files whose results are committed together
+PERSIST_BATCH_SIZE = 50
+
 
 class EPUBFixDailyScanTask(BaseTask):
     """Task for daily scheduled EPUB fixing.
@@ -103,15 +112,7 @@ class EPUBFixDailyScanTask(BaseTask):
 
     def _setup_services(
         self, session: Session
-    ) -> (
-        tuple[
-            EPUBFixerService,
-            BackupService | NullBackupService,
-            FixResultRecorder,
-            EPUBFixerSettings,
-        ]
-        | None
-    ):
+    ) -> tuple[EPUBFixerService, FixResultRecorder, EPUBFixerSettings] | None:
         """Set up services for daily scan processing.
 
         Parameters
@@ -121,7 +122,7 @@ class EPUBFixDailyScanTask(BaseTask):
 
         Returns
         -------
-        tuple[EPUBFixerService, BackupService | NullBackupService, FixResultRecorder, EPUBFixerSettings] | None
+        tuple[EPUBFixerService, FixResultRecorder, EPUBFixerSettings] | None
             Tuple of services, or None if disabled.
         """
         # Check if daily scan is enabled
@@ -140,14 +141,9 @@ class EPUBFixDailyScanTask(BaseTask):
 
         # Initialize services
         fixer_service = EPUBFixerService(session)
-        backup_service: BackupService | NullBackupService = (
-            BackupService(settings.backup_directory, settings.backup_enabled)
-            if settings.backup_enabled
-            else NullBackupService()
-        )
         recorder = FixResultRecorder(fixer_service)
 
-        return fixer_service, backup_service, recorder, settings
+        return fixer_service, recorder, settings
 
     def _scan_epub_files(self, library: Library) -> list[EPUBFileInfo]:
         """Scan library for EPUB files.
@@ -168,98 +164,193 @@ class EPUBFixDailyScanTask(BaseTask):
         scanner = EPUBScanner(library, calibre_repo)
         return scanner.scan_epub_files()
 
-    def _process_epub_file(
+    def _partition_files(
         self,
+        epub_files: list[EPUBFileInfo],
+        fingerprint_repo: EPUBFileFingerprintRepository,
+        fixer_hash: str,
+        fixer_service: EPUBFixerService,
+        settings: EPUBFixerSettings,
+    ) -> list[EPUBFileInfo]:
+        """Select the files that need to go through the fixer.
+
+        Files whose fingerprint matches their current size, modification
+        time and fixer hash are unchanged since they were last checked and
+        are skipped, as are files skipped by the fix history settings.
+
+        Parameters
+        ----------
+        epub_files : list[EPUBFileInfo]
+            All EPUB files of the library.
+        fingerprint_repo : EPUBFileFingerprintRepository
+            Fingerprint repository.
+        fixer_hash : str
+            Hash of the current fixer version and settings.
+        fixer_service : EPUBFixerService
+            EPUB fixer service.
+        settings : EPUBFixerSettings
+            EPUB fixer settings.
+
+        Returns
+        -------
+        list[EPUBFileInfo]
+            Files to process.
+        """
+        fingerprints = fingerprint_repo.get_by_paths(
+            str(epub_info.file_path) for epub_info in epub_files
+        )
+        pending: list[EPUBFileInfo] = []
+        for epub_info in epub_files:
+            fingerprint = fingerprints.get(str(epub_info.file_path))
+            if fingerprint is not None:
+                try:
+                    stat = epub_info.file_path.stat()
+                except OSError:
+                    pass
+                else:
+                    if fingerprint.matches(stat.st_size, stat.st_mtime_ns, fixer_hash):
+                        continue
+
+            if fixer_service.should_skip_epub(
+                str(epub_info.file_path),
+                skip_already_fixed=settings.skip_already_fixed,
+                skip_failed=settings.skip_failed,
+            ):
+                continue
+
+            pending.append(epub_info)
+        return pending
+
+    def _create_executor(self, max_workers: int) -> Executor:
+        """Create the worker pool fixing files.
+
+        Worker processes are spawned rather than forked, since forking a
+        process that runs other threads is unsafe.
+
+        Parameters
+        ----------
+        max_workers : int
+            Number of worker processes.
+
+        Returns
+        -------
+        Executor
+            Process pool running `fix_epub_file`.
+        """
+        return ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _persist_batch(
+        self,
+        session: Session,
+        fingerprint_repo: EPUBFileFingerprintRepository,
+        fingerprints: list[tuple[str, int, int]],
+        fixer_hash: str,
+    ) -> None:
+        """Commit recorded fixes and fingerprints of completed files.
+
+        Parameters
+        ----------
+        session : Session
+            Database session.
+        fingerprint_repo : EPUBFileFingerprintRepository
+            Fingerprint repository.
+        fingerprints : list[tuple[str, int, int]]
+            ``(file_path, size, mtime_ns)`` of completed files; cleared
+            once committed.
+        fixer_hash : str
+            Hash of the current fixer version and settings.
+        """
+        fingerprint_repo.upsert_many(fingerprints, fixer_hash)
+        session.commit()
+        fingerprints.clear()
+
+    def _record_outcome(
+        self,
+        future: Future[EPUBFixOutcome],
         epub_info: EPUBFileInfo,
-        orchestrator: EPUBFixerOrchestrator,
-        reader: EPUBReader,
-        writer: EPUBWriter,
-        backup_service: BackupService | NullBackupService,
         recorder: FixResultRecorder,
         fix_run: EPUBFixRun,
-    ) -> tuple[int, int]:
-        """Process a single EPUB file.
+        fingerprints: list[tuple[str, int, int]],
+    ) -> int:
+        """Record the outcome of a completed fix job.
 
         Parameters
         ----------
+        future : Future[EPUBFixOutcome]
+            Completed job.
         epub_info : EPUBFileInfo
-            EPUB file information.
-        orchestrator : EPUBFixerOrchestrator
-            Fix orchestrator.
-        reader : EPUBReader
-            EPUB reader.
-        writer : EPUBWriter
-            EPUB writer.
-        backup_service : BackupService | NullBackupService
-            Backup service.
+            File the job processed.
         recorder : FixResultRecorder
             Fix result recorder.
         fix_run : EPUBFixRun
             Fix run record.
+        fingerprints : list[tuple[str, int, int]]
+            Pending fingerprints; the file's new fingerprint is appended
+            unless it failed.
 
         Returns
         -------
-        tuple[int, int]
-            Tuple of (files_fixed, total_fixes).
+        int
+            Number of fixes applied to the file.
         """
-        files_fixed = 0
-        total_fixes = 0
         try:
-            backup_path = backup_service.create_backup(epub_info.file_path)
-            contents = reader.read(epub_info.file_path)
-            fix_results = orchestrator.process(contents)
-            if fix_results:
-                writer.write(contents, epub_info.file_path)
-                if fix_run.id is not None:
-                    recorder.record_fixes(
-                        run_id=fix_run.id,
-                        book_id=epub_info.book_id,
-                        book_title=epub_info.book_title,
-                        file_path=str(epub_info.file_path),
-                        fix_results=fix_results,
-                        original_file_path=backup_path,
-                        backup_created=backup_path is not None,
-                    )
-                files_fixed = 1
-                total_fixes = len(fix_results)
-        except Exception:
-            logger.exception("Error fixing EPUB %s", epub_info.file_path)
-
-        return files_fixed, total_fixes
+            outcome = future.result()
+        except Exception as exc:  # noqa: BLE001
+            # The worker process died (e.g. killed or crashed)
+            outcome = EPUBFixOutcome(file_path=str(epub_info.file_path), error=str(exc))
+
+        if outcome.error is not None:
+            logger.warning("Error fixing EPUB %s: %s", outcome.file_path, outcome.error)
+            return 0
+
+        if outcome.fix_results and fix_run.id is not None:
+            recorder.record_fixes(
+                run_id=fix_run.id,
+                book_id=epub_info.book_id,
+                book_title=epub_info.book_title,
+                file_path=outcome.file_path,
+                fix_results=outcome.fix_results,
+                original_file_path=outcome.backup_path,
+                backup_created=outcome.backup_path is not None,
+            )
+        if outcome.size is not None and outcome.mtime_ns is not None:
+            fingerprints.append((outcome.file_path, outcome.size, outcome.mtime_ns))
+        return len(outcome.fix_results)
 
     def _process_all_files(
         self,
+        session: Session,
         epub_files: list[EPUBFileInfo],
-        orchestrator: EPUBFixerOrchestrator,
-        reader: EPUBReader,
-        writer: EPUBWriter,
-        backup_service: BackupService | NullBackupService,
         recorder: FixResultRecorder,
         fix_run: EPUBFixRun,
         fixer_service: EPUBFixerService,
+        fingerprint_repo: EPUBFileFingerprintRepository,
         settings: EPUBFixerSettings,
         update_progress: Callable[[float], None],
     ) -> tuple[int, int, int]:
         """Process all EPUB files in daily scan.
 
+        Unchanged files are skipped; the rest are fixed by a bounded
+        process pool.  Fix records and fingerprints are committed every
+        `PERSIST_BATCH_SIZE` files.  Files that fail or time out get no
+        fingerprint, so the next scan retries them.
+
         Parameters
         ----------
+        session : Session
+            Database session.
         epub_files : list[EPUBFileInfo]
             List of EPUB files to process.
-        orchestrator : EPUBFixerOrchestrator
-            Fix orchestrator.
-        reader : EPUBReader
-            EPUB reader.
-        writer : EPUBWriter
-            EPUB writer.
-        backup_service : BackupService | NullBackupService
-            Backup service.
         recorder : FixResultRecorder
             Fix result recorder.
         fix_run : EPUBFixRun
             Fix run record.
         fixer_service : EPUBFixerService
             EPUB fixer service.
+        fingerprint_repo : EPUBFileFingerprintRepository
+            Fingerprint repository.
         settings : EPUBFixerSettings
             EPUB fixer settings.
         update_progress : Callable[[float], None]
@@ -271,43 +362,63 @@ class EPUBFixDailyScanTask(BaseTask):
             Tuple of (files_processed, files_fixed, total_fixes).
         """
         total_files = len(epub_files)
-        files_processed = 0
         files_fixed = 0
         total_fixes = 0
 
-        for epub_info in epub_files:
-            # Check if cancelled
-            if self.check_cancelled():
-                logger.info("Task %s cancelled during daily scan", self.task_id)
-                break
-
-            # Check if should skip
-            if fixer_service.should_skip_epub(
-                str(epub_info.file_path),
-                skip_already_fixed=settings.skip_already_fixed,
-                skip_failed=settings.skip_failed,
-            ):
-                files_processed += 1
-                update_progress(
-                    files_processed / total_files if total_files > 0 else 1.0
-                )
-                continue
-
-            # Process file
-            file_fixed, file_fixes = self._process_epub_file(
-                epub_info,
-                orchestrator,
-                reader,
-                writer,
-                backup_service,
-                recorder,
-                fix_run,
-            )
-            files_fixed += file_fixed
-            total_fixes += file_fixes
-            files_processed += 1
-            update_progress(files_processed / total_files if total_files > 0 else 1.0)
-
+        fixer_hash = compute_fixer_hash(settings.default_language)
+        pending = self._partition_files(
+            epub_files, fingerprint_repo, fixer_hash, fixer_service, settings
+        )
+        files_processed = total_files - len(pending)
+        if files_processed:
+            update_progress(files_processed / total_files)
+        if not pending:
+            return files_processed, files_fixed, total_fixes
+
+        backup_directory = (
+            str(settings.backup_directory) if settings.backup_enabled else None
+        )
+        jobs = iter(pending)
+        fingerprints: list[tuple[str, int, int]] = []
+        in_flight: dict[Future[EPUBFixOutcome], EPUBFileInfo] = {}
+        max_workers = min(MAX_FIX_WORKERS, os.cpu_count() or 1, len(pending))
+        executor = self._create_executor(max_workers)
+        try:
+            while True:
+                if self.check_cancelled():
+                    logger.info("Task %s cancelled during daily scan", self.task_id)
+                    break
+
+                # Keep a bounded window queued so cancellation stays responsive
+                for epub_info in islice(jobs, max_workers * 2 - len(in_flight)):
+                    job = EPUBFixJob(
+                        file_path=str(epub_info.file_path),
+                        default_language=settings.default_language,
+                        backup_directory=backup_directory,
+                    )
+                    in_flight[executor.submit(fix_epub_file, job)] = epub_info
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fixes_applied = self._record_outcome(
+                        future, in_flight.pop(future), recorder, fix_run, fingerprints
+                    )
+                    files_processed += 1
+                    if fixes_applied:
+                        files_fixed += 1
+                        total_fixes += fixes_applied
+
+                    if len(fingerprints) >= PERSIST_BATCH_SIZE:
+                        self._persist_batch(
+                            session, fingerprint_repo, fingerprints, fixer_hash
+                        )
+                    update_progress(files_processed / total_files)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self._persist_batch(session, fingerprint_repo, fingerprints, fixer_hash)
         return files_processed, files_fixed, total_fixes
 
     def run(self, worker_context: dict[str, Any]) -> None:
@@ -331,7 +442,7 @@ class EPUBFixDailyScanTask(BaseTask):
             if result is None:
                 logger.info("Daily scan disabled or EPUB fixer disabled, skipping")
                 return
-            fixer_service, backup_service, recorder, settings = result
+            fixer_service, recorder, settings = result
 
             # Resolve library via shared resolver (metadata → per-user → first available)
             library = resolve_task_library(session, self.metadata, self.user_id)
@@ -352,27 +463,14 @@ class EPUBFixDailyScanTask(BaseTask):
                 backup_enabled=settings.backup_enabled,
             )
 
-            # Create orchestrator and I/O components
-            fixes = [
-                BodyIdLinkFix(),
-                LanguageFix(default_language=settings.default_language),
-                StrayImageFix(),
-                EncodingFix(),
-            ]
-            orchestrator = EPUBFixerOrchestrator(fixes)
-            reader = EPUBReader()
-            writer = EPUBWriter()
-
             # Process all files
             files_processed, files_fixed, total_fixes = self._process_all_files(
+                session,
                 epub_files,
-                orchestrator,
-                reader,
-                writer,
-                backup_service,
                 recorder,
                 fix_run,
                 fixer_service,
+                EPUBFileFingerprintRepository(session),
                 settings,
                 update_progress,
             )
@@ -0,0 +1,344 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Task event bus.
+
+Task progress ticks and status transitions are published as `TaskEvent`
+objects.  Subscribers (the task SSE endpoint) receive them through bounded
+per-subscriber queues, so a slow client never blocks a task.
+
+`TaskEventBus` delivers events within the process.  `RedisTaskEventBus`
+relays them through a Redis Pub/Sub channel so that events published by
+out-of-process workers (e.g. Dramatiq) reach the web process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from typing import Any, Self
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Events kept per subscriber before the oldest ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+TASK_EVENTS_CHANNEL = "bookcard:task_events"
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """Progress tick or status transition of a task.
+
+    Attributes
+    ----------
+    task_id : int
+        Task ID.
+    user_id : int
+        ID of the user owning the task.
+    event_type : str
+        ``"progress"`` for progress ticks, ``"status"`` for transitions.
+    status : str
+        Task status after the event.
+    progress : float
+        Task progress (0.0 to 1.0).
+    metadata : dict[str, Any] | None
+        Progress metadata or final task metadata.
+    error_message : str | None
+        Error message of failed tasks.
+    timestamp : float
+        UNIX time at which the event was published.
+    """
+
+    task_id: int
+    user_id: int
+    event_type: str
+    status: str
+    progress: float
+    metadata: dict[str, Any] | None = None
+    error_message: str | None = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the event to a JSON-compatible dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TaskEvent:
+        """Build an event from `to_dict` output."""
+        return cls(**data)
+
+
+class TaskEventSubscription:
+    """Bounded queue of events delivered to one subscriber.
+
+    Parameters
+    ----------
+    bus : TaskEventBus
+        Bus the subscription is registered with.
+    user_id : int | None
+        Only receive events of this user's tasks; None receives all events.
+    maxsize : int
+        Maximum number of queued events; the oldest event is dropped when
+        the queue is full.
+    """
+
+    def __init__(
+        self,
+        bus: TaskEventBus,
+        user_id: int | None,
+        maxsize: int = SUBSCRIBER_QUEUE_SIZE,
+    ) -> None:
+        self._bus = bus
+        self.user_id = user_id
+        self._queue: queue.Queue[TaskEvent] = queue.Queue(maxsize=maxsize)
+
+    def matches(self, event: TaskEvent) -> bool:
+        """Return whether the event is visible to this subscriber."""
+        return self.user_id is None or event.user_id == self.user_id
+
+    def put(self, event: TaskEvent) -> None:
+        """Queue an event without blocking, dropping the oldest if full."""
+        while True:
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                with suppress(queue.Empty):
+                    self._queue.get_nowait()
+            else:
+                return
+
+    def get(self, timeout: float | None = None) -> TaskEvent | None:
+        """Wait for the next event.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Seconds to wait; None waits indefinitely.
+
+        Returns
+        -------
+        TaskEvent | None
+            Next event, or None if none arrived within the timeout.
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Unregister the subscription from its bus."""
+        self._bus.unsubscribe(self)
+
+    def __enter__(self) -> Self:
+        """Return the subscription for use as a context manager."""
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Unregister the subscription."""
+        self.close()
+
+
+class TaskEventBus:
+    """In-process publisher of task events."""
+
+    def __init__(self) -> None:
+        self._subscriptions: list[TaskEventSubscription] = []
+        self._lock = threading.Lock()
+
+    def publish(self, event: TaskEvent) -> None:
+        """Publish an event to all matching subscribers.
+
+        Parameters
+        ----------
+        event : TaskEvent
+            Event to publish.
+        """
+        self._dispatch(event)
+
+    def subscribe(self, user_id: int | None = None) -> TaskEventSubscription:
+        """Register a subscriber.
+
+        Parameters
+        ----------
+        user_id : int | None
+            Only receive events of this user's tasks; None receives all.
+
+        Returns
+        -------
+        TaskEventSubscription
+            Subscription to read events from; close it when done.
+        """
+        subscription = TaskEventSubscription(self, user_id)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TaskEventSubscription) -> None:
+        """Unregister a subscriber.
+
+        Parameters
+        ----------
+        subscription : TaskEventSubscription
+            Subscription returned by `subscribe`.
+        """
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def start(self) -> None:
+        """Start delivering events (no-op for the in-process bus)."""
+
+    def stop(self) -> None:
+        """Stop delivering events (no-op for the in-process bus)."""
+
+    def _dispatch(self, event: TaskEvent) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if subscription.matches(event):
+                subscription.put(event)
+
+
+class RedisTaskEventBus(TaskEventBus):
+    """Task event bus relaying events through Redis Pub/Sub.
+
+    Events are published to a Redis channel; after `start`, a listener
+    thread delivers events from that channel to local subscribers.
+    Processes that only publish (task workers) need not start it.
+
+    Parameters
+    ----------
+    redis_url : str
+        Redis connection URL.
+    channel : str
+        Pub/Sub channel name.
+    """
+
+    def __init__(self, redis_url: str, channel: str = TASK_EVENTS_CHANNEL) -> None:
+        super().__init__()
+        self._client = redis.from_url(redis_url)
+        self._channel = channel
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def publish(self, event: TaskEvent) -> None:
+        """Publish an event to the Redis channel.
+
+        Falls back to local delivery when Redis is unreachable.
+
+        Parameters
+        ----------
+        event : TaskEvent
+            Event to publish.
+        """
+        try:
+            self._client.publish(self._channel, json.dumps(event.to_dict()))
+        except redis.RedisError as exc:
+            logger.debug("Failed to publish task event to Redis: %s", exc)
+            self._dispatch(event)
+
+    def start(self) -> None:
+        """Start the listener thread delivering events to local subscribers."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._listen, name="TaskEventListener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _listen(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                try:
+                    while not self._stop_event.is_set():
+                        message = pubsub.get_message(timeout=1.0)
+                        if message is not None:
+                            self._handle_message(message)
+                finally:
+                    pubsub.close()
+            except redis.RedisError:
+                logger.exception("Task event listener lost Redis connection")
+                self._stop_event.wait(5.0)
+
+    def _handle_message(self, message: dict[str, Any]) -> None:
+        try:
+            event = TaskEvent.from_dict(json.loads(message["data"]))
+        except (TypeError, ValueError, KeyError):
+            logger.warning("Ignoring malformed task event: %r", message.get("data"))
+            return
+        self._dispatch(event)
+
+
+_bus: TaskEventBus | None = None
+_bus_lock = threading.Lock()
+
+
+def configure_task_event_bus(redis_url: str | None = None) -> TaskEventBus:
+    """Install the global task event bus.
+
+    Replaces (and stops) any previously configured bus.
+
+    Parameters
+    ----------
+    redis_url : str | None
+        Relay events through this Redis server; None keeps events
+        within the process.
+
+    Returns
+    -------
+    TaskEventBus
+        Newly installed bus.
+    """
+    global _bus
+    bus = RedisTaskEventBus(redis_url) if redis_url else TaskEventBus()
+    with _bus_lock:
+        previous, _bus = _bus, bus
+    if previous is not None:
+        previous.stop()
+    return bus
+
+
+def get_task_event_bus() -> TaskEventBus:
+    """Get the global task event bus.
+
+    Returns
+    -------
+    TaskEventBus
+        Bus configured by `configure_task_event_bus`, or an in-process bus
+        if none was configured.
+    """
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = TaskEventBus()
+        return _bus
@@ -28,6 +28,9 @@ from bookcard.services.tasks.author_metadata_fetch_task import (
 )
 from bookcard.services.tasks.base import BaseTask
 from bookcard.services.tasks.book_convert_task import BookConvertTask
+from bookcard.services.tasks.book_file_hash_backfill_task import (
+    BookFileHashBackfillTask,
+)
 from bookcard.services.tasks.book_strip_drm_task import BookStripDrmTask
 from bookcard.services.tasks.book_upload_task import BookUploadTask
 from bookcard.services.tasks.download_monitor_task import DownloadMonitorTask
@@ -45,6 +48,7 @@ from bookcard.services.tasks.indexer_health_check_task import (
 from bookcard.services.tasks.ingest_book_task import IngestBookTask
 from bookcard.services.tasks.ingest_discovery_task import IngestDiscoveryTask
 from bookcard.services.tasks.library_scan import LibraryScanTask
+from bookcard.services.tasks.magic_shelf_refresh_task import MagicShelfRefreshTask
 from bookcard.services.tasks.metadata_db_backup_task import MetadataDbBackupTask
 from bookcard.services.tasks.multi_upload_task import MultiBookUploadTask
 from bookcard.services.tasks.openlibrary import OpenLibraryDumpIngestTask
@@ -259,3 +263,5 @@ _registry.register(TaskType.PVR_DOWNLOAD_MONITOR, DownloadMonitorTask)
 _registry.register(TaskType.PROWLARR_SYNC, ProwlarrSyncTask)
 _registry.register(TaskType.INDEXER_HEALTH_CHECK, IndexerHealthCheckTask)
 _registry.register(TaskType.METADATA_BACKUP, MetadataDbBackupTask)
+_registry.register(TaskType.BOOK_FILE_HASH_BACKFILL, BookFileHashBackfillTask)
+_registry.register(TaskType.MAGIC_SHELF_REFRESH, MagicShelfRefreshTask)
@@ -342,13 +342,12 @@ class IngestBookTask(BaseTask):
         file_format: str,
         title: str | None,
         author_name: str | None,
+        session: Session | None = None,
     ) -> int | None:
         """Check for duplicate and handle according to library settings.
 
         Parameters
         ----------
-        session : Session
-            Database session.
         library : Library
             Active library configuration.
         processor_service : IngestProcessorService
@@ -361,6 +360,8 @@ class IngestBookTask(BaseTask):
             Book title.
         author_name : str | None
             Author name.
+        session : Session | None
+            Database session, enables the file hash index strategy.
 
         Returns
         -------
@@ -373,7 +374,7 @@ class IngestBookTask(BaseTask):
         For IGNORE mode, returns None to signal skip. For OVERWRITE mode,
         deletes existing book and returns its ID. For CREATE_NEW mode, returns None.
         """
-        duplicate_handler = BookDuplicateHandler()
+        duplicate_handler = BookDuplicateHandler(session=session)
         result = duplicate_handler.check_duplicate(
             library=library,
             file_path=file_path,
@@ -470,11 +471,12 @@ class IngestBookTask(BaseTask):
             file_format=file_format,
             title=title,
             author_name=author_name,
+            session=session,
         )
 
         # If IGNORE mode and duplicate found, skip this file
         if duplicate_result is None and title:
-            duplicate_handler = BookDuplicateHandler()
+            duplicate_handler = BookDuplicateHandler(session=session)
             result = duplicate_handler.check_duplicate(
                 library=library,
                 file_path=file_path,
@@ -0,0 +1,157 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Magic Shelf membership refresh task implementation."""
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from bookcard.models.shelves import ShelfTypeEnum
+from bookcard.repositories.calibre_book_repository import CalibreBookRepository
+from bookcard.repositories.library_repository import LibraryRepository
+from bookcard.repositories.shelf_repository import ShelfRepository
+from bookcard.services.magic_shelf.evaluator import BookRuleEvaluator
+from bookcard.services.magic_shelf.materializer import MagicShelfMaterializer
+from bookcard.services.magic_shelf.service import MagicShelfService
+from bookcard.services.tasks.base import BaseTask
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+    from bookcard.models.shelves import Shelf
+
+logger = logging.getLogger(__name__)
+
+
+class MagicShelfRefreshTask(BaseTask):
+    """Task for refreshing the materialized membership of Magic Shelves.
+
+    Refreshes every Magic Shelf of every library, so that opening a shelf
+    rarely has to wait for a refresh. Memberships are updated incrementally
+    from the books modified since the last refresh; the ``rebuild``
+    metadata flag re-evaluates the rules against whole libraries instead.
+    """
+
+    def run(self, worker_context: dict[str, Any]) -> None:
+        """Execute the refresh task.
+
+        Parameters
+        ----------
+        worker_context : dict[str, Any]
+            Worker context containing session, task_service, update_progress.
+        """
+        session: Session = worker_context["session"]
+        update_progress = worker_context["update_progress"]
+        rebuild = bool(self.metadata.get("rebuild", False))
+
+        shelf_repo = ShelfRepository(session)
+        evaluator = BookRuleEvaluator()
+        materializer = MagicShelfMaterializer(session, evaluator)
+
+        shelves_by_library: dict[int, list[Shelf]] = {}
+        libraries = {
+            library.id: library
+            for library in LibraryRepository(session).list()
+            if library.id is not None and library.calibre_db_path
+        }
+        for library_id in libraries:
+            shelves = [
+                shelf
+                for shelf in shelf_repo.find_by_library(library_id)
+                if shelf.shelf_type == ShelfTypeEnum.MAGIC_SHELF
+            ]
+            if shelves:
+                shelves_by_library[library_id] = shelves
+
+        total = sum(len(shelves) for shelves in shelves_by_library.values())
+        processed = 0
+        stats = {"refreshed": 0, "added": 0, "removed": 0, "failed": 0}
+        for library_id, shelves in shelves_by_library.items():
+            library = libraries[library_id]
+            service = MagicShelfService(
+                shelf_repo,
+                {
+                    library_id: CalibreBookRepository(
+                        calibre_db_path=library.calibre_db_path,
+                        calibre_db_file=library.calibre_db_file,
+                    )
+                },
+                evaluator,
+                materializer=materializer,
+            )
+            for shelf in shelves:
+                if self.check_cancelled():
+                    self.set_metadata("stats", stats)
+                    logger.info("Task %s cancelled during shelf refresh", self.task_id)
+                    return
+                if shelf.id is not None and self._refresh_shelf(
+                    session, service, shelf.id, rebuild, stats
+                ):
+                    stats["refreshed"] += 1
+                processed += 1
+                update_progress(processed / total)
+
+        self.set_metadata("stats", stats)
+        update_progress(1.0, self.metadata)
+        logger.info(
+            "Magic shelf refresh completed: %d refreshed, %d added, %d removed, "
+            "%d failed",
+            stats["refreshed"],
+            stats["added"],
+            stats["removed"],
+            stats["failed"],
+        )
+
+    @staticmethod
+    def _refresh_shelf(
+        session: "Session",
+        service: MagicShelfService,
+        shelf_id: int,
+        rebuild: bool,
+        stats: dict[str, int],
+    ) -> bool:
+        """Refresh one shelf and commit, isolating failures.
+
+        Parameters
+        ----------
+        session : Session
+            App database session.
+        service : MagicShelfService
+            Service scoped to the shelf's library.
+        shelf_id : int
+            Magic Shelf ID.
+        rebuild : bool
+            Whether to rebuild the membership from scratch.
+        stats : dict[str, int]
+            Statistics to update.
+
+        Returns
+        -------
+        bool
+            True if the shelf was refreshed.
+        """
+        try:
+            result = service.refresh_shelf(shelf_id, rebuild=rebuild)
+            session.commit()
+        except Exception:
+            session.rollback()
+            logger.exception("Failed to refresh magic shelf %d", shelf_id)
+            stats["failed"] += 1
+            return False
+        if result is None:
+            return False
+        stats["added"] += result.added
+        stats["removed"] += result.removed
+        return True
@@ -0,0 +1,137 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Coalesced task progress reporting.
+
+Tasks report progress through the ``update_progress`` callback of their
+worker context, sometimes once per processed item.  The reporter publishes
+every tick on the task event bus but writes progress to the database at
+most once per flush interval, keeping scans from contending with their own
+progress writes for the SQLite write lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from bookcard.services.task_service import PROGRESS_METADATA_FIELDS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from bookcard.services.task_service import TaskService
+
+# Minimum number of seconds between two progress writes of a task
+PROGRESS_FLUSH_INTERVAL = 2.0
+
+
+class CoalescedProgressReporter:
+    """Progress callback publishing every tick and writing at most every N seconds.
+
+    Ticks carrying metadata other than progress fields are written
+    immediately, since the task service merges rather than replaces such
+    metadata.  The final tick (progress 1.0) is also written immediately;
+    the task executor flushes any pending tick before a state transition.
+
+    Parameters
+    ----------
+    task_service : TaskService
+        Task service writing progress and publishing events.
+    task_id : int
+        Task ID.
+    user_id : int
+        ID of the user owning the task.
+    flush_interval : float
+        Minimum number of seconds between two progress writes.
+    clock : Callable[[], float]
+        Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        task_service: TaskService,
+        task_id: int,
+        user_id: int,
+        *,
+        flush_interval: float = PROGRESS_FLUSH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._task_service = task_service
+        self._task_id = task_id
+        self._user_id = user_id
+        self._flush_interval = flush_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_flush: float | None = None
+        self._pending = False
+        self._pending_progress = 0.0
+        self._pending_metadata: dict[str, Any] | None = None
+
+    def __call__(self, progress: float, metadata: dict[str, Any] | None = None) -> None:
+        """Report a progress tick.
+
+        Parameters
+        ----------
+        progress : float
+            Progress value between 0.0 and 1.0.
+        metadata : dict[str, Any] | None
+            Optional progress metadata.
+
+        Raises
+        ------
+        ValueError
+            If progress is outside 0.0 to 1.0.
+        """
+        if not 0.0 <= progress <= 1.0:
+            msg = "Progress must be between 0.0 and 1.0"
+            raise ValueError(msg)
+
+        self._task_service.publish_progress(
+            self._task_id, self._user_id, progress, metadata
+        )
+        with self._lock:
+            self._pending = True
+            self._pending_progress = progress
+            if metadata is not None:
+                self._pending_metadata = metadata
+            now = self._clock()
+            if (
+                progress >= 1.0
+                or self._last_flush is None
+                or now - self._last_flush >= self._flush_interval
+                or (
+                    metadata is not None
+                    and not any(key in PROGRESS_METADATA_FIELDS for key in metadata)
+                )
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write the last reported tick if it has not been written yet."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        progress, metadata = self._pending_progress, self._pending_metadata
+        self._pending = False
+        self._pending_metadata = None
+        self._last_flush = self._clock()
+        self._task_service.update_task_progress(
+            self._task_id, progress, metadata, publish=False
+        )
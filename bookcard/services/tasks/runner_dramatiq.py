@@ -35,7 +35,9 @@ from bookcard.models.tasks import TaskStatus, TaskType  # noqa: TC001
 from bookcard.services.messaging.redis_broker import RedisBroker as ScanRedisBroker
 from bookcard.services.task_service import TaskService
 from bookcard.services.tasks.base import TaskRunner
+from bookcard.services.tasks.events import RedisTaskEventBus
 from bookcard.services.tasks.factory import create_task
+from bookcard.services.tasks.progress_reporter import CoalescedProgressReporter
 from bookcard.services.tasks.task_executor import TaskExecutor
 
 if TYPE_CHECKING:
@@ -82,7 +84,9 @@ def _execute_task_actor(
     """
     try:
         with _get_session(engine) as session:
-            task_service = TaskService(session)
+            # Workers run out of process: relay events to the web process
+            event_bus = RedisTaskEventBus(redis_url) if redis_url else None
+            task_service = TaskService(session, event_bus=event_bus)
             task = task_service.get_task(task_id)
 
             if task is None:
@@ -98,15 +102,9 @@ def _execute_task_actor(
             task_metadata.update(payload)
             task_instance = create_task(task_id, user_id, task_metadata)
 
-            # Create progress callback
-            def update_progress(
-                progress: float,
-                meta: dict[str, Any] | None = None,
-                _task_id: int = task_id,
-                _task_service: TaskService = task_service,
-            ) -> None:
-                """Update task progress in database."""
-                _task_service.update_task_progress(_task_id, progress, meta)
+            # Create progress callback; ticks are published immediately and
+            # written to the database coalesced
+            update_progress = CoalescedProgressReporter(task_service, task_id, user_id)
 
             worker_context = {
                 "session": session,
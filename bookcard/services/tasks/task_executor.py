@@ -80,6 +80,7 @@ class TaskExecutor:
             # Execute the task
             task_instance.run(worker_context)
             duration = time.time() - start_time
+            self._flush_progress(worker_context)
 
             # Check if task was cancelled or already failed (e.g. by timeout reaper)
             task = self._task_service.get_task(task_id)
@@ -122,6 +123,10 @@ class TaskExecutor:
                 with suppress(Exception):
                     session.rollback()
 
+            # Persist the last coalesced progress tick before the transition
+            with suppress(Exception):
+                self._flush_progress(worker_context)
+
             # Get task to check current status
             try:
                 task = self._task_service.get_task(task_id)
@@ -149,6 +154,19 @@ class TaskExecutor:
                     task_id,
                 )
 
+    @staticmethod
+    def _flush_progress(worker_context: dict[str, Any]) -> None:
+        """Write a pending progress tick of a coalescing progress callback.
+
+        Parameters
+        ----------
+        worker_context : dict[str, Any]
+            Worker context whose ``update_progress`` may buffer ticks.
+        """
+        flush = getattr(worker_context.get("update_progress"), "flush", None)
+        if callable(flush):
+            flush()
+
     @staticmethod
     def _format_error(exc: Exception) -> str:
         """Format exception into a user-friendly error message.
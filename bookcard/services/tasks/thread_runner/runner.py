@@ -27,6 +27,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from bookcard.database import get_session as _get_session
 from bookcard.services.task_service import TaskService
 from bookcard.services.tasks.base import TaskRunner
+from bookcard.services.tasks.progress_reporter import CoalescedProgressReporter
 from bookcard.services.tasks.task_executor import TaskExecutor
 from bookcard.services.tasks.thread_runner.context import TaskContextBuilder
 from bookcard.services.tasks.thread_runner.queue import TaskQueueManager
@@ -174,15 +175,11 @@ class ThreadTaskRunner(TaskRunner):
                     timeout_timer.daemon = True
                     timeout_timer.start()
 
-                # Execute task with progress callback
-                def update_progress(
-                    progress: float,
-                    meta: dict[str, Any] | None = None,
-                    _task_id: int = task_id,
-                    _task_service: TaskService = task_service,
-                ) -> None:
-                    """Update task progress in database."""
-                    _task_service.update_task_progress(_task_id, progress, meta)
+                # Execute task with progress callback; ticks are published
+                # immediately and written to the database coalesced
+                update_progress = CoalescedProgressReporter(
+                    task_service, task_id, item.user_id
+                )
 
                 # Build worker context for TaskExecutor
                 worker_context = {
@@ -601,8 +601,6 @@ class TrackedBookService:
         except Exception:
             logger.exception("Error searching library for match")
             return None, False
-        finally:
-            calibre_repo.dispose()
 
         return None, False
 
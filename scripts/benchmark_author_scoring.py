@@ -0,0 +1,145 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark author similarity scoring.
+
+Compares the all-pairs loop (`AuthorPairProcessor`) with the blocked engine
+(`BlockedSimilarityEngine`) on a synthetic in-memory library.
+
+Usage
+-----
+    python -m scripts.benchmark_author_scoring [authors] [subjects_per_author]
+
+Examples
+--------
+    python -m scripts.benchmark_author_scoring
+    python -m scripts.benchmark_author_scoring 500 8
+
+Notes
+-----
+- The all-pairs loop is quadratic in queries; keep ``authors`` small
+  (a few hundred) or it will run for a very long time.
+- Both runs start from an empty ``author_similarities`` table.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from sqlalchemy import delete
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from bookcard.models.author_metadata import (
+    AuthorMetadata,
+    AuthorSimilarity,
+    AuthorWork,
+    WorkSubject,
+)
+from bookcard.services.library_scanning.pipeline.score import (
+    AuthorPairProcessor,
+    CompositeSimilarityCalculator,
+    GenreSimilarityCalculator,
+    RatingsSimilarityCalculator,
+    SimilarityRepository,
+    SubjectRepository,
+    TimePeriodSimilarityCalculator,
+    WorkCountSimilarityCalculator,
+)
+from bookcard.services.library_scanning.pipeline.score_engine import (
+    BlockedSimilarityEngine,
+)
+
+_VOCABULARY_SIZE = 400
+
+
+def _populate(session: Session, authors: int, subjects_per_author: int) -> None:
+    """Create synthetic authors, works and subjects."""
+    rng = random.Random(42)  # noqa: S311
+    vocabulary = [f"subject-{i}" for i in range(_VOCABULARY_SIZE)]
+    for author_id in range(1, authors + 1):
+        session.add(
+            AuthorMetadata(
+                id=author_id,
+                name=f"Author {author_id}",
+                work_count=rng.randint(1, 200),
+                ratings_count=rng.randint(0, 5000),
+                birth_date=str(rng.randint(1900, 1999)),
+            )
+        )
+        work = AuthorWork(author_metadata_id=author_id, work_key=f"OL{author_id}W")
+        session.add(work)
+        session.flush()
+        for subject in rng.sample(vocabulary, subjects_per_author):
+            session.add(WorkSubject(author_work_id=work.id, subject_name=subject))
+    session.commit()
+
+
+def _run_pair_loop(session: Session, authors: list[AuthorMetadata]) -> int:
+    """Score every pair with the original per-pair processor."""
+    subjects = SubjectRepository(session)
+    processor = AuthorPairProcessor(
+        CompositeSimilarityCalculator([
+            (GenreSimilarityCalculator(subjects), 0.5),
+            (WorkCountSimilarityCalculator(), 0.2),
+            (RatingsSimilarityCalculator(), 0.15),
+            (TimePeriodSimilarityCalculator(), 0.15),
+        ]),
+        SimilarityRepository(session),
+    )
+    created = 0
+    for i, author1 in enumerate(authors):
+        for author2 in authors[i + 1 :]:
+            created += processor.process_pair(author1, author2)
+    session.commit()
+    return created
+
+
+def main() -> None:
+    """Run both scoring strategies and print timings."""
+    authors = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    subjects_per_author = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        _populate(session, authors, subjects_per_author)
+        all_authors = list(session.exec(select(AuthorMetadata)).all())
+        pairs = authors * (authors - 1) // 2
+        sys.stdout.write(
+            f"{authors} authors, {subjects_per_author} subjects each, {pairs} pairs\n"
+        )
+
+        start = time.perf_counter()
+        created = _run_pair_loop(session, all_authors)
+        elapsed = time.perf_counter() - start
+        sys.stdout.write(f"pair loop:      {elapsed:8.3f}s  {created} similarities\n")
+
+        session.execute(delete(AuthorSimilarity))
+        session.commit()
+
+        start = time.perf_counter()
+        result = BlockedSimilarityEngine(session).run(all_authors)
+        elapsed = time.perf_counter() - start
+        sys.stdout.write(
+            f"blocked engine: {elapsed:8.3f}s  {result.similarities_created} "
+            f"similarities ({result.candidate_pairs} candidate pairs)\n"
+        )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
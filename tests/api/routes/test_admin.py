@@ -25,6 +25,7 @@ from fastapi import HTTPException
 import bookcard.api.routes.admin as admin
 from bookcard.models.auth import EBookFormat, EReaderDevice, Role, User
 from bookcard.models.config import Library
+from bookcard.repositories.engine_registry import EngineRegistryStats
 from tests.conftest import DummySession
 
 
@@ -1869,6 +1870,25 @@ def test_delete_library_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
         assert exc_info.value.detail == "library_not_found"
 
 
+def test_get_calibre_engine_stats() -> None:
+    """Test get_calibre_engine_stats exposes the engine registry counters."""
+    registry = MagicMock()
+    registry.__len__.return_value = 2
+    registry.stats.return_value = EngineRegistryStats(
+        engine_hits=9, engine_misses=1, checkouts=10, connections_opened=2
+    )
+
+    with patch(
+        "bookcard.api.routes.admin.get_calibre_engine_registry",
+        return_value=registry,
+    ):
+        result = admin.get_calibre_engine_stats()
+
+    assert result.libraries == 2
+    assert (result.engine_hits, result.engine_misses) == (9, 1)
+    assert (result.pool_hits, result.pool_misses) == (8, 2)
+
+
 def test_get_library_stats_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test get_library_stats returns statistics (covers lines 1128-1133)."""
     session = DummySession()
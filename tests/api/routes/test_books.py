@@ -23,12 +23,15 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
+from starlette.requests import Request
 
 import bookcard.api.routes.books as books
 from bookcard.models.auth import User
 from bookcard.models.config import Library
 from bookcard.models.core import Book
 from bookcard.repositories import BookWithFullRelations, BookWithRelations
+from bookcard.repositories.visibility import BookVisibility
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
 from tests.conftest import DummySession
 
 
@@ -42,6 +45,19 @@ def _create_mock_user() -> User:
     )
 
 
+def _make_cover_request(headers: dict[str, str] | None = None) -> Request:
+    """Create a request for the cover endpoint."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/books/1/cover",
+        "headers": [
+            (key.lower().encode(), value.encode())
+            for key, value in (headers or {}).items()
+        ],
+    })
+
+
 def _setup_route_mocks(
     monkeypatch: pytest.MonkeyPatch,
     session: DummySession,
@@ -123,6 +139,10 @@ class MockPermissionHelper:
     ) -> None:
         """Mock check_read_permission - always allows."""
 
+    def get_read_visibility(self, user: User) -> BookVisibility:
+        """Mock get_read_visibility - every book is visible."""
+        return BookVisibility()
+
     def check_write_permission(
         self,
         user: User,
@@ -259,6 +279,7 @@ class MockBookService:
         full: bool = False,
         pubdate_month: int | None = None,
         pubdate_day: int | None = None,
+        visibility: BookVisibility | None = None,
     ) -> tuple[list[BookWithRelations | BookWithFullRelations], int]:
         """Mock list_books method."""
         return self._list_books_result
@@ -319,6 +340,7 @@ class MockBookService:
         sort_by: str = "timestamp",
         sort_order: str = "desc",
         full: bool = False,
+        visibility: BookVisibility | None = None,
     ) -> tuple[list[BookWithRelations | BookWithFullRelations], int]:
         """Mock list_books_with_filters method."""
         return self._list_books_with_filters_result
@@ -831,15 +853,72 @@ def test_get_book_cover_success(monkeypatch: pytest.MonkeyPatch) -> None:
         )
 
         result = books.get_book_cover(
+            request=_make_cover_request(),
             current_user=current_user,
             book_id=1,
             book_service=mock_service,
             permission_helper=mock_permission_helper,
+            thumbnail_cache=CoverThumbnailCache(Path("/nonexistent/cache")),
         )
         assert isinstance(result, FileResponse)
         assert result.path == str(cover_path)
 
 
+def test_get_book_cover_resized_and_not_modified(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test get_book_cover serves a cached variant and answers 304."""
+    from fastapi import Response
+    from PIL import Image
+
+    session = DummySession()
+    current_user = _create_mock_user()
+
+    book = Book(id=1, title="Test Book", uuid="test-uuid", has_cover=True, path="p")
+    book_with_rels = BookWithRelations(book=book, authors=[], series=None, formats=[])
+    cover_path = tmp_path / "cover.jpg"
+    Image.new("RGB", (800, 1200), "red").save(cover_path, format="JPEG")
+
+    mock_service = MockBookService(
+        get_book_result=book_with_rels,
+        get_thumbnail_path_result=cover_path,
+    )
+    mock_permission_helper, _ = _setup_route_mocks(monkeypatch, session, mock_service)
+    cache = CoverThumbnailCache(tmp_path / "cache")
+
+    result = books.get_book_cover(
+        request=_make_cover_request({"Accept": "image/webp,*/*"}),
+        current_user=current_user,
+        book_id=1,
+        book_service=mock_service,
+        permission_helper=mock_permission_helper,
+        thumbnail_cache=cache,
+        w=300,
+    )
+
+    assert result.media_type == "image/webp"
+    etag = result.headers["etag"]
+    with Image.open(result.path) as thumb:  # type: ignore[attr-defined]
+        assert max(thumb.size) == 300
+
+    not_modified = books.get_book_cover(
+        request=_make_cover_request({
+            "Accept": "image/webp,*/*",
+            "If-None-Match": etag,
+        }),
+        current_user=current_user,
+        book_id=1,
+        book_service=mock_service,
+        permission_helper=mock_permission_helper,
+        thumbnail_cache=cache,
+        w=300,
+    )
+
+    assert isinstance(not_modified, Response)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+
 def test_get_book_cover_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test get_book_cover raises 404 when book not found."""
     session = DummySession()
@@ -859,10 +938,12 @@ def test_get_book_cover_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
 
     with pytest.raises(HTTPException) as exc_info:
         books.get_book_cover(
+            request=_make_cover_request(),
             current_user=current_user,
             book_id=999,
             book_service=mock_service,
             permission_helper=mock_permission_helper,
+            thumbnail_cache=CoverThumbnailCache(Path("/nonexistent/cache")),
         )
     assert isinstance(exc_info.value, HTTPException)
     assert exc_info.value.status_code == 404
@@ -909,10 +990,12 @@ def test_get_book_cover_file_not_exists(monkeypatch: pytest.MonkeyPatch) -> None
     mock_permission_helper, _ = _setup_route_mocks(monkeypatch, session, mock_service)
 
     result = books.get_book_cover(
+        request=_make_cover_request(),
         current_user=current_user,
         book_id=1,
         book_service=mock_service,
         permission_helper=mock_permission_helper,
+        thumbnail_cache=CoverThumbnailCache(Path("/nonexistent/cache")),
     )
 
     assert isinstance(result, Response)
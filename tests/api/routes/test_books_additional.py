@@ -1769,10 +1769,11 @@ def test_get_cover_service(monkeypatch: pytest.MonkeyPatch) -> None:
         mock_cover_service = MagicMock()
         mock_class.return_value = mock_cover_service
 
-        result = books._get_cover_service(mock_service)  # type: ignore[arg-type]
+        mock_cache = MagicMock()
+        result = books._get_cover_service(mock_service, mock_cache)  # type: ignore[arg-type]
 
         assert result is not None
-        mock_class.assert_called_once_with(mock_service)
+        mock_class.assert_called_once_with(mock_service, mock_cache)
 
 
 def test_get_conversion_orchestration_service_no_library(
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import zipfile
 from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
@@ -28,9 +29,17 @@ from fastapi.testclient import TestClient
 from PIL import Image
 
 import bookcard.api.routes.comic as comic_routes
-from bookcard.api.deps import get_current_user, get_db_session
+from bookcard.api.deps import (
+    get_comic_archive_service,
+    get_current_user,
+    get_db_session,
+)
 from bookcard.models.auth import User
-from bookcard.services.comic.archive import ArchiveReadError
+from bookcard.services.comic.archive import (
+    ArchiveReadError,
+    ComicThumbnailCache,
+    create_comic_archive_service,
+)
 from bookcard.services.comic.archive.models import ComicPageInfo
 
 if TYPE_CHECKING:
@@ -70,6 +79,7 @@ def app(test_user: User) -> FastAPI:
 
     app.dependency_overrides[get_db_session] = _session_dep
     app.dependency_overrides[get_current_user] = lambda: test_user
+    app.dependency_overrides[get_comic_archive_service] = create_comic_archive_service
     return app
 
 
@@ -366,8 +376,8 @@ def test_list_comic_pages_success(
     )
     monkeypatch.setattr(comic_routes, "BookPermissionHelper", FakePermissionHelper)
     monkeypatch.setattr(comic_routes, "_get_comic_file_path", lambda *_a, **_k: f)
-    monkeypatch.setattr(
-        comic_routes, "create_comic_archive_service", lambda: FakeArchiveService()
+    client.app.dependency_overrides[get_comic_archive_service] = lambda: (
+        FakeArchiveService()
     )
 
     res = client.get("/comic/1/pages", params={"file_format": "CBZ"})
@@ -416,8 +426,8 @@ def test_list_comic_pages_archive_error_mapped_to_400(
     )
     monkeypatch.setattr(comic_routes, "BookPermissionHelper", FakePermissionHelper)
     monkeypatch.setattr(comic_routes, "_get_comic_file_path", lambda *_a, **_k: f)
-    monkeypatch.setattr(
-        comic_routes, "create_comic_archive_service", lambda: FakeArchiveService()
+    client.app.dependency_overrides[get_comic_archive_service] = lambda: (
+        FakeArchiveService()
     )
 
     res = client.get("/comic/1/pages", params={"file_format": "CBZ"})
@@ -473,6 +483,9 @@ def test_get_comic_page_thumbnail_success_and_fallback(
         def get_page(self, _path: Path, _page_number: int) -> FakePage:
             return FakePage(image_data=self._payload)
 
+        def get_page_thumbnail(self, _path: Path, _page: int, **_kw: object) -> None:
+            return None
+
     f = Path("/tmp/a.cbz")
 
     monkeypatch.setattr(
@@ -484,10 +497,8 @@ def test_get_comic_page_thumbnail_success_and_fallback(
     monkeypatch.setattr(comic_routes, "_get_comic_file_path", lambda *_a, **_k: f)
 
     # Success path: RGBA image is converted to JPEG thumbnail
-    monkeypatch.setattr(
-        comic_routes,
-        "create_comic_archive_service",
-        lambda: FakeArchiveService(rgba_png_bytes),
+    client.app.dependency_overrides[get_comic_archive_service] = lambda: (
+        FakeArchiveService(rgba_png_bytes)
     )
     res = client.get(
         "/comic/1/pages/1",
@@ -499,8 +510,8 @@ def test_get_comic_page_thumbnail_success_and_fallback(
 
     # Fallback path: invalid bytes trigger try/except and return original bytes
     bad = b"not an image"
-    monkeypatch.setattr(
-        comic_routes, "create_comic_archive_service", lambda: FakeArchiveService(bad)
+    client.app.dependency_overrides[get_comic_archive_service] = lambda: (
+        FakeArchiveService(bad)
     )
     res2 = client.get(
         "/comic/1/pages/1",
@@ -537,6 +548,9 @@ def test_get_comic_page_thumbnail_endpoint_delegates(
         def get_page(self, _path: Path, _page_number: int) -> FakePage:
             return FakePage(image_data=rgba_png_bytes)
 
+        def get_page_thumbnail(self, _path: Path, _page: int, **_kw: object) -> None:
+            return None
+
     f = Path("/tmp/a.cbz")
 
     monkeypatch.setattr(
@@ -546,8 +560,8 @@ def test_get_comic_page_thumbnail_endpoint_delegates(
     )
     monkeypatch.setattr(comic_routes, "BookPermissionHelper", FakePermissionHelper)
     monkeypatch.setattr(comic_routes, "_get_comic_file_path", lambda *_a, **_k: f)
-    monkeypatch.setattr(
-        comic_routes, "create_comic_archive_service", lambda: FakeArchiveService()
+    client.app.dependency_overrides[get_comic_archive_service] = lambda: (
+        FakeArchiveService()
     )
 
     res = client.get(
@@ -588,8 +602,8 @@ def test_get_comic_page_archive_error_mapped_to_400(
     )
     monkeypatch.setattr(comic_routes, "BookPermissionHelper", FakePermissionHelper)
     monkeypatch.setattr(comic_routes, "_get_comic_file_path", lambda *_a, **_k: f)
-    monkeypatch.setattr(
-        comic_routes, "create_comic_archive_service", lambda: FakeArchiveService()
+    client.app.dependency_overrides[get_comic_archive_service] = lambda: (
+        FakeArchiveService()
     )
 
     res = client.get("/comic/1/pages/1", params={"file_format": "CBZ"})
@@ -613,3 +627,75 @@ def test_get_comic_page_book_not_found(
     res = client.get("/comic/1/pages/1", params={"file_format": "CBZ"})
     assert res.status_code == 404
     assert res.json()["detail"] == "book_not_found"
+
+
+@pytest.fixture
+def cached_comic(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    rgba_png_bytes: bytes,
+) -> Path:
+    """Serve a real CBZ through a service with a thumbnail cache."""
+    archive = tmp_path / "a.cbz"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for i in range(1, 4):
+            zf.writestr(f"p{i}.png", rgba_png_bytes)
+
+    class FakeBookService:
+        def get_book_full(self, _book_id: int) -> _BookWithRels:
+            return _BookWithRels(book=object())
+
+    class FakePermissionHelper:
+        def __init__(self, _session: object) -> None:
+            pass
+
+        def check_read_permission(self, _user: User, _book: object) -> None:
+            return None
+
+    monkeypatch.setattr(
+        comic_routes,
+        "_get_book_service",
+        lambda _s, _u=None, _lib=None: FakeBookService(),
+    )
+    monkeypatch.setattr(comic_routes, "BookPermissionHelper", FakePermissionHelper)
+    monkeypatch.setattr(comic_routes, "_get_comic_file_path", lambda *_a: archive)
+    service = create_comic_archive_service(
+        thumbnail_cache=ComicThumbnailCache(tmp_path / "thumbs")
+    )
+    client.app.dependency_overrides[get_comic_archive_service] = lambda: service
+    return archive
+
+
+@pytest.mark.usefixtures("cached_comic")
+def test_get_comic_page_thumbnail_cached_with_etag(client: TestClient) -> None:
+    res = client.get(
+        "/comic/1/pages/2/thumbnail", params={"file_format": "CBZ", "max_width": 50}
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("image/jpeg")
+    etag = res.headers["etag"]
+    with Image.open(BytesIO(res.content)) as img:
+        assert img.width == 100  # Narrower than the 120px bucket, not upscaled
+
+    res2 = client.get(
+        "/comic/1/pages/2/thumbnail",
+        params={"file_format": "CBZ", "max_width": 50},
+        headers={"If-None-Match": etag},
+    )
+    assert res2.status_code == 304
+
+
+@pytest.mark.usefixtures("cached_comic")
+def test_get_comic_thumbnail_sprite(client: TestClient) -> None:
+    res = client.get(
+        "/comic/1/thumbnails/sprite",
+        params={"file_format": "CBZ", "max_width": 120, "columns": 2},
+    )
+    assert res.status_code == 200
+    assert res.headers["x-sprite-pages"] == "3"
+    assert res.headers["x-sprite-rows"] == "2"
+    assert res.headers["x-sprite-cell-width"] == "100"
+    assert res.headers["x-sprite-cell-height"] == "80"
+    with Image.open(BytesIO(res.content)) as img:
+        assert img.size == (200, 160)
@@ -715,7 +715,11 @@ def test_get_kobo_cover_service(session: DummySession, mock_library: Library) ->
         mock_service_instance = MagicMock()
         mock_service_class.return_value = mock_service_instance
 
-        result = kobo_routes._get_kobo_cover_service(session, mock_book_service)  # type: ignore[arg-type]
+        result = kobo_routes._get_kobo_cover_service(
+            session,  # type: ignore[arg-type]
+            mock_book_service,
+            MagicMock(),
+        )
 
         assert result is not None
         assert result == mock_service_instance
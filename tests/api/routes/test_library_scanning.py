@@ -27,6 +27,7 @@ from fastapi import HTTPException, Request, status
 import bookcard.api.routes.library_scanning as library_scanning
 from bookcard.models.auth import User
 from bookcard.models.library_scanning import LibraryScanState
+from bookcard.models.tasks import TaskType
 
 if TYPE_CHECKING:
     from tests.conftest import DummySession
@@ -294,3 +295,45 @@ class TestGetScanState:
 
             assert result is not None
             assert result.last_scan_at is None
+
+
+class TestBackfillFileHashes:
+    """Test backfill_file_hashes endpoint."""
+
+    def test_enqueues_backfill_task(
+        self,
+        admin_user: User,
+        mock_request: Request,
+    ) -> None:
+        """Test backfill_file_hashes enqueues a backfill task for the library."""
+        mock_task_runner = MagicMock()
+        mock_request.app.state.task_runner = mock_task_runner
+        mock_task_runner.enqueue.return_value = 7
+
+        result = library_scanning.backfill_file_hashes(
+            request=library_scanning.FileHashBackfillRequest(library_id=2),
+            http_request=mock_request,
+            current_user=admin_user,
+        )
+
+        assert result.task_id == 7
+        call_kwargs = mock_task_runner.enqueue.call_args[1]
+        assert call_kwargs["task_type"] == TaskType.BOOK_FILE_HASH_BACKFILL
+        assert call_kwargs["metadata"]["library_id"] == 2
+
+    def test_no_task_runner(
+        self,
+        admin_user: User,
+        mock_request: Request,
+    ) -> None:
+        """Test backfill_file_hashes raises 503 without a task runner."""
+        mock_request.app.state.task_runner = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            library_scanning.backfill_file_hashes(
+                request=library_scanning.FileHashBackfillRequest(library_id=2),
+                http_request=mock_request,
+                current_user=admin_user,
+            )
+
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
@@ -31,13 +32,17 @@ from bookcard.models.auth import User
 from bookcard.models.config import Library
 from bookcard.models.core import Book
 from bookcard.repositories.models import BookWithRelations
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from tests.conftest import DummySession
 
 
+def _make_cover_request(path: str = "/opds/cover/1") -> Request:
+    """Create a request for an OPDS cover route."""
+    return Request({"type": "http", "method": "GET", "path": path, "headers": []})
+
+
 @pytest.fixture
 def opds_user() -> User:
     """Create a test OPDS user.
@@ -473,6 +478,43 @@ class TestFeedEndpoints:
                 return
 
 
+class TestFeedResponse:
+    """Test _feed_response helper."""
+
+    @staticmethod
+    def _request(headers: list[tuple[bytes, bytes]]) -> Request:
+        return Request({
+            "type": "http",
+            "method": "GET",
+            "path": "/opds/books",
+            "headers": headers,
+        })
+
+    def test_cached_feed_carries_validators(self) -> None:
+        """Test cached feeds are sent with ETag and Last-Modified."""
+        feed = OpdsFeedResponse(
+            xml_content="<feed></feed>", etag='"abc"', last_modified=0.0
+        )
+
+        response = opds_routes._feed_response(self._request([]), feed)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.body == b"<feed></feed>"
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["last-modified"] == "Thu, 01 Jan 1970 00:00:00 GMT"
+
+    def test_unchanged_feed_is_not_modified(self) -> None:
+        """Test a matching If-None-Match is answered with 304."""
+        feed = OpdsFeedResponse(xml_content="<feed></feed>", etag='"abc"')
+
+        response = opds_routes._feed_response(
+            self._request([(b"if-none-match", b'"abc"')]), feed
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.body == b""
+
+
 class TestFeedSearchPath:
     """Test feed_search_path endpoint."""
 
@@ -690,6 +732,9 @@ class TestOpdsCover:
         mock_book_with_rels.book = MagicMock(spec=Book)
         mock_book_with_rels.book.id = 1
         mock_book_with_rels.authors = ["Test Author"]
+        mock_book_with_rels.author_ids = [1]
+        mock_book_with_rels.series_id = None
+        mock_book_with_rels.tags = []
 
         mock_book_service = MagicMock()
         mock_book_service.get_book.return_value = mock_book_with_rels
@@ -699,14 +744,63 @@ class TestOpdsCover:
             mock_book_service_class.return_value = mock_book_service
 
             response = opds_routes.opds_cover(
+                request=_make_cover_request(),
                 session=session,
                 opds_user=opds_user,
                 book_id=1,
+                thumbnail_cache=CoverThumbnailCache(Path("/nonexistent/cache")),
                 library_id=None,
             )
 
             assert isinstance(response, FileResponse)
 
+    def test_cover_thumbnail_route_serves_resized_variant(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        session: DummySession,
+        opds_user: User,
+        mock_library: Library,
+        tmp_path: Path,
+    ) -> None:
+        """Test sized cover routes serve a cached thumbnail."""
+        from PIL import Image
+
+        _mock_permission_service(monkeypatch)
+        _mock_library_service(monkeypatch, library=mock_library)
+
+        cover_path = tmp_path / "cover.jpg"
+        Image.new("RGB", (600, 900), "blue").save(cover_path, format="JPEG")
+
+        mock_book_with_rels = MagicMock(spec=BookWithRelations)
+        mock_book_with_rels.book = MagicMock(spec=Book)
+        mock_book_with_rels.book.id = 1
+        mock_book_with_rels.authors = ["Test Author"]
+        mock_book_with_rels.author_ids = [1]
+        mock_book_with_rels.series_id = None
+        mock_book_with_rels.tags = []
+
+        mock_book_service = MagicMock()
+        mock_book_service.get_book.return_value = mock_book_with_rels
+        mock_book_service.get_thumbnail_path.return_value = cover_path
+
+        with patch("bookcard.api.routes.opds.BookService") as mock_book_service_class:
+            mock_book_service_class.return_value = mock_book_service
+
+            response = opds_routes.opds_cover(
+                request=_make_cover_request("/opds/thumb_240_240/1"),
+                session=session,
+                opds_user=opds_user,
+                book_id=1,
+                thumbnail_cache=CoverThumbnailCache(tmp_path / "cache"),
+                library_id=None,
+            )
+
+        assert isinstance(response, FileResponse)
+        assert response.path != str(cover_path)
+        assert "etag" in response.headers
+        with Image.open(response.path) as thumb:
+            assert max(thumb.size) <= 300
+
     def test_cover_no_library(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -719,9 +813,11 @@ class TestOpdsCover:
 
         with pytest.raises(HTTPException) as exc_info:
             opds_routes.opds_cover(
+                request=_make_cover_request(),
                 session=session,
                 opds_user=opds_user,
                 book_id=1,
+                thumbnail_cache=CoverThumbnailCache(Path("/nonexistent/cache")),
                 library_id=None,
             )
 
@@ -746,9 +842,11 @@ class TestOpdsCover:
             mock_book_service_class.return_value = mock_book_service
 
             response = opds_routes.opds_cover(
+                request=_make_cover_request(),
                 session=session,
                 opds_user=opds_user,
                 book_id=1,
+                thumbnail_cache=CoverThumbnailCache(Path("/nonexistent/cache")),
                 library_id=None,
             )
 
@@ -769,6 +867,9 @@ class TestOpdsCover:
         mock_book_with_rels.book = MagicMock(spec=Book)
         mock_book_with_rels.book.id = 1
         mock_book_with_rels.authors = ["Test Author"]
+        mock_book_with_rels.author_ids = [1]
+        mock_book_with_rels.series_id = None
+        mock_book_with_rels.tags = []
 
         mock_book_service = MagicMock()
         mock_book_service.get_book.return_value = mock_book_with_rels
@@ -778,9 +879,11 @@ class TestOpdsCover:
             mock_book_service_class.return_value = mock_book_service
 
             response = opds_routes.opds_cover(
+                request=_make_cover_request(),
                 session=session,
                 opds_user=opds_user,
                 book_id=1,
+                thumbnail_cache=CoverThumbnailCache(Path("/nonexistent/cache")),
                 library_id=None,
             )
 
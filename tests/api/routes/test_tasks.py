@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -28,6 +30,7 @@ import bookcard.api.routes.tasks as tasks
 from bookcard.models.auth import User
 from bookcard.models.tasks import Task, TaskStatistics, TaskStatus, TaskType
 from bookcard.services.messaging.redis_broker import RedisBroker
+from bookcard.services.tasks.events import TaskEvent, TaskEventBus
 
 if TYPE_CHECKING:
     from tests.conftest import DummySession
@@ -1090,3 +1093,57 @@ class TestGetTaskTypes:
 
         assert len(result.task_types) == len(list(TaskType))
         assert all(task_type in result.task_types for task_type in TaskType)
+
+
+class TestStreamTaskEvents:
+    """Test stream_task_events endpoint."""
+
+    @staticmethod
+    def _read_stream(response: object, count: int) -> list[str]:
+        async def read() -> list[str]:
+            iterator = response.body_iterator  # type: ignore[attr-defined]
+            chunks = [await anext(iterator) for _ in range(count)]
+            await iterator.aclose()
+            return chunks
+
+        return asyncio.run(read())
+
+    def test_stream_task_events_filters_by_user(
+        self,
+        session: DummySession,
+        regular_user: User,
+        mock_request: Request,
+        mock_permission_service: None,
+    ) -> None:
+        """Test regular users only receive events of their own tasks."""
+        bus = TaskEventBus()
+        mock_request.is_disconnected = MagicMock(  # type: ignore[method-assign]
+            side_effect=lambda: asyncio.sleep(0, result=False)
+        )
+
+        with patch("bookcard.api.routes.tasks.get_task_event_bus", return_value=bus):
+            response = tasks.stream_task_events(
+                request=mock_request,
+                session=session,
+                current_user=regular_user,
+            )
+        for user_id in (1, 2):
+            bus.publish(
+                TaskEvent(
+                    task_id=user_id,
+                    user_id=user_id,
+                    event_type="progress",
+                    status=TaskStatus.RUNNING,
+                    progress=0.5,
+                )
+            )
+
+        retry, event = self._read_stream(response, 2)
+
+        assert response.media_type == "text/event-stream"
+        assert retry == "retry: 2000\n\n"
+        header, data = event.strip().split("\n")
+        assert header == "event: progress"
+        assert json.loads(data.removeprefix("data: "))["task_id"] == 2
+        # Closing the stream unsubscribes from the bus
+        assert bus._subscriptions == []
@@ -221,6 +221,71 @@ class TestCreateRedisBroker:
             assert result is None
 
 
+class TestCreateTaskEventBus:
+    """Test create_task_event_bus method."""
+
+    def test_create_task_event_bus_uses_redis(
+        self, container: ServiceContainer
+    ) -> None:
+        """Test the bus relays events through Redis when Redis is enabled.
+
+        Parameters
+        ----------
+        container : ServiceContainer
+            Service container instance.
+        """
+        with patch(
+            "bookcard.api.services.container.configure_task_event_bus"
+        ) as mock_configure:
+            result = container.create_task_event_bus()
+
+            assert result == mock_configure.return_value
+            mock_configure.assert_called_once_with(container.config.redis_url)
+            mock_configure.return_value.start.assert_called_once()
+
+    def test_create_task_event_bus_redis_disabled(
+        self, test_config_no_redis: AppConfig, mock_engine: MagicMock
+    ) -> None:
+        """Test the bus stays in process when Redis is disabled.
+
+        Parameters
+        ----------
+        test_config_no_redis : AppConfig
+            Configuration with Redis disabled.
+        mock_engine : MagicMock
+            Mock database engine.
+        """
+        container = ServiceContainer(test_config_no_redis, mock_engine)
+        with patch(
+            "bookcard.api.services.container.configure_task_event_bus"
+        ) as mock_configure:
+            container.create_task_event_bus()
+
+            mock_configure.assert_called_once_with(None)
+
+    def test_create_task_event_bus_falls_back_in_process(
+        self, container: ServiceContainer
+    ) -> None:
+        """Test a failing Redis bus falls back to an in-process bus.
+
+        Parameters
+        ----------
+        container : ServiceContainer
+            Service container instance.
+        """
+        redis_bus = MagicMock()
+        redis_bus.start.side_effect = RuntimeError("Test error")
+        local_bus = MagicMock()
+        with patch(
+            "bookcard.api.services.container.configure_task_event_bus",
+            side_effect=[redis_bus, local_bus],
+        ) as mock_configure:
+            result = container.create_task_event_bus()
+
+            assert result == local_bus
+            assert mock_configure.call_args_list[-1].args == (None,)
+
+
 class TestCreateScanWorkerManager:
     """Test create_scan_worker_manager method."""
 
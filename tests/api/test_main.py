@@ -17,7 +17,7 @@
 
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -45,6 +45,7 @@ from bookcard.api.services.bootstrap import (
 from bookcard.api.services.container import ServiceContainer
 from bookcard.config import AppConfig
 from bookcard.database import create_db_engine
+from bookcard.repositories.engine_registry import EngineRegistryStats
 from bookcard.services.author_exceptions import NoActiveLibraryError
 from bookcard.services.ingest.exceptions import (
     IngestHistoryCreationError,
@@ -530,6 +531,21 @@ def test_app_endpoints_accessible() -> None:
     assert response.status_code in [200, 404]  # OpenAPI docs endpoint
 
 
+@pytest.fixture(autouse=True)
+def no_on_disk_caches() -> Iterator[None]:
+    """Keep service initialization from opening on-disk caches and indexes."""
+    with (
+        patch.object(ServiceContainer, "create_provider_http_pool", return_value=None),
+        patch.object(ServiceContainer, "create_book_search_indexes", return_value=None),
+        patch.object(
+            ServiceContainer, "create_library_change_monitor", return_value=None
+        ),
+        patch.object(ServiceContainer, "create_principal_cache", return_value=None),
+        patch.object(ServiceContainer, "create_task_event_bus", return_value=None),
+    ):
+        yield
+
+
 @pytest.fixture
 def test_config() -> AppConfig:
     """Create a test AppConfig instance.
@@ -1072,6 +1088,27 @@ def test_stop_background_services_scan_workers_exception(
     mock_manager.stop_workers.assert_called_once()
 
 
+def test_stop_background_services_disposes_calibre_engines(
+    fastapi_app: FastAPI,
+) -> None:
+    """Test shutdown closes the shared Calibre engines.
+
+    Parameters
+    ----------
+    fastapi_app : FastAPI
+        FastAPI application instance fixture.
+    """
+    fastapi_app.state.task_runner = None
+    registry = MagicMock()
+    registry.stats.return_value = EngineRegistryStats(engine_hits=3, engine_misses=1)
+    with patch(
+        "bookcard.api.services.bootstrap.get_calibre_engine_registry",
+        return_value=registry,
+    ):
+        stop_background_services(fastapi_app)
+    registry.dispose_all.assert_called_once()
+
+
 def test_initialize_ingest_watcher_redis_disabled(
     fastapi_app: FastAPI, mock_engine: MagicMock, test_config: AppConfig
 ) -> None:
@@ -0,0 +1,48 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for environment variable helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from bookcard.common.env import env_flag
+
+
+@pytest.mark.parametrize(
+    ("value", "default", "expected"),
+    [
+        (None, True, True),
+        (None, False, False),
+        (" Yes ", False, True),
+        ("on", False, True),
+        ("0", True, False),
+        ("maybe", True, False),
+    ],
+)
+def test_env_flag(
+    monkeypatch: pytest.MonkeyPatch,
+    value: str | None,
+    default: bool,
+    expected: bool,
+) -> None:
+    """Test flags fall back to the default only when unset."""
+    if value is None:
+        monkeypatch.delenv("BOOKCARD_TEST_FLAG", raising=False)
+    else:
+        monkeypatch.setenv("BOOKCARD_TEST_FLAG", value)
+
+    assert env_flag("BOOKCARD_TEST_FLAG", default) is expected
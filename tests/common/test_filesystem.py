@@ -0,0 +1,177 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for file transfer utilities."""
+
+from __future__ import annotations
+
+import errno
+import os
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from bookcard.common import filesystem
+from bookcard.common.filesystem import (
+    TransferMode,
+    same_filesystem,
+    transfer_file,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """Create a source file."""
+    path = tmp_path / "book.epub"
+    path.write_bytes(b"book content")
+    return path
+
+
+def test_hardlink_shares_data(source: Path, tmp_path: Path) -> None:
+    """Test hardlink mode links files on the same filesystem."""
+    dest = tmp_path / "linked.epub"
+
+    assert transfer_file(source, dest, TransferMode.HARDLINK) == TransferMode.HARDLINK
+    assert dest.stat().st_ino == source.stat().st_ino
+
+
+def test_hardlink_falls_back_to_clone_then_copy(source: Path, tmp_path: Path) -> None:
+    """Test unsupported hardlinks and clones degrade to a plain copy."""
+    dest = tmp_path / "copied.epub"
+    unsupported = OSError(errno.EXDEV, "cross-device link")
+
+    with (
+        patch.object(filesystem.os, "link", side_effect=unsupported),
+        patch.object(filesystem, "_clone_file", return_value=None) as clone,
+    ):
+        used = transfer_file(source, dest, TransferMode.HARDLINK)
+
+    assert used == TransferMode.COPY
+    clone.assert_called_once_with(source, dest)
+    assert dest.read_bytes() == b"book content"
+    assert dest.stat().st_ino != source.stat().st_ino
+
+
+def test_reflink_creates_independent_file(source: Path, tmp_path: Path) -> None:
+    """Test reflink mode never shares the inode with the source."""
+    dest = tmp_path / "clone.epub"
+
+    used = transfer_file(source, dest, TransferMode.REFLINK)
+
+    assert used in (TransferMode.REFLINK, TransferMode.COPY)
+    assert dest.read_bytes() == b"book content"
+    assert dest.stat().st_ino != source.stat().st_ino
+    assert dest.stat().st_mtime == pytest.approx(source.stat().st_mtime)
+
+
+def test_move_removes_source(source: Path, tmp_path: Path) -> None:
+    """Test move mode renames the source."""
+    dest = tmp_path / "moved.epub"
+
+    assert transfer_file(source, dest, TransferMode.MOVE) == TransferMode.MOVE
+    assert not source.exists()
+    assert dest.read_bytes() == b"book content"
+
+
+def test_existing_destination_is_replaced_not_written_through(
+    source: Path, tmp_path: Path
+) -> None:
+    """Test replacing a file leaves other links of the old file untouched."""
+    dest = tmp_path / "library.epub"
+    other_link = tmp_path / "seeding.epub"
+    other_link.write_bytes(b"seeding content")
+    os.link(other_link, dest)
+
+    transfer_file(source, dest, TransferMode.COPY)
+
+    assert dest.read_bytes() == b"book content"
+    assert other_link.read_bytes() == b"seeding content"
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_concurrent_replacements_do_not_share_temp_files(tmp_path: Path) -> None:
+    """Test threads replacing the same destination stage to distinct files."""
+    dest = tmp_path / "library.epub"
+    dest.write_bytes(b"old content")
+    sources = []
+    for i in range(8):
+        path = tmp_path / f"source{i}.epub"
+        path.write_bytes(f"content {i}".encode() * 10_000)
+        sources.append(path)
+    errors: list[BaseException] = []
+
+    def replace(path: Path) -> None:
+        try:
+            transfer_file(path, dest, TransferMode.COPY)
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=replace, args=(p,)) for p in sources]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert dest.read_bytes() in {p.read_bytes() for p in sources}
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_transfer_mode_defaults_to_copy(source: Path, tmp_path: Path) -> None:
+    """Test files are copied unless a mode is passed."""
+    dest = tmp_path / "copy.epub"
+
+    assert transfer_file(source, dest) == TransferMode.COPY
+    assert dest.stat().st_ino != source.stat().st_ino
+
+
+@pytest.mark.skipif(filesystem.fcntl is None, reason="requires fcntl")
+def test_clone_keeps_existing_destination(source: Path, tmp_path: Path) -> None:
+    """Test a clone onto a path that already exists does not remove it."""
+    dest = tmp_path / "existing.epub"
+    dest.write_bytes(b"existing content")
+
+    with pytest.raises(FileExistsError):
+        filesystem._clone_file(source, dest)
+
+    assert dest.read_bytes() == b"existing content"
+
+
+@pytest.mark.skipif(
+    filesystem.fcntl is None or not hasattr(os, "copy_file_range"),
+    reason="requires fcntl and copy_file_range",
+)
+def test_clone_reports_copy_when_ficlone_is_unsupported(
+    source: Path, tmp_path: Path
+) -> None:
+    """Test a copy_file_range fallback is reported as a copy, not a reflink."""
+    dest = tmp_path / "clone.epub"
+    unsupported = OSError(errno.EOPNOTSUPP, "not supported")
+
+    with patch.object(filesystem.fcntl, "ioctl", side_effect=unsupported):
+        used = transfer_file(source, dest, TransferMode.REFLINK)
+
+    assert used == TransferMode.COPY
+    assert dest.read_bytes() == b"book content"
+
+
+def test_same_filesystem_checks_nearest_existing_parent(tmp_path: Path) -> None:
+    """Test a destination that does not exist yet is resolved upwards."""
+    assert same_filesystem(tmp_path, tmp_path / "missing" / "dir")
@@ -0,0 +1,203 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the pooled provider HTTP clients."""
+
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from bookcard.metadata.http.pool import ProviderHttpPool
+from bookcard.metadata.http.rate_limiter import RateLimiter
+from bookcard.metadata.http.response_cache import ResponseCache
+from bookcard.metadata.http.transport import ProviderTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class CountingServer:
+    """Mock server recording the requests that reach the network."""
+
+    def __init__(
+        self, status_code: int = 200, headers: dict[str, str] | None = None
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(
+            self.status_code,
+            headers={"content-type": "application/json", **self.headers},
+            json={"path": request.url.path, "n": len(self.requests)},
+        )
+
+
+@pytest.fixture
+def server() -> CountingServer:
+    """Create a mock server answering 200."""
+    return CountingServer()
+
+
+@pytest.fixture
+def pool(server: CountingServer) -> Iterator[ProviderHttpPool]:
+    """Create a pool over the mock server."""
+    provider_pool = ProviderHttpPool(transport=httpx.MockTransport(server))
+    yield provider_pool
+    provider_pool.close()
+
+
+def test_client_is_reused_per_provider(pool: ProviderHttpPool) -> None:
+    """Test each provider gets one long-lived client."""
+    first = pool.client("google", headers={"User-Agent": "bookcard"})
+
+    assert pool.client("google") is first
+    assert pool.client("openlibrary") is not first
+    assert first.headers["User-Agent"] == "bookcard"
+
+
+def test_repeated_get_is_served_from_cache(
+    pool: ProviderHttpPool, server: CountingServer
+) -> None:
+    """Test an identical lookup does not reach the network again."""
+    client = pool.client("google")
+
+    first = client.get("https://example.com/books", params={"q": "dune", "p": 1})
+    second = client.get("https://example.com/books", params={"p": 1, "q": "dune"})
+
+    assert len(server.requests) == 1
+    assert second.json() == first.json()
+    assert second.extensions.get("from_cache") is True
+
+
+def test_cache_is_shared_between_providers(
+    pool: ProviderHttpPool, server: CountingServer
+) -> None:
+    """Test providers hitting the same URL share cached responses."""
+    pool.client("a").get("https://example.com/isbn/123")
+    pool.client("b").get("https://example.com/isbn/123")
+
+    assert len(server.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "server",
+    [
+        CountingServer(status_code=404),
+        CountingServer(headers={"Cache-Control": "no-store"}),
+    ],
+    ids=["not-found", "no-store"],
+)
+def test_uncacheable_responses_are_refetched(
+    pool: ProviderHttpPool, server: CountingServer
+) -> None:
+    """Test errors and no-store responses always reach the network."""
+    client = pool.client("google")
+
+    client.get("https://example.com/books")
+    client.get("https://example.com/books")
+
+    assert len(server.requests) == 2
+
+
+def test_post_is_not_cached(pool: ProviderHttpPool, server: CountingServer) -> None:
+    """Test only GET requests are cached."""
+    client = pool.client("google")
+
+    client.post("https://example.com/search", json={"q": "dune"})
+    client.post("https://example.com/search", json={"q": "dune"})
+
+    assert len(server.requests) == 2
+
+
+def test_zero_ttl_disables_cache(
+    pool: ProviderHttpPool, server: CountingServer
+) -> None:
+    """Test providers can opt out of caching."""
+    client = pool.client("live", cache_ttl=0)
+
+    client.get("https://example.com/books")
+    client.get("https://example.com/books")
+
+    assert len(server.requests) == 2
+
+
+def test_cached_body_is_stored_decoded() -> None:
+    """Test compressed responses replay without their wire encoding."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"content-encoding": "gzip"},
+            content=gzip.compress(b"payload"),
+        )
+
+    cache = ResponseCache(":memory:")
+    client = httpx.Client(
+        transport=ProviderTransport(
+            httpx.MockTransport(handler), cache=cache, cache_ttl=60
+        )
+    )
+
+    assert client.get("https://example.com/").content == b"payload"
+    cached = client.get("https://example.com/")
+    assert cached.content == b"payload"
+    assert "content-encoding" not in cached.headers
+    client.close()
+    cache.close()
+
+
+def test_cache_hits_are_not_rate_limited(server: CountingServer) -> None:
+    """Test only network requests consume rate limit tokens."""
+    waits: list[float] = []
+    limiter = RateLimiter(1.0, burst=1, clock=lambda: 0.0, sleep=waits.append)
+    cache = ResponseCache(":memory:")
+    client = httpx.Client(
+        transport=ProviderTransport(
+            httpx.MockTransport(server),
+            rate_limiter=limiter,
+            cache=cache,
+            cache_ttl=60,
+        )
+    )
+
+    for _ in range(3):
+        client.get("https://example.com/same")
+    client.get("https://example.com/other")
+
+    assert len(server.requests) == 2
+    assert waits == [1.0]
+    client.close()
+    cache.close()
+
+
+def test_closing_provider_client_keeps_shared_transport_open(
+    server: CountingServer,
+) -> None:
+    """Test a provider client cannot close the pool's shared transport."""
+    inner = httpx.MockTransport(server)
+    closed: list[bool] = []
+    inner.close = lambda: closed.append(True)  # type: ignore[method-assign]
+    client = httpx.Client(transport=ProviderTransport(inner))
+
+    client.close()
+
+    assert closed == []
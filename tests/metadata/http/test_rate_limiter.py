@@ -0,0 +1,77 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the provider rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from bookcard.metadata.http.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep advances time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_burst_is_served_without_waiting() -> None:
+    """Test requests up to the burst size do not wait."""
+    clock = FakeClock()
+    limiter = RateLimiter(2.0, burst=3, clock=clock, sleep=clock.sleep)
+
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert clock.sleeps == []
+
+
+def test_waits_once_bucket_is_empty() -> None:
+    """Test requests beyond the burst are spaced at the configured rate."""
+    clock = FakeClock()
+    limiter = RateLimiter(2.0, burst=1, clock=clock, sleep=clock.sleep)
+
+    limiter.acquire()
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_tokens_refill_over_time() -> None:
+    """Test idle time refills the bucket up to its capacity."""
+    clock = FakeClock()
+    limiter = RateLimiter(1.0, burst=2, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 10.0
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(1.0)
+
+
+def test_rejects_non_positive_rate() -> None:
+    """Test a zero rate is rejected."""
+    with pytest.raises(ValueError, match="positive"):
+        RateLimiter(0)
@@ -0,0 +1,133 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the provider response cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from bookcard.metadata.http.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ResponseCache]:
+    """Create an on-disk response cache."""
+    response_cache = ResponseCache(tmp_path / "cache" / "http.sqlite", max_bytes=100)
+    yield response_cache
+    response_cache.close()
+
+
+def _response(content: bytes) -> CachedResponse:
+    return CachedResponse(
+        status_code=200,
+        headers=[("content-type", "application/json")],
+        content=content,
+    )
+
+
+def test_cache_key_normalizes_query_order() -> None:
+    """Test query parameter order does not change the key."""
+    first = httpx.Request("GET", "https://Example.com/search?q=dune&page=1")
+    second = httpx.Request("GET", "https://example.com/search?page=1&q=dune")
+
+    assert cache_key(first) == cache_key(second)
+
+
+def test_cache_key_varies_by_method_and_language() -> None:
+    """Test method and Accept-Language select different entries."""
+    url = "https://example.com/search?q=dune"
+    base = cache_key(httpx.Request("GET", url))
+
+    assert cache_key(httpx.Request("HEAD", url)) != base
+    assert (
+        cache_key(httpx.Request("GET", url, headers={"Accept-Language": "de"})) != base
+    )
+
+
+def test_put_and_get_round_trip(cache: ResponseCache) -> None:
+    """Test a stored response is returned unchanged."""
+    cache.put("k", _response(b"hello"), ttl=60)
+
+    assert cache.get("k") == _response(b"hello")
+    assert cache.total_bytes() == 5
+
+
+def test_persists_across_instances(tmp_path: Path) -> None:
+    """Test entries survive reopening the database."""
+    path = tmp_path / "http.sqlite"
+    first = ResponseCache(path)
+    first.put("k", _response(b"hello"), ttl=60)
+    first.close()
+
+    second = ResponseCache(path)
+    try:
+        assert second.get("k") == _response(b"hello")
+    finally:
+        second.close()
+
+
+def test_expired_entries_are_dropped(
+    cache: ResponseCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test entries are not served after their TTL."""
+    now = 1000.0
+    monkeypatch.setattr("bookcard.metadata.http.response_cache.time.time", lambda: now)
+    cache.put("k", _response(b"hello"), ttl=10)
+
+    now = 1011.0
+
+    assert cache.get("k") is None
+    assert cache.total_bytes() == 0
+
+
+def test_evicts_least_recently_used(
+    cache: ResponseCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the size limit evicts the least recently used entries first."""
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(
+        "bookcard.metadata.http.response_cache.time.time", lambda: next(clock)
+    )
+    cache.put("a", _response(b"a" * 40), ttl=600)
+    cache.put("b", _response(b"b" * 40), ttl=600)
+    assert cache.get("a") is not None
+
+    cache.put("c", _response(b"c" * 40), ttl=600)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.total_bytes() == 80
+
+
+def test_skips_oversized_and_zero_ttl(cache: ResponseCache) -> None:
+    """Test bodies larger than the cache and zero TTLs are not stored."""
+    cache.put("big", _response(b"x" * 101), ttl=60)
+    cache.put("now", _response(b"x"), ttl=0)
+
+    assert cache.get("big") is None
+    assert cache.get("now") is None
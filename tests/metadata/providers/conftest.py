@@ -16,10 +16,14 @@
 """Shared fixtures for metadata provider tests."""
 
 import datetime
+from collections.abc import Iterator
 
+import httpx
 import pytest
 from lxml import etree  # type: ignore[attr-defined]
 
+from bookcard.metadata.http import pool as http_pool
+from bookcard.metadata.http.pool import ProviderHttpPool
 from bookcard.metadata.providers.dnb._cover_validator import CoverValidator
 from bookcard.metadata.providers.dnb._marc21_parser import MARC21Parser
 from bookcard.metadata.providers.dnb._query_builder import SRUQueryBuilder
@@ -27,6 +31,20 @@ from bookcard.metadata.providers.dnb._text_cleaner import TextCleaner
 from bookcard.metadata.providers.dnb_provider import DNBProvider
 
 
+def _refuse_network(request: httpx.Request) -> httpx.Response:
+    msg = f"Network access in tests: {request.url}"
+    raise httpx.ConnectError(msg, request=request)
+
+
+@pytest.fixture(autouse=True)
+def offline_provider_http_pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Install a provider HTTP pool that refuses to reach the network."""
+    pool = ProviderHttpPool(transport=httpx.MockTransport(_refuse_network))
+    monkeypatch.setattr(http_pool, "_pool", pool)
+    yield
+    pool.close()
+
+
 @pytest.fixture
 def dnb_provider() -> DNBProvider:
     """Create a DNBProvider instance for testing."""
@@ -79,7 +79,7 @@ def test_amazon_provider_search_no_results(amazon_provider: AmazonProvider) -> N
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(AmazonProvider, "get_http_client", return_value=mock_client):
         results = amazon_provider.search("test query")
         assert results == []
 
@@ -127,7 +127,7 @@ def test_amazon_provider_search_success(amazon_provider: AmazonProvider) -> None
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(AmazonProvider, "get_http_client", return_value=mock_client):
         results = amazon_provider.search("test query", max_results=1)
         assert len(results) == 1
         assert results[0].title == "Test Book"
@@ -142,7 +142,7 @@ def test_amazon_provider_search_timeout(amazon_provider: AmazonProvider) -> None
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(AmazonProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         amazon_provider.search("test query")
@@ -158,7 +158,7 @@ def test_amazon_provider_search_network_error(amazon_provider: AmazonProvider) -
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(AmazonProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderNetworkError),
     ):
         amazon_provider.search("test query")
@@ -176,7 +176,7 @@ def test_amazon_provider_search_parse_error(amazon_provider: AmazonProvider) ->
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(AmazonProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderParseError),
     ):
         amazon_provider.search("test query")
@@ -672,7 +672,7 @@ def test_amazon_provider_search_max_results(amazon_provider: AmazonProvider) ->
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(AmazonProvider, "get_http_client", return_value=mock_client):
         results = amazon_provider.search("test query", max_results=2)
         assert len(results) == 2
 
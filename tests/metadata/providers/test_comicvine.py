@@ -117,7 +117,7 @@ def test_comicvine_provider_search_success(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(ComicVineProvider, "get_http_client", return_value=mock_client):
         results = comicvine_provider.search("test query", max_results=10)
         assert len(results) == 1
         assert results[0].title == "Test Series#1 - Issue #1"
@@ -134,7 +134,7 @@ def test_comicvine_provider_search_timeout(
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(ComicVineProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         comicvine_provider.search("test query")
@@ -150,7 +150,7 @@ def test_comicvine_provider_search_network_error(
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(ComicVineProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderNetworkError),
     ):
         comicvine_provider.search("test query")
@@ -170,7 +170,7 @@ def test_comicvine_provider_search_parse_error(
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(ComicVineProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderParseError),
     ):
         comicvine_provider.search("test query")
@@ -491,7 +491,7 @@ def test_comicvine_provider_search_parse_error_in_result(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(ComicVineProvider, "get_http_client", return_value=mock_client):
         results = comicvine_provider.search("test query", max_results=10)
         # Should return only valid results
         assert len(results) == 1
@@ -515,7 +515,7 @@ def test_comicvine_provider_search_max_results(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(ComicVineProvider, "get_http_client", return_value=mock_client):
         results = comicvine_provider.search("test query", max_results=5)
         assert len(results) == 5
 
@@ -554,7 +554,7 @@ def test_comicvine_provider_search_empty_tokens_after_processing(
 
     # Mock _get_title_tokens to return empty list
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(ComicVineProvider, "get_http_client", return_value=mock_client),
         patch.object(comicvine_provider, "_get_title_tokens", return_value=[]),
     ):
         result = comicvine_provider.search("test query")
@@ -600,7 +600,7 @@ def test_comicvine_provider_search_parse_result_exception(
         return original_parse(result)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(ComicVineProvider, "get_http_client", return_value=mock_client),
         patch.object(
             comicvine_provider, "_parse_search_result", side_effect=failing_parse
         ),
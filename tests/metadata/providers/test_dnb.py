@@ -87,7 +87,11 @@ def test_dnb_provider_search_success(dnb_provider: DNBProvider) -> None:
     mock_response.content = sample_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        DNBProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = dnb_provider.search("test query", max_results=10)
 
         assert len(results) >= 0  # May be 0 if parsing fails, but no exception
@@ -105,7 +109,11 @@ def test_dnb_provider_search_no_results(dnb_provider: DNBProvider) -> None:
     mock_response.content = sample_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        DNBProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = dnb_provider.search("test query")
         assert results == []
 
@@ -113,7 +121,13 @@ def test_dnb_provider_search_no_results(dnb_provider: DNBProvider) -> None:
 def test_dnb_provider_search_timeout(dnb_provider: DNBProvider) -> None:
     """Test search raises TimeoutError."""
     with (
-        patch("httpx.get", side_effect=httpx.TimeoutException("Timeout")),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.TimeoutException("Timeout")
+            }),
+        ),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         dnb_provider.search("test query")
@@ -122,7 +136,13 @@ def test_dnb_provider_search_timeout(dnb_provider: DNBProvider) -> None:
 def test_dnb_provider_search_network_error(dnb_provider: DNBProvider) -> None:
     """Test search raises NetworkError."""
     with (
-        patch("httpx.get", side_effect=httpx.RequestError("Network error")),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.RequestError("Network error")
+            }),
+        ),
         pytest.raises(MetadataProviderNetworkError),
     ):
         dnb_provider.search("test query")
@@ -150,7 +170,11 @@ def test_dnb_provider_search_parse_error(dnb_provider: DNBProvider) -> None:
     mock_response.raise_for_status = MagicMock()
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         pytest.raises(MetadataProviderParseError),
     ):
         dnb_provider.search("test query")
@@ -174,7 +198,13 @@ def test_dnb_provider_search_xml_syntax_error_in_search(
 def test_dnb_provider_search_timeout_exception(dnb_provider: DNBProvider) -> None:
     """Test search raises TimeoutError on timeout."""
     with (
-        patch("httpx.get", side_effect=httpx.TimeoutException("Timeout")),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.TimeoutException("Timeout")
+            }),
+        ),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         dnb_provider.search("test query")
@@ -199,7 +229,13 @@ def test_dnb_provider_search_timeout_exception_in_search(
 def test_dnb_provider_search_request_error(dnb_provider: DNBProvider) -> None:
     """Test search raises NetworkError on request error."""
     with (
-        patch("httpx.get", side_effect=httpx.RequestError("Network error")),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.RequestError("Network error")
+            }),
+        ),
         pytest.raises(MetadataProviderNetworkError),
     ):
         dnb_provider.search("test query")
@@ -231,7 +267,11 @@ def test_dnb_provider_search_xml_syntax_error(dnb_provider: DNBProvider) -> None
 
     # XMLSyntaxError requires more arguments
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         patch(
             "bookcard.metadata.providers.dnb_provider.etree.XML",
             side_effect=etree.XMLSyntaxError("Invalid XML", "file", 1, 1, "error"),
@@ -354,7 +394,11 @@ def test_dnb_provider_execute_sru_query_success(
     mock_response.content = sample_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        DNBProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         records = dnb_provider._execute_sru_query('tit="Test Book"')
         assert isinstance(records, list)
 
@@ -371,7 +415,11 @@ def test_dnb_provider_execute_sru_query_empty(dnb_provider: DNBProvider) -> None
     mock_response.content = sample_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        DNBProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         records = dnb_provider._execute_sru_query('tit="No Results"')
         assert records == []
 
@@ -379,7 +427,13 @@ def test_dnb_provider_execute_sru_query_empty(dnb_provider: DNBProvider) -> None
 def test_dnb_provider_execute_sru_query_timeout(dnb_provider: DNBProvider) -> None:
     """Test SRU query execution raises TimeoutError."""
     with (
-        patch("httpx.get", side_effect=httpx.TimeoutException("Timeout")),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.TimeoutException("Timeout")
+            }),
+        ),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         dnb_provider._execute_sru_query('tit="Test"')
@@ -390,7 +444,13 @@ def test_dnb_provider_execute_sru_query_network_error(
 ) -> None:
     """Test SRU query execution raises NetworkError."""
     with (
-        patch("httpx.get", side_effect=httpx.RequestError("Network error")),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.RequestError("Network error")
+            }),
+        ),
         pytest.raises(MetadataProviderNetworkError),
     ):
         dnb_provider._execute_sru_query('tit="Test"')
@@ -403,7 +463,11 @@ def test_dnb_provider_execute_sru_query_parse_error(dnb_provider: DNBProvider) -
     mock_response.raise_for_status = MagicMock()
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         pytest.raises(MetadataProviderParseError),
     ):
         dnb_provider._execute_sru_query('tit="Test"')
@@ -619,7 +683,11 @@ def test_dnb_provider_execute_queries_and_parse_success(
     mock_response.content = sample_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        DNBProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         queries = ['tit="Test Book"', 'tit="Other Query"']
         records = dnb_provider._execute_queries_and_parse(queries)
         # Should stop after first successful query
@@ -651,7 +719,11 @@ def test_dnb_provider_execute_queries_and_parse_with_exception(
     mock_response.raise_for_status = MagicMock()
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            DNBProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         patch.object(
             dnb_provider._parser,
             "parse",
@@ -119,7 +119,7 @@ def test_douban_provider_search_success(douban_provider: DoubanProvider) -> None
         patch.object(
             douban_provider, "_get_book_id_list_from_html", return_value=["12345"]
         ),
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(DoubanProvider, "get_http_client", return_value=mock_client),
     ):
         results = douban_provider.search("test query", max_results=1)
         assert len(results) == 1
@@ -203,7 +203,7 @@ def test_douban_provider_get_book_id_list_from_html_success(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(DoubanProvider, "get_http_client", return_value=mock_client):
         book_ids = douban_provider._get_book_id_list_from_html("test")
         assert "12345" in book_ids
         assert "67890" in book_ids
@@ -220,7 +220,7 @@ def test_douban_provider_get_book_id_list_from_html_error(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(DoubanProvider, "get_http_client", return_value=mock_client):
         book_ids = douban_provider._get_book_id_list_from_html("test")
         assert book_ids == []
 
@@ -684,7 +684,7 @@ def test_douban_provider_search_max_results(douban_provider: DoubanProvider) ->
         patch.object(
             douban_provider, "_get_book_id_list_from_html", return_value=["1", "2", "3"]
         ),
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(DoubanProvider, "get_http_client", return_value=mock_client),
     ):
         results = douban_provider.search("test query", max_results=2)
         assert len(results) == 2
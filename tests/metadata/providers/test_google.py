@@ -90,7 +90,11 @@ def test_google_provider_search_success(google_provider: GoogleBooksProvider) ->
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        GoogleBooksProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = google_provider.search("test query", max_results=10)
 
         assert len(results) == 1
@@ -101,7 +105,13 @@ def test_google_provider_search_success(google_provider: GoogleBooksProvider) ->
 def test_google_provider_search_timeout(google_provider: GoogleBooksProvider) -> None:
     """Test search raises TimeoutError (covers lines 163-165)."""
     with (
-        patch("httpx.get", side_effect=httpx.TimeoutException("Timeout")),
+        patch.object(
+            GoogleBooksProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.TimeoutException("Timeout")
+            }),
+        ),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         google_provider.search("test query")
@@ -112,7 +122,13 @@ def test_google_provider_search_network_error(
 ) -> None:
     """Test search raises NetworkError (covers lines 166-168)."""
     with (
-        patch("httpx.get", side_effect=httpx.RequestError("Network error")),
+        patch.object(
+            GoogleBooksProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.RequestError("Network error")
+            }),
+        ),
         pytest.raises(MetadataProviderNetworkError),
     ):
         google_provider.search("test query")
@@ -127,7 +143,11 @@ def test_google_provider_search_parse_error(
     mock_response.raise_for_status = MagicMock()
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            GoogleBooksProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         pytest.raises(MetadataProviderParseError),
     ):
         google_provider.search("test query")
@@ -359,7 +379,9 @@ def test_google_provider_search_max_results_limit(
     mock_response.json.return_value = {"items": []}
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
+    with patch.object(GoogleBooksProvider, "get_http_client") as mock_http_client:
+        mock_http_client.return_value.get.return_value = mock_response
+        mock_get = mock_http_client.return_value.get
         google_provider.search("test", max_results=100)  # Request more than API limit
 
         # Verify maxResults is capped at 40
@@ -381,7 +403,11 @@ def test_google_provider_search_parse_item_error(
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        GoogleBooksProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = google_provider.search("test query")
 
         # Should return only valid items
@@ -416,7 +442,11 @@ def test_google_provider_search_parse_item_exception(
         return original_parse(item)
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            GoogleBooksProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         patch.object(
             google_provider, "_parse_item", side_effect=parse_item_side_effect
         ),
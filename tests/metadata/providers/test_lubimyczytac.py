@@ -93,7 +93,9 @@ def test_lubimyczytac_provider_search_no_results(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(
+        LubimyCzytacProvider, "get_http_client", return_value=mock_client
+    ):
         results = lubimyczytac_provider.search("test query")
         assert results == []
 
@@ -156,7 +158,9 @@ def test_lubimyczytac_provider_search_success(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(
+        LubimyCzytacProvider, "get_http_client", return_value=mock_client
+    ):
         results = lubimyczytac_provider.search("test query", max_results=1)
         assert len(results) == 1
         assert results[0].title == "Test Book"
@@ -172,7 +176,7 @@ def test_lubimyczytac_provider_search_timeout(
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(LubimyCzytacProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         lubimyczytac_provider.search("test query")
@@ -190,7 +194,7 @@ def test_lubimyczytac_provider_search_network_error(
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(LubimyCzytacProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderNetworkError),
     ):
         lubimyczytac_provider.search("test query")
@@ -210,7 +214,7 @@ def test_lubimyczytac_provider_search_parse_error(
     mock_client.__exit__ = MagicMock(return_value=False)
 
     with (
-        patch("httpx.Client", return_value=mock_client),
+        patch.object(LubimyCzytacProvider, "get_http_client", return_value=mock_client),
         pytest.raises(MetadataProviderParseError),
     ):
         lubimyczytac_provider.search("test query")
@@ -964,7 +968,9 @@ def test_lubimyczytac_provider_search_max_results(
     mock_client.__enter__ = MagicMock(return_value=mock_client)
     mock_client.__exit__ = MagicMock(return_value=False)
 
-    with patch("httpx.Client", return_value=mock_client):
+    with patch.object(
+        LubimyCzytacProvider, "get_http_client", return_value=mock_client
+    ):
         results = lubimyczytac_provider.search("test query", max_results=2)
         assert len(results) == 2
 
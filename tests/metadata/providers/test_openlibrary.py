@@ -137,7 +137,11 @@ def test_openlibrary_provider_search_success(
     mock_response.json.return_value = mock_search_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        OpenLibraryProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = openlibrary_provider.search("test query", max_results=10)
 
         assert len(results) == 1
@@ -160,7 +164,13 @@ def test_openlibrary_provider_search_timeout(
 ) -> None:
     """Test search raises TimeoutError (covers lines 156-158)."""
     with (
-        patch("httpx.get", side_effect=httpx.TimeoutException("Timeout")),
+        patch.object(
+            OpenLibraryProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.TimeoutException("Timeout")
+            }),
+        ),
         pytest.raises(MetadataProviderTimeoutError),
     ):
         openlibrary_provider.search("test query")
@@ -171,7 +181,13 @@ def test_openlibrary_provider_search_network_error(
 ) -> None:
     """Test search raises NetworkError (covers lines 159-161)."""
     with (
-        patch("httpx.get", side_effect=httpx.RequestError("Network error")),
+        patch.object(
+            OpenLibraryProvider,
+            "get_http_client",
+            return_value=MagicMock(**{
+                "get.side_effect": httpx.RequestError("Network error")
+            }),
+        ),
         pytest.raises(MetadataProviderNetworkError),
     ):
         openlibrary_provider.search("test query")
@@ -186,7 +202,11 @@ def test_openlibrary_provider_search_parse_error(
     mock_response.raise_for_status = MagicMock()
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            OpenLibraryProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         pytest.raises(MetadataProviderParseError),
     ):
         openlibrary_provider.search("test query")
@@ -203,7 +223,11 @@ def test_openlibrary_provider_search_parse_error_keyerror(
     mock_response.json.side_effect = KeyError("Missing key")
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            OpenLibraryProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         pytest.raises(MetadataProviderParseError),
     ):
         openlibrary_provider.search("test query")
@@ -218,7 +242,9 @@ def test_openlibrary_provider_search_max_results_limit(
     mock_response.json.return_value = mock_search_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response) as mock_get:
+    with patch.object(OpenLibraryProvider, "get_http_client") as mock_http_client:
+        mock_http_client.return_value.get.return_value = mock_response
+        mock_get = mock_http_client.return_value.get
         openlibrary_provider.search(
             "test", max_results=200
         )  # Request more than API limit
@@ -239,7 +265,11 @@ def test_openlibrary_provider_search_limits_results(
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        OpenLibraryProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = openlibrary_provider.search("test", max_results=5)
         assert len(results) == 5
 
@@ -451,7 +481,11 @@ def test_openlibrary_provider_search_parse_doc_error(
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        OpenLibraryProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = openlibrary_provider.search("test query")
 
         # Should return only valid items
@@ -483,7 +517,11 @@ def test_openlibrary_provider_search_parse_doc_exception(
         return original_parse(doc)
 
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            OpenLibraryProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         patch.object(
             openlibrary_provider,
             "_parse_search_doc",
@@ -830,7 +868,11 @@ def test_openlibrary_provider_search_empty_docs(
     mock_response.json.return_value = mock_search_response_empty
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        OpenLibraryProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = openlibrary_provider.search("test query")
         assert results == []
 
@@ -844,7 +886,11 @@ def test_openlibrary_provider_search_no_docs_key(
     mock_response.json.return_value = mock_search_response_no_docs
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.get", return_value=mock_response):
+    with patch.object(
+        OpenLibraryProvider,
+        "get_http_client",
+        return_value=MagicMock(**{"get.return_value": mock_response}),
+    ):
         results = openlibrary_provider.search("test query")
         assert results == []
 
@@ -872,7 +918,11 @@ def test_openlibrary_provider_search_http_status_error_escapes(
 
     # HTTPStatusError is not caught by RequestError handler, so it escapes
     with (
-        patch("httpx.get", return_value=mock_response),
+        patch.object(
+            OpenLibraryProvider,
+            "get_http_client",
+            return_value=MagicMock(**{"get.return_value": mock_response}),
+        ),
         pytest.raises(httpx.HTTPStatusError),
     ):
         openlibrary_provider.search("test query")
@@ -850,6 +850,100 @@ class TestQBittorrentClient:
         with pytest.raises(PVRProviderError, match="Failed to get downloads"):
             client.get_items()
 
+    @patch.object(QBittorrentProxy, "get_maindata")
+    def test_sync_items_applies_changes(
+        self,
+        mock_get_maindata: MagicMock,
+        qbittorrent_settings: QBittorrentSettings,
+        file_fetcher: FileFetcherProtocol,
+        url_router: UrlRouterProtocol,
+    ) -> None:
+        """Test sync_items merges partial updates and removals."""
+        qbittorrent_settings.category = None
+        mock_get_maindata.side_effect = [
+            {
+                "rid": 1,
+                "full_update": True,
+                "torrents": {
+                    "abc": {"name": "A", "state": "downloading", "progress": 0.5},
+                    "def": {"name": "B", "state": "downloading", "progress": 0.1},
+                },
+            },
+            {
+                "rid": 2,
+                "torrents": {"abc": {"state": "uploading", "progress": 1.0}},
+                "torrents_removed": ["def"],
+            },
+        ]
+        client = QBittorrentClient(
+            settings=qbittorrent_settings,
+            file_fetcher=file_fetcher,
+            url_router=url_router,
+        )
+
+        assert len(client.sync_items()) == 2
+        items = client.sync_items()
+
+        assert [call.args for call in mock_get_maindata.call_args_list] == [(0,), (1,)]
+        assert len(items) == 1
+        assert items[0]["client_item_id"] == "ABC"
+        assert items[0]["title"] == "A"
+        assert items[0]["status"] == "completed"
+        assert items[0]["progress"] == 1.0
+
+    @patch.object(QBittorrentProxy, "get_maindata")
+    def test_sync_items_filters_category(
+        self,
+        mock_get_maindata: MagicMock,
+        qbittorrent_settings: QBittorrentSettings,
+        file_fetcher: FileFetcherProtocol,
+        url_router: UrlRouterProtocol,
+    ) -> None:
+        """Test sync_items only reports torrents of the client's category."""
+        qbittorrent_settings.category = "books"
+        mock_get_maindata.return_value = {
+            "rid": 1,
+            "full_update": True,
+            "torrents": {
+                "abc": {"name": "A", "category": "books"},
+                "def": {"name": "B", "category": "movies"},
+            },
+        }
+        client = QBittorrentClient(
+            settings=qbittorrent_settings,
+            file_fetcher=file_fetcher,
+            url_router=url_router,
+        )
+
+        assert [item["title"] for item in client.sync_items()] == ["A"]
+
+    @patch.object(QBittorrentProxy, "get_maindata")
+    def test_sync_items_error_resets_rid(
+        self,
+        mock_get_maindata: MagicMock,
+        qbittorrent_settings: QBittorrentSettings,
+        file_fetcher: FileFetcherProtocol,
+        url_router: UrlRouterProtocol,
+    ) -> None:
+        """Test a failed sync requests a full update next time."""
+        mock_get_maindata.side_effect = [
+            {"rid": 5, "full_update": True, "torrents": {}},
+            RuntimeError("Network error"),
+            {"rid": 1, "full_update": True, "torrents": {}},
+        ]
+        client = QBittorrentClient(
+            settings=qbittorrent_settings,
+            file_fetcher=file_fetcher,
+            url_router=url_router,
+        )
+
+        client.sync_items()
+        with pytest.raises(PVRProviderError, match="Failed to get downloads"):
+            client.sync_items()
+        client.sync_items()
+
+        assert mock_get_maindata.call_args_list[-1].args == (0,)
+
     @patch.object(QBittorrentProxy, "remove_torrent")
     def test_remove_item(
         self,
@@ -374,6 +374,32 @@ class TestSabnzbdClient:
         items = client.get_items()
         assert len(items) > 0
 
+    @patch.object(SabnzbdProxy, "get_queue")
+    @patch.object(SabnzbdProxy, "get_history_changes")
+    def test_sync_items_reuses_unchanged_history(
+        self,
+        mock_get_history_changes: MagicMock,
+        mock_get_queue: MagicMock,
+        sabnzbd_settings: SabnzbdSettings,
+        file_fetcher: FileFetcherProtocol,
+        url_router: UrlRouterProtocol,
+    ) -> None:
+        """Test sync_items keeps the previous history if SABnzbd reports none."""
+        mock_get_queue.return_value = []
+        mock_get_history_changes.side_effect = [
+            ([{"nzo_id": "done-1", "name": "Done", "status": "Completed"}], 42),
+            (None, 42),
+        ]
+        client = SabnzbdClient(
+            settings=sabnzbd_settings, file_fetcher=file_fetcher, url_router=url_router
+        )
+
+        client.sync_items()
+        items = client.sync_items()
+
+        assert [item["client_item_id"] for item in items] == ["done-1"]
+        assert mock_get_history_changes.call_args_list[1].args == (42,)
+
     def test_get_items_disabled(
         self,
         sabnzbd_settings: SabnzbdSettings,
@@ -663,6 +689,32 @@ class TestSabnzbdClient:
         assert call_args[1]["params"]["start"] == 10
         assert call_args[1]["params"]["limit"] == 20
 
+    @pytest.mark.parametrize(
+        ("history", "expected"),
+        [
+            (False, (None, 7)),
+            (
+                {"slots": [{"nzo_id": "a"}], "last_history_update": 8},
+                ([{"nzo_id": "a"}], 8),
+            ),
+        ],
+    )
+    def test_get_history_changes(
+        self,
+        sabnzbd_settings: SabnzbdSettings,
+        history: object,
+        expected: tuple[object, int],
+    ) -> None:
+        """Test get_history_changes detects an unchanged history."""
+        proxy = SabnzbdProxy(sabnzbd_settings)
+        with patch.object(
+            proxy, "_request", return_value={"history": history}
+        ) as mock_request:
+            assert proxy.get_history_changes(7, limit=50) == expected
+        mock_request.assert_called_once_with(
+            "GET", "history", params={"last_history_update": 7, "limit": 50}
+        )
+
     @patch.object(SabnzbdProxy, "_request")
     def test_get_history_with_params(
         self, mock_request: MagicMock, sabnzbd_settings: SabnzbdSettings
@@ -25,6 +25,7 @@ import pytest
 from bookcard.pvr.base import DownloadClientSettings
 from bookcard.pvr.base.interfaces import FileFetcherProtocol, UrlRouterProtocol
 from bookcard.pvr.download_clients.transmission import (
+    TRACKING_FIELDS,
     TransmissionClient,
     TransmissionProxy,
     TransmissionSettings,
@@ -566,6 +567,42 @@ class TestTransmissionClient:
         items = client.get_items()
         assert items == []
 
+    @patch("bookcard.pvr.download_clients.transmission.time.monotonic")
+    @patch.object(TransmissionProxy, "get_recently_active")
+    @patch.object(TransmissionProxy, "get_torrents")
+    def test_sync_items_uses_recently_active(
+        self,
+        mock_get_torrents: MagicMock,
+        mock_get_recently_active: MagicMock,
+        mock_monotonic: MagicMock,
+        transmission_settings: TransmissionSettings,
+        file_fetcher: FileFetcherProtocol,
+        url_router: UrlRouterProtocol,
+    ) -> None:
+        """Test sync_items fetches recent changes after a recent sync."""
+        mock_get_torrents.return_value = [
+            {"id": 1, "hashString": "abc", "name": "A", "totalSize": 10},
+            {"id": 2, "hashString": "def", "name": "B", "totalSize": 10},
+        ]
+        mock_get_recently_active.return_value = (
+            [{"id": 1, "hashString": "abc", "name": "A", "totalSize": 10}],
+            [2],
+        )
+        mock_monotonic.side_effect = [100.0, 130.0, 300.0]
+        client = TransmissionClient(
+            settings=transmission_settings,
+            file_fetcher=file_fetcher,
+            url_router=url_router,
+        )
+
+        assert len(client.sync_items()) == 2
+        assert [item["title"] for item in client.sync_items()] == ["A"]
+        assert len(client.sync_items()) == 2
+
+        assert mock_get_torrents.call_count == 2
+        assert mock_get_torrents.call_args.kwargs == {"fields": TRACKING_FIELDS}
+        mock_get_recently_active.assert_called_once_with(TRACKING_FIELDS)
+
     @patch.object(TransmissionProxy, "remove_torrent")
     def test_remove_item(
         self,
@@ -28,6 +28,7 @@ import pytest
 from sqlalchemy import create_engine
 from sqlmodel import Session, SQLModel
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.core import (
     Author,
     Book,
@@ -84,6 +85,7 @@ class MockFileManager(IFileManager):
         book_path_str: str,
         title_dir: str,
         file_format: str,
+        transfer_mode: TransferMode = TransferMode.COPY,
     ) -> None:
         self.saved_files.append({
             "file_path": file_path,
@@ -91,6 +93,7 @@ class MockFileManager(IFileManager):
             "book_path_str": book_path_str,
             "title_dir": title_dir,
             "file_format": file_format,
+            "transfer_mode": transfer_mode,
         })
 
     def save_book_cover(
@@ -0,0 +1,172 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for detection of external changes of Calibre libraries."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from bookcard.repositories.calibre import change_detector as change_detector_module
+from bookcard.repositories.calibre.change_detector import (
+    LibraryChange,
+    LibraryChangeDetector,
+    LibraryChangeMonitor,
+)
+from bookcard.repositories.calibre.enrichment import BookEnrichmentService
+from bookcard.repositories.calibre.read_model import (
+    BookReadModel,
+    notify_book_read_model,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def db_file(tmp_path: Path) -> Path:
+    """Create a minimal Calibre database with two tagged books."""
+    db_file = tmp_path / "metadata.db"
+    with sqlite3.connect(db_file) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT,
+                                last_modified TEXT);
+            CREATE TABLE tags (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE preferences (id INTEGER PRIMARY KEY, val TEXT);
+            INSERT INTO books VALUES (1, 'Dune', '2025-01-01 00:00:00+00:00'),
+                                     (2, 'Emma', '2025-01-01 00:00:00+00:00');
+            INSERT INTO tags VALUES (1, 'Science Fiction');
+            """
+        )
+    conn.close()
+    return db_file
+
+
+def _execute(db_file: Path, sql: str) -> None:
+    """Write to the library as another program would."""
+    conn = sqlite3.connect(db_file)
+    with conn:
+        conn.execute(sql)
+    conn.close()
+
+
+@pytest.fixture
+def detector(db_file: Path) -> LibraryChangeDetector:
+    """Return a detector that has recorded the library's state."""
+    detector = LibraryChangeDetector(db_file)
+    assert detector.check() is None
+    return detector
+
+
+def test_updated_books_are_detected(
+    db_file: Path, detector: LibraryChangeDetector
+) -> None:
+    """Test books whose last_modified moved are reported."""
+    _execute(
+        db_file,
+        "UPDATE books SET title = 'Dune Messiah', "
+        "last_modified = '2025-02-01 00:00:00+00:00' WHERE id = 1",
+    )
+
+    assert detector.check() == LibraryChange(db_file.resolve(), frozenset({1}))
+    assert detector.check() is None
+
+
+def test_added_and_deleted_books_are_detected(
+    db_file: Path, detector: LibraryChangeDetector
+) -> None:
+    """Test books are reported when added or deleted."""
+    _execute(db_file, "DELETE FROM books WHERE id = 2")
+    change = detector.check()
+    assert change is not None
+    assert change.book_ids == {2}
+
+    _execute(
+        db_file, "INSERT INTO books VALUES (3, 'Ulysses', '2024-01-01 00:00:00+00:00')"
+    )
+    change = detector.check()
+    assert change is not None
+    assert change.book_ids == {3}
+
+
+def test_renamed_names_are_a_full_change(
+    db_file: Path, detector: LibraryChangeDetector
+) -> None:
+    """Test renaming a tag reports the whole library as changed."""
+    _execute(db_file, "UPDATE tags SET name = 'Sci-Fi' WHERE id = 1")
+
+    change = detector.check()
+
+    assert change is not None
+    assert change.full
+    assert change.book_ids == frozenset()
+
+
+def test_unrelated_commits_are_ignored(
+    db_file: Path, detector: LibraryChangeDetector
+) -> None:
+    """Test commits touching neither books nor names report nothing."""
+    _execute(db_file, "INSERT INTO preferences VALUES (1, 'value')")
+
+    assert detector.check() is None
+
+
+def test_monitor_publishes_to_subscribers(db_file: Path) -> None:
+    """Test changes reach subscribers until they unsubscribe."""
+    monitor = LibraryChangeMonitor(lambda: [db_file])
+    received: list[LibraryChange] = []
+
+    def _failing(_change: LibraryChange) -> None:
+        msg = "subscriber bug"
+        raise RuntimeError(msg)
+
+    monitor.subscribe(_failing)
+    unsubscribe = monitor.subscribe(received.append)
+    monitor._refresh_libraries()
+
+    _execute(db_file, "UPDATE books SET last_modified = '2026-01-01' WHERE id = 2")
+    monitor.check_all()
+    unsubscribe()
+    _execute(db_file, "UPDATE books SET last_modified = '2026-02-01' WHERE id = 1")
+    monitor.check_all()
+    monitor.shutdown()
+
+    assert [change.book_ids for change in received] == [{2}]
+
+
+def test_read_model_drops_only_changed_books(
+    db_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an external write invalidates the changed books only."""
+    monitor = LibraryChangeMonitor(lambda: [db_file])
+    monitor.subscribe(notify_book_read_model)
+    monkeypatch.setattr(change_detector_module, "_monitor", monitor)
+    monkeypatch.setattr(
+        "bookcard.repositories.calibre.read_model._read_models",
+        {db_file.resolve(): (read_model := BookReadModel(db_file.resolve()))},
+    )
+    books = {1: None, 2: None}
+    details = BookEnrichmentService._empty_full_details()
+
+    _, generation = read_model.get_many(books)
+    read_model.put_many(books, {1: details, 2: details}, generation)
+    _execute(db_file, "UPDATE books SET last_modified = '2026-01-01' WHERE id = 2")
+
+    assert set(read_model.get_many(books)[0]) == {1}
+    monitor.shutdown()
@@ -0,0 +1,191 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the read model of enriched book details."""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel
+
+from bookcard.models.core import (
+    Book,
+    BookAuthorLink,
+    BookLanguageLink,
+    BookPublisherLink,
+    BookRatingLink,
+    BookSeriesLink,
+    BookTagLink,
+    Comment,
+    Identifier,
+    Language,
+    Publisher,
+    Rating,
+    Series,
+    Tag,
+)
+from bookcard.repositories.calibre.enrichment import BookEnrichmentService
+from bookcard.repositories.calibre.read_model import (
+    BookReadModel,
+    get_book_read_model,
+)
+from bookcard.repositories.models import BookWithRelations
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from sqlalchemy import Engine
+
+_TABLES = [
+    model.__table__  # type: ignore[attr-defined]
+    for model in (
+        Book,
+        BookAuthorLink,
+        BookLanguageLink,
+        BookPublisherLink,
+        BookRatingLink,
+        BookSeriesLink,
+        BookTagLink,
+        Comment,
+        Identifier,
+        Language,
+        Publisher,
+        Rating,
+        Series,
+        Tag,
+    )
+]
+
+_MODIFIED = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    """Create a Calibre database with one tagged book."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'metadata.db'}")
+    SQLModel.metadata.create_all(engine, tables=_TABLES)
+    with Session(engine) as session:
+        session.add_all([
+            Book(id=1, title="Dune", last_modified=_MODIFIED),
+            Tag(id=1, name="Science Fiction"),
+        ])
+        session.flush()
+        session.add(BookTagLink(book=1, tag=1))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def _books(session: Session) -> list[BookWithRelations]:
+    book = session.get(Book, 1)
+    assert book is not None
+    return [BookWithRelations(book=book, authors=[], series=None, formats=[])]
+
+
+def _bump(db_file: Path) -> None:
+    stat = db_file.stat()
+    os.utime(db_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_enrichment_reuses_cached_details(engine: Engine, tmp_path: Path) -> None:
+    """Test repeated enrichment only queries the database once."""
+    enrichment = BookEnrichmentService(
+        read_model=BookReadModel(tmp_path / "metadata.db")
+    )
+
+    with (
+        Session(engine) as session,
+        patch.object(
+            enrichment,
+            "_fetch_full_details_maps",
+            wraps=enrichment._fetch_full_details_maps,
+        ) as fetch,
+    ):
+        first = _books(session)
+        enrichment.enrich_books_for_list(session, first)
+        first[0].tags.append("Modified by caller")
+        second = _books(session)
+        enrichment.enrich_books_for_list(session, second)
+
+    assert fetch.call_count == 1
+    assert second[0].tags == ["Science Fiction"]
+    assert second[0].tag_ids == [1]
+
+
+def test_entries_follow_last_modified(engine: Engine, tmp_path: Path) -> None:
+    """Test details of a book are reused only for the same last_modified."""
+    read_model = BookReadModel(tmp_path / "metadata.db")
+    details = BookEnrichmentService._empty_full_details()
+
+    _, generation = read_model.get_many({1: _MODIFIED})
+    read_model.put_many({1: _MODIFIED}, {1: details}, generation)
+
+    assert read_model.get_many({1: _MODIFIED})[0] == {1: details}
+    assert read_model.get_many({1: datetime(2025, 2, 1, tzinfo=UTC)})[0] == {}
+
+
+def test_external_change_drops_entries(engine: Engine, tmp_path: Path) -> None:
+    """Test any change of metadata.db on disk empties the read model."""
+    db_file = tmp_path / "metadata.db"
+    read_model = BookReadModel(db_file)
+    details = BookEnrichmentService._empty_full_details()
+    _, generation = read_model.get_many({1: _MODIFIED})
+    read_model.put_many({1: _MODIFIED}, {1: details}, generation)
+
+    _bump(db_file)
+
+    assert read_model.get_many({1: _MODIFIED})[0] == {}
+
+
+def test_details_read_before_invalidation_are_not_cached(
+    engine: Engine, tmp_path: Path
+) -> None:
+    """Test a write between lookup and store keeps stale details out."""
+    read_model = BookReadModel(tmp_path / "metadata.db")
+    details = BookEnrichmentService._empty_full_details()
+
+    _, generation = read_model.get_many({1: _MODIFIED})
+    read_model.invalidate([1])
+    read_model.put_many({1: _MODIFIED}, {1: details}, generation)
+
+    assert read_model.get_many({1: _MODIFIED})[0] == {}
+
+
+def test_missing_database_bypasses_cache(tmp_path: Path) -> None:
+    """Test nothing is cached for a library without metadata.db."""
+    read_model = BookReadModel(tmp_path / "metadata.db")
+
+    hits, generation = read_model.get_many({1: _MODIFIED})
+
+    assert (hits, generation) == ({}, None)
+
+
+def test_read_model_is_shared_per_library(tmp_path: Path) -> None:
+    """Test repositories of one library share its read model."""
+    db_file = tmp_path / "metadata.db"
+
+    assert get_book_read_model(db_file) is get_book_read_model(
+        tmp_path / "." / "metadata.db"
+    )
+    assert get_book_read_model(db_file) is not get_book_read_model(
+        tmp_path / "other.db"
+    )
@@ -20,6 +20,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -553,3 +554,128 @@ class TestBookReadOperations:
         books = operations.list_books(search_query="Test")
         # Search may or may not return results depending on implementation
         assert isinstance(books, list)
+
+    def test_search_uses_full_text_index_matches(self, in_memory_db: Session) -> None:
+        """Test count/list filter by index matches and fall back without them."""
+        self._add_book(in_memory_db, 1, 1, None)
+        self._add_book(in_memory_db, 2, 2, None)
+        search_index = MagicMock()
+        search_index.search_book_ids.return_value = [2]
+        operations = BookReadOperations(
+            session_manager=MockSessionManager(in_memory_db),
+            retry_policy=SQLiteRetryPolicy(),
+            unwrapper=ResultUnwrapper(),
+            queries=BookQueryBuilder(),
+            enrichment=BookEnrichmentService(),
+            search_service=MockBookSearchService(),
+            statistics_service=MockLibraryStatisticsService(),
+            pathing=BookPathService(),
+            calibre_db_path=Path("test.db"),
+            search_index=search_index,
+        )
+
+        assert operations.count_books(search_query="anything") == 1
+        books = operations.list_books(search_query="anything")
+        assert [b.book.id for b in books] == [2]
+
+        search_index.search_book_ids.return_value = None
+        assert operations.count_books(search_query="Book 1") == 1
+
+    def _make_operations(self, in_memory_db: Session) -> BookReadOperations:
+        return BookReadOperations(
+            session_manager=MockSessionManager(in_memory_db),
+            retry_policy=SQLiteRetryPolicy(),
+            unwrapper=ResultUnwrapper(),
+            queries=BookQueryBuilder(),
+            enrichment=BookEnrichmentService(),
+            search_service=MockBookSearchService(),
+            statistics_service=MockLibraryStatisticsService(),
+            pathing=BookPathService(),
+            calibre_db_path=Path("test.db"),
+        )
+
+    def _add_book(
+        self, in_memory_db: Session, book_id: int, day: int, fmt: str | None
+    ) -> None:
+        in_memory_db.add(
+            Book(
+                id=book_id,
+                title=f"Book {book_id}",
+                uuid=f"uuid-{book_id}",
+                last_modified=datetime(2025, 1, day, tzinfo=UTC),
+            )
+        )
+        if fmt is not None:
+            in_memory_db.add(
+                Data(book=book_id, format=fmt, uncompressed_size=1, name="b")
+            )
+        in_memory_db.commit()
+
+    def test_list_modified_book_keys_keyset(self, in_memory_db: Session) -> None:
+        """Test keys are ordered by (last_modified, id) and resume after a cursor."""
+        self._add_book(in_memory_db, 1, 2, "EPUB")
+        self._add_book(in_memory_db, 2, 1, "epub")
+        self._add_book(in_memory_db, 3, 2, "KEPUB")
+        self._add_book(in_memory_db, 4, 1, "PDF")
+        self._add_book(in_memory_db, 5, 3, None)
+        operations = self._make_operations(in_memory_db)
+
+        keys = operations.list_modified_book_keys(formats=("EPUB", "KEPUB"))
+        assert [book_id for _, book_id in keys] == [2, 1, 3]
+
+        first_page = operations.list_modified_book_keys(
+            formats=("EPUB", "KEPUB"), limit=2
+        )
+        assert [book_id for _, book_id in first_page] == [2, 1]
+
+        rest = operations.list_modified_book_keys(
+            after=first_page[-1], formats=("EPUB", "KEPUB")
+        )
+        assert [book_id for _, book_id in rest] == [3]
+
+    def test_list_modified_book_keys_book_ids(self, in_memory_db: Session) -> None:
+        """Test keys can be restricted to a set of book IDs."""
+        self._add_book(in_memory_db, 1, 1, "EPUB")
+        self._add_book(in_memory_db, 2, 2, "EPUB")
+        operations = self._make_operations(in_memory_db)
+
+        keys = operations.list_modified_book_keys(book_ids={2})
+        assert [book_id for _, book_id in keys] == [2]
+        assert operations.list_modified_book_keys(book_ids=set()) == []
+
+    def test_list_book_sort_keys_keyset(self, in_memory_db: Session) -> None:
+        """Test sort keys are ordered by (value, id) and resume after a cursor."""
+        for book_id, title in [(1, "beta"), (2, "Alpha"), (3, "beta"), (4, "gamma")]:
+            in_memory_db.add(Book(id=book_id, title=title, uuid=f"uuid-{book_id}"))
+        in_memory_db.commit()
+        operations = self._make_operations(in_memory_db)
+
+        keys = operations.list_book_sort_keys(sort_by="title", sort_order="asc")
+        assert keys == [("alpha", 2), ("beta", 1), ("beta", 3), ("gamma", 4)]
+
+        first_page = operations.list_book_sort_keys(
+            sort_by="title", sort_order="desc", limit=2
+        )
+        assert first_page == [("gamma", 4), ("beta", 3)]
+        rest = operations.list_book_sort_keys(
+            sort_by="title", sort_order="desc", after=first_page[-1]
+        )
+        assert rest == [("beta", 1), ("alpha", 2)]
+
+    def test_list_book_sort_keys_with_filters(self, in_memory_db: Session) -> None:
+        """Test filtered sort keys honour the filters and the cursor."""
+        for book_id in (1, 2, 3):
+            in_memory_db.add(
+                Book(id=book_id, title=f"Book {book_id}", uuid=f"uuid-{book_id}")
+            )
+        in_memory_db.commit()
+        operations = self._make_operations(in_memory_db)
+
+        keys = operations.list_book_sort_keys_with_filters(
+            sort_by="title", sort_order="asc", title_ids=[1, 3]
+        )
+        assert [book_id for _, book_id in keys] == [1, 3]
+        rest = operations.list_book_sort_keys_with_filters(
+            sort_by="title", sort_order="asc", title_ids=[1, 3], after=keys[0]
+        )
+        assert [book_id for _, book_id in rest] == [3]
@@ -0,0 +1,341 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the full-text search index."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel, select
+
+from bookcard.models.core import (
+    Author,
+    Book,
+    BookAuthorLink,
+    BookPublisherLink,
+    BookSeriesLink,
+    BookTagLink,
+    Comment,
+    Identifier,
+    Publisher,
+    Series,
+    Tag,
+)
+from bookcard.repositories.book_search_service import BookSearchService
+from bookcard.repositories.calibre import search_index as search_index_module
+from bookcard.repositories.calibre.queries import BookQueryBuilder
+from bookcard.repositories.calibre.search_index import (
+    BookSearchIndex,
+    BookSearchIndexRegistry,
+    build_match_expression,
+    get_book_search_index,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+_TABLES = [
+    model.__table__  # type: ignore[attr-defined]
+    for model in (
+        Author,
+        Book,
+        BookAuthorLink,
+        BookPublisherLink,
+        BookSeriesLink,
+        BookTagLink,
+        Comment,
+        Identifier,
+        Publisher,
+        Series,
+        Tag,
+    )
+]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def calibre_db(tmp_path: Path) -> Path:
+    """Create a small Calibre library database."""
+    db_file = tmp_path / "metadata.db"
+    engine = create_engine(f"sqlite:///{db_file}")
+    SQLModel.metadata.create_all(engine, tables=_TABLES)
+    modified = datetime(2025, 1, 1, tzinfo=UTC)
+    with Session(engine) as session:
+        session.add_all([
+            Book(id=1, title="The Fellowship of the Ring", last_modified=modified),
+            Book(id=2, title="Dune", last_modified=modified),
+            Book(id=3, title="Cooking Basics", last_modified=modified),
+            Author(id=1, name="J. R. R. Tolkien"),
+            Author(id=2, name="Frank Herbert"),
+            Series(id=1, name="The Lord of the Rings"),
+            Tag(id=1, name="Fantasy"),
+            Tag(id=2, name="Science Fiction"),
+            Publisher(id=1, name="Ace Books"),
+        ])
+        session.flush()
+        session.add_all([
+            BookAuthorLink(book=1, author=1),
+            BookAuthorLink(book=2, author=2),
+            BookSeriesLink(book=1, series=1),
+            BookTagLink(book=1, tag=1),
+            BookTagLink(book=2, tag=2),
+            BookPublisherLink(book=2, publisher=1),
+            Identifier(book=2, type="isbn", val="9780441013593"),
+            Comment(book=3, text="<p>Recipes inspired by <b>Dune</b>&amp;more</p>"),
+        ])
+        session.commit()
+    engine.dispose()
+    return db_file
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def index(calibre_db: Path, clock: FakeClock) -> Iterator[BookSearchIndex]:
+    """Create a built index of the library."""
+    search_index = BookSearchIndex(
+        calibre_db.parent / "index" / "search.sqlite",
+        calibre_db,
+        poll_interval=10.0,
+        clock=clock,
+    )
+    search_index.rebuild()
+    yield search_index
+    search_index.close()
+
+
+def _execute(db_file: Path, sql: str, *params: object) -> None:
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.execute(sql, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("fellowship", [1]),
+        ("tolk", [1]),
+        ("lord rings", [1]),
+        ("fantasy", [1]),
+        ("ace", [2]),
+        ("9780441013593", [2]),
+        ("recipes more", [3]),
+        ("missing", []),
+    ],
+)
+def test_search_matches_all_fields(
+    index: BookSearchIndex, query: str, expected: list[int]
+) -> None:
+    """Test words match the start of words in any indexed field."""
+    assert index.search_book_ids(query) == expected
+
+
+def test_search_ranks_title_matches_first(index: BookSearchIndex) -> None:
+    """Test BM25 weighting ranks title matches above comment matches."""
+    assert index.search_book_ids("dune") == [2, 3]
+
+
+def test_search_strips_comment_markup(index: BookSearchIndex) -> None:
+    """Test HTML tags in comments are not indexed as words."""
+    assert index.search_book_ids("amp") == []
+    assert index.search_book_ids("p") == []
+
+
+def test_unbuilt_index_defers_to_fallback(calibre_db: Path, tmp_path: Path) -> None:
+    """Test lookups return None until the background build completes."""
+    search_index = BookSearchIndex(tmp_path / "search.sqlite", calibre_db)
+    try:
+        assert search_index.search_book_ids("dune") is None
+        thread = search_index._build_thread
+        assert thread is not None
+        thread.join(timeout=10)
+
+        assert search_index.is_built
+        assert search_index.search_book_ids("dune") == [2, 3]
+    finally:
+        search_index.close()
+
+
+def test_marked_changes_apply_before_next_lookup(
+    index: BookSearchIndex, calibre_db: Path
+) -> None:
+    """Test repository hooks make edits searchable without waiting to poll."""
+    _execute(calibre_db, "UPDATE books SET title = 'Children of Dune' WHERE id = 3")
+    _execute(calibre_db, "DELETE FROM books WHERE id = 1")
+    index.mark_changed([1, 3])
+
+    assert index.search_book_ids("children") == [3]
+    assert index.search_book_ids("fellowship") == []
+
+
+def test_external_changes_are_polled(
+    index: BookSearchIndex, calibre_db: Path, clock: FakeClock
+) -> None:
+    """Test edits made outside the app are picked up via last_modified."""
+    _execute(
+        calibre_db,
+        "UPDATE books SET title = 'Dune Messiah', last_modified = ? WHERE id = 3",
+        "2030-01-01 00:00:00+00:00",
+    )
+    _execute(calibre_db, "DELETE FROM books WHERE id = 1")
+
+    assert index.search_book_ids("messiah") == []
+
+    clock.now += 10.0
+
+    assert index.search_book_ids("messiah") == [3]
+    assert index.search_book_ids("fellowship") == []
+
+
+def test_bulk_external_changes_rebuild_in_background(
+    index: BookSearchIndex,
+    calibre_db: Path,
+    clock: FakeClock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test too many external changes fall back while the index rebuilds."""
+    monkeypatch.setattr(search_index_module, "MAX_INLINE_SYNC", 1)
+    _execute(calibre_db, "UPDATE books SET last_modified = '2030-01-01'")
+    clock.now += 10.0
+
+    assert index.search_book_ids("dune") is None
+
+    thread = index._build_thread
+    assert thread is not None
+    thread.join(timeout=10)
+    assert index.search_book_ids("dune") == [2, 3]
+
+
+def test_suggest_returns_ranked_prefix_matches(index: BookSearchIndex) -> None:
+    """Test suggestions cover books, authors, tags and series."""
+    limits = {"books": 3, "authors": 3, "tags": 3, "series": 3}
+
+    assert index.suggest("fra", limits) == {
+        "books": [],
+        "authors": [{"id": 2, "name": "Frank Herbert"}],
+        "tags": [],
+        "series": [],
+    }
+    assert index.suggest("lord", limits) == {
+        "books": [],
+        "authors": [],
+        "tags": [],
+        "series": [{"id": 1, "name": "The Lord of the Rings"}],
+    }
+    assert index.suggest("fellow", {"books": 1})["books"] == [  # type: ignore[index]
+        {"id": 1, "name": "The Fellowship of the Ring"}
+    ]
+
+
+def test_suggest_picks_up_new_names(index: BookSearchIndex, calibre_db: Path) -> None:
+    """Test names added with a book are suggested after the write hook."""
+    _execute(calibre_db, "INSERT INTO tags (id, name, link) VALUES (3, 'Horror', '')")
+    index.mark_changed([])
+
+    assert index.suggest("hor", {"tags": 3}) == {"tags": [{"id": 3, "name": "Horror"}]}
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("Dune", '"dune"*'),
+        ('lord "of" rings', '"lord"* "of"* "rings"*'),
+        ("title:x OR NOT y*", '"title"* "x"* "or"* "not"* "y"*'),
+        ("--- !!", None),
+    ],
+)
+def test_build_match_expression_quotes_words(query: str, expected: str | None) -> None:
+    """Test user input cannot inject FTS5 syntax."""
+    assert build_match_expression(query) == expected
+
+
+def test_build_match_expression_column_filter() -> None:
+    """Test matching can be restricted to one column."""
+    assert build_match_expression("Dune", "title") == 'title : ("dune"*)'
+
+
+def test_book_id_in_binds_ids_as_one_parameter(calibre_db: Path) -> None:
+    """Test the ID filter works for any number of matched books."""
+    engine = create_engine(f"sqlite:///{calibre_db}")
+    queries = BookQueryBuilder()
+    try:
+        with Session(engine) as session:
+            ids = session.exec(
+                select(Book.id).where(queries.book_id_in([3, *range(100, 40000), 1]))
+            ).all()
+            count = session.exec(
+                queries.build_count_stmt(search_query="x", matched_book_ids=[])
+            ).one()
+    finally:
+        engine.dispose()
+
+    assert sorted(ids) == [1, 3]  # type: ignore[type-var]
+    assert count == 0
+
+
+def test_registry_reuses_index_per_library(calibre_db: Path, tmp_path: Path) -> None:
+    """Test each library gets one index file in the registry directory."""
+    registry = BookSearchIndexRegistry(tmp_path / "indexes")
+    try:
+        first = registry.get(calibre_db)
+
+        assert registry.get(calibre_db.parent / "." / calibre_db.name) is first
+        assert len(list((tmp_path / "indexes").iterdir())) == 1
+    finally:
+        registry.close()
+
+
+def test_get_book_search_index_requires_configuration(
+    calibre_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test full-text search is off unless a registry is configured."""
+    monkeypatch.setattr(search_index_module, "_registry", None)
+
+    assert get_book_search_index(calibre_db) is None
+
+
+def test_search_service_prefers_index_suggestions(index: BookSearchIndex) -> None:
+    """Test suggestions come from the index without querying Calibre."""
+    session = MagicMock()
+
+    result = BookSearchService(search_index=index).search_suggestions(
+        session, "herb", author_limit=1
+    )
+
+    assert result["authors"] == [{"id": 2, "name": "Frank Herbert"}]
+    session.exec.assert_not_called()
@@ -0,0 +1,198 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the process-wide Calibre engine registry."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from bookcard.repositories.engine_registry import (
+    CalibreEngineRegistry,
+    get_calibre_engine_registry,
+)
+from bookcard.repositories.session_manager import CalibreSessionManager
+
+
+@pytest.fixture
+def db_file(tmp_path: Path) -> Path:
+    """Create an empty SQLite database with a single table."""
+    path = tmp_path / "metadata.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def registry() -> CalibreEngineRegistry:
+    """Create an isolated registry."""
+    return CalibreEngineRegistry(pool_size=2, max_overflow=0)
+
+
+def test_get_engine_reuses_engine(
+    registry: CalibreEngineRegistry, db_file: Path
+) -> None:
+    """Test repeated lookups for the same file share one engine."""
+    first = registry.get_engine(db_file)
+    second = registry.get_engine(db_file)
+
+    assert first is second
+    stats = registry.stats()
+    assert stats.engine_misses == 1
+    assert stats.engine_hits == 1
+    registry.dispose_all()
+
+
+def test_session_managers_share_engine(
+    registry: CalibreEngineRegistry, db_file: Path
+) -> None:
+    """Test separate session managers for one library use the same engine."""
+    manager_a = CalibreSessionManager(str(db_file.parent), registry=registry)
+    manager_b = CalibreSessionManager(str(db_file.parent), registry=registry)
+
+    assert manager_a._get_engine() is manager_b._get_engine()
+    registry.dispose_all()
+
+
+def test_get_engine_missing_file(
+    registry: CalibreEngineRegistry, tmp_path: Path
+) -> None:
+    """Test lookup raises FileNotFoundError when the database is missing."""
+    with pytest.raises(FileNotFoundError, match="Calibre database not found"):
+        registry.get_engine(tmp_path / "metadata.db")
+
+
+def test_pool_reuses_connections(
+    registry: CalibreEngineRegistry, db_file: Path
+) -> None:
+    """Test checkouts after the first are served from the pool."""
+    engine = registry.get_engine(db_file)
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    stats = registry.stats()
+    assert stats.checkouts == 3
+    assert stats.pool_misses == 1
+    assert stats.pool_hits == 2
+    registry.dispose_all()
+
+
+def test_read_only_engine_rejects_writes(
+    registry: CalibreEngineRegistry, db_file: Path
+) -> None:
+    """Test the read-only engine cannot modify the database."""
+    engine = registry.get_engine(db_file, read_only=True)
+
+    assert engine is not registry.get_engine(db_file)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM books")).scalar() == 0
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO books (title) VALUES ('x')"))
+    registry.dispose_all()
+
+
+def test_replaced_file_gets_new_engine(
+    registry: CalibreEngineRegistry, db_file: Path, tmp_path: Path
+) -> None:
+    """Test a database replaced on disk is not served by the old engine."""
+    first = registry.get_engine(db_file)
+    with first.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    replacement = tmp_path / "replacement.db"
+    conn = sqlite3.connect(replacement)
+    conn.execute("CREATE TABLE other (id INTEGER PRIMARY KEY)")
+    conn.commit()
+    conn.close()
+    replacement.replace(db_file)
+
+    second = registry.get_engine(db_file)
+
+    assert second is not first
+    assert registry.stats().evictions == 1
+    registry.dispose_all()
+
+
+def test_idle_libraries_are_evicted(tmp_path: Path) -> None:
+    """Test libraries unused for longer than the idle timeout are disposed."""
+    registry = CalibreEngineRegistry(idle_timeout=0.0)
+    paths = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        path = tmp_path / name / "metadata.db"
+        sqlite3.connect(path).close()
+        paths.append(path)
+
+    registry.get_engine(paths[0])
+    registry.get_engine(paths[1])
+
+    assert len(registry) == 1
+    assert registry.stats().evictions == 1
+    registry.dispose_all()
+
+
+def test_lru_bound_on_libraries(tmp_path: Path) -> None:
+    """Test the registry keeps at most ``max_libraries`` entries."""
+    registry = CalibreEngineRegistry(max_libraries=2)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        path = tmp_path / name / "metadata.db"
+        sqlite3.connect(path).close()
+        registry.get_engine(path)
+
+    assert len(registry) == 2
+    registry.dispose_all()
+
+
+def test_dispose_removes_library(
+    registry: CalibreEngineRegistry, db_file: Path
+) -> None:
+    """Test disposing a library recreates its engine on next use."""
+    manager = CalibreSessionManager(str(db_file.parent), registry=registry)
+    first = manager._get_engine()
+
+    registry.dispose(db_file)
+
+    assert len(registry) == 0
+    assert manager._get_engine() is not first
+    registry.dispose_all()
+
+
+def test_manager_dispose_keeps_shared_engines(
+    registry: CalibreEngineRegistry, db_file: Path
+) -> None:
+    """Test disposing one session manager leaves the library's engines pooled."""
+    manager = CalibreSessionManager(str(db_file.parent), registry=registry)
+    other = CalibreSessionManager(str(db_file.parent), registry=registry)
+    engine = other._get_engine()
+
+    manager.dispose()
+
+    assert len(registry) == 1
+    assert other._get_engine() is engine
+    registry.dispose_all()
+
+
+def test_get_calibre_engine_registry_is_singleton() -> None:
+    """Test the global registry accessor returns the same instance."""
+    assert get_calibre_engine_registry() is get_calibre_engine_registry()
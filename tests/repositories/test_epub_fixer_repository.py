@@ -18,18 +18,23 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
 import pytest
+from sqlmodel import Session, SQLModel, create_engine
 
 from bookcard.models.epub_fixer import EPUBFix, EPUBFixRun, EPUBFixType
 from bookcard.repositories.epub_fixer_repository import (
+    EPUBFileFingerprintRepository,
     EPUBFixRepository,
     EPUBFixRunRepository,
 )
 from tests.repositories.test_base_repository import MockResult, MockSession
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class MockResultWithFirst(MockResult):
     """Mock query result with `first()` method support."""
@@ -651,3 +656,41 @@ class TestEPUBFixRepositoryGetRecentFixes:
         session.set_exec_result([])
         result = fix_repo.get_recent_fixes()
         assert result == []
+
+
+class TestEPUBFileFingerprintRepository:
+    """Test EPUBFileFingerprintRepository against a real database."""
+
+    @pytest.fixture
+    def db_session(self) -> Iterator[Session]:
+        """Create an in-memory database session."""
+        engine = create_engine("sqlite:///:memory:")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+        engine.dispose()
+
+    def test_upsert_many_inserts_and_updates(self, db_session: Session) -> None:
+        """Test fingerprints are inserted once and updated in place."""
+        repo = EPUBFileFingerprintRepository(db_session)
+        repo.upsert_many([("/a.epub", 1, 10), ("/b.epub", 2, 20)], "hash1")
+        db_session.commit()
+
+        repo.upsert_many([("/a.epub", 3, 30)], "hash2")
+        db_session.commit()
+
+        fingerprints = repo.get_by_paths(["/a.epub", "/b.epub", "/c.epub"])
+        assert sorted(fingerprints) == ["/a.epub", "/b.epub"]
+        assert fingerprints["/a.epub"].matches(3, 30, "hash2")
+        assert fingerprints["/b.epub"].matches(2, 20, "hash1")
+        assert not fingerprints["/b.epub"].matches(2, 21, "hash1")
+        assert len(repo.list()) == 2
+
+    def test_get_by_paths_chunks_large_lookups(self, db_session: Session) -> None:
+        """Test lookups beyond one IN clause chunk return every fingerprint."""
+        repo = EPUBFileFingerprintRepository(db_session)
+        paths = [f"/book{index}.epub" for index in range(1200)]
+        repo.upsert_many(((path, 1, 1) for path in paths), "hash")
+        db_session.commit()
+
+        assert len(repo.get_by_paths(paths)) == 1200
@@ -0,0 +1,182 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for book visibility predicates."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel, select
+
+from bookcard.models.core import (
+    Author,
+    Book,
+    BookAuthorLink,
+    BookSeriesLink,
+    BookTagLink,
+    Series,
+    Tag,
+)
+from bookcard.repositories.calibre.queries import BookQueryBuilder
+from bookcard.repositories.filters import FilterBuilder
+from bookcard.repositories.visibility import BookVisibility
+from bookcard.services.permission_service import PermissionService
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_TABLES = [
+    model.__table__  # type: ignore[attr-defined]
+    for model in (
+        Author,
+        Book,
+        BookAuthorLink,
+        BookSeriesLink,
+        BookTagLink,
+        Series,
+        Tag,
+    )
+]
+
+# Permission contexts of the books in the `session` fixture
+_CONTEXTS: dict[int, dict[str, Any]] = {
+    1: {
+        "authors": ["J. R. R. Tolkien"],
+        "author_ids": [1],
+        "tags": ["Fantasy"],
+        "series_id": 1,
+    },
+    2: {"authors": ["Frank Herbert"], "author_ids": [2], "tags": ["Science Fiction"]},
+    3: {
+        "authors": ["Terry Pratchett", "Neil Gaiman"],
+        "author_ids": [3, 4],
+        "tags": ["Fantasy", "Humor"],
+    },
+    4: {"authors": []},
+}
+
+_FANTASY = BookVisibility(conditions=({"tag": "Fantasy"},))
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Create a Calibre database of four books."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=_TABLES)
+    with Session(engine) as session:
+        session.add_all([
+            Book(id=1, title="The Fellowship of the Ring"),
+            Book(id=2, title="Dune"),
+            Book(id=3, title="Good Omens"),
+            Book(id=4, title="Untitled"),
+            Author(id=1, name="J. R. R. Tolkien"),
+            Author(id=2, name="Frank Herbert"),
+            Author(id=3, name="Terry Pratchett"),
+            Author(id=4, name="Neil Gaiman"),
+            Series(id=1, name="The Lord of the Rings"),
+            Tag(id=1, name="Fantasy"),
+            Tag(id=2, name="Science Fiction"),
+            Tag(id=3, name="Humor"),
+        ])
+        session.flush()
+        session.add_all([
+            BookAuthorLink(book=1, author=1),
+            BookAuthorLink(book=2, author=2),
+            BookAuthorLink(book=3, author=3),
+            BookAuthorLink(book=3, author=4),
+            BookSeriesLink(book=1, series=1),
+            BookTagLink(book=1, tag=1),
+            BookTagLink(book=2, tag=2),
+            BookTagLink(book=3, tag=1),
+            BookTagLink(book=3, tag=3),
+        ])
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _visible_ids(session: Session, visibility: BookVisibility) -> set[int]:
+    stmt = BookQueryBuilder().apply_visibility(select(Book.id), visibility)
+    return set(session.exec(stmt).all())
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        ({"author": "Neil Gaiman"},),
+        ({"author_id": 2},),
+        ({"author_ids": [1, 4]},),
+        ({"author_ids": 1},),
+        ({"tag": "Fantasy"},),
+        ({"tags": ["Humor", "Science Fiction"]},),
+        ({"series_id": 1},),
+        ({"series_id": None},),
+        ({"tag": "Fantasy", "author_id": 3},),
+        ({"tag": "Fantasy"}, {"author": "Frank Herbert"}),
+        ({"owner_id": "user.id"},),
+        ({"publisher": "Ace"},),
+        ({},),
+        (),
+    ],
+)
+def test_predicate_matches_permission_evaluator(
+    session: Session, conditions: tuple[dict[str, Any], ...]
+) -> None:
+    """Test the SQL predicate selects the books the evaluator accepts."""
+    evaluator = PermissionService(session)
+    expected = {
+        book_id
+        for book_id, context in _CONTEXTS.items()
+        if any(evaluator.evaluate_condition(c, context) for c in conditions)
+    }
+
+    assert _visible_ids(session, BookVisibility(conditions=conditions)) == expected
+
+
+def test_unrestricted_visibility_adds_no_predicate(session: Session) -> None:
+    """Test unrestricted visibility leaves statements untouched."""
+    stmt = select(Book.id)
+
+    assert BookQueryBuilder().apply_visibility(stmt, BookVisibility()) is stmt
+    assert _visible_ids(session, BookVisibility()) == {1, 2, 3, 4}
+
+
+def test_visibility_applies_to_search_joins(session: Session) -> None:
+    """Test the predicate is independent of link tables joined by searches."""
+    queries = BookQueryBuilder()
+
+    count_stmt = queries.build_count_stmt(search_query="a")
+    list_stmt = queries.build_list_base_stmt(search_query="a")
+
+    assert session.exec(count_stmt).one() == 3
+    assert session.exec(queries.apply_visibility(count_stmt, _FANTASY)).one() == 2
+    listed = session.exec(queries.apply_visibility(list_stmt, _FANTASY)).all()
+    assert {book.id for book, _series_name in listed} == {1, 3}
+
+
+def test_filter_builder_ands_visibility_with_filters(session: Session) -> None:
+    """Test visibility restricts OR-combined filters instead of widening them."""
+    stmt = (
+        FilterBuilder(select(Book.id))  # type: ignore[arg-type]
+        .with_author_ids([2, 3])
+        .with_title_ids([1])
+        .with_visibility(_FANTASY)
+        .build()
+    )
+
+    assert set(session.exec(stmt).all()) == {1, 3}
@@ -32,7 +32,7 @@ import types
 import zipfile
 from dataclasses import dataclass
 from io import BytesIO
-from typing import TYPE_CHECKING, Self, cast
+from typing import TYPE_CHECKING, Any, Self, cast
 
 import pytest
 
@@ -562,16 +562,29 @@ def test_cb7_handler_success_and_error_branches(
         def getnames(self) -> list[str]:
             return ["page2.png", "page1.jpg", "folder/"]
 
-        def read(self, names: list[str]) -> dict[str, BytesIO]:
-            if names == ["missing.png"]:
-                raise KeyError("missing")
-            return {names[0]: BytesIO(rgb_png_bytes)}
+        def archiveinfo(self) -> types.SimpleNamespace:
+            return types.SimpleNamespace(solid=True)
+
+        def extract(
+            self,
+            path: Path | None = None,
+            targets: list[str] | None = None,
+            *,
+            factory: Any,  # noqa: ANN401
+        ) -> None:
+            for name in targets or []:
+                if name == "missing.png":
+                    continue
+                writer = factory.create(name)
+                writer.write(rgb_png_bytes)
+                writer.close()
 
     fake_py7zr = types.SimpleNamespace(SevenZipFile=FakeSevenZipFile)
     monkeypatch.setitem(sys.modules, "py7zr", fake_py7zr)
 
     md = handler.scan_metadata(tmp_path / "a.cb7", last_modified_ns=1)
     assert md.page_filenames == ("page1.jpg", "page2.png")
+    assert md.is_solid
 
     data = handler.extract_page(tmp_path / "a.cb7", filename="page1.jpg", metadata=md)
     assert data == rgb_png_bytes
@@ -604,6 +617,9 @@ def test_cbr_handler_success_and_error_branches(
         def namelist(self) -> list[str]:
             return list(self._names)
 
+        def is_solid(self) -> bool:
+            return False
+
         def read(self, filename: str) -> bytes:
             if filename == "missing.png":
                 raise KeyError(filename)
@@ -613,6 +629,7 @@ def test_cbr_handler_success_and_error_branches(
 
     md = handler.scan_metadata(tmp_path / "a.cbr", last_modified_ns=2)
     assert md.page_filenames == ("page1.jpg", "page2.png")
+    assert not md.is_solid
     assert (
         handler.extract_page(tmp_path / "a.cbr", filename="page1.jpg", metadata=md)
         == b"data"
@@ -0,0 +1,231 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the on-disk comic page cache."""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Any
+
+import py7zr
+import pytest
+
+from bookcard.services.comic.archive import page_cache
+from bookcard.services.comic.archive.handlers import CB7Handler, CBZHandler
+from bookcard.services.comic.archive.page_cache import ComicPageCache
+from bookcard.services.comic.archive.service import create_comic_archive_service
+from bookcard.services.comic.archive.zip_encoding import ZipEncodingDetector
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from bookcard.services.comic.archive.models import ArchiveMetadata
+
+
+class _InlineExecutor(Executor):
+    """Executor running submitted work immediately."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:  # noqa: ANN401
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class _CountingCB7Handler(CB7Handler):
+    def __init__(self) -> None:
+        self.passes = 0
+        self.single_extracts = 0
+
+    def extract_pages(self, file_path: Path, **kwargs: Any) -> None:  # noqa: ANN401
+        self.passes += 1
+        super().extract_pages(file_path, **kwargs)
+
+    def extract_page(
+        self, file_path: Path, *, filename: str, metadata: ArchiveMetadata
+    ) -> bytes:
+        self.single_extracts += 1
+        return super().extract_page(file_path, filename=filename, metadata=metadata)
+
+
+def _make_cb7(path: Path, pages: int) -> Path:
+    with py7zr.SevenZipFile(path, "w") as z:
+        for i in range(1, pages + 1):
+            z.writestr(bytes([i]) * 100, f"p{i:02d}.png")
+    return path
+
+
+def test_solid_archive_is_extracted_once(tmp_path: Path) -> None:
+    """Test a solid CB7 is decompressed in one pass and then served from disk."""
+    archive = _make_cb7(tmp_path / "a.cb7", pages=5)
+    handler = _CountingCB7Handler()
+    metadata = handler.scan_metadata(archive, last_modified_ns=1)
+    assert metadata.is_solid
+    cache = ComicPageCache(tmp_path / "cache")
+
+    pages = [
+        cache.get_page(archive, page_number=n, metadata=metadata, handler=handler)
+        for n in (3, 1, 5, 3)
+    ]
+
+    assert pages == [bytes([n]) * 100 for n in (3, 1, 5, 3)]
+    assert handler.passes == 1
+    assert handler.single_extracts == 0
+    stats = cache.stats()
+    assert (stats.misses, stats.hits, stats.archive_extractions) == (1, 3, 1)
+    assert stats.bytes_cached == 500
+
+
+def test_non_solid_pages_are_prefetched(
+    tmp_path: Path, make_zip_file: Callable[[Path, dict[str, bytes]], Path]
+) -> None:
+    """Test reading a CBZ page extracts the following pages ahead of time."""
+    archive = make_zip_file(
+        tmp_path / "a.cbz", {f"p{i}.png": bytes([i]) * 10 for i in range(1, 6)}
+    )
+    handler = CBZHandler(ZipEncodingDetector(encodings=("utf-8",)))
+    metadata = handler.scan_metadata(archive, last_modified_ns=1)
+    cache = ComicPageCache(
+        tmp_path / "cache", prefetch_pages=2, executor=_InlineExecutor()
+    )
+
+    assert cache.get_page(archive, page_number=1, metadata=metadata, handler=handler)
+    assert cache.get_page(archive, page_number=2, metadata=metadata, handler=handler)
+
+    stats = cache.stats()
+    assert (stats.misses, stats.hits, stats.prefetched) == (1, 1, 3)
+
+
+def test_least_recently_used_archive_is_evicted(tmp_path: Path) -> None:
+    """Test the size bound evicts whole archives in LRU order."""
+    handler = CB7Handler()
+    cache = ComicPageCache(tmp_path / "cache", max_bytes=600)
+    archives = [_make_cb7(tmp_path / f"{name}.cb7", pages=4) for name in "abc"]
+    metadata = [handler.scan_metadata(a, last_modified_ns=1) for a in archives]
+
+    for archive, md in zip(archives, metadata, strict=True):
+        cache.get_page(archive, page_number=1, metadata=md, handler=handler)
+
+    stats = cache.stats()
+    assert stats.evictions == 2
+    assert stats.bytes_cached == 400
+    cache.get_page(archives[0], page_number=1, metadata=metadata[0], handler=handler)
+    assert cache.stats().archive_extractions == 4
+
+
+def test_sizes_are_reloaded_from_disk(tmp_path: Path) -> None:
+    """Test a new cache instance accounts for pages cached by a previous one."""
+    archive = _make_cb7(tmp_path / "a.cb7", pages=3)
+    handler = CB7Handler()
+    metadata = handler.scan_metadata(archive, last_modified_ns=1)
+    ComicPageCache(tmp_path / "cache").get_page(
+        archive, page_number=1, metadata=metadata, handler=handler
+    )
+
+    cache = ComicPageCache(tmp_path / "cache")
+
+    assert cache.stats().bytes_cached == 300
+    cache.get_page(archive, page_number=2, metadata=metadata, handler=handler)
+    assert cache.stats().hits == 1
+
+
+def test_service_uses_page_cache_and_mtime_key(
+    tmp_path: Path, rgb_png_bytes: bytes
+) -> None:
+    """Test the service serves cached pages until the archive changes."""
+    archive = tmp_path / "a.cb7"
+    with py7zr.SevenZipFile(archive, "w") as z:
+        z.writestr(rgb_png_bytes, "p1.png")
+    cache = ComicPageCache(tmp_path / "cache")
+    service = create_comic_archive_service(page_cache=cache)
+
+    assert service.get_page(archive, 1).image_data == rgb_png_bytes
+    assert service.get_page(archive, 1).width == 100
+    assert cache.stats().hits == 1
+
+    stat = archive.stat()
+    os.utime(archive, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    service.get_page(archive, 1)
+    assert cache.stats().misses == 2
+
+
+def test_prefetch_can_be_disabled(
+    tmp_path: Path, make_zip_file: Callable[[Path, dict[str, bytes]], Path]
+) -> None:
+    """Test no read-ahead happens when disabled."""
+    archive = make_zip_file(tmp_path / "a.cbz", {"p1.png": b"1", "p2.png": b"2"})
+    handler = CBZHandler(ZipEncodingDetector(encodings=("utf-8",)))
+    metadata = handler.scan_metadata(archive, last_modified_ns=1)
+    cache = ComicPageCache(
+        tmp_path / "cache", prefetch_pages=0, executor=_InlineExecutor()
+    )
+
+    cache.get_page(archive, page_number=1, metadata=metadata, handler=handler)
+
+    assert cache.stats().prefetched == 0
+
+
+class _FailingPrefetchCBZHandler(CBZHandler):
+    """CBZ handler whose single-page extraction fails after the first page."""
+
+    def __init__(self, error: Exception) -> None:
+        super().__init__(ZipEncodingDetector(encodings=("utf-8",)))
+        self.error = error
+
+    def extract_page(
+        self, file_path: Path, *, filename: str, metadata: ArchiveMetadata
+    ) -> bytes:
+        if filename != "p1.png":
+            raise self.error
+        return super().extract_page(file_path, filename=filename, metadata=metadata)
+
+
+@pytest.mark.parametrize(
+    ("error", "level"),
+    [
+        (OSError("disk full"), logging.DEBUG),
+        (RuntimeError("bug"), logging.ERROR),
+    ],
+)
+def test_failed_prefetch_is_logged_and_released(
+    tmp_path: Path,
+    make_zip_file: Callable[[Path, dict[str, bytes]], Path],
+    caplog: pytest.LogCaptureFixture,
+    error: Exception,
+    level: int,
+) -> None:
+    """Test prefetch errors are logged and do not leave pages pending."""
+    archive = make_zip_file(
+        tmp_path / "a.cbz", {f"p{i}.png": bytes([i]) * 10 for i in range(1, 4)}
+    )
+    handler = _FailingPrefetchCBZHandler(error)
+    metadata = handler.scan_metadata(archive, last_modified_ns=1)
+    cache = ComicPageCache(
+        tmp_path / "cache", prefetch_pages=2, executor=_InlineExecutor()
+    )
+
+    with caplog.at_level(logging.DEBUG, logger=page_cache.__name__):
+        assert cache.get_page(
+            archive, page_number=1, metadata=metadata, handler=handler
+        )
+
+    failures = [r for r in caplog.records if "page 2" in r.getMessage()]
+    assert [r.levelno for r in failures] == [level]
+    assert cache.stats().prefetched == 0
+    assert not cache._pending
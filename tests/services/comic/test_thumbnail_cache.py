@@ -0,0 +1,208 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the on-disk comic page thumbnail cache."""
+
+from __future__ import annotations
+
+import os
+from io import BytesIO
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from PIL import Image
+
+from bookcard.services.comic.archive.exceptions import ImageProcessingError
+from bookcard.services.comic.archive.handlers import CBZHandler
+from bookcard.services.comic.archive.service import create_comic_archive_service
+from bookcard.services.comic.archive.thumbnail_cache import ComicThumbnailCache
+from bookcard.services.comic.archive.zip_encoding import ZipEncodingDetector
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from bookcard.services.comic.archive.models import ArchiveMetadata
+
+
+class _CountingCBZHandler(CBZHandler):
+    def __init__(self) -> None:
+        super().__init__(ZipEncodingDetector(encodings=("utf-8",)))
+        self.passes = 0
+        self.single_extracts = 0
+
+    def extract_pages(self, file_path: Path, **kwargs: Any) -> None:  # noqa: ANN401
+        self.passes += 1
+        super().extract_pages(file_path, **kwargs)
+
+    def extract_page(
+        self, file_path: Path, *, filename: str, metadata: ArchiveMetadata
+    ) -> bytes:
+        self.single_extracts += 1
+        return super().extract_page(file_path, filename=filename, metadata=metadata)
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (width, height), color="blue").save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def comic(
+    tmp_path: Path, make_zip_file: Callable[[Path, dict[str, bytes]], Path]
+) -> Path:
+    """Create a CBZ with three pages, one of which is not a valid image."""
+    return make_zip_file(
+        tmp_path / "a.cbz",
+        {"p1.jpg": _jpeg(800, 1200), "p2.jpg": _jpeg(600, 600), "p3.png": b"bad"},
+    )
+
+
+@pytest.mark.parametrize(
+    ("max_width", "expected"),
+    [(None, None), (0, None), (50, 120), (120, 120), (121, 240), (961, None)],
+)
+def test_bucket_for(max_width: int | None, expected: int | None) -> None:
+    """Test requested widths round up to the nearest bucket."""
+    assert ComicThumbnailCache.bucket_for(max_width) == expected
+
+
+def test_thumbnails_rendered_in_one_pass(tmp_path: Path, comic: Path) -> None:
+    """Test all thumbnails of a comic are rendered from one archive pass."""
+    handler = _CountingCBZHandler()
+    metadata = handler.scan_metadata(comic, last_modified_ns=7)
+    cache = ComicThumbnailCache(tmp_path / "cache")
+
+    thumbs = [
+        cache.get_thumbnail(
+            comic, page_number=n, bucket=240, metadata=metadata, handler=handler
+        )
+        for n in (2, 1, 2)
+    ]
+
+    assert handler.passes == 1
+    assert handler.single_extracts == 0
+    assert thumbs[0] is not None
+    assert thumbs[1] is not None
+    with Image.open(thumbs[1].path) as img:
+        assert img.format == "JPEG"
+        assert img.size == (240, 360)
+    assert thumbs[0].etag == '"7-w240-p2"'
+    assert thumbs[0].etag != thumbs[1].etag
+
+
+def test_undecodable_page_has_no_thumbnail(tmp_path: Path, comic: Path) -> None:
+    """Test a page that cannot be decoded yields None instead of failing."""
+    handler = _CountingCBZHandler()
+    metadata = handler.scan_metadata(comic, last_modified_ns=7)
+    cache = ComicThumbnailCache(tmp_path / "cache")
+
+    thumb = cache.get_thumbnail(
+        comic, page_number=3, bucket=120, metadata=metadata, handler=handler
+    )
+
+    assert thumb is None
+
+
+def test_sprite_sheet_layout(tmp_path: Path, comic: Path) -> None:
+    """Test the sprite sheet grid matches the reported layout."""
+    handler = _CountingCBZHandler()
+    metadata = handler.scan_metadata(comic, last_modified_ns=7)
+    cache = ComicThumbnailCache(tmp_path / "cache")
+
+    sprite = cache.get_sprite_sheet(
+        comic, bucket=120, columns=2, metadata=metadata, handler=handler
+    )
+
+    assert (sprite.page_count, sprite.columns, sprite.rows) == (3, 2, 2)
+    assert (sprite.cell_width, sprite.cell_height) == (120, 180)
+    with Image.open(sprite.path) as img:
+        assert img.size == (240, 360)
+    assert handler.passes == 1
+
+
+def test_sprite_sheet_too_tall(
+    tmp_path: Path, comic: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an unencodable sprite sheet is rejected."""
+    handler = _CountingCBZHandler()
+    metadata = handler.scan_metadata(comic, last_modified_ns=7)
+    cache = ComicThumbnailCache(tmp_path / "cache")
+    monkeypatch.setattr(
+        "bookcard.services.comic.archive.thumbnail_cache._MAX_SPRITE_HEIGHT", 100
+    )
+
+    with pytest.raises(ImageProcessingError, match="too tall"):
+        cache.get_sprite_sheet(
+            comic, bucket=120, columns=1, metadata=metadata, handler=handler
+        )
+
+
+def test_least_recently_used_sets_are_evicted(
+    tmp_path: Path, comic: Path, make_zip_file: Callable[[Path, dict[str, bytes]], Path]
+) -> None:
+    """Test the size bound evicts whole thumbnail sets."""
+    other = make_zip_file(tmp_path / "b.cbz", {"p1.jpg": _jpeg(800, 1200)})
+    handler = _CountingCBZHandler()
+    cache = ComicThumbnailCache(tmp_path / "cache", max_bytes=1)
+
+    first = cache.get_thumbnail(
+        comic,
+        page_number=1,
+        bucket=120,
+        metadata=handler.scan_metadata(comic, last_modified_ns=1),
+        handler=handler,
+    )
+    assert first is not None
+    cache.get_thumbnail(
+        other,
+        page_number=1,
+        bucket=120,
+        metadata=handler.scan_metadata(other, last_modified_ns=1),
+        handler=handler,
+    )
+
+    assert not first.path.exists()
+
+
+def test_service_serves_thumbnails_until_archive_changes(
+    tmp_path: Path, comic: Path
+) -> None:
+    """Test the service caches thumbnails per archive mtime and width bucket."""
+    service = create_comic_archive_service(
+        thumbnail_cache=ComicThumbnailCache(tmp_path / "cache")
+    )
+
+    first = service.get_page_thumbnail(comic, 1, max_width=100)
+    assert first is not None
+    assert service.get_page_thumbnail(comic, 1, max_width=2000) is None
+
+    stat = comic.stat()
+    os.utime(comic, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = service.get_page_thumbnail(comic, 1, max_width=100)
+    assert second is not None
+    assert second.etag != first.etag
+    assert second.path != first.path
+
+
+def test_service_without_thumbnail_cache(comic: Path) -> None:
+    """Test thumbnails are not served when no cache is configured."""
+    service = create_comic_archive_service()
+
+    assert service.get_page_thumbnail(comic, 1, max_width=100) is None
+    with pytest.raises(ImageProcessingError):
+        service.get_sprite_sheet(comic, max_width=100, columns=4)
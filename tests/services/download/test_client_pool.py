@@ -0,0 +1,134 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the download client pool and circuit breaker."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from bookcard.models.pvr import DownloadClientDefinition, DownloadClientType
+from bookcard.services.download.client_pool import (
+    CircuitBreaker,
+    DownloadClientPool,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def definition() -> DownloadClientDefinition:
+    """Return a download client definition."""
+    return DownloadClientDefinition(
+        id=1,
+        name="qBittorrent",
+        client_type=DownloadClientType.QBITTORRENT,
+        host="localhost",
+        port=8080,
+    )
+
+
+def test_breaker_opens_after_threshold_and_backs_off(clock: FakeClock) -> None:
+    """Test the circuit opens, retries after a cooldown and doubles it."""
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_failure()
+    clock.now = 29
+    assert not breaker.allow()
+    clock.now = 30
+    assert breaker.allow()
+
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+
+
+def test_pool_reuses_clients_until_settings_change(
+    definition: DownloadClientDefinition,
+) -> None:
+    """Test instances survive checkouts and are rebuilt on new settings."""
+    pool = DownloadClientPool()
+    create = MagicMock(side_effect=lambda: MagicMock())
+
+    first = pool.checkout(definition, create)
+    assert first is not None
+    pool.release(first)
+    second = pool.checkout(definition, create)
+    assert second is not None
+    assert second.client is first.client
+    pool.release(second)
+
+    definition.port = 9090
+    third = pool.checkout(definition, create)
+    assert third is not None
+    assert third.client is not first.client
+    assert create.call_count == 2
+
+
+def test_pool_skips_busy_and_open_clients(
+    definition: DownloadClientDefinition, clock: FakeClock
+) -> None:
+    """Test a client is not checked out while polled or while its circuit is open."""
+    pool = DownloadClientPool(
+        breaker_factory=lambda: CircuitBreaker(failure_threshold=1, clock=clock)
+    )
+    create = MagicMock(return_value=MagicMock())
+
+    pooled = pool.checkout(definition, create)
+    assert pooled is not None
+    assert pool.checkout(definition, create) is None
+
+    pool.release(pooled)
+    pooled.breaker.record_failure()
+    assert pool.checkout(definition, create) is None
+
+
+def test_pool_retains_only_enabled_clients(
+    definition: DownloadClientDefinition,
+) -> None:
+    """Test clients of removed definitions are dropped."""
+    pool = DownloadClientPool()
+    create = MagicMock(side_effect=lambda: MagicMock())
+    pooled = pool.checkout(definition, create)
+    assert pooled is not None
+    pool.release(pooled)
+
+    pool.retain(set())
+    pool.checkout(definition, create)
+
+    assert create.call_count == 2
@@ -0,0 +1,310 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the book file content-hash index."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from bookcard.models.config import Library
+from bookcard.models.core import Book
+from bookcard.models.file_hash import BookFileHash
+from bookcard.models.media import Data
+from bookcard.services.duplicate_detection.book_duplicate_handler import (
+    BookDuplicateHandler,
+)
+from bookcard.services.duplicate_detection.file_hash_index import (
+    FILE_HASH_DETECTION_ENV,
+    FileHashIndex,
+)
+from bookcard.services.duplicate_detection.strategies import (
+    FullFileHashDuplicateStrategy,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+LIBRARY_ID = 1
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Create an in-memory session holding both Calibre and index tables."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _add_book(
+    session: Session, library_path: Path, book_id: int, content: bytes
+) -> Path:
+    book_dir = library_path / f"Author/Book {book_id} ({book_id})"
+    book_dir.mkdir(parents=True)
+    file_path = book_dir / f"Book {book_id}.epub"
+    file_path.write_bytes(content)
+    session.add(
+        Book(
+            id=book_id,
+            title=f"Book {book_id}",
+            path=str(book_dir.relative_to(library_path)),
+        )
+    )
+    session.add(
+        Data(
+            book=book_id,
+            format="EPUB",
+            uncompressed_size=len(content),
+            name=f"Book {book_id}",
+        )
+    )
+    session.commit()
+    return file_path
+
+
+def _find(session: Session, library_path: Path, file_path: Path) -> int | None:
+    return FileHashIndex(session).find_duplicate(
+        library_id=LIBRARY_ID,
+        calibre_session=session,
+        library_path=library_path,
+        file_path=file_path,
+        file_format="epub",
+    )
+
+
+def _records(session: Session) -> list[BookFileHash]:
+    return list(session.exec(select(BookFileHash)).all())
+
+
+def test_find_duplicate_indexes_same_size_files(
+    session: Session, tmp_path: Path
+) -> None:
+    """Test unindexed library files of matching size are indexed and matched."""
+    library_path = tmp_path / "library"
+    _add_book(session, library_path, 1, b"same content")
+    _add_book(session, library_path, 2, b"other content, longer")
+    incoming = tmp_path / "incoming.epub"
+    incoming.write_bytes(b"same content")
+
+    assert _find(session, library_path, incoming) == 1
+    # Only the file with a matching size was hashed
+    assert [r.book_id for r in _records(session)] == [1]
+
+
+def test_find_duplicate_skips_hashing_without_size_match(
+    session: Session, tmp_path: Path
+) -> None:
+    """Test a file with no same-size candidate is never hashed."""
+    library_path = tmp_path / "library"
+    _add_book(session, library_path, 1, b"abc")
+    incoming = tmp_path / "incoming.epub"
+    incoming.write_bytes(b"abcdef")
+
+    with patch(
+        "bookcard.services.duplicate_detection.file_hash_index.compute_file_hash"
+    ) as mock_hash:
+        assert _find(session, library_path, incoming) is None
+    mock_hash.assert_not_called()
+
+
+def test_find_duplicate_rehashes_changed_file(session: Session, tmp_path: Path) -> None:
+    """Test a record whose file changed on disk is refreshed before matching."""
+    library_path = tmp_path / "library"
+    file_path = _add_book(session, library_path, 1, b"version one")
+    index = FileHashIndex(session)
+    index.record_file(
+        library_id=LIBRARY_ID, book_id=1, file_format="EPUB", file_path=file_path
+    )
+    # Same size, different content, newer mtime
+    file_path.write_bytes(b"version two")
+    stat = file_path.stat()
+    os.utime(file_path, (stat.st_atime, stat.st_mtime + 10))
+
+    incoming = tmp_path / "incoming.epub"
+    incoming.write_bytes(b"version one")
+    assert _find(session, library_path, incoming) is None
+
+    incoming.write_bytes(b"version two")
+    assert _find(session, library_path, incoming) == 1
+
+
+def test_record_file_skips_unchanged(session: Session, tmp_path: Path) -> None:
+    """Test re-recording an unchanged file does not hash it again."""
+    library_path = tmp_path / "library"
+    file_path = _add_book(session, library_path, 1, b"content")
+    index = FileHashIndex(session)
+    index.record_file(
+        library_id=LIBRARY_ID, book_id=1, file_format="epub", file_path=file_path
+    )
+
+    with patch(
+        "bookcard.services.duplicate_detection.file_hash_index.compute_file_hash"
+    ) as mock_hash:
+        index.record_file(
+            library_id=LIBRARY_ID, book_id=1, file_format="epub", file_path=file_path
+        )
+    mock_hash.assert_not_called()
+
+
+def test_remove(session: Session, tmp_path: Path) -> None:
+    """Test removing a book format drops its record."""
+    library_path = tmp_path / "library"
+    file_path = _add_book(session, library_path, 1, b"content")
+    index = FileHashIndex(session)
+    index.record_file(
+        library_id=LIBRARY_ID, book_id=1, file_format="epub", file_path=file_path
+    )
+
+    index.remove(library_id=LIBRARY_ID, book_id=1, file_format="epub")
+
+    assert _records(session) == []
+
+
+def test_record_and_remove_leave_transaction_to_caller(
+    session: Session, tmp_path: Path
+) -> None:
+    """Test index updates are flushed, not committed."""
+    library_path = tmp_path / "library"
+    file_path = _add_book(session, library_path, 1, b"content")
+    index = FileHashIndex(session)
+
+    index.record_file(
+        library_id=LIBRARY_ID, book_id=1, file_format="epub", file_path=file_path
+    )
+    assert [r.book_id for r in _records(session)] == [1]
+    session.rollback()
+    assert _records(session) == []
+
+    index.record_file(
+        library_id=LIBRARY_ID, book_id=1, file_format="epub", file_path=file_path
+    )
+    session.commit()
+    index.remove(library_id=LIBRARY_ID, book_id=1, file_format="epub")
+    session.rollback()
+    assert [r.book_id for r in _records(session)] == [1]
+
+
+def test_backfill(session: Session, tmp_path: Path) -> None:
+    """Test backfill hashes new files, keeps current ones and drops stale ones."""
+    library_path = tmp_path / "library"
+    _add_book(session, library_path, 1, b"one")
+    _add_book(session, library_path, 2, b"two")
+    session.add(
+        BookFileHash(
+            library_id=LIBRARY_ID,
+            book_id=99,
+            format="EPUB",
+            file_size=1,
+            file_mtime=0.0,
+            partial_hash="x",
+            sha256="x",
+        )
+    )
+    session.commit()
+    index = FileHashIndex(session)
+
+    first = index.backfill(
+        library_id=LIBRARY_ID, calibre_session=session, library_path=library_path
+    )
+    second = index.backfill(
+        library_id=LIBRARY_ID, calibre_session=session, library_path=library_path
+    )
+
+    assert (first.hashed, first.removed) == (2, 1)
+    assert (second.hashed, second.unchanged) == (0, 2)
+    assert sorted(r.book_id for r in _records(session)) == [1, 2]
+
+
+def test_strategy_uses_index(session: Session, tmp_path: Path) -> None:
+    """Test the full-hash strategy delegates to the index when given one."""
+    library_path = tmp_path / "library"
+    _add_book(session, library_path, 1, b"same content")
+    incoming = tmp_path / "incoming.epub"
+    incoming.write_bytes(b"same content")
+    library = Library(
+        id=LIBRARY_ID,
+        name="Test",
+        calibre_db_path=str(library_path),
+        library_root=str(library_path),
+    )
+    strategy = FullFileHashDuplicateStrategy(index=FileHashIndex(session))
+
+    book_id = strategy.find_duplicate(
+        session=session,
+        library=library,
+        file_path=incoming,
+        title=None,
+        author_name=None,
+        file_format="epub",
+    )
+
+    assert book_id == 1
+
+
+def test_find_duplicate_leaves_transaction_to_caller(
+    session: Session, tmp_path: Path
+) -> None:
+    """Test lookups flush new records without committing the caller's work."""
+    library_path = tmp_path / "library"
+    _add_book(session, library_path, 1, b"same content")
+    incoming = tmp_path / "incoming.epub"
+    incoming.write_bytes(b"same content")
+    session.add(Book(id=2, title="Pending", path="Author/Pending (2)"))
+
+    assert _find(session, library_path, incoming) == 1
+    assert [r.book_id for r in _records(session)] == [1]
+
+    session.rollback()
+    assert _records(session) == []
+    assert session.get(Book, 2) is None
+
+
+@pytest.mark.parametrize(
+    ("env_value", "use_file_hash", "expected"),
+    [
+        (None, None, False),
+        ("true", None, True),
+        ("off", None, False),
+        (None, True, True),
+        ("true", False, False),
+    ],
+)
+def test_handler_file_hash_detection_is_opt_in(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    env_value: str | None,
+    use_file_hash: bool | None,
+    expected: bool,
+) -> None:
+    """Test the default strategies hash files only when enabled."""
+    if env_value is None:
+        monkeypatch.delenv(FILE_HASH_DETECTION_ENV, raising=False)
+    else:
+        monkeypatch.setenv(FILE_HASH_DETECTION_ENV, env_value)
+
+    handler = BookDuplicateHandler(session=session, use_file_hash=use_file_hash)
+
+    uses_hash = any(
+        isinstance(s, FullFileHashDuplicateStrategy) for s in handler._strategies
+    )
+    assert uses_hash is expected
@@ -0,0 +1,142 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the in-memory title/author fuzzy index."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from bookcard.models.config import Library
+from bookcard.models.core import Author, Book, BookAuthorLink
+from bookcard.services.duplicate_detection.strategies import (
+    TitleAuthorLevenshteinDuplicateStrategy,
+)
+from bookcard.services.duplicate_detection.title_author_index import (
+    TitleAuthorIndex,
+    TitleAuthorIndexRegistry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Create an in-memory Calibre-schema session."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _add_book(
+    session: Session,
+    book_id: int,
+    title: str,
+    author: str | None,
+    modified: datetime,
+) -> None:
+    session.add(
+        Book(id=book_id, title=title, path=f"b{book_id}", last_modified=modified)
+    )
+    if author is not None:
+        session.add(Author(id=book_id, name=author))
+        session.add(BookAuthorLink(book=book_id, author=book_id))
+    session.commit()
+
+
+def test_find_best_matches_close_key(session: Session) -> None:
+    """Test a misspelt title+author finds the existing book."""
+    _add_book(
+        session, 1, "The Hobbit", "J.R.R. Tolkien", datetime(2024, 1, 1, tzinfo=UTC)
+    )
+    _add_book(session, 2, "Dune", "Frank Herbert", datetime(2024, 1, 1, tzinfo=UTC))
+    index = TitleAuthorIndex()
+
+    match = index.find_best(session, "The Hobit", "J.R.R. Tolkein", 0.85)
+
+    assert match is not None
+    assert match.book_id == 1
+    assert match.key == "the hobbit j.r.r. tolkien"
+    assert index.find_best(session, "Emma", "Jane Austen", 0.85) is None
+
+
+def test_refresh_picks_up_new_and_edited_books(session: Session) -> None:
+    """Test writes after the first lookup are visible to the next one."""
+    _add_book(session, 1, "Dune", "Frank Herbert", datetime(2024, 1, 1, tzinfo=UTC))
+    index = TitleAuthorIndex()
+    assert index.find_best(session, "Emma", "Jane Austen", 0.85) is None
+
+    _add_book(session, 2, "Emma", "Jane Austen", datetime(2024, 2, 1, tzinfo=UTC))
+    match = index.find_best(session, "Emma", "Jane Austen", 0.85)
+    assert match is not None
+    assert match.book_id == 2
+
+    book = session.get(Book, 1)
+    assert book is not None
+    book.title = "Dune Messiah"
+    book.last_modified = datetime(2024, 3, 1, tzinfo=UTC)
+    session.commit()
+
+    assert index.find_best(session, "Dune", "Frank Herbert", 0.95) is None
+    match = index.find_best(session, "Dune Messiah", "Frank Herbert", 0.95)
+    assert match is not None
+    assert match.book_id == 1
+
+
+def test_refresh_rebuilds_after_delete(session: Session) -> None:
+    """Test deleted books disappear from the index."""
+    _add_book(session, 1, "Dune", "Frank Herbert", datetime(2024, 1, 1, tzinfo=UTC))
+    _add_book(session, 2, "Emma", "Jane Austen", datetime(2024, 1, 1, tzinfo=UTC))
+    index = TitleAuthorIndex()
+    index.refresh(session)
+    assert len(index) == 2
+
+    link = session.get(BookAuthorLink, 1)
+    session.delete(link)
+    session.delete(session.get(Book, 1))
+    session.commit()
+
+    assert index.find_best(session, "Dune", "Frank Herbert", 0.85) is None
+    assert len(index) == 1
+
+
+def test_strategy_uses_library_index(session: Session, tmp_path: Path) -> None:
+    """Test the duplicate strategy resolves matches through the registry."""
+    _add_book(session, 7, "Emma", "Jane Austen", datetime(2024, 1, 1, tzinfo=UTC))
+    library = Library(
+        id=1, name="Main", calibre_db_path=str(tmp_path), calibre_db_file="m.db"
+    )
+    strategy = TitleAuthorLevenshteinDuplicateStrategy(
+        index_registry=TitleAuthorIndexRegistry()
+    )
+
+    result = strategy.find_duplicate(
+        session=session,
+        library=library,
+        file_path=tmp_path / "emma.epub",
+        title="Emma.",
+        author_name="Jane Austen",
+        file_format="epub",
+    )
+
+    assert result == 7
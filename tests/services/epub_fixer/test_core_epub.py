@@ -21,6 +21,7 @@ from pathlib import Path
 import pytest
 
 from bookcard.models.epub_fixer import EPUBFixType
+from bookcard.services.epub_fixer.core import epub as epub_module
 from bookcard.services.epub_fixer.core.epub import (
     EPUBContents,
     EPUBReader,
@@ -225,3 +226,158 @@ def test_epub_reader_read_string_path(minimal_epub: Path) -> None:
     contents = reader.read(str(minimal_epub))
 
     assert len(contents.files) > 0
+
+
+def _raw_entry_data(epub_path: Path, name: str) -> tuple[int, int, bytes]:
+    """Get compress type, CRC and compressed bytes of an archive entry."""
+    with zipfile.ZipFile(epub_path, "r") as zip_ref:
+        info = zip_ref.getinfo(name)
+        with epub_path.open("rb") as f:
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = (
+                int.from_bytes(f.read(2), "little"),
+                int.from_bytes(f.read(2), "little"),
+            )
+            f.seek(name_len + extra_len, 1)
+            return info.compress_type, info.CRC, f.read(info.compress_size)
+
+
+def test_epub_writer_copies_unmodified_entries_raw(
+    minimal_epub: Path, temp_dir: Path
+) -> None:
+    """Test unmodified entries keep their compressed bytes on rewrite."""
+    with zipfile.ZipFile(minimal_epub, "a") as zip_ref:
+        zip_ref.writestr("image.jpg", b"\x00" * 4096, compress_type=zipfile.ZIP_STORED)
+        zip_ref.writestr(
+            "font.otf", b"glyphs" * 500, compress_type=zipfile.ZIP_DEFLATED
+        )
+    contents = EPUBReader().read(minimal_epub)
+    contents.files["chapter1.html"] = "<html><body>fixed</body></html>"
+
+    output_path = temp_dir / "output.epub"
+    EPUBWriter().write(contents, output_path)
+
+    for name in ("image.jpg", "font.otf", "content.opf"):
+        assert _raw_entry_data(output_path, name) == _raw_entry_data(minimal_epub, name)
+    rewritten = EPUBReader().read(output_path)
+    assert rewritten.files["chapter1.html"] == "<html><body>fixed</body></html>"
+    assert rewritten.binary_files["font.otf"] == b"glyphs" * 500
+    with zipfile.ZipFile(output_path, "r") as zip_ref:
+        assert zip_ref.testzip() is None
+        assert zip_ref.namelist()[0] == "mimetype"
+
+
+class _UnseekableWriter:
+    """Write-only stream, so ``zipfile`` writes entries with data descriptors."""
+
+    def __init__(self, path: Path) -> None:
+        self._file = path.open("wb")
+
+    def write(self, data: bytes) -> int:
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _write_streamed_epub(epub_path: Path, entries: dict[str, bytes]) -> None:
+    """Write an EPUB whose entries all use data descriptors."""
+    stream = _UnseekableWriter(epub_path)
+    try:
+        with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as zip_ref:  # type: ignore[arg-type]
+            zip_ref.writestr(
+                "mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED
+            )
+            for name, data in entries.items():
+                zip_ref.writestr(name, data)
+    finally:
+        stream.close()
+
+
+@pytest.mark.parametrize("raw_copy_supported", [True, False])
+def test_epub_writer_round_trips_data_descriptor_entries(
+    minimal_epub: Path,
+    temp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    raw_copy_supported: bool,
+) -> None:
+    """Test entries written with data descriptors survive a rewrite.
+
+    Without the ``zipfile`` internals used for raw copies, entries are
+    recompressed instead.
+    """
+    with zipfile.ZipFile(minimal_epub, "r") as zip_ref:
+        entries = {
+            name: zip_ref.read(name)
+            for name in zip_ref.namelist()
+            if name != "mimetype"
+        }
+    entries["font.otf"] = b"glyphs" * 500
+    source = temp_dir / "streamed.epub"
+    _write_streamed_epub(source, entries)
+    with zipfile.ZipFile(source, "r") as zip_ref:
+        assert zip_ref.getinfo("font.otf").flag_bits & 0x08
+    if not raw_copy_supported:
+        monkeypatch.setattr(
+            epub_module,
+            "_ZIPFILE_WRITER_INTERNALS",
+            (*epub_module._ZIPFILE_WRITER_INTERNALS, "_missing_internal"),
+        )
+    recompressed: list[str] = []
+    recompress = epub_module._recompress_entry
+
+    def _spy(src: zipfile.ZipFile, dst: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+        recompressed.append(info.filename)
+        recompress(src, dst, info)
+
+    monkeypatch.setattr(epub_module, "_recompress_entry", _spy)
+    contents = EPUBReader().read(source)
+    contents.files["chapter1.html"] = "<html><body>fixed</body></html>"
+
+    output_path = temp_dir / "output.epub"
+    EPUBWriter().write(contents, output_path)
+
+    with zipfile.ZipFile(output_path, "r") as zip_ref:
+        assert zip_ref.testzip() is None
+        assert zip_ref.read("font.otf") == b"glyphs" * 500
+        assert zip_ref.read("content.opf") == entries["content.opf"]
+    assert ("font.otf" in recompressed) is not raw_copy_supported
+
+
+def test_epub_writer_rewrites_source_in_place(minimal_epub: Path) -> None:
+    """Test an EPUB can be written back over the archive it was read from."""
+    with zipfile.ZipFile(minimal_epub, "a") as zip_ref:
+        zip_ref.writestr("image.jpg", b"old image")
+    contents = EPUBReader().read(minimal_epub)
+    contents.binary_files["image.jpg"] = b"new image"
+    contents.binary_files["extra.png"] = b"added"
+    del contents.files["chapter1.html"]
+
+    EPUBWriter().write(contents, minimal_epub)
+
+    rewritten = EPUBReader().read(minimal_epub)
+    assert rewritten.binary_files["image.jpg"] == b"new image"
+    assert rewritten.binary_files["extra.png"] == b"added"
+    assert "chapter1.html" not in rewritten.entries
+    assert "content.opf" in rewritten.files
+    assert list(minimal_epub.parent.glob("*.tmp")) == []
+
+
+def test_epub_reader_reads_binary_entries_lazily(minimal_epub: Path) -> None:
+    """Test binary entries are read from the archive only on access."""
+    with zipfile.ZipFile(minimal_epub, "a") as zip_ref:
+        zip_ref.writestr("image.jpg", b"image data")
+    contents = EPUBReader().read(minimal_epub)
+
+    assert contents.is_pristine("image.jpg")
+    assert contents.is_pristine("content.opf")
+    assert contents.binary_files["image.jpg"] == b"image data"
+
+    contents.files["content.opf"] += " "
+    contents.binary_files["image.jpg"] = b"image data"
+
+    assert not contents.is_pristine("content.opf")
+    assert not contents.is_pristine("image.jpg")
@@ -0,0 +1,100 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the per-file EPUB fix worker."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from bookcard.services.epub_fixer.services.worker import (
+    EPUBFixJob,
+    compute_fixer_hash,
+    fix_epub_file,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_fixer_hash_depends_on_default_language() -> None:
+    """Test a settings change invalidates recorded fingerprints."""
+    assert compute_fixer_hash("en") == compute_fixer_hash("en")
+    assert compute_fixer_hash("en") != compute_fixer_hash("fr")
+
+
+def test_clean_file_is_left_untouched(minimal_epub: Path, temp_dir: Path) -> None:
+    """Test a file needing no fixes is neither backed up nor rewritten."""
+    fix_epub_file(EPUBFixJob(str(minimal_epub), "en"))
+    stat = minimal_epub.stat()
+    backups = temp_dir / "backups"
+
+    outcome = fix_epub_file(
+        EPUBFixJob(str(minimal_epub), "en", backup_directory=str(backups))
+    )
+
+    assert outcome.error is None
+    assert outcome.fix_results == []
+    assert outcome.backup_path is None
+    assert (outcome.size, outcome.mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+    assert minimal_epub.stat().st_mtime_ns == stat.st_mtime_ns
+
+
+def test_fixed_file_is_backed_up_and_fingerprinted(
+    epub_with_language_issue: Path, temp_dir: Path
+) -> None:
+    """Test a fixed file is backed up and reports its rewritten fingerprint."""
+    backups = temp_dir / "backups"
+
+    outcome = fix_epub_file(
+        EPUBFixJob(str(epub_with_language_issue), "en", backup_directory=str(backups))
+    )
+
+    assert outcome.error is None
+    assert outcome.fix_results
+    assert outcome.backup_path is not None
+    assert outcome.size == epub_with_language_issue.stat().st_size
+    assert outcome.mtime_ns == epub_with_language_issue.stat().st_mtime_ns
+
+
+def test_unreadable_file_reports_error(temp_dir: Path) -> None:
+    """Test errors are returned instead of raised."""
+    outcome = fix_epub_file(EPUBFixJob(str(temp_dir / "missing.epub"), "en"))
+
+    assert outcome.error
+    assert outcome.size is None
+
+
+def test_slow_file_times_out(minimal_epub: Path) -> None:
+    """Test a file exceeding its timeout is abandoned."""
+    with patch(
+        "bookcard.services.epub_fixer.services.worker.EPUBReader.read",
+        side_effect=lambda _path: time.sleep(5),
+    ):
+        outcome = fix_epub_file(EPUBFixJob(str(minimal_epub), "en", timeout=1))
+
+    assert outcome.error == "Timed out after 1s"
+
+
+@pytest.mark.parametrize("timeout", [None, 0])
+def test_timeout_can_be_disabled(minimal_epub: Path, timeout: int | None) -> None:
+    """Test jobs without a timeout run normally."""
+    outcome = fix_epub_file(EPUBFixJob(str(minimal_epub), "en", timeout=timeout))
+
+    assert outcome.error is None
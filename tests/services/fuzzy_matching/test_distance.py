@@ -0,0 +1,91 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for bounded Levenshtein distance and similarity."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bookcard.services.fuzzy_matching.distance import (
+    levenshtein_distance,
+    max_edit_distance,
+    similarity_score,
+)
+
+
+def _reference_distance(s1: str, s2: str) -> int:
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, start=1):
+        current = [i]
+        for j, c2 in enumerate(s2, start=1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (c1 != c2))
+            )
+        previous = current
+    return previous[-1]
+
+
+@pytest.mark.parametrize(
+    ("s1", "s2", "expected"),
+    [
+        ("", "", 0),
+        ("abc", "", 3),
+        ("kitten", "sitting", 3),
+        ("flaw", "lawn", 2),
+        ("the hobbit tolkien", "the hobit tolkein", 3),
+    ],
+)
+def test_levenshtein_distance_unbounded(s1: str, s2: str, expected: int) -> None:
+    """Test exact distances without a bound."""
+    assert levenshtein_distance(s1, s2) == expected
+    assert levenshtein_distance(s2, s1) == expected
+
+
+def test_levenshtein_distance_bounded_matches_reference() -> None:
+    """Test bounded distance equals the full DP or reports bound + 1."""
+    rng = random.Random(7)  # noqa: S311
+    alphabet = "abcde "
+    for _ in range(500):
+        s1 = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        s2 = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        bound = rng.randint(0, 6)
+        expected = _reference_distance(s1, s2)
+        result = levenshtein_distance(s1, s2, max_distance=bound)
+        assert result == (expected if expected <= bound else bound + 1)
+
+
+def test_levenshtein_distance_length_gap_exceeds_bound() -> None:
+    """Test strings whose lengths differ by more than the bound exit early."""
+    assert levenshtein_distance("a" * 20, "a", max_distance=3) == 4
+
+
+@pytest.mark.parametrize(
+    ("length", "min_similarity", "expected"),
+    [(10, 0.7, 3), (20, 0.85, 3), (6, 0.85, 0), (4, 1.0, 0)],
+)
+def test_max_edit_distance(length: int, min_similarity: float, expected: int) -> None:
+    """Test the distance bound derived from a similarity threshold."""
+    assert max_edit_distance(length, min_similarity) == expected
+
+
+def test_similarity_score_threshold() -> None:
+    """Test scores under the threshold are reported as zero."""
+    assert similarity_score("kitten", "sitting", 0.5) == pytest.approx(1 - 3 / 7)
+    assert similarity_score("kitten", "sitting", 0.8) == 0.0
+    assert similarity_score("abcdefghij", "abcdefgxyz", 0.7) == pytest.approx(0.7)
+    assert similarity_score("", "abc", 0.5) == 0.0
@@ -0,0 +1,90 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the in-memory trigram index."""
+
+from __future__ import annotations
+
+import random
+
+from bookcard.services.fuzzy_matching.distance import similarity_score
+from bookcard.services.fuzzy_matching.trigram_index import TrigramIndex, trigrams
+
+
+def test_trigrams_pads_both_ends() -> None:
+    """Test trigrams include the padded start and end."""
+    assert trigrams("ab") == frozenset({"  a", " ab", "ab "})
+
+
+def test_search_returns_best_first() -> None:
+    """Test search ranks matches by similarity and honours the limit."""
+    index: TrigramIndex[int] = TrigramIndex()
+    index.add(1, "the hobbit tolkien")
+    index.add(2, "the hobit tolkien")
+    index.add(3, "dune herbert")
+
+    matches = index.search("the hobbit tolkien", 0.85)
+
+    assert [key for key, _ in matches] == [1, 2]
+    assert matches[0][1] == 1.0
+    assert index.search("the hobbit tolkien", 0.85, limit=1) == [(1, 1.0)]
+
+
+def test_add_replaces_and_remove_drops() -> None:
+    """Test re-adding a key replaces its text and removing forgets it."""
+    index: TrigramIndex[str] = TrigramIndex()
+    index.add("a", "dune herbert")
+    index.add("a", "emma austen")
+
+    assert len(index) == 1
+    assert index.text("a") == "emma austen"
+    assert index.search("dune herbert", 0.8) == []
+
+    index.remove("a")
+    assert "a" not in index
+    assert index.search("emma austen", 0.8) == []
+
+
+def test_compaction_keeps_live_entries() -> None:
+    """Test dead entries are compacted away without losing live keys."""
+    index: TrigramIndex[int] = TrigramIndex()
+    for i in range(3000):
+        index.add(i % 1000, f"book {i} author {i % 7}")
+
+    assert len(index) == 1000
+    assert index.search("book 2999 author 3", 0.9, limit=1) == [(999, 1.0)]
+
+
+def test_candidates_cover_all_matches() -> None:
+    """Test the candidate filter never drops a key above the threshold."""
+    rng = random.Random(3)  # noqa: S311
+    alphabet = "abcdefgh "
+    texts = {
+        i: "".join(rng.choice(alphabet) for _ in range(rng.randint(8, 30)))
+        for i in range(300)
+    }
+    index: TrigramIndex[int] = TrigramIndex()
+    for key, text in texts.items():
+        index.add(key, text)
+
+    for query in list(texts.values())[:40]:
+        mutated = query[:3] + "x" + query[4:]
+        expected = {
+            key
+            for key, text in texts.items()
+            if similarity_score(mutated, text) >= 0.85
+        }
+        assert expected <= index.candidates(mutated, 0.85)
+        assert {key for key, _ in index.search(mutated, 0.85)} == expected
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
 
     from tests.conftest import DummySession
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.config import Library
 from bookcard.models.ingest import IngestHistory, IngestStatus
 from bookcard.models.metadata import MetadataRecord
@@ -497,6 +498,7 @@ class TestAddBookToLibrary:
                 title=expected_title,
                 author_name=expected_author,
                 pubdate=None,
+                transfer_mode=TransferMode.COPY,
             )
 
     def test_add_book_to_library_updates_history(
@@ -27,6 +27,7 @@ from fastapi.responses import FileResponse, RedirectResponse
 
 from bookcard.models.core import Book
 from bookcard.repositories.models import BookWithFullRelations
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
 from bookcard.services.kobo.cover_service import KoboCoverService
 from bookcard.services.kobo.store_proxy_service import KoboStoreProxyService
 
@@ -245,6 +246,49 @@ def test_get_cover_image_success(
     cover_file.unlink()
 
 
+def test_get_cover_image_resized_with_thumbnail_cache(
+    mock_book_service: MagicMock,
+    mock_book_lookup_service: MagicMock,
+    mock_proxy_service: MagicMock,
+    book: Book,
+    book_with_rels: BookWithFullRelations,
+    tmp_path: Path,
+) -> None:
+    """Test the cover is served at the device size with caching headers."""
+    from PIL import Image
+
+    cover = tmp_path / "cover.jpg"
+    Image.new("RGB", (1000, 1500), "white").save(cover, format="JPEG")
+    mock_book_lookup_service.find_book_by_uuid.return_value = (1, book)
+    mock_book_service.get_book.return_value = book_with_rels
+    mock_book_service.get_thumbnail_path.return_value = cover
+    service = KoboCoverService(
+        book_service=mock_book_service,
+        book_lookup_service=mock_book_lookup_service,
+        proxy_service=mock_proxy_service,
+        thumbnail_cache=CoverThumbnailCache(tmp_path / "cache"),
+    )
+
+    result = service.get_cover_image(
+        book_uuid="test-uuid-123", width="355", height="530"
+    )
+
+    assert isinstance(result, FileResponse)
+    assert result.path != str(cover)
+    assert "etag" in result.headers
+    with Image.open(result.path) as thumb:
+        assert max(thumb.size) == 600
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("300", 300), ("0", None), ("-1", None), ("abc", None)],
+)
+def test_parse_dimension(value: str, expected: int | None) -> None:
+    """Test device-supplied dimensions are parsed defensively."""
+    assert KoboCoverService._parse_dimension(value) == expected
+
+
 def test_get_cover_image_book_not_found_redirect(
     cover_service: KoboCoverService,
     mock_book_lookup_service: MagicMock,
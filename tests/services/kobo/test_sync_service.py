@@ -30,7 +30,7 @@ from bookcard.models.kobo import (
     KoboSyncedBook,
 )
 from bookcard.models.reading import ReadStatus, ReadStatusEnum
-from bookcard.repositories.models import BookWithFullRelations, BookWithRelations
+from bookcard.repositories.models import BookWithFullRelations
 from bookcard.services.kobo.metadata_service import KoboMetadataService
 from bookcard.services.kobo.sync_service import KoboSyncService
 from bookcard.services.kobo.sync_token_service import SyncToken
@@ -43,6 +43,36 @@ if TYPE_CHECKING:
 # ============================================================================
 
 
+def _stub_books(
+    book_service: MagicMock, books: list[BookWithFullRelations]
+) -> list[tuple[str, int]]:
+    """Make the book service return ``books`` as sync candidates.
+
+    Parameters
+    ----------
+    book_service : MagicMock
+        Mock book service.
+    books : list[BookWithFullRelations]
+        Books to return, in sync order.
+
+    Returns
+    -------
+    list[tuple[str, int]]
+        Keyset keys returned for the books.
+    """
+    keys = [(f"2025-01-15 00:00:{i // 100:02d}.{i:06d}", i) for i in range(len(books))]
+
+    def _list_keys(**kwargs: object) -> list[tuple[str, int]]:
+        limit = kwargs.get("limit")
+        return keys[:limit] if isinstance(limit, int) else keys
+
+    book_service.list_modified_book_keys.side_effect = _list_keys
+    book_service.list_books_by_ids.side_effect = lambda ids, full=False: books[
+        : len(ids)
+    ]
+    return keys
+
+
 @pytest.fixture
 def mock_book_service() -> MagicMock:
     """Create a mock BookService.
@@ -53,7 +83,8 @@ def mock_book_service() -> MagicMock:
         Mock book service instance.
     """
     service = MagicMock()
-    service.list_books = MagicMock(return_value=([], 0))
+    service.list_modified_book_keys = MagicMock(return_value=[])
+    service.list_books_by_ids = MagicMock(return_value=[])
     service.get_book = MagicMock(return_value=None)
     return service
 
@@ -112,6 +143,7 @@ def mock_archived_book_repo() -> MagicMock:
     """
     repo = MagicMock()
     repo.find_by_user_library_and_book = MagicMock(return_value=None)
+    repo.find_book_ids_by_user_and_library = MagicMock(return_value=set())
     return repo
 
 
@@ -340,7 +372,7 @@ def test_sync_library_new_book(
     """
     # Set book timestamp after last_created to make it "new"
     book_with_rels.book.timestamp = datetime(2025, 1, 12, tzinfo=UTC)
-    mock_book_service.list_books.return_value = ([book_with_rels], 1)
+    _stub_books(mock_book_service, [book_with_rels])
     mock_metadata_service.create_book_entitlement.return_value = {"Id": "test-uuid-123"}
     mock_metadata_service.get_book_metadata.return_value = {"Title": "Test Book"}
 
@@ -378,7 +410,7 @@ def test_sync_library_changed_book(
     """
     # Set book timestamp to before last_created
     book_with_rels.book.timestamp = datetime(2025, 1, 1, tzinfo=UTC)
-    mock_book_service.list_books.return_value = ([book_with_rels], 1)
+    _stub_books(mock_book_service, [book_with_rels])
     mock_metadata_service.create_book_entitlement.return_value = {"Id": "test-uuid-123"}
     mock_metadata_service.get_book_metadata.return_value = {"Title": "Test Book"}
 
@@ -419,7 +451,7 @@ def test_sync_library_with_archived_book(
     mock_archived_book_repo.find_by_user_library_and_book.return_value = archived_book
     # Set book timestamp after last_created to make it "new"
     book_with_rels.book.timestamp = datetime(2025, 1, 12, tzinfo=UTC)
-    mock_book_service.list_books.return_value = ([book_with_rels], 1)
+    _stub_books(mock_book_service, [book_with_rels])
     mock_metadata_service.create_book_entitlement.return_value = {"Id": "test-uuid-123"}
     mock_metadata_service.get_book_metadata.return_value = {"Title": "Test Book"}
 
@@ -476,7 +508,7 @@ def test_sync_library_with_reading_state(
     mock_read_status_repo.find_by_user_library_book.return_value = read_status
     # Set book timestamp after last_created to make it "new"
     book_with_rels.book.timestamp = datetime(2025, 1, 12, tzinfo=UTC)
-    mock_book_service.list_books.return_value = ([book_with_rels], 1)
+    _stub_books(mock_book_service, [book_with_rels])
     mock_metadata_service.create_book_entitlement.return_value = {"Id": "test-uuid-123"}
     mock_metadata_service.get_book_metadata.return_value = {"Title": "Test Book"}
     mock_metadata_service.get_reading_state_response.return_value = {
@@ -517,7 +549,7 @@ def test_sync_library_continue_sync(
     """
     # Create 150 books to exceed SYNC_ITEM_LIMIT (100)
     books = [book_with_rels] * 150
-    mock_book_service.list_books.return_value = (books, 150)
+    _stub_books(mock_book_service, books)
     mock_metadata_service.create_book_entitlement.return_value = {"Id": "test-uuid-123"}
     mock_metadata_service.get_book_metadata.return_value = {"Title": "Test Book"}
 
@@ -564,7 +596,7 @@ def test_sync_library_changed_reading_states(
         last_modified=datetime(2025, 1, 15, tzinfo=UTC),
     )
     mock_reading_state_repo.find_by_user.return_value = [reading_state]
-    mock_book_service.list_books.return_value = ([book_with_rels], 1)
+    _stub_books(mock_book_service, [book_with_rels])
     mock_book_service.get_book.return_value = book_with_rels
     mock_metadata_service.create_book_entitlement.return_value = {"Id": "test-uuid-123"}
     mock_metadata_service.get_book_metadata.return_value = {"Title": "Test Book"}
@@ -588,11 +620,10 @@ def test_sync_library_changed_reading_states(
 def test_get_books_to_sync(
     sync_service: KoboSyncService,
     mock_book_service: MagicMock,
-    mock_synced_book_repo: MagicMock,
     book_with_rels: BookWithFullRelations,
     sync_token: SyncToken,
 ) -> None:
-    """Test getting books to sync.
+    """Test getting books to sync enriches only emitted books and moves the cursor.
 
     Parameters
     ----------
@@ -600,351 +631,234 @@ def test_get_books_to_sync(
         Service instance.
     mock_book_service : MagicMock
         Mock book service.
-    mock_synced_book_repo : MagicMock
-        Mock synced book repository.
     book_with_rels : BookWithFullRelations
         Test book with relations.
     sync_token : SyncToken
         Sync token.
     """
-    mock_book_service.list_books.return_value = ([book_with_rels], 1)
+    keys = _stub_books(mock_book_service, [book_with_rels])
 
-    results = sync_service._get_books_to_sync(
+    results, has_more = sync_service._get_books_to_sync(
         user_id=1, library_id=1, sync_token=sync_token, only_shelves=False
     )
 
     assert len(results) == 1
-    mock_book_service.list_books.assert_called_once_with(
-        page=1, page_size=1000, full=True
+    assert has_more is False
+    mock_book_service.list_modified_book_keys.assert_called_once_with(
+        after=("2025-01-10 00:00:00", 0),
+        formats=("EPUB", "KEPUB"),
+        book_ids=None,
+        limit=101,
     )
+    mock_book_service.list_books_by_ids.assert_called_once_with([0], full=True)
+    assert sync_token.books_cursor == keys[0]
 
 
-# ============================================================================
-# Tests for KoboSyncService._get_shelf_book_ids
-# ============================================================================
-
-
-def test_get_shelf_book_ids_disabled(
+def test_get_books_to_sync_resumes_from_cursor(
     sync_service: KoboSyncService,
+    mock_book_service: MagicMock,
+    sync_token: SyncToken,
 ) -> None:
-    """Test getting shelf book IDs when disabled.
+    """Test a token cursor is used as-is and kept when nothing changed.
 
     Parameters
     ----------
     sync_service : KoboSyncService
         Service instance.
+    mock_book_service : MagicMock
+        Mock book service.
+    sync_token : SyncToken
+        Sync token.
     """
-    result = sync_service._get_shelf_book_ids(
-        user_id=1, library_id=1, only_shelves=False
-    )
-    assert result is None
+    sync_token.books_cursor = ("2025-01-12 08:30:00.123456+00:00", 7)
 
+    results, has_more = sync_service._get_books_to_sync(
+        user_id=1, library_id=1, sync_token=sync_token, only_shelves=False
+    )
 
-def test_get_shelf_book_ids_no_shelf_service(
-    sync_service: KoboSyncService,
-) -> None:
-    """Test getting shelf book IDs when shelf service is None.
-
-    Parameters
-    ----------
-    sync_service : KoboSyncService
-        Service instance.
-    """
-    sync_service._shelf_service = None
-    result = sync_service._get_shelf_book_ids(
-        user_id=1, library_id=1, only_shelves=True
+    assert results == []
+    assert has_more is False
+    assert mock_book_service.list_modified_book_keys.call_count == 1
+    assert mock_book_service.list_modified_book_keys.call_args.kwargs["after"] == (
+        "2025-01-12 08:30:00.123456+00:00",
+        7,
     )
-    assert result is None
+    assert sync_token.books_cursor == ("2025-01-12 08:30:00.123456+00:00", 7)
 
 
-def test_get_shelf_book_ids_with_shelves(
+def test_get_books_to_sync_full_sync_without_token(
     sync_service: KoboSyncService,
-    mock_shelf_service: MagicMock,
+    mock_book_service: MagicMock,
 ) -> None:
-    """Test getting shelf book IDs with shelves.
+    """Test an empty token starts from the beginning of the library.
 
     Parameters
     ----------
     sync_service : KoboSyncService
         Service instance.
-    mock_shelf_service : MagicMock
-        Mock shelf service.
+    mock_book_service : MagicMock
+        Mock book service.
     """
-    from bookcard.models.shelves import BookShelfLink, Shelf
-
-    shelf = Shelf(
-        id=1,
-        uuid="shelf-uuid",
-        name="Test Shelf",
-        library_id=1,
-        user_id=1,
+    sync_service._get_books_to_sync(
+        user_id=1, library_id=1, sync_token=SyncToken(), only_shelves=False
     )
-    book_link = BookShelfLink(id=1, shelf_id=1, book_id=1)
-    shelf.book_links = [book_link]
-    mock_shelf_service.list_user_shelves.return_value = [shelf]
-    sync_service._shelf_service = mock_shelf_service
 
-    result = sync_service._get_shelf_book_ids(
-        user_id=1, library_id=1, only_shelves=True
-    )
+    assert mock_book_service.list_modified_book_keys.call_args.kwargs["after"] is None
 
-    assert result == {1}
 
-
-# ============================================================================
-# Tests for KoboSyncService._filter_books_for_sync
-# ============================================================================
-
-
-def test_filter_books_for_sync(
+def test_get_books_to_sync_sends_unsynced_books_behind_cursor(
     sync_service: KoboSyncService,
+    mock_book_service: MagicMock,
+    mock_synced_book_repo: MagicMock,
+    mock_shelf_service: MagicMock,
     book_with_rels: BookWithFullRelations,
     sync_token: SyncToken,
 ) -> None:
-    """Test filtering books for sync.
+    """Test shelf books older than the cursor are sent if never synced.
 
     Parameters
     ----------
     sync_service : KoboSyncService
         Service instance.
+    mock_book_service : MagicMock
+        Mock book service.
+    mock_synced_book_repo : MagicMock
+        Mock synced book repository.
+    mock_shelf_service : MagicMock
+        Mock shelf service.
     book_with_rels : BookWithFullRelations
         Test book with relations.
     sync_token : SyncToken
         Sync token.
     """
-    books = [book_with_rels]
-    synced_book_ids: set[int] = set()
-    shelf_book_ids: set[int] | None = None
-
-    results = sync_service._filter_books_for_sync(
-        books, synced_book_ids, shelf_book_ids, sync_token
-    )
-
-    assert len(results) == 1
+    shelf = MagicMock()
+    shelf.book_links = [MagicMock(book_id=1), MagicMock(book_id=2)]
+    mock_shelf_service.list_user_shelves.return_value = [shelf]
+    mock_synced_book_repo.find_book_ids_by_user_and_library.return_value = {2}
+    sync_token.books_cursor = ("2025-01-12 00:00:00", 5)
 
+    def _list_keys(**kwargs: object) -> list[tuple[str, int]]:
+        if kwargs.get("after") is None:
+            return [("2025-01-01 00:00:00", 1)]
+        return []
 
-def test_filter_books_for_sync_no_id(
-    sync_service: KoboSyncService,
-    book: Book,
-    sync_token: SyncToken,
-) -> None:
-    """Test filtering books for sync when book has no ID.
+    mock_book_service.list_modified_book_keys.side_effect = _list_keys
+    mock_book_service.list_books_by_ids.return_value = [book_with_rels]
 
-    Parameters
-    ----------
-    sync_service : KoboSyncService
-        Service instance.
-    book : Book
-        Test book.
-    sync_token : SyncToken
-        Sync token.
-    """
-    book.id = None
-    book_with_rels = BookWithRelations(book=book, authors=[], series=None, formats=[])
-    books = [book_with_rels]
-    synced_book_ids: set[int] = set()
-    shelf_book_ids: set[int] | None = None
-
-    results = sync_service._filter_books_for_sync(
-        books, synced_book_ids, shelf_book_ids, sync_token
+    results, has_more = sync_service._get_books_to_sync(
+        user_id=1, library_id=1, sync_token=sync_token, only_shelves=True
     )
 
-    assert len(results) == 0
-
-
-# ============================================================================
-# Tests for KoboSyncService._should_sync_book
-# ============================================================================
+    assert results == [book_with_rels]
+    assert has_more is False
+    first_call = mock_book_service.list_modified_book_keys.call_args_list[0]
+    assert first_call.kwargs["book_ids"] == {1}
+    second_call = mock_book_service.list_modified_book_keys.call_args_list[1]
+    assert second_call.kwargs["book_ids"] == {1, 2}
+    mock_book_service.list_books_by_ids.assert_called_once_with([1], full=True)
+    # Backfilled books do not move the cursor
+    assert sync_token.books_cursor == ("2025-01-12 00:00:00", 5)
 
 
-def test_should_sync_book_new(
+def test_get_books_to_sync_requeues_archived_books(
     sync_service: KoboSyncService,
-    book: Book,
-    book_with_rels: BookWithFullRelations,
+    mock_book_service: MagicMock,
+    mock_archived_book_repo: MagicMock,
     sync_token: SyncToken,
 ) -> None:
-    """Test should sync book when new.
+    """Test archived books whose synced record was removed are looked up.
 
     Parameters
     ----------
     sync_service : KoboSyncService
         Service instance.
-    book : Book
-        Test book.
-    book_with_rels : BookWithFullRelations
-        Test book with relations.
+    mock_book_service : MagicMock
+        Mock book service.
+    mock_archived_book_repo : MagicMock
+        Mock archived book repository.
     sync_token : SyncToken
         Sync token.
     """
-    synced_book_ids: set[int] = set()
-    shelf_book_ids: set[int] | None = None
+    mock_archived_book_repo.find_book_ids_by_user_and_library.return_value = {3}
 
-    result = sync_service._should_sync_book(
-        book, book_with_rels, synced_book_ids, shelf_book_ids, sync_token
+    sync_service._get_books_to_sync(
+        user_id=1, library_id=1, sync_token=sync_token, only_shelves=False
     )
 
-    assert result is True
+    first_call = mock_book_service.list_modified_book_keys.call_args_list[0]
+    assert first_call.kwargs["book_ids"] == {3}
 
 
-def test_should_sync_book_already_synced_not_modified(
-    sync_service: KoboSyncService,
-    book: Book,
-    book_with_rels: BookWithFullRelations,
-    sync_token: SyncToken,
-) -> None:
-    """Test should sync book when already synced and not modified.
-
-    Parameters
-    ----------
-    sync_service : KoboSyncService
-        Service instance.
-    book : Book
-        Test book.
-    book_with_rels : BookWithFullRelations
-        Test book with relations.
-    sync_token : SyncToken
-        Sync token.
-    """
-    book.last_modified = datetime(2025, 1, 5, tzinfo=UTC)
-    synced_book_ids: set[int] = {1}
-    shelf_book_ids: set[int] | None = None
-
-    result = sync_service._should_sync_book(
-        book, book_with_rels, synced_book_ids, shelf_book_ids, sync_token
-    )
-
-    assert result is False
+# ============================================================================
+# Tests for KoboSyncService._get_shelf_book_ids
+# ============================================================================
 
 
-def test_should_sync_book_already_synced_modified(
+def test_get_shelf_book_ids_disabled(
     sync_service: KoboSyncService,
-    book: Book,
-    book_with_rels: BookWithFullRelations,
-    sync_token: SyncToken,
 ) -> None:
-    """Test should sync book when already synced but modified.
+    """Test getting shelf book IDs when disabled.
 
     Parameters
     ----------
     sync_service : KoboSyncService
         Service instance.
-    book : Book
-        Test book.
-    book_with_rels : BookWithFullRelations
-        Test book with relations.
-    sync_token : SyncToken
-        Sync token.
     """
-    book.last_modified = datetime(2025, 1, 15, tzinfo=UTC)
-    synced_book_ids: set[int] = {1}
-    shelf_book_ids: set[int] | None = None
-
-    result = sync_service._should_sync_book(
-        book, book_with_rels, synced_book_ids, shelf_book_ids, sync_token
+    result = sync_service._get_shelf_book_ids(
+        user_id=1, library_id=1, only_shelves=False
     )
-
-    assert result is True
+    assert result is None
 
 
-def test_should_sync_book_not_in_shelf(
+def test_get_shelf_book_ids_no_shelf_service(
     sync_service: KoboSyncService,
-    book: Book,
-    book_with_rels: BookWithFullRelations,
-    sync_token: SyncToken,
 ) -> None:
-    """Test should sync book when not in shelf.
+    """Test getting shelf book IDs when shelf service is None.
 
     Parameters
     ----------
     sync_service : KoboSyncService
         Service instance.
-    book : Book
-        Test book.
-    book_with_rels : BookWithFullRelations
-        Test book with relations.
-    sync_token : SyncToken
-        Sync token.
     """
-    synced_book_ids: set[int] = set()
-    shelf_book_ids: set[int] = {2}  # Different book ID
-
-    result = sync_service._should_sync_book(
-        book, book_with_rels, synced_book_ids, shelf_book_ids, sync_token
+    sync_service._shelf_service = None
+    result = sync_service._get_shelf_book_ids(
+        user_id=1, library_id=1, only_shelves=True
     )
-
-    assert result is False
+    assert result is None
 
 
-def test_should_sync_book_no_epub_format(
+def test_get_shelf_book_ids_with_shelves(
     sync_service: KoboSyncService,
-    book: Book,
-    sync_token: SyncToken,
+    mock_shelf_service: MagicMock,
 ) -> None:
-    """Test should sync book when no EPUB format.
+    """Test getting shelf book IDs with shelves.
 
     Parameters
     ----------
     sync_service : KoboSyncService
         Service instance.
-    book : Book
-        Test book.
-    sync_token : SyncToken
-        Sync token.
+    mock_shelf_service : MagicMock
+        Mock shelf service.
     """
-    book_with_rels = BookWithFullRelations(
-        book=book,
-        authors=[],
-        series=None,
-        series_id=None,
-        tags=[],
-        identifiers=[],
-        description=None,
-        publisher=None,
-        publisher_id=None,
-        languages=[],
-        language_ids=[],
-        rating=None,
-        rating_id=None,
-        formats=[{"format": "MOBI", "name": "test.mobi", "size": 1000}],
-    )
-    synced_book_ids: set[int] = set()
-    shelf_book_ids: set[int] | None = None
+    from bookcard.models.shelves import BookShelfLink, Shelf
 
-    result = sync_service._should_sync_book(
-        book, book_with_rels, synced_book_ids, shelf_book_ids, sync_token
+    shelf = Shelf(
+        id=1,
+        uuid="shelf-uuid",
+        name="Test Shelf",
+        library_id=1,
+        user_id=1,
     )
+    book_link = BookShelfLink(id=1, shelf_id=1, book_id=1)
+    shelf.book_links = [book_link]
+    mock_shelf_service.list_user_shelves.return_value = [shelf]
+    sync_service._shelf_service = mock_shelf_service
 
-    assert result is False
-
-
-def test_should_sync_book_no_id(
-    sync_service: KoboSyncService,
-    book: Book,
-    book_with_rels: BookWithFullRelations,
-    sync_token: SyncToken,
-) -> None:
-    """Test should sync book when book has no ID.
-
-    Parameters
-    ----------
-    sync_service : KoboSyncService
-        Service instance.
-    book : Book
-        Test book.
-    book_with_rels : BookWithFullRelations
-        Test book with relations.
-    sync_token : SyncToken
-        Sync token.
-    """
-    book.id = None
-    synced_book_ids: set[int] = set()
-    shelf_book_ids: set[int] | None = None
-
-    result = sync_service._should_sync_book(
-        book, book_with_rels, synced_book_ids, shelf_book_ids, sync_token
+    result = sync_service._get_shelf_book_ids(
+        user_id=1, library_id=1, only_shelves=True
     )
 
-    assert result is False
+    assert result == {1}
 
 
 # ============================================================================
@@ -237,6 +237,38 @@ def test_to_headers_partial_timestamps() -> None:
     assert "x-kobo-sync" in headers
 
 
+def test_books_cursor_round_trip() -> None:
+    """Test the book keyset cursor survives encoding to and from headers."""
+    token = SyncToken(books_cursor=("2025-01-15 12:00:00.123456+00:00", 42))
+    headers: dict[str, str] = {}
+
+    token.to_headers(headers)
+    parsed = SyncToken.from_headers(headers)
+
+    assert parsed.books_cursor == ("2025-01-15 12:00:00.123456+00:00", 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        None,
+        "2025-01-15",
+        {"LastModified": "", "BookId": 1},
+        {"LastModified": "2025-01-15", "BookId": "1"},
+        {"LastModified": "2025-01-15", "BookId": True},
+    ],
+)
+def test_from_headers_invalid_books_cursor(cursor: object) -> None:
+    """Test malformed cursors are ignored."""
+    data = {"BooksLastModified": "2025-01-15T12:00:00Z", "BooksCursor": cursor}
+    encoded = base64.b64encode(json.dumps(data).encode()).decode()
+
+    token = SyncToken.from_headers({"x-kobo-sync": encoded})
+
+    assert token.books_cursor is None
+    assert token.books_last_modified == datetime(2025, 1, 15, 12, tzinfo=UTC)
+
+
 # ============================================================================
 # Tests for SyncToken.merge_from_store_response
 # ============================================================================
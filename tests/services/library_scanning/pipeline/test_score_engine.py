@@ -0,0 +1,202 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the blocked author similarity engine."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from bookcard.models.author_metadata import (
+    AuthorMetadata,
+    AuthorSimilarity,
+    AuthorWork,
+    WorkSubject,
+)
+from bookcard.services.library_scanning.pipeline.score import (
+    CompositeSimilarityCalculator,
+    GenreSimilarityCalculator,
+    RatingsSimilarityCalculator,
+    SubjectRepository,
+    TimePeriodSimilarityCalculator,
+    WorkCountSimilarityCalculator,
+)
+from bookcard.services.library_scanning.pipeline.score_engine import (
+    BlockedSimilarityEngine,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Create an in-memory database session."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _add_author(
+    session: Session,
+    author_id: int,
+    subjects: list[str],
+    *,
+    work_count: int | None = None,
+    ratings_count: int | None = None,
+    birth_date: str | None = None,
+) -> AuthorMetadata:
+    author = AuthorMetadata(
+        id=author_id,
+        name=f"Author {author_id}",
+        work_count=work_count,
+        ratings_count=ratings_count,
+        birth_date=birth_date,
+    )
+    session.add(author)
+    work = AuthorWork(author_metadata_id=author_id, work_key=f"OL{author_id}W")
+    session.add(work)
+    session.flush()
+    for subject in subjects:
+        session.add(WorkSubject(author_work_id=work.id, subject_name=subject))
+    session.commit()
+    return author
+
+
+def _stored_pairs(session: Session) -> dict[tuple[int, int], float]:
+    rows = session.exec(select(AuthorSimilarity)).all()
+    return {(r.author1_id, r.author2_id): r.similarity_score for r in rows}
+
+
+def test_scores_match_default_calculator(session: Session) -> None:
+    """Test engine scores equal the default composite calculator."""
+    a = _add_author(
+        session,
+        1,
+        ["fantasy", "magic", "dragons"],
+        work_count=10,
+        ratings_count=100,
+        birth_date="1950",
+    )
+    b = _add_author(
+        session,
+        2,
+        ["fantasy", "magic", "history"],
+        work_count=20,
+        ratings_count=50,
+        birth_date="31 July 1965",
+    )
+    calculator = CompositeSimilarityCalculator([
+        (GenreSimilarityCalculator(SubjectRepository(session)), 0.5),
+        (WorkCountSimilarityCalculator(), 0.2),
+        (RatingsSimilarityCalculator(), 0.15),
+        (TimePeriodSimilarityCalculator(), 0.15),
+    ])
+
+    result = BlockedSimilarityEngine(session, min_similarity=0.0).run([a, b])
+
+    assert result.similarities_created == 1
+    assert _stored_pairs(session)[1, 2] == pytest.approx(calculator.calculate(a, b))
+
+
+def test_only_authors_sharing_subjects_are_compared(session: Session) -> None:
+    """Test pairs without a shared subject are never scored."""
+    authors = [
+        _add_author(session, 1, ["fantasy"], work_count=10),
+        _add_author(session, 2, ["fantasy"], work_count=10),
+        _add_author(session, 3, ["cooking"], work_count=10),
+    ]
+
+    result = BlockedSimilarityEngine(session).run(authors)
+
+    assert result.candidate_pairs == 1
+    assert set(_stored_pairs(session)) == {(1, 2)}
+
+
+def test_existing_similarities_are_skipped(session: Session) -> None:
+    """Test pairs that already have a similarity are not inserted again."""
+    authors = [
+        _add_author(session, 1, ["fantasy"]),
+        _add_author(session, 2, ["fantasy"]),
+    ]
+    session.add(AuthorSimilarity(author1_id=1, author2_id=2, similarity_score=0.9))
+    session.commit()
+
+    result = BlockedSimilarityEngine(session).run(authors)
+
+    assert result.similarities_created == 0
+    assert _stored_pairs(session) == {(1, 2): 0.9}
+
+
+def test_keeps_top_neighbors_per_author(session: Session) -> None:
+    """Test only the best ``max_neighbors`` matches of each author are kept."""
+    authors = [
+        _add_author(session, 1, ["a", "b", "c"]),
+        _add_author(session, 2, ["a", "b", "c"]),
+        _add_author(session, 3, ["a", "x", "y", "z"]),
+    ]
+
+    BlockedSimilarityEngine(session, max_neighbors=1).run(authors)
+
+    # 1 and 2 are each other's best match; 3's best match is 1 or 2
+    pairs = set(_stored_pairs(session))
+    assert (1, 2) in pairs
+    assert len(pairs) == 2
+
+
+def test_target_author_mode(session: Session) -> None:
+    """Test single-author mode only scores pairs involving the target."""
+    authors = [
+        _add_author(session, 1, ["fantasy"]),
+        _add_author(session, 2, ["fantasy"]),
+        _add_author(session, 3, ["fantasy"]),
+    ]
+
+    result = BlockedSimilarityEngine(session).run(authors, target_author_id=3)
+
+    assert result.candidate_pairs == 2
+    assert set(_stored_pairs(session)) == {(1, 3), (2, 3)}
+
+
+def test_generic_subjects_do_not_block(session: Session) -> None:
+    """Test subjects above ``max_block_size`` do not generate candidates."""
+    authors = [
+        _add_author(session, 1, ["fiction", "whaling"]),
+        _add_author(session, 2, ["fiction", "whaling"]),
+        _add_author(session, 3, ["fiction"]),
+    ]
+
+    result = BlockedSimilarityEngine(session, max_block_size=2).run(authors)
+
+    assert result.candidate_pairs == 1
+    assert set(_stored_pairs(session)) == {(1, 2)}
+
+
+def test_cancellation_stops_without_inserting(session: Session) -> None:
+    """Test a cancelled run inserts nothing."""
+    authors = [
+        _add_author(session, 1, ["fantasy"]),
+        _add_author(session, 2, ["fantasy"]),
+    ]
+
+    result = BlockedSimilarityEngine(session).run(authors, check_cancelled=lambda: True)
+
+    assert result.cancelled is True
+    assert _stored_pairs(session) == {}
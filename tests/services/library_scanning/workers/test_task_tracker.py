@@ -15,6 +15,7 @@
 
 """Tests for ScanTaskTracker to achieve 100% coverage."""
 
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -22,6 +23,7 @@ import pytest
 from sqlalchemy.exc import OperationalError
 
 from bookcard.services.library_scanning.workers.task_tracker import ScanTaskTracker
+from bookcard.services.tasks.events import TaskEventBus
 
 
 @pytest.fixture
@@ -110,6 +112,34 @@ class TestScanTaskTrackerUpdateStageProgress:
             call_args = mock_retry.call_args
             assert "update task 123 progress" in str(call_args)
 
+    def test_update_stage_progress_coalesces_writes(
+        self, tracker: ScanTaskTracker
+    ) -> None:
+        """Test repeated updates within a stage are published, not written."""
+        ScanTaskTracker._progress_writes[456] = ("score", time.monotonic(), 7)
+        bus = TaskEventBus()
+        subscription = bus.subscribe(user_id=7)
+        try:
+            with (
+                patch.object(tracker, "_with_retry") as mock_retry,
+                patch(
+                    "bookcard.services.library_scanning.workers.task_tracker.get_task_event_bus",
+                    return_value=bus,
+                ),
+            ):
+                tracker.update_stage_progress(456, "score", 0.5)
+                mock_retry.assert_not_called()
+
+                # A new stage is written immediately
+                tracker.update_stage_progress(456, "completion", 0.0)
+                mock_retry.assert_called_once()
+        finally:
+            tracker._forget_progress(456)
+
+        event = subscription.get(timeout=0)
+        assert event is not None
+        assert event.metadata == {"current_stage": "score", "stage_progress": 0.5}
+
 
 class TestScanTaskTrackerCompleteTask:
     """Test ScanTaskTracker.complete_task method."""
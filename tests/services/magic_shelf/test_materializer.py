@@ -0,0 +1,239 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for materialized Magic Shelf membership."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from bookcard.models.core import Book
+from bookcard.models.magic_shelf_rules import (
+    GroupRule,
+    Rule,
+    RuleField,
+    RuleOperator,
+)
+from bookcard.models.shelves import MagicShelfState
+from bookcard.repositories.calibre.queries import BookQueryBuilder
+from bookcard.repositories.calibre.reads import BookReadOperations
+from bookcard.repositories.calibre.retry import SQLiteRetryPolicy
+from bookcard.repositories.calibre.unwrapping import ResultUnwrapper
+from bookcard.repositories.magic_shelf_repository import (
+    MagicShelfMembershipRepository,
+)
+from bookcard.services.magic_shelf.evaluator import BookRuleEvaluator
+from bookcard.services.magic_shelf.materializer import MagicShelfMaterializer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from bookcard.repositories.interfaces import IBookRepository
+
+SHELF_ID = 1
+
+
+class _SessionManager:
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    @contextmanager
+    def get_session(self) -> Iterator[Session]:
+        yield self._session
+
+    get_read_session = get_session
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Create an in-memory session holding both Calibre and app tables."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _book_repo(session: Session) -> IBookRepository:
+    return cast(
+        "IBookRepository",
+        BookReadOperations(
+            session_manager=_SessionManager(session),  # type: ignore[arg-type]
+            retry_policy=SQLiteRetryPolicy(),
+            unwrapper=ResultUnwrapper(),
+            queries=BookQueryBuilder(),
+            enrichment=MagicMock(),
+            search_service=MagicMock(),
+            statistics_service=MagicMock(),
+            pathing=MagicMock(),
+            calibre_db_path=Path("test.db"),
+        ),
+    )
+
+
+@pytest.fixture
+def book_repo(session: Session) -> IBookRepository:
+    """Calibre reads over the in-memory session."""
+    return _book_repo(session)
+
+
+def _title_rule(value: str) -> GroupRule:
+    return GroupRule(
+        rules=[Rule(field=RuleField.TITLE, operator=RuleOperator.CONTAINS, value=value)]
+    )
+
+
+def _set_book(session: Session, book_id: int, title: str, minute: int) -> None:
+    book = session.get(Book, book_id) or Book(id=book_id, uuid=f"uuid-{book_id}")
+    book.title = title
+    book.last_modified = datetime(2025, 1, 1, 12, minute, tzinfo=UTC)
+    session.add(book)
+    session.commit()
+
+
+def _members(session: Session) -> list[int]:
+    return MagicShelfMembershipRepository(session).list_book_ids(SHELF_ID)
+
+
+def test_first_refresh_builds_membership(
+    session: Session, book_repo: IBookRepository
+) -> None:
+    """Test the first refresh evaluates the rules against the whole library."""
+    _set_book(session, 1, "Dune", 1)
+    _set_book(session, 2, "Emma", 2)
+    _set_book(session, 3, "Dune Messiah", 3)
+
+    result = MagicShelfMaterializer(session, BookRuleEvaluator()).refresh(
+        SHELF_ID, _title_rule("dune"), book_repo
+    )
+
+    assert result.rebuilt
+    assert result.book_count == 2
+    assert _members(session) == [1, 3]
+    state = session.get(MagicShelfState, SHELF_ID)
+    assert state is not None
+    assert state.watermark_book_id == 3
+
+
+def test_refresh_only_reevaluates_changed_and_deleted_books(
+    session: Session, book_repo: IBookRepository
+) -> None:
+    """Test later refreshes apply edits, additions and deletions."""
+    _set_book(session, 1, "Dune", 1)
+    _set_book(session, 2, "Emma", 2)
+    _set_book(session, 3, "Dune Messiah", 3)
+    materializer = MagicShelfMaterializer(session, BookRuleEvaluator())
+    materializer.refresh(SHELF_ID, _title_rule("dune"), book_repo)
+
+    _set_book(session, 2, "Children of Dune", 4)
+    _set_book(session, 3, "Messiah", 5)
+    _set_book(session, 4, "God Emperor of Dune", 6)
+    session.delete(session.get(Book, 1))
+    session.commit()
+
+    result = materializer.refresh(SHELF_ID, _title_rule("dune"), book_repo)
+
+    assert not result.rebuilt
+    assert (result.added, result.removed, result.book_count) == (2, 2, 2)
+    assert _members(session) == [2, 4]
+
+
+def test_rule_change_rebuilds_membership(
+    session: Session, book_repo: IBookRepository
+) -> None:
+    """Test a change of rules re-evaluates unchanged books too."""
+    _set_book(session, 1, "Dune", 1)
+    _set_book(session, 2, "Emma", 2)
+    materializer = MagicShelfMaterializer(session, BookRuleEvaluator())
+    materializer.refresh(SHELF_ID, _title_rule("dune"), book_repo)
+
+    state = materializer.ensure_current(SHELF_ID, _title_rule("emma"), book_repo)
+
+    assert state.book_count == 1
+    assert _members(session) == [2]
+
+
+def test_ensure_current_serves_fresh_membership(
+    session: Session, book_repo: IBookRepository
+) -> None:
+    """Test a fresh membership is served without querying Calibre."""
+    _set_book(session, 1, "Dune", 1)
+    materializer = MagicShelfMaterializer(
+        session, BookRuleEvaluator(), refresh_interval=timedelta(hours=1)
+    )
+    materializer.ensure_current(SHELF_ID, _title_rule("dune"), book_repo)
+    _set_book(session, 2, "Children of Dune", 2)
+
+    repo = MagicMock(wraps=book_repo)
+    state = materializer.ensure_current(SHELF_ID, _title_rule("dune"), repo)
+
+    assert state.book_count == 1
+    repo.list_modified_book_keys.assert_not_called()
+    assert session.exec(materializer.book_ids_stmt(SHELF_ID)).all() == [1]
+
+
+def test_concurrent_refreshes_do_not_conflict(tmp_path: Path) -> None:
+    """Test two refreshes computing the same changes both succeed."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        _set_book(session, 1, "Dune", 1)
+        _set_book(session, 2, "Dune Messiah", 2)
+    # Both refreshes read the (missing) membership before either writes
+    snapshots_taken = threading.Barrier(2)
+    results: list[int] = []
+    errors: list[BaseException] = []
+
+    def refresh() -> None:
+        with Session(engine) as session:
+            calibre = _book_repo(session)
+            repo = MagicMock(wraps=calibre)
+
+            def list_after_barrier(stmt: object) -> list[int]:
+                snapshots_taken.wait(timeout=5)
+                return calibre.list_book_ids_by_query(stmt)  # type: ignore[arg-type]
+
+            repo.list_book_ids_by_query.side_effect = list_after_barrier
+            try:
+                result = MagicShelfMaterializer(session, BookRuleEvaluator()).refresh(
+                    SHELF_ID, _title_rule("dune"), repo
+                )
+                session.commit()
+                results.append(result.book_count)
+            except BaseException as e:  # noqa: BLE001
+                errors.append(e)
+
+    threads = [threading.Thread(target=refresh) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results == [2, 2]
+    with Session(engine) as session:
+        assert _members(session) == [1, 2]
+        state = session.get(MagicShelfState, SHELF_ID)
+        assert state is not None
+        assert state.book_count == 2
+    engine.dispose()
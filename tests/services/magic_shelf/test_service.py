@@ -349,3 +349,95 @@ class TestMagicShelfServiceMultiLibrary:
             library_id=42,
         )
         assert service._book_repos == {42: repo}
+
+
+class TestMagicShelfServiceMaterialized:
+    """Tests for shelves served from a materialized membership."""
+
+    @pytest.fixture
+    def mock_shelf_repo(self) -> MagicMock:
+        shelf_repo = MagicMock()
+        shelf = MagicMock(spec=Shelf)
+        shelf.shelf_type = ShelfTypeEnum.MAGIC_SHELF
+        shelf.library_id = 1
+        shelf.filter_rules = {"rules": []}
+        shelf_repo.get.return_value = shelf
+        return shelf_repo
+
+    @pytest.fixture
+    def mock_book_repo(self) -> MagicMock:
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_materializer(self) -> MagicMock:
+        materializer = MagicMock()
+        materializer.ensure_current.return_value.book_count = 12
+        materializer.book_ids_stmt.return_value = "members_query"
+        return materializer
+
+    @pytest.fixture
+    def service(
+        self,
+        mock_shelf_repo: MagicMock,
+        mock_book_repo: MagicMock,
+        mock_materializer: MagicMock,
+    ) -> MagicShelfService:
+        return MagicShelfService(
+            mock_shelf_repo,
+            {1: mock_book_repo},
+            MagicMock(),
+            materializer=mock_materializer,
+        )
+
+    def test_count_served_from_membership(
+        self,
+        service: MagicShelfService,
+        mock_book_repo: MagicMock,
+        mock_materializer: MagicMock,
+    ) -> None:
+        """Test counting reads the materialized book count."""
+        assert service.count_books_for_shelf(1) == 12
+
+        mock_materializer.ensure_current.assert_called_once()
+        mock_book_repo.count_books_by_ids_query.assert_not_called()
+
+    def test_get_books_lists_members(
+        self,
+        service: MagicShelfService,
+        mock_book_repo: MagicMock,
+    ) -> None:
+        """Test listing loads the page from the member book IDs."""
+        mock_book_repo.list_books_by_ids_query.return_value = [MagicMock()]
+
+        books, total = service.get_books_for_shelf(1, page=2, page_size=5)
+
+        assert total == 12
+        assert len(books) == 1
+        call_args = mock_book_repo.list_books_by_ids_query.call_args
+        assert call_args[0][0] == "members_query"
+        assert call_args[1]["offset"] == 5
+        mock_book_repo.count_books_by_ids_query.assert_not_called()
+
+    def test_refresh_shelf(
+        self,
+        service: MagicShelfService,
+        mock_book_repo: MagicMock,
+        mock_materializer: MagicMock,
+    ) -> None:
+        """Test refresh_shelf delegates to the materializer."""
+        result = service.refresh_shelf(1, rebuild=True)
+
+        assert result is mock_materializer.refresh.return_value
+        args, kwargs = mock_materializer.refresh.call_args
+        assert args[0] == 1
+        assert args[2] is mock_book_repo
+        assert kwargs == {"rebuild": True}
+
+    def test_refresh_shelf_requires_materializer(
+        self, mock_shelf_repo: MagicMock
+    ) -> None:
+        """Test refresh_shelf fails without a materializer."""
+        service = MagicShelfService(mock_shelf_repo, {1: MagicMock()}, MagicMock())
+
+        with pytest.raises(ValueError, match="not configured"):
+            service.refresh_shelf(1)
@@ -23,11 +23,14 @@ from sqlmodel import Session
 from bookcard.models.auth import User
 from bookcard.models.config import Library
 from bookcard.repositories.models import BookWithRelations
+from bookcard.repositories.visibility import BookVisibility
 from bookcard.services.book_permission_helper import BookPermissionHelper
 from bookcard.services.book_service import BookService
 from bookcard.services.opds.book_query_service import OpdsBookQueryService
 from bookcard.services.permission_service import PermissionService
 
+_RESTRICTED = BookVisibility(conditions=({"tag": "Fiction"},))
+
 
 @pytest.fixture
 def mock_session() -> Mock:
@@ -46,7 +49,9 @@ def mock_book_service() -> Mock:
 
 @pytest.fixture
 def mock_permission_service() -> Mock:
-    return Mock(spec=PermissionService)
+    service = Mock(spec=PermissionService)
+    service.get_book_visibility.return_value = _RESTRICTED
+    return service
 
 
 @pytest.fixture
@@ -114,7 +119,12 @@ class TestOpdsBookQueryService:
             assert result == [book1]
             assert count == 2
             mock_book_service.list_books.assert_called_with(
-                page=1, page_size=20, sort_by="timestamp", sort_order="desc", full=False
+                page=1,
+                page_size=20,
+                sort_by="timestamp",
+                sort_order="desc",
+                full=False,
+                visibility=_RESTRICTED,
             )
 
     def test_get_books_no_user(
@@ -150,7 +160,12 @@ class TestOpdsBookQueryService:
             assert result == [book]
             assert count == 1
             mock_book_service.list_books.assert_called_with(
-                page=1, page_size=20, sort_by="timestamp", sort_order="desc", full=False
+                page=1,
+                page_size=20,
+                sort_by="timestamp",
+                sort_order="desc",
+                full=False,
+                visibility=_RESTRICTED,
             )
 
     def test_get_random_books(
@@ -197,7 +212,11 @@ class TestOpdsBookQueryService:
             assert result == [book]
             assert count == 1
             mock_book_service.list_books.assert_called_with(
-                page=1, page_size=20, search_query="query", full=False
+                page=1,
+                page_size=20,
+                search_query="query",
+                full=False,
+                visibility=_RESTRICTED,
             )
 
     def test_get_books_by_filter(
@@ -232,6 +251,7 @@ class TestOpdsBookQueryService:
                 sort_by="timestamp",
                 sort_order="desc",
                 full=False,
+                visibility=_RESTRICTED,
             )
 
     def test_get_best_rated_books(
@@ -299,3 +319,25 @@ class TestOpdsBookQueryService:
         assert result == []
         # Total is the underlying count; filtering removes the entry from the page.
         assert count == 1
+
+    def test_unrestricted_visibility_skips_book_checks(
+        self,
+        book_query_service: OpdsBookQueryService,
+        mock_book_service: Mock,
+        mock_permission_service: Mock,
+    ) -> None:
+        """Books listed without restriction are not checked one by one."""
+        user = User(id=1)
+        book = Mock(spec=BookWithRelations)
+        book.is_virtual = False
+        book.formats = [{"format": "EPUB"}]
+        mock_book_service.list_books.return_value = ([book], 1)
+        mock_permission_service.get_book_visibility.return_value = BookVisibility()
+
+        result, _count = book_query_service.get_books(user)
+
+        assert result == [book]
+        mock_permission_service.get_book_visibility.assert_called_once_with(
+            user, "read"
+        )
+        mock_permission_service.has_permission.assert_not_called()
@@ -0,0 +1,111 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the OPDS feed cache."""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from bookcard.api.schemas.opds import OpdsFeedResponse
+from bookcard.models.auth import User
+from bookcard.models.config import Library
+from bookcard.services.opds.feed_cache import (
+    OpdsFeedCache,
+    OpdsFeedCacheKey,
+    library_watermark,
+    permission_scope,
+)
+from bookcard.services.principal_cache import PermissionGrant
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _key(url: str) -> OpdsFeedCacheKey:
+    return OpdsFeedCacheKey(1, url, "admin", "v1")
+
+
+def _session(tracked: tuple[int, datetime | None] = (0, None)) -> MagicMock:
+    session = MagicMock()
+    session.exec.return_value.one.return_value = tracked
+    return session
+
+
+def _permission_service(*grants: tuple[str, str, dict | None]) -> MagicMock:
+    service = MagicMock()
+    service.get_user_grants.return_value = tuple(
+        PermissionGrant(resource, action, condition)
+        for resource, action, condition in grants
+    )
+    return service
+
+
+def test_cache_evicts_least_recently_used_feed() -> None:
+    """Test the cache keeps the most recently used feeds."""
+    cache = OpdsFeedCache(maxsize=2)
+    feed = OpdsFeedResponse(xml_content="<feed/>")
+
+    cache.put(_key("a"), feed)
+    cache.put(_key("b"), feed)
+    cache.get(_key("a"))
+    cache.put(_key("c"), feed)
+
+    assert cache.get(_key("a")) is feed
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("c")) is feed
+
+
+def test_library_watermark_follows_database_and_tracked_books(
+    tmp_path: Path,
+) -> None:
+    """Test the watermark changes with metadata.db and tracked books."""
+    db_file = tmp_path / "metadata.db"
+    db_file.write_bytes(b"db")
+    library = Library(name="Lib", calibre_db_path=str(tmp_path))
+
+    first = library_watermark(_session(), library)
+    assert library_watermark(_session(), library) == first
+    assert first.last_modified == db_file.stat().st_mtime
+
+    stat = db_file.stat()
+    os.utime(db_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = library_watermark(_session(), library)
+    assert second.signature != first.signature
+
+    tracked = library_watermark(
+        _session((1, datetime(2025, 1, 1, tzinfo=UTC))), library
+    )
+    assert tracked.signature != second.signature
+
+
+def test_permission_scope_is_shared_by_equal_grants() -> None:
+    """Test users with identical grants share a scope unless tied to the user."""
+    alice = User(id=1, username="alice", email="a@example.com", password_hash="x")
+    bob = User(id=2, username="bob", email="b@example.com", password_hash="x")
+    admin = User(
+        id=3, username="root", email="r@example.com", password_hash="x", is_admin=True
+    )
+    readers = _permission_service(("books", "read", {"tags": ["public"]}))
+    owners = _permission_service(("books", "read", {"owner_id": "user.id"}))
+
+    assert permission_scope(None, readers) == "anonymous"
+    assert permission_scope(admin, readers) == "admin"
+    assert permission_scope(alice, readers) == permission_scope(bob, readers)
+    assert permission_scope(alice, readers) != permission_scope(alice, owners)
+    assert permission_scope(alice, owners) != permission_scope(bob, owners)
@@ -27,6 +27,7 @@ from bookcard.models.config import Library
 from bookcard.models.core import Author
 from bookcard.repositories.models import BookWithRelations
 from bookcard.services.opds.book_query_service import OpdsBookQueryService
+from bookcard.services.opds.feed_cache import LibraryWatermark, OpdsFeedCache
 from bookcard.services.opds.feed_service import OpdsFeedService
 from bookcard.services.opds.xml_builder import OpdsXmlBuilder
 
@@ -725,3 +726,80 @@ class TestOpdsFeedService:
         )
         call_args = mock_xml_builder.build_feed.call_args[1]
         assert "Test Title - All" in call_args["title"]
+
+
+class TestOpdsFeedServiceCache:
+    @pytest.fixture
+    def cached_service(
+        self,
+        mock_session: Mock,
+        mock_library: Mock,
+        mock_xml_builder: Mock,
+        mock_book_query_service: Mock,
+    ) -> OpdsFeedService:
+        mock_library.id = 1
+        with patch("bookcard.services.opds.feed_service.BookService"):
+            return OpdsFeedService(
+                session=mock_session,
+                library=mock_library,
+                xml_builder=mock_xml_builder,
+                book_query_service=mock_book_query_service,
+                feed_cache=OpdsFeedCache(),
+            )
+
+    def test_cached_feed_is_rendered_once_per_watermark(
+        self,
+        cached_service: OpdsFeedService,
+        mock_request: Mock,
+        mock_xml_builder: Mock,
+        mock_book_query_service: Mock,
+        feed_request: OpdsFeedRequest,
+    ) -> None:
+        """Test repeated requests reuse the feed until the library changes."""
+        mock_request.url = "http://testserver/opds/books?offset=0"
+        mock_book_query_service.get_books.return_value = ([], 0)
+        mock_xml_builder.build_feed.return_value = "<feed></feed>"
+        watermarks = iter([
+            LibraryWatermark("v1", 100.0),
+            LibraryWatermark("v1", 100.0),
+            LibraryWatermark("v2", 200.0),
+        ])
+
+        with patch(
+            "bookcard.services.opds.feed_service.library_watermark",
+            side_effect=lambda *_: next(watermarks),
+        ):
+            first = cached_service.generate_books_feed(mock_request, None, feed_request)
+            second = cached_service.generate_books_feed(
+                mock_request, None, feed_request
+            )
+            assert mock_book_query_service.get_books.call_count == 1
+            third = cached_service.generate_books_feed(mock_request, None, feed_request)
+
+        assert mock_book_query_service.get_books.call_count == 2
+        assert first.etag is not None
+        assert first.etag == second.etag == third.etag
+        assert first.last_modified == 100.0
+        assert third.last_modified == 200.0
+
+    def test_uncacheable_feeds_bypass_cache(
+        self,
+        cached_service: OpdsFeedService,
+        mock_request: Mock,
+        mock_xml_builder: Mock,
+        mock_book_query_service: Mock,
+        feed_request: OpdsFeedRequest,
+    ) -> None:
+        """Test random discovery feeds are rendered on every request."""
+        mock_book_query_service.get_random_books.return_value = []
+        mock_xml_builder.build_feed.return_value = "<feed></feed>"
+
+        with patch(
+            "bookcard.services.opds.feed_service.library_watermark"
+        ) as watermark:
+            response = cached_service.generate_discover_feed(
+                mock_request, None, feed_request
+            )
+
+        watermark.assert_not_called()
+        assert response.etag is None
@@ -70,6 +70,11 @@ class TestOpdsUrlBuilder:
         url = url_builder.build_cover_url(123)
         assert url == "http://testserver/opds/cover/123"
 
+    def test_build_thumbnail_url(self, url_builder: OpdsUrlBuilder) -> None:
+        """Test building cover thumbnail URL."""
+        url = url_builder.build_thumbnail_url(123)
+        assert url == "http://testserver/opds/thumb_240_240/123"
+
     def test_build_pagination_url(self, url_builder: OpdsUrlBuilder) -> None:
         """Test building pagination URL."""
         url = url_builder.build_pagination_url("/opds/books", offset=20, page_size=10)
@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 from lxml import etree  # type: ignore[attr-defined]
 
@@ -26,6 +28,9 @@ from bookcard.services.opds.xml_builder import (
     OpdsXmlBuilder,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 @pytest.fixture
 def xml_builder() -> OpdsXmlBuilder:
@@ -177,3 +182,29 @@ class TestOpdsXmlBuilder:
         )
         root = etree.fromstring(xml.encode("utf-8"))
         assert len(root.findall(f"{{{NS_ATOM}}}link")) == 0
+
+    def test_iter_feed_streams_entries_lazily(
+        self, xml_builder: OpdsXmlBuilder, sample_entry: OpdsEntry
+    ) -> None:
+        """Test entries are consumed and written one chunk at a time."""
+        consumed: list[int] = []
+
+        def _entries() -> Iterator[OpdsEntry]:
+            for index in range(3):
+                consumed.append(index)
+                yield sample_entry
+
+        chunks = xml_builder.iter_feed(
+            title="Title", feed_id="id", updated="time", entries=_entries()
+        )
+
+        header = next(chunks)
+        assert b"<title" in header
+        assert consumed == []
+        first_entry = next(chunks)
+        assert b"<entry" in first_entry
+        assert consumed == [0]
+
+        root = etree.fromstring(header + first_entry + b"".join(chunks))
+        assert len(root.findall(f"{{{NS_ATOM}}}entry")) == 3
+        assert root.find(f"{{{NS_ATOM}}}entry/{{{NS_DC}}}language").text == "en"
@@ -0,0 +1,110 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for PVR import file preparation."""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from bookcard.common.filesystem import TransferMode
+from bookcard.services.pvr.importing.file_preparation import (
+    DEFAULT_IMPORT_MODE,
+    FilePreparationService,
+    import_mode_from_env,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def download_dir(tmp_path: Path) -> Path:
+    """Create a completed download with a nested book and an archive."""
+    download = tmp_path / "download"
+    (download / "extras").mkdir(parents=True)
+    (download / "book.epub").write_bytes(b"epub")
+    (download / "extras" / "book.pdf").write_bytes(b"pdf")
+    archive_root = tmp_path / "archive_root"
+    archive_root.mkdir()
+    (archive_root / "comic.cbz").write_bytes(b"cbz")
+    shutil.make_archive(str(download / "bundle"), "zip", archive_root)
+    return download
+
+
+@pytest.fixture
+def staging_dir(tmp_path: Path) -> Path:
+    """Create an empty staging directory."""
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    return staging
+
+
+def test_hardlink_mode_stages_links(download_dir: Path, staging_dir: Path) -> None:
+    """Test files and trees are staged as hardlinks and archives extracted."""
+    FilePreparationService(TransferMode.HARDLINK).prepare_files(
+        download_dir, staging_dir
+    )
+
+    staged = staging_dir / "extras" / "book.pdf"
+    assert staged.stat().st_ino == (download_dir / "extras" / "book.pdf").stat().st_ino
+    assert (staging_dir / "book.epub").stat().st_nlink == 2
+    assert (staging_dir / "bundle" / "comic.cbz").read_bytes() == b"cbz"
+
+
+def test_move_mode_keeps_download_until_released(
+    download_dir: Path, staging_dir: Path
+) -> None:
+    """Test move mode stages links and removes the download on release."""
+    preparer = FilePreparationService(TransferMode.MOVE)
+
+    preparer.prepare_files(download_dir, staging_dir)
+    assert (download_dir / "book.epub").exists()
+    assert (staging_dir / "book.epub").stat().st_nlink == 2
+
+    preparer.release_source(download_dir)
+    assert not download_dir.exists()
+    assert (staging_dir / "book.epub").read_bytes() == b"epub"
+
+
+def test_release_keeps_download_outside_move_mode(download_dir: Path) -> None:
+    """Test releasing a download is a no-op unless importing by move."""
+    FilePreparationService(TransferMode.HARDLINK).release_source(download_dir)
+
+    assert download_dir.exists()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, DEFAULT_IMPORT_MODE),
+        ("Hardlink", TransferMode.HARDLINK),
+        ("move", TransferMode.MOVE),
+        ("symlink", DEFAULT_IMPORT_MODE),
+    ],
+)
+def test_import_mode_from_env(
+    monkeypatch: pytest.MonkeyPatch, value: str | None, expected: TransferMode
+) -> None:
+    """Test the import mode is read from the environment."""
+    if value is None:
+        monkeypatch.delenv("BOOKCARD_PVR_IMPORT_MODE", raising=False)
+    else:
+        monkeypatch.setenv("BOOKCARD_PVR_IMPORT_MODE", value)
+
+    assert import_mode_from_env() == expected
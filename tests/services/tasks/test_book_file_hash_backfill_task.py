@@ -0,0 +1,70 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for BookFileHashBackfillTask."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from bookcard.models.config import Library
+from bookcard.models.tasks import TaskType
+from bookcard.services.duplicate_detection.file_hash_index import (
+    FileHashBackfillResult,
+)
+from bookcard.services.tasks.book_file_hash_backfill_task import (
+    BookFileHashBackfillTask,
+)
+
+MODULE = "bookcard.services.tasks.book_file_hash_backfill_task"
+
+
+def _run(
+    result: FileHashBackfillResult, tmp_path: Path
+) -> tuple[BookFileHashBackfillTask, MagicMock, MagicMock]:
+    task = BookFileHashBackfillTask(
+        task_id=1,
+        user_id=1,
+        metadata={"task_type": TaskType.BOOK_FILE_HASH_BACKFILL, "library_id": 3},
+    )
+    library = Library(id=3, name="Lib", calibre_db_path=str(tmp_path))
+    update_progress = MagicMock()
+    with (
+        patch(f"{MODULE}.resolve_task_library", return_value=library),
+        patch(f"{MODULE}.CalibreBookRepository"),
+        patch(f"{MODULE}.FileHashIndex") as mock_index_class,
+    ):
+        mock_index_class.return_value.backfill.return_value = result
+        task.run({"session": MagicMock(), "update_progress": update_progress})
+    return task, mock_index_class.return_value.backfill, update_progress
+
+
+def test_run_backfills_library(tmp_path: Path) -> None:
+    """Test the task backfills the resolved library and records stats."""
+    task, backfill, update_progress = _run(
+        FileHashBackfillResult(hashed=2, unchanged=5), tmp_path
+    )
+
+    kwargs = backfill.call_args.kwargs
+    assert kwargs["library_id"] == 3
+    assert kwargs["library_path"] == tmp_path
+    assert task.metadata["stats"]["hashed"] == 2
+    update_progress.assert_called_with(1.0, task.metadata)
+
+
+def test_run_cancelled(tmp_path: Path) -> None:
+    """Test a cancelled backfill does not report completion."""
+    _, _, update_progress = _run(FileHashBackfillResult(cancelled=True), tmp_path)
+
+    update_progress.assert_not_called()
@@ -15,14 +15,20 @@
 
 """Tests for epub_fix_daily_scan_task to achieve 100% coverage."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from bookcard.models.config import EPUBFixerConfig, Library, ScheduledTasksConfig
-from bookcard.models.epub_fixer import EPUBFixRun
+from bookcard.models.epub_fixer import EPUBFileFingerprint, EPUBFixRun
+from bookcard.services.epub_fixer import EPUBFixerSettings
 from bookcard.services.epub_fixer.services.scanner import EPUBFileInfo
+from bookcard.services.epub_fixer.services.worker import (
+    EPUBFixOutcome,
+    compute_fixer_hash,
+)
 from bookcard.services.tasks.epub_fix_daily_scan_task import EPUBFixDailyScanTask
 from bookcard.services.tasks.exceptions import LibraryNotConfiguredError
 from tests.conftest import DummySession
@@ -270,9 +276,8 @@ class TestEPUBFixDailyScanTaskSetupServices:
         session.add_exec_result([epub_fixer_config])
         result = task._setup_services(session)  # type: ignore[arg-type]
         assert result is not None
-        fixer_service, backup_service, recorder, settings = result
+        fixer_service, recorder, settings = result
         assert fixer_service is not None
-        assert backup_service is not None
         assert recorder is not None
         assert settings is not None
 
@@ -304,9 +309,8 @@ class TestEPUBFixDailyScanTaskSetupServices:
         session.add_exec_result([epub_config])
         result = task._setup_services(session)  # type: ignore[arg-type]
         assert result is not None
-        fixer_service, backup_service, recorder, settings = result
+        fixer_service, recorder, settings = result
         assert fixer_service is not None
-        assert backup_service is not None
         assert recorder is not None
         assert settings is not None
 
@@ -350,367 +354,335 @@ class TestEPUBFixDailyScanTaskScanEPUBFiles:
             )
 
 
-class TestEPUBFixDailyScanTaskProcessEPUBFile:
-    """Test _process_epub_file method."""
+def _outcome(
+    file_path: Path, fixes: int = 0, error: str | None = None
+) -> EPUBFixOutcome:
+    """Build a worker outcome for a file."""
+    if error is not None:
+        return EPUBFixOutcome(file_path=str(file_path), error=error)
+    return EPUBFixOutcome(
+        file_path=str(file_path),
+        fix_results=[MagicMock() for _ in range(fixes)],
+        backup_path="/backups/book.epub" if fixes else None,
+        size=10,
+        mtime_ns=20,
+    )
 
-    def test_process_epub_file_success(
-        self,
+
+class TestEPUBFixDailyScanTaskRecordOutcome:
+    """Test _record_outcome method."""
+
+    @staticmethod
+    def _record(
+        outcome: EPUBFixOutcome | Exception,
         epub_file_info: EPUBFileInfo,
         fix_run: EPUBFixRun,
-        tmp_path: Path,
-    ) -> None:
-        """Test _process_epub_file successfully processes file.
-
-        Parameters
-        ----------
-        epub_file_info : EPUBFileInfo
-            EPUB file info instance.
-        fix_run : EPUBFixRun
-            Fix run instance.
-        tmp_path : Path
-            Temporary directory path.
-        """
+        recorder: MagicMock,
+        fingerprints: list[tuple[str, int, int]],
+    ) -> int:
         task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
-
-        mock_orchestrator = MagicMock()
-        mock_fix_result = MagicMock()
-        mock_orchestrator.process.return_value = [mock_fix_result]
-
-        mock_reader = MagicMock()
-        mock_contents = MagicMock()
-        mock_reader.read.return_value = mock_contents
-
-        mock_writer = MagicMock()
-
-        mock_backup_service = MagicMock()
-        mock_backup_service.create_backup.return_value = tmp_path / "backup.epub"
-
-        mock_recorder = MagicMock()
-
-        fix_run.id = 1
-
-        files_fixed, total_fixes = task._process_epub_file(
+        future: Future[EPUBFixOutcome] = Future()
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+        return task._record_outcome(
+            future,
             epub_file_info,
-            mock_orchestrator,
-            mock_reader,
-            mock_writer,
-            mock_backup_service,
-            mock_recorder,
+            recorder,  # type: ignore[arg-type]
             fix_run,
+            fingerprints,
         )
 
-        assert files_fixed == 1
-        assert total_fixes == 1
-        mock_writer.write.assert_called_once_with(
-            mock_contents, epub_file_info.file_path
-        )
-        mock_recorder.record_fixes.assert_called_once()
-
-    def test_process_epub_file_no_fixes(
-        self,
-        epub_file_info: EPUBFileInfo,
-        fix_run: EPUBFixRun,
-        tmp_path: Path,
+    def test_fixed_file_records_fixes_and_fingerprint(
+        self, epub_file_info: EPUBFileInfo, fix_run: EPUBFixRun
     ) -> None:
-        """Test _process_epub_file when no fixes are needed.
+        """Test a fixed file is recorded with its backup and new fingerprint."""
+        recorder = MagicMock()
+        fingerprints: list[tuple[str, int, int]] = []
 
-        Parameters
-        ----------
-        epub_file_info : EPUBFileInfo
-            EPUB file info instance.
-        fix_run : EPUBFixRun
-            Fix run instance.
-        tmp_path : Path
-            Temporary directory path.
-        """
-        task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.process.return_value = []  # No fixes
-
-        mock_reader = MagicMock()
-        mock_contents = MagicMock()
-        mock_reader.read.return_value = mock_contents
-
-        mock_writer = MagicMock()
-
-        mock_backup_service = MagicMock()
-        mock_backup_service.create_backup.return_value = tmp_path / "backup.epub"
-
-        mock_recorder = MagicMock()
-
-        fix_run.id = 1
-
-        files_fixed, total_fixes = task._process_epub_file(
+        fixes = self._record(
+            _outcome(epub_file_info.file_path, fixes=2),
             epub_file_info,
-            mock_orchestrator,
-            mock_reader,
-            mock_writer,
-            mock_backup_service,
-            mock_recorder,
             fix_run,
+            recorder,
+            fingerprints,
         )
 
-        assert files_fixed == 0
-        assert total_fixes == 0
-        mock_writer.write.assert_not_called()
-        mock_recorder.record_fixes.assert_not_called()
+        assert fixes == 2
+        recorder.record_fixes.assert_called_once()
+        kwargs = recorder.record_fixes.call_args.kwargs
+        assert kwargs["original_file_path"] == "/backups/book.epub"
+        assert kwargs["backup_created"] is True
+        assert fingerprints == [(str(epub_file_info.file_path), 10, 20)]
 
-    def test_process_epub_file_exception(
-        self,
-        epub_file_info: EPUBFileInfo,
-        fix_run: EPUBFixRun,
-        tmp_path: Path,
+    def test_clean_file_only_records_fingerprint(
+        self, epub_file_info: EPUBFileInfo, fix_run: EPUBFixRun
     ) -> None:
-        """Test _process_epub_file handles exceptions.
+        """Test a file needing no fixes is fingerprinted without fix records."""
+        recorder = MagicMock()
+        fingerprints: list[tuple[str, int, int]] = []
 
-        Parameters
-        ----------
-        epub_file_info : EPUBFileInfo
-            EPUB file info instance.
-        fix_run : EPUBFixRun
-            Fix run instance.
-        tmp_path : Path
-            Temporary directory path.
-        """
-        task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
+        fixes = self._record(
+            _outcome(epub_file_info.file_path),
+            epub_file_info,
+            fix_run,
+            recorder,
+            fingerprints,
+        )
 
-        mock_orchestrator = MagicMock()
-        mock_reader = MagicMock()
-        mock_reader.read.side_effect = Exception("Read error")
+        assert fixes == 0
+        recorder.record_fixes.assert_not_called()
+        assert len(fingerprints) == 1
 
-        mock_writer = MagicMock()
-        mock_backup_service = MagicMock()
-        mock_backup_service.create_backup.return_value = tmp_path / "backup.epub"
-        mock_recorder = MagicMock()
+    def test_no_fix_run_id_skips_fix_records(
+        self, epub_file_info: EPUBFileInfo, fix_run: EPUBFixRun
+    ) -> None:
+        """Test fixes are counted but not recorded without a run ID."""
+        recorder = MagicMock()
+        fix_run.id = None
 
-        files_fixed, total_fixes = task._process_epub_file(
+        fixes = self._record(
+            _outcome(epub_file_info.file_path, fixes=1),
             epub_file_info,
-            mock_orchestrator,
-            mock_reader,
-            mock_writer,
-            mock_backup_service,
-            mock_recorder,
             fix_run,
+            recorder,
+            [],
         )
 
-        assert files_fixed == 0
-        assert total_fixes == 0
+        assert fixes == 1
+        recorder.record_fixes.assert_not_called()
 
-    def test_process_epub_file_no_fix_run_id(
+    @pytest.mark.parametrize(
+        "outcome",
+        [
+            _outcome(Path("book.epub"), error="Read error"),
+            RuntimeError("worker died"),
+        ],
+    )
+    def test_failed_file_is_not_fingerprinted(
         self,
         epub_file_info: EPUBFileInfo,
         fix_run: EPUBFixRun,
-        tmp_path: Path,
+        outcome: EPUBFixOutcome | Exception,
     ) -> None:
-        """Test _process_epub_file when fix_run.id is None.
+        """Test failed files and crashed workers leave no fingerprint."""
+        recorder = MagicMock()
+        fingerprints: list[tuple[str, int, int]] = []
 
-        Parameters
-        ----------
-        epub_file_info : EPUBFileInfo
-            EPUB file info instance.
-        fix_run : EPUBFixRun
-            Fix run instance.
-        tmp_path : Path
-            Temporary directory path.
-        """
-        task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
-
-        mock_orchestrator = MagicMock()
-        mock_fix_result = MagicMock()
-        mock_orchestrator.process.return_value = [mock_fix_result]
+        fixes = self._record(outcome, epub_file_info, fix_run, recorder, fingerprints)
 
-        mock_reader = MagicMock()
-        mock_contents = MagicMock()
-        mock_reader.read.return_value = mock_contents
+        assert fixes == 0
+        recorder.record_fixes.assert_not_called()
+        assert fingerprints == []
 
-        mock_writer = MagicMock()
 
-        mock_backup_service = MagicMock()
-        mock_backup_service.create_backup.return_value = tmp_path / "backup.epub"
-
-        mock_recorder = MagicMock()
+class TestEPUBFixDailyScanTaskProcessAllFiles:
+    """Test _process_all_files method."""
 
-        fix_run.id = None
+    @staticmethod
+    def _make_files(tmp_path: Path, count: int) -> list[EPUBFileInfo]:
+        files = []
+        for index in range(count):
+            file_path = tmp_path / f"book{index}.epub"
+            file_path.write_bytes(b"x" * (index + 1))
+            files.append(
+                EPUBFileInfo(
+                    book_id=index, book_title=f"Book {index}", file_path=file_path
+                )
+            )
+        return files
 
-        files_fixed, total_fixes = task._process_epub_file(
-            epub_file_info,
-            mock_orchestrator,
-            mock_reader,
-            mock_writer,
-            mock_backup_service,
-            mock_recorder,
+    @staticmethod
+    def _make_task(cancelled: bool = False) -> EPUBFixDailyScanTask:
+        task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
+        task.check_cancelled = MagicMock(return_value=cancelled)  # type: ignore[method-assign]
+        task._create_executor = ThreadPoolExecutor  # type: ignore[method-assign]
+        return task
+
+    @staticmethod
+    def _run(
+        task: EPUBFixDailyScanTask,
+        files: list[EPUBFileInfo],
+        fix_run: EPUBFixRun,
+        fingerprint_repo: MagicMock,
+        session: DummySession,
+        update_progress: MagicMock | None = None,
+        skip: bool = False,
+    ) -> tuple[int, int, int]:
+        fixer_service = MagicMock()
+        fixer_service.should_skip_epub.return_value = skip
+        settings = EPUBFixerSettings(backup_enabled=False, default_language="en")
+        return task._process_all_files(
+            session,  # type: ignore[arg-type]
+            files,
+            MagicMock(),
             fix_run,
+            fixer_service,
+            fingerprint_repo,
+            settings,
+            update_progress or MagicMock(),
         )
 
-        assert files_fixed == 1
-        assert total_fixes == 1
-        mock_recorder.record_fixes.assert_not_called()
-
-
-class TestEPUBFixDailyScanTaskProcessAllFiles:
-    """Test _process_all_files method."""
-
     def test_process_all_files_success(
         self,
-        epub_file_info: EPUBFileInfo,
+        session: DummySession,
         fix_run: EPUBFixRun,
         tmp_path: Path,
     ) -> None:
-        """Test _process_all_files successfully processes all files.
-
-        Parameters
-        ----------
-        epub_file_info : EPUBFileInfo
-            EPUB file info instance.
-        fix_run : EPUBFixRun
-            Fix run instance.
-        tmp_path : Path
-            Temporary directory path.
-        """
-        task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
-        task.check_cancelled = MagicMock(return_value=False)  # type: ignore[method-assign]
-
-        mock_orchestrator = MagicMock()
-        mock_fix_result = MagicMock()
-        mock_orchestrator.process.return_value = [mock_fix_result]
-
-        mock_reader = MagicMock()
-        mock_contents = MagicMock()
-        mock_reader.read.return_value = mock_contents
-
-        mock_writer = MagicMock()
-
-        mock_backup_service = MagicMock()
-        mock_backup_service.create_backup.return_value = tmp_path / "backup.epub"
-
-        mock_recorder = MagicMock()
-        fix_run.id = 1
-
-        mock_fixer_service = MagicMock()
-        mock_fixer_service.should_skip_epub.return_value = False
-
-        mock_settings = MagicMock()
-        mock_settings.skip_already_fixed = False
-        mock_settings.skip_failed = False
-
+        """Test files are fixed by the pool and fingerprinted in one commit."""
+        files = self._make_files(tmp_path, 3)
+        fingerprint_repo = MagicMock()
+        fingerprint_repo.get_by_paths.return_value = {}
+        upserts: list[tuple[list[tuple[str, int, int]], str]] = []
+        fingerprint_repo.upsert_many.side_effect = lambda entries, fixer_hash: (
+            upserts.append((list(entries), fixer_hash))
+        )
         update_progress = MagicMock()
 
-        files_processed, files_fixed, total_fixes = task._process_all_files(
-            [epub_file_info],
-            mock_orchestrator,
-            mock_reader,
-            mock_writer,
-            mock_backup_service,
-            mock_recorder,
-            fix_run,
-            mock_fixer_service,
-            mock_settings,
-            update_progress,
-        )
+        with patch(
+            "bookcard.services.tasks.epub_fix_daily_scan_task.fix_epub_file",
+            side_effect=lambda job: _outcome(
+                Path(job.file_path), fixes=1 if job.file_path.endswith("0.epub") else 0
+            ),
+        ):
+            result = self._run(
+                self._make_task(),
+                files,
+                fix_run,
+                fingerprint_repo,
+                session,
+                update_progress,
+            )
 
-        assert files_processed == 1
-        assert files_fixed == 1
-        assert total_fixes == 1
-        assert update_progress.call_count == 1
+        assert result == (3, 1, 1)
+        assert update_progress.call_count == 3
+        assert len(upserts) == 1
+        entries, fixer_hash = upserts[0]
+        assert len(entries) == 3
+        assert fixer_hash == compute_fixer_hash("en")
+        assert session.commit_count == 1
 
-    def test_process_all_files_skipped(
+    def test_process_all_files_skips_unchanged_files(
         self,
-        epub_file_info: EPUBFileInfo,
+        session: DummySession,
         fix_run: EPUBFixRun,
+        tmp_path: Path,
     ) -> None:
-        """Test _process_all_files when file is skipped.
+        """Test files matching their fingerprint are not sent to the pool."""
+        unchanged, changed = self._make_files(tmp_path, 2)
+        stat = unchanged.file_path.stat()
+        fingerprint_repo = MagicMock()
+        fingerprint_repo.get_by_paths.return_value = {
+            str(unchanged.file_path): EPUBFileFingerprint(
+                file_path=str(unchanged.file_path),
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                fixer_hash=compute_fixer_hash("en"),
+            ),
+            str(changed.file_path): EPUBFileFingerprint(
+                file_path=str(changed.file_path),
+                size=0,
+                mtime_ns=0,
+                fixer_hash=compute_fixer_hash("en"),
+            ),
+        }
 
-        Parameters
-        ----------
-        epub_file_info : EPUBFileInfo
-            EPUB file info instance.
-        fix_run : EPUBFixRun
-            Fix run instance.
-        """
-        task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
-        task.check_cancelled = MagicMock(return_value=False)  # type: ignore[method-assign]
+        with patch(
+            "bookcard.services.tasks.epub_fix_daily_scan_task.fix_epub_file",
+            side_effect=lambda job: _outcome(Path(job.file_path)),
+        ) as mock_fix:
+            result = self._run(
+                self._make_task(),
+                [unchanged, changed],
+                fix_run,
+                fingerprint_repo,
+                session,
+            )
 
-        mock_orchestrator = MagicMock()
-        mock_reader = MagicMock()
-        mock_writer = MagicMock()
-        mock_backup_service = MagicMock()
-        mock_recorder = MagicMock()
+        assert result == (2, 0, 0)
+        assert [call.args[0].file_path for call in mock_fix.call_args_list] == [
+            str(changed.file_path)
+        ]
 
-        mock_fixer_service = MagicMock()
-        mock_fixer_service.should_skip_epub.return_value = True
+    def test_process_all_files_skipped_by_history(
+        self,
+        session: DummySession,
+        fix_run: EPUBFixRun,
+        tmp_path: Path,
+    ) -> None:
+        """Test files skipped by the fix history are counted as processed."""
+        files = self._make_files(tmp_path, 1)
+        fingerprint_repo = MagicMock()
+        fingerprint_repo.get_by_paths.return_value = {}
+        task = self._make_task()
+        task._create_executor = MagicMock()  # type: ignore[method-assign]
 
-        mock_settings = MagicMock()
-        mock_settings.skip_already_fixed = True
-        mock_settings.skip_failed = False
+        result = self._run(task, files, fix_run, fingerprint_repo, session, skip=True)
 
-        update_progress = MagicMock()
+        assert result == (1, 0, 0)
+        task._create_executor.assert_not_called()
 
-        files_processed, files_fixed, total_fixes = task._process_all_files(
-            [epub_file_info],
-            mock_orchestrator,
-            mock_reader,
-            mock_writer,
-            mock_backup_service,
-            mock_recorder,
-            fix_run,
-            mock_fixer_service,
-            mock_settings,
-            update_progress,
+    def test_process_all_files_persists_in_batches(
+        self,
+        session: DummySession,
+        fix_run: EPUBFixRun,
+        tmp_path: Path,
+    ) -> None:
+        """Test results are committed every batch and failures are not fingerprinted."""
+        files = self._make_files(tmp_path, 5)
+        fingerprint_repo = MagicMock()
+        fingerprint_repo.get_by_paths.return_value = {}
+        upserted: list[int] = []
+        fingerprint_repo.upsert_many.side_effect = lambda entries, _hash: (
+            upserted.append(len(entries))
         )
 
-        assert files_processed == 1
-        assert files_fixed == 0
-        assert total_fixes == 0
+        with (
+            patch(
+                "bookcard.services.tasks.epub_fix_daily_scan_task.PERSIST_BATCH_SIZE",
+                2,
+            ),
+            patch(
+                "bookcard.services.tasks.epub_fix_daily_scan_task.fix_epub_file",
+                side_effect=lambda job: _outcome(
+                    Path(job.file_path),
+                    error="Timed out" if job.file_path.endswith("4.epub") else None,
+                ),
+            ),
+        ):
+            result = self._run(
+                self._make_task(), files, fix_run, fingerprint_repo, session
+            )
+
+        assert result == (5, 0, 0)
+        assert sum(upserted) == 4
+        assert max(upserted) == 2
 
     def test_process_all_files_cancelled(
         self,
-        epub_file_info: EPUBFileInfo,
+        session: DummySession,
         fix_run: EPUBFixRun,
+        tmp_path: Path,
     ) -> None:
-        """Test _process_all_files when task is cancelled.
+        """Test _process_all_files submits nothing once the task is cancelled."""
+        files = self._make_files(tmp_path, 1)
+        fingerprint_repo = MagicMock()
+        fingerprint_repo.get_by_paths.return_value = {}
 
-        Parameters
-        ----------
-        epub_file_info : EPUBFileInfo
-            EPUB file info instance.
-        fix_run : EPUBFixRun
-            Fix run instance.
-        """
-        task = EPUBFixDailyScanTask(task_id=1, user_id=1, metadata={})
-        task.check_cancelled = MagicMock(return_value=True)  # type: ignore[method-assign]
-
-        mock_orchestrator = MagicMock()
-        mock_reader = MagicMock()
-        mock_writer = MagicMock()
-        mock_backup_service = MagicMock()
-        mock_recorder = MagicMock()
-
-        mock_fixer_service = MagicMock()
-        mock_fixer_service.should_skip_epub.return_value = False
-
-        mock_settings = MagicMock()
-        mock_settings.skip_already_fixed = False
-        mock_settings.skip_failed = False
-
-        update_progress = MagicMock()
-
-        files_processed, files_fixed, total_fixes = task._process_all_files(
-            [epub_file_info],
-            mock_orchestrator,
-            mock_reader,
-            mock_writer,
-            mock_backup_service,
-            mock_recorder,
-            fix_run,
-            mock_fixer_service,
-            mock_settings,
-            update_progress,
-        )
+        with patch(
+            "bookcard.services.tasks.epub_fix_daily_scan_task.fix_epub_file"
+        ) as mock_fix:
+            result = self._run(
+                self._make_task(cancelled=True),
+                files,
+                fix_run,
+                fingerprint_repo,
+                session,
+            )
 
-        assert files_processed == 0
-        assert files_fixed == 0
-        assert total_fixes == 0
+        assert result == (0, 0, 0)
+        mock_fix.assert_not_called()
 
 
 class TestEPUBFixDailyScanTaskRun:
@@ -0,0 +1,110 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the task event bus."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import redis
+
+from bookcard.models.tasks import TaskStatus
+from bookcard.services.tasks.events import (
+    RedisTaskEventBus,
+    TaskEvent,
+    TaskEventBus,
+    TaskEventSubscription,
+)
+
+
+def _event(task_id: int = 1, user_id: int = 1, progress: float = 0.5) -> TaskEvent:
+    return TaskEvent(
+        task_id=task_id,
+        user_id=user_id,
+        event_type="progress",
+        status=TaskStatus.RUNNING,
+        progress=progress,
+    )
+
+
+def test_subscribers_only_receive_events_of_their_user() -> None:
+    """Test user subscriptions filter events while unfiltered ones get all."""
+    bus = TaskEventBus()
+    user_sub = bus.subscribe(user_id=2)
+    admin_sub = bus.subscribe()
+    first, second = _event(task_id=1, user_id=1), _event(task_id=2, user_id=2)
+
+    bus.publish(first)
+    bus.publish(second)
+
+    assert user_sub.get(timeout=0) == second
+    assert user_sub.get(timeout=0) is None
+    assert [admin_sub.get(timeout=0), admin_sub.get(timeout=0)] == [first, second]
+
+
+def test_full_subscription_drops_oldest_event() -> None:
+    """Test a slow subscriber keeps the latest events without blocking."""
+    subscription = TaskEventSubscription(TaskEventBus(), None, maxsize=2)
+
+    for progress in (0.1, 0.2, 0.3):
+        subscription.put(_event(progress=progress))
+
+    assert subscription.get(timeout=0).progress == 0.2  # type: ignore[union-attr]
+    assert subscription.get(timeout=0).progress == 0.3  # type: ignore[union-attr]
+
+
+def test_closed_subscription_stops_receiving_events() -> None:
+    """Test closing a subscription unregisters it."""
+    bus = TaskEventBus()
+    with bus.subscribe() as subscription:
+        pass
+
+    bus.publish(_event())
+
+    assert subscription.get(timeout=0) is None
+
+
+def test_redis_bus_relays_events_through_channel() -> None:
+    """Test events are published to Redis and delivered from the channel."""
+    client = MagicMock()
+    with patch("bookcard.services.tasks.events.redis.from_url", return_value=client):
+        bus = RedisTaskEventBus("redis://localhost:6379/0")
+    subscription = bus.subscribe()
+    event = _event()
+
+    bus.publish(event)
+    channel, payload = client.publish.call_args.args
+    assert subscription.get(timeout=0) is None
+
+    bus._handle_message({"channel": channel, "data": payload})
+
+    assert json.loads(payload)["task_id"] == 1
+    assert subscription.get(timeout=0) == event
+
+
+def test_redis_bus_falls_back_to_local_delivery() -> None:
+    """Test events still reach local subscribers when Redis is down."""
+    client = MagicMock()
+    client.publish.side_effect = redis.ConnectionError("down")
+    with patch("bookcard.services.tasks.events.redis.from_url", return_value=client):
+        bus = RedisTaskEventBus("redis://localhost:6379/0")
+    subscription = bus.subscribe()
+    event = _event()
+
+    bus.publish(event)
+
+    assert subscription.get(timeout=0) == event
@@ -1136,6 +1136,7 @@ class TestRun:
         mock_calibre_session = MagicMock()
         mock_exec_result = MagicMock()
         mock_exec_result.first.return_value = None  # No duplicate found
+        mock_exec_result.one.return_value = (0, None, 0)  # Empty library index
         mock_calibre_session.exec.return_value = mock_exec_result
         mock_calibre_repo.get_session.return_value.__enter__.return_value = (
             mock_calibre_session
@@ -1195,6 +1196,7 @@ class TestRun:
         mock_calibre_session = MagicMock()
         mock_exec_result = MagicMock()
         mock_exec_result.first.return_value = None  # No duplicate found
+        mock_exec_result.one.return_value = (0, None, 0)  # Empty library index
         mock_calibre_session.exec.return_value = mock_exec_result
         mock_calibre_repo.get_session.return_value.__enter__.return_value = (
             mock_calibre_session
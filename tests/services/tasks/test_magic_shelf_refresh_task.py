@@ -0,0 +1,95 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for MagicShelfRefreshTask."""
+
+from unittest.mock import MagicMock, patch
+
+from bookcard.models.config import Library
+from bookcard.models.shelves import Shelf, ShelfTypeEnum
+from bookcard.models.tasks import TaskType
+from bookcard.services.magic_shelf.materializer import MagicShelfRefreshResult
+from bookcard.services.tasks.magic_shelf_refresh_task import MagicShelfRefreshTask
+
+MODULE = "bookcard.services.tasks.magic_shelf_refresh_task"
+
+
+def _shelf(shelf_id: int, shelf_type: ShelfTypeEnum) -> Shelf:
+    return Shelf(
+        id=shelf_id,
+        name=f"Shelf {shelf_id}",
+        user_id=1,
+        library_id=3,
+        shelf_type=shelf_type,
+    )
+
+
+def _run(
+    refresh: MagicMock, metadata: dict | None = None
+) -> tuple[MagicShelfRefreshTask, MagicMock, MagicMock]:
+    task = MagicShelfRefreshTask(
+        task_id=1,
+        user_id=1,
+        metadata={"task_type": TaskType.MAGIC_SHELF_REFRESH, **(metadata or {})},
+    )
+    library = Library(id=3, name="Lib", calibre_db_path="/library")
+    session = MagicMock()
+    update_progress = MagicMock()
+    with (
+        patch(f"{MODULE}.LibraryRepository") as mock_library_repo,
+        patch(f"{MODULE}.ShelfRepository") as mock_shelf_repo,
+        patch(f"{MODULE}.CalibreBookRepository"),
+        patch(f"{MODULE}.MagicShelfService") as mock_service_class,
+    ):
+        mock_library_repo.return_value.list.return_value = [library]
+        mock_shelf_repo.return_value.find_by_library.return_value = [
+            _shelf(1, ShelfTypeEnum.MAGIC_SHELF),
+            _shelf(2, ShelfTypeEnum.SHELF),
+            _shelf(3, ShelfTypeEnum.MAGIC_SHELF),
+        ]
+        mock_service_class.return_value.refresh_shelf = refresh
+        task.run({"session": session, "update_progress": update_progress})
+    return task, session, update_progress
+
+
+def test_run_refreshes_magic_shelves() -> None:
+    """Test every magic shelf is refreshed and committed."""
+    refresh = MagicMock(return_value=MagicShelfRefreshResult(added=2, removed=1))
+
+    task, session, update_progress = _run(refresh, {"rebuild": True})
+
+    assert [c.args[0] for c in refresh.call_args_list] == [1, 3]
+    assert all(c.kwargs == {"rebuild": True} for c in refresh.call_args_list)
+    assert session.commit.call_count == 2
+    assert task.metadata["stats"] == {
+        "refreshed": 2,
+        "added": 4,
+        "removed": 2,
+        "failed": 0,
+    }
+    update_progress.assert_called_with(1.0, task.metadata)
+
+
+def test_run_isolates_failing_shelf() -> None:
+    """Test a failing shelf is rolled back without stopping the others."""
+    refresh = MagicMock(
+        side_effect=[RuntimeError("boom"), MagicShelfRefreshResult(added=1)]
+    )
+
+    task, session, _ = _run(refresh)
+
+    session.rollback.assert_called_once()
+    assert task.metadata["stats"]["refreshed"] == 1
+    assert task.metadata["stats"]["failed"] == 1
@@ -0,0 +1,108 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for coalesced task progress reporting."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from bookcard.services.task_service import TaskService
+from bookcard.services.tasks.progress_reporter import CoalescedProgressReporter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def task_service() -> MagicMock:
+    """Return mock TaskService."""
+    return MagicMock(spec=TaskService)
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    """Return a manually advanced clock."""
+    return _Clock()
+
+
+@pytest.fixture
+def reporter(task_service: MagicMock, clock: _Clock) -> CoalescedProgressReporter:
+    """Return a reporter flushing at most every 2 seconds."""
+    return CoalescedProgressReporter(
+        task_service, task_id=7, user_id=3, flush_interval=2.0, clock=clock
+    )
+
+
+def test_ticks_are_published_but_written_coalesced(
+    reporter: CoalescedProgressReporter, task_service: MagicMock, clock: _Clock
+) -> None:
+    """Test every tick is published while writes wait for the interval."""
+    reporter(0.1, {"status": "a"})
+    clock.now = 0.5
+    reporter(0.2, {"status": "b"})
+    reporter(0.3)
+    clock.now = 2.5
+    reporter(0.4)
+
+    assert task_service.publish_progress.call_count == 4
+    assert task_service.update_task_progress.call_args_list == [
+        call(7, 0.1, {"status": "a"}, publish=False),
+        call(7, 0.4, {"status": "b"}, publish=False),
+    ]
+
+
+def test_flush_writes_pending_tick_once(
+    reporter: CoalescedProgressReporter, task_service: MagicMock
+) -> None:
+    """Test flush writes the last buffered tick and is idempotent."""
+    reporter(0.1)
+    reporter(0.2, {"status": "b"})
+
+    reporter.flush()
+    reporter.flush()
+
+    assert task_service.update_task_progress.call_args_list[-1] == call(
+        7, 0.2, {"status": "b"}, publish=False
+    )
+    assert task_service.update_task_progress.call_count == 2
+
+
+def test_non_progress_metadata_and_completion_are_written_immediately(
+    reporter: CoalescedProgressReporter, task_service: MagicMock
+) -> None:
+    """Test merged metadata and the final tick bypass coalescing."""
+    reporter(0.1)
+    reporter(0.2, {"book_ids": [1]})
+    reporter(1.0)
+
+    assert task_service.update_task_progress.call_count == 3
+
+
+def test_out_of_range_progress_is_rejected(
+    reporter: CoalescedProgressReporter, task_service: MagicMock
+) -> None:
+    """Test invalid progress raises before anything is published."""
+    with pytest.raises(ValueError, match="Progress must be between"):
+        reporter(1.5)
+
+    task_service.publish_progress.assert_not_called()
@@ -367,3 +367,22 @@ class TestTerminalStateGuard:
         executor.execute_task(task_id, mock_task_instance, worker_context)
 
         executor._task_service.fail_task.assert_not_called()  # type: ignore[attr-defined]
+
+
+def test_execute_task_flushes_coalesced_progress_before_completion(
+    executor: TaskExecutor, mock_task_service: MagicMock
+) -> None:
+    """Test a buffered progress tick is written before the task completes."""
+    calls: list[str] = []
+    update_progress = MagicMock()
+    update_progress.flush.side_effect = lambda: calls.append("flush")
+    mock_task_service.complete_task.side_effect = lambda *_a, **_k: calls.append(
+        "complete"
+    )
+    mock_task_service.get_task.return_value = None
+    task_instance = MagicMock(spec=BaseTask)
+    task_instance.metadata = {}
+
+    executor.execute_task(1, task_instance, {"update_progress": update_progress})
+
+    assert calls == ["flush", "complete"]
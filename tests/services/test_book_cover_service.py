@@ -641,6 +641,27 @@ class TestSaveCoverImage:
             # For now, we'll just verify the file was saved
             pass
 
+    def test_save_cover_image_invalidates_thumbnails(
+        self,
+        mock_book_service: MagicMock,
+        library_with_root: Library,
+        book_with_full_relations: BookWithFullRelations,
+        sample_image_bytes: bytes,
+        tmp_path: Path,
+    ) -> None:
+        """Test save_cover_image drops cached thumbnails of the old cover."""
+        mock_book_service._library = library_with_root
+        library_with_root.library_root = str(tmp_path)
+        mock_book_service.get_book_full.return_value = book_with_full_relations
+        mock_book_service._book_repo = MagicMock()
+        thumbnail_cache = MagicMock()
+        service = BookCoverService(mock_book_service, thumbnail_cache)
+
+        service.save_cover_image(1, sample_image_bytes)
+
+        cover_path = tmp_path / book_with_full_relations.book.path / "cover.jpg"
+        thumbnail_cache.invalidate.assert_called_once_with(cover_path)
+
     def test_save_cover_image_invalid_image(
         self,
         cover_service: BookCoverService,
@@ -0,0 +1,170 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the single-pass book file probe."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import zipfile
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pypdf import PdfWriter
+
+from bookcard.services.book_file_probe import BookFileProbe
+from bookcard.services.book_metadata import BookMetadata
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_OPF = """<?xml version="1.0"?>
+<package xmlns="http://www.idpf.org/2007/opf"
+         xmlns:dc="http://purl.org/dc/elements/1.1/" version="3.0">
+    <metadata>
+        <dc:title>Probe Title</dc:title>
+        <dc:creator>Probe Author</dc:creator>
+    </metadata>
+    <manifest>
+        <item id="cover" href="cover.jpg" media-type="image/jpeg"
+              properties="cover-image"/>
+    </manifest>
+</package>"""
+
+_COVER = b"fake image data"
+
+
+@pytest.fixture
+def epub_path(tmp_path: Path) -> Path:
+    """Return an EPUB with metadata and a cover image."""
+    path = tmp_path / "book.epub"
+    with zipfile.ZipFile(path, "w") as epub_zip:
+        epub_zip.writestr("content.opf", _OPF)
+        epub_zip.writestr("cover.jpg", _COVER)
+    return path
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    """Return a three-page PDF with a title."""
+    path = tmp_path / "book.pdf"
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=72, height=72)
+    writer.add_metadata({"/Title": "PDF Title"})
+    with path.open("wb") as stream:
+        writer.write(stream)
+    return path
+
+
+def test_probe_epub_reads_metadata_cover_and_hash(epub_path: Path) -> None:
+    """Test EPUB metadata and cover come from a single package parse."""
+    cover_extractor = MagicMock()
+    probe = BookFileProbe(cover_extractor=cover_extractor)
+
+    with patch(
+        "bookcard.services.book_file_probe.zipfile.ZipFile", wraps=zipfile.ZipFile
+    ) as zip_file:
+        result = probe.probe(epub_path, "epub")
+
+    assert zip_file.call_count == 1
+    assert result.metadata.title == "Probe Title"
+    assert result.metadata.author == "Probe Author"
+    assert result.cover_data == _COVER
+    assert result.page_count is None
+    assert result.sha256 == hashlib.sha256(epub_path.read_bytes()).hexdigest()
+    assert result.size == epub_path.stat().st_size
+    cover_extractor.extract_cover.assert_not_called()
+
+
+def test_probe_pdf_reads_metadata_and_page_count(pdf_path: Path) -> None:
+    """Test PDF metadata and page count come from one reader."""
+    probe = BookFileProbe(cover_extractor=MagicMock(extract_cover=lambda *_: None))
+
+    result = probe.probe(pdf_path, "PDF")
+
+    assert result.metadata.title == "PDF Title"
+    assert result.page_count == 3
+
+
+def test_probe_other_formats_use_extractors(tmp_path: Path) -> None:
+    """Test formats without a single-pass probe fall back to the strategies."""
+    path = tmp_path / "book.mobi"
+    path.write_bytes(b"mobi")
+    metadata = BookMetadata(title="Mobi Title")
+    metadata_extractor = MagicMock()
+    metadata_extractor.extract_metadata.return_value = metadata
+    cover_extractor = MagicMock()
+    cover_extractor.extract_cover.return_value = b"cover"
+    probe = BookFileProbe(metadata_extractor, cover_extractor)
+
+    result = probe.probe(path, "mobi", "Original.mobi")
+
+    metadata_extractor.extract_metadata.assert_called_once_with(
+        path, "MOBI", "Original.mobi"
+    )
+    cover_extractor.extract_cover.assert_called_once_with(path, "MOBI")
+    assert result.metadata.title == "Mobi Title"
+    assert result.cover_data == b"cover"
+    assert result.sha256 == hashlib.sha256(b"mobi").hexdigest()
+
+
+def test_probe_is_cached_until_file_changes(epub_path: Path) -> None:
+    """Test repeated probes reuse the result until size or mtime changes."""
+    probe = BookFileProbe()
+
+    with patch.object(probe, "_probe_file", wraps=probe._probe_file) as probe_file:
+        probe.probe(epub_path, "epub")
+        probe.probe(epub_path, "EPUB")
+        assert probe_file.call_count == 1
+
+        stat = epub_path.stat()
+        os.utime(epub_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        probe.probe(epub_path, "epub")
+        assert probe_file.call_count == 2
+
+
+def test_probe_returns_metadata_copies(epub_path: Path) -> None:
+    """Test callers may modify returned metadata without corrupting the cache."""
+    probe = BookFileProbe()
+
+    probe.probe(epub_path, "epub").metadata.title = "Changed"
+
+    assert probe.probe(epub_path, "epub").metadata.title == "Probe Title"
+
+
+def test_content_hash_reuses_probe_hash(epub_path: Path) -> None:
+    """Test the content hash of a probed file is not recomputed."""
+    probe = BookFileProbe()
+    sha256 = probe.probe(epub_path, "epub").sha256
+
+    with patch("bookcard.services.book_file_probe._hash_stream") as hash_stream:
+        assert probe.content_hash(epub_path) == sha256
+
+    hash_stream.assert_not_called()
+
+
+def test_content_hash_of_unprobed_file(tmp_path: Path) -> None:
+    """Test the content hash is computed and cached for unprobed files."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"content")
+    probe = BookFileProbe()
+
+    assert probe.content_hash(path) == hashlib.sha256(b"content").hexdigest()
+    probe.clear()
+    path.write_bytes(b"other content")
+    assert probe.content_hash(path) == hashlib.sha256(b"other content").hexdigest()
@@ -28,6 +28,7 @@ from bookcard.models.config import Library
 from bookcard.models.conversion import BookConversion, ConversionMethod
 from bookcard.models.core import Book
 from bookcard.models.epub_fixer import EPUBFix
+from bookcard.models.file_hash import BookFileHash
 from bookcard.models.ingest import IngestAudit, IngestHistory, IngestRetry
 from bookcard.models.kobo import (
     KoboArchivedBook,
@@ -100,9 +101,14 @@ def test_list_books_calculates_offset() -> None:
             full=False,
             pubdate_month=None,
             pubdate_day=None,
+            visibility=None,
         )
         mock_repo.count_books.assert_called_once_with(
-            search_query=None, author_id=None, pubdate_month=None, pubdate_day=None
+            search_query=None,
+            author_id=None,
+            pubdate_month=None,
+            pubdate_day=None,
+            visibility=None,
         )
         assert books == []
         assert total == 0
@@ -135,6 +141,7 @@ def test_list_books_with_search() -> None:
             author_id=None,
             pubdate_month=None,
             pubdate_day=None,
+            visibility=None,
         )
 
 
@@ -498,6 +505,7 @@ def test_list_books_with_filters_calculates_offset() -> None:
             sort_by="timestamp",
             sort_order="desc",
             full=False,
+            visibility=None,
         )
         mock_repo.count_books_with_filters.assert_called_once_with(
             author_ids=[1, 2],
@@ -509,6 +517,7 @@ def test_list_books_with_filters_calculates_offset() -> None:
             formats=None,
             rating_ids=None,
             language_ids=None,
+            visibility=None,
         )
         assert books == []
         assert total == 0
@@ -798,6 +807,128 @@ def test_add_book_without_library_root() -> None:
         assert call_kwargs["library_path"] == Path("/path/to/library")
 
 
+@pytest.mark.parametrize(
+    ("env_value", "expect_indexed"),
+    [(None, False), ("0", False), ("1", True)],
+)
+def test_add_book_indexes_file_hash_only_when_enabled(
+    monkeypatch: pytest.MonkeyPatch,
+    env_value: str | None,
+    expect_indexed: bool,
+) -> None:
+    """Test add_book only hashes the stored file when hash detection is on."""
+    if env_value is None:
+        monkeypatch.delenv("BOOKCARD_DUPLICATE_FILE_HASH", raising=False)
+    else:
+        monkeypatch.setenv("BOOKCARD_DUPLICATE_FILE_HASH", env_value)
+    library = Library(
+        id=1,
+        name="Test Library",
+        calibre_db_path="/path/to/library",
+        calibre_db_file="metadata.db",
+    )
+
+    with (
+        patch(
+            "bookcard.services.book_service.CalibreBookRepository"
+        ) as mock_repo_class,
+        patch("bookcard.services.book_service.FileHashIndex") as mock_index_class,
+        patch.object(
+            BookService,
+            "get_format_file_path",
+            return_value=Path("/path/to/library/book.epub"),
+        ),
+    ):
+        mock_repo_class.return_value.add_book.return_value = 123
+        service = BookService(library, session=MagicMock())
+        service.add_book(
+            file_path=Path("/tmp/test.epub"),
+            file_format="epub",
+            title="Test Book",
+        )
+
+    assert mock_index_class.return_value.record_file.called is expect_indexed
+
+
+def test_add_book_keeps_session_work_when_indexing_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a failed index write rolls back only its savepoint."""
+    monkeypatch.setenv("BOOKCARD_DUPLICATE_FILE_HASH", "1")
+    library = Library(id=1, name="Test Library", calibre_db_path="/path/to/library")
+    session = MagicMock()
+
+    with (
+        patch(
+            "bookcard.services.book_service.CalibreBookRepository"
+        ) as mock_repo_class,
+        patch("bookcard.services.book_service.FileHashIndex") as mock_index_class,
+        patch.object(
+            BookService,
+            "get_format_file_path",
+            return_value=Path("/path/to/library/book.epub"),
+        ),
+    ):
+        mock_repo_class.return_value.add_book.return_value = 123
+        mock_index_class.return_value.record_file.side_effect = SQLAlchemyError(
+            "locked"
+        )
+        book_id = BookService(library, session=session).add_book(
+            file_path=Path("/tmp/test.epub"), file_format="epub"
+        )
+
+    assert book_id == 123
+    session.begin_nested.assert_called_once()
+    session.rollback.assert_not_called()
+
+
+@pytest.mark.parametrize(("env_value", "expect_removed"), [(None, False), ("1", True)])
+def test_delete_format_updates_file_hash_only_when_enabled(
+    monkeypatch: pytest.MonkeyPatch,
+    env_value: str | None,
+    expect_removed: bool,
+) -> None:
+    """Test delete_format only touches the hash index when detection is on."""
+    if env_value is None:
+        monkeypatch.delenv("BOOKCARD_DUPLICATE_FILE_HASH", raising=False)
+    else:
+        monkeypatch.setenv("BOOKCARD_DUPLICATE_FILE_HASH", env_value)
+    library = Library(id=1, name="Test Library", calibre_db_path="/path/to/library")
+    session = MagicMock()
+
+    with (
+        patch("bookcard.services.book_service.CalibreBookRepository"),
+        patch("bookcard.services.book_service.FileHashIndex") as mock_index_class,
+    ):
+        BookService(library, session=session).delete_format(
+            book_id=123, file_format="epub"
+        )
+
+    assert mock_index_class.return_value.remove.called is expect_removed
+    assert session.begin_nested.called is expect_removed
+    session.commit.assert_not_called()
+    session.rollback.assert_not_called()
+
+
+def test_delete_format_survives_file_hash_index_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a failed index update does not fail the format deletion."""
+    monkeypatch.setenv("BOOKCARD_DUPLICATE_FILE_HASH", "1")
+    library = Library(id=1, name="Test Library", calibre_db_path="/path/to/library")
+
+    with (
+        patch("bookcard.services.book_service.CalibreBookRepository") as repo_class,
+        patch("bookcard.services.book_service.FileHashIndex") as mock_index_class,
+    ):
+        mock_index_class.return_value.remove.side_effect = SQLAlchemyError("locked")
+        BookService(library, session=MagicMock()).delete_format(
+            book_id=123, file_format="epub"
+        )
+
+    repo_class.return_value.delete_format.assert_called_once()
+
+
 def test_delete_book_with_library_root() -> None:
     """Test delete_book uses library_root when available (covers lines 499-505)."""
     library = Library(
@@ -953,6 +1084,7 @@ def test_delete_bookcard_associations_deletes_all_model_types() -> None:
         [mock_epub_fix],
         [mock_metadata_enforcement],
         [mock_ingest_history],
+        [MagicMock(spec=BookFileHash)],  # File hash index records
     ]
 
     call_count = [0]  # Use list to allow modification in closure
@@ -974,11 +1106,12 @@ def test_delete_bookcard_associations_deletes_all_model_types() -> None:
     # Call the method
     service._delete_bookcard_associations(book_id)
 
-    # Verify session.exec was called for TrackedBook + ingest dependencies + 12 model types
-    assert mock_session.exec.call_count == 16
+    # Verify session.exec was called for TrackedBook + ingest dependencies
+    # + 12 model types + file hash index
+    assert mock_session.exec.call_count == 17
 
     # Verify session.delete was called for ingest dependencies + model deletes
-    assert mock_session.delete.call_count == 14
+    assert mock_session.delete.call_count == 15
 
     # Verify commit was called
     mock_session.commit.assert_called_once()
@@ -1002,8 +1135,9 @@ def test_delete_bookcard_associations_handles_empty_results() -> None:
     # Call the method
     service._delete_bookcard_associations(123)
 
-    # Verify session.exec was called for TrackedBook + ingest history id query + 12 model types
-    assert mock_session.exec.call_count == 14
+    # Verify session.exec was called for TrackedBook + ingest history id query
+    # + 12 model types + file hash index
+    assert mock_session.exec.call_count == 15
 
     # Verify session.delete was never called (no records to delete)
     mock_session.delete.assert_not_called()
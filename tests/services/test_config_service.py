@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -345,9 +346,15 @@ def test_delete_library_success() -> None:
 
     session.add(library)  # Add to session for get() lookup
 
-    service.delete_library(1)
+    with patch(
+        "bookcard.services.config_service.get_calibre_engine_registry"
+    ) as mock_get_registry:
+        service.delete_library(1)
 
     assert library in session.deleted
+    mock_get_registry.return_value.dispose.assert_called_once_with(
+        Path("/path/to/library/metadata.db")
+    )
 
 
 def test_delete_library_not_found() -> None:
@@ -0,0 +1,154 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the cover thumbnail cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from PIL import Image
+
+from bookcard.services.cover_thumbnail_cache import CoverThumbnailCache
+
+
+@pytest.fixture
+def cover_path(tmp_path: Path) -> Path:
+    """Create a 600x900 JPEG cover."""
+    path = tmp_path / "book" / "cover.jpg"
+    path.parent.mkdir()
+    Image.new("RGB", (600, 900), "green").save(path, format="JPEG")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> CoverThumbnailCache:
+    """Create a cache in a temporary directory."""
+    return CoverThumbnailCache(tmp_path / "cache")
+
+
+@pytest.mark.parametrize(
+    ("width", "height", "expected"),
+    [
+        (None, None, None),
+        (100, None, 120),
+        (200, 350, 600),
+        (300, None, 300),
+        (5000, None, None),
+    ],
+)
+def test_bucket_for(
+    width: int | None, height: int | None, expected: int | None
+) -> None:
+    """Test requested sizes round up to the nearest bucket."""
+    assert CoverThumbnailCache.bucket_for(width, height) == expected
+
+
+def test_get_without_size_returns_original(
+    cache: CoverThumbnailCache, cover_path: Path
+) -> None:
+    """Test that no requested size serves the original cover."""
+    thumb = cache.get(cover_path)
+
+    assert thumb.path == cover_path
+    assert thumb.media_type == "image/jpeg"
+    assert thumb.etag.startswith('"')
+
+
+@pytest.mark.parametrize(
+    ("image_format", "media_type"),
+    [("jpeg", "image/jpeg"), ("webp", "image/webp")],
+)
+def test_get_generates_variant(
+    cache: CoverThumbnailCache,
+    cover_path: Path,
+    image_format: str,
+    media_type: str,
+) -> None:
+    """Test that a resized variant is generated and reused."""
+    thumb = cache.get(cover_path, width=300, image_format=image_format)
+
+    assert thumb.path != cover_path
+    assert thumb.media_type == media_type
+    with Image.open(thumb.path) as img:
+        assert img.size == (200, 300)
+
+    mtime = thumb.path.stat().st_mtime_ns
+    again = cache.get(cover_path, width=250, image_format=image_format)
+    assert again.path == thumb.path
+    assert again.etag == thumb.etag
+    assert again.path.stat().st_mtime_ns == mtime
+
+
+def test_get_rejects_unknown_format(
+    cache: CoverThumbnailCache, cover_path: Path
+) -> None:
+    """Test that unsupported formats raise ValueError."""
+    with pytest.raises(ValueError, match="Unsupported thumbnail format"):
+        cache.get(cover_path, width=100, image_format="gif")
+
+
+def test_changed_cover_gets_new_variant(
+    cache: CoverThumbnailCache, cover_path: Path
+) -> None:
+    """Test that replacing a cover changes the ETag and drops old variants."""
+    first = cache.get(cover_path, width=120)
+
+    Image.new("RGB", (300, 300), "white").save(cover_path, format="JPEG")
+    stat = cover_path.stat()
+    os.utime(cover_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = cache.get(cover_path, width=120)
+
+    assert second.etag != first.etag
+    assert not first.path.exists()
+    with Image.open(second.path) as img:
+        assert img.size == (120, 120)
+
+
+def test_invalid_image_falls_back_to_original(
+    cache: CoverThumbnailCache, tmp_path: Path
+) -> None:
+    """Test that undecodable covers are served unchanged."""
+    broken = tmp_path / "cover.jpg"
+    broken.write_bytes(b"not an image")
+
+    thumb = cache.get(broken, width=120)
+
+    assert thumb.path == broken
+
+
+def test_invalidate_removes_variants(
+    cache: CoverThumbnailCache, cover_path: Path
+) -> None:
+    """Test that invalidate deletes cached variants."""
+    thumb = cache.get(cover_path, width=120)
+
+    cache.invalidate(cover_path)
+
+    assert not thumb.path.exists()
+
+
+def test_from_data_directory(tmp_path: Path) -> None:
+    """Test the cache is rooted under the data directory."""
+    cache = CoverThumbnailCache.from_data_directory(tmp_path)
+    cover = tmp_path / "cover.jpg"
+    Image.new("RGB", (500, 500)).save(cover, format="JPEG")
+
+    thumb = cache.get(cover, width=120)
+
+    assert (tmp_path / "cache" / "covers") in thumb.path.parents
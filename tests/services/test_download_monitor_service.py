@@ -15,7 +15,9 @@
 
 """Unit tests for DownloadMonitorService."""
 
-from unittest.mock import MagicMock
+import threading
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlmodel import Session
@@ -29,6 +31,8 @@ from bookcard.models.pvr import (
     TrackedBook,
     TrackedBookStatus,
 )
+from bookcard.pvr.models import DownloadItem as ClientDownloadItem
+from bookcard.services.download.client_pool import DownloadClientPool
 from bookcard.services.download_monitor_service import DownloadMonitorService
 
 
@@ -165,3 +169,102 @@ class TestDownloadMonitorService:
         # Verify session calls
         mock_session.add.assert_any_call(tracked_book)
         mock_session.add.assert_any_call(sample_download_item)
+
+
+class FakeTracker:
+    """Download client returning the items of a callable."""
+
+    def __init__(self, fetch: Callable[[], list[ClientDownloadItem]]) -> None:
+        self._fetch = fetch
+        self.calls: list[str] = []
+
+    def get_items(self) -> list[ClientDownloadItem]:
+        self.calls.append("get_items")
+        return self._fetch()
+
+
+class FakeIncrementalTracker(FakeTracker):
+    """Download client supporting incremental sync."""
+
+    def sync_items(self) -> list[ClientDownloadItem]:
+        self.calls.append("sync_items")
+        return self._fetch()
+
+
+class TestCheckDownloads:
+    """Test suite for concurrent polling in check_downloads."""
+
+    @staticmethod
+    def _definition(
+        client_id: int, timeout_seconds: int = 30
+    ) -> DownloadClientDefinition:
+        return DownloadClientDefinition(
+            id=client_id,
+            name=f"Client {client_id}",
+            client_type=DownloadClientType.QBITTORRENT,
+            host=f"host-{client_id}",
+            timeout_seconds=timeout_seconds,
+        )
+
+    @staticmethod
+    def _service(
+        mock_session: MagicMock,
+        definitions: list[DownloadClientDefinition],
+        clients: dict[int, object],
+    ) -> tuple[DownloadMonitorService, MagicMock]:
+        client_repo = MagicMock()
+        client_repo.get_enabled_clients.return_value = definitions
+        factory = MagicMock()
+        factory.create.side_effect = lambda definition: clients[definition.id]
+        health_manager = MagicMock()
+        item_repo = MagicMock()
+        item_repo.get_by_client.return_value = []
+        service = DownloadMonitorService(
+            mock_session,
+            item_repo=item_repo,
+            client_repo=client_repo,
+            client_factory=factory,
+            health_manager=health_manager,
+            client_pool=DownloadClientPool(),
+        )
+        return service, health_manager
+
+    def test_slow_client_times_out_without_stalling_others(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test a hanging client fails alone while others are processed."""
+        release = threading.Event()
+        slow = FakeTracker(lambda: release.wait(5) and [])
+        fast = FakeTracker(list)
+        slow_def = self._definition(1, timeout_seconds=0)
+        fast_def = self._definition(2)
+        service, health_manager = self._service(
+            mock_session, [slow_def, fast_def], {1: slow, 2: fast}
+        )
+
+        with patch(
+            "bookcard.services.download_monitor_service.POLL_TIMEOUT_FACTOR", 0.1
+        ):
+            service.check_downloads()
+        release.set()
+
+        health_manager.update_status.assert_any_call(
+            slow_def,
+            DownloadClientStatus.UNHEALTHY,
+            "Timed out fetching download client items",
+        )
+        health_manager.update_status.assert_any_call(
+            fast_def, DownloadClientStatus.HEALTHY
+        )
+
+    def test_incremental_clients_are_synced(self, mock_session: MagicMock) -> None:
+        """Test clients supporting incremental sync are polled with sync_items."""
+        client = FakeIncrementalTracker(list)
+        service, _health_manager = self._service(
+            mock_session, [self._definition(1)], {1: client}
+        )
+
+        service.check_downloads()
+        service.check_downloads()
+
+        assert client.calls == ["sync_items", "sync_items"]
@@ -0,0 +1,108 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for HTTP conditional request helpers."""
+
+from __future__ import annotations
+
+from email.utils import formatdate
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from fastapi.responses import FileResponse
+from starlette.requests import Request
+
+from bookcard.services.http_caching import (
+    build_validator_headers,
+    conditional_file_response,
+    is_not_modified,
+)
+
+ETAG = '"abc-120-jpeg"'
+MTIME = 1_700_000_000.0
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [
+            (key.lower().encode(), value.encode())
+            for key, value in (headers or {}).items()
+        ],
+    })
+
+
+def test_build_validator_headers() -> None:
+    """Test validator headers include ETag, Last-Modified and Cache-Control."""
+    headers = build_validator_headers(ETAG, MTIME)
+
+    assert headers["ETag"] == ETAG
+    assert headers["Last-Modified"] == formatdate(MTIME, usegmt=True)
+    assert "max-age" in headers["Cache-Control"]
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, False),
+        ({"If-None-Match": ETAG}, True),
+        ({"If-None-Match": f'"other", W/{ETAG}'}, True),
+        ({"If-None-Match": "*"}, True),
+        ({"If-None-Match": '"other"'}, False),
+        ({"If-Modified-Since": formatdate(MTIME, usegmt=True)}, True),
+        ({"If-Modified-Since": formatdate(MTIME - 60, usegmt=True)}, False),
+        ({"If-Modified-Since": "garbage"}, False),
+        (
+            {
+                "If-None-Match": '"other"',
+                "If-Modified-Since": formatdate(MTIME, usegmt=True),
+            },
+            False,
+        ),
+    ],
+)
+def test_is_not_modified(headers: dict[str, str], expected: bool) -> None:
+    """Test conditional header evaluation."""
+    assert is_not_modified(_request(headers), ETAG, MTIME) is expected
+
+
+def test_conditional_file_response(tmp_path: Path) -> None:
+    """Test a file is served with validators, or 304 when unchanged."""
+    path = tmp_path / "cover.jpg"
+    path.write_bytes(b"data")
+
+    response = conditional_file_response(
+        _request(),
+        path,
+        media_type="image/jpeg",
+        etag=ETAG,
+        last_modified=MTIME,
+        extra_headers={"Vary": "Accept"},
+    )
+    assert isinstance(response, FileResponse)
+    assert response.headers["etag"] == ETAG
+    assert response.headers["vary"] == "Accept"
+
+    not_modified = conditional_file_response(
+        _request({"If-None-Match": ETAG}),
+        path,
+        media_type="image/jpeg",
+        etag=ETAG,
+        last_modified=MTIME,
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == ETAG
@@ -0,0 +1,209 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the multi-library book service."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from bookcard.models.core import Book
+from bookcard.repositories.models import BookWithRelations
+from bookcard.services import multi_library_book_service
+from bookcard.services.multi_library_book_service import MultiLibraryBookService
+
+if TYPE_CHECKING:
+    from bookcard.repositories.calibre.repository import CalibreBookRepository
+
+
+class FakeRepository:
+    """In-memory stand-in exposing the repository calls the service uses."""
+
+    def __init__(self, titles: dict[int, str]) -> None:
+        self.titles = titles
+        self.loaded_ids: list[list[int]] = []
+        self.key_calls = 0
+
+    def _keys(self, sort_order: str) -> list[tuple[object, int]]:
+        return sorted(
+            ((title.lower(), book_id) for book_id, title in self.titles.items()),
+            reverse=sort_order == "desc",
+        )
+
+    def list_book_sort_keys(
+        self,
+        *,
+        sort_by: str,
+        sort_order: str,
+        after: tuple[object, int] | None,
+        limit: int,
+        **_: Any,  # noqa: ANN401
+    ) -> list[tuple[object, int]]:
+        assert sort_by == "title"
+        self.key_calls += 1
+        keys = self._keys(sort_order)
+        if after is not None:
+            if sort_order == "desc":
+                keys = [k for k in keys if k < after]
+            else:
+                keys = [k for k in keys if k > after]
+        return keys[:limit]
+
+    list_book_sort_keys_with_filters = list_book_sort_keys
+
+    def count_books(self, **_: Any) -> int:  # noqa: ANN401
+        return len(self.titles)
+
+    count_books_with_filters = count_books
+
+    def list_books_by_ids_query(
+        self,
+        stmt: Any,  # noqa: ANN401
+        *,
+        limit: int,
+        full: bool = False,
+    ) -> list[BookWithRelations]:
+        book_ids = list(stmt.whereclause.right.value)
+        self.loaded_ids.append(book_ids)
+        # Deliberately out of order: the service restores page order
+        return [
+            BookWithRelations(
+                book=Book(id=book_id, title=self.titles[book_id]),
+                authors=[],
+                series=None,
+                formats=[],
+            )
+            for book_id in sorted(book_ids, reverse=True)
+        ][:limit]
+
+
+@pytest.fixture
+def repos() -> dict[int, FakeRepository]:
+    return {
+        1: FakeRepository({1: "Alpha", 2: "Delta", 3: "Echo"}),
+        2: FakeRepository({1: "Bravo", 2: "Delta", 3: "Foxtrot"}),
+        3: FakeRepository({}),
+    }
+
+
+def _service(repos: dict[int, FakeRepository]) -> MultiLibraryBookService:
+    return MultiLibraryBookService(
+        {}, repositories=cast("dict[int, CalibreBookRepository]", repos)
+    )
+
+
+def _titles(books: list[Any]) -> list[tuple[int, str]]:
+    return [(b.library_id, b.book.title) for b in books]
+
+
+def test_list_books_merges_libraries_in_order(
+    repos: dict[int, FakeRepository],
+) -> None:
+    result = _service(repos).list_books(
+        page=1, page_size=10, sort_by="title", sort_order="asc"
+    )
+
+    assert _titles(result.books) == [
+        (1, "Alpha"),
+        (2, "Bravo"),
+        (1, "Delta"),
+        (2, "Delta"),
+        (1, "Echo"),
+        (2, "Foxtrot"),
+    ]
+    assert result.total == 6
+    assert result.next_cursor is None
+
+
+def test_list_books_descending_breaks_ties_by_library(
+    repos: dict[int, FakeRepository],
+) -> None:
+    result = _service(repos).list_books(
+        page=1, page_size=4, sort_by="title", sort_order="desc"
+    )
+
+    assert _titles(result.books) == [
+        (2, "Foxtrot"),
+        (1, "Echo"),
+        (2, "Delta"),
+        (1, "Delta"),
+    ]
+    assert result.next_cursor is not None
+
+
+def test_list_books_loads_only_the_page(repos: dict[int, FakeRepository]) -> None:
+    _service(repos).list_books(page=2, page_size=2, sort_by="title", sort_order="asc")
+
+    assert repos[1].loaded_ids == [[2]]
+    assert repos[2].loaded_ids == [[2]]
+    assert repos[3].loaded_ids == []
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize("page_size", [1, 2, 4])
+def test_cursor_pages_match_offset_pages(
+    repos: dict[int, FakeRepository], sort_order: str, page_size: int
+) -> None:
+    service = _service(repos)
+    by_offset: list[tuple[int, str]] = []
+    for page in range(1, 7):
+        by_offset += _titles(
+            service.list_books(
+                page=page, page_size=page_size, sort_by="title", sort_order=sort_order
+            ).books
+        )
+
+    by_cursor: list[tuple[int, str]] = []
+    cursor = None
+    while True:
+        result = service.list_books_with_filters(
+            page_size=page_size,
+            sort_by="title",
+            sort_order=sort_order,
+            cursor=cursor,
+        )
+        by_cursor += _titles(result.books)
+        if result.next_cursor is None:
+            break
+        cursor = result.next_cursor
+
+    assert by_cursor == by_offset
+    assert len(by_cursor) == 6
+
+
+def test_deep_pages_fetch_keys_in_batches(
+    repos: dict[int, FakeRepository], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(multi_library_book_service, "MAX_KEY_BATCH", 1)
+
+    result = _service(repos).list_books(
+        page=5, page_size=1, sort_by="title", sort_order="asc"
+    )
+
+    assert _titles(result.books) == [(1, "Echo")]
+    assert repos[1].key_calls > 1
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", "W10", "WyJ0aXRsZSIsImFzYyIsIngiLDEsMl0"]
+)
+def test_invalid_cursor_is_rejected(
+    repos: dict[int, FakeRepository], cursor: str
+) -> None:
+    # The last cursor is valid but was issued for ascending order
+    with pytest.raises(ValueError, match="invalid_cursor"):
+        _service(repos).list_books(sort_by="title", sort_order="desc", cursor=cursor)
@@ -0,0 +1,218 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the process-wide OIDC key manager."""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import replace
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from bookcard.config import AppConfig
+from bookcard.services.oidc_auth_service import (
+    OIDCAuthService,
+    OIDCTokenValidationError,
+)
+from bookcard.services.oidc_key_manager import (
+    OIDCKeyManager,
+    configure_oidc_key_manager,
+    get_oidc_key_manager,
+)
+from tests.conftest import TEST_ENCRYPTION_KEY
+
+_ISSUER = "http://issuer.example/realms/bookcard"
+_JWKS_URI = f"{_ISSUER}/certs"
+
+
+def _cfg() -> AppConfig:
+    return AppConfig(
+        jwt_secret="test-secret",
+        jwt_algorithm="HS256",
+        jwt_expires_minutes=15,
+        encryption_key=TEST_ENCRYPTION_KEY,
+        oidc_enabled=True,
+        oidc_client_id="bookcard-client",
+        oidc_issuer=_ISSUER,
+    )
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProvider:
+    """OIDC provider serving discovery and a rotatable JWKS."""
+
+    def __init__(self) -> None:
+        self.keys: dict[str, rsa.RSAPrivateKey] = {}
+        self.requests: list[str] = []
+        self.extra_jwks: list[object] = []
+        self.down = False
+
+    def add_key(self, kid: str) -> None:
+        self.keys[kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def token(self, kid: str, **claims: object) -> str:
+        payload: dict[str, object] = {
+            "sub": "oidc-sub",
+            "aud": "bookcard-client",
+            "iss": _ISSUER,
+            "exp": int(time.time()) + 300,
+        }
+        payload.update(claims)
+        return jwt.encode(
+            payload, self.keys[kid], algorithm="RS256", headers={"kid": kid}
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        self.requests.append(url)
+        if self.down:
+            return httpx.Response(503, json={})
+        if url.endswith("openid-configuration"):
+            return httpx.Response(200, json={"jwks_uri": _JWKS_URI})
+        jwks: list[object] = [
+            {**json.loads(RSAAlgorithm.to_jwk(key.public_key())), "kid": kid}
+            for kid, key in self.keys.items()
+        ]
+        jwks.extend(self.extra_jwks)
+        return httpx.Response(200, json={"keys": jwks})
+
+
+@pytest.fixture
+def provider() -> FakeProvider:
+    """Return a provider with one signing key."""
+    provider = FakeProvider()
+    provider.add_key("k1")
+    return provider
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(provider: FakeProvider, clock: FakeClock) -> OIDCKeyManager:
+    """Return a key manager talking to the fake provider."""
+    return OIDCKeyManager(
+        _cfg(),
+        http_client=httpx.Client(transport=httpx.MockTransport(provider.handler)),
+        clock=clock,
+    )
+
+
+def _validate(manager: OIDCKeyManager, token: str) -> dict[str, object]:
+    return OIDCAuthService(_cfg(), key_manager=manager).validate_access_token(
+        token=token
+    )
+
+
+def test_keys_and_claims_are_shared_across_services(
+    manager: OIDCKeyManager, provider: FakeProvider
+) -> None:
+    """Test services of later requests reuse discovery, keys and claims."""
+    token = provider.token("k1")
+
+    assert _validate(manager, token)["sub"] == "oidc-sub"
+    assert _validate(manager, token)["sub"] == "oidc-sub"
+    assert _validate(manager, provider.token("k1", sub="other"))["sub"] == "other"
+
+    assert len(provider.requests) == 2
+
+
+def test_cached_claims_expire_with_token(
+    manager: OIDCKeyManager, provider: FakeProvider, clock: FakeClock
+) -> None:
+    """Test claims are not reused past the token's exp."""
+    token = provider.token("k1", exp=int(clock.now) + 10)
+    _validate(manager, token)
+
+    assert manager.get_claims(token) is not None
+    clock.now += 11
+    assert manager.get_claims(token) is None
+
+
+def test_malformed_jwks_entries_are_skipped(
+    manager: OIDCKeyManager, provider: FakeProvider
+) -> None:
+    """Test JWKS entries without a string kid do not break key loading."""
+    public_jwk = json.loads(RSAAlgorithm.to_jwk(provider.keys["k1"].public_key()))
+    provider.extra_jwks = [
+        "not-a-key",
+        {k: v for k, v in public_jwk.items() if k != "kid"},
+        {**public_jwk, "kid": 42},
+        {**public_jwk, "kid": ["k1"]},
+    ]
+
+    assert _validate(manager, provider.token("k1"))["sub"] == "oidc-sub"
+
+
+def test_unknown_kid_refreshes_keys_at_limited_rate(
+    manager: OIDCKeyManager, provider: FakeProvider, clock: FakeClock
+) -> None:
+    """Test rotated keys are picked up without refetching on every miss."""
+    _validate(manager, provider.token("k1"))
+    provider.add_key("k2")
+    rotated = provider.token("k2")
+
+    with pytest.raises(OIDCTokenValidationError, match="unknown_kid"):
+        _validate(manager, rotated)
+    assert len(provider.requests) == 2
+
+    clock.now += 61
+    assert _validate(manager, rotated)["sub"] == "oidc-sub"
+    assert len(provider.requests) == 3
+    with pytest.raises(OIDCTokenValidationError, match="unknown_kid"):
+        manager.get_signing_key("forged")
+    assert len(provider.requests) == 3
+
+
+def test_stale_keys_are_kept_while_provider_is_down(
+    manager: OIDCKeyManager, provider: FakeProvider, clock: FakeClock
+) -> None:
+    """Test a failed refresh keeps serving the cached keys."""
+    manager.refresh()
+    provider.down = True
+    clock.now += 3601
+
+    assert manager.get_signing_key("k1") is not None
+    assert manager.get_signing_key("k1") is not None
+    assert len(provider.requests) == 3
+
+
+def test_configure_requires_oidc_enabled() -> None:
+    """Test no manager is installed while OIDC is disabled."""
+    try:
+        assert configure_oidc_key_manager(_cfg()) is not None
+        disabled = replace(_cfg(), oidc_enabled=False)
+        assert configure_oidc_key_manager(disabled) is None
+        assert get_oidc_key_manager() is None
+    finally:
+        configure_oidc_key_manager(None)
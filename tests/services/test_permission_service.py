@@ -24,7 +24,9 @@ import pytest
 from fastapi import HTTPException, status
 
 from bookcard.models.auth import Permission, RolePermission, User, UserRole
+from bookcard.repositories.visibility import BookVisibility
 from bookcard.services.permission_service import PermissionService
+from bookcard.services.principal_cache import PermissionGrant
 
 if TYPE_CHECKING:
     from tests.conftest import DummySession
@@ -645,3 +647,51 @@ class TestGetUserPermissions:
         assert result[0]["permission"] == perm1
         assert result[1]["permission"] == perm2
         assert result[1]["condition"] == {"tag": "fiction"}
+
+
+class TestGetBookVisibility:
+    """Test get_book_visibility method."""
+
+    def test_admin_sees_every_book(
+        self, permission_service: PermissionService, admin_user: User
+    ) -> None:
+        """Test admins are unrestricted without loading grants."""
+        assert permission_service.get_book_visibility(admin_user) == BookVisibility()
+
+    @pytest.mark.parametrize(
+        ("grants", "expected"),
+        [
+            ((), BookVisibility(conditions=())),
+            (
+                (PermissionGrant("books", "write"),),
+                BookVisibility(conditions=()),
+            ),
+            (
+                (
+                    PermissionGrant("books", "read", {"tag": "fiction"}),
+                    PermissionGrant("books", "read"),
+                ),
+                BookVisibility(),
+            ),
+            (
+                (
+                    PermissionGrant("books", "read", {"tag": "fiction"}),
+                    PermissionGrant("shelves", "read", {"owner_id": "user.id"}),
+                    PermissionGrant("books", "read", {"author_id": 3}),
+                ),
+                BookVisibility(conditions=({"tag": "fiction"}, {"author_id": 3})),
+            ),
+        ],
+    )
+    def test_visibility_from_grants(
+        self,
+        permission_service: PermissionService,
+        user: User,
+        monkeypatch: pytest.MonkeyPatch,
+        grants: tuple[PermissionGrant, ...],
+        expected: BookVisibility,
+    ) -> None:
+        """Test book read grants are combined into a visibility."""
+        monkeypatch.setattr(permission_service, "get_user_grants", lambda _user: grants)
+
+        assert permission_service.get_book_visibility(user) == expected
@@ -0,0 +1,188 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the in-process principal cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from bookcard.models.auth import (
+    Permission,
+    Role,
+    RolePermission,
+    TokenBlacklist,
+    User,
+    UserRole,
+)
+from bookcard.models.config import Library  # noqa: F401
+from bookcard.services.permission_service import PermissionService
+from bookcard.services.principal_cache import (
+    PrincipalCache,
+    configure_principal_cache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from sqlalchemy import Engine
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    """Return an engine of a database with a user holding a viewer role."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = User(id=1, username="alice", email="a@example.com", password_hash="x")
+        role = Role(id=1, name="viewer")
+        permission = Permission(
+            id=1, name="books:read", resource="books", action="read"
+        )
+        session.add_all([user, role, permission])
+        session.flush()
+        session.add(UserRole(user_id=1, role_id=1))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> Iterator[PrincipalCache]:
+    """Install a principal cache driven by the fake clock."""
+    configure_principal_cache()
+    cache = PrincipalCache(clock=clock)
+    with patch("bookcard.services.principal_cache._cache", cache):
+        yield cache
+    configure_principal_cache(enabled=False)
+
+
+def _can_read(engine: Engine) -> bool:
+    with Session(engine) as session:
+        user = session.get(User, 1)
+        assert user is not None
+        return PermissionService(session).has_permission(user, "books", "read")
+
+
+def test_user_is_served_without_query(engine: Engine, cache: PrincipalCache) -> None:
+    """Test a cached user is attached to later sessions without loading it."""
+    with Session(engine) as session:
+        assert cache.get_user(session, 1) is not None
+
+    with Session(engine) as session, patch.object(session, "get") as get:
+        user = cache.get_user(session, 1)
+        assert user is not None
+        assert user.username == "alice"
+        assert [user_role.role_id for user_role in user.roles] == [1]
+    get.assert_not_called()
+
+
+def test_grants_are_loaded_once_per_session(
+    engine: Engine, cache: PrincipalCache, clock: FakeClock
+) -> None:
+    """Test a session never loads grants twice, the process only once per TTL."""
+    loads: list[int] = []
+
+    def _load() -> tuple:
+        loads.append(1)
+        return ()
+
+    with Session(engine) as session:
+        cache.get_grants(session, 1, _load)
+        cache.get_grants(session, 1, _load)
+    with Session(engine) as session:
+        cache.get_grants(session, 1, _load)
+    assert len(loads) == 1
+
+    clock.now += 11
+    with Session(engine) as session:
+        cache.get_grants(session, 1, _load)
+    assert len(loads) == 2
+
+
+def test_committed_role_changes_invalidate_grants(
+    engine: Engine, cache: PrincipalCache
+) -> None:
+    """Test granting a permission to a role is visible after commit."""
+    assert not _can_read(engine)
+
+    with Session(engine) as session:
+        session.add(RolePermission(role_id=1, permission_id=1))
+        session.flush()
+        assert PermissionService(session).has_permission(
+            session.get(User, 1),  # type: ignore[arg-type]
+            "books",
+            "read",
+        )
+        assert not _can_read(engine)
+        session.commit()
+
+    assert _can_read(engine)
+
+
+def test_rolled_back_changes_are_not_cached(
+    engine: Engine, cache: PrincipalCache
+) -> None:
+    """Test grants read from uncommitted changes never reach the cache."""
+    with Session(engine) as session:
+        session.add(RolePermission(role_id=1, permission_id=1))
+        session.flush()
+        user = session.get(User, 1)
+        assert user is not None
+        assert PermissionService(session).has_permission(user, "books", "read")
+        session.rollback()
+
+    assert not _can_read(engine)
+
+
+def test_blacklist_syncs_incrementally(
+    engine: Engine, cache: PrincipalCache, clock: FakeClock
+) -> None:
+    """Test revocations by other processes are seen after the sync interval."""
+    expires_at = datetime.now(UTC) + timedelta(hours=1)
+    with Session(engine) as session:
+        assert not cache.is_blacklisted(session, "other-process")
+        session.add(TokenBlacklist(jti="other-process", expires_at=expires_at))
+        session.commit()
+
+        cache.add_blacklisted("this-process", expires_at)
+        assert cache.is_blacklisted(session, "this-process")
+        assert not cache.is_blacklisted(session, "other-process")
+
+        clock.now += 5
+        assert cache.is_blacklisted(session, "other-process")
+        assert cache.is_blacklisted(session, "this-process")
@@ -21,6 +21,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from sqlmodel import Session
 
+from bookcard.common.filesystem import TransferMode
 from bookcard.models.config import Library
 from bookcard.models.pvr import (
     DownloadItem,
@@ -34,6 +35,7 @@ from bookcard.services.ingest.file_discovery_service import (
 )
 from bookcard.services.ingest.ingest_processor_service import IngestProcessorService
 from bookcard.services.pvr.importing.results import ImportStatus
+from bookcard.services.pvr.importing.workflow import PVRImportWorkflow
 from bookcard.services.pvr_import_service import PVRImportService
 from bookcard.services.tracked_book_service import TrackedBookService
 
@@ -248,9 +250,10 @@ class TestPVRImportService:
             patch("pathlib.Path.exists", return_value=True),
             patch("pathlib.Path.is_file", return_value=True),
             patch("pathlib.Path.stat", return_value=mock_stat),
+            patch.object(PVRImportWorkflow, "_staging_root", return_value=None),
             patch(
-                "bookcard.services.pvr.importing.file_preparation.shutil"
-            ) as mock_shutil,
+                "bookcard.services.pvr.importing.file_preparation.transfer_file"
+            ) as mock_transfer_file,
         ):
             # Mock file discovery - create a mock Path that has stat() method
             mock_book_file = MagicMock(spec=Path)
@@ -314,8 +317,8 @@ class TestPVRImportService:
                 assert result.book_id == 777
 
                 # Verify flow
-                # 1. Prepare files (copy/extract)
-                mock_shutil.copy2.assert_called()  # assuming file copy for single file
+                # 1. Prepare files (transfer/extract)
+                mock_transfer_file.assert_called()  # single file is transferred
 
                 # 2. Discovery
                 mock_file_discovery_service.discover_files.assert_called()
@@ -325,6 +328,9 @@ class TestPVRImportService:
                 mock_ingest_service.process_file_group.assert_called_with(file_group)
                 mock_ingest_service.fetch_and_store_metadata.assert_called()
                 mock_ingest_service.add_book_to_library.assert_called()
+                # Staged files are disposable, so they are linked, not copied
+                add_kwargs = mock_ingest_service.add_book_to_library.call_args.kwargs
+                assert add_kwargs["transfer_mode"] == TransferMode.HARDLINK
                 mock_ingest_service.finalize_history.assert_called_with(555, [777])
 
                 # NOTE: Transaction updates (linking) are harder to verify with
@@ -357,7 +363,7 @@ class TestPVRImportService:
         with (
             patch("pathlib.Path.exists", return_value=True),
             patch("pathlib.Path.is_file", return_value=True),
-            patch("bookcard.services.pvr.importing.file_preparation.shutil"),
+            patch("bookcard.services.pvr.importing.file_preparation.transfer_file"),
         ):
             # Return empty list for discovery
             mock_file_discovery_service.discover_files.return_value = []
@@ -414,7 +420,8 @@ class TestPVRImportService:
             patch("pathlib.Path.exists", return_value=True),
             patch("pathlib.Path.is_file", return_value=True),
             patch("pathlib.Path.stat", return_value=mock_stat),
-            patch("bookcard.services.pvr.importing.file_preparation.shutil"),
+            patch.object(PVRImportWorkflow, "_staging_root", return_value=None),
+            patch("bookcard.services.pvr.importing.file_preparation.transfer_file"),
         ):
             # Setup valid file discovery
             mock_file_discovery_service.discover_files.return_value = [book_file]
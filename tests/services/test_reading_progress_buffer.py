@@ -0,0 +1,226 @@
+# Copyright (C) 2025 knguyen and others
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the reading progress write-behind buffer."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from bookcard.models.auth import User  # noqa: F401
+from bookcard.models.config import Library  # noqa: F401
+from bookcard.models.reading import ReadingProgress, ReadStatus
+from bookcard.repositories.reading_repository import (
+    ReadingProgressRepository,
+    ReadingSessionRepository,
+    ReadStatusRepository,
+)
+from bookcard.services.reading_progress_buffer import (
+    BufferedProgress,
+    ReadingProgressBuffer,
+    configure_reading_progress_buffer,
+    get_reading_progress_buffer,
+)
+from bookcard.services.reading_service import ReadingService
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from sqlalchemy import Engine
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    """Return an engine of an empty application database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def buffer(engine: Engine) -> ReadingProgressBuffer:
+    """Return a buffer that is only flushed explicitly."""
+    return ReadingProgressBuffer(engine, flush_interval=3600)
+
+
+def _service(session: Session, buffer: ReadingProgressBuffer) -> ReadingService:
+    return ReadingService(
+        session,
+        ReadingProgressRepository(session),
+        ReadingSessionRepository(session),
+        ReadStatusRepository(session),
+        progress_buffer=buffer,
+    )
+
+
+def _update(session: Session, buffer: ReadingProgressBuffer, **kwargs: object) -> int:
+    values: dict[str, object] = {
+        "user_id": 1,
+        "library_id": 1,
+        "book_id": 1,
+        "book_format": "EPUB",
+    }
+    values.update(kwargs)
+    progress = _service(session, buffer).update_progress(**values)  # type: ignore[arg-type]
+    session.commit()
+    return progress.id  # type: ignore[return-value]
+
+
+def _stored(engine: Engine, book_id: int = 1) -> ReadingProgress:
+    with Session(engine) as session:
+        return session.exec(
+            select(ReadingProgress).where(ReadingProgress.book_id == book_id)
+        ).one()
+
+
+def test_first_update_is_written_through(
+    engine: Engine, buffer: ReadingProgressBuffer
+) -> None:
+    """Test progress rows are created immediately."""
+    with Session(engine) as session:
+        progress_id = _update(session, buffer, progress=0.1, cfi="a")
+
+    assert _stored(engine).id == progress_id
+    assert buffer.stats.pending == 0
+
+
+def test_updates_are_coalesced_and_flushed(
+    engine: Engine, buffer: ReadingProgressBuffer
+) -> None:
+    """Test later updates are buffered, read back, and flushed once."""
+    with Session(engine) as session:
+        progress_id = _update(session, buffer, progress=0.1, cfi="a")
+        assert _update(session, buffer, progress=0.2, cfi="b") == progress_id
+        _update(session, buffer, progress=0.3, page_number=7)
+
+        current = _service(session, buffer).get_progress(1, 1, 1, "EPUB")
+        assert current is not None
+        assert (current.progress, current.cfi, current.page_number) == (0.3, "b", 7)
+    assert _stored(engine).progress == 0.1
+
+    assert buffer.flush() == 1
+
+    stored = _stored(engine)
+    assert (stored.progress, stored.cfi, stored.page_number) == (0.3, "b", 7)
+    stats = buffer.stats
+    assert (stats.pending, stats.flushed_rows, stats.flushed_updates) == (0, 1, 2)
+    assert stats.coalescing_ratio == 2.0
+
+
+def test_threshold_update_is_written_through_over_pending(
+    engine: Engine, buffer: ReadingProgressBuffer
+) -> None:
+    """Test auto-marking updates are written at once and drop pending ones."""
+    with Session(engine) as session:
+        _update(session, buffer, progress=0.1)
+        _update(session, buffer, progress=0.5, cfi="pending")
+        _update(session, buffer, progress=0.95)
+
+    stored = _stored(engine)
+    assert (stored.progress, stored.cfi) == (0.95, "pending")
+    assert buffer.stats.pending == 0
+    with Session(engine) as session:
+        assert session.exec(select(ReadStatus)).one().auto_marked
+
+
+def test_flush_skips_entries_older_than_stored_progress(
+    engine: Engine, buffer: ReadingProgressBuffer
+) -> None:
+    """Test a flush never overwrites progress written after the update."""
+    with Session(engine) as session:
+        progress_id = _update(session, buffer, progress=0.1)
+    buffer.record(
+        BufferedProgress(
+            progress_id=progress_id,
+            user_id=1,
+            library_id=1,
+            book_id=1,
+            book_format="EPUB",
+            progress=0.4,
+            updated_at=datetime.now(UTC) - timedelta(hours=1),
+        )
+    )
+
+    buffer.flush()
+
+    assert _stored(engine).progress == 0.1
+
+
+def test_failed_flush_requeues_beneath_newer_updates(
+    engine: Engine, buffer: ReadingProgressBuffer
+) -> None:
+    """Test entries of a failed flush are kept without hiding newer updates."""
+    with Session(engine) as session:
+        _update(session, buffer, progress=0.1)
+        _update(session, buffer, progress=0.2, cfi="old")
+
+    with (
+        patch.object(buffer, "_write", side_effect=RuntimeError("locked")),
+        pytest.raises(RuntimeError),
+    ):
+        buffer.flush()
+    with Session(engine) as session:
+        _update(session, buffer, progress=0.3)
+
+    pending = buffer.get((1, 1, 1, "EPUB"))
+    assert pending is not None
+    assert (pending.progress, pending.cfi) == (0.3, "old")
+    assert buffer.stats.failed_flushes == 1
+
+
+def test_recent_reads_overlay_buffered_progress(
+    engine: Engine, buffer: ReadingProgressBuffer
+) -> None:
+    """Test recent reads reflect buffered progress and ordering."""
+    with Session(engine) as session:
+        _update(session, buffer, book_id=1, progress=0.1)
+        _update(session, buffer, book_id=2, progress=0.1)
+        _update(session, buffer, book_id=1, progress=0.6)
+
+        reads = _service(session, buffer).get_recent_reads(1, 1)
+
+    assert [(read.book_id, read.progress) for read in reads] == [(1, 0.6), (2, 0.1)]
+
+
+def test_shutdown_flushes_pending_updates(
+    engine: Engine, buffer: ReadingProgressBuffer
+) -> None:
+    """Test stopping the flusher persists everything still pending."""
+    buffer.start()
+    with Session(engine) as session:
+        _update(session, buffer, progress=0.1)
+        _update(session, buffer, progress=0.7)
+
+    buffer.shutdown()
+
+    assert _stored(engine).progress == 0.7
+
+
+def test_configure_disabled_by_zero_interval(engine: Engine) -> None:
+    """Test a zero flush interval writes progress through."""
+    try:
+        assert configure_reading_progress_buffer(engine, 0) is None
+        assert get_reading_progress_buffer() is None
+        installed = configure_reading_progress_buffer(engine, 5)
+        assert get_reading_progress_buffer() is installed
+    finally:
+        configure_reading_progress_buffer(None)
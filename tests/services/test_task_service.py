@@ -24,6 +24,7 @@ import pytest
 
 from bookcard.models.tasks import Task, TaskStatistics, TaskStatus, TaskType
 from bookcard.services.task_service import TaskService
+from bookcard.services.tasks.events import TaskEventBus
 
 if TYPE_CHECKING:
     from tests.conftest import DummySession
@@ -315,6 +316,24 @@ class TestUpdateTaskProgress:
         with pytest.raises(ValueError, match=r"Progress must be between 0.0 and 1.0"):
             task_service.update_task_progress(1, progress)
 
+    def test_update_task_progress_publishes_event(
+        self, session: DummySession, task: Task
+    ) -> None:
+        """Test progress updates are published unless the caller already did."""
+        bus = TaskEventBus()
+        subscription = bus.subscribe()
+        service = TaskService(session, event_bus=bus)  # type: ignore[arg-type]
+        session._entities_by_class_and_id[Task] = {1: task}
+
+        service.update_task_progress(1, 0.5, {"status": "x", "encryption_key": "k"})
+        service.update_task_progress(1, 0.6, publish=False)
+
+        event = subscription.get(timeout=0)
+        assert event is not None
+        assert (event.event_type, event.progress) == ("progress", 0.5)
+        assert event.metadata == {"status": "x"}
+        assert subscription.get(timeout=0) is None
+
 
 class TestStartTask:
     """Test start_task method."""
@@ -329,6 +348,20 @@ class TestStartTask:
         assert task.started_at is not None
         assert task_service._session.commit_count == 1  # type: ignore[attr-defined]
 
+    def test_start_task_publishes_status_event(
+        self, session: DummySession, task: Task
+    ) -> None:
+        """Test start_task publishes the transition for the task's owner."""
+        bus = TaskEventBus()
+        subscription = bus.subscribe(user_id=task.user_id)
+        session._entities_by_class_and_id[Task] = {1: task}
+
+        TaskService(session, event_bus=bus).start_task(1)  # type: ignore[arg-type]
+
+        event = subscription.get(timeout=0)
+        assert event is not None
+        assert (event.event_type, event.status) == ("status", TaskStatus.RUNNING)
+
     def test_start_task_not_found(self, task_service: TaskService) -> None:
         """Test start_task raises ValueError when task not found."""
         with pytest.raises(ValueError, match="Task 999 not found"):
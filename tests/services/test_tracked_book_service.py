@@ -603,7 +603,8 @@ class TestTrackedBookService:
             book_id, has_files = service._find_library_match("Title", "Author", 1)
             assert book_id is None
             assert has_files is False
-            mock_repo.dispose.assert_called_once()
+            # Engines are shared process-wide, so the repository is not disposed
+            mock_repo.dispose.assert_not_called()
 
     def test_find_library_match_with_active_library(
         self,
@@ -19,10 +19,44 @@ import {
   getOptionalClient,
 } from "@/services/http/routeHelpers";
 
+/** Request headers forwarded so the backend can negotiate and revalidate. */
+const FORWARDED_REQUEST_HEADERS = [
+  "accept",
+  "if-none-match",
+  "if-modified-since",
+];
+
+/** Backend response headers passed through to the browser. */
+const FORWARDED_RESPONSE_HEADERS = [
+  "content-type",
+  "content-length",
+  "cache-control",
+  "etag",
+  "last-modified",
+  "vary",
+];
+
+/**
+ * Copy the named headers that are present from one header set to another.
+ */
+function copyHeaders(from: Headers, names: string[]): Headers {
+  const headers = new Headers();
+  for (const name of names) {
+    const value = from.get(name);
+    if (value) {
+      headers.set(name, value);
+    }
+  }
+  return headers;
+}
+
 /**
  * GET /api/books/[id]/cover
  *
  * Proxies request to get book cover image.
+ * Forwards the query string (``w``/``h`` size and cache-busting ``v``), the
+ * ``Accept`` header and conditional headers, and passes the backend's
+ * validators and caching headers (and ``304 Not Modified``) through.
  */
 export async function GET(
   request: NextRequest,
@@ -36,11 +70,22 @@ export async function GET(
     }
 
     const { id } = await params;
+    const queryString = request.nextUrl.searchParams.toString();
+    const backendPath = `/books/${id}/cover`;
+    const url = queryString ? `${backendPath}?${queryString}` : backendPath;
 
-    const response = await client.request(`/books/${id}/cover`, {
+    const response = await client.request(url, {
       method: "GET",
+      headers: copyHeaders(request.headers, FORWARDED_REQUEST_HEADERS),
     });
 
+    if (response.status === 304) {
+      return new NextResponse(null, {
+        status: 304,
+        headers: copyHeaders(response.headers, FORWARDED_RESPONSE_HEADERS),
+      });
+    }
+
     if (!response.ok) {
       // If 404, just return 404
       if (response.status === 404) {
@@ -56,20 +101,12 @@ export async function GET(
       );
     }
 
-    // Get the file content
-    const blob = await response.blob();
-    const contentType = response.headers.get("content-type") || "image/jpeg";
-
-    // Create response with file
-    const fileResponse = new NextResponse(blob, {
-      status: 200,
-      headers: {
-        "Content-Type": contentType,
-        "Cache-Control": "public, max-age=86400, immutable", // Cache for 1 day
-      },
-    });
+    const headers = copyHeaders(response.headers, FORWARDED_RESPONSE_HEADERS);
+    if (!headers.has("content-type")) {
+      headers.set("content-type", "image/jpeg");
+    }
 
-    return fileResponse;
+    return new NextResponse(response.body, { status: 200, headers });
   } catch (error) {
     console.error("Cover fetch error:", error);
     return NextResponse.json(
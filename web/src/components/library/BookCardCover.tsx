@@ -16,6 +16,7 @@
 "use client";
 
 import { ImageWithLoading } from "@/components/common/ImageWithLoading";
+import { GRID_COVER_WIDTH, getSizedCoverUrl } from "@/utils/books";
 
 export interface BookCardCoverProps {
   /** Book title for alt text. */
@@ -27,15 +28,17 @@ export interface BookCardCoverProps {
 /**
  * Book card cover image component.
  *
- * Displays book cover thumbnail or placeholder.
+ * Displays book cover thumbnail or placeholder. Library covers are
+ * requested at grid size rather than at full resolution.
  * Follows SRP by focusing solely on cover display.
  */
 export function BookCardCover({ title, thumbnailUrl }: BookCardCoverProps) {
+  const coverUrl = getSizedCoverUrl(thumbnailUrl, GRID_COVER_WIDTH);
   return (
     <div className="relative h-full w-full overflow-hidden md:aspect-[2/3] md:w-full">
-      {thumbnailUrl ? (
+      {coverUrl ? (
         <ImageWithLoading
-          src={thumbnailUrl}
+          src={coverUrl}
           alt={`Cover for ${title}`}
           width={200}
           height={300}
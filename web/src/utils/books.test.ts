@@ -19,6 +19,7 @@ import {
   deduplicateBooks,
   getBookEditModalTitle,
   getCoverUrlWithCacheBuster,
+  getSizedCoverUrl,
 } from "./books";
 
 describe("books utils", () => {
@@ -37,6 +38,30 @@ describe("books utils", () => {
     });
   });
 
+  describe("getSizedCoverUrl", () => {
+    it("should add the width to a library cover URL", () => {
+      expect(getSizedCoverUrl("/api/books/7/cover?v=123", 300)).toBe(
+        "/api/books/7/cover?v=123&w=300",
+      );
+      expect(getSizedCoverUrl("/api/books/7/cover", 300)).toBe(
+        "/api/books/7/cover?w=300",
+      );
+    });
+
+    it("should replace an existing width", () => {
+      expect(getSizedCoverUrl("/api/books/7/cover?w=120&v=1", 300)).toBe(
+        "/api/books/7/cover?w=300&v=1",
+      );
+    });
+
+    it("should leave external URLs and missing URLs alone", () => {
+      const external = "https://covers.example.com/book.jpg";
+      expect(getSizedCoverUrl(external, 300)).toBe(external);
+      expect(getSizedCoverUrl(null, 300)).toBeNull();
+      expect(getSizedCoverUrl(undefined, 300)).toBeNull();
+    });
+  });
+
   describe("deduplicateBooks", () => {
     const book1: Book = {
       id: 1,
@@ -47,6 +47,44 @@ export function getCoverUrlWithCacheBuster(
   return `${baseUrl}?v=${timestamp}`;
 }
 
+/** Cover width requested by library grid and list items. */
+export const GRID_COVER_WIDTH = 300;
+
+/**
+ * Request a resized variant of a library cover URL.
+ *
+ * The backend rounds the width up to a thumbnail size bucket. URLs that
+ * do not point at a library cover (e.g. external covers of virtual books)
+ * are returned unchanged.
+ *
+ * Parameters
+ * ----------
+ * url : string | null | undefined
+ *     Cover URL, possibly with a cache-busting parameter.
+ * width : number
+ *     Requested cover width in pixels.
+ *
+ * Returns
+ * -------
+ * string | null
+ *     Cover URL with a width parameter, or null if no URL was given.
+ */
+export function getSizedCoverUrl(
+  url: string | null | undefined,
+  width: number,
+): string | null {
+  if (!url) {
+    return null;
+  }
+  if (!/^\/api\/books\/-?\d+\/cover(\?|$)/.test(url)) {
+    return url;
+  }
+  const [path, query = ""] = url.split("?", 2);
+  const params = new URLSearchParams(query);
+  params.set("w", String(width));
+  return `${path}?${params.toString()}`;
+}
+
 /**
  * Deduplicate books by ID and apply book data overrides.
  *